@@ -0,0 +1,3 @@
+#define HAVE_FNM_EXTMATCH 1
+#define HAVE_GLOB_PERIOD 1
+#define HAVE_PWENT 1
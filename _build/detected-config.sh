@@ -0,0 +1,7 @@
+HAVE_READLINE=1
+READLINE_DIR=
+
+PREFIX=/usr/local
+DATAROOTDIR=/usr/local/share
+
+STRIP_FLAGS=--gc-sections
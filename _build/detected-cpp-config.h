@@ -0,0 +1,6 @@
+#define GC_TIMING 1
+/* #undef HAVE_SYSTEMTAP_SDT */
+
+#define HAVE_FNM_EXTMATCH 1
+#define HAVE_GLOB_PERIOD 1
+#define HAVE_PWENT 1
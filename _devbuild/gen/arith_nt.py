@@ -0,0 +1,4 @@
+# This code is generated by pgen2/grammar.py
+
+arith_expr = 512
+term = 513
@@ -0,0 +1,10 @@
+# This code is generated by pgen2/grammar.py
+
+start = 512
+concatenation = 513
+conjunction = 514
+disjunction = 515
+expr = 516
+group = 517
+negation = 518
+terminator = 519
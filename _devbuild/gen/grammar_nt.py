@@ -0,0 +1,74 @@
+# This code is generated by pgen2/grammar.py
+
+augassign = 512
+and_expr = 513
+and_test = 514
+arg_group = 515
+arglist = 516
+arglist3 = 517
+argument = 518
+arith_expr = 519
+array_item = 520
+atom = 521
+braced_var_sub = 522
+char_literal = 523
+class_literal = 524
+class_literal_term = 525
+comma_newline = 526
+command_expr = 527
+comp_for = 528
+comp_op = 529
+comparison = 530
+dict = 531
+dict_pair = 532
+dq_string = 533
+eggex = 534
+end_stmt = 535
+expr = 536
+factor = 537
+lambdef = 538
+lhs_list = 539
+name_type = 540
+name_type_list = 541
+not_test = 542
+old_sh_array_literal = 543
+or_test = 544
+param = 545
+param_group = 546
+pat_else = 547
+pat_exprs = 548
+place_trailer = 549
+power = 550
+range_char = 551
+range_expr = 552
+re_alt = 553
+re_atom = 554
+re_flag = 555
+regex = 556
+repeat_op = 557
+repeat_range = 558
+sh_array_literal = 559
+sh_command_sub = 560
+shift_expr = 561
+simple_var_sub = 562
+splat_expr = 563
+sq_string = 564
+subscript = 565
+subscriptlist = 566
+term = 567
+test = 568
+testlist = 569
+testlist_comp = 570
+trailer = 571
+type_expr = 572
+xor_expr = 573
+ysh_case_pat = 574
+ysh_eager_arglist = 575
+ysh_expr = 576
+ysh_expr_sub = 577
+ysh_expr_sub_2 = 578
+ysh_func = 579
+ysh_lazy_arglist = 580
+ysh_mutation = 581
+ysh_proc = 582
+ysh_var_decl = 583
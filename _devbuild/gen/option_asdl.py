@@ -0,0 +1,476 @@
+from asdl import pybase
+from mycpp import mops
+from typing import Optional, List, Tuple, Dict, Any, cast, TYPE_CHECKING
+
+from asdl import runtime  # For runtime.NO_SPID
+from asdl.runtime import NewRecord, NewLeaf, TraversalState
+from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, Field
+
+option_t = int  # type alias for integer
+
+class option_i(object):
+  errexit = 1
+  nounset = 2
+  pipefail = 3
+  inherit_errexit = 4
+  nullglob = 5
+  verbose_errexit = 6
+  verbose_warn = 7
+  allexport = 8
+  noexec = 9
+  xtrace = 10
+  verbose = 11
+  noglob = 12
+  noclobber = 13
+  errtrace = 14
+  posix = 15
+  vi = 16
+  emacs = 17
+  interactive = 18
+  hashall = 19
+  lastpipe = 20
+  extglob = 21
+  failglob = 22
+  nocasematch = 23
+  dotglob = 24
+  globstar = 25
+  globskipdots = 26
+  extdebug = 27
+  eval_unsafe_arith = 28
+  ignore_flags_not_impl = 29
+  ignore_shopt_not_impl = 30
+  rewrite_extern = 31
+  path_index = 32
+  parse_cache = 33
+  stat_cache = 34
+  _allow_command_sub = 35
+  _allow_process_sub = 36
+  dynamic_scope = 37
+  redefine_const = 38
+  redefine_source = 39
+  _running_trap = 40
+  _running_hay = 41
+  _no_debug_trap = 42
+  _no_err_trap = 43
+  strict_parse_equals = 44
+  strict_parse_slice = 45
+  strict_argv = 46
+  strict_arith = 47
+  strict_arg_parse = 48
+  strict_array = 49
+  strict_control_flow = 50
+  strict_env_binding = 51
+  strict_errexit = 52
+  strict_nameref = 53
+  strict_word_eval = 54
+  strict_tilde = 55
+  strict_glob = 56
+  parse_at = 57
+  parse_proc = 58
+  parse_func = 59
+  parse_brace = 60
+  parse_bracket = 61
+  parse_equals = 62
+  parse_paren = 63
+  parse_ysh_string = 64
+  parse_triple_quote = 65
+  parse_ysh_expr_sub = 66
+  simple_word_eval = 67
+  no_dash_glob = 68
+  command_sub_errexit = 69
+  process_sub_fail = 70
+  xtrace_rich = 71
+  no_xtrace_osh = 72
+  sigpipe_status_ok = 73
+  env_obj = 74
+  init_ysh_globals = 75
+  for_loop_frames = 76
+  ysh_rewrite_extern = 77
+  parse_at_all = 78
+  no_parse_backslash = 79
+  no_parse_backticks = 80
+  no_parse_bare_word = 81
+  no_parse_dbracket = 82
+  no_parse_dollar = 83
+  no_parse_dparen = 84
+  no_parse_ignored = 85
+  no_parse_osh = 86
+  no_parse_sh_arith = 87
+  no_parse_word_join = 88
+  no_exported = 89
+  no_init_globals = 90
+  no_osh_builtins = 91
+  simple_echo = 92
+  simple_eval_builtin = 93
+  simple_test_builtin = 94
+  simple_trap_builtin = 95
+  expand_aliases = 96
+  progcomp = 97
+  hostcomplete = 98
+  histappend = 99
+  cmdhist = 100
+  assoc_expand_once = 101
+  autocd = 102
+  cdable_vars = 103
+  cdspell = 104
+  checkhash = 105
+  checkjobs = 106
+  checkwinsize = 107
+  complete_fullquote = 108
+  direxpand = 109
+  dirspell = 110
+  execfail = 111
+  extquote = 112
+  force_fignore = 113
+  globasciiranges = 114
+  gnu_errfmt = 115
+  histreedit = 116
+  histverify = 117
+  huponexit = 118
+  interactive_comments = 119
+  lithist = 120
+  localvar_inherit = 121
+  localvar_unset = 122
+  login_shell = 123
+  mailwarn = 124
+  no_empty_cmd_completion = 125
+  nocaseglob = 126
+  progcomp_alias = 127
+  promptvars = 128
+  restricted_shell = 129
+  shift_verbose = 130
+  sourcepath = 131
+  xpg_echo = 132
+  ARRAY_SIZE = 133
+
+_option_str = {
+  1: 'errexit',
+  2: 'nounset',
+  3: 'pipefail',
+  4: 'inherit_errexit',
+  5: 'nullglob',
+  6: 'verbose_errexit',
+  7: 'verbose_warn',
+  8: 'allexport',
+  9: 'noexec',
+  10: 'xtrace',
+  11: 'verbose',
+  12: 'noglob',
+  13: 'noclobber',
+  14: 'errtrace',
+  15: 'posix',
+  16: 'vi',
+  17: 'emacs',
+  18: 'interactive',
+  19: 'hashall',
+  20: 'lastpipe',
+  21: 'extglob',
+  22: 'failglob',
+  23: 'nocasematch',
+  24: 'dotglob',
+  25: 'globstar',
+  26: 'globskipdots',
+  27: 'extdebug',
+  28: 'eval_unsafe_arith',
+  29: 'ignore_flags_not_impl',
+  30: 'ignore_shopt_not_impl',
+  31: 'rewrite_extern',
+  32: 'path_index',
+  33: 'parse_cache',
+  34: 'stat_cache',
+  35: '_allow_command_sub',
+  36: '_allow_process_sub',
+  37: 'dynamic_scope',
+  38: 'redefine_const',
+  39: 'redefine_source',
+  40: '_running_trap',
+  41: '_running_hay',
+  42: '_no_debug_trap',
+  43: '_no_err_trap',
+  44: 'strict_parse_equals',
+  45: 'strict_parse_slice',
+  46: 'strict_argv',
+  47: 'strict_arith',
+  48: 'strict_arg_parse',
+  49: 'strict_array',
+  50: 'strict_control_flow',
+  51: 'strict_env_binding',
+  52: 'strict_errexit',
+  53: 'strict_nameref',
+  54: 'strict_word_eval',
+  55: 'strict_tilde',
+  56: 'strict_glob',
+  57: 'parse_at',
+  58: 'parse_proc',
+  59: 'parse_func',
+  60: 'parse_brace',
+  61: 'parse_bracket',
+  62: 'parse_equals',
+  63: 'parse_paren',
+  64: 'parse_ysh_string',
+  65: 'parse_triple_quote',
+  66: 'parse_ysh_expr_sub',
+  67: 'simple_word_eval',
+  68: 'no_dash_glob',
+  69: 'command_sub_errexit',
+  70: 'process_sub_fail',
+  71: 'xtrace_rich',
+  72: 'no_xtrace_osh',
+  73: 'sigpipe_status_ok',
+  74: 'env_obj',
+  75: 'init_ysh_globals',
+  76: 'for_loop_frames',
+  77: 'ysh_rewrite_extern',
+  78: 'parse_at_all',
+  79: 'no_parse_backslash',
+  80: 'no_parse_backticks',
+  81: 'no_parse_bare_word',
+  82: 'no_parse_dbracket',
+  83: 'no_parse_dollar',
+  84: 'no_parse_dparen',
+  85: 'no_parse_ignored',
+  86: 'no_parse_osh',
+  87: 'no_parse_sh_arith',
+  88: 'no_parse_word_join',
+  89: 'no_exported',
+  90: 'no_init_globals',
+  91: 'no_osh_builtins',
+  92: 'simple_echo',
+  93: 'simple_eval_builtin',
+  94: 'simple_test_builtin',
+  95: 'simple_trap_builtin',
+  96: 'expand_aliases',
+  97: 'progcomp',
+  98: 'hostcomplete',
+  99: 'histappend',
+  100: 'cmdhist',
+  101: 'assoc_expand_once',
+  102: 'autocd',
+  103: 'cdable_vars',
+  104: 'cdspell',
+  105: 'checkhash',
+  106: 'checkjobs',
+  107: 'checkwinsize',
+  108: 'complete_fullquote',
+  109: 'direxpand',
+  110: 'dirspell',
+  111: 'execfail',
+  112: 'extquote',
+  113: 'force_fignore',
+  114: 'globasciiranges',
+  115: 'gnu_errfmt',
+  116: 'histreedit',
+  117: 'histverify',
+  118: 'huponexit',
+  119: 'interactive_comments',
+  120: 'lithist',
+  121: 'localvar_inherit',
+  122: 'localvar_unset',
+  123: 'login_shell',
+  124: 'mailwarn',
+  125: 'no_empty_cmd_completion',
+  126: 'nocaseglob',
+  127: 'progcomp_alias',
+  128: 'promptvars',
+  129: 'restricted_shell',
+  130: 'shift_verbose',
+  131: 'sourcepath',
+  132: 'xpg_echo',
+}
+
+def option_str(val, dot=True):
+  # type: (option_t, bool) -> str
+  v = _option_str[val]
+  if dot:
+    return "option.%s" % v
+  else:
+    return v
+
+builtin_t = int  # type alias for integer
+
+class builtin_i(object):
+  colon = 1
+  dot = 2
+  exec_ = 3
+  eval = 4
+  set = 5
+  shift = 6
+  times = 7
+  trap = 8
+  unset = 9
+  readonly = 10
+  local = 11
+  declare = 12
+  typeset = 13
+  export_ = 14
+  true_ = 15
+  false_ = 16
+  try_ = 17
+  assert_ = 18
+  break_ = 19
+  continue_ = 20
+  return_ = 21
+  exit = 22
+  read = 23
+  echo = 24
+  printf = 25
+  mapfile = 26
+  readarray = 27
+  cd = 28
+  chdir = 29
+  pushd = 30
+  popd = 31
+  dirs = 32
+  pwd = 33
+  source = 34
+  umask = 35
+  ulimit = 36
+  wait = 37
+  jobs = 38
+  fg = 39
+  bg = 40
+  kill = 41
+  shopt = 42
+  complete = 43
+  compgen = 44
+  compopt = 45
+  compadjust = 46
+  compexport = 47
+  getopts = 48
+  builtin = 49
+  command = 50
+  type = 51
+  hash = 52
+  help = 53
+  history = 54
+  fc = 55
+  alias = 56
+  unalias = 57
+  bind = 58
+  append = 59
+  write = 60
+  json = 61
+  json8 = 62
+  pp = 63
+  hay = 64
+  haynode = 65
+  use = 66
+  error = 67
+  failed = 68
+  fork = 69
+  forkwait = 70
+  forkmany = 71
+  redir = 72
+  fopen = 73
+  shvar = 74
+  ctx = 75
+  invoke = 76
+  runproc = 77
+  boolstatus = 78
+  test = 79
+  bracket = 80
+  push_registers = 81
+  source_guard = 82
+  is_main = 83
+  cat = 84
+  rm = 85
+  sleep = 86
+  ARRAY_SIZE = 87
+
+_builtin_str = {
+  1: 'colon',
+  2: 'dot',
+  3: 'exec_',
+  4: 'eval',
+  5: 'set',
+  6: 'shift',
+  7: 'times',
+  8: 'trap',
+  9: 'unset',
+  10: 'readonly',
+  11: 'local',
+  12: 'declare',
+  13: 'typeset',
+  14: 'export_',
+  15: 'true_',
+  16: 'false_',
+  17: 'try_',
+  18: 'assert_',
+  19: 'break_',
+  20: 'continue_',
+  21: 'return_',
+  22: 'exit',
+  23: 'read',
+  24: 'echo',
+  25: 'printf',
+  26: 'mapfile',
+  27: 'readarray',
+  28: 'cd',
+  29: 'chdir',
+  30: 'pushd',
+  31: 'popd',
+  32: 'dirs',
+  33: 'pwd',
+  34: 'source',
+  35: 'umask',
+  36: 'ulimit',
+  37: 'wait',
+  38: 'jobs',
+  39: 'fg',
+  40: 'bg',
+  41: 'kill',
+  42: 'shopt',
+  43: 'complete',
+  44: 'compgen',
+  45: 'compopt',
+  46: 'compadjust',
+  47: 'compexport',
+  48: 'getopts',
+  49: 'builtin',
+  50: 'command',
+  51: 'type',
+  52: 'hash',
+  53: 'help',
+  54: 'history',
+  55: 'fc',
+  56: 'alias',
+  57: 'unalias',
+  58: 'bind',
+  59: 'append',
+  60: 'write',
+  61: 'json',
+  62: 'json8',
+  63: 'pp',
+  64: 'hay',
+  65: 'haynode',
+  66: 'use',
+  67: 'error',
+  68: 'failed',
+  69: 'fork',
+  70: 'forkwait',
+  71: 'forkmany',
+  72: 'redir',
+  73: 'fopen',
+  74: 'shvar',
+  75: 'ctx',
+  76: 'invoke',
+  77: 'runproc',
+  78: 'boolstatus',
+  79: 'test',
+  80: 'bracket',
+  81: 'push_registers',
+  82: 'source_guard',
+  83: 'is_main',
+  84: 'cat',
+  85: 'rm',
+  86: 'sleep',
+}
+
+def builtin_str(val, dot=True):
+  # type: (builtin_t, bool) -> str
+  v = _builtin_str[val]
+  if dot:
+    return "builtin.%s" % v
+  else:
+    return v
+
@@ -0,0 +1,236 @@
+// _gen/asdl/hnode.asdl.cc is generated by asdl_main.py
+
+#include "_gen/asdl/hnode.asdl.h"
+#include <assert.h>
+#include "prebuilt/asdl/runtime.mycpp.h"  // from mycpp
+
+// Generated code uses these types
+using hnode_asdl::hnode;
+using hnode_asdl::Field;
+using hnode_asdl::color_e;
+
+namespace hnode_asdl {
+
+BigStr* color_str(color_e tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case color_e::TypeName:
+    v = "TypeName"; break;
+  case color_e::StringConst:
+    v = "StringConst"; break;
+  case color_e::OtherConst:
+    v = "OtherConst"; break;
+  case color_e::UserType:
+    v = "UserType"; break;
+  case color_e::External:
+    v = "External"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "color.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* Field::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("Field"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->name);
+  L->append(Alloc<Field>(StrFromC("name"), x0));
+
+  hnode_t* x1 = this->val->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("val"), x1));
+
+  return out_node;
+}
+
+BigStr* hnode_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case hnode_e::AlreadySeen:
+    v = "AlreadySeen"; break;
+  case hnode_e::Leaf:
+    v = "Leaf"; break;
+  case hnode_e::Array:
+    v = "Array"; break;
+  case hnode_e::Record:
+    v = "Record"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "hnode.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* hnode__AlreadySeen::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(hnode_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->heap_id);
+  L->append(Alloc<Field>(StrFromC("heap_id"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* hnode__Leaf::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(hnode_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->s);
+  L->append(Alloc<Field>(StrFromC("s"), x0));
+
+  hnode_t* x1 = Alloc<hnode::Leaf>(color_str(this->color), color_e::TypeName);
+  L->append(Alloc<Field>(StrFromC("color"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* hnode__Array::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(hnode_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->children != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<hnode_t*> it(this->children); !it.Done(); it.Next()) {
+      hnode_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("children"), x0));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* hnode__Record::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(hnode_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->node_type);
+  L->append(Alloc<Field>(StrFromC("node_type"), x0));
+
+  hnode_t* x1 = ToPretty(this->left);
+  L->append(Alloc<Field>(StrFromC("left"), x1));
+
+  hnode_t* x2 = ToPretty(this->right);
+  L->append(Alloc<Field>(StrFromC("right"), x2));
+
+  if (this->fields != nullptr) {  // List
+    hnode::Array* x3 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<Field*> it(this->fields); !it.Done(); it.Next()) {
+      Field* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x3->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("fields"), x3));
+  }
+
+  if (this->unnamed_fields != nullptr) {  // List
+    hnode::Array* x4 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<hnode_t*> it(this->unnamed_fields); !it.Done(); it.Next()) {
+      hnode_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x4->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("unnamed_fields"), x4));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* hnode_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case hnode_e::AlreadySeen: {
+    hnode__AlreadySeen* obj = static_cast<hnode__AlreadySeen*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case hnode_e::Leaf: {
+    hnode__Leaf* obj = static_cast<hnode__Leaf*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case hnode_e::Array: {
+    hnode__Array* obj = static_cast<hnode__Array*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case hnode_e::Record: {
+    hnode__Record* obj = static_cast<hnode__Record*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+BigStr* alloc_members_str(alloc_members_e tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case alloc_members_e::List:
+    v = "List"; break;
+  case alloc_members_e::Dict:
+    v = "Dict"; break;
+  case alloc_members_e::Struct:
+    v = "Struct"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "alloc_members.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+}  // namespace hnode_asdl
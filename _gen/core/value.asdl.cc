@@ -0,0 +1,2987 @@
+// _gen/core/value.asdl.cc is generated by asdl_main.py
+
+#include "_gen/core/value.asdl.h"
+#include <assert.h>
+#include "prebuilt/asdl/runtime.mycpp.h"  // from mycpp
+#include "_gen/frontend/syntax.asdl.h"  // "use" in ASDL
+#include "_gen/core/runtime.asdl.h"  // "use" in ASDL
+
+// Generated code uses these types
+using hnode_asdl::hnode;
+using hnode_asdl::Field;
+using hnode_asdl::color_e;
+
+namespace value_asdl {
+
+
+hnode_t* IntBox::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("IntBox"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->i);
+  L->append(Alloc<Field>(StrFromC("i"), x0));
+
+  return out_node;
+}
+
+
+void IntBox::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 64)) {
+    return;
+  }
+  enc->Int(this->i);
+}
+
+IntBox* IntBox::DecodeNew(pyserial::Decoder* dec) {
+  IntBox* obj = IntBox::CreateNull();
+  dec->Add(obj);
+  obj->i = dec->Int();
+  return obj;
+}
+
+IntBox* IntBox::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 64) {
+    return IntBox::DecodeNew(dec);
+  }
+  return static_cast<IntBox*>(dec->Ref(h));
+}
+
+hnode_t* InitializerValue::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("InitializerValue"));
+  List<Field*>* L = out_node->fields;
+
+  if (this->key) {  // Optional
+    hnode_t* x0 = ToPretty(this->key);
+    L->append(Alloc<Field>(StrFromC("key"), x0));
+  }
+
+  hnode_t* x1 = ToPretty(this->rval);
+  L->append(Alloc<Field>(StrFromC("rval"), x1));
+
+  hnode_t* x2 = ToPretty(this->plus_eq);
+  L->append(Alloc<Field>(StrFromC("plus_eq"), x2));
+
+  return out_node;
+}
+
+
+void InitializerValue::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 65)) {
+    return;
+  }
+  enc->Str(this->key);
+  enc->Str(this->rval);
+  enc->Bool(this->plus_eq);
+}
+
+InitializerValue* InitializerValue::DecodeNew(pyserial::Decoder* dec) {
+  InitializerValue* obj = InitializerValue::CreateNull();
+  dec->Add(obj);
+  obj->key = dec->Str();
+  obj->rval = dec->Str();
+  obj->plus_eq = dec->Bool();
+  return obj;
+}
+
+InitializerValue* InitializerValue::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 65) {
+    return InitializerValue::DecodeNew(dec);
+  }
+  return static_cast<InitializerValue*>(dec->Ref(h));
+}
+
+hnode_t* ProcDefaults::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("ProcDefaults"));
+  List<Field*>* L = out_node->fields;
+
+  if (this->for_word != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<value_t*> it(this->for_word); !it.Done(); it.Next()) {
+      value_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("for_word"), x0));
+  }
+
+  if (this->for_typed != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<value_t*> it(this->for_typed); !it.Done(); it.Next()) {
+      value_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("for_typed"), x1));
+  }
+
+  if (this->for_named != nullptr) {  // Dict
+    auto* unnamed = NewList<hnode_t*>();
+    auto* hdict = Alloc<hnode::Record>(kEmptyString, StrFromC("{"),
+                                                                 StrFromC("}"),
+                                                                 NewList<Field*>(), unnamed);
+    for (DictIter<BigStr*, value_t*> it(this->for_named); !it.Done();
+         it.Next()) {
+      auto k = it.Key();
+      auto v = it.Value();
+      unnamed->append(ToPretty(k));
+      unnamed->append(v->PrettyTree(do_abbrev, seen));
+    }
+    L->append(Alloc<Field>(StrFromC("for_named"), hdict));
+  }
+
+  if (this->for_block) {  // Optional
+    hnode_t* x3 = this->for_block->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("for_block"), x3));
+  }
+
+  return out_node;
+}
+
+
+void ProcDefaults::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 66)) {
+    return;
+  }
+  if (this->for_word == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->for_word));
+    for (ListIter<value_t*> it0(this->for_word); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  if (this->for_typed == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->for_typed));
+    for (ListIter<value_t*> it1(this->for_typed); !it1.Done(); it1.Next()) {
+      enc->Obj(it1.Value());
+    }
+  }
+  if (this->for_named == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->for_named));
+    for (DictIter<BigStr*, value_t*> it2(this->for_named); !it2.Done(); it2.Next()) {
+      enc->Str(it2.Key());
+      enc->Obj(it2.Value());
+    }
+  }
+  enc->Obj(this->for_block);
+}
+
+ProcDefaults* ProcDefaults::DecodeNew(pyserial::Decoder* dec) {
+  ProcDefaults* obj = ProcDefaults::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<value_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      value_t* i0;
+      i0 = value_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->for_word = c0;
+  }
+  int n1 = dec->Size();
+  if (n1 != -1) {
+    auto* c1 = Alloc<List<value_t*>>();
+    for (int j1 = 0; j1 < n1; ++j1) {
+      value_t* i1;
+      i1 = value_t::Decode(dec);
+      c1->append(i1);
+    }
+    obj->for_typed = c1;
+  }
+  int n2 = dec->Size();
+  if (n2 != -1) {
+    auto* c2 = Alloc<Dict<BigStr*, value_t*>>();
+    for (int j2 = 0; j2 < n2; ++j2) {
+      BigStr* k2;
+      value_t* v2;
+      k2 = dec->Str();
+      v2 = value_t::Decode(dec);
+      c2->set(k2, v2);
+    }
+    obj->for_named = c2;
+  }
+  obj->for_block = value_t::Decode(dec);
+  return obj;
+}
+
+ProcDefaults* ProcDefaults::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 66) {
+    return ProcDefaults::DecodeNew(dec);
+  }
+  return static_cast<ProcDefaults*>(dec->Ref(h));
+}
+
+hnode_t* LeftName::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("LeftName"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->name);
+  L->append(Alloc<Field>(StrFromC("name"), x0));
+
+  hnode_t* x1 = this->blame_loc->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("blame_loc"), x1));
+
+  return out_node;
+}
+
+
+void LeftName::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 67)) {
+    return;
+  }
+  enc->Str(this->name);
+  enc->Obj(this->blame_loc);
+}
+
+LeftName* LeftName::DecodeNew(pyserial::Decoder* dec) {
+  LeftName* obj = LeftName::CreateNull();
+  dec->Add(obj);
+  obj->name = dec->Str();
+  obj->blame_loc = syntax_asdl::loc_t::Decode(dec);
+  return obj;
+}
+
+LeftName* LeftName::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 67) {
+    return LeftName::DecodeNew(dec);
+  }
+  return static_cast<LeftName*>(dec->Ref(h));
+}
+BigStr* y_lvalue_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case y_lvalue_e::Local:
+    v = "Local"; break;
+  case y_lvalue_e::Container:
+    v = "Container"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "y_lvalue.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* y_lvalue__Container::PrettyTree(bool do_abbrev, Dict<int, bool>* seen)
+                                         {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(y_lvalue_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->obj->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("obj"), x0));
+
+  hnode_t* x1 = this->index->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("index"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* y_lvalue_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case y_lvalue_e::Local: {
+    LeftName* obj = static_cast<LeftName*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case y_lvalue_e::Container: {
+    y_lvalue__Container* obj = static_cast<y_lvalue__Container*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void y_lvalue__Container::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, y_lvalue_e::Container)) {
+    return;
+  }
+  enc->Obj(this->obj);
+  enc->Obj(this->index);
+}
+
+y_lvalue__Container* y_lvalue__Container::DecodeNew(pyserial::Decoder* dec) {
+  y_lvalue__Container* obj = y_lvalue__Container::CreateNull();
+  dec->Add(obj);
+  obj->obj = value_t::Decode(dec);
+  obj->index = value_t::Decode(dec);
+  return obj;
+}
+
+void y_lvalue_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case y_lvalue_e::Local: {
+    static_cast<LeftName*>(this)->Encode(enc);
+    return;
+  }
+  case y_lvalue_e::Container: {
+    static_cast<y_lvalue__Container*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+y_lvalue_t* y_lvalue_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case y_lvalue_e::Local:
+    return LeftName::DecodeNew(dec);
+  case y_lvalue_e::Container:
+    return y_lvalue__Container::DecodeNew(dec);
+  }
+  return static_cast<y_lvalue_t*>(dec->Ref(h));
+}
+BigStr* sh_lvalue_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case sh_lvalue_e::Var:
+    v = "Var"; break;
+  case sh_lvalue_e::Indexed:
+    v = "Indexed"; break;
+  case sh_lvalue_e::Keyed:
+    v = "Keyed"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "sh_lvalue.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* sh_lvalue__Indexed::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(sh_lvalue_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->name);
+  L->append(Alloc<Field>(StrFromC("name"), x0));
+
+  hnode_t* x1 = ToPretty(this->index);
+  L->append(Alloc<Field>(StrFromC("index"), x1));
+
+  hnode_t* x2 = this->blame_loc->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("blame_loc"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* sh_lvalue__Keyed::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(sh_lvalue_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->name);
+  L->append(Alloc<Field>(StrFromC("name"), x0));
+
+  hnode_t* x1 = ToPretty(this->key);
+  L->append(Alloc<Field>(StrFromC("key"), x1));
+
+  hnode_t* x2 = this->blame_loc->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("blame_loc"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* sh_lvalue_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case sh_lvalue_e::Var: {
+    LeftName* obj = static_cast<LeftName*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case sh_lvalue_e::Indexed: {
+    sh_lvalue__Indexed* obj = static_cast<sh_lvalue__Indexed*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case sh_lvalue_e::Keyed: {
+    sh_lvalue__Keyed* obj = static_cast<sh_lvalue__Keyed*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void sh_lvalue__Indexed::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, sh_lvalue_e::Indexed)) {
+    return;
+  }
+  enc->Str(this->name);
+  enc->Int(this->index);
+  enc->Obj(this->blame_loc);
+}
+
+sh_lvalue__Indexed* sh_lvalue__Indexed::DecodeNew(pyserial::Decoder* dec) {
+  sh_lvalue__Indexed* obj = sh_lvalue__Indexed::CreateNull();
+  dec->Add(obj);
+  obj->name = dec->Str();
+  obj->index = dec->Int();
+  obj->blame_loc = syntax_asdl::loc_t::Decode(dec);
+  return obj;
+}
+
+void sh_lvalue__Keyed::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, sh_lvalue_e::Keyed)) {
+    return;
+  }
+  enc->Str(this->name);
+  enc->Str(this->key);
+  enc->Obj(this->blame_loc);
+}
+
+sh_lvalue__Keyed* sh_lvalue__Keyed::DecodeNew(pyserial::Decoder* dec) {
+  sh_lvalue__Keyed* obj = sh_lvalue__Keyed::CreateNull();
+  dec->Add(obj);
+  obj->name = dec->Str();
+  obj->key = dec->Str();
+  obj->blame_loc = syntax_asdl::loc_t::Decode(dec);
+  return obj;
+}
+
+void sh_lvalue_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case sh_lvalue_e::Var: {
+    static_cast<LeftName*>(this)->Encode(enc);
+    return;
+  }
+  case sh_lvalue_e::Indexed: {
+    static_cast<sh_lvalue__Indexed*>(this)->Encode(enc);
+    return;
+  }
+  case sh_lvalue_e::Keyed: {
+    static_cast<sh_lvalue__Keyed*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+sh_lvalue_t* sh_lvalue_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case sh_lvalue_e::Var:
+    return LeftName::DecodeNew(dec);
+  case sh_lvalue_e::Indexed:
+    return sh_lvalue__Indexed::DecodeNew(dec);
+  case sh_lvalue_e::Keyed:
+    return sh_lvalue__Keyed::DecodeNew(dec);
+  }
+  return static_cast<sh_lvalue_t*>(dec->Ref(h));
+}
+BigStr* eggex_ops_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case eggex_ops_e::No:
+    v = "No"; break;
+  case eggex_ops_e::Yes:
+    v = "Yes"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "eggex_ops.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+eggex_ops__No* eggex_ops::No = &geggex_ops__No.obj;
+
+GcGlobal<eggex_ops__No> geggex_ops__No = 
+  { ObjHeader::Global(eggex_ops_e::No) };
+
+hnode_t* eggex_ops__No::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(eggex_ops_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* eggex_ops__Yes::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(eggex_ops_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->convert_funcs != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<value_t*> it(this->convert_funcs); !it.Done(); it.Next()) {
+      value_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("convert_funcs"), x0));
+  }
+
+  if (this->convert_toks != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<syntax_asdl::Token*> it(this->convert_toks); !it.Done();
+         it.Next()) {
+      syntax_asdl::Token* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("convert_toks"), x1));
+  }
+
+  if (this->capture_names != nullptr) {  // List
+    hnode::Array* x2 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<BigStr*> it(this->capture_names); !it.Done(); it.Next()) {
+      BigStr* v_ = it.Value();
+      hnode_t* h = ToPretty(v_);
+      x2->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("capture_names"), x2));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* eggex_ops_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case eggex_ops_e::No: {
+    eggex_ops__No* obj = static_cast<eggex_ops__No*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case eggex_ops_e::Yes: {
+    eggex_ops__Yes* obj = static_cast<eggex_ops__Yes*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void eggex_ops__No::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, eggex_ops_e::No)) {
+    return;
+  }
+}
+
+void eggex_ops__Yes::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, eggex_ops_e::Yes)) {
+    return;
+  }
+  if (this->convert_funcs == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->convert_funcs));
+    for (ListIter<value_t*> it0(this->convert_funcs); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  if (this->convert_toks == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->convert_toks));
+    for (ListIter<syntax_asdl::Token*> it1(this->convert_toks); !it1.Done(); it1.Next()) {
+      enc->Obj(it1.Value());
+    }
+  }
+  if (this->capture_names == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->capture_names));
+    for (ListIter<BigStr*> it2(this->capture_names); !it2.Done(); it2.Next()) {
+      enc->Str(it2.Value());
+    }
+  }
+}
+
+eggex_ops__Yes* eggex_ops__Yes::DecodeNew(pyserial::Decoder* dec) {
+  eggex_ops__Yes* obj = eggex_ops__Yes::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<value_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      value_t* i0;
+      i0 = value_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->convert_funcs = c0;
+  }
+  int n1 = dec->Size();
+  if (n1 != -1) {
+    auto* c1 = Alloc<List<syntax_asdl::Token*>>();
+    for (int j1 = 0; j1 < n1; ++j1) {
+      syntax_asdl::Token* i1;
+      i1 = syntax_asdl::Token::Decode(dec);
+      c1->append(i1);
+    }
+    obj->convert_toks = c1;
+  }
+  int n2 = dec->Size();
+  if (n2 != -1) {
+    auto* c2 = Alloc<List<BigStr*>>();
+    for (int j2 = 0; j2 < n2; ++j2) {
+      BigStr* i2;
+      i2 = dec->Str();
+      c2->append(i2);
+    }
+    obj->capture_names = c2;
+  }
+  return obj;
+}
+
+void eggex_ops_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case eggex_ops_e::No: {
+    static_cast<eggex_ops__No*>(this)->Encode(enc);
+    return;
+  }
+  case eggex_ops_e::Yes: {
+    static_cast<eggex_ops__Yes*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+eggex_ops_t* eggex_ops_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case eggex_ops_e::No:
+    dec->Add(eggex_ops::No);
+    return eggex_ops::No;
+  case eggex_ops_e::Yes:
+    return eggex_ops__Yes::DecodeNew(dec);
+  }
+  return static_cast<eggex_ops_t*>(dec->Ref(h));
+}
+
+hnode_t* RegexMatch::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("RegexMatch"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->s);
+  L->append(Alloc<Field>(StrFromC("s"), x0));
+
+  if (this->indices != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<int> it(this->indices); !it.Done(); it.Next()) {
+      int v_ = it.Value();
+      hnode_t* h = ToPretty(v_);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("indices"), x1));
+  }
+
+  hnode_t* x2 = this->ops->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("ops"), x2));
+
+  return out_node;
+}
+
+
+void RegexMatch::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 68)) {
+    return;
+  }
+  enc->Str(this->s);
+  if (this->indices == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->indices));
+    for (ListIter<int> it0(this->indices); !it0.Done(); it0.Next()) {
+      enc->Int(it0.Value());
+    }
+  }
+  enc->Obj(this->ops);
+}
+
+RegexMatch* RegexMatch::DecodeNew(pyserial::Decoder* dec) {
+  RegexMatch* obj = RegexMatch::CreateNull();
+  dec->Add(obj);
+  obj->s = dec->Str();
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<int>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      int i0;
+      i0 = dec->Int();
+      c0->append(i0);
+    }
+    obj->indices = c0;
+  }
+  obj->ops = eggex_ops_t::Decode(dec);
+  return obj;
+}
+
+RegexMatch* RegexMatch::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 68) {
+    return RegexMatch::DecodeNew(dec);
+  }
+  return static_cast<RegexMatch*>(dec->Ref(h));
+}
+BigStr* regex_match_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case regex_match_e::No:
+    v = "No"; break;
+  case regex_match_e::Yes:
+    v = "Yes"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "regex_match.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+regex_match__No* regex_match::No = &gregex_match__No.obj;
+
+GcGlobal<regex_match__No> gregex_match__No = 
+  { ObjHeader::Global(regex_match_e::No) };
+
+hnode_t* regex_match__No::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(regex_match_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* regex_match_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case regex_match_e::No: {
+    regex_match__No* obj = static_cast<regex_match__No*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case regex_match_e::Yes: {
+    RegexMatch* obj = static_cast<RegexMatch*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void regex_match__No::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, regex_match_e::No)) {
+    return;
+  }
+}
+
+void regex_match_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case regex_match_e::No: {
+    static_cast<regex_match__No*>(this)->Encode(enc);
+    return;
+  }
+  case regex_match_e::Yes: {
+    static_cast<RegexMatch*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+regex_match_t* regex_match_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case regex_match_e::No:
+    dec->Add(regex_match::No);
+    return regex_match::No;
+  case regex_match_e::Yes:
+    return RegexMatch::DecodeNew(dec);
+  }
+  return static_cast<regex_match_t*>(dec->Ref(h));
+}
+
+hnode_t* Obj::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("Obj"));
+  List<Field*>* L = out_node->fields;
+
+  if (this->prototype) {  // Optional
+    hnode_t* x0 = this->prototype->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("prototype"), x0));
+  }
+
+  if (this->d != nullptr) {  // Dict
+    auto* unnamed = NewList<hnode_t*>();
+    auto* hdict = Alloc<hnode::Record>(kEmptyString, StrFromC("{"),
+                                                                 StrFromC("}"),
+                                                                 NewList<Field*>(), unnamed);
+    for (DictIter<BigStr*, value_t*> it(this->d); !it.Done(); it.Next()) {
+      auto k = it.Key();
+      auto v = it.Value();
+      unnamed->append(ToPretty(k));
+      unnamed->append(v->PrettyTree(do_abbrev, seen));
+    }
+    L->append(Alloc<Field>(StrFromC("d"), hdict));
+  }
+
+  return out_node;
+}
+
+
+void Obj::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 69)) {
+    return;
+  }
+  enc->Obj(this->prototype);
+  if (this->d == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->d));
+    for (DictIter<BigStr*, value_t*> it0(this->d); !it0.Done(); it0.Next()) {
+      enc->Str(it0.Key());
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+Obj* Obj::DecodeNew(pyserial::Decoder* dec) {
+  Obj* obj = Obj::CreateNull();
+  dec->Add(obj);
+  obj->prototype = Obj::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<Dict<BigStr*, value_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      BigStr* k0;
+      value_t* v0;
+      k0 = dec->Str();
+      v0 = value_t::Decode(dec);
+      c0->set(k0, v0);
+    }
+    obj->d = c0;
+  }
+  return obj;
+}
+
+Obj* Obj::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 69) {
+    return Obj::DecodeNew(dec);
+  }
+  return static_cast<Obj*>(dec->Ref(h));
+}
+BigStr* value_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case value_e::Interrupted:
+    v = "Interrupted"; break;
+  case value_e::Stdin:
+    v = "Stdin"; break;
+  case value_e::Slice:
+    v = "Slice"; break;
+  case value_e::Undef:
+    v = "Undef"; break;
+  case value_e::Str:
+    v = "Str"; break;
+  case value_e::InitializerList:
+    v = "InitializerList"; break;
+  case value_e::InternalStringArray:
+    v = "InternalStringArray"; break;
+  case value_e::BashArray:
+    v = "BashArray"; break;
+  case value_e::BashAssoc:
+    v = "BashAssoc"; break;
+  case value_e::Null:
+    v = "Null"; break;
+  case value_e::Bool:
+    v = "Bool"; break;
+  case value_e::Int:
+    v = "Int"; break;
+  case value_e::Float:
+    v = "Float"; break;
+  case value_e::List:
+    v = "List"; break;
+  case value_e::Dict:
+    v = "Dict"; break;
+  case value_e::Obj:
+    v = "Obj"; break;
+  case value_e::Range:
+    v = "Range"; break;
+  case value_e::Eggex:
+    v = "Eggex"; break;
+  case value_e::Match:
+    v = "Match"; break;
+  case value_e::Place:
+    v = "Place"; break;
+  case value_e::Frame:
+    v = "Frame"; break;
+  case value_e::DebugFrame:
+    v = "DebugFrame"; break;
+  case value_e::BoundFunc:
+    v = "BoundFunc"; break;
+  case value_e::BuiltinFunc:
+    v = "BuiltinFunc"; break;
+  case value_e::Func:
+    v = "Func"; break;
+  case value_e::BuiltinProc:
+    v = "BuiltinProc"; break;
+  case value_e::Proc:
+    v = "Proc"; break;
+  case value_e::Expr:
+    v = "Expr"; break;
+  case value_e::CommandFrag:
+    v = "CommandFrag"; break;
+  case value_e::Command:
+    v = "Command"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "value.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+value__Interrupted* value::Interrupted = &gvalue__Interrupted.obj;
+
+GcGlobal<value__Interrupted> gvalue__Interrupted = 
+  { ObjHeader::Global(value_e::Interrupted) };
+
+value__Stdin* value::Stdin = &gvalue__Stdin.obj;
+
+GcGlobal<value__Stdin> gvalue__Stdin = 
+  { ObjHeader::Global(value_e::Stdin) };
+
+value__Undef* value::Undef = &gvalue__Undef.obj;
+
+GcGlobal<value__Undef> gvalue__Undef = 
+  { ObjHeader::Global(value_e::Undef) };
+
+value__Null* value::Null = &gvalue__Null.obj;
+
+GcGlobal<value__Null> gvalue__Null = 
+  { ObjHeader::Global(value_e::Null) };
+
+hnode_t* value__Interrupted::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* value__Stdin::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* value__Slice::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->lower) {  // Optional
+    hnode_t* x0 = this->lower->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("lower"), x0));
+  }
+
+  if (this->upper) {  // Optional
+    hnode_t* x1 = this->upper->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("upper"), x1));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* value__Undef::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* value__Str::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->s);
+  L->append(Alloc<Field>(StrFromC("s"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* value__InitializerList::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                            seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->assigns != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<InitializerValue*> it(this->assigns); !it.Done(); it.Next()) {
+      InitializerValue* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("assigns"), x0));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* value__InternalStringArray::PrettyTree(bool do_abbrev, Dict<int,
+                                                bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->strs != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<BigStr*> it(this->strs); !it.Done(); it.Next()) {
+      BigStr* v_ = it.Value();
+      hnode_t* h = ToPretty(v_);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("strs"), x0));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* value__BashArray::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->d != nullptr) {  // Dict
+    auto* unnamed = NewList<hnode_t*>();
+    auto* hdict = Alloc<hnode::Record>(kEmptyString, StrFromC("{"),
+                                                                 StrFromC("}"),
+                                                                 NewList<Field*>(), unnamed);
+    for (DictIter<mops::BigInt, BigStr*> it(this->d); !it.Done(); it.Next()) {
+      auto k = it.Key();
+      auto v = it.Value();
+      unnamed->append(ToPretty(k));
+      unnamed->append(ToPretty(v));
+    }
+    L->append(Alloc<Field>(StrFromC("d"), hdict));
+  }
+
+  hnode_t* x1 = ToPretty(this->max_index);
+  L->append(Alloc<Field>(StrFromC("max_index"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* value__BashAssoc::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->d != nullptr) {  // Dict
+    auto* unnamed = NewList<hnode_t*>();
+    auto* hdict = Alloc<hnode::Record>(kEmptyString, StrFromC("{"),
+                                                                 StrFromC("}"),
+                                                                 NewList<Field*>(), unnamed);
+    for (DictIter<BigStr*, BigStr*> it(this->d); !it.Done(); it.Next()) {
+      auto k = it.Key();
+      auto v = it.Value();
+      unnamed->append(ToPretty(k));
+      unnamed->append(ToPretty(v));
+    }
+    L->append(Alloc<Field>(StrFromC("d"), hdict));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* value__Null::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* value__Bool::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->b);
+  L->append(Alloc<Field>(StrFromC("b"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* value__Int::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->i);
+  L->append(Alloc<Field>(StrFromC("i"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* value__Float::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->f);
+  L->append(Alloc<Field>(StrFromC("f"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* value__List::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->items != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<value_t*> it(this->items); !it.Done(); it.Next()) {
+      value_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("items"), x0));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* value__Dict::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->d != nullptr) {  // Dict
+    auto* unnamed = NewList<hnode_t*>();
+    auto* hdict = Alloc<hnode::Record>(kEmptyString, StrFromC("{"),
+                                                                 StrFromC("}"),
+                                                                 NewList<Field*>(), unnamed);
+    for (DictIter<BigStr*, value_t*> it(this->d); !it.Done(); it.Next()) {
+      auto k = it.Key();
+      auto v = it.Value();
+      unnamed->append(ToPretty(k));
+      unnamed->append(v->PrettyTree(do_abbrev, seen));
+    }
+    L->append(Alloc<Field>(StrFromC("d"), hdict));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* value__Range::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->lower);
+  L->append(Alloc<Field>(StrFromC("lower"), x0));
+
+  hnode_t* x1 = ToPretty(this->upper);
+  L->append(Alloc<Field>(StrFromC("upper"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* value__Eggex::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->spliced->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("spliced"), x0));
+
+  hnode_t* x1 = ToPretty(this->canonical_flags);
+  L->append(Alloc<Field>(StrFromC("canonical_flags"), x1));
+
+  if (this->convert_funcs != nullptr) {  // List
+    hnode::Array* x2 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<value_t*> it(this->convert_funcs); !it.Done(); it.Next()) {
+      value_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x2->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("convert_funcs"), x2));
+  }
+
+  if (this->convert_toks != nullptr) {  // List
+    hnode::Array* x3 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<syntax_asdl::Token*> it(this->convert_toks); !it.Done();
+         it.Next()) {
+      syntax_asdl::Token* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x3->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("convert_toks"), x3));
+  }
+
+  if (this->as_ere) {  // Optional
+    hnode_t* x4 = ToPretty(this->as_ere);
+    L->append(Alloc<Field>(StrFromC("as_ere"), x4));
+  }
+
+  if (this->capture_names != nullptr) {  // List
+    hnode::Array* x5 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<BigStr*> it(this->capture_names); !it.Done(); it.Next()) {
+      BigStr* v_ = it.Value();
+      hnode_t* h = ToPretty(v_);
+      x5->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("capture_names"), x5));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* value__Place::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->lval->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("lval"), x0));
+
+  if (this->frame != nullptr) {  // Dict
+    auto* unnamed = NewList<hnode_t*>();
+    auto* hdict = Alloc<hnode::Record>(kEmptyString, StrFromC("{"),
+                                                                 StrFromC("}"),
+                                                                 NewList<Field*>(), unnamed);
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it(this->frame); !it.Done();
+         it.Next()) {
+      auto k = it.Key();
+      auto v = it.Value();
+      unnamed->append(ToPretty(k));
+      unnamed->append(v->PrettyTree(do_abbrev, seen));
+    }
+    L->append(Alloc<Field>(StrFromC("frame"), hdict));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* value__Frame::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->frame != nullptr) {  // Dict
+    auto* unnamed = NewList<hnode_t*>();
+    auto* hdict = Alloc<hnode::Record>(kEmptyString, StrFromC("{"),
+                                                                 StrFromC("}"),
+                                                                 NewList<Field*>(), unnamed);
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it(this->frame); !it.Done();
+         it.Next()) {
+      auto k = it.Key();
+      auto v = it.Value();
+      unnamed->append(ToPretty(k));
+      unnamed->append(v->PrettyTree(do_abbrev, seen));
+    }
+    L->append(Alloc<Field>(StrFromC("frame"), hdict));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* value__DebugFrame::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->frame->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("frame"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* value__BoundFunc::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->me->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("me"), x0));
+
+  hnode_t* x1 = this->func->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("func"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* value__BuiltinFunc::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = Alloc<hnode::Leaf>(StrFromC("<extern>"), color_e::External);
+  L->append(Alloc<Field>(StrFromC("callable"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* value__Func::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->name);
+  L->append(Alloc<Field>(StrFromC("name"), x0));
+
+  hnode_t* x1 = this->parsed->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("parsed"), x1));
+
+  if (this->pos_defaults != nullptr) {  // List
+    hnode::Array* x2 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<value_t*> it(this->pos_defaults); !it.Done(); it.Next()) {
+      value_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x2->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("pos_defaults"), x2));
+  }
+
+  if (this->named_defaults != nullptr) {  // Dict
+    auto* unnamed = NewList<hnode_t*>();
+    auto* hdict = Alloc<hnode::Record>(kEmptyString, StrFromC("{"),
+                                                                 StrFromC("}"),
+                                                                 NewList<Field*>(), unnamed);
+    for (DictIter<BigStr*, value_t*> it(this->named_defaults); !it.Done();
+         it.Next()) {
+      auto k = it.Key();
+      auto v = it.Value();
+      unnamed->append(ToPretty(k));
+      unnamed->append(v->PrettyTree(do_abbrev, seen));
+    }
+    L->append(Alloc<Field>(StrFromC("named_defaults"), hdict));
+  }
+
+  if (this->captured_frame != nullptr) {  // Dict
+    auto* unnamed = NewList<hnode_t*>();
+    auto* hdict = Alloc<hnode::Record>(kEmptyString, StrFromC("{"),
+                                                                 StrFromC("}"),
+                                                                 NewList<Field*>(), unnamed);
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it(this->captured_frame);
+         !it.Done(); it.Next()) {
+      auto k = it.Key();
+      auto v = it.Value();
+      unnamed->append(ToPretty(k));
+      unnamed->append(v->PrettyTree(do_abbrev, seen));
+    }
+    L->append(Alloc<Field>(StrFromC("captured_frame"), hdict));
+  }
+
+  if (this->module_frame != nullptr) {  // Dict
+    auto* unnamed = NewList<hnode_t*>();
+    auto* hdict = Alloc<hnode::Record>(kEmptyString, StrFromC("{"),
+                                                                 StrFromC("}"),
+                                                                 NewList<Field*>(), unnamed);
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it(this->module_frame);
+         !it.Done(); it.Next()) {
+      auto k = it.Key();
+      auto v = it.Value();
+      unnamed->append(ToPretty(k));
+      unnamed->append(v->PrettyTree(do_abbrev, seen));
+    }
+    L->append(Alloc<Field>(StrFromC("module_frame"), hdict));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* value__BuiltinProc::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = Alloc<hnode::Leaf>(StrFromC("<extern>"), color_e::External);
+  L->append(Alloc<Field>(StrFromC("builtin"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* value__Proc::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->name);
+  L->append(Alloc<Field>(StrFromC("name"), x0));
+
+  hnode_t* x1 = this->name_tok->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("name_tok"), x1));
+
+  hnode_t* x2 = this->sig->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("sig"), x2));
+
+  hnode_t* x3 = this->body->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("body"), x3));
+
+  if (this->defaults) {  // Optional
+    hnode_t* x4 = this->defaults->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("defaults"), x4));
+  }
+
+  hnode_t* x5 = ToPretty(this->sh_compat);
+  L->append(Alloc<Field>(StrFromC("sh_compat"), x5));
+
+  if (this->captured_frame != nullptr) {  // Dict
+    auto* unnamed = NewList<hnode_t*>();
+    auto* hdict = Alloc<hnode::Record>(kEmptyString, StrFromC("{"),
+                                                                 StrFromC("}"),
+                                                                 NewList<Field*>(), unnamed);
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it(this->captured_frame);
+         !it.Done(); it.Next()) {
+      auto k = it.Key();
+      auto v = it.Value();
+      unnamed->append(ToPretty(k));
+      unnamed->append(v->PrettyTree(do_abbrev, seen));
+    }
+    L->append(Alloc<Field>(StrFromC("captured_frame"), hdict));
+  }
+
+  if (this->module_frame != nullptr) {  // Dict
+    auto* unnamed = NewList<hnode_t*>();
+    auto* hdict = Alloc<hnode::Record>(kEmptyString, StrFromC("{"),
+                                                                 StrFromC("}"),
+                                                                 NewList<Field*>(), unnamed);
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it(this->module_frame);
+         !it.Done(); it.Next()) {
+      auto k = it.Key();
+      auto v = it.Value();
+      unnamed->append(ToPretty(k));
+      unnamed->append(v->PrettyTree(do_abbrev, seen));
+    }
+    L->append(Alloc<Field>(StrFromC("module_frame"), hdict));
+  }
+
+  if (this->code_str) {  // Optional
+    hnode_t* x8 = ToPretty(this->code_str);
+    L->append(Alloc<Field>(StrFromC("code_str"), x8));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* value__Expr::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->e->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("e"), x0));
+
+  if (this->captured_frame != nullptr) {  // Dict
+    auto* unnamed = NewList<hnode_t*>();
+    auto* hdict = Alloc<hnode::Record>(kEmptyString, StrFromC("{"),
+                                                                 StrFromC("}"),
+                                                                 NewList<Field*>(), unnamed);
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it(this->captured_frame);
+         !it.Done(); it.Next()) {
+      auto k = it.Key();
+      auto v = it.Value();
+      unnamed->append(ToPretty(k));
+      unnamed->append(v->PrettyTree(do_abbrev, seen));
+    }
+    L->append(Alloc<Field>(StrFromC("captured_frame"), hdict));
+  }
+
+  if (this->module_frame != nullptr) {  // Dict
+    auto* unnamed = NewList<hnode_t*>();
+    auto* hdict = Alloc<hnode::Record>(kEmptyString, StrFromC("{"),
+                                                                 StrFromC("}"),
+                                                                 NewList<Field*>(), unnamed);
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it(this->module_frame);
+         !it.Done(); it.Next()) {
+      auto k = it.Key();
+      auto v = it.Value();
+      unnamed->append(ToPretty(k));
+      unnamed->append(v->PrettyTree(do_abbrev, seen));
+    }
+    L->append(Alloc<Field>(StrFromC("module_frame"), hdict));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* value__CommandFrag::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->c->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("c"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* value__Command::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(value_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->frag->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("frag"), x0));
+
+  if (this->captured_frame != nullptr) {  // Dict
+    auto* unnamed = NewList<hnode_t*>();
+    auto* hdict = Alloc<hnode::Record>(kEmptyString, StrFromC("{"),
+                                                                 StrFromC("}"),
+                                                                 NewList<Field*>(), unnamed);
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it(this->captured_frame);
+         !it.Done(); it.Next()) {
+      auto k = it.Key();
+      auto v = it.Value();
+      unnamed->append(ToPretty(k));
+      unnamed->append(v->PrettyTree(do_abbrev, seen));
+    }
+    L->append(Alloc<Field>(StrFromC("captured_frame"), hdict));
+  }
+
+  if (this->module_frame != nullptr) {  // Dict
+    auto* unnamed = NewList<hnode_t*>();
+    auto* hdict = Alloc<hnode::Record>(kEmptyString, StrFromC("{"),
+                                                                 StrFromC("}"),
+                                                                 NewList<Field*>(), unnamed);
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it(this->module_frame);
+         !it.Done(); it.Next()) {
+      auto k = it.Key();
+      auto v = it.Value();
+      unnamed->append(ToPretty(k));
+      unnamed->append(v->PrettyTree(do_abbrev, seen));
+    }
+    L->append(Alloc<Field>(StrFromC("module_frame"), hdict));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* value_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case value_e::Interrupted: {
+    value__Interrupted* obj = static_cast<value__Interrupted*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::Stdin: {
+    value__Stdin* obj = static_cast<value__Stdin*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::Slice: {
+    value__Slice* obj = static_cast<value__Slice*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::Undef: {
+    value__Undef* obj = static_cast<value__Undef*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::Str: {
+    value__Str* obj = static_cast<value__Str*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::InitializerList: {
+    value__InitializerList* obj = static_cast<value__InitializerList*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::InternalStringArray: {
+    value__InternalStringArray* obj =
+static_cast<value__InternalStringArray*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::BashArray: {
+    value__BashArray* obj = static_cast<value__BashArray*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::BashAssoc: {
+    value__BashAssoc* obj = static_cast<value__BashAssoc*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::Null: {
+    value__Null* obj = static_cast<value__Null*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::Bool: {
+    value__Bool* obj = static_cast<value__Bool*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::Int: {
+    value__Int* obj = static_cast<value__Int*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::Float: {
+    value__Float* obj = static_cast<value__Float*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::List: {
+    value__List* obj = static_cast<value__List*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::Dict: {
+    value__Dict* obj = static_cast<value__Dict*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::Obj: {
+    Obj* obj = static_cast<Obj*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::Range: {
+    value__Range* obj = static_cast<value__Range*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::Eggex: {
+    value__Eggex* obj = static_cast<value__Eggex*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::Match: {
+    RegexMatch* obj = static_cast<RegexMatch*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::Place: {
+    value__Place* obj = static_cast<value__Place*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::Frame: {
+    value__Frame* obj = static_cast<value__Frame*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::DebugFrame: {
+    value__DebugFrame* obj = static_cast<value__DebugFrame*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::BoundFunc: {
+    value__BoundFunc* obj = static_cast<value__BoundFunc*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::BuiltinFunc: {
+    value__BuiltinFunc* obj = static_cast<value__BuiltinFunc*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::Func: {
+    value__Func* obj = static_cast<value__Func*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::BuiltinProc: {
+    value__BuiltinProc* obj = static_cast<value__BuiltinProc*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::Proc: {
+    value__Proc* obj = static_cast<value__Proc*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::Expr: {
+    value__Expr* obj = static_cast<value__Expr*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::CommandFrag: {
+    value__CommandFrag* obj = static_cast<value__CommandFrag*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case value_e::Command: {
+    value__Command* obj = static_cast<value__Command*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void value__Interrupted::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::Interrupted)) {
+    return;
+  }
+}
+
+void value__Stdin::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::Stdin)) {
+    return;
+  }
+}
+
+void value__Slice::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::Slice)) {
+    return;
+  }
+  enc->Obj(this->lower);
+  enc->Obj(this->upper);
+}
+
+value__Slice* value__Slice::DecodeNew(pyserial::Decoder* dec) {
+  value__Slice* obj = value__Slice::CreateNull();
+  dec->Add(obj);
+  obj->lower = IntBox::Decode(dec);
+  obj->upper = IntBox::Decode(dec);
+  return obj;
+}
+
+void value__Undef::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::Undef)) {
+    return;
+  }
+}
+
+void value__Str::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::Str)) {
+    return;
+  }
+  enc->Str(this->s);
+}
+
+value__Str* value__Str::DecodeNew(pyserial::Decoder* dec) {
+  value__Str* obj = value__Str::CreateNull();
+  dec->Add(obj);
+  obj->s = dec->Str();
+  return obj;
+}
+
+void value__InitializerList::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::InitializerList)) {
+    return;
+  }
+  if (this->assigns == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->assigns));
+    for (ListIter<InitializerValue*> it0(this->assigns); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+value__InitializerList* value__InitializerList::DecodeNew(pyserial::Decoder*
+                                                          dec) {
+  value__InitializerList* obj = value__InitializerList::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<InitializerValue*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      InitializerValue* i0;
+      i0 = InitializerValue::Decode(dec);
+      c0->append(i0);
+    }
+    obj->assigns = c0;
+  }
+  return obj;
+}
+
+void value__InternalStringArray::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::InternalStringArray)) {
+    return;
+  }
+  if (this->strs == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->strs));
+    for (ListIter<BigStr*> it0(this->strs); !it0.Done(); it0.Next()) {
+      enc->Str(it0.Value());
+    }
+  }
+}
+
+value__InternalStringArray*
+value__InternalStringArray::DecodeNew(pyserial::Decoder* dec) {
+  value__InternalStringArray* obj = value__InternalStringArray::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<BigStr*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      BigStr* i0;
+      i0 = dec->Str();
+      c0->append(i0);
+    }
+    obj->strs = c0;
+  }
+  return obj;
+}
+
+void value__BashArray::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::BashArray)) {
+    return;
+  }
+  if (this->d == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->d));
+    for (DictIter<mops::BigInt, BigStr*> it0(this->d); !it0.Done(); it0.Next()) {
+      enc->BigInt(it0.Key());
+      enc->Str(it0.Value());
+    }
+  }
+  enc->BigInt(this->max_index);
+}
+
+value__BashArray* value__BashArray::DecodeNew(pyserial::Decoder* dec) {
+  value__BashArray* obj = value__BashArray::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<Dict<mops::BigInt, BigStr*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      mops::BigInt k0;
+      BigStr* v0;
+      k0 = dec->BigInt();
+      v0 = dec->Str();
+      c0->set(k0, v0);
+    }
+    obj->d = c0;
+  }
+  obj->max_index = dec->BigInt();
+  return obj;
+}
+
+void value__BashAssoc::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::BashAssoc)) {
+    return;
+  }
+  if (this->d == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->d));
+    for (DictIter<BigStr*, BigStr*> it0(this->d); !it0.Done(); it0.Next()) {
+      enc->Str(it0.Key());
+      enc->Str(it0.Value());
+    }
+  }
+}
+
+value__BashAssoc* value__BashAssoc::DecodeNew(pyserial::Decoder* dec) {
+  value__BashAssoc* obj = value__BashAssoc::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<Dict<BigStr*, BigStr*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      BigStr* k0;
+      BigStr* v0;
+      k0 = dec->Str();
+      v0 = dec->Str();
+      c0->set(k0, v0);
+    }
+    obj->d = c0;
+  }
+  return obj;
+}
+
+void value__Null::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::Null)) {
+    return;
+  }
+}
+
+void value__Bool::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::Bool)) {
+    return;
+  }
+  enc->Bool(this->b);
+}
+
+value__Bool* value__Bool::DecodeNew(pyserial::Decoder* dec) {
+  value__Bool* obj = value__Bool::CreateNull();
+  dec->Add(obj);
+  obj->b = dec->Bool();
+  return obj;
+}
+
+void value__Int::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::Int)) {
+    return;
+  }
+  enc->BigInt(this->i);
+}
+
+value__Int* value__Int::DecodeNew(pyserial::Decoder* dec) {
+  value__Int* obj = value__Int::CreateNull();
+  dec->Add(obj);
+  obj->i = dec->BigInt();
+  return obj;
+}
+
+void value__Float::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::Float)) {
+    return;
+  }
+  enc->Float(this->f);
+}
+
+value__Float* value__Float::DecodeNew(pyserial::Decoder* dec) {
+  value__Float* obj = value__Float::CreateNull();
+  dec->Add(obj);
+  obj->f = dec->Float();
+  return obj;
+}
+
+void value__List::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::List)) {
+    return;
+  }
+  if (this->items == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->items));
+    for (ListIter<value_t*> it0(this->items); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+value__List* value__List::DecodeNew(pyserial::Decoder* dec) {
+  value__List* obj = value__List::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<value_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      value_t* i0;
+      i0 = value_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->items = c0;
+  }
+  return obj;
+}
+
+void value__Dict::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::Dict)) {
+    return;
+  }
+  if (this->d == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->d));
+    for (DictIter<BigStr*, value_t*> it0(this->d); !it0.Done(); it0.Next()) {
+      enc->Str(it0.Key());
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+value__Dict* value__Dict::DecodeNew(pyserial::Decoder* dec) {
+  value__Dict* obj = value__Dict::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<Dict<BigStr*, value_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      BigStr* k0;
+      value_t* v0;
+      k0 = dec->Str();
+      v0 = value_t::Decode(dec);
+      c0->set(k0, v0);
+    }
+    obj->d = c0;
+  }
+  return obj;
+}
+
+void value__Range::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::Range)) {
+    return;
+  }
+  enc->Int(this->lower);
+  enc->Int(this->upper);
+}
+
+value__Range* value__Range::DecodeNew(pyserial::Decoder* dec) {
+  value__Range* obj = value__Range::CreateNull();
+  dec->Add(obj);
+  obj->lower = dec->Int();
+  obj->upper = dec->Int();
+  return obj;
+}
+
+void value__Eggex::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::Eggex)) {
+    return;
+  }
+  enc->Obj(this->spliced);
+  enc->Str(this->canonical_flags);
+  if (this->convert_funcs == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->convert_funcs));
+    for (ListIter<value_t*> it0(this->convert_funcs); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  if (this->convert_toks == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->convert_toks));
+    for (ListIter<syntax_asdl::Token*> it1(this->convert_toks); !it1.Done(); it1.Next()) {
+      enc->Obj(it1.Value());
+    }
+  }
+  enc->Str(this->as_ere);
+  if (this->capture_names == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->capture_names));
+    for (ListIter<BigStr*> it2(this->capture_names); !it2.Done(); it2.Next()) {
+      enc->Str(it2.Value());
+    }
+  }
+}
+
+value__Eggex* value__Eggex::DecodeNew(pyserial::Decoder* dec) {
+  value__Eggex* obj = value__Eggex::CreateNull();
+  dec->Add(obj);
+  obj->spliced = syntax_asdl::re_t::Decode(dec);
+  obj->canonical_flags = dec->Str();
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<value_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      value_t* i0;
+      i0 = value_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->convert_funcs = c0;
+  }
+  int n1 = dec->Size();
+  if (n1 != -1) {
+    auto* c1 = Alloc<List<syntax_asdl::Token*>>();
+    for (int j1 = 0; j1 < n1; ++j1) {
+      syntax_asdl::Token* i1;
+      i1 = syntax_asdl::Token::Decode(dec);
+      c1->append(i1);
+    }
+    obj->convert_toks = c1;
+  }
+  obj->as_ere = dec->Str();
+  int n2 = dec->Size();
+  if (n2 != -1) {
+    auto* c2 = Alloc<List<BigStr*>>();
+    for (int j2 = 0; j2 < n2; ++j2) {
+      BigStr* i2;
+      i2 = dec->Str();
+      c2->append(i2);
+    }
+    obj->capture_names = c2;
+  }
+  return obj;
+}
+
+void value__Place::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::Place)) {
+    return;
+  }
+  enc->Obj(this->lval);
+  if (this->frame == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->frame));
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it0(this->frame); !it0.Done(); it0.Next()) {
+      enc->Str(it0.Key());
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+value__Place* value__Place::DecodeNew(pyserial::Decoder* dec) {
+  value__Place* obj = value__Place::CreateNull();
+  dec->Add(obj);
+  obj->lval = y_lvalue_t::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<Dict<BigStr*, runtime_asdl::Cell*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      BigStr* k0;
+      runtime_asdl::Cell* v0;
+      k0 = dec->Str();
+      v0 = runtime_asdl::Cell::Decode(dec);
+      c0->set(k0, v0);
+    }
+    obj->frame = c0;
+  }
+  return obj;
+}
+
+void value__Frame::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::Frame)) {
+    return;
+  }
+  if (this->frame == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->frame));
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it0(this->frame); !it0.Done(); it0.Next()) {
+      enc->Str(it0.Key());
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+value__Frame* value__Frame::DecodeNew(pyserial::Decoder* dec) {
+  value__Frame* obj = value__Frame::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<Dict<BigStr*, runtime_asdl::Cell*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      BigStr* k0;
+      runtime_asdl::Cell* v0;
+      k0 = dec->Str();
+      v0 = runtime_asdl::Cell::Decode(dec);
+      c0->set(k0, v0);
+    }
+    obj->frame = c0;
+  }
+  return obj;
+}
+
+void value__DebugFrame::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::DebugFrame)) {
+    return;
+  }
+  enc->Obj(this->frame);
+}
+
+value__DebugFrame* value__DebugFrame::DecodeNew(pyserial::Decoder* dec) {
+  value__DebugFrame* obj = value__DebugFrame::CreateNull();
+  dec->Add(obj);
+  obj->frame = syntax_asdl::debug_frame_t::Decode(dec);
+  return obj;
+}
+
+void value__BoundFunc::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::BoundFunc)) {
+    return;
+  }
+  enc->Obj(this->me);
+  enc->Obj(this->func);
+}
+
+value__BoundFunc* value__BoundFunc::DecodeNew(pyserial::Decoder* dec) {
+  value__BoundFunc* obj = value__BoundFunc::CreateNull();
+  dec->Add(obj);
+  obj->me = value_t::Decode(dec);
+  obj->func = value_t::Decode(dec);
+  return obj;
+}
+
+void value__BuiltinFunc::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::BuiltinFunc)) {
+    return;
+  }
+  enc->Unsupported();
+}
+
+value__BuiltinFunc* value__BuiltinFunc::DecodeNew(pyserial::Decoder* dec) {
+  value__BuiltinFunc* obj = value__BuiltinFunc::CreateNull();
+  dec->Add(obj);
+  dec->Unsupported();
+  obj->callable = nullptr;
+  return obj;
+}
+
+void value__Func::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::Func)) {
+    return;
+  }
+  enc->Str(this->name);
+  enc->Obj(this->parsed);
+  if (this->pos_defaults == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->pos_defaults));
+    for (ListIter<value_t*> it0(this->pos_defaults); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  if (this->named_defaults == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->named_defaults));
+    for (DictIter<BigStr*, value_t*> it1(this->named_defaults); !it1.Done(); it1.Next()) {
+      enc->Str(it1.Key());
+      enc->Obj(it1.Value());
+    }
+  }
+  if (this->captured_frame == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->captured_frame));
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it2(this->captured_frame); !it2.Done(); it2.Next()) {
+      enc->Str(it2.Key());
+      enc->Obj(it2.Value());
+    }
+  }
+  if (this->module_frame == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->module_frame));
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it3(this->module_frame); !it3.Done(); it3.Next()) {
+      enc->Str(it3.Key());
+      enc->Obj(it3.Value());
+    }
+  }
+}
+
+value__Func* value__Func::DecodeNew(pyserial::Decoder* dec) {
+  value__Func* obj = value__Func::CreateNull();
+  dec->Add(obj);
+  obj->name = dec->Str();
+  obj->parsed = syntax_asdl::Func::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<value_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      value_t* i0;
+      i0 = value_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->pos_defaults = c0;
+  }
+  int n1 = dec->Size();
+  if (n1 != -1) {
+    auto* c1 = Alloc<Dict<BigStr*, value_t*>>();
+    for (int j1 = 0; j1 < n1; ++j1) {
+      BigStr* k1;
+      value_t* v1;
+      k1 = dec->Str();
+      v1 = value_t::Decode(dec);
+      c1->set(k1, v1);
+    }
+    obj->named_defaults = c1;
+  }
+  int n2 = dec->Size();
+  if (n2 != -1) {
+    auto* c2 = Alloc<Dict<BigStr*, runtime_asdl::Cell*>>();
+    for (int j2 = 0; j2 < n2; ++j2) {
+      BigStr* k2;
+      runtime_asdl::Cell* v2;
+      k2 = dec->Str();
+      v2 = runtime_asdl::Cell::Decode(dec);
+      c2->set(k2, v2);
+    }
+    obj->captured_frame = c2;
+  }
+  int n3 = dec->Size();
+  if (n3 != -1) {
+    auto* c3 = Alloc<Dict<BigStr*, runtime_asdl::Cell*>>();
+    for (int j3 = 0; j3 < n3; ++j3) {
+      BigStr* k3;
+      runtime_asdl::Cell* v3;
+      k3 = dec->Str();
+      v3 = runtime_asdl::Cell::Decode(dec);
+      c3->set(k3, v3);
+    }
+    obj->module_frame = c3;
+  }
+  return obj;
+}
+
+void value__BuiltinProc::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::BuiltinProc)) {
+    return;
+  }
+  enc->Unsupported();
+}
+
+value__BuiltinProc* value__BuiltinProc::DecodeNew(pyserial::Decoder* dec) {
+  value__BuiltinProc* obj = value__BuiltinProc::CreateNull();
+  dec->Add(obj);
+  dec->Unsupported();
+  obj->builtin = nullptr;
+  return obj;
+}
+
+void value__Proc::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::Proc)) {
+    return;
+  }
+  enc->Str(this->name);
+  enc->Obj(this->name_tok);
+  enc->Obj(this->sig);
+  enc->Obj(this->body);
+  enc->Obj(this->defaults);
+  enc->Bool(this->sh_compat);
+  if (this->captured_frame == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->captured_frame));
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it0(this->captured_frame); !it0.Done(); it0.Next()) {
+      enc->Str(it0.Key());
+      enc->Obj(it0.Value());
+    }
+  }
+  if (this->module_frame == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->module_frame));
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it1(this->module_frame); !it1.Done(); it1.Next()) {
+      enc->Str(it1.Key());
+      enc->Obj(it1.Value());
+    }
+  }
+  enc->Str(this->code_str);
+}
+
+value__Proc* value__Proc::DecodeNew(pyserial::Decoder* dec) {
+  value__Proc* obj = value__Proc::CreateNull();
+  dec->Add(obj);
+  obj->name = dec->Str();
+  obj->name_tok = syntax_asdl::Token::Decode(dec);
+  obj->sig = syntax_asdl::proc_sig_t::Decode(dec);
+  obj->body = syntax_asdl::command_t::Decode(dec);
+  obj->defaults = ProcDefaults::Decode(dec);
+  obj->sh_compat = dec->Bool();
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<Dict<BigStr*, runtime_asdl::Cell*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      BigStr* k0;
+      runtime_asdl::Cell* v0;
+      k0 = dec->Str();
+      v0 = runtime_asdl::Cell::Decode(dec);
+      c0->set(k0, v0);
+    }
+    obj->captured_frame = c0;
+  }
+  int n1 = dec->Size();
+  if (n1 != -1) {
+    auto* c1 = Alloc<Dict<BigStr*, runtime_asdl::Cell*>>();
+    for (int j1 = 0; j1 < n1; ++j1) {
+      BigStr* k1;
+      runtime_asdl::Cell* v1;
+      k1 = dec->Str();
+      v1 = runtime_asdl::Cell::Decode(dec);
+      c1->set(k1, v1);
+    }
+    obj->module_frame = c1;
+  }
+  obj->code_str = dec->Str();
+  return obj;
+}
+
+void value__Expr::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::Expr)) {
+    return;
+  }
+  enc->Obj(this->e);
+  if (this->captured_frame == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->captured_frame));
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it0(this->captured_frame); !it0.Done(); it0.Next()) {
+      enc->Str(it0.Key());
+      enc->Obj(it0.Value());
+    }
+  }
+  if (this->module_frame == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->module_frame));
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it1(this->module_frame); !it1.Done(); it1.Next()) {
+      enc->Str(it1.Key());
+      enc->Obj(it1.Value());
+    }
+  }
+}
+
+value__Expr* value__Expr::DecodeNew(pyserial::Decoder* dec) {
+  value__Expr* obj = value__Expr::CreateNull();
+  dec->Add(obj);
+  obj->e = syntax_asdl::expr_t::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<Dict<BigStr*, runtime_asdl::Cell*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      BigStr* k0;
+      runtime_asdl::Cell* v0;
+      k0 = dec->Str();
+      v0 = runtime_asdl::Cell::Decode(dec);
+      c0->set(k0, v0);
+    }
+    obj->captured_frame = c0;
+  }
+  int n1 = dec->Size();
+  if (n1 != -1) {
+    auto* c1 = Alloc<Dict<BigStr*, runtime_asdl::Cell*>>();
+    for (int j1 = 0; j1 < n1; ++j1) {
+      BigStr* k1;
+      runtime_asdl::Cell* v1;
+      k1 = dec->Str();
+      v1 = runtime_asdl::Cell::Decode(dec);
+      c1->set(k1, v1);
+    }
+    obj->module_frame = c1;
+  }
+  return obj;
+}
+
+void value__CommandFrag::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::CommandFrag)) {
+    return;
+  }
+  enc->Obj(this->c);
+}
+
+value__CommandFrag* value__CommandFrag::DecodeNew(pyserial::Decoder* dec) {
+  value__CommandFrag* obj = value__CommandFrag::CreateNull();
+  dec->Add(obj);
+  obj->c = syntax_asdl::command_t::Decode(dec);
+  return obj;
+}
+
+void value__Command::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, value_e::Command)) {
+    return;
+  }
+  enc->Obj(this->frag);
+  if (this->captured_frame == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->captured_frame));
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it0(this->captured_frame); !it0.Done(); it0.Next()) {
+      enc->Str(it0.Key());
+      enc->Obj(it0.Value());
+    }
+  }
+  if (this->module_frame == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->module_frame));
+    for (DictIter<BigStr*, runtime_asdl::Cell*> it1(this->module_frame); !it1.Done(); it1.Next()) {
+      enc->Str(it1.Key());
+      enc->Obj(it1.Value());
+    }
+  }
+}
+
+value__Command* value__Command::DecodeNew(pyserial::Decoder* dec) {
+  value__Command* obj = value__Command::CreateNull();
+  dec->Add(obj);
+  obj->frag = syntax_asdl::cmd_frag_t::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<Dict<BigStr*, runtime_asdl::Cell*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      BigStr* k0;
+      runtime_asdl::Cell* v0;
+      k0 = dec->Str();
+      v0 = runtime_asdl::Cell::Decode(dec);
+      c0->set(k0, v0);
+    }
+    obj->captured_frame = c0;
+  }
+  int n1 = dec->Size();
+  if (n1 != -1) {
+    auto* c1 = Alloc<Dict<BigStr*, runtime_asdl::Cell*>>();
+    for (int j1 = 0; j1 < n1; ++j1) {
+      BigStr* k1;
+      runtime_asdl::Cell* v1;
+      k1 = dec->Str();
+      v1 = runtime_asdl::Cell::Decode(dec);
+      c1->set(k1, v1);
+    }
+    obj->module_frame = c1;
+  }
+  return obj;
+}
+
+void value_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case value_e::Interrupted: {
+    static_cast<value__Interrupted*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::Stdin: {
+    static_cast<value__Stdin*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::Slice: {
+    static_cast<value__Slice*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::Undef: {
+    static_cast<value__Undef*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::Str: {
+    static_cast<value__Str*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::InitializerList: {
+    static_cast<value__InitializerList*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::InternalStringArray: {
+    static_cast<value__InternalStringArray*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::BashArray: {
+    static_cast<value__BashArray*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::BashAssoc: {
+    static_cast<value__BashAssoc*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::Null: {
+    static_cast<value__Null*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::Bool: {
+    static_cast<value__Bool*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::Int: {
+    static_cast<value__Int*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::Float: {
+    static_cast<value__Float*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::List: {
+    static_cast<value__List*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::Dict: {
+    static_cast<value__Dict*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::Obj: {
+    static_cast<Obj*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::Range: {
+    static_cast<value__Range*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::Eggex: {
+    static_cast<value__Eggex*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::Match: {
+    static_cast<RegexMatch*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::Place: {
+    static_cast<value__Place*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::Frame: {
+    static_cast<value__Frame*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::DebugFrame: {
+    static_cast<value__DebugFrame*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::BoundFunc: {
+    static_cast<value__BoundFunc*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::BuiltinFunc: {
+    static_cast<value__BuiltinFunc*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::Func: {
+    static_cast<value__Func*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::BuiltinProc: {
+    static_cast<value__BuiltinProc*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::Proc: {
+    static_cast<value__Proc*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::Expr: {
+    static_cast<value__Expr*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::CommandFrag: {
+    static_cast<value__CommandFrag*>(this)->Encode(enc);
+    return;
+  }
+  case value_e::Command: {
+    static_cast<value__Command*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+value_t* value_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case value_e::Interrupted:
+    dec->Add(value::Interrupted);
+    return value::Interrupted;
+  case value_e::Stdin:
+    dec->Add(value::Stdin);
+    return value::Stdin;
+  case value_e::Slice:
+    return value__Slice::DecodeNew(dec);
+  case value_e::Undef:
+    dec->Add(value::Undef);
+    return value::Undef;
+  case value_e::Str:
+    return value__Str::DecodeNew(dec);
+  case value_e::InitializerList:
+    return value__InitializerList::DecodeNew(dec);
+  case value_e::InternalStringArray:
+    return value__InternalStringArray::DecodeNew(dec);
+  case value_e::BashArray:
+    return value__BashArray::DecodeNew(dec);
+  case value_e::BashAssoc:
+    return value__BashAssoc::DecodeNew(dec);
+  case value_e::Null:
+    dec->Add(value::Null);
+    return value::Null;
+  case value_e::Bool:
+    return value__Bool::DecodeNew(dec);
+  case value_e::Int:
+    return value__Int::DecodeNew(dec);
+  case value_e::Float:
+    return value__Float::DecodeNew(dec);
+  case value_e::List:
+    return value__List::DecodeNew(dec);
+  case value_e::Dict:
+    return value__Dict::DecodeNew(dec);
+  case value_e::Obj:
+    return Obj::DecodeNew(dec);
+  case value_e::Range:
+    return value__Range::DecodeNew(dec);
+  case value_e::Eggex:
+    return value__Eggex::DecodeNew(dec);
+  case value_e::Match:
+    return RegexMatch::DecodeNew(dec);
+  case value_e::Place:
+    return value__Place::DecodeNew(dec);
+  case value_e::Frame:
+    return value__Frame::DecodeNew(dec);
+  case value_e::DebugFrame:
+    return value__DebugFrame::DecodeNew(dec);
+  case value_e::BoundFunc:
+    return value__BoundFunc::DecodeNew(dec);
+  case value_e::BuiltinFunc:
+    return value__BuiltinFunc::DecodeNew(dec);
+  case value_e::Func:
+    return value__Func::DecodeNew(dec);
+  case value_e::BuiltinProc:
+    return value__BuiltinProc::DecodeNew(dec);
+  case value_e::Proc:
+    return value__Proc::DecodeNew(dec);
+  case value_e::Expr:
+    return value__Expr::DecodeNew(dec);
+  case value_e::CommandFrag:
+    return value__CommandFrag::DecodeNew(dec);
+  case value_e::Command:
+    return value__Command::DecodeNew(dec);
+  }
+  return static_cast<value_t*>(dec->Ref(h));
+}
+
+}  // namespace value_asdl
@@ -0,0 +1,12616 @@
+// _gen/frontend/syntax.asdl.cc is generated by asdl_main.py
+
+#include "_gen/frontend/syntax.asdl.h"
+#include <assert.h>
+#include "prebuilt/frontend/syntax_abbrev.mycpp.h"
+#include "prebuilt/asdl/runtime.mycpp.h"  // from mycpp
+#include "_gen/frontend/id_kind.asdl.h"  // "use" in ASDL
+using id_kind_asdl::Id_str;
+#include "_gen/core/value.asdl.h"  // "use" in ASDL
+
+// Generated code uses these types
+using hnode_asdl::hnode;
+using hnode_asdl::Field;
+using hnode_asdl::color_e;
+
+namespace syntax_asdl {
+
+
+hnode_t* BoolParamBox::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("BoolParamBox"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->b);
+  L->append(Alloc<Field>(StrFromC("b"), x0));
+
+  return out_node;
+}
+
+
+void BoolParamBox::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 64)) {
+    return;
+  }
+  enc->Bool(this->b);
+}
+
+BoolParamBox* BoolParamBox::DecodeNew(pyserial::Decoder* dec) {
+  BoolParamBox* obj = BoolParamBox::CreateNull();
+  dec->Add(obj);
+  obj->b = dec->Bool();
+  return obj;
+}
+
+BoolParamBox* BoolParamBox::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 64) {
+    return BoolParamBox::DecodeNew(dec);
+  }
+  return static_cast<BoolParamBox*>(dec->Ref(h));
+}
+
+hnode_t* IntParamBox::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("IntParamBox"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->i);
+  L->append(Alloc<Field>(StrFromC("i"), x0));
+
+  return out_node;
+}
+
+
+void IntParamBox::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 65)) {
+    return;
+  }
+  enc->Int(this->i);
+}
+
+IntParamBox* IntParamBox::DecodeNew(pyserial::Decoder* dec) {
+  IntParamBox* obj = IntParamBox::CreateNull();
+  dec->Add(obj);
+  obj->i = dec->Int();
+  return obj;
+}
+
+IntParamBox* IntParamBox::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 65) {
+    return IntParamBox::DecodeNew(dec);
+  }
+  return static_cast<IntParamBox*>(dec->Ref(h));
+}
+BigStr* parse_result_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case parse_result_e::EmptyLine:
+    v = "EmptyLine"; break;
+  case parse_result_e::Eof:
+    v = "Eof"; break;
+  case parse_result_e::Node:
+    v = "Node"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "parse_result.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+parse_result__EmptyLine* parse_result::EmptyLine =
+&gparse_result__EmptyLine.obj;
+
+GcGlobal<parse_result__EmptyLine> gparse_result__EmptyLine = 
+  { ObjHeader::Global(parse_result_e::EmptyLine) };
+
+parse_result__Eof* parse_result::Eof = &gparse_result__Eof.obj;
+
+GcGlobal<parse_result__Eof> gparse_result__Eof = 
+  { ObjHeader::Global(parse_result_e::Eof) };
+
+hnode_t* parse_result__EmptyLine::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                             seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(parse_result_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* parse_result__Eof::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(parse_result_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* parse_result__Node::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(parse_result_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->cmd->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("cmd"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* parse_result_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case parse_result_e::EmptyLine: {
+    parse_result__EmptyLine* obj = static_cast<parse_result__EmptyLine*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case parse_result_e::Eof: {
+    parse_result__Eof* obj = static_cast<parse_result__Eof*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case parse_result_e::Node: {
+    parse_result__Node* obj = static_cast<parse_result__Node*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void parse_result__EmptyLine::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, parse_result_e::EmptyLine)) {
+    return;
+  }
+}
+
+void parse_result__Eof::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, parse_result_e::Eof)) {
+    return;
+  }
+}
+
+void parse_result__Node::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, parse_result_e::Node)) {
+    return;
+  }
+  enc->Obj(this->cmd);
+}
+
+parse_result__Node* parse_result__Node::DecodeNew(pyserial::Decoder* dec) {
+  parse_result__Node* obj = parse_result__Node::CreateNull();
+  dec->Add(obj);
+  obj->cmd = command_t::Decode(dec);
+  return obj;
+}
+
+void parse_result_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case parse_result_e::EmptyLine: {
+    static_cast<parse_result__EmptyLine*>(this)->Encode(enc);
+    return;
+  }
+  case parse_result_e::Eof: {
+    static_cast<parse_result__Eof*>(this)->Encode(enc);
+    return;
+  }
+  case parse_result_e::Node: {
+    static_cast<parse_result__Node*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+parse_result_t* parse_result_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case parse_result_e::EmptyLine:
+    dec->Add(parse_result::EmptyLine);
+    return parse_result::EmptyLine;
+  case parse_result_e::Eof:
+    dec->Add(parse_result::Eof);
+    return parse_result::Eof;
+  case parse_result_e::Node:
+    return parse_result__Node::DecodeNew(dec);
+  }
+  return static_cast<parse_result_t*>(dec->Ref(h));
+}
+BigStr* source_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case source_e::Interactive:
+    v = "Interactive"; break;
+  case source_e::Headless:
+    v = "Headless"; break;
+  case source_e::Unused:
+    v = "Unused"; break;
+  case source_e::CFlag:
+    v = "CFlag"; break;
+  case source_e::Stdin:
+    v = "Stdin"; break;
+  case source_e::MainFile:
+    v = "MainFile"; break;
+  case source_e::OtherFile:
+    v = "OtherFile"; break;
+  case source_e::Dynamic:
+    v = "Dynamic"; break;
+  case source_e::VarRef:
+    v = "VarRef"; break;
+  case source_e::Variable:
+    v = "Variable"; break;
+  case source_e::Alias:
+    v = "Alias"; break;
+  case source_e::Reparsed:
+    v = "Reparsed"; break;
+  case source_e::Synthetic:
+    v = "Synthetic"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "source.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+source__Interactive* source::Interactive = &gsource__Interactive.obj;
+
+GcGlobal<source__Interactive> gsource__Interactive = 
+  { ObjHeader::Global(source_e::Interactive) };
+
+source__Headless* source::Headless = &gsource__Headless.obj;
+
+GcGlobal<source__Headless> gsource__Headless = 
+  { ObjHeader::Global(source_e::Headless) };
+
+source__CFlag* source::CFlag = &gsource__CFlag.obj;
+
+GcGlobal<source__CFlag> gsource__CFlag = 
+  { ObjHeader::Global(source_e::CFlag) };
+
+hnode_t* source__Interactive::PrettyTree(bool do_abbrev, Dict<int, bool>* seen)
+                                         {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(source_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* source__Headless::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(source_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* source__Unused::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(source_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->comment);
+  L->append(Alloc<Field>(StrFromC("comment"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* source__CFlag::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(source_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* source__Stdin::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(source_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->comment);
+  L->append(Alloc<Field>(StrFromC("comment"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* source__MainFile::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(source_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->path);
+  L->append(Alloc<Field>(StrFromC("path"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* source__OtherFile::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(source_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->path);
+  L->append(Alloc<Field>(StrFromC("path"), x0));
+
+  hnode_t* x1 = this->location->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("location"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* source__Dynamic::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(source_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->what);
+  L->append(Alloc<Field>(StrFromC("what"), x0));
+
+  hnode_t* x1 = this->location->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("location"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* source__VarRef::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(source_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->orig_tok->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("orig_tok"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* source__Variable::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(source_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->var_name);
+  L->append(Alloc<Field>(StrFromC("var_name"), x0));
+
+  hnode_t* x1 = this->location->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("location"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* source__Alias::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(source_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->argv0);
+  L->append(Alloc<Field>(StrFromC("argv0"), x0));
+
+  hnode_t* x1 = this->argv0_loc->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("argv0_loc"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* source__Reparsed::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(source_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->what);
+  L->append(Alloc<Field>(StrFromC("what"), x0));
+
+  hnode_t* x1 = this->left_token->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left_token"), x1));
+
+  hnode_t* x2 = this->right_token->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right_token"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* source__Synthetic::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(source_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->s);
+  L->append(Alloc<Field>(StrFromC("s"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* source_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case source_e::Interactive: {
+    source__Interactive* obj = static_cast<source__Interactive*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case source_e::Headless: {
+    source__Headless* obj = static_cast<source__Headless*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case source_e::Unused: {
+    source__Unused* obj = static_cast<source__Unused*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case source_e::CFlag: {
+    source__CFlag* obj = static_cast<source__CFlag*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case source_e::Stdin: {
+    source__Stdin* obj = static_cast<source__Stdin*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case source_e::MainFile: {
+    source__MainFile* obj = static_cast<source__MainFile*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case source_e::OtherFile: {
+    source__OtherFile* obj = static_cast<source__OtherFile*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case source_e::Dynamic: {
+    source__Dynamic* obj = static_cast<source__Dynamic*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case source_e::VarRef: {
+    source__VarRef* obj = static_cast<source__VarRef*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case source_e::Variable: {
+    source__Variable* obj = static_cast<source__Variable*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case source_e::Alias: {
+    source__Alias* obj = static_cast<source__Alias*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case source_e::Reparsed: {
+    source__Reparsed* obj = static_cast<source__Reparsed*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case source_e::Synthetic: {
+    source__Synthetic* obj = static_cast<source__Synthetic*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void source__Interactive::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, source_e::Interactive)) {
+    return;
+  }
+}
+
+void source__Headless::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, source_e::Headless)) {
+    return;
+  }
+}
+
+void source__Unused::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, source_e::Unused)) {
+    return;
+  }
+  enc->Str(this->comment);
+}
+
+source__Unused* source__Unused::DecodeNew(pyserial::Decoder* dec) {
+  source__Unused* obj = source__Unused::CreateNull();
+  dec->Add(obj);
+  obj->comment = dec->Str();
+  return obj;
+}
+
+void source__CFlag::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, source_e::CFlag)) {
+    return;
+  }
+}
+
+void source__Stdin::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, source_e::Stdin)) {
+    return;
+  }
+  enc->Str(this->comment);
+}
+
+source__Stdin* source__Stdin::DecodeNew(pyserial::Decoder* dec) {
+  source__Stdin* obj = source__Stdin::CreateNull();
+  dec->Add(obj);
+  obj->comment = dec->Str();
+  return obj;
+}
+
+void source__MainFile::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, source_e::MainFile)) {
+    return;
+  }
+  enc->Str(this->path);
+}
+
+source__MainFile* source__MainFile::DecodeNew(pyserial::Decoder* dec) {
+  source__MainFile* obj = source__MainFile::CreateNull();
+  dec->Add(obj);
+  obj->path = dec->Str();
+  return obj;
+}
+
+void source__OtherFile::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, source_e::OtherFile)) {
+    return;
+  }
+  enc->Str(this->path);
+  enc->Obj(this->location);
+}
+
+source__OtherFile* source__OtherFile::DecodeNew(pyserial::Decoder* dec) {
+  source__OtherFile* obj = source__OtherFile::CreateNull();
+  dec->Add(obj);
+  obj->path = dec->Str();
+  obj->location = loc_t::Decode(dec);
+  return obj;
+}
+
+void source__Dynamic::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, source_e::Dynamic)) {
+    return;
+  }
+  enc->Str(this->what);
+  enc->Obj(this->location);
+}
+
+source__Dynamic* source__Dynamic::DecodeNew(pyserial::Decoder* dec) {
+  source__Dynamic* obj = source__Dynamic::CreateNull();
+  dec->Add(obj);
+  obj->what = dec->Str();
+  obj->location = loc_t::Decode(dec);
+  return obj;
+}
+
+void source__VarRef::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, source_e::VarRef)) {
+    return;
+  }
+  enc->Obj(this->orig_tok);
+}
+
+source__VarRef* source__VarRef::DecodeNew(pyserial::Decoder* dec) {
+  source__VarRef* obj = source__VarRef::CreateNull();
+  dec->Add(obj);
+  obj->orig_tok = Token::Decode(dec);
+  return obj;
+}
+
+void source__Variable::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, source_e::Variable)) {
+    return;
+  }
+  enc->Str(this->var_name);
+  enc->Obj(this->location);
+}
+
+source__Variable* source__Variable::DecodeNew(pyserial::Decoder* dec) {
+  source__Variable* obj = source__Variable::CreateNull();
+  dec->Add(obj);
+  obj->var_name = dec->Str();
+  obj->location = loc_t::Decode(dec);
+  return obj;
+}
+
+void source__Alias::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, source_e::Alias)) {
+    return;
+  }
+  enc->Str(this->argv0);
+  enc->Obj(this->argv0_loc);
+}
+
+source__Alias* source__Alias::DecodeNew(pyserial::Decoder* dec) {
+  source__Alias* obj = source__Alias::CreateNull();
+  dec->Add(obj);
+  obj->argv0 = dec->Str();
+  obj->argv0_loc = loc_t::Decode(dec);
+  return obj;
+}
+
+void source__Reparsed::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, source_e::Reparsed)) {
+    return;
+  }
+  enc->Str(this->what);
+  enc->Obj(this->left_token);
+  enc->Obj(this->right_token);
+}
+
+source__Reparsed* source__Reparsed::DecodeNew(pyserial::Decoder* dec) {
+  source__Reparsed* obj = source__Reparsed::CreateNull();
+  dec->Add(obj);
+  obj->what = dec->Str();
+  obj->left_token = Token::Decode(dec);
+  obj->right_token = Token::Decode(dec);
+  return obj;
+}
+
+void source__Synthetic::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, source_e::Synthetic)) {
+    return;
+  }
+  enc->Str(this->s);
+}
+
+source__Synthetic* source__Synthetic::DecodeNew(pyserial::Decoder* dec) {
+  source__Synthetic* obj = source__Synthetic::CreateNull();
+  dec->Add(obj);
+  obj->s = dec->Str();
+  return obj;
+}
+
+void source_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case source_e::Interactive: {
+    static_cast<source__Interactive*>(this)->Encode(enc);
+    return;
+  }
+  case source_e::Headless: {
+    static_cast<source__Headless*>(this)->Encode(enc);
+    return;
+  }
+  case source_e::Unused: {
+    static_cast<source__Unused*>(this)->Encode(enc);
+    return;
+  }
+  case source_e::CFlag: {
+    static_cast<source__CFlag*>(this)->Encode(enc);
+    return;
+  }
+  case source_e::Stdin: {
+    static_cast<source__Stdin*>(this)->Encode(enc);
+    return;
+  }
+  case source_e::MainFile: {
+    static_cast<source__MainFile*>(this)->Encode(enc);
+    return;
+  }
+  case source_e::OtherFile: {
+    static_cast<source__OtherFile*>(this)->Encode(enc);
+    return;
+  }
+  case source_e::Dynamic: {
+    static_cast<source__Dynamic*>(this)->Encode(enc);
+    return;
+  }
+  case source_e::VarRef: {
+    static_cast<source__VarRef*>(this)->Encode(enc);
+    return;
+  }
+  case source_e::Variable: {
+    static_cast<source__Variable*>(this)->Encode(enc);
+    return;
+  }
+  case source_e::Alias: {
+    static_cast<source__Alias*>(this)->Encode(enc);
+    return;
+  }
+  case source_e::Reparsed: {
+    static_cast<source__Reparsed*>(this)->Encode(enc);
+    return;
+  }
+  case source_e::Synthetic: {
+    static_cast<source__Synthetic*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+source_t* source_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case source_e::Interactive:
+    dec->Add(source::Interactive);
+    return source::Interactive;
+  case source_e::Headless:
+    dec->Add(source::Headless);
+    return source::Headless;
+  case source_e::Unused:
+    return source__Unused::DecodeNew(dec);
+  case source_e::CFlag:
+    dec->Add(source::CFlag);
+    return source::CFlag;
+  case source_e::Stdin:
+    return source__Stdin::DecodeNew(dec);
+  case source_e::MainFile:
+    return source__MainFile::DecodeNew(dec);
+  case source_e::OtherFile:
+    return source__OtherFile::DecodeNew(dec);
+  case source_e::Dynamic:
+    return source__Dynamic::DecodeNew(dec);
+  case source_e::VarRef:
+    return source__VarRef::DecodeNew(dec);
+  case source_e::Variable:
+    return source__Variable::DecodeNew(dec);
+  case source_e::Alias:
+    return source__Alias::DecodeNew(dec);
+  case source_e::Reparsed:
+    return source__Reparsed::DecodeNew(dec);
+  case source_e::Synthetic:
+    return source__Synthetic::DecodeNew(dec);
+  }
+  return static_cast<source_t*>(dec->Ref(h));
+}
+
+hnode_t* SourceLine::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("SourceLine"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->line_num);
+  L->append(Alloc<Field>(StrFromC("line_num"), x0));
+
+  hnode_t* x1 = ToPretty(this->content);
+  L->append(Alloc<Field>(StrFromC("content"), x1));
+
+  hnode_t* x2 = this->src->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("src"), x2));
+
+  return out_node;
+}
+
+
+void SourceLine::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 66)) {
+    return;
+  }
+  enc->Int(this->line_num);
+  enc->Str(this->content);
+  enc->Obj(this->src);
+}
+
+SourceLine* SourceLine::DecodeNew(pyserial::Decoder* dec) {
+  SourceLine* obj = SourceLine::CreateNull();
+  dec->Add(obj);
+  obj->line_num = dec->Int();
+  obj->content = dec->Str();
+  obj->src = source_t::Decode(dec);
+  return obj;
+}
+
+SourceLine* SourceLine::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 66) {
+    return SourceLine::DecodeNew(dec);
+  }
+  return static_cast<SourceLine*>(dec->Ref(h));
+}
+
+hnode_t* Token::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  if (do_abbrev) {
+    auto* p = syntax_abbrev::_Token(this);
+    if (p) {
+      return p;
+    }
+  }
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("Token"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = Alloc<hnode::Leaf>(Id_str(this->id, false), color_e::UserType);
+  L->append(Alloc<Field>(StrFromC("id"), x0));
+
+  hnode_t* x1 = ToPretty(this->length);
+  L->append(Alloc<Field>(StrFromC("length"), x1));
+
+  hnode_t* x2 = ToPretty(this->col);
+  L->append(Alloc<Field>(StrFromC("col"), x2));
+
+  if (this->line) {  // Optional
+    hnode_t* x3 = this->line->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("line"), x3));
+  }
+
+  if (this->tval) {  // Optional
+    hnode_t* x4 = ToPretty(this->tval);
+    L->append(Alloc<Field>(StrFromC("tval"), x4));
+  }
+
+  return out_node;
+}
+
+
+void Token::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 67)) {
+    return;
+  }
+  enc->Int(this->id);
+  enc->Int(this->length);
+  enc->Int(this->col);
+  enc->Obj(this->line);
+  enc->Str(this->tval);
+}
+
+Token* Token::DecodeNew(pyserial::Decoder* dec) {
+  Token* obj = Token::CreateNull();
+  dec->Add(obj);
+  obj->id = dec->Int();
+  obj->length = dec->Int();
+  obj->col = dec->Int();
+  obj->line = SourceLine::Decode(dec);
+  obj->tval = dec->Str();
+  return obj;
+}
+
+Token* Token::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 67) {
+    return Token::DecodeNew(dec);
+  }
+  return static_cast<Token*>(dec->Ref(h));
+}
+
+hnode_t* CompoundWord::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  if (do_abbrev) {
+    auto* p = syntax_abbrev::_CompoundWord(this);
+    if (p) {
+      return p;
+    }
+  }
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("CompoundWord"));
+  List<Field*>* L = out_node->fields;
+
+  if (this->parts != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<word_part_t*> it(this->parts); !it.Done(); it.Next()) {
+      word_part_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("parts"), x0));
+  }
+
+  return out_node;
+}
+
+
+void CompoundWord::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 68)) {
+    return;
+  }
+  if (this->parts == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->parts));
+    for (ListIter<word_part_t*> it0(this->parts); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+CompoundWord* CompoundWord::DecodeNew(pyserial::Decoder* dec) {
+  CompoundWord* obj = CompoundWord::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<word_part_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      word_part_t* i0;
+      i0 = word_part_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->parts = c0;
+  }
+  return obj;
+}
+
+CompoundWord* CompoundWord::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 68) {
+    return CompoundWord::DecodeNew(dec);
+  }
+  return static_cast<CompoundWord*>(dec->Ref(h));
+}
+BigStr* loc_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case loc_e::Missing:
+    v = "Missing"; break;
+  case loc_e::Token:
+    v = "Token"; break;
+  case loc_e::ArgWord:
+    v = "ArgWord"; break;
+  case loc_e::WordPart:
+    v = "WordPart"; break;
+  case loc_e::Word:
+    v = "Word"; break;
+  case loc_e::Arith:
+    v = "Arith"; break;
+  case loc_e::Command:
+    v = "Command"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "loc.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+loc__Missing* loc::Missing = &gloc__Missing.obj;
+
+GcGlobal<loc__Missing> gloc__Missing = 
+  { ObjHeader::Global(loc_e::Missing) };
+
+hnode_t* loc__Missing::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(loc_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* loc__WordPart::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(loc_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->p->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("p"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* loc__Word::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(loc_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->w->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("w"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* loc__Arith::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(loc_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->a->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("a"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* loc__Command::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(loc_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->c->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("c"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* loc_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case loc_e::Missing: {
+    loc__Missing* obj = static_cast<loc__Missing*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case loc_e::Token: {
+    Token* obj = static_cast<Token*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case loc_e::ArgWord: {
+    CompoundWord* obj = static_cast<CompoundWord*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case loc_e::WordPart: {
+    loc__WordPart* obj = static_cast<loc__WordPart*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case loc_e::Word: {
+    loc__Word* obj = static_cast<loc__Word*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case loc_e::Arith: {
+    loc__Arith* obj = static_cast<loc__Arith*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case loc_e::Command: {
+    loc__Command* obj = static_cast<loc__Command*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void loc__Missing::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, loc_e::Missing)) {
+    return;
+  }
+}
+
+void loc__WordPart::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, loc_e::WordPart)) {
+    return;
+  }
+  enc->Obj(this->p);
+}
+
+loc__WordPart* loc__WordPart::DecodeNew(pyserial::Decoder* dec) {
+  loc__WordPart* obj = loc__WordPart::CreateNull();
+  dec->Add(obj);
+  obj->p = word_part_t::Decode(dec);
+  return obj;
+}
+
+void loc__Word::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, loc_e::Word)) {
+    return;
+  }
+  enc->Obj(this->w);
+}
+
+loc__Word* loc__Word::DecodeNew(pyserial::Decoder* dec) {
+  loc__Word* obj = loc__Word::CreateNull();
+  dec->Add(obj);
+  obj->w = word_t::Decode(dec);
+  return obj;
+}
+
+void loc__Arith::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, loc_e::Arith)) {
+    return;
+  }
+  enc->Obj(this->a);
+}
+
+loc__Arith* loc__Arith::DecodeNew(pyserial::Decoder* dec) {
+  loc__Arith* obj = loc__Arith::CreateNull();
+  dec->Add(obj);
+  obj->a = arith_expr_t::Decode(dec);
+  return obj;
+}
+
+void loc__Command::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, loc_e::Command)) {
+    return;
+  }
+  enc->Obj(this->c);
+}
+
+loc__Command* loc__Command::DecodeNew(pyserial::Decoder* dec) {
+  loc__Command* obj = loc__Command::CreateNull();
+  dec->Add(obj);
+  obj->c = command_t::Decode(dec);
+  return obj;
+}
+
+void loc_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case loc_e::Missing: {
+    static_cast<loc__Missing*>(this)->Encode(enc);
+    return;
+  }
+  case loc_e::Token: {
+    static_cast<Token*>(this)->Encode(enc);
+    return;
+  }
+  case loc_e::ArgWord: {
+    static_cast<CompoundWord*>(this)->Encode(enc);
+    return;
+  }
+  case loc_e::WordPart: {
+    static_cast<loc__WordPart*>(this)->Encode(enc);
+    return;
+  }
+  case loc_e::Word: {
+    static_cast<loc__Word*>(this)->Encode(enc);
+    return;
+  }
+  case loc_e::Arith: {
+    static_cast<loc__Arith*>(this)->Encode(enc);
+    return;
+  }
+  case loc_e::Command: {
+    static_cast<loc__Command*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+loc_t* loc_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case loc_e::Missing:
+    dec->Add(loc::Missing);
+    return loc::Missing;
+  case loc_e::Token:
+    return Token::DecodeNew(dec);
+  case loc_e::ArgWord:
+    return CompoundWord::DecodeNew(dec);
+  case loc_e::WordPart:
+    return loc__WordPart::DecodeNew(dec);
+  case loc_e::Word:
+    return loc__Word::DecodeNew(dec);
+  case loc_e::Arith:
+    return loc__Arith::DecodeNew(dec);
+  case loc_e::Command:
+    return loc__Command::DecodeNew(dec);
+  }
+  return static_cast<loc_t*>(dec->Ref(h));
+}
+BigStr* debug_frame_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case debug_frame_e::MainFile:
+    v = "MainFile"; break;
+  case debug_frame_e::Dummy:
+    v = "Dummy"; break;
+  case debug_frame_e::Source:
+    v = "Source"; break;
+  case debug_frame_e::ProcLike:
+    v = "ProcLike"; break;
+  case debug_frame_e::Token:
+    v = "Token"; break;
+  case debug_frame_e::CompoundWord:
+    v = "CompoundWord"; break;
+  case debug_frame_e::BeforeErrTrap:
+    v = "BeforeErrTrap"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "debug_frame.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+debug_frame__Dummy* debug_frame::Dummy = &gdebug_frame__Dummy.obj;
+
+GcGlobal<debug_frame__Dummy> gdebug_frame__Dummy = 
+  { ObjHeader::Global(debug_frame_e::Dummy) };
+
+hnode_t* debug_frame__MainFile::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                           seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(debug_frame_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->main_filename);
+  L->append(Alloc<Field>(StrFromC("main_filename"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* debug_frame__Dummy::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(debug_frame_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* debug_frame__Source::PrettyTree(bool do_abbrev, Dict<int, bool>* seen)
+                                         {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(debug_frame_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->source_loc->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("source_loc"), x0));
+
+  hnode_t* x1 = ToPretty(this->source_name);
+  L->append(Alloc<Field>(StrFromC("source_name"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* debug_frame__ProcLike::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                           seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(debug_frame_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->invoke_loc->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("invoke_loc"), x0));
+
+  hnode_t* x1 = this->def_tok->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("def_tok"), x1));
+
+  hnode_t* x2 = ToPretty(this->proc_name);
+  L->append(Alloc<Field>(StrFromC("proc_name"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* debug_frame__BeforeErrTrap::PrettyTree(bool do_abbrev, Dict<int,
+                                                bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(debug_frame_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->tok->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("tok"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* debug_frame_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case debug_frame_e::MainFile: {
+    debug_frame__MainFile* obj = static_cast<debug_frame__MainFile*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case debug_frame_e::Dummy: {
+    debug_frame__Dummy* obj = static_cast<debug_frame__Dummy*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case debug_frame_e::Source: {
+    debug_frame__Source* obj = static_cast<debug_frame__Source*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case debug_frame_e::ProcLike: {
+    debug_frame__ProcLike* obj = static_cast<debug_frame__ProcLike*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case debug_frame_e::Token: {
+    Token* obj = static_cast<Token*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case debug_frame_e::CompoundWord: {
+    CompoundWord* obj = static_cast<CompoundWord*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case debug_frame_e::BeforeErrTrap: {
+    debug_frame__BeforeErrTrap* obj =
+static_cast<debug_frame__BeforeErrTrap*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void debug_frame__MainFile::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, debug_frame_e::MainFile)) {
+    return;
+  }
+  enc->Str(this->main_filename);
+}
+
+debug_frame__MainFile* debug_frame__MainFile::DecodeNew(pyserial::Decoder* dec)
+                                                        {
+  debug_frame__MainFile* obj = debug_frame__MainFile::CreateNull();
+  dec->Add(obj);
+  obj->main_filename = dec->Str();
+  return obj;
+}
+
+void debug_frame__Dummy::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, debug_frame_e::Dummy)) {
+    return;
+  }
+}
+
+void debug_frame__Source::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, debug_frame_e::Source)) {
+    return;
+  }
+  enc->Obj(this->source_loc);
+  enc->Str(this->source_name);
+}
+
+debug_frame__Source* debug_frame__Source::DecodeNew(pyserial::Decoder* dec) {
+  debug_frame__Source* obj = debug_frame__Source::CreateNull();
+  dec->Add(obj);
+  obj->source_loc = CompoundWord::Decode(dec);
+  obj->source_name = dec->Str();
+  return obj;
+}
+
+void debug_frame__ProcLike::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, debug_frame_e::ProcLike)) {
+    return;
+  }
+  enc->Obj(this->invoke_loc);
+  enc->Obj(this->def_tok);
+  enc->Str(this->proc_name);
+}
+
+debug_frame__ProcLike* debug_frame__ProcLike::DecodeNew(pyserial::Decoder* dec)
+                                                        {
+  debug_frame__ProcLike* obj = debug_frame__ProcLike::CreateNull();
+  dec->Add(obj);
+  obj->invoke_loc = CompoundWord::Decode(dec);
+  obj->def_tok = Token::Decode(dec);
+  obj->proc_name = dec->Str();
+  return obj;
+}
+
+void debug_frame__BeforeErrTrap::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, debug_frame_e::BeforeErrTrap)) {
+    return;
+  }
+  enc->Obj(this->tok);
+}
+
+debug_frame__BeforeErrTrap*
+debug_frame__BeforeErrTrap::DecodeNew(pyserial::Decoder* dec) {
+  debug_frame__BeforeErrTrap* obj = debug_frame__BeforeErrTrap::CreateNull();
+  dec->Add(obj);
+  obj->tok = Token::Decode(dec);
+  return obj;
+}
+
+void debug_frame_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case debug_frame_e::MainFile: {
+    static_cast<debug_frame__MainFile*>(this)->Encode(enc);
+    return;
+  }
+  case debug_frame_e::Dummy: {
+    static_cast<debug_frame__Dummy*>(this)->Encode(enc);
+    return;
+  }
+  case debug_frame_e::Source: {
+    static_cast<debug_frame__Source*>(this)->Encode(enc);
+    return;
+  }
+  case debug_frame_e::ProcLike: {
+    static_cast<debug_frame__ProcLike*>(this)->Encode(enc);
+    return;
+  }
+  case debug_frame_e::Token: {
+    static_cast<Token*>(this)->Encode(enc);
+    return;
+  }
+  case debug_frame_e::CompoundWord: {
+    static_cast<CompoundWord*>(this)->Encode(enc);
+    return;
+  }
+  case debug_frame_e::BeforeErrTrap: {
+    static_cast<debug_frame__BeforeErrTrap*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+debug_frame_t* debug_frame_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case debug_frame_e::MainFile:
+    return debug_frame__MainFile::DecodeNew(dec);
+  case debug_frame_e::Dummy:
+    dec->Add(debug_frame::Dummy);
+    return debug_frame::Dummy;
+  case debug_frame_e::Source:
+    return debug_frame__Source::DecodeNew(dec);
+  case debug_frame_e::ProcLike:
+    return debug_frame__ProcLike::DecodeNew(dec);
+  case debug_frame_e::Token:
+    return Token::DecodeNew(dec);
+  case debug_frame_e::CompoundWord:
+    return CompoundWord::DecodeNew(dec);
+  case debug_frame_e::BeforeErrTrap:
+    return debug_frame__BeforeErrTrap::DecodeNew(dec);
+  }
+  return static_cast<debug_frame_t*>(dec->Ref(h));
+}
+BigStr* bracket_op_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case bracket_op_e::WholeArray:
+    v = "WholeArray"; break;
+  case bracket_op_e::ArrayIndex:
+    v = "ArrayIndex"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "bracket_op.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* bracket_op__WholeArray::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                            seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(bracket_op_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = Alloc<hnode::Leaf>(Id_str(this->op_id, false),
+                                   color_e::UserType);
+  L->append(Alloc<Field>(StrFromC("op_id"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* bracket_op__ArrayIndex::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                            seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(bracket_op_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->expr->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("expr"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* bracket_op_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case bracket_op_e::WholeArray: {
+    bracket_op__WholeArray* obj = static_cast<bracket_op__WholeArray*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case bracket_op_e::ArrayIndex: {
+    bracket_op__ArrayIndex* obj = static_cast<bracket_op__ArrayIndex*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void bracket_op__WholeArray::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, bracket_op_e::WholeArray)) {
+    return;
+  }
+  enc->Int(this->op_id);
+}
+
+bracket_op__WholeArray* bracket_op__WholeArray::DecodeNew(pyserial::Decoder*
+                                                          dec) {
+  bracket_op__WholeArray* obj = bracket_op__WholeArray::CreateNull();
+  dec->Add(obj);
+  obj->op_id = dec->Int();
+  return obj;
+}
+
+void bracket_op__ArrayIndex::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, bracket_op_e::ArrayIndex)) {
+    return;
+  }
+  enc->Obj(this->expr);
+}
+
+bracket_op__ArrayIndex* bracket_op__ArrayIndex::DecodeNew(pyserial::Decoder*
+                                                          dec) {
+  bracket_op__ArrayIndex* obj = bracket_op__ArrayIndex::CreateNull();
+  dec->Add(obj);
+  obj->expr = arith_expr_t::Decode(dec);
+  return obj;
+}
+
+void bracket_op_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case bracket_op_e::WholeArray: {
+    static_cast<bracket_op__WholeArray*>(this)->Encode(enc);
+    return;
+  }
+  case bracket_op_e::ArrayIndex: {
+    static_cast<bracket_op__ArrayIndex*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+bracket_op_t* bracket_op_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case bracket_op_e::WholeArray:
+    return bracket_op__WholeArray::DecodeNew(dec);
+  case bracket_op_e::ArrayIndex:
+    return bracket_op__ArrayIndex::DecodeNew(dec);
+  }
+  return static_cast<bracket_op_t*>(dec->Ref(h));
+}
+BigStr* suffix_op_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case suffix_op_e::Nullary:
+    v = "Nullary"; break;
+  case suffix_op_e::Unary:
+    v = "Unary"; break;
+  case suffix_op_e::Static:
+    v = "Static"; break;
+  case suffix_op_e::PatSub:
+    v = "PatSub"; break;
+  case suffix_op_e::Slice:
+    v = "Slice"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "suffix_op.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* suffix_op__Unary::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(suffix_op_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->op->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("op"), x0));
+
+  hnode_t* x1 = this->arg_word->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("arg_word"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* suffix_op__Static::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(suffix_op_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->tok->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("tok"), x0));
+
+  hnode_t* x1 = ToPretty(this->arg);
+  L->append(Alloc<Field>(StrFromC("arg"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* suffix_op__PatSub::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(suffix_op_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->pat->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("pat"), x0));
+
+  hnode_t* x1 = this->replace->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("replace"), x1));
+
+  hnode_t* x2 = Alloc<hnode::Leaf>(Id_str(this->replace_mode, false),
+                                   color_e::UserType);
+  L->append(Alloc<Field>(StrFromC("replace_mode"), x2));
+
+  hnode_t* x3 = this->slash_tok->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("slash_tok"), x3));
+
+  return out_node;
+}
+
+
+hnode_t* suffix_op__Slice::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(suffix_op_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->begin->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("begin"), x0));
+
+  if (this->length) {  // Optional
+    hnode_t* x1 = this->length->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("length"), x1));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* suffix_op_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case suffix_op_e::Nullary: {
+    Token* obj = static_cast<Token*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case suffix_op_e::Unary: {
+    suffix_op__Unary* obj = static_cast<suffix_op__Unary*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case suffix_op_e::Static: {
+    suffix_op__Static* obj = static_cast<suffix_op__Static*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case suffix_op_e::PatSub: {
+    suffix_op__PatSub* obj = static_cast<suffix_op__PatSub*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case suffix_op_e::Slice: {
+    suffix_op__Slice* obj = static_cast<suffix_op__Slice*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void suffix_op__Unary::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, suffix_op_e::Unary)) {
+    return;
+  }
+  enc->Obj(this->op);
+  enc->Obj(this->arg_word);
+}
+
+suffix_op__Unary* suffix_op__Unary::DecodeNew(pyserial::Decoder* dec) {
+  suffix_op__Unary* obj = suffix_op__Unary::CreateNull();
+  dec->Add(obj);
+  obj->op = Token::Decode(dec);
+  obj->arg_word = rhs_word_t::Decode(dec);
+  return obj;
+}
+
+void suffix_op__Static::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, suffix_op_e::Static)) {
+    return;
+  }
+  enc->Obj(this->tok);
+  enc->Str(this->arg);
+}
+
+suffix_op__Static* suffix_op__Static::DecodeNew(pyserial::Decoder* dec) {
+  suffix_op__Static* obj = suffix_op__Static::CreateNull();
+  dec->Add(obj);
+  obj->tok = Token::Decode(dec);
+  obj->arg = dec->Str();
+  return obj;
+}
+
+void suffix_op__PatSub::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, suffix_op_e::PatSub)) {
+    return;
+  }
+  enc->Obj(this->pat);
+  enc->Obj(this->replace);
+  enc->Int(this->replace_mode);
+  enc->Obj(this->slash_tok);
+}
+
+suffix_op__PatSub* suffix_op__PatSub::DecodeNew(pyserial::Decoder* dec) {
+  suffix_op__PatSub* obj = suffix_op__PatSub::CreateNull();
+  dec->Add(obj);
+  obj->pat = CompoundWord::Decode(dec);
+  obj->replace = rhs_word_t::Decode(dec);
+  obj->replace_mode = dec->Int();
+  obj->slash_tok = Token::Decode(dec);
+  return obj;
+}
+
+void suffix_op__Slice::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, suffix_op_e::Slice)) {
+    return;
+  }
+  enc->Obj(this->begin);
+  enc->Obj(this->length);
+}
+
+suffix_op__Slice* suffix_op__Slice::DecodeNew(pyserial::Decoder* dec) {
+  suffix_op__Slice* obj = suffix_op__Slice::CreateNull();
+  dec->Add(obj);
+  obj->begin = arith_expr_t::Decode(dec);
+  obj->length = arith_expr_t::Decode(dec);
+  return obj;
+}
+
+void suffix_op_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case suffix_op_e::Nullary: {
+    static_cast<Token*>(this)->Encode(enc);
+    return;
+  }
+  case suffix_op_e::Unary: {
+    static_cast<suffix_op__Unary*>(this)->Encode(enc);
+    return;
+  }
+  case suffix_op_e::Static: {
+    static_cast<suffix_op__Static*>(this)->Encode(enc);
+    return;
+  }
+  case suffix_op_e::PatSub: {
+    static_cast<suffix_op__PatSub*>(this)->Encode(enc);
+    return;
+  }
+  case suffix_op_e::Slice: {
+    static_cast<suffix_op__Slice*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+suffix_op_t* suffix_op_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case suffix_op_e::Nullary:
+    return Token::DecodeNew(dec);
+  case suffix_op_e::Unary:
+    return suffix_op__Unary::DecodeNew(dec);
+  case suffix_op_e::Static:
+    return suffix_op__Static::DecodeNew(dec);
+  case suffix_op_e::PatSub:
+    return suffix_op__PatSub::DecodeNew(dec);
+  case suffix_op_e::Slice:
+    return suffix_op__Slice::DecodeNew(dec);
+  }
+  return static_cast<suffix_op_t*>(dec->Ref(h));
+}
+
+hnode_t* BracedVarSub::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  if (do_abbrev) {
+    auto* p = syntax_abbrev::_BracedVarSub(this);
+    if (p) {
+      return p;
+    }
+  }
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("BracedVarSub"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = this->name_tok->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("name_tok"), x1));
+
+  hnode_t* x2 = ToPretty(this->var_name);
+  L->append(Alloc<Field>(StrFromC("var_name"), x2));
+
+  if (this->prefix_op) {  // Optional
+    hnode_t* x3 = this->prefix_op->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("prefix_op"), x3));
+  }
+
+  if (this->bracket_op) {  // Optional
+    hnode_t* x4 = this->bracket_op->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("bracket_op"), x4));
+  }
+
+  if (this->suffix_op) {  // Optional
+    hnode_t* x5 = this->suffix_op->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("suffix_op"), x5));
+  }
+
+  hnode_t* x6 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x6));
+
+  return out_node;
+}
+
+
+void BracedVarSub::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 69)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->name_tok);
+  enc->Str(this->var_name);
+  enc->Obj(this->prefix_op);
+  enc->Obj(this->bracket_op);
+  enc->Obj(this->suffix_op);
+  enc->Obj(this->right);
+}
+
+BracedVarSub* BracedVarSub::DecodeNew(pyserial::Decoder* dec) {
+  BracedVarSub* obj = BracedVarSub::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->name_tok = Token::Decode(dec);
+  obj->var_name = dec->Str();
+  obj->prefix_op = Token::Decode(dec);
+  obj->bracket_op = bracket_op_t::Decode(dec);
+  obj->suffix_op = suffix_op_t::Decode(dec);
+  obj->right = Token::Decode(dec);
+  return obj;
+}
+
+BracedVarSub* BracedVarSub::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 69) {
+    return BracedVarSub::DecodeNew(dec);
+  }
+  return static_cast<BracedVarSub*>(dec->Ref(h));
+}
+
+hnode_t* DoubleQuoted::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  if (do_abbrev) {
+    auto* p = syntax_abbrev::_DoubleQuoted(this);
+    if (p) {
+      return p;
+    }
+  }
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("DoubleQuoted"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  if (this->parts != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<word_part_t*> it(this->parts); !it.Done(); it.Next()) {
+      word_part_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("parts"), x1));
+  }
+
+  hnode_t* x2 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x2));
+
+  return out_node;
+}
+
+
+void DoubleQuoted::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 70)) {
+    return;
+  }
+  enc->Obj(this->left);
+  if (this->parts == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->parts));
+    for (ListIter<word_part_t*> it0(this->parts); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Obj(this->right);
+}
+
+DoubleQuoted* DoubleQuoted::DecodeNew(pyserial::Decoder* dec) {
+  DoubleQuoted* obj = DoubleQuoted::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<word_part_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      word_part_t* i0;
+      i0 = word_part_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->parts = c0;
+  }
+  obj->right = Token::Decode(dec);
+  return obj;
+}
+
+DoubleQuoted* DoubleQuoted::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 70) {
+    return DoubleQuoted::DecodeNew(dec);
+  }
+  return static_cast<DoubleQuoted*>(dec->Ref(h));
+}
+
+hnode_t* SingleQuoted::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  if (do_abbrev) {
+    auto* p = syntax_abbrev::_SingleQuoted(this);
+    if (p) {
+      return p;
+    }
+  }
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("SingleQuoted"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = ToPretty(this->sval);
+  L->append(Alloc<Field>(StrFromC("sval"), x1));
+
+  hnode_t* x2 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x2));
+
+  return out_node;
+}
+
+
+void SingleQuoted::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 71)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Str(this->sval);
+  enc->Obj(this->right);
+}
+
+SingleQuoted* SingleQuoted::DecodeNew(pyserial::Decoder* dec) {
+  SingleQuoted* obj = SingleQuoted::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->sval = dec->Str();
+  obj->right = Token::Decode(dec);
+  return obj;
+}
+
+SingleQuoted* SingleQuoted::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 71) {
+    return SingleQuoted::DecodeNew(dec);
+  }
+  return static_cast<SingleQuoted*>(dec->Ref(h));
+}
+
+hnode_t* SimpleVarSub::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  if (do_abbrev) {
+    auto* p = syntax_abbrev::_SimpleVarSub(this);
+    if (p) {
+      return p;
+    }
+  }
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("SimpleVarSub"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->tok->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("tok"), x0));
+
+  return out_node;
+}
+
+
+void SimpleVarSub::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 72)) {
+    return;
+  }
+  enc->Obj(this->tok);
+}
+
+SimpleVarSub* SimpleVarSub::DecodeNew(pyserial::Decoder* dec) {
+  SimpleVarSub* obj = SimpleVarSub::CreateNull();
+  dec->Add(obj);
+  obj->tok = Token::Decode(dec);
+  return obj;
+}
+
+SimpleVarSub* SimpleVarSub::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 72) {
+    return SimpleVarSub::DecodeNew(dec);
+  }
+  return static_cast<SimpleVarSub*>(dec->Ref(h));
+}
+
+hnode_t* CommandSub::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("CommandSub"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left_token->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left_token"), x0));
+
+  hnode_t* x1 = this->child->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("child"), x1));
+
+  hnode_t* x2 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x2));
+
+  return out_node;
+}
+
+
+void CommandSub::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 73)) {
+    return;
+  }
+  enc->Obj(this->left_token);
+  enc->Obj(this->child);
+  enc->Obj(this->right);
+}
+
+CommandSub* CommandSub::DecodeNew(pyserial::Decoder* dec) {
+  CommandSub* obj = CommandSub::CreateNull();
+  dec->Add(obj);
+  obj->left_token = Token::Decode(dec);
+  obj->child = command_t::Decode(dec);
+  obj->right = Token::Decode(dec);
+  return obj;
+}
+
+CommandSub* CommandSub::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 73) {
+    return CommandSub::DecodeNew(dec);
+  }
+  return static_cast<CommandSub*>(dec->Ref(h));
+}
+
+hnode_t* ExprSub::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("ExprSub"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = this->child->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("child"), x1));
+
+  hnode_t* x2 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x2));
+
+  return out_node;
+}
+
+
+void ExprSub::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 74)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->child);
+  enc->Obj(this->right);
+}
+
+ExprSub* ExprSub::DecodeNew(pyserial::Decoder* dec) {
+  ExprSub* obj = ExprSub::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->child = expr_t::Decode(dec);
+  obj->right = Token::Decode(dec);
+  return obj;
+}
+
+ExprSub* ExprSub::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 74) {
+    return ExprSub::DecodeNew(dec);
+  }
+  return static_cast<ExprSub*>(dec->Ref(h));
+}
+
+hnode_t* YshArrayLiteral::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("YshArrayLiteral"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  if (this->words != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<word_t*> it(this->words); !it.Done(); it.Next()) {
+      word_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("words"), x1));
+  }
+
+  hnode_t* x2 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x2));
+
+  return out_node;
+}
+
+
+void YshArrayLiteral::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 75)) {
+    return;
+  }
+  enc->Obj(this->left);
+  if (this->words == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->words));
+    for (ListIter<word_t*> it0(this->words); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Obj(this->right);
+}
+
+YshArrayLiteral* YshArrayLiteral::DecodeNew(pyserial::Decoder* dec) {
+  YshArrayLiteral* obj = YshArrayLiteral::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<word_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      word_t* i0;
+      i0 = word_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->words = c0;
+  }
+  obj->right = Token::Decode(dec);
+  return obj;
+}
+
+YshArrayLiteral* YshArrayLiteral::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 75) {
+    return YshArrayLiteral::DecodeNew(dec);
+  }
+  return static_cast<YshArrayLiteral*>(dec->Ref(h));
+}
+
+hnode_t* ArgList::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("ArgList"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  if (this->pos_args != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<expr_t*> it(this->pos_args); !it.Done(); it.Next()) {
+      expr_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("pos_args"), x1));
+  }
+
+  if (this->semi_tok) {  // Optional
+    hnode_t* x2 = this->semi_tok->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("semi_tok"), x2));
+  }
+
+  if (this->named_args != nullptr) {  // List
+    hnode::Array* x3 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<NamedArg*> it(this->named_args); !it.Done(); it.Next()) {
+      NamedArg* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x3->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("named_args"), x3));
+  }
+
+  if (this->semi_tok2) {  // Optional
+    hnode_t* x4 = this->semi_tok2->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("semi_tok2"), x4));
+  }
+
+  if (this->block_expr) {  // Optional
+    hnode_t* x5 = this->block_expr->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("block_expr"), x5));
+  }
+
+  hnode_t* x6 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x6));
+
+  return out_node;
+}
+
+
+void ArgList::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 76)) {
+    return;
+  }
+  enc->Obj(this->left);
+  if (this->pos_args == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->pos_args));
+    for (ListIter<expr_t*> it0(this->pos_args); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Obj(this->semi_tok);
+  if (this->named_args == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->named_args));
+    for (ListIter<NamedArg*> it1(this->named_args); !it1.Done(); it1.Next()) {
+      enc->Obj(it1.Value());
+    }
+  }
+  enc->Obj(this->semi_tok2);
+  enc->Obj(this->block_expr);
+  enc->Obj(this->right);
+}
+
+ArgList* ArgList::DecodeNew(pyserial::Decoder* dec) {
+  ArgList* obj = ArgList::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<expr_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      expr_t* i0;
+      i0 = expr_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->pos_args = c0;
+  }
+  obj->semi_tok = Token::Decode(dec);
+  int n1 = dec->Size();
+  if (n1 != -1) {
+    auto* c1 = Alloc<List<NamedArg*>>();
+    for (int j1 = 0; j1 < n1; ++j1) {
+      NamedArg* i1;
+      i1 = NamedArg::Decode(dec);
+      c1->append(i1);
+    }
+    obj->named_args = c1;
+  }
+  obj->semi_tok2 = Token::Decode(dec);
+  obj->block_expr = expr_t::Decode(dec);
+  obj->right = Token::Decode(dec);
+  return obj;
+}
+
+ArgList* ArgList::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 76) {
+    return ArgList::DecodeNew(dec);
+  }
+  return static_cast<ArgList*>(dec->Ref(h));
+}
+
+hnode_t* AssocPair::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("AssocPair"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->key->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("key"), x0));
+
+  hnode_t* x1 = this->value->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("value"), x1));
+
+  hnode_t* x2 = ToPretty(this->has_plus);
+  L->append(Alloc<Field>(StrFromC("has_plus"), x2));
+
+  return out_node;
+}
+
+
+void AssocPair::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 77)) {
+    return;
+  }
+  enc->Obj(this->key);
+  enc->Obj(this->value);
+  enc->Bool(this->has_plus);
+}
+
+AssocPair* AssocPair::DecodeNew(pyserial::Decoder* dec) {
+  AssocPair* obj = AssocPair::CreateNull();
+  dec->Add(obj);
+  obj->key = CompoundWord::Decode(dec);
+  obj->value = CompoundWord::Decode(dec);
+  obj->has_plus = dec->Bool();
+  return obj;
+}
+
+AssocPair* AssocPair::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 77) {
+    return AssocPair::DecodeNew(dec);
+  }
+  return static_cast<AssocPair*>(dec->Ref(h));
+}
+BigStr* InitializerWord_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case InitializerWord_e::ArrayWord:
+    v = "ArrayWord"; break;
+  case InitializerWord_e::AssocPair:
+    v = "AssocPair"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "InitializerWord.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* InitializerWord__ArrayWord::PrettyTree(bool do_abbrev, Dict<int,
+                                                bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node =
+runtime::NewRecord(InitializerWord_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->w->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("w"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* InitializerWord_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case InitializerWord_e::ArrayWord: {
+    InitializerWord__ArrayWord* obj =
+static_cast<InitializerWord__ArrayWord*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case InitializerWord_e::AssocPair: {
+    AssocPair* obj = static_cast<AssocPair*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void InitializerWord__ArrayWord::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, InitializerWord_e::ArrayWord)) {
+    return;
+  }
+  enc->Obj(this->w);
+}
+
+InitializerWord__ArrayWord*
+InitializerWord__ArrayWord::DecodeNew(pyserial::Decoder* dec) {
+  InitializerWord__ArrayWord* obj = InitializerWord__ArrayWord::CreateNull();
+  dec->Add(obj);
+  obj->w = word_t::Decode(dec);
+  return obj;
+}
+
+void InitializerWord_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case InitializerWord_e::ArrayWord: {
+    static_cast<InitializerWord__ArrayWord*>(this)->Encode(enc);
+    return;
+  }
+  case InitializerWord_e::AssocPair: {
+    static_cast<AssocPair*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+InitializerWord_t* InitializerWord_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case InitializerWord_e::ArrayWord:
+    return InitializerWord__ArrayWord::DecodeNew(dec);
+  case InitializerWord_e::AssocPair:
+    return AssocPair::DecodeNew(dec);
+  }
+  return static_cast<InitializerWord_t*>(dec->Ref(h));
+}
+BigStr* word_part_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case word_part_e::YshArrayLiteral:
+    v = "YshArrayLiteral"; break;
+  case word_part_e::InitializerLiteral:
+    v = "InitializerLiteral"; break;
+  case word_part_e::Literal:
+    v = "Literal"; break;
+  case word_part_e::EscapedLiteral:
+    v = "EscapedLiteral"; break;
+  case word_part_e::SingleQuoted:
+    v = "SingleQuoted"; break;
+  case word_part_e::DoubleQuoted:
+    v = "DoubleQuoted"; break;
+  case word_part_e::SimpleVarSub:
+    v = "SimpleVarSub"; break;
+  case word_part_e::BracedVarSub:
+    v = "BracedVarSub"; break;
+  case word_part_e::ZshVarSub:
+    v = "ZshVarSub"; break;
+  case word_part_e::CommandSub:
+    v = "CommandSub"; break;
+  case word_part_e::TildeSub:
+    v = "TildeSub"; break;
+  case word_part_e::ArithSub:
+    v = "ArithSub"; break;
+  case word_part_e::BracedTuple:
+    v = "BracedTuple"; break;
+  case word_part_e::BracedRange:
+    v = "BracedRange"; break;
+  case word_part_e::BracedRangeDigit:
+    v = "BracedRangeDigit"; break;
+  case word_part_e::ExtGlob:
+    v = "ExtGlob"; break;
+  case word_part_e::BashRegexGroup:
+    v = "BashRegexGroup"; break;
+  case word_part_e::Splice:
+    v = "Splice"; break;
+  case word_part_e::ExprSub:
+    v = "ExprSub"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "word_part.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* word_part__InitializerLiteral::PrettyTree(bool do_abbrev, Dict<int,
+                                                   bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(word_part_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  if (this->pairs != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<InitializerWord_t*> it(this->pairs); !it.Done(); it.Next()) {
+      InitializerWord_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("pairs"), x1));
+  }
+
+  hnode_t* x2 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* word_part__EscapedLiteral::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                               seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(word_part_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->token->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("token"), x0));
+
+  hnode_t* x1 = ToPretty(this->ch);
+  L->append(Alloc<Field>(StrFromC("ch"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* word_part__ZshVarSub::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                          seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(word_part_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = this->ignored->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("ignored"), x1));
+
+  hnode_t* x2 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* word_part__TildeSub::PrettyTree(bool do_abbrev, Dict<int, bool>* seen)
+                                         {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(word_part_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  if (this->name) {  // Optional
+    hnode_t* x1 = this->name->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("name"), x1));
+  }
+
+  if (this->user_name) {  // Optional
+    hnode_t* x2 = ToPretty(this->user_name);
+    L->append(Alloc<Field>(StrFromC("user_name"), x2));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* word_part__ArithSub::PrettyTree(bool do_abbrev, Dict<int, bool>* seen)
+                                         {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(word_part_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = this->anode->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("anode"), x1));
+
+  hnode_t* x2 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* word_part__BracedTuple::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                            seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(word_part_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->words != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<CompoundWord*> it(this->words); !it.Done(); it.Next()) {
+      CompoundWord* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("words"), x0));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* word_part__BracedRange::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                            seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(word_part_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->blame_tok->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("blame_tok"), x0));
+
+  hnode_t* x1 = Alloc<hnode::Leaf>(Id_str(this->kind, false),
+                                   color_e::UserType);
+  L->append(Alloc<Field>(StrFromC("kind"), x1));
+
+  hnode_t* x2 = ToPretty(this->start);
+  L->append(Alloc<Field>(StrFromC("start"), x2));
+
+  hnode_t* x3 = ToPretty(this->end);
+  L->append(Alloc<Field>(StrFromC("end"), x3));
+
+  hnode_t* x4 = ToPretty(this->step);
+  L->append(Alloc<Field>(StrFromC("step"), x4));
+
+  return out_node;
+}
+
+
+hnode_t* word_part__BracedRangeDigit::PrettyTree(bool do_abbrev, Dict<int,
+                                                 bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(word_part_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->s);
+  L->append(Alloc<Field>(StrFromC("s"), x0));
+
+  hnode_t* x1 = this->orig_tok->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("orig_tok"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* word_part__ExtGlob::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(word_part_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->op->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("op"), x0));
+
+  if (this->arms != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<CompoundWord*> it(this->arms); !it.Done(); it.Next()) {
+      CompoundWord* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("arms"), x1));
+  }
+
+  hnode_t* x2 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* word_part__BashRegexGroup::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                               seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(word_part_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  if (this->child) {  // Optional
+    hnode_t* x1 = this->child->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("child"), x1));
+  }
+
+  hnode_t* x2 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* word_part__Splice::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(word_part_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->blame_tok->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("blame_tok"), x0));
+
+  hnode_t* x1 = ToPretty(this->var_name);
+  L->append(Alloc<Field>(StrFromC("var_name"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* word_part_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case word_part_e::YshArrayLiteral: {
+    YshArrayLiteral* obj = static_cast<YshArrayLiteral*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_part_e::InitializerLiteral: {
+    word_part__InitializerLiteral* obj =
+static_cast<word_part__InitializerLiteral*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_part_e::Literal: {
+    Token* obj = static_cast<Token*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_part_e::EscapedLiteral: {
+    word_part__EscapedLiteral* obj =
+static_cast<word_part__EscapedLiteral*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_part_e::SingleQuoted: {
+    SingleQuoted* obj = static_cast<SingleQuoted*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_part_e::DoubleQuoted: {
+    DoubleQuoted* obj = static_cast<DoubleQuoted*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_part_e::SimpleVarSub: {
+    SimpleVarSub* obj = static_cast<SimpleVarSub*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_part_e::BracedVarSub: {
+    BracedVarSub* obj = static_cast<BracedVarSub*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_part_e::ZshVarSub: {
+    word_part__ZshVarSub* obj = static_cast<word_part__ZshVarSub*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_part_e::CommandSub: {
+    CommandSub* obj = static_cast<CommandSub*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_part_e::TildeSub: {
+    word_part__TildeSub* obj = static_cast<word_part__TildeSub*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_part_e::ArithSub: {
+    word_part__ArithSub* obj = static_cast<word_part__ArithSub*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_part_e::BracedTuple: {
+    word_part__BracedTuple* obj = static_cast<word_part__BracedTuple*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_part_e::BracedRange: {
+    word_part__BracedRange* obj = static_cast<word_part__BracedRange*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_part_e::BracedRangeDigit: {
+    word_part__BracedRangeDigit* obj =
+static_cast<word_part__BracedRangeDigit*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_part_e::ExtGlob: {
+    word_part__ExtGlob* obj = static_cast<word_part__ExtGlob*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_part_e::BashRegexGroup: {
+    word_part__BashRegexGroup* obj =
+static_cast<word_part__BashRegexGroup*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_part_e::Splice: {
+    word_part__Splice* obj = static_cast<word_part__Splice*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_part_e::ExprSub: {
+    ExprSub* obj = static_cast<ExprSub*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void word_part__InitializerLiteral::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, word_part_e::InitializerLiteral)) {
+    return;
+  }
+  enc->Obj(this->left);
+  if (this->pairs == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->pairs));
+    for (ListIter<InitializerWord_t*> it0(this->pairs); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Obj(this->right);
+}
+
+word_part__InitializerLiteral*
+word_part__InitializerLiteral::DecodeNew(pyserial::Decoder* dec) {
+  word_part__InitializerLiteral* obj =
+word_part__InitializerLiteral::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<InitializerWord_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      InitializerWord_t* i0;
+      i0 = InitializerWord_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->pairs = c0;
+  }
+  obj->right = Token::Decode(dec);
+  return obj;
+}
+
+void word_part__EscapedLiteral::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, word_part_e::EscapedLiteral)) {
+    return;
+  }
+  enc->Obj(this->token);
+  enc->Str(this->ch);
+}
+
+word_part__EscapedLiteral*
+word_part__EscapedLiteral::DecodeNew(pyserial::Decoder* dec) {
+  word_part__EscapedLiteral* obj = word_part__EscapedLiteral::CreateNull();
+  dec->Add(obj);
+  obj->token = Token::Decode(dec);
+  obj->ch = dec->Str();
+  return obj;
+}
+
+void word_part__ZshVarSub::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, word_part_e::ZshVarSub)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->ignored);
+  enc->Obj(this->right);
+}
+
+word_part__ZshVarSub* word_part__ZshVarSub::DecodeNew(pyserial::Decoder* dec) {
+  word_part__ZshVarSub* obj = word_part__ZshVarSub::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->ignored = CompoundWord::Decode(dec);
+  obj->right = Token::Decode(dec);
+  return obj;
+}
+
+void word_part__TildeSub::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, word_part_e::TildeSub)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->name);
+  enc->Str(this->user_name);
+}
+
+word_part__TildeSub* word_part__TildeSub::DecodeNew(pyserial::Decoder* dec) {
+  word_part__TildeSub* obj = word_part__TildeSub::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->name = Token::Decode(dec);
+  obj->user_name = dec->Str();
+  return obj;
+}
+
+void word_part__ArithSub::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, word_part_e::ArithSub)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->anode);
+  enc->Obj(this->right);
+}
+
+word_part__ArithSub* word_part__ArithSub::DecodeNew(pyserial::Decoder* dec) {
+  word_part__ArithSub* obj = word_part__ArithSub::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->anode = arith_expr_t::Decode(dec);
+  obj->right = Token::Decode(dec);
+  return obj;
+}
+
+void word_part__BracedTuple::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, word_part_e::BracedTuple)) {
+    return;
+  }
+  if (this->words == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->words));
+    for (ListIter<CompoundWord*> it0(this->words); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+word_part__BracedTuple* word_part__BracedTuple::DecodeNew(pyserial::Decoder*
+                                                          dec) {
+  word_part__BracedTuple* obj = word_part__BracedTuple::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<CompoundWord*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      CompoundWord* i0;
+      i0 = CompoundWord::Decode(dec);
+      c0->append(i0);
+    }
+    obj->words = c0;
+  }
+  return obj;
+}
+
+void word_part__BracedRange::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, word_part_e::BracedRange)) {
+    return;
+  }
+  enc->Obj(this->blame_tok);
+  enc->Int(this->kind);
+  enc->Str(this->start);
+  enc->Str(this->end);
+  enc->Int(this->step);
+}
+
+word_part__BracedRange* word_part__BracedRange::DecodeNew(pyserial::Decoder*
+                                                          dec) {
+  word_part__BracedRange* obj = word_part__BracedRange::CreateNull();
+  dec->Add(obj);
+  obj->blame_tok = Token::Decode(dec);
+  obj->kind = dec->Int();
+  obj->start = dec->Str();
+  obj->end = dec->Str();
+  obj->step = dec->Int();
+  return obj;
+}
+
+void word_part__BracedRangeDigit::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, word_part_e::BracedRangeDigit)) {
+    return;
+  }
+  enc->Str(this->s);
+  enc->Obj(this->orig_tok);
+}
+
+word_part__BracedRangeDigit*
+word_part__BracedRangeDigit::DecodeNew(pyserial::Decoder* dec) {
+  word_part__BracedRangeDigit* obj = word_part__BracedRangeDigit::CreateNull();
+  dec->Add(obj);
+  obj->s = dec->Str();
+  obj->orig_tok = Token::Decode(dec);
+  return obj;
+}
+
+void word_part__ExtGlob::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, word_part_e::ExtGlob)) {
+    return;
+  }
+  enc->Obj(this->op);
+  if (this->arms == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->arms));
+    for (ListIter<CompoundWord*> it0(this->arms); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Obj(this->right);
+}
+
+word_part__ExtGlob* word_part__ExtGlob::DecodeNew(pyserial::Decoder* dec) {
+  word_part__ExtGlob* obj = word_part__ExtGlob::CreateNull();
+  dec->Add(obj);
+  obj->op = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<CompoundWord*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      CompoundWord* i0;
+      i0 = CompoundWord::Decode(dec);
+      c0->append(i0);
+    }
+    obj->arms = c0;
+  }
+  obj->right = Token::Decode(dec);
+  return obj;
+}
+
+void word_part__BashRegexGroup::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, word_part_e::BashRegexGroup)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->child);
+  enc->Obj(this->right);
+}
+
+word_part__BashRegexGroup*
+word_part__BashRegexGroup::DecodeNew(pyserial::Decoder* dec) {
+  word_part__BashRegexGroup* obj = word_part__BashRegexGroup::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->child = CompoundWord::Decode(dec);
+  obj->right = Token::Decode(dec);
+  return obj;
+}
+
+void word_part__Splice::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, word_part_e::Splice)) {
+    return;
+  }
+  enc->Obj(this->blame_tok);
+  enc->Str(this->var_name);
+}
+
+word_part__Splice* word_part__Splice::DecodeNew(pyserial::Decoder* dec) {
+  word_part__Splice* obj = word_part__Splice::CreateNull();
+  dec->Add(obj);
+  obj->blame_tok = Token::Decode(dec);
+  obj->var_name = dec->Str();
+  return obj;
+}
+
+void word_part_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case word_part_e::YshArrayLiteral: {
+    static_cast<YshArrayLiteral*>(this)->Encode(enc);
+    return;
+  }
+  case word_part_e::InitializerLiteral: {
+    static_cast<word_part__InitializerLiteral*>(this)->Encode(enc);
+    return;
+  }
+  case word_part_e::Literal: {
+    static_cast<Token*>(this)->Encode(enc);
+    return;
+  }
+  case word_part_e::EscapedLiteral: {
+    static_cast<word_part__EscapedLiteral*>(this)->Encode(enc);
+    return;
+  }
+  case word_part_e::SingleQuoted: {
+    static_cast<SingleQuoted*>(this)->Encode(enc);
+    return;
+  }
+  case word_part_e::DoubleQuoted: {
+    static_cast<DoubleQuoted*>(this)->Encode(enc);
+    return;
+  }
+  case word_part_e::SimpleVarSub: {
+    static_cast<SimpleVarSub*>(this)->Encode(enc);
+    return;
+  }
+  case word_part_e::BracedVarSub: {
+    static_cast<BracedVarSub*>(this)->Encode(enc);
+    return;
+  }
+  case word_part_e::ZshVarSub: {
+    static_cast<word_part__ZshVarSub*>(this)->Encode(enc);
+    return;
+  }
+  case word_part_e::CommandSub: {
+    static_cast<CommandSub*>(this)->Encode(enc);
+    return;
+  }
+  case word_part_e::TildeSub: {
+    static_cast<word_part__TildeSub*>(this)->Encode(enc);
+    return;
+  }
+  case word_part_e::ArithSub: {
+    static_cast<word_part__ArithSub*>(this)->Encode(enc);
+    return;
+  }
+  case word_part_e::BracedTuple: {
+    static_cast<word_part__BracedTuple*>(this)->Encode(enc);
+    return;
+  }
+  case word_part_e::BracedRange: {
+    static_cast<word_part__BracedRange*>(this)->Encode(enc);
+    return;
+  }
+  case word_part_e::BracedRangeDigit: {
+    static_cast<word_part__BracedRangeDigit*>(this)->Encode(enc);
+    return;
+  }
+  case word_part_e::ExtGlob: {
+    static_cast<word_part__ExtGlob*>(this)->Encode(enc);
+    return;
+  }
+  case word_part_e::BashRegexGroup: {
+    static_cast<word_part__BashRegexGroup*>(this)->Encode(enc);
+    return;
+  }
+  case word_part_e::Splice: {
+    static_cast<word_part__Splice*>(this)->Encode(enc);
+    return;
+  }
+  case word_part_e::ExprSub: {
+    static_cast<ExprSub*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+word_part_t* word_part_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case word_part_e::YshArrayLiteral:
+    return YshArrayLiteral::DecodeNew(dec);
+  case word_part_e::InitializerLiteral:
+    return word_part__InitializerLiteral::DecodeNew(dec);
+  case word_part_e::Literal:
+    return Token::DecodeNew(dec);
+  case word_part_e::EscapedLiteral:
+    return word_part__EscapedLiteral::DecodeNew(dec);
+  case word_part_e::SingleQuoted:
+    return SingleQuoted::DecodeNew(dec);
+  case word_part_e::DoubleQuoted:
+    return DoubleQuoted::DecodeNew(dec);
+  case word_part_e::SimpleVarSub:
+    return SimpleVarSub::DecodeNew(dec);
+  case word_part_e::BracedVarSub:
+    return BracedVarSub::DecodeNew(dec);
+  case word_part_e::ZshVarSub:
+    return word_part__ZshVarSub::DecodeNew(dec);
+  case word_part_e::CommandSub:
+    return CommandSub::DecodeNew(dec);
+  case word_part_e::TildeSub:
+    return word_part__TildeSub::DecodeNew(dec);
+  case word_part_e::ArithSub:
+    return word_part__ArithSub::DecodeNew(dec);
+  case word_part_e::BracedTuple:
+    return word_part__BracedTuple::DecodeNew(dec);
+  case word_part_e::BracedRange:
+    return word_part__BracedRange::DecodeNew(dec);
+  case word_part_e::BracedRangeDigit:
+    return word_part__BracedRangeDigit::DecodeNew(dec);
+  case word_part_e::ExtGlob:
+    return word_part__ExtGlob::DecodeNew(dec);
+  case word_part_e::BashRegexGroup:
+    return word_part__BashRegexGroup::DecodeNew(dec);
+  case word_part_e::Splice:
+    return word_part__Splice::DecodeNew(dec);
+  case word_part_e::ExprSub:
+    return ExprSub::DecodeNew(dec);
+  }
+  return static_cast<word_part_t*>(dec->Ref(h));
+}
+BigStr* rhs_word_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case rhs_word_e::Empty:
+    v = "Empty"; break;
+  case rhs_word_e::Compound:
+    v = "Compound"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "rhs_word.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+rhs_word__Empty* rhs_word::Empty = &grhs_word__Empty.obj;
+
+GcGlobal<rhs_word__Empty> grhs_word__Empty = 
+  { ObjHeader::Global(rhs_word_e::Empty) };
+
+hnode_t* rhs_word__Empty::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(rhs_word_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* rhs_word_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case rhs_word_e::Empty: {
+    rhs_word__Empty* obj = static_cast<rhs_word__Empty*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case rhs_word_e::Compound: {
+    CompoundWord* obj = static_cast<CompoundWord*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void rhs_word__Empty::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, rhs_word_e::Empty)) {
+    return;
+  }
+}
+
+void rhs_word_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case rhs_word_e::Empty: {
+    static_cast<rhs_word__Empty*>(this)->Encode(enc);
+    return;
+  }
+  case rhs_word_e::Compound: {
+    static_cast<CompoundWord*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+rhs_word_t* rhs_word_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case rhs_word_e::Empty:
+    dec->Add(rhs_word::Empty);
+    return rhs_word::Empty;
+  case rhs_word_e::Compound:
+    return CompoundWord::DecodeNew(dec);
+  }
+  return static_cast<rhs_word_t*>(dec->Ref(h));
+}
+BigStr* word_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case word_e::Operator:
+    v = "Operator"; break;
+  case word_e::Compound:
+    v = "Compound"; break;
+  case word_e::BracedTree:
+    v = "BracedTree"; break;
+  case word_e::String:
+    v = "String"; break;
+  case word_e::Redir:
+    v = "Redir"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "word.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* word__BracedTree::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(word_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->parts != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<word_part_t*> it(this->parts); !it.Done(); it.Next()) {
+      word_part_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("parts"), x0));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* word__String::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(word_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = Alloc<hnode::Leaf>(Id_str(this->id, false), color_e::UserType);
+  L->append(Alloc<Field>(StrFromC("id"), x0));
+
+  hnode_t* x1 = ToPretty(this->s);
+  L->append(Alloc<Field>(StrFromC("s"), x1));
+
+  if (this->blame_loc) {  // Optional
+    hnode_t* x2 = this->blame_loc->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("blame_loc"), x2));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* word__Redir::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(word_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->left_tok) {  // Optional
+    hnode_t* x0 = this->left_tok->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("left_tok"), x0));
+  }
+
+  hnode_t* x1 = this->op->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("op"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* word_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case word_e::Operator: {
+    Token* obj = static_cast<Token*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_e::Compound: {
+    CompoundWord* obj = static_cast<CompoundWord*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_e::BracedTree: {
+    word__BracedTree* obj = static_cast<word__BracedTree*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_e::String: {
+    word__String* obj = static_cast<word__String*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case word_e::Redir: {
+    word__Redir* obj = static_cast<word__Redir*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void word__BracedTree::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, word_e::BracedTree)) {
+    return;
+  }
+  if (this->parts == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->parts));
+    for (ListIter<word_part_t*> it0(this->parts); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+word__BracedTree* word__BracedTree::DecodeNew(pyserial::Decoder* dec) {
+  word__BracedTree* obj = word__BracedTree::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<word_part_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      word_part_t* i0;
+      i0 = word_part_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->parts = c0;
+  }
+  return obj;
+}
+
+void word__String::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, word_e::String)) {
+    return;
+  }
+  enc->Int(this->id);
+  enc->Str(this->s);
+  enc->Obj(this->blame_loc);
+}
+
+word__String* word__String::DecodeNew(pyserial::Decoder* dec) {
+  word__String* obj = word__String::CreateNull();
+  dec->Add(obj);
+  obj->id = dec->Int();
+  obj->s = dec->Str();
+  obj->blame_loc = CompoundWord::Decode(dec);
+  return obj;
+}
+
+void word__Redir::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, word_e::Redir)) {
+    return;
+  }
+  enc->Obj(this->left_tok);
+  enc->Obj(this->op);
+}
+
+word__Redir* word__Redir::DecodeNew(pyserial::Decoder* dec) {
+  word__Redir* obj = word__Redir::CreateNull();
+  dec->Add(obj);
+  obj->left_tok = Token::Decode(dec);
+  obj->op = Token::Decode(dec);
+  return obj;
+}
+
+void word_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case word_e::Operator: {
+    static_cast<Token*>(this)->Encode(enc);
+    return;
+  }
+  case word_e::Compound: {
+    static_cast<CompoundWord*>(this)->Encode(enc);
+    return;
+  }
+  case word_e::BracedTree: {
+    static_cast<word__BracedTree*>(this)->Encode(enc);
+    return;
+  }
+  case word_e::String: {
+    static_cast<word__String*>(this)->Encode(enc);
+    return;
+  }
+  case word_e::Redir: {
+    static_cast<word__Redir*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+word_t* word_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case word_e::Operator:
+    return Token::DecodeNew(dec);
+  case word_e::Compound:
+    return CompoundWord::DecodeNew(dec);
+  case word_e::BracedTree:
+    return word__BracedTree::DecodeNew(dec);
+  case word_e::String:
+    return word__String::DecodeNew(dec);
+  case word_e::Redir:
+    return word__Redir::DecodeNew(dec);
+  }
+  return static_cast<word_t*>(dec->Ref(h));
+}
+BigStr* sh_lhs_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case sh_lhs_e::Name:
+    v = "Name"; break;
+  case sh_lhs_e::IndexedName:
+    v = "IndexedName"; break;
+  case sh_lhs_e::UnparsedIndex:
+    v = "UnparsedIndex"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "sh_lhs.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* sh_lhs__Name::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(sh_lhs_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = ToPretty(this->name);
+  L->append(Alloc<Field>(StrFromC("name"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* sh_lhs__IndexedName::PrettyTree(bool do_abbrev, Dict<int, bool>* seen)
+                                         {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(sh_lhs_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = ToPretty(this->name);
+  L->append(Alloc<Field>(StrFromC("name"), x1));
+
+  hnode_t* x2 = this->index->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("index"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* sh_lhs__UnparsedIndex::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                           seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(sh_lhs_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = ToPretty(this->name);
+  L->append(Alloc<Field>(StrFromC("name"), x1));
+
+  hnode_t* x2 = ToPretty(this->index);
+  L->append(Alloc<Field>(StrFromC("index"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* sh_lhs_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case sh_lhs_e::Name: {
+    sh_lhs__Name* obj = static_cast<sh_lhs__Name*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case sh_lhs_e::IndexedName: {
+    sh_lhs__IndexedName* obj = static_cast<sh_lhs__IndexedName*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case sh_lhs_e::UnparsedIndex: {
+    sh_lhs__UnparsedIndex* obj = static_cast<sh_lhs__UnparsedIndex*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void sh_lhs__Name::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, sh_lhs_e::Name)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Str(this->name);
+}
+
+sh_lhs__Name* sh_lhs__Name::DecodeNew(pyserial::Decoder* dec) {
+  sh_lhs__Name* obj = sh_lhs__Name::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->name = dec->Str();
+  return obj;
+}
+
+void sh_lhs__IndexedName::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, sh_lhs_e::IndexedName)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Str(this->name);
+  enc->Obj(this->index);
+}
+
+sh_lhs__IndexedName* sh_lhs__IndexedName::DecodeNew(pyserial::Decoder* dec) {
+  sh_lhs__IndexedName* obj = sh_lhs__IndexedName::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->name = dec->Str();
+  obj->index = arith_expr_t::Decode(dec);
+  return obj;
+}
+
+void sh_lhs__UnparsedIndex::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, sh_lhs_e::UnparsedIndex)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Str(this->name);
+  enc->Str(this->index);
+}
+
+sh_lhs__UnparsedIndex* sh_lhs__UnparsedIndex::DecodeNew(pyserial::Decoder* dec)
+                                                        {
+  sh_lhs__UnparsedIndex* obj = sh_lhs__UnparsedIndex::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->name = dec->Str();
+  obj->index = dec->Str();
+  return obj;
+}
+
+void sh_lhs_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case sh_lhs_e::Name: {
+    static_cast<sh_lhs__Name*>(this)->Encode(enc);
+    return;
+  }
+  case sh_lhs_e::IndexedName: {
+    static_cast<sh_lhs__IndexedName*>(this)->Encode(enc);
+    return;
+  }
+  case sh_lhs_e::UnparsedIndex: {
+    static_cast<sh_lhs__UnparsedIndex*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+sh_lhs_t* sh_lhs_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case sh_lhs_e::Name:
+    return sh_lhs__Name::DecodeNew(dec);
+  case sh_lhs_e::IndexedName:
+    return sh_lhs__IndexedName::DecodeNew(dec);
+  case sh_lhs_e::UnparsedIndex:
+    return sh_lhs__UnparsedIndex::DecodeNew(dec);
+  }
+  return static_cast<sh_lhs_t*>(dec->Ref(h));
+}
+BigStr* arith_expr_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case arith_expr_e::EmptyZero:
+    v = "EmptyZero"; break;
+  case arith_expr_e::EmptyOne:
+    v = "EmptyOne"; break;
+  case arith_expr_e::VarSub:
+    v = "VarSub"; break;
+  case arith_expr_e::Word:
+    v = "Word"; break;
+  case arith_expr_e::UnaryAssign:
+    v = "UnaryAssign"; break;
+  case arith_expr_e::BinaryAssign:
+    v = "BinaryAssign"; break;
+  case arith_expr_e::Unary:
+    v = "Unary"; break;
+  case arith_expr_e::Binary:
+    v = "Binary"; break;
+  case arith_expr_e::TernaryOp:
+    v = "TernaryOp"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "arith_expr.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+arith_expr__EmptyZero* arith_expr::EmptyZero = &garith_expr__EmptyZero.obj;
+
+GcGlobal<arith_expr__EmptyZero> garith_expr__EmptyZero = 
+  { ObjHeader::Global(arith_expr_e::EmptyZero) };
+
+arith_expr__EmptyOne* arith_expr::EmptyOne = &garith_expr__EmptyOne.obj;
+
+GcGlobal<arith_expr__EmptyOne> garith_expr__EmptyOne = 
+  { ObjHeader::Global(arith_expr_e::EmptyOne) };
+
+hnode_t* arith_expr__EmptyZero::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                           seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(arith_expr_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* arith_expr__EmptyOne::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                          seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(arith_expr_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* arith_expr__UnaryAssign::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                             seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(arith_expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = Alloc<hnode::Leaf>(Id_str(this->op_id, false),
+                                   color_e::UserType);
+  L->append(Alloc<Field>(StrFromC("op_id"), x0));
+
+  hnode_t* x1 = this->child->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("child"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* arith_expr__BinaryAssign::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                              seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(arith_expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = Alloc<hnode::Leaf>(Id_str(this->op_id, false),
+                                   color_e::UserType);
+  L->append(Alloc<Field>(StrFromC("op_id"), x0));
+
+  hnode_t* x1 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x1));
+
+  hnode_t* x2 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* arith_expr__Unary::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(arith_expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = Alloc<hnode::Leaf>(Id_str(this->op_id, false),
+                                   color_e::UserType);
+  L->append(Alloc<Field>(StrFromC("op_id"), x0));
+
+  hnode_t* x1 = this->child->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("child"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* arith_expr__Binary::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(arith_expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->op->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("op"), x0));
+
+  hnode_t* x1 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x1));
+
+  hnode_t* x2 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* arith_expr__TernaryOp::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                           seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(arith_expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->cond->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("cond"), x0));
+
+  hnode_t* x1 = this->true_expr->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("true_expr"), x1));
+
+  hnode_t* x2 = this->false_expr->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("false_expr"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* arith_expr_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case arith_expr_e::EmptyZero: {
+    arith_expr__EmptyZero* obj = static_cast<arith_expr__EmptyZero*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case arith_expr_e::EmptyOne: {
+    arith_expr__EmptyOne* obj = static_cast<arith_expr__EmptyOne*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case arith_expr_e::VarSub: {
+    Token* obj = static_cast<Token*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case arith_expr_e::Word: {
+    CompoundWord* obj = static_cast<CompoundWord*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case arith_expr_e::UnaryAssign: {
+    arith_expr__UnaryAssign* obj = static_cast<arith_expr__UnaryAssign*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case arith_expr_e::BinaryAssign: {
+    arith_expr__BinaryAssign* obj =
+static_cast<arith_expr__BinaryAssign*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case arith_expr_e::Unary: {
+    arith_expr__Unary* obj = static_cast<arith_expr__Unary*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case arith_expr_e::Binary: {
+    arith_expr__Binary* obj = static_cast<arith_expr__Binary*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case arith_expr_e::TernaryOp: {
+    arith_expr__TernaryOp* obj = static_cast<arith_expr__TernaryOp*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void arith_expr__EmptyZero::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, arith_expr_e::EmptyZero)) {
+    return;
+  }
+}
+
+void arith_expr__EmptyOne::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, arith_expr_e::EmptyOne)) {
+    return;
+  }
+}
+
+void arith_expr__UnaryAssign::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, arith_expr_e::UnaryAssign)) {
+    return;
+  }
+  enc->Int(this->op_id);
+  enc->Obj(this->child);
+}
+
+arith_expr__UnaryAssign* arith_expr__UnaryAssign::DecodeNew(pyserial::Decoder*
+                                                            dec) {
+  arith_expr__UnaryAssign* obj = arith_expr__UnaryAssign::CreateNull();
+  dec->Add(obj);
+  obj->op_id = dec->Int();
+  obj->child = arith_expr_t::Decode(dec);
+  return obj;
+}
+
+void arith_expr__BinaryAssign::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, arith_expr_e::BinaryAssign)) {
+    return;
+  }
+  enc->Int(this->op_id);
+  enc->Obj(this->left);
+  enc->Obj(this->right);
+}
+
+arith_expr__BinaryAssign*
+arith_expr__BinaryAssign::DecodeNew(pyserial::Decoder* dec) {
+  arith_expr__BinaryAssign* obj = arith_expr__BinaryAssign::CreateNull();
+  dec->Add(obj);
+  obj->op_id = dec->Int();
+  obj->left = arith_expr_t::Decode(dec);
+  obj->right = arith_expr_t::Decode(dec);
+  return obj;
+}
+
+void arith_expr__Unary::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, arith_expr_e::Unary)) {
+    return;
+  }
+  enc->Int(this->op_id);
+  enc->Obj(this->child);
+}
+
+arith_expr__Unary* arith_expr__Unary::DecodeNew(pyserial::Decoder* dec) {
+  arith_expr__Unary* obj = arith_expr__Unary::CreateNull();
+  dec->Add(obj);
+  obj->op_id = dec->Int();
+  obj->child = arith_expr_t::Decode(dec);
+  return obj;
+}
+
+void arith_expr__Binary::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, arith_expr_e::Binary)) {
+    return;
+  }
+  enc->Obj(this->op);
+  enc->Obj(this->left);
+  enc->Obj(this->right);
+}
+
+arith_expr__Binary* arith_expr__Binary::DecodeNew(pyserial::Decoder* dec) {
+  arith_expr__Binary* obj = arith_expr__Binary::CreateNull();
+  dec->Add(obj);
+  obj->op = Token::Decode(dec);
+  obj->left = arith_expr_t::Decode(dec);
+  obj->right = arith_expr_t::Decode(dec);
+  return obj;
+}
+
+void arith_expr__TernaryOp::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, arith_expr_e::TernaryOp)) {
+    return;
+  }
+  enc->Obj(this->cond);
+  enc->Obj(this->true_expr);
+  enc->Obj(this->false_expr);
+}
+
+arith_expr__TernaryOp* arith_expr__TernaryOp::DecodeNew(pyserial::Decoder* dec)
+                                                        {
+  arith_expr__TernaryOp* obj = arith_expr__TernaryOp::CreateNull();
+  dec->Add(obj);
+  obj->cond = arith_expr_t::Decode(dec);
+  obj->true_expr = arith_expr_t::Decode(dec);
+  obj->false_expr = arith_expr_t::Decode(dec);
+  return obj;
+}
+
+void arith_expr_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case arith_expr_e::EmptyZero: {
+    static_cast<arith_expr__EmptyZero*>(this)->Encode(enc);
+    return;
+  }
+  case arith_expr_e::EmptyOne: {
+    static_cast<arith_expr__EmptyOne*>(this)->Encode(enc);
+    return;
+  }
+  case arith_expr_e::VarSub: {
+    static_cast<Token*>(this)->Encode(enc);
+    return;
+  }
+  case arith_expr_e::Word: {
+    static_cast<CompoundWord*>(this)->Encode(enc);
+    return;
+  }
+  case arith_expr_e::UnaryAssign: {
+    static_cast<arith_expr__UnaryAssign*>(this)->Encode(enc);
+    return;
+  }
+  case arith_expr_e::BinaryAssign: {
+    static_cast<arith_expr__BinaryAssign*>(this)->Encode(enc);
+    return;
+  }
+  case arith_expr_e::Unary: {
+    static_cast<arith_expr__Unary*>(this)->Encode(enc);
+    return;
+  }
+  case arith_expr_e::Binary: {
+    static_cast<arith_expr__Binary*>(this)->Encode(enc);
+    return;
+  }
+  case arith_expr_e::TernaryOp: {
+    static_cast<arith_expr__TernaryOp*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+arith_expr_t* arith_expr_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case arith_expr_e::EmptyZero:
+    dec->Add(arith_expr::EmptyZero);
+    return arith_expr::EmptyZero;
+  case arith_expr_e::EmptyOne:
+    dec->Add(arith_expr::EmptyOne);
+    return arith_expr::EmptyOne;
+  case arith_expr_e::VarSub:
+    return Token::DecodeNew(dec);
+  case arith_expr_e::Word:
+    return CompoundWord::DecodeNew(dec);
+  case arith_expr_e::UnaryAssign:
+    return arith_expr__UnaryAssign::DecodeNew(dec);
+  case arith_expr_e::BinaryAssign:
+    return arith_expr__BinaryAssign::DecodeNew(dec);
+  case arith_expr_e::Unary:
+    return arith_expr__Unary::DecodeNew(dec);
+  case arith_expr_e::Binary:
+    return arith_expr__Binary::DecodeNew(dec);
+  case arith_expr_e::TernaryOp:
+    return arith_expr__TernaryOp::DecodeNew(dec);
+  }
+  return static_cast<arith_expr_t*>(dec->Ref(h));
+}
+BigStr* bool_expr_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case bool_expr_e::WordTest:
+    v = "WordTest"; break;
+  case bool_expr_e::Binary:
+    v = "Binary"; break;
+  case bool_expr_e::Unary:
+    v = "Unary"; break;
+  case bool_expr_e::LogicalNot:
+    v = "LogicalNot"; break;
+  case bool_expr_e::LogicalAnd:
+    v = "LogicalAnd"; break;
+  case bool_expr_e::LogicalOr:
+    v = "LogicalOr"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "bool_expr.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* bool_expr__WordTest::PrettyTree(bool do_abbrev, Dict<int, bool>* seen)
+                                         {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(bool_expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->w->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("w"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* bool_expr__Binary::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(bool_expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = Alloc<hnode::Leaf>(Id_str(this->op_id, false),
+                                   color_e::UserType);
+  L->append(Alloc<Field>(StrFromC("op_id"), x0));
+
+  hnode_t* x1 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x1));
+
+  hnode_t* x2 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* bool_expr__Unary::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(bool_expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = Alloc<hnode::Leaf>(Id_str(this->op_id, false),
+                                   color_e::UserType);
+  L->append(Alloc<Field>(StrFromC("op_id"), x0));
+
+  hnode_t* x1 = this->child->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("child"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* bool_expr__LogicalNot::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                           seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(bool_expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->child->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("child"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* bool_expr__LogicalAnd::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                           seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(bool_expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* bool_expr__LogicalOr::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                          seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(bool_expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* bool_expr_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case bool_expr_e::WordTest: {
+    bool_expr__WordTest* obj = static_cast<bool_expr__WordTest*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case bool_expr_e::Binary: {
+    bool_expr__Binary* obj = static_cast<bool_expr__Binary*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case bool_expr_e::Unary: {
+    bool_expr__Unary* obj = static_cast<bool_expr__Unary*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case bool_expr_e::LogicalNot: {
+    bool_expr__LogicalNot* obj = static_cast<bool_expr__LogicalNot*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case bool_expr_e::LogicalAnd: {
+    bool_expr__LogicalAnd* obj = static_cast<bool_expr__LogicalAnd*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case bool_expr_e::LogicalOr: {
+    bool_expr__LogicalOr* obj = static_cast<bool_expr__LogicalOr*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void bool_expr__WordTest::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, bool_expr_e::WordTest)) {
+    return;
+  }
+  enc->Obj(this->w);
+}
+
+bool_expr__WordTest* bool_expr__WordTest::DecodeNew(pyserial::Decoder* dec) {
+  bool_expr__WordTest* obj = bool_expr__WordTest::CreateNull();
+  dec->Add(obj);
+  obj->w = word_t::Decode(dec);
+  return obj;
+}
+
+void bool_expr__Binary::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, bool_expr_e::Binary)) {
+    return;
+  }
+  enc->Int(this->op_id);
+  enc->Obj(this->left);
+  enc->Obj(this->right);
+}
+
+bool_expr__Binary* bool_expr__Binary::DecodeNew(pyserial::Decoder* dec) {
+  bool_expr__Binary* obj = bool_expr__Binary::CreateNull();
+  dec->Add(obj);
+  obj->op_id = dec->Int();
+  obj->left = word_t::Decode(dec);
+  obj->right = word_t::Decode(dec);
+  return obj;
+}
+
+void bool_expr__Unary::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, bool_expr_e::Unary)) {
+    return;
+  }
+  enc->Int(this->op_id);
+  enc->Obj(this->child);
+}
+
+bool_expr__Unary* bool_expr__Unary::DecodeNew(pyserial::Decoder* dec) {
+  bool_expr__Unary* obj = bool_expr__Unary::CreateNull();
+  dec->Add(obj);
+  obj->op_id = dec->Int();
+  obj->child = word_t::Decode(dec);
+  return obj;
+}
+
+void bool_expr__LogicalNot::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, bool_expr_e::LogicalNot)) {
+    return;
+  }
+  enc->Obj(this->child);
+}
+
+bool_expr__LogicalNot* bool_expr__LogicalNot::DecodeNew(pyserial::Decoder* dec)
+                                                        {
+  bool_expr__LogicalNot* obj = bool_expr__LogicalNot::CreateNull();
+  dec->Add(obj);
+  obj->child = bool_expr_t::Decode(dec);
+  return obj;
+}
+
+void bool_expr__LogicalAnd::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, bool_expr_e::LogicalAnd)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->right);
+}
+
+bool_expr__LogicalAnd* bool_expr__LogicalAnd::DecodeNew(pyserial::Decoder* dec)
+                                                        {
+  bool_expr__LogicalAnd* obj = bool_expr__LogicalAnd::CreateNull();
+  dec->Add(obj);
+  obj->left = bool_expr_t::Decode(dec);
+  obj->right = bool_expr_t::Decode(dec);
+  return obj;
+}
+
+void bool_expr__LogicalOr::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, bool_expr_e::LogicalOr)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->right);
+}
+
+bool_expr__LogicalOr* bool_expr__LogicalOr::DecodeNew(pyserial::Decoder* dec) {
+  bool_expr__LogicalOr* obj = bool_expr__LogicalOr::CreateNull();
+  dec->Add(obj);
+  obj->left = bool_expr_t::Decode(dec);
+  obj->right = bool_expr_t::Decode(dec);
+  return obj;
+}
+
+void bool_expr_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case bool_expr_e::WordTest: {
+    static_cast<bool_expr__WordTest*>(this)->Encode(enc);
+    return;
+  }
+  case bool_expr_e::Binary: {
+    static_cast<bool_expr__Binary*>(this)->Encode(enc);
+    return;
+  }
+  case bool_expr_e::Unary: {
+    static_cast<bool_expr__Unary*>(this)->Encode(enc);
+    return;
+  }
+  case bool_expr_e::LogicalNot: {
+    static_cast<bool_expr__LogicalNot*>(this)->Encode(enc);
+    return;
+  }
+  case bool_expr_e::LogicalAnd: {
+    static_cast<bool_expr__LogicalAnd*>(this)->Encode(enc);
+    return;
+  }
+  case bool_expr_e::LogicalOr: {
+    static_cast<bool_expr__LogicalOr*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+bool_expr_t* bool_expr_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case bool_expr_e::WordTest:
+    return bool_expr__WordTest::DecodeNew(dec);
+  case bool_expr_e::Binary:
+    return bool_expr__Binary::DecodeNew(dec);
+  case bool_expr_e::Unary:
+    return bool_expr__Unary::DecodeNew(dec);
+  case bool_expr_e::LogicalNot:
+    return bool_expr__LogicalNot::DecodeNew(dec);
+  case bool_expr_e::LogicalAnd:
+    return bool_expr__LogicalAnd::DecodeNew(dec);
+  case bool_expr_e::LogicalOr:
+    return bool_expr__LogicalOr::DecodeNew(dec);
+  }
+  return static_cast<bool_expr_t*>(dec->Ref(h));
+}
+BigStr* redir_loc_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case redir_loc_e::Fd:
+    v = "Fd"; break;
+  case redir_loc_e::VarName:
+    v = "VarName"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "redir_loc.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* redir_loc__Fd::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(redir_loc_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->fd);
+  L->append(Alloc<Field>(StrFromC("fd"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* redir_loc__VarName::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(redir_loc_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->name);
+  L->append(Alloc<Field>(StrFromC("name"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* redir_loc_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case redir_loc_e::Fd: {
+    redir_loc__Fd* obj = static_cast<redir_loc__Fd*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case redir_loc_e::VarName: {
+    redir_loc__VarName* obj = static_cast<redir_loc__VarName*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void redir_loc__Fd::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, redir_loc_e::Fd)) {
+    return;
+  }
+  enc->Int(this->fd);
+}
+
+redir_loc__Fd* redir_loc__Fd::DecodeNew(pyserial::Decoder* dec) {
+  redir_loc__Fd* obj = redir_loc__Fd::CreateNull();
+  dec->Add(obj);
+  obj->fd = dec->Int();
+  return obj;
+}
+
+void redir_loc__VarName::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, redir_loc_e::VarName)) {
+    return;
+  }
+  enc->Str(this->name);
+}
+
+redir_loc__VarName* redir_loc__VarName::DecodeNew(pyserial::Decoder* dec) {
+  redir_loc__VarName* obj = redir_loc__VarName::CreateNull();
+  dec->Add(obj);
+  obj->name = dec->Str();
+  return obj;
+}
+
+void redir_loc_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case redir_loc_e::Fd: {
+    static_cast<redir_loc__Fd*>(this)->Encode(enc);
+    return;
+  }
+  case redir_loc_e::VarName: {
+    static_cast<redir_loc__VarName*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+redir_loc_t* redir_loc_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case redir_loc_e::Fd:
+    return redir_loc__Fd::DecodeNew(dec);
+  case redir_loc_e::VarName:
+    return redir_loc__VarName::DecodeNew(dec);
+  }
+  return static_cast<redir_loc_t*>(dec->Ref(h));
+}
+BigStr* redir_param_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case redir_param_e::Word:
+    v = "Word"; break;
+  case redir_param_e::HereWord:
+    v = "HereWord"; break;
+  case redir_param_e::HereDoc:
+    v = "HereDoc"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "redir_param.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* redir_param__HereWord::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                           seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(redir_param_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->w->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("w"), x0));
+
+  hnode_t* x1 = ToPretty(this->is_multiline);
+  L->append(Alloc<Field>(StrFromC("is_multiline"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* redir_param__HereDoc::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                          seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(redir_param_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->here_begin->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("here_begin"), x0));
+
+  if (this->here_end_tok) {  // Optional
+    hnode_t* x1 = this->here_end_tok->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("here_end_tok"), x1));
+  }
+
+  if (this->stdin_parts != nullptr) {  // List
+    hnode::Array* x2 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<word_part_t*> it(this->stdin_parts); !it.Done(); it.Next()) {
+      word_part_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x2->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("stdin_parts"), x2));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* redir_param_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case redir_param_e::Word: {
+    CompoundWord* obj = static_cast<CompoundWord*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case redir_param_e::HereWord: {
+    redir_param__HereWord* obj = static_cast<redir_param__HereWord*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case redir_param_e::HereDoc: {
+    redir_param__HereDoc* obj = static_cast<redir_param__HereDoc*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void redir_param__HereWord::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, redir_param_e::HereWord)) {
+    return;
+  }
+  enc->Obj(this->w);
+  enc->Bool(this->is_multiline);
+}
+
+redir_param__HereWord* redir_param__HereWord::DecodeNew(pyserial::Decoder* dec)
+                                                        {
+  redir_param__HereWord* obj = redir_param__HereWord::CreateNull();
+  dec->Add(obj);
+  obj->w = CompoundWord::Decode(dec);
+  obj->is_multiline = dec->Bool();
+  return obj;
+}
+
+void redir_param__HereDoc::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, redir_param_e::HereDoc)) {
+    return;
+  }
+  enc->Obj(this->here_begin);
+  enc->Obj(this->here_end_tok);
+  if (this->stdin_parts == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->stdin_parts));
+    for (ListIter<word_part_t*> it0(this->stdin_parts); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+redir_param__HereDoc* redir_param__HereDoc::DecodeNew(pyserial::Decoder* dec) {
+  redir_param__HereDoc* obj = redir_param__HereDoc::CreateNull();
+  dec->Add(obj);
+  obj->here_begin = word_t::Decode(dec);
+  obj->here_end_tok = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<word_part_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      word_part_t* i0;
+      i0 = word_part_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->stdin_parts = c0;
+  }
+  return obj;
+}
+
+void redir_param_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case redir_param_e::Word: {
+    static_cast<CompoundWord*>(this)->Encode(enc);
+    return;
+  }
+  case redir_param_e::HereWord: {
+    static_cast<redir_param__HereWord*>(this)->Encode(enc);
+    return;
+  }
+  case redir_param_e::HereDoc: {
+    static_cast<redir_param__HereDoc*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+redir_param_t* redir_param_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case redir_param_e::Word:
+    return CompoundWord::DecodeNew(dec);
+  case redir_param_e::HereWord:
+    return redir_param__HereWord::DecodeNew(dec);
+  case redir_param_e::HereDoc:
+    return redir_param__HereDoc::DecodeNew(dec);
+  }
+  return static_cast<redir_param_t*>(dec->Ref(h));
+}
+
+hnode_t* Redir::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("Redir"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->op->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("op"), x0));
+
+  hnode_t* x1 = this->loc->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("loc"), x1));
+
+  hnode_t* x2 = this->arg->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("arg"), x2));
+
+  return out_node;
+}
+
+
+void Redir::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 78)) {
+    return;
+  }
+  enc->Obj(this->op);
+  enc->Obj(this->loc);
+  enc->Obj(this->arg);
+}
+
+Redir* Redir::DecodeNew(pyserial::Decoder* dec) {
+  Redir* obj = Redir::CreateNull();
+  dec->Add(obj);
+  obj->op = Token::Decode(dec);
+  obj->loc = redir_loc_t::Decode(dec);
+  obj->arg = redir_param_t::Decode(dec);
+  return obj;
+}
+
+Redir* Redir::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 78) {
+    return Redir::DecodeNew(dec);
+  }
+  return static_cast<Redir*>(dec->Ref(h));
+}
+BigStr* assign_op_str(assign_op_e tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case assign_op_e::Equal:
+    v = "Equal"; break;
+  case assign_op_e::PlusEqual:
+    v = "PlusEqual"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "assign_op.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* AssignPair::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("AssignPair"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = this->lhs->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("lhs"), x1));
+
+  hnode_t* x2 = Alloc<hnode::Leaf>(assign_op_str(this->op), color_e::TypeName);
+  L->append(Alloc<Field>(StrFromC("op"), x2));
+
+  hnode_t* x3 = this->rhs->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("rhs"), x3));
+
+  return out_node;
+}
+
+
+void AssignPair::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 79)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->lhs);
+  enc->Int(static_cast<int>(this->op));
+  enc->Obj(this->rhs);
+}
+
+AssignPair* AssignPair::DecodeNew(pyserial::Decoder* dec) {
+  AssignPair* obj = AssignPair::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->lhs = sh_lhs_t::Decode(dec);
+  obj->op = static_cast<assign_op_t>(dec->Int());
+  obj->rhs = rhs_word_t::Decode(dec);
+  return obj;
+}
+
+AssignPair* AssignPair::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 79) {
+    return AssignPair::DecodeNew(dec);
+  }
+  return static_cast<AssignPair*>(dec->Ref(h));
+}
+
+hnode_t* EnvPair::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("EnvPair"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = ToPretty(this->name);
+  L->append(Alloc<Field>(StrFromC("name"), x1));
+
+  hnode_t* x2 = this->val->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("val"), x2));
+
+  return out_node;
+}
+
+
+void EnvPair::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 80)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Str(this->name);
+  enc->Obj(this->val);
+}
+
+EnvPair* EnvPair::DecodeNew(pyserial::Decoder* dec) {
+  EnvPair* obj = EnvPair::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->name = dec->Str();
+  obj->val = rhs_word_t::Decode(dec);
+  return obj;
+}
+
+EnvPair* EnvPair::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 80) {
+    return EnvPair::DecodeNew(dec);
+  }
+  return static_cast<EnvPair*>(dec->Ref(h));
+}
+
+hnode_t* List_of_command::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Array* out_node = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+  for (ListIter<command_t*> it(this); !it.Done(); it.Next()) {
+    command_t* v_ = it.Value();
+    hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                  color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+    out_node->children->append(h);
+  }
+  return out_node;
+}
+
+
+void List_of_command::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 81)) {
+    return;
+  }
+  enc->Size(len(this));
+  for (ListIter<command_t*> it(this); !it.Done(); it.Next()) {
+    enc->Obj(it.Value());
+  }
+}
+
+List_of_command* List_of_command::DecodeNew(pyserial::Decoder* dec) {
+  List_of_command* obj = List_of_command::New();
+  dec->Add(obj);
+  int n = dec->Size();
+  for (int j = 0; j < n; ++j) {
+    command_t* item;
+    item = command_t::Decode(dec);
+    obj->append(item);
+  }
+  return obj;
+}
+
+List_of_command* List_of_command::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 81) {
+    return List_of_command::DecodeNew(dec);
+  }
+  return static_cast<List_of_command*>(dec->Ref(h));
+}
+BigStr* condition_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case condition_e::Shell:
+    v = "Shell"; break;
+  case condition_e::YshExpr:
+    v = "YshExpr"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "condition.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* condition__YshExpr::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(condition_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->e->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("e"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* condition_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case condition_e::Shell: {
+    List_of_command* obj = static_cast<List_of_command*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case condition_e::YshExpr: {
+    condition__YshExpr* obj = static_cast<condition__YshExpr*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void condition__YshExpr::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, condition_e::YshExpr)) {
+    return;
+  }
+  enc->Obj(this->e);
+}
+
+condition__YshExpr* condition__YshExpr::DecodeNew(pyserial::Decoder* dec) {
+  condition__YshExpr* obj = condition__YshExpr::CreateNull();
+  dec->Add(obj);
+  obj->e = expr_t::Decode(dec);
+  return obj;
+}
+
+void condition_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case condition_e::Shell: {
+    static_cast<List_of_command*>(this)->Encode(enc);
+    return;
+  }
+  case condition_e::YshExpr: {
+    static_cast<condition__YshExpr*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+condition_t* condition_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case condition_e::Shell:
+    return List_of_command::DecodeNew(dec);
+  case condition_e::YshExpr:
+    return condition__YshExpr::DecodeNew(dec);
+  }
+  return static_cast<condition_t*>(dec->Ref(h));
+}
+
+hnode_t* CaseArm::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("CaseArm"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = this->pattern->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("pattern"), x1));
+
+  hnode_t* x2 = this->middle->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("middle"), x2));
+
+  if (this->action != nullptr) {  // List
+    hnode::Array* x3 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<command_t*> it(this->action); !it.Done(); it.Next()) {
+      command_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x3->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("action"), x3));
+  }
+
+  if (this->right) {  // Optional
+    hnode_t* x4 = this->right->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("right"), x4));
+  }
+
+  return out_node;
+}
+
+
+void CaseArm::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 82)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->pattern);
+  enc->Obj(this->middle);
+  if (this->action == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->action));
+    for (ListIter<command_t*> it0(this->action); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Obj(this->right);
+}
+
+CaseArm* CaseArm::DecodeNew(pyserial::Decoder* dec) {
+  CaseArm* obj = CaseArm::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->pattern = pat_t::Decode(dec);
+  obj->middle = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<command_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      command_t* i0;
+      i0 = command_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->action = c0;
+  }
+  obj->right = Token::Decode(dec);
+  return obj;
+}
+
+CaseArm* CaseArm::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 82) {
+    return CaseArm::DecodeNew(dec);
+  }
+  return static_cast<CaseArm*>(dec->Ref(h));
+}
+BigStr* case_arg_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case case_arg_e::Word:
+    v = "Word"; break;
+  case case_arg_e::YshExpr:
+    v = "YshExpr"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "case_arg.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* case_arg__Word::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(case_arg_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->w->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("w"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* case_arg__YshExpr::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(case_arg_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->e->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("e"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* case_arg_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case case_arg_e::Word: {
+    case_arg__Word* obj = static_cast<case_arg__Word*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case case_arg_e::YshExpr: {
+    case_arg__YshExpr* obj = static_cast<case_arg__YshExpr*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void case_arg__Word::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, case_arg_e::Word)) {
+    return;
+  }
+  enc->Obj(this->w);
+}
+
+case_arg__Word* case_arg__Word::DecodeNew(pyserial::Decoder* dec) {
+  case_arg__Word* obj = case_arg__Word::CreateNull();
+  dec->Add(obj);
+  obj->w = word_t::Decode(dec);
+  return obj;
+}
+
+void case_arg__YshExpr::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, case_arg_e::YshExpr)) {
+    return;
+  }
+  enc->Obj(this->e);
+}
+
+case_arg__YshExpr* case_arg__YshExpr::DecodeNew(pyserial::Decoder* dec) {
+  case_arg__YshExpr* obj = case_arg__YshExpr::CreateNull();
+  dec->Add(obj);
+  obj->e = expr_t::Decode(dec);
+  return obj;
+}
+
+void case_arg_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case case_arg_e::Word: {
+    static_cast<case_arg__Word*>(this)->Encode(enc);
+    return;
+  }
+  case case_arg_e::YshExpr: {
+    static_cast<case_arg__YshExpr*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+case_arg_t* case_arg_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case case_arg_e::Word:
+    return case_arg__Word::DecodeNew(dec);
+  case case_arg_e::YshExpr:
+    return case_arg__YshExpr::DecodeNew(dec);
+  }
+  return static_cast<case_arg_t*>(dec->Ref(h));
+}
+
+hnode_t* EggexFlag::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("EggexFlag"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->negated);
+  L->append(Alloc<Field>(StrFromC("negated"), x0));
+
+  hnode_t* x1 = this->flag->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("flag"), x1));
+
+  return out_node;
+}
+
+
+void EggexFlag::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 83)) {
+    return;
+  }
+  enc->Bool(this->negated);
+  enc->Obj(this->flag);
+}
+
+EggexFlag* EggexFlag::DecodeNew(pyserial::Decoder* dec) {
+  EggexFlag* obj = EggexFlag::CreateNull();
+  dec->Add(obj);
+  obj->negated = dec->Bool();
+  obj->flag = Token::Decode(dec);
+  return obj;
+}
+
+EggexFlag* EggexFlag::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 83) {
+    return EggexFlag::DecodeNew(dec);
+  }
+  return static_cast<EggexFlag*>(dec->Ref(h));
+}
+
+hnode_t* Eggex::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("Eggex"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = this->regex->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("regex"), x1));
+
+  if (this->flags != nullptr) {  // List
+    hnode::Array* x2 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<EggexFlag*> it(this->flags); !it.Done(); it.Next()) {
+      EggexFlag* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x2->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("flags"), x2));
+  }
+
+  if (this->trans_pref) {  // Optional
+    hnode_t* x3 = this->trans_pref->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("trans_pref"), x3));
+  }
+
+  if (this->canonical_flags) {  // Optional
+    hnode_t* x4 = ToPretty(this->canonical_flags);
+    L->append(Alloc<Field>(StrFromC("canonical_flags"), x4));
+  }
+
+  return out_node;
+}
+
+
+void Eggex::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 84)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->regex);
+  if (this->flags == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->flags));
+    for (ListIter<EggexFlag*> it0(this->flags); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Obj(this->trans_pref);
+  enc->Str(this->canonical_flags);
+}
+
+Eggex* Eggex::DecodeNew(pyserial::Decoder* dec) {
+  Eggex* obj = Eggex::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->regex = re_t::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<EggexFlag*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      EggexFlag* i0;
+      i0 = EggexFlag::Decode(dec);
+      c0->append(i0);
+    }
+    obj->flags = c0;
+  }
+  obj->trans_pref = Token::Decode(dec);
+  obj->canonical_flags = dec->Str();
+  return obj;
+}
+
+Eggex* Eggex::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 84) {
+    return Eggex::DecodeNew(dec);
+  }
+  return static_cast<Eggex*>(dec->Ref(h));
+}
+BigStr* pat_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case pat_e::Else:
+    v = "Else"; break;
+  case pat_e::Words:
+    v = "Words"; break;
+  case pat_e::YshExprs:
+    v = "YshExprs"; break;
+  case pat_e::Eggex:
+    v = "Eggex"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "pat.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+pat__Else* pat::Else = &gpat__Else.obj;
+
+GcGlobal<pat__Else> gpat__Else = 
+  { ObjHeader::Global(pat_e::Else) };
+
+hnode_t* pat__Else::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(pat_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* pat__Words::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(pat_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->words != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<word_t*> it(this->words); !it.Done(); it.Next()) {
+      word_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("words"), x0));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* pat__YshExprs::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(pat_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->exprs != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<expr_t*> it(this->exprs); !it.Done(); it.Next()) {
+      expr_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("exprs"), x0));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* pat_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case pat_e::Else: {
+    pat__Else* obj = static_cast<pat__Else*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case pat_e::Words: {
+    pat__Words* obj = static_cast<pat__Words*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case pat_e::YshExprs: {
+    pat__YshExprs* obj = static_cast<pat__YshExprs*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case pat_e::Eggex: {
+    Eggex* obj = static_cast<Eggex*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void pat__Else::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, pat_e::Else)) {
+    return;
+  }
+}
+
+void pat__Words::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, pat_e::Words)) {
+    return;
+  }
+  if (this->words == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->words));
+    for (ListIter<word_t*> it0(this->words); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+pat__Words* pat__Words::DecodeNew(pyserial::Decoder* dec) {
+  pat__Words* obj = pat__Words::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<word_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      word_t* i0;
+      i0 = word_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->words = c0;
+  }
+  return obj;
+}
+
+void pat__YshExprs::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, pat_e::YshExprs)) {
+    return;
+  }
+  if (this->exprs == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->exprs));
+    for (ListIter<expr_t*> it0(this->exprs); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+pat__YshExprs* pat__YshExprs::DecodeNew(pyserial::Decoder* dec) {
+  pat__YshExprs* obj = pat__YshExprs::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<expr_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      expr_t* i0;
+      i0 = expr_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->exprs = c0;
+  }
+  return obj;
+}
+
+void pat_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case pat_e::Else: {
+    static_cast<pat__Else*>(this)->Encode(enc);
+    return;
+  }
+  case pat_e::Words: {
+    static_cast<pat__Words*>(this)->Encode(enc);
+    return;
+  }
+  case pat_e::YshExprs: {
+    static_cast<pat__YshExprs*>(this)->Encode(enc);
+    return;
+  }
+  case pat_e::Eggex: {
+    static_cast<Eggex*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+pat_t* pat_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case pat_e::Else:
+    dec->Add(pat::Else);
+    return pat::Else;
+  case pat_e::Words:
+    return pat__Words::DecodeNew(dec);
+  case pat_e::YshExprs:
+    return pat__YshExprs::DecodeNew(dec);
+  case pat_e::Eggex:
+    return Eggex::DecodeNew(dec);
+  }
+  return static_cast<pat_t*>(dec->Ref(h));
+}
+
+hnode_t* IfArm::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("IfArm"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->keyword->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("keyword"), x0));
+
+  hnode_t* x1 = this->cond->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("cond"), x1));
+
+  if (this->then_kw) {  // Optional
+    hnode_t* x2 = this->then_kw->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("then_kw"), x2));
+  }
+
+  if (this->action != nullptr) {  // List
+    hnode::Array* x3 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<command_t*> it(this->action); !it.Done(); it.Next()) {
+      command_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x3->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("action"), x3));
+  }
+
+  if (this->then_tok) {  // Optional
+    hnode_t* x4 = this->then_tok->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("then_tok"), x4));
+  }
+
+  return out_node;
+}
+
+
+void IfArm::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 85)) {
+    return;
+  }
+  enc->Obj(this->keyword);
+  enc->Obj(this->cond);
+  enc->Obj(this->then_kw);
+  if (this->action == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->action));
+    for (ListIter<command_t*> it0(this->action); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Obj(this->then_tok);
+}
+
+IfArm* IfArm::DecodeNew(pyserial::Decoder* dec) {
+  IfArm* obj = IfArm::CreateNull();
+  dec->Add(obj);
+  obj->keyword = Token::Decode(dec);
+  obj->cond = condition_t::Decode(dec);
+  obj->then_kw = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<command_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      command_t* i0;
+      i0 = command_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->action = c0;
+  }
+  obj->then_tok = Token::Decode(dec);
+  return obj;
+}
+
+IfArm* IfArm::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 85) {
+    return IfArm::DecodeNew(dec);
+  }
+  return static_cast<IfArm*>(dec->Ref(h));
+}
+BigStr* for_iter_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case for_iter_e::Args:
+    v = "Args"; break;
+  case for_iter_e::Words:
+    v = "Words"; break;
+  case for_iter_e::YshExpr:
+    v = "YshExpr"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "for_iter.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+for_iter__Args* for_iter::Args = &gfor_iter__Args.obj;
+
+GcGlobal<for_iter__Args> gfor_iter__Args = 
+  { ObjHeader::Global(for_iter_e::Args) };
+
+hnode_t* for_iter__Args::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(for_iter_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* for_iter__Words::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(for_iter_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->words != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<word_t*> it(this->words); !it.Done(); it.Next()) {
+      word_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("words"), x0));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* for_iter__YshExpr::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(for_iter_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->e->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("e"), x0));
+
+  hnode_t* x1 = this->blame->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("blame"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* for_iter_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case for_iter_e::Args: {
+    for_iter__Args* obj = static_cast<for_iter__Args*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case for_iter_e::Words: {
+    for_iter__Words* obj = static_cast<for_iter__Words*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case for_iter_e::YshExpr: {
+    for_iter__YshExpr* obj = static_cast<for_iter__YshExpr*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void for_iter__Args::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, for_iter_e::Args)) {
+    return;
+  }
+}
+
+void for_iter__Words::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, for_iter_e::Words)) {
+    return;
+  }
+  if (this->words == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->words));
+    for (ListIter<word_t*> it0(this->words); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+for_iter__Words* for_iter__Words::DecodeNew(pyserial::Decoder* dec) {
+  for_iter__Words* obj = for_iter__Words::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<word_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      word_t* i0;
+      i0 = word_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->words = c0;
+  }
+  return obj;
+}
+
+void for_iter__YshExpr::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, for_iter_e::YshExpr)) {
+    return;
+  }
+  enc->Obj(this->e);
+  enc->Obj(this->blame);
+}
+
+for_iter__YshExpr* for_iter__YshExpr::DecodeNew(pyserial::Decoder* dec) {
+  for_iter__YshExpr* obj = for_iter__YshExpr::CreateNull();
+  dec->Add(obj);
+  obj->e = expr_t::Decode(dec);
+  obj->blame = Token::Decode(dec);
+  return obj;
+}
+
+void for_iter_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case for_iter_e::Args: {
+    static_cast<for_iter__Args*>(this)->Encode(enc);
+    return;
+  }
+  case for_iter_e::Words: {
+    static_cast<for_iter__Words*>(this)->Encode(enc);
+    return;
+  }
+  case for_iter_e::YshExpr: {
+    static_cast<for_iter__YshExpr*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+for_iter_t* for_iter_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case for_iter_e::Args:
+    dec->Add(for_iter::Args);
+    return for_iter::Args;
+  case for_iter_e::Words:
+    return for_iter__Words::DecodeNew(dec);
+  case for_iter_e::YshExpr:
+    return for_iter__YshExpr::DecodeNew(dec);
+  }
+  return static_cast<for_iter_t*>(dec->Ref(h));
+}
+
+hnode_t* BraceGroup::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("BraceGroup"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  if (this->doc_token) {  // Optional
+    hnode_t* x1 = this->doc_token->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("doc_token"), x1));
+  }
+
+  if (this->children != nullptr) {  // List
+    hnode::Array* x2 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<command_t*> it(this->children); !it.Done(); it.Next()) {
+      command_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x2->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("children"), x2));
+  }
+
+  hnode_t* x3 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x3));
+
+  return out_node;
+}
+
+
+void BraceGroup::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 86)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->doc_token);
+  if (this->children == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->children));
+    for (ListIter<command_t*> it0(this->children); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Obj(this->right);
+}
+
+BraceGroup* BraceGroup::DecodeNew(pyserial::Decoder* dec) {
+  BraceGroup* obj = BraceGroup::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->doc_token = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<command_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      command_t* i0;
+      i0 = command_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->children = c0;
+  }
+  obj->right = Token::Decode(dec);
+  return obj;
+}
+
+BraceGroup* BraceGroup::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 86) {
+    return BraceGroup::DecodeNew(dec);
+  }
+  return static_cast<BraceGroup*>(dec->Ref(h));
+}
+
+hnode_t* Param::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("Param"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->blame_tok->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("blame_tok"), x0));
+
+  hnode_t* x1 = ToPretty(this->name);
+  L->append(Alloc<Field>(StrFromC("name"), x1));
+
+  if (this->type) {  // Optional
+    hnode_t* x2 = this->type->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("type"), x2));
+  }
+
+  if (this->default_val) {  // Optional
+    hnode_t* x3 = this->default_val->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("default_val"), x3));
+  }
+
+  return out_node;
+}
+
+
+void Param::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 87)) {
+    return;
+  }
+  enc->Obj(this->blame_tok);
+  enc->Str(this->name);
+  enc->Obj(this->type);
+  enc->Obj(this->default_val);
+}
+
+Param* Param::DecodeNew(pyserial::Decoder* dec) {
+  Param* obj = Param::CreateNull();
+  dec->Add(obj);
+  obj->blame_tok = Token::Decode(dec);
+  obj->name = dec->Str();
+  obj->type = TypeExpr::Decode(dec);
+  obj->default_val = expr_t::Decode(dec);
+  return obj;
+}
+
+Param* Param::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 87) {
+    return Param::DecodeNew(dec);
+  }
+  return static_cast<Param*>(dec->Ref(h));
+}
+
+hnode_t* RestParam::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("RestParam"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->blame_tok->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("blame_tok"), x0));
+
+  hnode_t* x1 = ToPretty(this->name);
+  L->append(Alloc<Field>(StrFromC("name"), x1));
+
+  return out_node;
+}
+
+
+void RestParam::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 88)) {
+    return;
+  }
+  enc->Obj(this->blame_tok);
+  enc->Str(this->name);
+}
+
+RestParam* RestParam::DecodeNew(pyserial::Decoder* dec) {
+  RestParam* obj = RestParam::CreateNull();
+  dec->Add(obj);
+  obj->blame_tok = Token::Decode(dec);
+  obj->name = dec->Str();
+  return obj;
+}
+
+RestParam* RestParam::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 88) {
+    return RestParam::DecodeNew(dec);
+  }
+  return static_cast<RestParam*>(dec->Ref(h));
+}
+
+hnode_t* ParamGroup::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("ParamGroup"));
+  List<Field*>* L = out_node->fields;
+
+  if (this->params != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<Param*> it(this->params); !it.Done(); it.Next()) {
+      Param* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("params"), x0));
+  }
+
+  if (this->rest_of) {  // Optional
+    hnode_t* x1 = this->rest_of->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("rest_of"), x1));
+  }
+
+  return out_node;
+}
+
+
+void ParamGroup::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 89)) {
+    return;
+  }
+  if (this->params == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->params));
+    for (ListIter<Param*> it0(this->params); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Obj(this->rest_of);
+}
+
+ParamGroup* ParamGroup::DecodeNew(pyserial::Decoder* dec) {
+  ParamGroup* obj = ParamGroup::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<Param*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      Param* i0;
+      i0 = Param::Decode(dec);
+      c0->append(i0);
+    }
+    obj->params = c0;
+  }
+  obj->rest_of = RestParam::Decode(dec);
+  return obj;
+}
+
+ParamGroup* ParamGroup::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 89) {
+    return ParamGroup::DecodeNew(dec);
+  }
+  return static_cast<ParamGroup*>(dec->Ref(h));
+}
+BigStr* proc_sig_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case proc_sig_e::Open:
+    v = "Open"; break;
+  case proc_sig_e::Closed:
+    v = "Closed"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "proc_sig.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+proc_sig__Open* proc_sig::Open = &gproc_sig__Open.obj;
+
+GcGlobal<proc_sig__Open> gproc_sig__Open = 
+  { ObjHeader::Global(proc_sig_e::Open) };
+
+hnode_t* proc_sig__Open::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(proc_sig_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* proc_sig__Closed::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(proc_sig_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->word) {  // Optional
+    hnode_t* x0 = this->word->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("word"), x0));
+  }
+
+  if (this->positional) {  // Optional
+    hnode_t* x1 = this->positional->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("positional"), x1));
+  }
+
+  if (this->named) {  // Optional
+    hnode_t* x2 = this->named->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("named"), x2));
+  }
+
+  if (this->block_param) {  // Optional
+    hnode_t* x3 = this->block_param->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("block_param"), x3));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* proc_sig_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case proc_sig_e::Open: {
+    proc_sig__Open* obj = static_cast<proc_sig__Open*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case proc_sig_e::Closed: {
+    proc_sig__Closed* obj = static_cast<proc_sig__Closed*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void proc_sig__Open::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, proc_sig_e::Open)) {
+    return;
+  }
+}
+
+void proc_sig__Closed::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, proc_sig_e::Closed)) {
+    return;
+  }
+  enc->Obj(this->word);
+  enc->Obj(this->positional);
+  enc->Obj(this->named);
+  enc->Obj(this->block_param);
+}
+
+proc_sig__Closed* proc_sig__Closed::DecodeNew(pyserial::Decoder* dec) {
+  proc_sig__Closed* obj = proc_sig__Closed::CreateNull();
+  dec->Add(obj);
+  obj->word = ParamGroup::Decode(dec);
+  obj->positional = ParamGroup::Decode(dec);
+  obj->named = ParamGroup::Decode(dec);
+  obj->block_param = Param::Decode(dec);
+  return obj;
+}
+
+void proc_sig_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case proc_sig_e::Open: {
+    static_cast<proc_sig__Open*>(this)->Encode(enc);
+    return;
+  }
+  case proc_sig_e::Closed: {
+    static_cast<proc_sig__Closed*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+proc_sig_t* proc_sig_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case proc_sig_e::Open:
+    dec->Add(proc_sig::Open);
+    return proc_sig::Open;
+  case proc_sig_e::Closed:
+    return proc_sig__Closed::DecodeNew(dec);
+  }
+  return static_cast<proc_sig_t*>(dec->Ref(h));
+}
+
+hnode_t* Proc::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("Proc"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->keyword->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("keyword"), x0));
+
+  hnode_t* x1 = this->name->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("name"), x1));
+
+  hnode_t* x2 = this->sig->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("sig"), x2));
+
+  hnode_t* x3 = this->body->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("body"), x3));
+
+  return out_node;
+}
+
+
+void Proc::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 90)) {
+    return;
+  }
+  enc->Obj(this->keyword);
+  enc->Obj(this->name);
+  enc->Obj(this->sig);
+  enc->Obj(this->body);
+}
+
+Proc* Proc::DecodeNew(pyserial::Decoder* dec) {
+  Proc* obj = Proc::CreateNull();
+  dec->Add(obj);
+  obj->keyword = Token::Decode(dec);
+  obj->name = Token::Decode(dec);
+  obj->sig = proc_sig_t::Decode(dec);
+  obj->body = command_t::Decode(dec);
+  return obj;
+}
+
+Proc* Proc::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 90) {
+    return Proc::DecodeNew(dec);
+  }
+  return static_cast<Proc*>(dec->Ref(h));
+}
+
+hnode_t* Func::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("Func"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->keyword->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("keyword"), x0));
+
+  hnode_t* x1 = this->name->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("name"), x1));
+
+  if (this->positional) {  // Optional
+    hnode_t* x2 = this->positional->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("positional"), x2));
+  }
+
+  if (this->named) {  // Optional
+    hnode_t* x3 = this->named->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("named"), x3));
+  }
+
+  hnode_t* x4 = this->body->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("body"), x4));
+
+  return out_node;
+}
+
+
+void Func::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 91)) {
+    return;
+  }
+  enc->Obj(this->keyword);
+  enc->Obj(this->name);
+  enc->Obj(this->positional);
+  enc->Obj(this->named);
+  enc->Obj(this->body);
+}
+
+Func* Func::DecodeNew(pyserial::Decoder* dec) {
+  Func* obj = Func::CreateNull();
+  dec->Add(obj);
+  obj->keyword = Token::Decode(dec);
+  obj->name = Token::Decode(dec);
+  obj->positional = ParamGroup::Decode(dec);
+  obj->named = ParamGroup::Decode(dec);
+  obj->body = command_t::Decode(dec);
+  return obj;
+}
+
+Func* Func::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 91) {
+    return Func::DecodeNew(dec);
+  }
+  return static_cast<Func*>(dec->Ref(h));
+}
+
+hnode_t* ParsedAssignment::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("ParsedAssignment"));
+  List<Field*>* L = out_node->fields;
+
+  if (this->left) {  // Optional
+    hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("left"), x0));
+  }
+
+  if (this->close) {  // Optional
+    hnode_t* x1 = this->close->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("close"), x1));
+  }
+
+  hnode_t* x2 = ToPretty(this->part_offset);
+  L->append(Alloc<Field>(StrFromC("part_offset"), x2));
+
+  hnode_t* x3 = this->w->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("w"), x3));
+
+  return out_node;
+}
+
+
+void ParsedAssignment::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 92)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->close);
+  enc->Int(this->part_offset);
+  enc->Obj(this->w);
+}
+
+ParsedAssignment* ParsedAssignment::DecodeNew(pyserial::Decoder* dec) {
+  ParsedAssignment* obj = ParsedAssignment::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->close = Token::Decode(dec);
+  obj->part_offset = dec->Int();
+  obj->w = CompoundWord::Decode(dec);
+  return obj;
+}
+
+ParsedAssignment* ParsedAssignment::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 92) {
+    return ParsedAssignment::DecodeNew(dec);
+  }
+  return static_cast<ParsedAssignment*>(dec->Ref(h));
+}
+
+hnode_t* VarDecl::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("VarDecl"));
+  List<Field*>* L = out_node->fields;
+
+  if (this->keyword) {  // Optional
+    hnode_t* x0 = this->keyword->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("keyword"), x0));
+  }
+
+  if (this->lhs != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<NameType*> it(this->lhs); !it.Done(); it.Next()) {
+      NameType* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("lhs"), x1));
+  }
+
+  if (this->rhs) {  // Optional
+    hnode_t* x2 = this->rhs->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("rhs"), x2));
+  }
+
+  return out_node;
+}
+
+
+void VarDecl::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 93)) {
+    return;
+  }
+  enc->Obj(this->keyword);
+  if (this->lhs == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->lhs));
+    for (ListIter<NameType*> it0(this->lhs); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Obj(this->rhs);
+}
+
+VarDecl* VarDecl::DecodeNew(pyserial::Decoder* dec) {
+  VarDecl* obj = VarDecl::CreateNull();
+  dec->Add(obj);
+  obj->keyword = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<NameType*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      NameType* i0;
+      i0 = NameType::Decode(dec);
+      c0->append(i0);
+    }
+    obj->lhs = c0;
+  }
+  obj->rhs = expr_t::Decode(dec);
+  return obj;
+}
+
+VarDecl* VarDecl::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 93) {
+    return VarDecl::DecodeNew(dec);
+  }
+  return static_cast<VarDecl*>(dec->Ref(h));
+}
+
+hnode_t* Mutation::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("Mutation"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->keyword->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("keyword"), x0));
+
+  if (this->lhs != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<y_lhs_t*> it(this->lhs); !it.Done(); it.Next()) {
+      y_lhs_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("lhs"), x1));
+  }
+
+  hnode_t* x2 = this->op->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("op"), x2));
+
+  hnode_t* x3 = this->rhs->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("rhs"), x3));
+
+  return out_node;
+}
+
+
+void Mutation::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 94)) {
+    return;
+  }
+  enc->Obj(this->keyword);
+  if (this->lhs == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->lhs));
+    for (ListIter<y_lhs_t*> it0(this->lhs); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Obj(this->op);
+  enc->Obj(this->rhs);
+}
+
+Mutation* Mutation::DecodeNew(pyserial::Decoder* dec) {
+  Mutation* obj = Mutation::CreateNull();
+  dec->Add(obj);
+  obj->keyword = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<y_lhs_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      y_lhs_t* i0;
+      i0 = y_lhs_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->lhs = c0;
+  }
+  obj->op = Token::Decode(dec);
+  obj->rhs = expr_t::Decode(dec);
+  return obj;
+}
+
+Mutation* Mutation::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 94) {
+    return Mutation::DecodeNew(dec);
+  }
+  return static_cast<Mutation*>(dec->Ref(h));
+}
+
+hnode_t* ExprCommand::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("ExprCommand"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->keyword->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("keyword"), x0));
+
+  hnode_t* x1 = this->e->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("e"), x1));
+
+  return out_node;
+}
+
+
+void ExprCommand::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 95)) {
+    return;
+  }
+  enc->Obj(this->keyword);
+  enc->Obj(this->e);
+}
+
+ExprCommand* ExprCommand::DecodeNew(pyserial::Decoder* dec) {
+  ExprCommand* obj = ExprCommand::CreateNull();
+  dec->Add(obj);
+  obj->keyword = Token::Decode(dec);
+  obj->e = expr_t::Decode(dec);
+  return obj;
+}
+
+ExprCommand* ExprCommand::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 95) {
+    return ExprCommand::DecodeNew(dec);
+  }
+  return static_cast<ExprCommand*>(dec->Ref(h));
+}
+
+hnode_t* ShFunction::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("ShFunction"));
+  List<Field*>* L = out_node->fields;
+
+  if (this->keyword) {  // Optional
+    hnode_t* x0 = this->keyword->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("keyword"), x0));
+  }
+
+  hnode_t* x1 = this->name_tok->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("name_tok"), x1));
+
+  hnode_t* x2 = ToPretty(this->name);
+  L->append(Alloc<Field>(StrFromC("name"), x2));
+
+  hnode_t* x3 = this->body->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("body"), x3));
+
+  if (this->code_str) {  // Optional
+    hnode_t* x4 = ToPretty(this->code_str);
+    L->append(Alloc<Field>(StrFromC("code_str"), x4));
+  }
+
+  return out_node;
+}
+
+
+void ShFunction::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 96)) {
+    return;
+  }
+  enc->Obj(this->keyword);
+  enc->Obj(this->name_tok);
+  enc->Str(this->name);
+  enc->Obj(this->body);
+  enc->Str(this->code_str);
+}
+
+ShFunction* ShFunction::DecodeNew(pyserial::Decoder* dec) {
+  ShFunction* obj = ShFunction::CreateNull();
+  dec->Add(obj);
+  obj->keyword = Token::Decode(dec);
+  obj->name_tok = Token::Decode(dec);
+  obj->name = dec->Str();
+  obj->body = command_t::Decode(dec);
+  obj->code_str = dec->Str();
+  return obj;
+}
+
+ShFunction* ShFunction::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 96) {
+    return ShFunction::DecodeNew(dec);
+  }
+  return static_cast<ShFunction*>(dec->Ref(h));
+}
+
+hnode_t* LiteralBlock::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("LiteralBlock"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->brace_group->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("brace_group"), x0));
+
+  if (this->code_str) {  // Optional
+    hnode_t* x1 = ToPretty(this->code_str);
+    L->append(Alloc<Field>(StrFromC("code_str"), x1));
+  }
+
+  return out_node;
+}
+
+
+void LiteralBlock::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 97)) {
+    return;
+  }
+  enc->Obj(this->brace_group);
+  enc->Str(this->code_str);
+}
+
+LiteralBlock* LiteralBlock::DecodeNew(pyserial::Decoder* dec) {
+  LiteralBlock* obj = LiteralBlock::CreateNull();
+  dec->Add(obj);
+  obj->brace_group = BraceGroup::Decode(dec);
+  obj->code_str = dec->Str();
+  return obj;
+}
+
+LiteralBlock* LiteralBlock::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 97) {
+    return LiteralBlock::DecodeNew(dec);
+  }
+  return static_cast<LiteralBlock*>(dec->Ref(h));
+}
+BigStr* cmd_frag_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case cmd_frag_e::LiteralBlock:
+    v = "LiteralBlock"; break;
+  case cmd_frag_e::Expr:
+    v = "Expr"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "cmd_frag.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* cmd_frag__Expr::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(cmd_frag_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->c->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("c"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* cmd_frag_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case cmd_frag_e::LiteralBlock: {
+    LiteralBlock* obj = static_cast<LiteralBlock*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case cmd_frag_e::Expr: {
+    cmd_frag__Expr* obj = static_cast<cmd_frag__Expr*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void cmd_frag__Expr::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, cmd_frag_e::Expr)) {
+    return;
+  }
+  enc->Obj(this->c);
+}
+
+cmd_frag__Expr* cmd_frag__Expr::DecodeNew(pyserial::Decoder* dec) {
+  cmd_frag__Expr* obj = cmd_frag__Expr::CreateNull();
+  dec->Add(obj);
+  obj->c = command_t::Decode(dec);
+  return obj;
+}
+
+void cmd_frag_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case cmd_frag_e::LiteralBlock: {
+    static_cast<LiteralBlock*>(this)->Encode(enc);
+    return;
+  }
+  case cmd_frag_e::Expr: {
+    static_cast<cmd_frag__Expr*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+cmd_frag_t* cmd_frag_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case cmd_frag_e::LiteralBlock:
+    return LiteralBlock::DecodeNew(dec);
+  case cmd_frag_e::Expr:
+    return cmd_frag__Expr::DecodeNew(dec);
+  }
+  return static_cast<cmd_frag_t*>(dec->Ref(h));
+}
+BigStr* command_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case command_e::NoOp:
+    v = "NoOp"; break;
+  case command_e::Redirect:
+    v = "Redirect"; break;
+  case command_e::Simple:
+    v = "Simple"; break;
+  case command_e::ExpandedAlias:
+    v = "ExpandedAlias"; break;
+  case command_e::Sentence:
+    v = "Sentence"; break;
+  case command_e::ShAssignment:
+    v = "ShAssignment"; break;
+  case command_e::ControlFlow:
+    v = "ControlFlow"; break;
+  case command_e::Pipeline:
+    v = "Pipeline"; break;
+  case command_e::AndOr:
+    v = "AndOr"; break;
+  case command_e::DoGroup:
+    v = "DoGroup"; break;
+  case command_e::BraceGroup:
+    v = "BraceGroup"; break;
+  case command_e::Subshell:
+    v = "Subshell"; break;
+  case command_e::DParen:
+    v = "DParen"; break;
+  case command_e::DBracket:
+    v = "DBracket"; break;
+  case command_e::ForEach:
+    v = "ForEach"; break;
+  case command_e::ForExpr:
+    v = "ForExpr"; break;
+  case command_e::WhileUntil:
+    v = "WhileUntil"; break;
+  case command_e::If:
+    v = "If"; break;
+  case command_e::Case:
+    v = "Case"; break;
+  case command_e::ShFunction:
+    v = "ShFunction"; break;
+  case command_e::TimeBlock:
+    v = "TimeBlock"; break;
+  case command_e::CommandList:
+    v = "CommandList"; break;
+  case command_e::VarDecl:
+    v = "VarDecl"; break;
+  case command_e::BareDecl:
+    v = "BareDecl"; break;
+  case command_e::Mutation:
+    v = "Mutation"; break;
+  case command_e::Expr:
+    v = "Expr"; break;
+  case command_e::Proc:
+    v = "Proc"; break;
+  case command_e::Func:
+    v = "Func"; break;
+  case command_e::Retval:
+    v = "Retval"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "command.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+command__NoOp* command::NoOp = &gcommand__NoOp.obj;
+
+GcGlobal<command__NoOp> gcommand__NoOp = 
+  { ObjHeader::Global(command_e::NoOp) };
+
+hnode_t* command__NoOp::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* command__Redirect::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->child->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("child"), x0));
+
+  if (this->redirects != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<Redir*> it(this->redirects); !it.Done(); it.Next()) {
+      Redir* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("redirects"), x1));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* command__Simple::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  if (do_abbrev) {
+    auto* p = syntax_abbrev::_command__Simple(this);
+    if (p) {
+      return p;
+    }
+  }
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->blame_tok) {  // Optional
+    hnode_t* x0 = this->blame_tok->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("blame_tok"), x0));
+  }
+
+  if (this->more_env != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<EnvPair*> it(this->more_env); !it.Done(); it.Next()) {
+      EnvPair* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("more_env"), x1));
+  }
+
+  if (this->words != nullptr) {  // List
+    hnode::Array* x2 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<word_t*> it(this->words); !it.Done(); it.Next()) {
+      word_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x2->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("words"), x2));
+  }
+
+  if (this->typed_args) {  // Optional
+    hnode_t* x3 = this->typed_args->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("typed_args"), x3));
+  }
+
+  if (this->block) {  // Optional
+    hnode_t* x4 = this->block->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("block"), x4));
+  }
+
+  hnode_t* x5 = ToPretty(this->is_last_cmd);
+  L->append(Alloc<Field>(StrFromC("is_last_cmd"), x5));
+
+  if (this->redirects != nullptr) {  // List
+    hnode::Array* x6 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<Redir*> it(this->redirects); !it.Done(); it.Next()) {
+      Redir* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x6->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("redirects"), x6));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* command__ExpandedAlias::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                            seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->child->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("child"), x0));
+
+  if (this->more_env != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<EnvPair*> it(this->more_env); !it.Done(); it.Next()) {
+      EnvPair* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("more_env"), x1));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* command__Sentence::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->child->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("child"), x0));
+
+  hnode_t* x1 = this->terminator->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("terminator"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* command__ShAssignment::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                           seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  if (this->pairs != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<AssignPair*> it(this->pairs); !it.Done(); it.Next()) {
+      AssignPair* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("pairs"), x1));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* command__ControlFlow::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                          seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->keyword->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("keyword"), x0));
+
+  if (this->arg_word) {  // Optional
+    hnode_t* x1 = this->arg_word->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("arg_word"), x1));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* command__Pipeline::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->negated) {  // Optional
+    hnode_t* x0 = this->negated->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("negated"), x0));
+  }
+
+  if (this->children != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<command_t*> it(this->children); !it.Done(); it.Next()) {
+      command_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("children"), x1));
+  }
+
+  if (this->ops != nullptr) {  // List
+    hnode::Array* x2 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<Token*> it(this->ops); !it.Done(); it.Next()) {
+      Token* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x2->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("ops"), x2));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* command__AndOr::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->children != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<command_t*> it(this->children); !it.Done(); it.Next()) {
+      command_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("children"), x0));
+  }
+
+  if (this->ops != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<Token*> it(this->ops); !it.Done(); it.Next()) {
+      Token* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("ops"), x1));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* command__DoGroup::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  if (this->children != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<command_t*> it(this->children); !it.Done(); it.Next()) {
+      command_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("children"), x1));
+  }
+
+  hnode_t* x2 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* command__Subshell::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = this->child->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("child"), x1));
+
+  hnode_t* x2 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x2));
+
+  hnode_t* x3 = ToPretty(this->is_last_cmd);
+  L->append(Alloc<Field>(StrFromC("is_last_cmd"), x3));
+
+  return out_node;
+}
+
+
+hnode_t* command__DParen::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = this->child->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("child"), x1));
+
+  hnode_t* x2 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* command__DBracket::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = this->expr->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("expr"), x1));
+
+  hnode_t* x2 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* command__ForEach::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->keyword->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("keyword"), x0));
+
+  if (this->iter_names != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<BigStr*> it(this->iter_names); !it.Done(); it.Next()) {
+      BigStr* v_ = it.Value();
+      hnode_t* h = ToPretty(v_);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("iter_names"), x1));
+  }
+
+  hnode_t* x2 = this->iterable->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("iterable"), x2));
+
+  if (this->semi_tok) {  // Optional
+    hnode_t* x3 = this->semi_tok->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("semi_tok"), x3));
+  }
+
+  hnode_t* x4 = this->body->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("body"), x4));
+
+  return out_node;
+}
+
+
+hnode_t* command__ForExpr::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->keyword->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("keyword"), x0));
+
+  if (this->init) {  // Optional
+    hnode_t* x1 = this->init->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("init"), x1));
+  }
+
+  if (this->cond) {  // Optional
+    hnode_t* x2 = this->cond->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("cond"), x2));
+  }
+
+  if (this->update) {  // Optional
+    hnode_t* x3 = this->update->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("update"), x3));
+  }
+
+  if (this->body) {  // Optional
+    hnode_t* x4 = this->body->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("body"), x4));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* command__WhileUntil::PrettyTree(bool do_abbrev, Dict<int, bool>* seen)
+                                         {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->keyword->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("keyword"), x0));
+
+  hnode_t* x1 = this->cond->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("cond"), x1));
+
+  hnode_t* x2 = this->body->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("body"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* command__If::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->if_kw->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("if_kw"), x0));
+
+  if (this->arms != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<IfArm*> it(this->arms); !it.Done(); it.Next()) {
+      IfArm* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("arms"), x1));
+  }
+
+  if (this->else_kw) {  // Optional
+    hnode_t* x2 = this->else_kw->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("else_kw"), x2));
+  }
+
+  if (this->else_action != nullptr) {  // List
+    hnode::Array* x3 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<command_t*> it(this->else_action); !it.Done(); it.Next()) {
+      command_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x3->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("else_action"), x3));
+  }
+
+  if (this->fi_kw) {  // Optional
+    hnode_t* x4 = this->fi_kw->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("fi_kw"), x4));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* command__Case::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->case_kw->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("case_kw"), x0));
+
+  hnode_t* x1 = this->to_match->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("to_match"), x1));
+
+  hnode_t* x2 = this->arms_start->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("arms_start"), x2));
+
+  if (this->arms != nullptr) {  // List
+    hnode::Array* x3 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<CaseArm*> it(this->arms); !it.Done(); it.Next()) {
+      CaseArm* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x3->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("arms"), x3));
+  }
+
+  hnode_t* x4 = this->arms_end->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("arms_end"), x4));
+
+  return out_node;
+}
+
+
+hnode_t* command__TimeBlock::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->keyword->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("keyword"), x0));
+
+  hnode_t* x1 = this->pipeline->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("pipeline"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* command__CommandList::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                          seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->children != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<command_t*> it(this->children); !it.Done(); it.Next()) {
+      command_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("children"), x0));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* command__BareDecl::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->lhs->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("lhs"), x0));
+
+  hnode_t* x1 = this->rhs->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("rhs"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* command__Retval::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(command_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->keyword->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("keyword"), x0));
+
+  hnode_t* x1 = this->val->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("val"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* command_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case command_e::NoOp: {
+    command__NoOp* obj = static_cast<command__NoOp*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::Redirect: {
+    command__Redirect* obj = static_cast<command__Redirect*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::Simple: {
+    command__Simple* obj = static_cast<command__Simple*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::ExpandedAlias: {
+    command__ExpandedAlias* obj = static_cast<command__ExpandedAlias*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::Sentence: {
+    command__Sentence* obj = static_cast<command__Sentence*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::ShAssignment: {
+    command__ShAssignment* obj = static_cast<command__ShAssignment*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::ControlFlow: {
+    command__ControlFlow* obj = static_cast<command__ControlFlow*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::Pipeline: {
+    command__Pipeline* obj = static_cast<command__Pipeline*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::AndOr: {
+    command__AndOr* obj = static_cast<command__AndOr*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::DoGroup: {
+    command__DoGroup* obj = static_cast<command__DoGroup*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::BraceGroup: {
+    BraceGroup* obj = static_cast<BraceGroup*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::Subshell: {
+    command__Subshell* obj = static_cast<command__Subshell*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::DParen: {
+    command__DParen* obj = static_cast<command__DParen*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::DBracket: {
+    command__DBracket* obj = static_cast<command__DBracket*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::ForEach: {
+    command__ForEach* obj = static_cast<command__ForEach*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::ForExpr: {
+    command__ForExpr* obj = static_cast<command__ForExpr*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::WhileUntil: {
+    command__WhileUntil* obj = static_cast<command__WhileUntil*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::If: {
+    command__If* obj = static_cast<command__If*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::Case: {
+    command__Case* obj = static_cast<command__Case*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::ShFunction: {
+    ShFunction* obj = static_cast<ShFunction*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::TimeBlock: {
+    command__TimeBlock* obj = static_cast<command__TimeBlock*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::CommandList: {
+    command__CommandList* obj = static_cast<command__CommandList*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::VarDecl: {
+    VarDecl* obj = static_cast<VarDecl*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::BareDecl: {
+    command__BareDecl* obj = static_cast<command__BareDecl*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::Mutation: {
+    Mutation* obj = static_cast<Mutation*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::Expr: {
+    ExprCommand* obj = static_cast<ExprCommand*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::Proc: {
+    Proc* obj = static_cast<Proc*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::Func: {
+    Func* obj = static_cast<Func*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case command_e::Retval: {
+    command__Retval* obj = static_cast<command__Retval*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void command__NoOp::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::NoOp)) {
+    return;
+  }
+}
+
+void command__Redirect::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::Redirect)) {
+    return;
+  }
+  enc->Obj(this->child);
+  if (this->redirects == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->redirects));
+    for (ListIter<Redir*> it0(this->redirects); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+command__Redirect* command__Redirect::DecodeNew(pyserial::Decoder* dec) {
+  command__Redirect* obj = command__Redirect::CreateNull();
+  dec->Add(obj);
+  obj->child = command_t::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<Redir*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      Redir* i0;
+      i0 = Redir::Decode(dec);
+      c0->append(i0);
+    }
+    obj->redirects = c0;
+  }
+  return obj;
+}
+
+void command__Simple::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::Simple)) {
+    return;
+  }
+  enc->Obj(this->blame_tok);
+  if (this->more_env == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->more_env));
+    for (ListIter<EnvPair*> it0(this->more_env); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  if (this->words == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->words));
+    for (ListIter<word_t*> it1(this->words); !it1.Done(); it1.Next()) {
+      enc->Obj(it1.Value());
+    }
+  }
+  enc->Obj(this->typed_args);
+  enc->Obj(this->block);
+  enc->Bool(this->is_last_cmd);
+  if (this->redirects == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->redirects));
+    for (ListIter<Redir*> it2(this->redirects); !it2.Done(); it2.Next()) {
+      enc->Obj(it2.Value());
+    }
+  }
+}
+
+command__Simple* command__Simple::DecodeNew(pyserial::Decoder* dec) {
+  command__Simple* obj = command__Simple::CreateNull();
+  dec->Add(obj);
+  obj->blame_tok = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<EnvPair*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      EnvPair* i0;
+      i0 = EnvPair::Decode(dec);
+      c0->append(i0);
+    }
+    obj->more_env = c0;
+  }
+  int n1 = dec->Size();
+  if (n1 != -1) {
+    auto* c1 = Alloc<List<word_t*>>();
+    for (int j1 = 0; j1 < n1; ++j1) {
+      word_t* i1;
+      i1 = word_t::Decode(dec);
+      c1->append(i1);
+    }
+    obj->words = c1;
+  }
+  obj->typed_args = ArgList::Decode(dec);
+  obj->block = LiteralBlock::Decode(dec);
+  obj->is_last_cmd = dec->Bool();
+  int n2 = dec->Size();
+  if (n2 != -1) {
+    auto* c2 = Alloc<List<Redir*>>();
+    for (int j2 = 0; j2 < n2; ++j2) {
+      Redir* i2;
+      i2 = Redir::Decode(dec);
+      c2->append(i2);
+    }
+    obj->redirects = c2;
+  }
+  return obj;
+}
+
+void command__ExpandedAlias::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::ExpandedAlias)) {
+    return;
+  }
+  enc->Obj(this->child);
+  if (this->more_env == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->more_env));
+    for (ListIter<EnvPair*> it0(this->more_env); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+command__ExpandedAlias* command__ExpandedAlias::DecodeNew(pyserial::Decoder*
+                                                          dec) {
+  command__ExpandedAlias* obj = command__ExpandedAlias::CreateNull();
+  dec->Add(obj);
+  obj->child = command_t::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<EnvPair*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      EnvPair* i0;
+      i0 = EnvPair::Decode(dec);
+      c0->append(i0);
+    }
+    obj->more_env = c0;
+  }
+  return obj;
+}
+
+void command__Sentence::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::Sentence)) {
+    return;
+  }
+  enc->Obj(this->child);
+  enc->Obj(this->terminator);
+}
+
+command__Sentence* command__Sentence::DecodeNew(pyserial::Decoder* dec) {
+  command__Sentence* obj = command__Sentence::CreateNull();
+  dec->Add(obj);
+  obj->child = command_t::Decode(dec);
+  obj->terminator = Token::Decode(dec);
+  return obj;
+}
+
+void command__ShAssignment::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::ShAssignment)) {
+    return;
+  }
+  enc->Obj(this->left);
+  if (this->pairs == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->pairs));
+    for (ListIter<AssignPair*> it0(this->pairs); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+command__ShAssignment* command__ShAssignment::DecodeNew(pyserial::Decoder* dec)
+                                                        {
+  command__ShAssignment* obj = command__ShAssignment::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<AssignPair*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      AssignPair* i0;
+      i0 = AssignPair::Decode(dec);
+      c0->append(i0);
+    }
+    obj->pairs = c0;
+  }
+  return obj;
+}
+
+void command__ControlFlow::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::ControlFlow)) {
+    return;
+  }
+  enc->Obj(this->keyword);
+  enc->Obj(this->arg_word);
+}
+
+command__ControlFlow* command__ControlFlow::DecodeNew(pyserial::Decoder* dec) {
+  command__ControlFlow* obj = command__ControlFlow::CreateNull();
+  dec->Add(obj);
+  obj->keyword = Token::Decode(dec);
+  obj->arg_word = CompoundWord::Decode(dec);
+  return obj;
+}
+
+void command__Pipeline::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::Pipeline)) {
+    return;
+  }
+  enc->Obj(this->negated);
+  if (this->children == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->children));
+    for (ListIter<command_t*> it0(this->children); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  if (this->ops == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->ops));
+    for (ListIter<Token*> it1(this->ops); !it1.Done(); it1.Next()) {
+      enc->Obj(it1.Value());
+    }
+  }
+}
+
+command__Pipeline* command__Pipeline::DecodeNew(pyserial::Decoder* dec) {
+  command__Pipeline* obj = command__Pipeline::CreateNull();
+  dec->Add(obj);
+  obj->negated = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<command_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      command_t* i0;
+      i0 = command_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->children = c0;
+  }
+  int n1 = dec->Size();
+  if (n1 != -1) {
+    auto* c1 = Alloc<List<Token*>>();
+    for (int j1 = 0; j1 < n1; ++j1) {
+      Token* i1;
+      i1 = Token::Decode(dec);
+      c1->append(i1);
+    }
+    obj->ops = c1;
+  }
+  return obj;
+}
+
+void command__AndOr::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::AndOr)) {
+    return;
+  }
+  if (this->children == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->children));
+    for (ListIter<command_t*> it0(this->children); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  if (this->ops == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->ops));
+    for (ListIter<Token*> it1(this->ops); !it1.Done(); it1.Next()) {
+      enc->Obj(it1.Value());
+    }
+  }
+}
+
+command__AndOr* command__AndOr::DecodeNew(pyserial::Decoder* dec) {
+  command__AndOr* obj = command__AndOr::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<command_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      command_t* i0;
+      i0 = command_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->children = c0;
+  }
+  int n1 = dec->Size();
+  if (n1 != -1) {
+    auto* c1 = Alloc<List<Token*>>();
+    for (int j1 = 0; j1 < n1; ++j1) {
+      Token* i1;
+      i1 = Token::Decode(dec);
+      c1->append(i1);
+    }
+    obj->ops = c1;
+  }
+  return obj;
+}
+
+void command__DoGroup::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::DoGroup)) {
+    return;
+  }
+  enc->Obj(this->left);
+  if (this->children == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->children));
+    for (ListIter<command_t*> it0(this->children); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Obj(this->right);
+}
+
+command__DoGroup* command__DoGroup::DecodeNew(pyserial::Decoder* dec) {
+  command__DoGroup* obj = command__DoGroup::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<command_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      command_t* i0;
+      i0 = command_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->children = c0;
+  }
+  obj->right = Token::Decode(dec);
+  return obj;
+}
+
+void command__Subshell::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::Subshell)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->child);
+  enc->Obj(this->right);
+  enc->Bool(this->is_last_cmd);
+}
+
+command__Subshell* command__Subshell::DecodeNew(pyserial::Decoder* dec) {
+  command__Subshell* obj = command__Subshell::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->child = command_t::Decode(dec);
+  obj->right = Token::Decode(dec);
+  obj->is_last_cmd = dec->Bool();
+  return obj;
+}
+
+void command__DParen::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::DParen)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->child);
+  enc->Obj(this->right);
+}
+
+command__DParen* command__DParen::DecodeNew(pyserial::Decoder* dec) {
+  command__DParen* obj = command__DParen::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->child = arith_expr_t::Decode(dec);
+  obj->right = Token::Decode(dec);
+  return obj;
+}
+
+void command__DBracket::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::DBracket)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->expr);
+  enc->Obj(this->right);
+}
+
+command__DBracket* command__DBracket::DecodeNew(pyserial::Decoder* dec) {
+  command__DBracket* obj = command__DBracket::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->expr = bool_expr_t::Decode(dec);
+  obj->right = Token::Decode(dec);
+  return obj;
+}
+
+void command__ForEach::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::ForEach)) {
+    return;
+  }
+  enc->Obj(this->keyword);
+  if (this->iter_names == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->iter_names));
+    for (ListIter<BigStr*> it0(this->iter_names); !it0.Done(); it0.Next()) {
+      enc->Str(it0.Value());
+    }
+  }
+  enc->Obj(this->iterable);
+  enc->Obj(this->semi_tok);
+  enc->Obj(this->body);
+}
+
+command__ForEach* command__ForEach::DecodeNew(pyserial::Decoder* dec) {
+  command__ForEach* obj = command__ForEach::CreateNull();
+  dec->Add(obj);
+  obj->keyword = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<BigStr*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      BigStr* i0;
+      i0 = dec->Str();
+      c0->append(i0);
+    }
+    obj->iter_names = c0;
+  }
+  obj->iterable = for_iter_t::Decode(dec);
+  obj->semi_tok = Token::Decode(dec);
+  obj->body = command_t::Decode(dec);
+  return obj;
+}
+
+void command__ForExpr::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::ForExpr)) {
+    return;
+  }
+  enc->Obj(this->keyword);
+  enc->Obj(this->init);
+  enc->Obj(this->cond);
+  enc->Obj(this->update);
+  enc->Obj(this->body);
+}
+
+command__ForExpr* command__ForExpr::DecodeNew(pyserial::Decoder* dec) {
+  command__ForExpr* obj = command__ForExpr::CreateNull();
+  dec->Add(obj);
+  obj->keyword = Token::Decode(dec);
+  obj->init = arith_expr_t::Decode(dec);
+  obj->cond = arith_expr_t::Decode(dec);
+  obj->update = arith_expr_t::Decode(dec);
+  obj->body = command_t::Decode(dec);
+  return obj;
+}
+
+void command__WhileUntil::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::WhileUntil)) {
+    return;
+  }
+  enc->Obj(this->keyword);
+  enc->Obj(this->cond);
+  enc->Obj(this->body);
+}
+
+command__WhileUntil* command__WhileUntil::DecodeNew(pyserial::Decoder* dec) {
+  command__WhileUntil* obj = command__WhileUntil::CreateNull();
+  dec->Add(obj);
+  obj->keyword = Token::Decode(dec);
+  obj->cond = condition_t::Decode(dec);
+  obj->body = command_t::Decode(dec);
+  return obj;
+}
+
+void command__If::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::If)) {
+    return;
+  }
+  enc->Obj(this->if_kw);
+  if (this->arms == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->arms));
+    for (ListIter<IfArm*> it0(this->arms); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Obj(this->else_kw);
+  if (this->else_action == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->else_action));
+    for (ListIter<command_t*> it1(this->else_action); !it1.Done(); it1.Next()) {
+      enc->Obj(it1.Value());
+    }
+  }
+  enc->Obj(this->fi_kw);
+}
+
+command__If* command__If::DecodeNew(pyserial::Decoder* dec) {
+  command__If* obj = command__If::CreateNull();
+  dec->Add(obj);
+  obj->if_kw = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<IfArm*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      IfArm* i0;
+      i0 = IfArm::Decode(dec);
+      c0->append(i0);
+    }
+    obj->arms = c0;
+  }
+  obj->else_kw = Token::Decode(dec);
+  int n1 = dec->Size();
+  if (n1 != -1) {
+    auto* c1 = Alloc<List<command_t*>>();
+    for (int j1 = 0; j1 < n1; ++j1) {
+      command_t* i1;
+      i1 = command_t::Decode(dec);
+      c1->append(i1);
+    }
+    obj->else_action = c1;
+  }
+  obj->fi_kw = Token::Decode(dec);
+  return obj;
+}
+
+void command__Case::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::Case)) {
+    return;
+  }
+  enc->Obj(this->case_kw);
+  enc->Obj(this->to_match);
+  enc->Obj(this->arms_start);
+  if (this->arms == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->arms));
+    for (ListIter<CaseArm*> it0(this->arms); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Obj(this->arms_end);
+}
+
+command__Case* command__Case::DecodeNew(pyserial::Decoder* dec) {
+  command__Case* obj = command__Case::CreateNull();
+  dec->Add(obj);
+  obj->case_kw = Token::Decode(dec);
+  obj->to_match = case_arg_t::Decode(dec);
+  obj->arms_start = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<CaseArm*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      CaseArm* i0;
+      i0 = CaseArm::Decode(dec);
+      c0->append(i0);
+    }
+    obj->arms = c0;
+  }
+  obj->arms_end = Token::Decode(dec);
+  return obj;
+}
+
+void command__TimeBlock::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::TimeBlock)) {
+    return;
+  }
+  enc->Obj(this->keyword);
+  enc->Obj(this->pipeline);
+}
+
+command__TimeBlock* command__TimeBlock::DecodeNew(pyserial::Decoder* dec) {
+  command__TimeBlock* obj = command__TimeBlock::CreateNull();
+  dec->Add(obj);
+  obj->keyword = Token::Decode(dec);
+  obj->pipeline = command_t::Decode(dec);
+  return obj;
+}
+
+void command__CommandList::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::CommandList)) {
+    return;
+  }
+  if (this->children == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->children));
+    for (ListIter<command_t*> it0(this->children); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+command__CommandList* command__CommandList::DecodeNew(pyserial::Decoder* dec) {
+  command__CommandList* obj = command__CommandList::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<command_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      command_t* i0;
+      i0 = command_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->children = c0;
+  }
+  return obj;
+}
+
+void command__BareDecl::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::BareDecl)) {
+    return;
+  }
+  enc->Obj(this->lhs);
+  enc->Obj(this->rhs);
+}
+
+command__BareDecl* command__BareDecl::DecodeNew(pyserial::Decoder* dec) {
+  command__BareDecl* obj = command__BareDecl::CreateNull();
+  dec->Add(obj);
+  obj->lhs = Token::Decode(dec);
+  obj->rhs = expr_t::Decode(dec);
+  return obj;
+}
+
+void command__Retval::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, command_e::Retval)) {
+    return;
+  }
+  enc->Obj(this->keyword);
+  enc->Obj(this->val);
+}
+
+command__Retval* command__Retval::DecodeNew(pyserial::Decoder* dec) {
+  command__Retval* obj = command__Retval::CreateNull();
+  dec->Add(obj);
+  obj->keyword = Token::Decode(dec);
+  obj->val = expr_t::Decode(dec);
+  return obj;
+}
+
+void command_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case command_e::NoOp: {
+    static_cast<command__NoOp*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::Redirect: {
+    static_cast<command__Redirect*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::Simple: {
+    static_cast<command__Simple*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::ExpandedAlias: {
+    static_cast<command__ExpandedAlias*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::Sentence: {
+    static_cast<command__Sentence*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::ShAssignment: {
+    static_cast<command__ShAssignment*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::ControlFlow: {
+    static_cast<command__ControlFlow*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::Pipeline: {
+    static_cast<command__Pipeline*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::AndOr: {
+    static_cast<command__AndOr*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::DoGroup: {
+    static_cast<command__DoGroup*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::BraceGroup: {
+    static_cast<BraceGroup*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::Subshell: {
+    static_cast<command__Subshell*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::DParen: {
+    static_cast<command__DParen*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::DBracket: {
+    static_cast<command__DBracket*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::ForEach: {
+    static_cast<command__ForEach*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::ForExpr: {
+    static_cast<command__ForExpr*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::WhileUntil: {
+    static_cast<command__WhileUntil*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::If: {
+    static_cast<command__If*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::Case: {
+    static_cast<command__Case*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::ShFunction: {
+    static_cast<ShFunction*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::TimeBlock: {
+    static_cast<command__TimeBlock*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::CommandList: {
+    static_cast<command__CommandList*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::VarDecl: {
+    static_cast<VarDecl*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::BareDecl: {
+    static_cast<command__BareDecl*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::Mutation: {
+    static_cast<Mutation*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::Expr: {
+    static_cast<ExprCommand*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::Proc: {
+    static_cast<Proc*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::Func: {
+    static_cast<Func*>(this)->Encode(enc);
+    return;
+  }
+  case command_e::Retval: {
+    static_cast<command__Retval*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+command_t* command_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case command_e::NoOp:
+    dec->Add(command::NoOp);
+    return command::NoOp;
+  case command_e::Redirect:
+    return command__Redirect::DecodeNew(dec);
+  case command_e::Simple:
+    return command__Simple::DecodeNew(dec);
+  case command_e::ExpandedAlias:
+    return command__ExpandedAlias::DecodeNew(dec);
+  case command_e::Sentence:
+    return command__Sentence::DecodeNew(dec);
+  case command_e::ShAssignment:
+    return command__ShAssignment::DecodeNew(dec);
+  case command_e::ControlFlow:
+    return command__ControlFlow::DecodeNew(dec);
+  case command_e::Pipeline:
+    return command__Pipeline::DecodeNew(dec);
+  case command_e::AndOr:
+    return command__AndOr::DecodeNew(dec);
+  case command_e::DoGroup:
+    return command__DoGroup::DecodeNew(dec);
+  case command_e::BraceGroup:
+    return BraceGroup::DecodeNew(dec);
+  case command_e::Subshell:
+    return command__Subshell::DecodeNew(dec);
+  case command_e::DParen:
+    return command__DParen::DecodeNew(dec);
+  case command_e::DBracket:
+    return command__DBracket::DecodeNew(dec);
+  case command_e::ForEach:
+    return command__ForEach::DecodeNew(dec);
+  case command_e::ForExpr:
+    return command__ForExpr::DecodeNew(dec);
+  case command_e::WhileUntil:
+    return command__WhileUntil::DecodeNew(dec);
+  case command_e::If:
+    return command__If::DecodeNew(dec);
+  case command_e::Case:
+    return command__Case::DecodeNew(dec);
+  case command_e::ShFunction:
+    return ShFunction::DecodeNew(dec);
+  case command_e::TimeBlock:
+    return command__TimeBlock::DecodeNew(dec);
+  case command_e::CommandList:
+    return command__CommandList::DecodeNew(dec);
+  case command_e::VarDecl:
+    return VarDecl::DecodeNew(dec);
+  case command_e::BareDecl:
+    return command__BareDecl::DecodeNew(dec);
+  case command_e::Mutation:
+    return Mutation::DecodeNew(dec);
+  case command_e::Expr:
+    return ExprCommand::DecodeNew(dec);
+  case command_e::Proc:
+    return Proc::DecodeNew(dec);
+  case command_e::Func:
+    return Func::DecodeNew(dec);
+  case command_e::Retval:
+    return command__Retval::DecodeNew(dec);
+  }
+  return static_cast<command_t*>(dec->Ref(h));
+}
+BigStr* b_command_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case b_command_e::VarDecl:
+    v = "VarDecl"; break;
+  case b_command_e::Mutation:
+    v = "Mutation"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "b_command.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* b_command_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case b_command_e::VarDecl: {
+    VarDecl* obj = static_cast<VarDecl*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case b_command_e::Mutation: {
+    Mutation* obj = static_cast<Mutation*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void b_command_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case b_command_e::VarDecl: {
+    static_cast<VarDecl*>(this)->Encode(enc);
+    return;
+  }
+  case b_command_e::Mutation: {
+    static_cast<Mutation*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+b_command_t* b_command_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case b_command_e::VarDecl:
+    return VarDecl::DecodeNew(dec);
+  case b_command_e::Mutation:
+    return Mutation::DecodeNew(dec);
+  }
+  return static_cast<b_command_t*>(dec->Ref(h));
+}
+BigStr* glob_part_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case glob_part_e::Literal:
+    v = "Literal"; break;
+  case glob_part_e::Operator:
+    v = "Operator"; break;
+  case glob_part_e::CharClass:
+    v = "CharClass"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "glob_part.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* glob_part__Literal::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(glob_part_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = Alloc<hnode::Leaf>(Id_str(this->id, false), color_e::UserType);
+  L->append(Alloc<Field>(StrFromC("id"), x0));
+
+  hnode_t* x1 = ToPretty(this->s);
+  L->append(Alloc<Field>(StrFromC("s"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* glob_part__Operator::PrettyTree(bool do_abbrev, Dict<int, bool>* seen)
+                                         {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(glob_part_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = Alloc<hnode::Leaf>(Id_str(this->op_id, false),
+                                   color_e::UserType);
+  L->append(Alloc<Field>(StrFromC("op_id"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* glob_part__CharClass::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                          seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(glob_part_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->negated);
+  L->append(Alloc<Field>(StrFromC("negated"), x0));
+
+  if (this->strs != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<BigStr*> it(this->strs); !it.Done(); it.Next()) {
+      BigStr* v_ = it.Value();
+      hnode_t* h = ToPretty(v_);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("strs"), x1));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* glob_part_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case glob_part_e::Literal: {
+    glob_part__Literal* obj = static_cast<glob_part__Literal*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case glob_part_e::Operator: {
+    glob_part__Operator* obj = static_cast<glob_part__Operator*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case glob_part_e::CharClass: {
+    glob_part__CharClass* obj = static_cast<glob_part__CharClass*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void glob_part__Literal::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, glob_part_e::Literal)) {
+    return;
+  }
+  enc->Int(this->id);
+  enc->Str(this->s);
+}
+
+glob_part__Literal* glob_part__Literal::DecodeNew(pyserial::Decoder* dec) {
+  glob_part__Literal* obj = glob_part__Literal::CreateNull();
+  dec->Add(obj);
+  obj->id = dec->Int();
+  obj->s = dec->Str();
+  return obj;
+}
+
+void glob_part__Operator::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, glob_part_e::Operator)) {
+    return;
+  }
+  enc->Int(this->op_id);
+}
+
+glob_part__Operator* glob_part__Operator::DecodeNew(pyserial::Decoder* dec) {
+  glob_part__Operator* obj = glob_part__Operator::CreateNull();
+  dec->Add(obj);
+  obj->op_id = dec->Int();
+  return obj;
+}
+
+void glob_part__CharClass::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, glob_part_e::CharClass)) {
+    return;
+  }
+  enc->Bool(this->negated);
+  if (this->strs == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->strs));
+    for (ListIter<BigStr*> it0(this->strs); !it0.Done(); it0.Next()) {
+      enc->Str(it0.Value());
+    }
+  }
+}
+
+glob_part__CharClass* glob_part__CharClass::DecodeNew(pyserial::Decoder* dec) {
+  glob_part__CharClass* obj = glob_part__CharClass::CreateNull();
+  dec->Add(obj);
+  obj->negated = dec->Bool();
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<BigStr*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      BigStr* i0;
+      i0 = dec->Str();
+      c0->append(i0);
+    }
+    obj->strs = c0;
+  }
+  return obj;
+}
+
+void glob_part_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case glob_part_e::Literal: {
+    static_cast<glob_part__Literal*>(this)->Encode(enc);
+    return;
+  }
+  case glob_part_e::Operator: {
+    static_cast<glob_part__Operator*>(this)->Encode(enc);
+    return;
+  }
+  case glob_part_e::CharClass: {
+    static_cast<glob_part__CharClass*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+glob_part_t* glob_part_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case glob_part_e::Literal:
+    return glob_part__Literal::DecodeNew(dec);
+  case glob_part_e::Operator:
+    return glob_part__Operator::DecodeNew(dec);
+  case glob_part_e::CharClass:
+    return glob_part__CharClass::DecodeNew(dec);
+  }
+  return static_cast<glob_part_t*>(dec->Ref(h));
+}
+BigStr* printf_part_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case printf_part_e::Literal:
+    v = "Literal"; break;
+  case printf_part_e::Percent:
+    v = "Percent"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "printf_part.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* printf_part__Percent::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                          seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(printf_part_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->flags != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<Token*> it(this->flags); !it.Done(); it.Next()) {
+      Token* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("flags"), x0));
+  }
+
+  if (this->width) {  // Optional
+    hnode_t* x1 = this->width->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("width"), x1));
+  }
+
+  if (this->precision) {  // Optional
+    hnode_t* x2 = this->precision->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("precision"), x2));
+  }
+
+  hnode_t* x3 = this->type->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("type"), x3));
+
+  return out_node;
+}
+
+
+hnode_t* printf_part_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case printf_part_e::Literal: {
+    Token* obj = static_cast<Token*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case printf_part_e::Percent: {
+    printf_part__Percent* obj = static_cast<printf_part__Percent*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void printf_part__Percent::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, printf_part_e::Percent)) {
+    return;
+  }
+  if (this->flags == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->flags));
+    for (ListIter<Token*> it0(this->flags); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Obj(this->width);
+  enc->Obj(this->precision);
+  enc->Obj(this->type);
+}
+
+printf_part__Percent* printf_part__Percent::DecodeNew(pyserial::Decoder* dec) {
+  printf_part__Percent* obj = printf_part__Percent::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<Token*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      Token* i0;
+      i0 = Token::Decode(dec);
+      c0->append(i0);
+    }
+    obj->flags = c0;
+  }
+  obj->width = Token::Decode(dec);
+  obj->precision = Token::Decode(dec);
+  obj->type = Token::Decode(dec);
+  return obj;
+}
+
+void printf_part_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case printf_part_e::Literal: {
+    static_cast<Token*>(this)->Encode(enc);
+    return;
+  }
+  case printf_part_e::Percent: {
+    static_cast<printf_part__Percent*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+printf_part_t* printf_part_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case printf_part_e::Literal:
+    return Token::DecodeNew(dec);
+  case printf_part_e::Percent:
+    return printf_part__Percent::DecodeNew(dec);
+  }
+  return static_cast<printf_part_t*>(dec->Ref(h));
+}
+BigStr* expr_context_str(expr_context_e tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case expr_context_e::Load:
+    v = "Load"; break;
+  case expr_context_e::Store:
+    v = "Store"; break;
+  case expr_context_e::Del:
+    v = "Del"; break;
+  case expr_context_e::AugLoad:
+    v = "AugLoad"; break;
+  case expr_context_e::AugStore:
+    v = "AugStore"; break;
+  case expr_context_e::Param:
+    v = "Param"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "expr_context.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* TypeExpr::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("TypeExpr"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->tok->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("tok"), x0));
+
+  hnode_t* x1 = ToPretty(this->name);
+  L->append(Alloc<Field>(StrFromC("name"), x1));
+
+  if (this->params != nullptr) {  // List
+    hnode::Array* x2 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<TypeExpr*> it(this->params); !it.Done(); it.Next()) {
+      TypeExpr* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x2->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("params"), x2));
+  }
+
+  return out_node;
+}
+
+
+void TypeExpr::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 98)) {
+    return;
+  }
+  enc->Obj(this->tok);
+  enc->Str(this->name);
+  if (this->params == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->params));
+    for (ListIter<TypeExpr*> it0(this->params); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+TypeExpr* TypeExpr::DecodeNew(pyserial::Decoder* dec) {
+  TypeExpr* obj = TypeExpr::CreateNull();
+  dec->Add(obj);
+  obj->tok = Token::Decode(dec);
+  obj->name = dec->Str();
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<TypeExpr*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      TypeExpr* i0;
+      i0 = TypeExpr::Decode(dec);
+      c0->append(i0);
+    }
+    obj->params = c0;
+  }
+  return obj;
+}
+
+TypeExpr* TypeExpr::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 98) {
+    return TypeExpr::DecodeNew(dec);
+  }
+  return static_cast<TypeExpr*>(dec->Ref(h));
+}
+
+hnode_t* NameType::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("NameType"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = ToPretty(this->name);
+  L->append(Alloc<Field>(StrFromC("name"), x1));
+
+  if (this->typ) {  // Optional
+    hnode_t* x2 = this->typ->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("typ"), x2));
+  }
+
+  return out_node;
+}
+
+
+void NameType::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 99)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Str(this->name);
+  enc->Obj(this->typ);
+}
+
+NameType* NameType::DecodeNew(pyserial::Decoder* dec) {
+  NameType* obj = NameType::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->name = dec->Str();
+  obj->typ = TypeExpr::Decode(dec);
+  return obj;
+}
+
+NameType* NameType::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 99) {
+    return NameType::DecodeNew(dec);
+  }
+  return static_cast<NameType*>(dec->Ref(h));
+}
+
+hnode_t* Comprehension::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("Comprehension"));
+  List<Field*>* L = out_node->fields;
+
+  if (this->lhs != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<NameType*> it(this->lhs); !it.Done(); it.Next()) {
+      NameType* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("lhs"), x0));
+  }
+
+  hnode_t* x1 = this->iter->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("iter"), x1));
+
+  if (this->cond) {  // Optional
+    hnode_t* x2 = this->cond->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("cond"), x2));
+  }
+
+  return out_node;
+}
+
+
+void Comprehension::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 100)) {
+    return;
+  }
+  if (this->lhs == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->lhs));
+    for (ListIter<NameType*> it0(this->lhs); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Obj(this->iter);
+  enc->Obj(this->cond);
+}
+
+Comprehension* Comprehension::DecodeNew(pyserial::Decoder* dec) {
+  Comprehension* obj = Comprehension::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<NameType*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      NameType* i0;
+      i0 = NameType::Decode(dec);
+      c0->append(i0);
+    }
+    obj->lhs = c0;
+  }
+  obj->iter = expr_t::Decode(dec);
+  obj->cond = expr_t::Decode(dec);
+  return obj;
+}
+
+Comprehension* Comprehension::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 100) {
+    return Comprehension::DecodeNew(dec);
+  }
+  return static_cast<Comprehension*>(dec->Ref(h));
+}
+
+hnode_t* NamedArg::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("NamedArg"));
+  List<Field*>* L = out_node->fields;
+
+  if (this->name) {  // Optional
+    hnode_t* x0 = this->name->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("name"), x0));
+  }
+
+  hnode_t* x1 = this->value->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("value"), x1));
+
+  return out_node;
+}
+
+
+void NamedArg::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 101)) {
+    return;
+  }
+  enc->Obj(this->name);
+  enc->Obj(this->value);
+}
+
+NamedArg* NamedArg::DecodeNew(pyserial::Decoder* dec) {
+  NamedArg* obj = NamedArg::CreateNull();
+  dec->Add(obj);
+  obj->name = Token::Decode(dec);
+  obj->value = expr_t::Decode(dec);
+  return obj;
+}
+
+NamedArg* NamedArg::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 101) {
+    return NamedArg::DecodeNew(dec);
+  }
+  return static_cast<NamedArg*>(dec->Ref(h));
+}
+
+hnode_t* Subscript::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("Subscript"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = this->obj->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("obj"), x1));
+
+  hnode_t* x2 = this->index->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("index"), x2));
+
+  return out_node;
+}
+
+
+void Subscript::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 102)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->obj);
+  enc->Obj(this->index);
+}
+
+Subscript* Subscript::DecodeNew(pyserial::Decoder* dec) {
+  Subscript* obj = Subscript::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->obj = expr_t::Decode(dec);
+  obj->index = expr_t::Decode(dec);
+  return obj;
+}
+
+Subscript* Subscript::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 102) {
+    return Subscript::DecodeNew(dec);
+  }
+  return static_cast<Subscript*>(dec->Ref(h));
+}
+
+hnode_t* Attribute::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("Attribute"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->obj->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("obj"), x0));
+
+  hnode_t* x1 = this->op->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("op"), x1));
+
+  hnode_t* x2 = this->attr->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("attr"), x2));
+
+  hnode_t* x3 = ToPretty(this->attr_name);
+  L->append(Alloc<Field>(StrFromC("attr_name"), x3));
+
+  hnode_t* x4 = Alloc<hnode::Leaf>(expr_context_str(this->ctx),
+                                   color_e::TypeName);
+  L->append(Alloc<Field>(StrFromC("ctx"), x4));
+
+  return out_node;
+}
+
+
+void Attribute::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 103)) {
+    return;
+  }
+  enc->Obj(this->obj);
+  enc->Obj(this->op);
+  enc->Obj(this->attr);
+  enc->Str(this->attr_name);
+  enc->Int(static_cast<int>(this->ctx));
+}
+
+Attribute* Attribute::DecodeNew(pyserial::Decoder* dec) {
+  Attribute* obj = Attribute::CreateNull();
+  dec->Add(obj);
+  obj->obj = expr_t::Decode(dec);
+  obj->op = Token::Decode(dec);
+  obj->attr = Token::Decode(dec);
+  obj->attr_name = dec->Str();
+  obj->ctx = static_cast<expr_context_t>(dec->Int());
+  return obj;
+}
+
+Attribute* Attribute::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 103) {
+    return Attribute::DecodeNew(dec);
+  }
+  return static_cast<Attribute*>(dec->Ref(h));
+}
+BigStr* y_lhs_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case y_lhs_e::Var:
+    v = "Var"; break;
+  case y_lhs_e::Subscript:
+    v = "Subscript"; break;
+  case y_lhs_e::Attribute:
+    v = "Attribute"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "y_lhs.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* y_lhs_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case y_lhs_e::Var: {
+    Token* obj = static_cast<Token*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case y_lhs_e::Subscript: {
+    Subscript* obj = static_cast<Subscript*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case y_lhs_e::Attribute: {
+    Attribute* obj = static_cast<Attribute*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void y_lhs_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case y_lhs_e::Var: {
+    static_cast<Token*>(this)->Encode(enc);
+    return;
+  }
+  case y_lhs_e::Subscript: {
+    static_cast<Subscript*>(this)->Encode(enc);
+    return;
+  }
+  case y_lhs_e::Attribute: {
+    static_cast<Attribute*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+y_lhs_t* y_lhs_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case y_lhs_e::Var:
+    return Token::DecodeNew(dec);
+  case y_lhs_e::Subscript:
+    return Subscript::DecodeNew(dec);
+  case y_lhs_e::Attribute:
+    return Attribute::DecodeNew(dec);
+  }
+  return static_cast<y_lhs_t*>(dec->Ref(h));
+}
+BigStr* place_op_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case place_op_e::Subscript:
+    v = "Subscript"; break;
+  case place_op_e::Attribute:
+    v = "Attribute"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "place_op.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* place_op__Subscript::PrettyTree(bool do_abbrev, Dict<int, bool>* seen)
+                                         {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(place_op_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->op->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("op"), x0));
+
+  hnode_t* x1 = this->index->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("index"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* place_op__Attribute::PrettyTree(bool do_abbrev, Dict<int, bool>* seen)
+                                         {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(place_op_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->op->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("op"), x0));
+
+  hnode_t* x1 = this->attr->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("attr"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* place_op_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case place_op_e::Subscript: {
+    place_op__Subscript* obj = static_cast<place_op__Subscript*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case place_op_e::Attribute: {
+    place_op__Attribute* obj = static_cast<place_op__Attribute*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void place_op__Subscript::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, place_op_e::Subscript)) {
+    return;
+  }
+  enc->Obj(this->op);
+  enc->Obj(this->index);
+}
+
+place_op__Subscript* place_op__Subscript::DecodeNew(pyserial::Decoder* dec) {
+  place_op__Subscript* obj = place_op__Subscript::CreateNull();
+  dec->Add(obj);
+  obj->op = Token::Decode(dec);
+  obj->index = expr_t::Decode(dec);
+  return obj;
+}
+
+void place_op__Attribute::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, place_op_e::Attribute)) {
+    return;
+  }
+  enc->Obj(this->op);
+  enc->Obj(this->attr);
+}
+
+place_op__Attribute* place_op__Attribute::DecodeNew(pyserial::Decoder* dec) {
+  place_op__Attribute* obj = place_op__Attribute::CreateNull();
+  dec->Add(obj);
+  obj->op = Token::Decode(dec);
+  obj->attr = Token::Decode(dec);
+  return obj;
+}
+
+void place_op_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case place_op_e::Subscript: {
+    static_cast<place_op__Subscript*>(this)->Encode(enc);
+    return;
+  }
+  case place_op_e::Attribute: {
+    static_cast<place_op__Attribute*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+place_op_t* place_op_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case place_op_e::Subscript:
+    return place_op__Subscript::DecodeNew(dec);
+  case place_op_e::Attribute:
+    return place_op__Attribute::DecodeNew(dec);
+  }
+  return static_cast<place_op_t*>(dec->Ref(h));
+}
+BigStr* expr_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case expr_e::Var:
+    v = "Var"; break;
+  case expr_e::Const:
+    v = "Const"; break;
+  case expr_e::Place:
+    v = "Place"; break;
+  case expr_e::YshArrayLiteral:
+    v = "YshArrayLiteral"; break;
+  case expr_e::Eggex:
+    v = "Eggex"; break;
+  case expr_e::SimpleVarSub:
+    v = "SimpleVarSub"; break;
+  case expr_e::BracedVarSub:
+    v = "BracedVarSub"; break;
+  case expr_e::CommandSub:
+    v = "CommandSub"; break;
+  case expr_e::ExprSub:
+    v = "ExprSub"; break;
+  case expr_e::SingleQuoted:
+    v = "SingleQuoted"; break;
+  case expr_e::DoubleQuoted:
+    v = "DoubleQuoted"; break;
+  case expr_e::Literal:
+    v = "Literal"; break;
+  case expr_e::Lambda:
+    v = "Lambda"; break;
+  case expr_e::Unary:
+    v = "Unary"; break;
+  case expr_e::Binary:
+    v = "Binary"; break;
+  case expr_e::Compare:
+    v = "Compare"; break;
+  case expr_e::FuncCall:
+    v = "FuncCall"; break;
+  case expr_e::IfExp:
+    v = "IfExp"; break;
+  case expr_e::Tuple:
+    v = "Tuple"; break;
+  case expr_e::List:
+    v = "List"; break;
+  case expr_e::Dict:
+    v = "Dict"; break;
+  case expr_e::Implicit:
+    v = "Implicit"; break;
+  case expr_e::ListComp:
+    v = "ListComp"; break;
+  case expr_e::DictComp:
+    v = "DictComp"; break;
+  case expr_e::GeneratorExp:
+    v = "GeneratorExp"; break;
+  case expr_e::Range:
+    v = "Range"; break;
+  case expr_e::Slice:
+    v = "Slice"; break;
+  case expr_e::Subscript:
+    v = "Subscript"; break;
+  case expr_e::Attribute:
+    v = "Attribute"; break;
+  case expr_e::Spread:
+    v = "Spread"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "expr.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+expr__Implicit* expr::Implicit = &gexpr__Implicit.obj;
+
+GcGlobal<expr__Implicit> gexpr__Implicit = 
+  { ObjHeader::Global(expr_e::Implicit) };
+
+hnode_t* expr__Var::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  if (do_abbrev) {
+    auto* p = syntax_abbrev::_expr__Var(this);
+    if (p) {
+      return p;
+    }
+  }
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = ToPretty(this->name);
+  L->append(Alloc<Field>(StrFromC("name"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* expr__Const::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  if (do_abbrev) {
+    auto* p = syntax_abbrev::_expr__Const(this);
+    if (p) {
+      return p;
+    }
+  }
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->c->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("c"), x0));
+
+  hnode_t* x1 = this->val->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("val"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* expr__Place::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->blame_tok->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("blame_tok"), x0));
+
+  hnode_t* x1 = ToPretty(this->var_name);
+  L->append(Alloc<Field>(StrFromC("var_name"), x1));
+
+  if (this->ops != nullptr) {  // List
+    hnode::Array* x2 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<place_op_t*> it(this->ops); !it.Done(); it.Next()) {
+      place_op_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x2->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("ops"), x2));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* expr__Literal::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->inner->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("inner"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* expr__Lambda::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->params != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<NameType*> it(this->params); !it.Done(); it.Next()) {
+      NameType* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("params"), x0));
+  }
+
+  hnode_t* x1 = this->body->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("body"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* expr__Unary::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->op->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("op"), x0));
+
+  hnode_t* x1 = this->child->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("child"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* expr__Binary::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->op->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("op"), x0));
+
+  hnode_t* x1 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x1));
+
+  hnode_t* x2 = this->right->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("right"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* expr__Compare::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  if (this->ops != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<Token*> it(this->ops); !it.Done(); it.Next()) {
+      Token* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("ops"), x1));
+  }
+
+  if (this->comparators != nullptr) {  // List
+    hnode::Array* x2 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<expr_t*> it(this->comparators); !it.Done(); it.Next()) {
+      expr_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x2->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("comparators"), x2));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* expr__FuncCall::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->func->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("func"), x0));
+
+  hnode_t* x1 = this->args->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("args"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* expr__IfExp::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->test->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("test"), x0));
+
+  hnode_t* x1 = this->body->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("body"), x1));
+
+  hnode_t* x2 = this->orelse->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("orelse"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* expr__Tuple::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  if (this->elts != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<expr_t*> it(this->elts); !it.Done(); it.Next()) {
+      expr_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("elts"), x1));
+  }
+
+  hnode_t* x2 = Alloc<hnode::Leaf>(expr_context_str(this->ctx),
+                                   color_e::TypeName);
+  L->append(Alloc<Field>(StrFromC("ctx"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* expr__List::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  if (this->elts != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<expr_t*> it(this->elts); !it.Done(); it.Next()) {
+      expr_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("elts"), x1));
+  }
+
+  hnode_t* x2 = Alloc<hnode::Leaf>(expr_context_str(this->ctx),
+                                   color_e::TypeName);
+  L->append(Alloc<Field>(StrFromC("ctx"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* expr__Dict::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  if (this->keys != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<expr_t*> it(this->keys); !it.Done(); it.Next()) {
+      expr_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("keys"), x1));
+  }
+
+  if (this->values != nullptr) {  // List
+    hnode::Array* x2 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<expr_t*> it(this->values); !it.Done(); it.Next()) {
+      expr_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x2->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("values"), x2));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* expr__Implicit::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  return out_node;
+}
+
+
+hnode_t* expr__ListComp::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = this->elt->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("elt"), x1));
+
+  if (this->generators != nullptr) {  // List
+    hnode::Array* x2 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<Comprehension*> it(this->generators); !it.Done(); it.Next()) {
+      Comprehension* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x2->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("generators"), x2));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* expr__DictComp::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = this->key->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("key"), x1));
+
+  hnode_t* x2 = this->value->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("value"), x2));
+
+  if (this->generators != nullptr) {  // List
+    hnode::Array* x3 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<Comprehension*> it(this->generators); !it.Done(); it.Next()) {
+      Comprehension* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x3->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("generators"), x3));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* expr__GeneratorExp::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->elt->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("elt"), x0));
+
+  if (this->generators != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<Comprehension*> it(this->generators); !it.Done(); it.Next()) {
+      Comprehension* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("generators"), x1));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* expr__Range::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->lower->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("lower"), x0));
+
+  hnode_t* x1 = this->op->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("op"), x1));
+
+  hnode_t* x2 = this->upper->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("upper"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* expr__Slice::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->lower) {  // Optional
+    hnode_t* x0 = this->lower->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("lower"), x0));
+  }
+
+  hnode_t* x1 = this->op->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("op"), x1));
+
+  if (this->upper) {  // Optional
+    hnode_t* x2 = this->upper->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("upper"), x2));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* expr__Spread::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(expr_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("left"), x0));
+
+  hnode_t* x1 = this->child->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("child"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* expr_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case expr_e::Var: {
+    expr__Var* obj = static_cast<expr__Var*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::Const: {
+    expr__Const* obj = static_cast<expr__Const*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::Place: {
+    expr__Place* obj = static_cast<expr__Place*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::YshArrayLiteral: {
+    YshArrayLiteral* obj = static_cast<YshArrayLiteral*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::Eggex: {
+    Eggex* obj = static_cast<Eggex*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::SimpleVarSub: {
+    SimpleVarSub* obj = static_cast<SimpleVarSub*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::BracedVarSub: {
+    BracedVarSub* obj = static_cast<BracedVarSub*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::CommandSub: {
+    CommandSub* obj = static_cast<CommandSub*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::ExprSub: {
+    ExprSub* obj = static_cast<ExprSub*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::SingleQuoted: {
+    SingleQuoted* obj = static_cast<SingleQuoted*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::DoubleQuoted: {
+    DoubleQuoted* obj = static_cast<DoubleQuoted*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::Literal: {
+    expr__Literal* obj = static_cast<expr__Literal*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::Lambda: {
+    expr__Lambda* obj = static_cast<expr__Lambda*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::Unary: {
+    expr__Unary* obj = static_cast<expr__Unary*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::Binary: {
+    expr__Binary* obj = static_cast<expr__Binary*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::Compare: {
+    expr__Compare* obj = static_cast<expr__Compare*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::FuncCall: {
+    expr__FuncCall* obj = static_cast<expr__FuncCall*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::IfExp: {
+    expr__IfExp* obj = static_cast<expr__IfExp*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::Tuple: {
+    expr__Tuple* obj = static_cast<expr__Tuple*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::List: {
+    expr__List* obj = static_cast<expr__List*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::Dict: {
+    expr__Dict* obj = static_cast<expr__Dict*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::Implicit: {
+    expr__Implicit* obj = static_cast<expr__Implicit*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::ListComp: {
+    expr__ListComp* obj = static_cast<expr__ListComp*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::DictComp: {
+    expr__DictComp* obj = static_cast<expr__DictComp*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::GeneratorExp: {
+    expr__GeneratorExp* obj = static_cast<expr__GeneratorExp*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::Range: {
+    expr__Range* obj = static_cast<expr__Range*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::Slice: {
+    expr__Slice* obj = static_cast<expr__Slice*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::Subscript: {
+    Subscript* obj = static_cast<Subscript*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::Attribute: {
+    Attribute* obj = static_cast<Attribute*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case expr_e::Spread: {
+    expr__Spread* obj = static_cast<expr__Spread*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void expr__Var::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::Var)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Str(this->name);
+}
+
+expr__Var* expr__Var::DecodeNew(pyserial::Decoder* dec) {
+  expr__Var* obj = expr__Var::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->name = dec->Str();
+  return obj;
+}
+
+void expr__Const::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::Const)) {
+    return;
+  }
+  enc->Obj(this->c);
+  enc->Obj(this->val);
+}
+
+expr__Const* expr__Const::DecodeNew(pyserial::Decoder* dec) {
+  expr__Const* obj = expr__Const::CreateNull();
+  dec->Add(obj);
+  obj->c = Token::Decode(dec);
+  obj->val = value_asdl::value_t::Decode(dec);
+  return obj;
+}
+
+void expr__Place::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::Place)) {
+    return;
+  }
+  enc->Obj(this->blame_tok);
+  enc->Str(this->var_name);
+  if (this->ops == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->ops));
+    for (ListIter<place_op_t*> it0(this->ops); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+expr__Place* expr__Place::DecodeNew(pyserial::Decoder* dec) {
+  expr__Place* obj = expr__Place::CreateNull();
+  dec->Add(obj);
+  obj->blame_tok = Token::Decode(dec);
+  obj->var_name = dec->Str();
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<place_op_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      place_op_t* i0;
+      i0 = place_op_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->ops = c0;
+  }
+  return obj;
+}
+
+void expr__Literal::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::Literal)) {
+    return;
+  }
+  enc->Obj(this->inner);
+}
+
+expr__Literal* expr__Literal::DecodeNew(pyserial::Decoder* dec) {
+  expr__Literal* obj = expr__Literal::CreateNull();
+  dec->Add(obj);
+  obj->inner = expr_t::Decode(dec);
+  return obj;
+}
+
+void expr__Lambda::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::Lambda)) {
+    return;
+  }
+  if (this->params == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->params));
+    for (ListIter<NameType*> it0(this->params); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Obj(this->body);
+}
+
+expr__Lambda* expr__Lambda::DecodeNew(pyserial::Decoder* dec) {
+  expr__Lambda* obj = expr__Lambda::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<NameType*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      NameType* i0;
+      i0 = NameType::Decode(dec);
+      c0->append(i0);
+    }
+    obj->params = c0;
+  }
+  obj->body = expr_t::Decode(dec);
+  return obj;
+}
+
+void expr__Unary::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::Unary)) {
+    return;
+  }
+  enc->Obj(this->op);
+  enc->Obj(this->child);
+}
+
+expr__Unary* expr__Unary::DecodeNew(pyserial::Decoder* dec) {
+  expr__Unary* obj = expr__Unary::CreateNull();
+  dec->Add(obj);
+  obj->op = Token::Decode(dec);
+  obj->child = expr_t::Decode(dec);
+  return obj;
+}
+
+void expr__Binary::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::Binary)) {
+    return;
+  }
+  enc->Obj(this->op);
+  enc->Obj(this->left);
+  enc->Obj(this->right);
+}
+
+expr__Binary* expr__Binary::DecodeNew(pyserial::Decoder* dec) {
+  expr__Binary* obj = expr__Binary::CreateNull();
+  dec->Add(obj);
+  obj->op = Token::Decode(dec);
+  obj->left = expr_t::Decode(dec);
+  obj->right = expr_t::Decode(dec);
+  return obj;
+}
+
+void expr__Compare::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::Compare)) {
+    return;
+  }
+  enc->Obj(this->left);
+  if (this->ops == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->ops));
+    for (ListIter<Token*> it0(this->ops); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  if (this->comparators == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->comparators));
+    for (ListIter<expr_t*> it1(this->comparators); !it1.Done(); it1.Next()) {
+      enc->Obj(it1.Value());
+    }
+  }
+}
+
+expr__Compare* expr__Compare::DecodeNew(pyserial::Decoder* dec) {
+  expr__Compare* obj = expr__Compare::CreateNull();
+  dec->Add(obj);
+  obj->left = expr_t::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<Token*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      Token* i0;
+      i0 = Token::Decode(dec);
+      c0->append(i0);
+    }
+    obj->ops = c0;
+  }
+  int n1 = dec->Size();
+  if (n1 != -1) {
+    auto* c1 = Alloc<List<expr_t*>>();
+    for (int j1 = 0; j1 < n1; ++j1) {
+      expr_t* i1;
+      i1 = expr_t::Decode(dec);
+      c1->append(i1);
+    }
+    obj->comparators = c1;
+  }
+  return obj;
+}
+
+void expr__FuncCall::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::FuncCall)) {
+    return;
+  }
+  enc->Obj(this->func);
+  enc->Obj(this->args);
+}
+
+expr__FuncCall* expr__FuncCall::DecodeNew(pyserial::Decoder* dec) {
+  expr__FuncCall* obj = expr__FuncCall::CreateNull();
+  dec->Add(obj);
+  obj->func = expr_t::Decode(dec);
+  obj->args = ArgList::Decode(dec);
+  return obj;
+}
+
+void expr__IfExp::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::IfExp)) {
+    return;
+  }
+  enc->Obj(this->test);
+  enc->Obj(this->body);
+  enc->Obj(this->orelse);
+}
+
+expr__IfExp* expr__IfExp::DecodeNew(pyserial::Decoder* dec) {
+  expr__IfExp* obj = expr__IfExp::CreateNull();
+  dec->Add(obj);
+  obj->test = expr_t::Decode(dec);
+  obj->body = expr_t::Decode(dec);
+  obj->orelse = expr_t::Decode(dec);
+  return obj;
+}
+
+void expr__Tuple::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::Tuple)) {
+    return;
+  }
+  enc->Obj(this->left);
+  if (this->elts == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->elts));
+    for (ListIter<expr_t*> it0(this->elts); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Int(static_cast<int>(this->ctx));
+}
+
+expr__Tuple* expr__Tuple::DecodeNew(pyserial::Decoder* dec) {
+  expr__Tuple* obj = expr__Tuple::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<expr_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      expr_t* i0;
+      i0 = expr_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->elts = c0;
+  }
+  obj->ctx = static_cast<expr_context_t>(dec->Int());
+  return obj;
+}
+
+void expr__List::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::List)) {
+    return;
+  }
+  enc->Obj(this->left);
+  if (this->elts == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->elts));
+    for (ListIter<expr_t*> it0(this->elts); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  enc->Int(static_cast<int>(this->ctx));
+}
+
+expr__List* expr__List::DecodeNew(pyserial::Decoder* dec) {
+  expr__List* obj = expr__List::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<expr_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      expr_t* i0;
+      i0 = expr_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->elts = c0;
+  }
+  obj->ctx = static_cast<expr_context_t>(dec->Int());
+  return obj;
+}
+
+void expr__Dict::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::Dict)) {
+    return;
+  }
+  enc->Obj(this->left);
+  if (this->keys == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->keys));
+    for (ListIter<expr_t*> it0(this->keys); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+  if (this->values == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->values));
+    for (ListIter<expr_t*> it1(this->values); !it1.Done(); it1.Next()) {
+      enc->Obj(it1.Value());
+    }
+  }
+}
+
+expr__Dict* expr__Dict::DecodeNew(pyserial::Decoder* dec) {
+  expr__Dict* obj = expr__Dict::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<expr_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      expr_t* i0;
+      i0 = expr_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->keys = c0;
+  }
+  int n1 = dec->Size();
+  if (n1 != -1) {
+    auto* c1 = Alloc<List<expr_t*>>();
+    for (int j1 = 0; j1 < n1; ++j1) {
+      expr_t* i1;
+      i1 = expr_t::Decode(dec);
+      c1->append(i1);
+    }
+    obj->values = c1;
+  }
+  return obj;
+}
+
+void expr__Implicit::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::Implicit)) {
+    return;
+  }
+}
+
+void expr__ListComp::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::ListComp)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->elt);
+  if (this->generators == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->generators));
+    for (ListIter<Comprehension*> it0(this->generators); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+expr__ListComp* expr__ListComp::DecodeNew(pyserial::Decoder* dec) {
+  expr__ListComp* obj = expr__ListComp::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->elt = expr_t::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<Comprehension*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      Comprehension* i0;
+      i0 = Comprehension::Decode(dec);
+      c0->append(i0);
+    }
+    obj->generators = c0;
+  }
+  return obj;
+}
+
+void expr__DictComp::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::DictComp)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->key);
+  enc->Obj(this->value);
+  if (this->generators == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->generators));
+    for (ListIter<Comprehension*> it0(this->generators); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+expr__DictComp* expr__DictComp::DecodeNew(pyserial::Decoder* dec) {
+  expr__DictComp* obj = expr__DictComp::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->key = expr_t::Decode(dec);
+  obj->value = expr_t::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<Comprehension*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      Comprehension* i0;
+      i0 = Comprehension::Decode(dec);
+      c0->append(i0);
+    }
+    obj->generators = c0;
+  }
+  return obj;
+}
+
+void expr__GeneratorExp::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::GeneratorExp)) {
+    return;
+  }
+  enc->Obj(this->elt);
+  if (this->generators == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->generators));
+    for (ListIter<Comprehension*> it0(this->generators); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+expr__GeneratorExp* expr__GeneratorExp::DecodeNew(pyserial::Decoder* dec) {
+  expr__GeneratorExp* obj = expr__GeneratorExp::CreateNull();
+  dec->Add(obj);
+  obj->elt = expr_t::Decode(dec);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<Comprehension*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      Comprehension* i0;
+      i0 = Comprehension::Decode(dec);
+      c0->append(i0);
+    }
+    obj->generators = c0;
+  }
+  return obj;
+}
+
+void expr__Range::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::Range)) {
+    return;
+  }
+  enc->Obj(this->lower);
+  enc->Obj(this->op);
+  enc->Obj(this->upper);
+}
+
+expr__Range* expr__Range::DecodeNew(pyserial::Decoder* dec) {
+  expr__Range* obj = expr__Range::CreateNull();
+  dec->Add(obj);
+  obj->lower = expr_t::Decode(dec);
+  obj->op = Token::Decode(dec);
+  obj->upper = expr_t::Decode(dec);
+  return obj;
+}
+
+void expr__Slice::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::Slice)) {
+    return;
+  }
+  enc->Obj(this->lower);
+  enc->Obj(this->op);
+  enc->Obj(this->upper);
+}
+
+expr__Slice* expr__Slice::DecodeNew(pyserial::Decoder* dec) {
+  expr__Slice* obj = expr__Slice::CreateNull();
+  dec->Add(obj);
+  obj->lower = expr_t::Decode(dec);
+  obj->op = Token::Decode(dec);
+  obj->upper = expr_t::Decode(dec);
+  return obj;
+}
+
+void expr__Spread::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, expr_e::Spread)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Obj(this->child);
+}
+
+expr__Spread* expr__Spread::DecodeNew(pyserial::Decoder* dec) {
+  expr__Spread* obj = expr__Spread::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->child = expr_t::Decode(dec);
+  return obj;
+}
+
+void expr_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case expr_e::Var: {
+    static_cast<expr__Var*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::Const: {
+    static_cast<expr__Const*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::Place: {
+    static_cast<expr__Place*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::YshArrayLiteral: {
+    static_cast<YshArrayLiteral*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::Eggex: {
+    static_cast<Eggex*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::SimpleVarSub: {
+    static_cast<SimpleVarSub*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::BracedVarSub: {
+    static_cast<BracedVarSub*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::CommandSub: {
+    static_cast<CommandSub*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::ExprSub: {
+    static_cast<ExprSub*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::SingleQuoted: {
+    static_cast<SingleQuoted*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::DoubleQuoted: {
+    static_cast<DoubleQuoted*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::Literal: {
+    static_cast<expr__Literal*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::Lambda: {
+    static_cast<expr__Lambda*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::Unary: {
+    static_cast<expr__Unary*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::Binary: {
+    static_cast<expr__Binary*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::Compare: {
+    static_cast<expr__Compare*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::FuncCall: {
+    static_cast<expr__FuncCall*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::IfExp: {
+    static_cast<expr__IfExp*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::Tuple: {
+    static_cast<expr__Tuple*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::List: {
+    static_cast<expr__List*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::Dict: {
+    static_cast<expr__Dict*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::Implicit: {
+    static_cast<expr__Implicit*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::ListComp: {
+    static_cast<expr__ListComp*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::DictComp: {
+    static_cast<expr__DictComp*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::GeneratorExp: {
+    static_cast<expr__GeneratorExp*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::Range: {
+    static_cast<expr__Range*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::Slice: {
+    static_cast<expr__Slice*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::Subscript: {
+    static_cast<Subscript*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::Attribute: {
+    static_cast<Attribute*>(this)->Encode(enc);
+    return;
+  }
+  case expr_e::Spread: {
+    static_cast<expr__Spread*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+expr_t* expr_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case expr_e::Var:
+    return expr__Var::DecodeNew(dec);
+  case expr_e::Const:
+    return expr__Const::DecodeNew(dec);
+  case expr_e::Place:
+    return expr__Place::DecodeNew(dec);
+  case expr_e::YshArrayLiteral:
+    return YshArrayLiteral::DecodeNew(dec);
+  case expr_e::Eggex:
+    return Eggex::DecodeNew(dec);
+  case expr_e::SimpleVarSub:
+    return SimpleVarSub::DecodeNew(dec);
+  case expr_e::BracedVarSub:
+    return BracedVarSub::DecodeNew(dec);
+  case expr_e::CommandSub:
+    return CommandSub::DecodeNew(dec);
+  case expr_e::ExprSub:
+    return ExprSub::DecodeNew(dec);
+  case expr_e::SingleQuoted:
+    return SingleQuoted::DecodeNew(dec);
+  case expr_e::DoubleQuoted:
+    return DoubleQuoted::DecodeNew(dec);
+  case expr_e::Literal:
+    return expr__Literal::DecodeNew(dec);
+  case expr_e::Lambda:
+    return expr__Lambda::DecodeNew(dec);
+  case expr_e::Unary:
+    return expr__Unary::DecodeNew(dec);
+  case expr_e::Binary:
+    return expr__Binary::DecodeNew(dec);
+  case expr_e::Compare:
+    return expr__Compare::DecodeNew(dec);
+  case expr_e::FuncCall:
+    return expr__FuncCall::DecodeNew(dec);
+  case expr_e::IfExp:
+    return expr__IfExp::DecodeNew(dec);
+  case expr_e::Tuple:
+    return expr__Tuple::DecodeNew(dec);
+  case expr_e::List:
+    return expr__List::DecodeNew(dec);
+  case expr_e::Dict:
+    return expr__Dict::DecodeNew(dec);
+  case expr_e::Implicit:
+    dec->Add(expr::Implicit);
+    return expr::Implicit;
+  case expr_e::ListComp:
+    return expr__ListComp::DecodeNew(dec);
+  case expr_e::DictComp:
+    return expr__DictComp::DecodeNew(dec);
+  case expr_e::GeneratorExp:
+    return expr__GeneratorExp::DecodeNew(dec);
+  case expr_e::Range:
+    return expr__Range::DecodeNew(dec);
+  case expr_e::Slice:
+    return expr__Slice::DecodeNew(dec);
+  case expr_e::Subscript:
+    return Subscript::DecodeNew(dec);
+  case expr_e::Attribute:
+    return Attribute::DecodeNew(dec);
+  case expr_e::Spread:
+    return expr__Spread::DecodeNew(dec);
+  }
+  return static_cast<expr_t*>(dec->Ref(h));
+}
+
+hnode_t* PosixClass::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("PosixClass"));
+  List<Field*>* L = out_node->fields;
+
+  if (this->negated) {  // Optional
+    hnode_t* x0 = this->negated->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("negated"), x0));
+  }
+
+  hnode_t* x1 = ToPretty(this->name);
+  L->append(Alloc<Field>(StrFromC("name"), x1));
+
+  return out_node;
+}
+
+
+void PosixClass::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 104)) {
+    return;
+  }
+  enc->Obj(this->negated);
+  enc->Str(this->name);
+}
+
+PosixClass* PosixClass::DecodeNew(pyserial::Decoder* dec) {
+  PosixClass* obj = PosixClass::CreateNull();
+  dec->Add(obj);
+  obj->negated = Token::Decode(dec);
+  obj->name = dec->Str();
+  return obj;
+}
+
+PosixClass* PosixClass::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 104) {
+    return PosixClass::DecodeNew(dec);
+  }
+  return static_cast<PosixClass*>(dec->Ref(h));
+}
+
+hnode_t* PerlClass::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("PerlClass"));
+  List<Field*>* L = out_node->fields;
+
+  if (this->negated) {  // Optional
+    hnode_t* x0 = this->negated->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("negated"), x0));
+  }
+
+  hnode_t* x1 = ToPretty(this->name);
+  L->append(Alloc<Field>(StrFromC("name"), x1));
+
+  return out_node;
+}
+
+
+void PerlClass::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 105)) {
+    return;
+  }
+  enc->Obj(this->negated);
+  enc->Str(this->name);
+}
+
+PerlClass* PerlClass::DecodeNew(pyserial::Decoder* dec) {
+  PerlClass* obj = PerlClass::CreateNull();
+  dec->Add(obj);
+  obj->negated = Token::Decode(dec);
+  obj->name = dec->Str();
+  return obj;
+}
+
+PerlClass* PerlClass::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 105) {
+    return PerlClass::DecodeNew(dec);
+  }
+  return static_cast<PerlClass*>(dec->Ref(h));
+}
+
+hnode_t* CharCode::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("CharCode"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->blame_tok->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("blame_tok"), x0));
+
+  hnode_t* x1 = ToPretty(this->i);
+  L->append(Alloc<Field>(StrFromC("i"), x1));
+
+  hnode_t* x2 = ToPretty(this->u_braced);
+  L->append(Alloc<Field>(StrFromC("u_braced"), x2));
+
+  return out_node;
+}
+
+
+void CharCode::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 106)) {
+    return;
+  }
+  enc->Obj(this->blame_tok);
+  enc->Int(this->i);
+  enc->Bool(this->u_braced);
+}
+
+CharCode* CharCode::DecodeNew(pyserial::Decoder* dec) {
+  CharCode* obj = CharCode::CreateNull();
+  dec->Add(obj);
+  obj->blame_tok = Token::Decode(dec);
+  obj->i = dec->Int();
+  obj->u_braced = dec->Bool();
+  return obj;
+}
+
+CharCode* CharCode::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 106) {
+    return CharCode::DecodeNew(dec);
+  }
+  return static_cast<CharCode*>(dec->Ref(h));
+}
+
+hnode_t* CharRange::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(StrFromC("CharRange"));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->start->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("start"), x0));
+
+  hnode_t* x1 = this->end->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("end"), x1));
+
+  return out_node;
+}
+
+
+void CharRange::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, 107)) {
+    return;
+  }
+  enc->Obj(this->start);
+  enc->Obj(this->end);
+}
+
+CharRange* CharRange::DecodeNew(pyserial::Decoder* dec) {
+  CharRange* obj = CharRange::CreateNull();
+  dec->Add(obj);
+  obj->start = CharCode::Decode(dec);
+  obj->end = CharCode::Decode(dec);
+  return obj;
+}
+
+CharRange* CharRange::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  if (h == 107) {
+    return CharRange::DecodeNew(dec);
+  }
+  return static_cast<CharRange*>(dec->Ref(h));
+}
+BigStr* class_literal_term_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case class_literal_term_e::PosixClass:
+    v = "PosixClass"; break;
+  case class_literal_term_e::PerlClass:
+    v = "PerlClass"; break;
+  case class_literal_term_e::CharRange:
+    v = "CharRange"; break;
+  case class_literal_term_e::CharCode:
+    v = "CharCode"; break;
+  case class_literal_term_e::SingleQuoted:
+    v = "SingleQuoted"; break;
+  case class_literal_term_e::Splice:
+    v = "Splice"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "class_literal_term.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* class_literal_term__Splice::PrettyTree(bool do_abbrev, Dict<int,
+                                                bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node =
+runtime::NewRecord(class_literal_term_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->name->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("name"), x0));
+
+  hnode_t* x1 = ToPretty(this->var_name);
+  L->append(Alloc<Field>(StrFromC("var_name"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* class_literal_term_t::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                          seen) {
+  switch (this->tag()) {
+  case class_literal_term_e::PosixClass: {
+    PosixClass* obj = static_cast<PosixClass*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case class_literal_term_e::PerlClass: {
+    PerlClass* obj = static_cast<PerlClass*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case class_literal_term_e::CharRange: {
+    CharRange* obj = static_cast<CharRange*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case class_literal_term_e::CharCode: {
+    CharCode* obj = static_cast<CharCode*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case class_literal_term_e::SingleQuoted: {
+    SingleQuoted* obj = static_cast<SingleQuoted*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case class_literal_term_e::Splice: {
+    class_literal_term__Splice* obj =
+static_cast<class_literal_term__Splice*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void class_literal_term__Splice::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, class_literal_term_e::Splice)) {
+    return;
+  }
+  enc->Obj(this->name);
+  enc->Str(this->var_name);
+}
+
+class_literal_term__Splice*
+class_literal_term__Splice::DecodeNew(pyserial::Decoder* dec) {
+  class_literal_term__Splice* obj = class_literal_term__Splice::CreateNull();
+  dec->Add(obj);
+  obj->name = Token::Decode(dec);
+  obj->var_name = dec->Str();
+  return obj;
+}
+
+void class_literal_term_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case class_literal_term_e::PosixClass: {
+    static_cast<PosixClass*>(this)->Encode(enc);
+    return;
+  }
+  case class_literal_term_e::PerlClass: {
+    static_cast<PerlClass*>(this)->Encode(enc);
+    return;
+  }
+  case class_literal_term_e::CharRange: {
+    static_cast<CharRange*>(this)->Encode(enc);
+    return;
+  }
+  case class_literal_term_e::CharCode: {
+    static_cast<CharCode*>(this)->Encode(enc);
+    return;
+  }
+  case class_literal_term_e::SingleQuoted: {
+    static_cast<SingleQuoted*>(this)->Encode(enc);
+    return;
+  }
+  case class_literal_term_e::Splice: {
+    static_cast<class_literal_term__Splice*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+class_literal_term_t* class_literal_term_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case class_literal_term_e::PosixClass:
+    return PosixClass::DecodeNew(dec);
+  case class_literal_term_e::PerlClass:
+    return PerlClass::DecodeNew(dec);
+  case class_literal_term_e::CharRange:
+    return CharRange::DecodeNew(dec);
+  case class_literal_term_e::CharCode:
+    return CharCode::DecodeNew(dec);
+  case class_literal_term_e::SingleQuoted:
+    return SingleQuoted::DecodeNew(dec);
+  case class_literal_term_e::Splice:
+    return class_literal_term__Splice::DecodeNew(dec);
+  }
+  return static_cast<class_literal_term_t*>(dec->Ref(h));
+}
+BigStr* char_class_term_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case char_class_term_e::PosixClass:
+    v = "PosixClass"; break;
+  case char_class_term_e::PerlClass:
+    v = "PerlClass"; break;
+  case char_class_term_e::CharRange:
+    v = "CharRange"; break;
+  case char_class_term_e::CharCode:
+    v = "CharCode"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "char_class_term.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* char_class_term_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case char_class_term_e::PosixClass: {
+    PosixClass* obj = static_cast<PosixClass*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case char_class_term_e::PerlClass: {
+    PerlClass* obj = static_cast<PerlClass*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case char_class_term_e::CharRange: {
+    CharRange* obj = static_cast<CharRange*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case char_class_term_e::CharCode: {
+    CharCode* obj = static_cast<CharCode*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void char_class_term_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case char_class_term_e::PosixClass: {
+    static_cast<PosixClass*>(this)->Encode(enc);
+    return;
+  }
+  case char_class_term_e::PerlClass: {
+    static_cast<PerlClass*>(this)->Encode(enc);
+    return;
+  }
+  case char_class_term_e::CharRange: {
+    static_cast<CharRange*>(this)->Encode(enc);
+    return;
+  }
+  case char_class_term_e::CharCode: {
+    static_cast<CharCode*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+char_class_term_t* char_class_term_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case char_class_term_e::PosixClass:
+    return PosixClass::DecodeNew(dec);
+  case char_class_term_e::PerlClass:
+    return PerlClass::DecodeNew(dec);
+  case char_class_term_e::CharRange:
+    return CharRange::DecodeNew(dec);
+  case char_class_term_e::CharCode:
+    return CharCode::DecodeNew(dec);
+  }
+  return static_cast<char_class_term_t*>(dec->Ref(h));
+}
+BigStr* re_repeat_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case re_repeat_e::Op:
+    v = "Op"; break;
+  case re_repeat_e::Range:
+    v = "Range"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "re_repeat.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* re_repeat__Range::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(re_repeat_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->left) {  // Optional
+    hnode_t* x0 = this->left->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("left"), x0));
+  }
+
+  hnode_t* x1 = ToPretty(this->lower);
+  L->append(Alloc<Field>(StrFromC("lower"), x1));
+
+  hnode_t* x2 = ToPretty(this->upper);
+  L->append(Alloc<Field>(StrFromC("upper"), x2));
+
+  if (this->right) {  // Optional
+    hnode_t* x3 = this->right->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("right"), x3));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* re_repeat_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case re_repeat_e::Op: {
+    Token* obj = static_cast<Token*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case re_repeat_e::Range: {
+    re_repeat__Range* obj = static_cast<re_repeat__Range*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void re_repeat__Range::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, re_repeat_e::Range)) {
+    return;
+  }
+  enc->Obj(this->left);
+  enc->Str(this->lower);
+  enc->Str(this->upper);
+  enc->Obj(this->right);
+}
+
+re_repeat__Range* re_repeat__Range::DecodeNew(pyserial::Decoder* dec) {
+  re_repeat__Range* obj = re_repeat__Range::CreateNull();
+  dec->Add(obj);
+  obj->left = Token::Decode(dec);
+  obj->lower = dec->Str();
+  obj->upper = dec->Str();
+  obj->right = Token::Decode(dec);
+  return obj;
+}
+
+void re_repeat_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case re_repeat_e::Op: {
+    static_cast<Token*>(this)->Encode(enc);
+    return;
+  }
+  case re_repeat_e::Range: {
+    static_cast<re_repeat__Range*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+re_repeat_t* re_repeat_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case re_repeat_e::Op:
+    return Token::DecodeNew(dec);
+  case re_repeat_e::Range:
+    return re_repeat__Range::DecodeNew(dec);
+  }
+  return static_cast<re_repeat_t*>(dec->Ref(h));
+}
+BigStr* re_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case re_e::Primitive:
+    v = "Primitive"; break;
+  case re_e::PosixClass:
+    v = "PosixClass"; break;
+  case re_e::PerlClass:
+    v = "PerlClass"; break;
+  case re_e::CharClassLiteral:
+    v = "CharClassLiteral"; break;
+  case re_e::CharClass:
+    v = "CharClass"; break;
+  case re_e::Splice:
+    v = "Splice"; break;
+  case re_e::SingleQuoted:
+    v = "SingleQuoted"; break;
+  case re_e::Repeat:
+    v = "Repeat"; break;
+  case re_e::Seq:
+    v = "Seq"; break;
+  case re_e::Alt:
+    v = "Alt"; break;
+  case re_e::Group:
+    v = "Group"; break;
+  case re_e::Capture:
+    v = "Capture"; break;
+  case re_e::Backtracking:
+    v = "Backtracking"; break;
+  case re_e::LiteralChars:
+    v = "LiteralChars"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "re.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+hnode_t* re__Primitive::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(re_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->blame_tok->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("blame_tok"), x0));
+
+  hnode_t* x1 = Alloc<hnode::Leaf>(Id_str(this->id, false), color_e::UserType);
+  L->append(Alloc<Field>(StrFromC("id"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* re__CharClassLiteral::PrettyTree(bool do_abbrev, Dict<int, bool>*
+                                          seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(re_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->negated);
+  L->append(Alloc<Field>(StrFromC("negated"), x0));
+
+  if (this->terms != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<class_literal_term_t*> it(this->terms); !it.Done();
+         it.Next()) {
+      class_literal_term_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("terms"), x1));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* re__CharClass::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(re_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->negated);
+  L->append(Alloc<Field>(StrFromC("negated"), x0));
+
+  if (this->terms != nullptr) {  // List
+    hnode::Array* x1 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<char_class_term_t*> it(this->terms); !it.Done(); it.Next()) {
+      char_class_term_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x1->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("terms"), x1));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* re__Splice::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(re_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->name->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("name"), x0));
+
+  hnode_t* x1 = ToPretty(this->var_name);
+  L->append(Alloc<Field>(StrFromC("var_name"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* re__Repeat::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(re_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->child->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("child"), x0));
+
+  hnode_t* x1 = this->op->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("op"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* re__Seq::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(re_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->children != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<re_t*> it(this->children); !it.Done(); it.Next()) {
+      re_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("children"), x0));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* re__Alt::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(re_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  if (this->children != nullptr) {  // List
+    hnode::Array* x0 = Alloc<hnode::Array>(Alloc<List<hnode_t*>>());
+    for (ListIter<re_t*> it(this->children); !it.Done(); it.Next()) {
+      re_t* v_ = it.Value();
+      hnode_t* h = (v_ == nullptr) ? Alloc<hnode::Leaf>(StrFromC("_"),
+                    color_e::OtherConst) : v_->PrettyTree(do_abbrev, seen);
+      x0->children->append(h);
+    }
+    L->append(Alloc<Field>(StrFromC("children"), x0));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* re__Group::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(re_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->child->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("child"), x0));
+
+  return out_node;
+}
+
+
+hnode_t* re__Capture::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(re_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->child->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("child"), x0));
+
+  if (this->name) {  // Optional
+    hnode_t* x1 = this->name->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("name"), x1));
+  }
+
+  if (this->func_name) {  // Optional
+    hnode_t* x2 = this->func_name->PrettyTree(do_abbrev, seen);
+    L->append(Alloc<Field>(StrFromC("func_name"), x2));
+  }
+
+  return out_node;
+}
+
+
+hnode_t* re__Backtracking::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(re_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = ToPretty(this->negated);
+  L->append(Alloc<Field>(StrFromC("negated"), x0));
+
+  hnode_t* x1 = this->name->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("name"), x1));
+
+  hnode_t* x2 = this->child->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("child"), x2));
+
+  return out_node;
+}
+
+
+hnode_t* re__LiteralChars::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  seen = seen ? seen : Alloc<Dict<int, bool>>();
+  int heap_id = ObjectId(this);
+  if (dict_contains(seen, heap_id)) {
+    return Alloc<hnode::AlreadySeen>(heap_id);
+  }
+  seen->set(heap_id, true);
+
+  hnode::Record* out_node = runtime::NewRecord(re_str(this->tag()));
+  List<Field*>* L = out_node->fields;
+
+  hnode_t* x0 = this->blame_tok->PrettyTree(do_abbrev, seen);
+  L->append(Alloc<Field>(StrFromC("blame_tok"), x0));
+
+  hnode_t* x1 = ToPretty(this->s);
+  L->append(Alloc<Field>(StrFromC("s"), x1));
+
+  return out_node;
+}
+
+
+hnode_t* re_t::PrettyTree(bool do_abbrev, Dict<int, bool>* seen) {
+  switch (this->tag()) {
+  case re_e::Primitive: {
+    re__Primitive* obj = static_cast<re__Primitive*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case re_e::PosixClass: {
+    PosixClass* obj = static_cast<PosixClass*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case re_e::PerlClass: {
+    PerlClass* obj = static_cast<PerlClass*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case re_e::CharClassLiteral: {
+    re__CharClassLiteral* obj = static_cast<re__CharClassLiteral*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case re_e::CharClass: {
+    re__CharClass* obj = static_cast<re__CharClass*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case re_e::Splice: {
+    re__Splice* obj = static_cast<re__Splice*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case re_e::SingleQuoted: {
+    SingleQuoted* obj = static_cast<SingleQuoted*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case re_e::Repeat: {
+    re__Repeat* obj = static_cast<re__Repeat*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case re_e::Seq: {
+    re__Seq* obj = static_cast<re__Seq*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case re_e::Alt: {
+    re__Alt* obj = static_cast<re__Alt*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case re_e::Group: {
+    re__Group* obj = static_cast<re__Group*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case re_e::Capture: {
+    re__Capture* obj = static_cast<re__Capture*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case re_e::Backtracking: {
+    re__Backtracking* obj = static_cast<re__Backtracking*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  case re_e::LiteralChars: {
+    re__LiteralChars* obj = static_cast<re__LiteralChars*>(this);
+    return obj->PrettyTree(do_abbrev, seen);
+  }
+  default:
+    assert(0);
+  }
+}
+
+void re__Primitive::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, re_e::Primitive)) {
+    return;
+  }
+  enc->Obj(this->blame_tok);
+  enc->Int(this->id);
+}
+
+re__Primitive* re__Primitive::DecodeNew(pyserial::Decoder* dec) {
+  re__Primitive* obj = re__Primitive::CreateNull();
+  dec->Add(obj);
+  obj->blame_tok = Token::Decode(dec);
+  obj->id = dec->Int();
+  return obj;
+}
+
+void re__CharClassLiteral::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, re_e::CharClassLiteral)) {
+    return;
+  }
+  enc->Bool(this->negated);
+  if (this->terms == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->terms));
+    for (ListIter<class_literal_term_t*> it0(this->terms); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+re__CharClassLiteral* re__CharClassLiteral::DecodeNew(pyserial::Decoder* dec) {
+  re__CharClassLiteral* obj = re__CharClassLiteral::CreateNull();
+  dec->Add(obj);
+  obj->negated = dec->Bool();
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<class_literal_term_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      class_literal_term_t* i0;
+      i0 = class_literal_term_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->terms = c0;
+  }
+  return obj;
+}
+
+void re__CharClass::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, re_e::CharClass)) {
+    return;
+  }
+  enc->Bool(this->negated);
+  if (this->terms == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->terms));
+    for (ListIter<char_class_term_t*> it0(this->terms); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+re__CharClass* re__CharClass::DecodeNew(pyserial::Decoder* dec) {
+  re__CharClass* obj = re__CharClass::CreateNull();
+  dec->Add(obj);
+  obj->negated = dec->Bool();
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<char_class_term_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      char_class_term_t* i0;
+      i0 = char_class_term_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->terms = c0;
+  }
+  return obj;
+}
+
+void re__Splice::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, re_e::Splice)) {
+    return;
+  }
+  enc->Obj(this->name);
+  enc->Str(this->var_name);
+}
+
+re__Splice* re__Splice::DecodeNew(pyserial::Decoder* dec) {
+  re__Splice* obj = re__Splice::CreateNull();
+  dec->Add(obj);
+  obj->name = Token::Decode(dec);
+  obj->var_name = dec->Str();
+  return obj;
+}
+
+void re__Repeat::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, re_e::Repeat)) {
+    return;
+  }
+  enc->Obj(this->child);
+  enc->Obj(this->op);
+}
+
+re__Repeat* re__Repeat::DecodeNew(pyserial::Decoder* dec) {
+  re__Repeat* obj = re__Repeat::CreateNull();
+  dec->Add(obj);
+  obj->child = re_t::Decode(dec);
+  obj->op = re_repeat_t::Decode(dec);
+  return obj;
+}
+
+void re__Seq::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, re_e::Seq)) {
+    return;
+  }
+  if (this->children == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->children));
+    for (ListIter<re_t*> it0(this->children); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+re__Seq* re__Seq::DecodeNew(pyserial::Decoder* dec) {
+  re__Seq* obj = re__Seq::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<re_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      re_t* i0;
+      i0 = re_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->children = c0;
+  }
+  return obj;
+}
+
+void re__Alt::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, re_e::Alt)) {
+    return;
+  }
+  if (this->children == nullptr) {
+    enc->Null();
+  } else {
+    enc->Size(len(this->children));
+    for (ListIter<re_t*> it0(this->children); !it0.Done(); it0.Next()) {
+      enc->Obj(it0.Value());
+    }
+  }
+}
+
+re__Alt* re__Alt::DecodeNew(pyserial::Decoder* dec) {
+  re__Alt* obj = re__Alt::CreateNull();
+  dec->Add(obj);
+  int n0 = dec->Size();
+  if (n0 != -1) {
+    auto* c0 = Alloc<List<re_t*>>();
+    for (int j0 = 0; j0 < n0; ++j0) {
+      re_t* i0;
+      i0 = re_t::Decode(dec);
+      c0->append(i0);
+    }
+    obj->children = c0;
+  }
+  return obj;
+}
+
+void re__Group::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, re_e::Group)) {
+    return;
+  }
+  enc->Obj(this->child);
+}
+
+re__Group* re__Group::DecodeNew(pyserial::Decoder* dec) {
+  re__Group* obj = re__Group::CreateNull();
+  dec->Add(obj);
+  obj->child = re_t::Decode(dec);
+  return obj;
+}
+
+void re__Capture::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, re_e::Capture)) {
+    return;
+  }
+  enc->Obj(this->child);
+  enc->Obj(this->name);
+  enc->Obj(this->func_name);
+}
+
+re__Capture* re__Capture::DecodeNew(pyserial::Decoder* dec) {
+  re__Capture* obj = re__Capture::CreateNull();
+  dec->Add(obj);
+  obj->child = re_t::Decode(dec);
+  obj->name = Token::Decode(dec);
+  obj->func_name = Token::Decode(dec);
+  return obj;
+}
+
+void re__Backtracking::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, re_e::Backtracking)) {
+    return;
+  }
+  enc->Bool(this->negated);
+  enc->Obj(this->name);
+  enc->Obj(this->child);
+}
+
+re__Backtracking* re__Backtracking::DecodeNew(pyserial::Decoder* dec) {
+  re__Backtracking* obj = re__Backtracking::CreateNull();
+  dec->Add(obj);
+  obj->negated = dec->Bool();
+  obj->name = Token::Decode(dec);
+  obj->child = re_t::Decode(dec);
+  return obj;
+}
+
+void re__LiteralChars::Encode(pyserial::Encoder* enc) {
+  if (!enc->Begin(this, re_e::LiteralChars)) {
+    return;
+  }
+  enc->Obj(this->blame_tok);
+  enc->Str(this->s);
+}
+
+re__LiteralChars* re__LiteralChars::DecodeNew(pyserial::Decoder* dec) {
+  re__LiteralChars* obj = re__LiteralChars::CreateNull();
+  dec->Add(obj);
+  obj->blame_tok = Token::Decode(dec);
+  obj->s = dec->Str();
+  return obj;
+}
+
+void re_t::Encode(pyserial::Encoder* enc) {
+  switch (this->tag()) {
+  case re_e::Primitive: {
+    static_cast<re__Primitive*>(this)->Encode(enc);
+    return;
+  }
+  case re_e::PosixClass: {
+    static_cast<PosixClass*>(this)->Encode(enc);
+    return;
+  }
+  case re_e::PerlClass: {
+    static_cast<PerlClass*>(this)->Encode(enc);
+    return;
+  }
+  case re_e::CharClassLiteral: {
+    static_cast<re__CharClassLiteral*>(this)->Encode(enc);
+    return;
+  }
+  case re_e::CharClass: {
+    static_cast<re__CharClass*>(this)->Encode(enc);
+    return;
+  }
+  case re_e::Splice: {
+    static_cast<re__Splice*>(this)->Encode(enc);
+    return;
+  }
+  case re_e::SingleQuoted: {
+    static_cast<SingleQuoted*>(this)->Encode(enc);
+    return;
+  }
+  case re_e::Repeat: {
+    static_cast<re__Repeat*>(this)->Encode(enc);
+    return;
+  }
+  case re_e::Seq: {
+    static_cast<re__Seq*>(this)->Encode(enc);
+    return;
+  }
+  case re_e::Alt: {
+    static_cast<re__Alt*>(this)->Encode(enc);
+    return;
+  }
+  case re_e::Group: {
+    static_cast<re__Group*>(this)->Encode(enc);
+    return;
+  }
+  case re_e::Capture: {
+    static_cast<re__Capture*>(this)->Encode(enc);
+    return;
+  }
+  case re_e::Backtracking: {
+    static_cast<re__Backtracking*>(this)->Encode(enc);
+    return;
+  }
+  case re_e::LiteralChars: {
+    static_cast<re__LiteralChars*>(this)->Encode(enc);
+    return;
+  }
+  default:
+    assert(0);
+  }
+}
+
+re_t* re_t::Decode(pyserial::Decoder* dec) {
+  int h = dec->Head();
+  switch (h) {
+  case re_e::Primitive:
+    return re__Primitive::DecodeNew(dec);
+  case re_e::PosixClass:
+    return PosixClass::DecodeNew(dec);
+  case re_e::PerlClass:
+    return PerlClass::DecodeNew(dec);
+  case re_e::CharClassLiteral:
+    return re__CharClassLiteral::DecodeNew(dec);
+  case re_e::CharClass:
+    return re__CharClass::DecodeNew(dec);
+  case re_e::Splice:
+    return re__Splice::DecodeNew(dec);
+  case re_e::SingleQuoted:
+    return SingleQuoted::DecodeNew(dec);
+  case re_e::Repeat:
+    return re__Repeat::DecodeNew(dec);
+  case re_e::Seq:
+    return re__Seq::DecodeNew(dec);
+  case re_e::Alt:
+    return re__Alt::DecodeNew(dec);
+  case re_e::Group:
+    return re__Group::DecodeNew(dec);
+  case re_e::Capture:
+    return re__Capture::DecodeNew(dec);
+  case re_e::Backtracking:
+    return re__Backtracking::DecodeNew(dec);
+  case re_e::LiteralChars:
+    return re__LiteralChars::DecodeNew(dec);
+  }
+  return static_cast<re_t*>(dec->Ref(h));
+}
+
+}  // namespace syntax_asdl
@@ -0,0 +1,179 @@
+// _gen/frontend/types.asdl.cc is generated by asdl_main.py
+
+#include "_gen/frontend/types.asdl.h"
+#include <assert.h>
+#include "prebuilt/asdl/runtime.mycpp.h"  // from mycpp
+
+// Generated code uses these types
+using hnode_asdl::hnode;
+using hnode_asdl::Field;
+using hnode_asdl::color_e;
+
+namespace types_asdl {
+
+BigStr* bool_arg_type_str(bool_arg_type_e tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case bool_arg_type_e::Undefined:
+    v = "Undefined"; break;
+  case bool_arg_type_e::Path:
+    v = "Path"; break;
+  case bool_arg_type_e::Int:
+    v = "Int"; break;
+  case bool_arg_type_e::Str:
+    v = "Str"; break;
+  case bool_arg_type_e::Other:
+    v = "Other"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "bool_arg_type.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+BigStr* redir_arg_type_str(redir_arg_type_e tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case redir_arg_type_e::Path:
+    v = "Path"; break;
+  case redir_arg_type_e::Desc:
+    v = "Desc"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "redir_arg_type.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+BigStr* opt_group_str(int tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case opt_group_i::StrictAll:
+    v = "StrictAll"; break;
+  case opt_group_i::YshUpgrade:
+    v = "YshUpgrade"; break;
+  case opt_group_i::YshAll:
+    v = "YshAll"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "opt_group.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+BigStr* lex_mode_str(lex_mode_e tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case lex_mode_e::Undefined:
+    v = "Undefined"; break;
+  case lex_mode_e::Comment:
+    v = "Comment"; break;
+  case lex_mode_e::ShCommand:
+    v = "ShCommand"; break;
+  case lex_mode_e::ShCommandFakeBrack:
+    v = "ShCommandFakeBrack"; break;
+  case lex_mode_e::Backtick:
+    v = "Backtick"; break;
+  case lex_mode_e::DBracket:
+    v = "DBracket"; break;
+  case lex_mode_e::SQ_Raw:
+    v = "SQ_Raw"; break;
+  case lex_mode_e::DQ:
+    v = "DQ"; break;
+  case lex_mode_e::SQ_C:
+    v = "SQ_C"; break;
+  case lex_mode_e::J8_Str:
+    v = "J8_Str"; break;
+  case lex_mode_e::Arith:
+    v = "Arith"; break;
+  case lex_mode_e::ExtGlob:
+    v = "ExtGlob"; break;
+  case lex_mode_e::VSub_1:
+    v = "VSub_1"; break;
+  case lex_mode_e::VSub_2:
+    v = "VSub_2"; break;
+  case lex_mode_e::VSub_ArgUnquoted:
+    v = "VSub_ArgUnquoted"; break;
+  case lex_mode_e::VSub_ArgDQ:
+    v = "VSub_ArgDQ"; break;
+  case lex_mode_e::VSub_Zsh:
+    v = "VSub_Zsh"; break;
+  case lex_mode_e::BashRegex:
+    v = "BashRegex"; break;
+  case lex_mode_e::BashRegexFakeInner:
+    v = "BashRegexFakeInner"; break;
+  case lex_mode_e::FuncParens:
+    v = "FuncParens"; break;
+  case lex_mode_e::PrintfOuter:
+    v = "PrintfOuter"; break;
+  case lex_mode_e::PrintfPercent:
+    v = "PrintfPercent"; break;
+  case lex_mode_e::Expr:
+    v = "Expr"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "lex_mode.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+BigStr* word_mode_str(word_mode_e tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case word_mode_e::ShCommand:
+    v = "ShCommand"; break;
+  case word_mode_e::ShCommandBrack:
+    v = "ShCommandBrack"; break;
+  case word_mode_e::DBracket:
+    v = "DBracket"; break;
+  case word_mode_e::BashRegex:
+    v = "BashRegex"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "word_mode.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+BigStr* cmd_mode_str(cmd_mode_e tag, bool dot) {
+  char buf[32];
+  const char* v = nullptr;
+  switch (tag) {
+  case cmd_mode_e::Shell:
+    v = "Shell"; break;
+  case cmd_mode_e::Func:
+    v = "Func"; break;
+  case cmd_mode_e::Proc:
+    v = "Proc"; break;
+  default:
+    assert(0);
+  }
+  if (dot) {
+    snprintf(buf, 32, "cmd_mode.%s", v);
+    return StrFromC(buf);
+  } else {
+    return StrFromC(v);
+  }
+}
+
+}  // namespace types_asdl
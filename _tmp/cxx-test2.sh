@@ -0,0 +1,9 @@
+#!/usr/bin/env bash
+# usage: _tmp/cxx-test.sh TEST_MAIN.cc [more srcs...]
+cd /root/package
+out=_tmp/cxx/$(basename $1 .cc)
+mkdir -p _tmp/cxx
+g++ -std=c++11 -g -O0 -D MARK_SWEEP $CXXDEFS -Wno-invalid-offsetof -I . -o $out "$@" \
+  mycpp/bump_leak_heap.cc mycpp/gc_iolib.cc mycpp/gc_mylib.cc \
+  mycpp/gc_builtins.cc mycpp/gc_mops.cc mycpp/gc_str.cc mycpp/hash.cc \
+  mycpp/mark_sweep_heap.cc && $out
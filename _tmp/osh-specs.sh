@@ -0,0 +1,7 @@
+#!/usr/bin/env bash
+# usage: _tmp/osh-specs.sh OUT -- FATAL lines for the OSH spec suites
+cd /root/package
+for f in $(ls spec/*.test.sh | grep -v "/ysh-\|/hay\|/toysh\|/nix\|/zsh\|/blog\|/explore\|/spec-harness"); do
+  s=$(basename $f .test.sh)
+  timeout 300 _tmp/spec.sh $s 2>&1 | grep -a "FATAL" | sed "s/^/$s: /"
+done > $1 2>&1
@@ -0,0 +1,28 @@
+from _devbuild.gen.syntax_asdl import command_t, source
+from asdl import pyserial
+from core import alloc, test_lib, state, pyutil
+from frontend import reader, parse_lib
+import sys
+arena = alloc.Arena(); src = source.MainFile('x')
+mem = test_lib.MakeMem(arena)
+parse_opts, exec_opts, mutable_opts = state.MakeOpts(mem, {}, None)
+mutable_opts.SetAnyOption('ysh:all', True)
+loader = pyutil.GetResourceLoader()
+g = pyutil.LoadYshGrammar(loader)
+parse_ctx = parse_lib.ParseContext(arena, parse_opts, {}, g)
+code = open(sys.argv[1]).read()
+with alloc.ctx_SourceCode(arena, src):
+    c_parser = parse_ctx.MakeOshParser(reader.StringLineReader(code, arena))
+    nodes = []
+    while True:
+        n = c_parser.ParseLogicalLine()
+        if n is None: break
+        nodes.append(n)
+enc = pyserial.Encoder(); enc.Seed(src)
+for n in nodes: n.Encode(enc)
+s = enc.Finish()
+dec = pyserial.Decoder(s); dec.Seed(src)
+out = [command_t.Decode(dec) for _ in nodes]
+enc2 = pyserial.Encoder(); enc2.Seed(src)
+for m in out: m.Encode(enc2)
+print(len(code), len(s), enc.Ok(), dec.Ok(), dec.AtEnd(), enc2.Finish() == s)
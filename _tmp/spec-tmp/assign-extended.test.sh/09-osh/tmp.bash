@@ -0,0 +1,6 @@
+declare -- s1=foo
+declare -- s2='foo bar'
+declare -- s3=$'\u001f'
+declare -- s4=$'\xfe\xff'
+declare -a a=(foo 'foo bar' $'\u001f' $'\xfe\xff')
+declare -A A=([$'\u001f']=$'\xfe\xff' ['foo']='foo bar')
@@ -0,0 +1,3 @@
+echo start
+(:)
+echo end
@@ -0,0 +1 @@
+echo hi
\ No newline at end of file
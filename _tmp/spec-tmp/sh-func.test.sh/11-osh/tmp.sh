@@ -0,0 +1,9 @@
+
+g="global"
+local L="local"
+
+test_func() {
+  echo "g = $g"
+  echo "L = $L"
+}
+
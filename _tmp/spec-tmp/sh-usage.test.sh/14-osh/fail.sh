@@ -0,0 +1 @@
+echo fail "$@"; ( exit 42 )
@@ -0,0 +1 @@
+echo μ 'μ' "μ" $'μ'
@@ -0,0 +1,2 @@
+shopt -s parse_at
+echo lib.sh
@@ -0,0 +1 @@
+x=$(echo command sub)
@@ -0,0 +1 @@
+seq 3 | wc -l
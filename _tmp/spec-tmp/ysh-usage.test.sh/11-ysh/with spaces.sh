@@ -0,0 +1 @@
+(BAD
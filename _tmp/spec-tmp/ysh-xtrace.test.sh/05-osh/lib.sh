@@ -0,0 +1 @@
+echo "\$1 = $1"
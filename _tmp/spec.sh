@@ -0,0 +1,11 @@
+#!/usr/bin/env bash
+# usage: _tmp/spec.sh NAME [shell...]  -- run spec test with only osh/ysh
+cd /root/package
+export PYENV_VERSION=2.7.18
+name=$1; shift
+shells=${@:-bin/osh}
+source test/spec-common.sh 2>/dev/null
+set +o errexit +o pipefail
+sh-spec spec/$name.test.sh --oils-bin-dir $PWD/bin $shells > _tmp/spec-$name.log 2>&1
+grep -a "FATAL\|allowed\|	total\|FAIL" _tmp/spec-$name.log | tail -8
+grep -a -c "pass\|ok" _tmp/spec-$name.log | sed 's/^/passed-or-ok lines: /'
@@ -0,0 +1,5 @@
+#!/usr/bin/env bash
+cd /root/package
+export PYENV_VERSION=2.7.18
+test/unit.sh minimal > _tmp/unit.log 2>&1
+echo "unit status=$?"; grep -a "FAIL\|passed" _tmp/unit.log | tail -5
@@ -0,0 +1,31 @@
+import sys, collections
+sys.path[:0]=['/root/package','/root/package/vendor']
+from osh import word_
+from frontend import lexer
+from _devbuild.gen.syntax_asdl import word_part_e
+from _devbuild.gen.id_kind_asdl import Id_str
+orig = word_.FastStrEval
+C = collections.Counter()
+def Fast(w):
+    r = orig(w)
+    if r is None:
+        ok, s, q = word_.StaticEval(w)
+        key = 'static' if ok else 'dynamic'
+        if ok:
+            kinds = []
+            for p in w.parts:
+                if p.tag() == word_part_e.Literal:
+                    kinds.append(Id_str(p.id))
+                else:
+                    kinds.append(word_part_e_str(p.tag()) if 0 else str(p.tag()))
+            C['static ' + ' '.join(kinds[:4])] += 1
+        C[key] += 1
+    else:
+        C['fast'] += 1
+    return r
+word_.FastStrEval = Fast
+import atexit
+atexit.register(lambda: sys.stderr.write('\n'.join('%d %s' % (n,k) for k,n in C.most_common(25))+'\n'))
+sys.argv = ['/root/package/bin/osh'] + sys.argv[1:]
+from bin import oils_for_unix
+sys.exit(oils_for_unix.main(sys.argv))
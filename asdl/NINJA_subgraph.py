@@ -27,8 +27,19 @@ def NinjaGraph(ru):
     # Base type for pretty printing
     ru.asdl_library('asdl/hnode.asdl', pretty_print_methods=False)
 
+    # Runtime for asdl_library(serialize_methods=True)
+    ru.cc_library('//asdl/cpp_serial',
+                  srcs=['asdl/cpp_serial.cc'],
+                  deps=['//mycpp/runtime'])
+
+    # BigInt is encoded differently in the +bigint variants
+    ru.cc_binary('asdl/cpp_serial_test.cc',
+                 deps=['//asdl/cpp_serial', '//mycpp/runtime'],
+                 matrix=ninja_lib.COMPILERS_VARIANTS +
+                 ninja_lib.OTHER_VARIANTS)
+
     # ASDL schemas
-    ru.asdl_library('asdl/examples/typed_arith.asdl')
+    ru.asdl_library('asdl/examples/typed_arith.asdl', serialize_methods=True)
 
     ru.asdl_library('asdl/examples/shared_variant.asdl')
 
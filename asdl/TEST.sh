@@ -21,6 +21,10 @@ cpp-unit() {
     run-one-test 'asdl/gen_cpp_test' '' $variant
     run-one-test 'asdl/gc_test' '' $variant
   done
+
+  for variant in asan asan+bigint; do
+    run-one-test 'asdl/cpp_serial_test' '' $variant
+  done
 }
 
 py-unit() {
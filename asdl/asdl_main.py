@@ -7,6 +7,7 @@ from __future__ import print_function
 import optparse
 import os
 import sys
+import zlib
 
 from asdl import front_end
 from asdl import gen_cpp
@@ -31,6 +32,12 @@ def Options():
                  action='store_false',
                  default=True,
                  help='Whether to generate pretty printing methods')
+    p.add_option('--serialize-methods',
+                 dest='serialize_methods',
+                 action='store_true',
+                 default=False,
+                 help='Generate Encode() and Decode() methods, for a binary '
+                 'format (asdl/pyserial.py)')
 
     # Control Python constructors
 
@@ -57,6 +64,13 @@ def Options():
     return p
 
 
+def _SchemaHash(schema_path):
+    # type: (str) -> int
+    """For --serialize-methods.  The same on every platform, unlike hash()."""
+    with open(schema_path) as f:
+        return zlib.crc32(f.read()) & 0x7fffffff
+
+
 class Abbrev(object):
     """A struct for convenience"""
 
@@ -135,9 +149,12 @@ def main(argv):
         # asdl/typed_arith.asdl -> typed_arith_asdl
         ns = os.path.basename(schema_path).replace('.', '_')
 
+        schema_hash = (_SchemaHash(schema_path)
+                       if opts.serialize_methods else 0)
         debug_info = gen_cpp.WriteHeaderFile(schema_ast, ARG_0, ns,
                                              opts.pretty_print_methods,
-                                             out_prefix)
+                                             opts.serialize_methods,
+                                             schema_hash, out_prefix)
 
         if debug_info_path:
             gen_cpp.WriteDebugInfo(debug_info, ns, debug_info_path)
@@ -146,7 +163,8 @@ def main(argv):
             # No .cc file at all
             return
 
-        gen_cpp.WriteCppFile(schema_ast, ARG_0, ns, abbrev, out_prefix)
+        gen_cpp.WriteCppFile(schema_ast, ARG_0, ns, abbrev,
+                             opts.serialize_methods, out_prefix)
 
     elif action == 'mypy':  # Generated typed MyPy code
         with open(schema_path) as f:
@@ -157,7 +175,10 @@ def main(argv):
             opts.abbrev_module,
             abbrev.mod_entries,
             pretty_print_methods=opts.pretty_print_methods,
-            py_init_n=opts.py_init_n)
+            py_init_n=opts.py_init_n,
+            serialize_methods=opts.serialize_methods,
+            schema_hash=(_SchemaHash(schema_path)
+                         if opts.serialize_methods else 0))
         v4.VisitModule(schema_ast)
 
     else:
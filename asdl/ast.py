@@ -386,3 +386,35 @@ def IsDict(t):
 
     else:
         raise AssertionError()
+
+
+def SerialMethod(t):
+    # type: (NamedType) -> str
+    """For --serialize-methods: the pyserial.Encoder method for a named type.
+
+    Returns 'Obj' for types with their own Encode() method, and '' for types we
+    can't encode, like 'any'.
+    """
+    name = t.name
+    if name in ('int', 'uint16', 'id'):
+        return 'Int'
+    if name == 'bool':
+        return 'Bool'
+    if name == 'float':
+        return 'Float'
+    if name == 'string':
+        return 'Str'
+    if name == 'BigInt':
+        return 'BigInt'
+    if name == 'any':
+        return ''
+
+    r = t.resolved
+    if isinstance(r, SimpleSum):
+        return 'Int'
+    if isinstance(r, Extern):
+        return ''
+    if isinstance(r, Use):
+        _, is_pointer = TypeNameHeuristic(name)
+        return 'Obj' if is_pointer else 'Int'  # 'id' is uint16_t
+    return 'Obj'  # Sum, Product, or subtype
@@ -0,0 +1,245 @@
+// asdl/cpp_serial.cc
+
+#include "asdl/cpp_serial.h"
+
+#include <string.h>  // memcpy
+
+namespace pyserial {
+
+// Int(kBigIntTag), then Str() of the decimal digits.  It's used for values
+// that don't fit in an int64_t, and for kBigIntTag itself.
+const int64_t kBigIntTag = INT64_MIN;
+
+Encoder::Encoder()
+    : buf_(Alloc<mylib::BufWriter>()),
+      memo_(Alloc<Dict<void*, int>>()),
+      num_objs_(0),
+      ok_(true) {
+}
+
+void Encoder::Seed(void* obj) {
+  memo_->set(obj, num_objs_);
+  num_objs_++;
+}
+
+bool Encoder::Begin(void* obj, int tag) {
+  int n = memo_->get(obj, -1);
+  if (n != -1) {
+    Int(-n - 1);
+    return false;
+  }
+  Seed(obj);
+  Int(tag);
+  return true;
+}
+
+void Encoder::WriteByte(uint8_t b) {
+  buf_->EnsureMoreSpace(1);
+  uint8_t* p = buf_->LengthPointer();
+  *p = b;
+  buf_->SetLengthFrom(p + 1);
+}
+
+void Encoder::Null() {
+  WriteByte(0);
+}
+
+void Encoder::Int(int64_t i) {
+  // zig-zag
+  uint64_t z = (static_cast<uint64_t>(i) << 1) ^ static_cast<uint64_t>(i >> 63);
+  while (z >= 0x80) {
+    WriteByte((z & 0x7f) | 0x80);
+    z >>= 7;
+  }
+  WriteByte(z);
+}
+
+void Encoder::Bool(bool b) {
+  Int(b ? 1 : 0);
+}
+
+void Encoder::BigInt(mops::BigInt i) {
+  int64_t small = mops::ToC(i);
+  if (small != kBigIntTag && mops::Equal(mops::FromC(small), i)) {
+    Int(small);
+  } else {
+    Int(kBigIntTag);
+    Str(mops::ToStr(i));
+  }
+}
+
+void Encoder::Float(double f) {
+  uint64_t bits;
+  memcpy(&bits, &f, sizeof(bits));
+  for (int i = 0; i < 8; ++i) {  // little endian, regardless of the host
+    WriteByte(bits & 0xff);
+    bits >>= 8;
+  }
+}
+
+void Encoder::Str(BigStr* s) {
+  if (s == nullptr) {
+    Null();
+    return;
+  }
+  int n = len(s);
+  Int(n + 1);
+  buf_->EnsureMoreSpace(n);
+  uint8_t* p = buf_->LengthPointer();
+  memcpy(p, s->data_, n);
+  buf_->SetLengthFrom(p + n);
+}
+
+void Encoder::Size(int n) {
+  Int(n + 1);
+}
+
+void Encoder::Unsupported() {
+  ok_ = false;
+  Null();
+}
+
+BigStr* Encoder::Finish() {
+  return buf_->getvalue();
+}
+
+Decoder::Decoder(BigStr* s)
+    : s_(s), objs_(Alloc<List<void*>>()), pos_(0), ok_(true) {
+}
+
+void Decoder::Fail() {
+  ok_ = false;
+  pos_ = len(s_);  // all further reads return zero values
+}
+
+void Decoder::Seed(void* obj) {
+  objs_->append(obj);
+}
+
+void Decoder::Add(void* obj) {
+  objs_->append(obj);
+}
+
+void* Decoder::Ref(int h) {
+  if (h == 0) {
+    return nullptr;
+  }
+  int n = -h - 1;
+  if (h > 0 || n >= len(objs_)) {  // unexpected tag, or bad reference
+    Fail();
+    return nullptr;
+  }
+  return objs_->at(n);
+}
+
+int64_t Decoder::Int() {
+  const uint8_t* data = reinterpret_cast<const uint8_t*>(s_->data_);
+  int n = len(s_);
+  uint64_t z = 0;
+  int shift = 0;
+  while (true) {
+    if (pos_ >= n || shift > 63) {
+      Fail();
+      return 0;
+    }
+    uint8_t b = data[pos_];
+    pos_++;
+    z |= static_cast<uint64_t>(b & 0x7f) << shift;
+    if (b < 0x80) {
+      break;
+    }
+    shift += 7;
+  }
+  return static_cast<int64_t>(z >> 1) ^ -static_cast<int64_t>(z & 1);
+}
+
+bool Decoder::Bool() {
+  return Int() != 0;
+}
+
+mops::BigInt Decoder::BigInt() {
+  int64_t small = Int();
+  if (small != kBigIntTag) {
+    return mops::FromC(small);
+  }
+
+  BigStr* s = Str();
+  StackRoot _root(&s);
+
+  int n = s ? len(s) : 0;
+  int start = (n > 0 && s->data_[0] == '-') ? 1 : 0;
+  if (start == n) {
+    Fail();
+    return mops::ZERO;
+  }
+  for (int k = start; k < n; ++k) {
+    if (s->data_[k] < '0' || s->data_[k] > '9') {
+      Fail();
+      return mops::ZERO;
+    }
+  }
+
+#ifdef BIGINT
+  mops::BigInt ten = mops::FromC(10);
+  mops::BigInt result = mops::ZERO;
+  for (int k = start; k < n; ++k) {
+    result = mops::Add(mops::Mul(result, ten), mops::FromC(s->data_[k] - '0'));
+  }
+  return start ? mops::Negate(result) : result;
+#else
+  // Only kBigIntTag itself is in range
+  Tuple2<bool, mops::BigInt> tup = mops::FromStr2(s);
+  if (!tup.at0()) {
+    Fail();
+  }
+  return tup.at1();
+#endif
+}
+
+double Decoder::Float() {
+  if (pos_ + 8 > len(s_)) {
+    Fail();
+    return 0.0;
+  }
+  const uint8_t* data = reinterpret_cast<const uint8_t*>(s_->data_) + pos_;
+  uint64_t bits = 0;
+  for (int i = 7; i >= 0; --i) {
+    bits = (bits << 8) | data[i];
+  }
+  pos_ += 8;
+
+  double f;
+  memcpy(&f, &bits, sizeof(f));
+  return f;
+}
+
+BigStr* Decoder::Str() {
+  int64_t n = Int() - 1;
+  if (n < 0) {
+    return nullptr;
+  }
+  if (n > len(s_) - pos_) {
+    Fail();
+    return nullptr;
+  }
+  BigStr* result = StrFromC(s_->data_ + pos_, n);
+  pos_ += n;
+  return result;
+}
+
+int Decoder::Size() {
+  // Every item takes at least one byte, so the decoder can't be made to loop
+  // more than len(s) times.
+  int64_t n = Int() - 1;
+  if (n < -1 || n > len(s_) - pos_) {
+    Fail();
+    return -1;
+  }
+  return n;
+}
+
+void Decoder::Unsupported() {
+  Fail();
+}
+
+}  // namespace pyserial
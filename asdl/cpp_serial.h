@@ -0,0 +1,115 @@
+// asdl/cpp_serial.h: Binary encoding of ASDL object graphs.
+//
+// A hand-written port of asdl/pyserial.py, which describes the format.  The
+// Encode() and DecodeNew() methods generated by asdl/gen_cpp.py with
+// --serialize-methods target this API.
+
+#ifndef ASDL_CPP_SERIAL_H
+#define ASDL_CPP_SERIAL_H
+
+#include "mycpp/runtime.h"
+
+namespace pyserial {
+
+class Encoder {
+ public:
+  Encoder();
+
+  // False if the graph contained something we can't encode
+  bool Ok() {
+    return ok_;
+  }
+  void Seed(void* obj);
+
+  // Write the head of an object.  Returns true if the caller should write the
+  // fields, or false if we wrote a reference to an object already written.
+  bool Begin(void* obj, int tag);
+
+  template <typename T>
+  void Obj(T* obj) {
+    if (obj == nullptr) {
+      Null();
+    } else {
+      obj->Encode(this);
+    }
+  }
+
+  void Null();
+  void Int(int64_t i);
+  void Bool(bool b);
+  void BigInt(mops::BigInt i);
+  void Float(double f);
+  void Str(BigStr* s);
+  void Size(int n);
+  void Unsupported();
+  BigStr* Finish();
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::ClassFixed(field_mask(), sizeof(Encoder));
+  }
+
+  static constexpr uint32_t field_mask() {
+    return maskbit(offsetof(Encoder, buf_)) |
+           maskbit(offsetof(Encoder, memo_));
+  }
+
+ private:
+  void WriteByte(uint8_t b);
+
+  mylib::BufWriter* buf_;
+  Dict<void*, int>* memo_;  // object -> object number
+  int num_objs_;
+  bool ok_;
+
+  DISALLOW_COPY_AND_ASSIGN(Encoder)
+};
+
+class Decoder {
+ public:
+  explicit Decoder(BigStr* s);
+
+  bool Ok() {
+    return ok_;
+  }
+  bool AtEnd() {
+    return pos_ >= len(s_);
+  }
+  void Fail();
+  void Seed(void* obj);
+  // Register a new object, BEFORE decoding its fields
+  void Add(void* obj);
+
+  int Head() {
+    return Int();
+  }
+  // Resolve a head that isn't a new object: None or a reference
+  void* Ref(int h);
+
+  int64_t Int();
+  bool Bool();
+  mops::BigInt BigInt();
+  double Float();
+  BigStr* Str();
+  int Size();  // -1 for None
+  void Unsupported();
+
+  static constexpr ObjHeader obj_header() {
+    return ObjHeader::ClassFixed(field_mask(), sizeof(Decoder));
+  }
+
+  static constexpr uint32_t field_mask() {
+    return maskbit(offsetof(Decoder, s_)) | maskbit(offsetof(Decoder, objs_));
+  }
+
+ private:
+  BigStr* s_;
+  List<void*>* objs_;
+  int pos_;
+  bool ok_;
+
+  DISALLOW_COPY_AND_ASSIGN(Decoder)
+};
+
+}  // namespace pyserial
+
+#endif  // ASDL_CPP_SERIAL_H
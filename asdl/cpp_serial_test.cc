@@ -0,0 +1,130 @@
+// asdl/cpp_serial_test.cc
+
+#include "asdl/cpp_serial.h"
+
+#include "mycpp/runtime.h"
+#include "vendor/greatest.h"
+
+using pyserial::Decoder;
+using pyserial::Encoder;
+
+TEST primitive_test() {
+  Encoder* enc = nullptr;
+  Decoder* dec = nullptr;
+  BigStr* s = nullptr;
+  StackRoot _r1(&enc);
+  StackRoot _r2(&dec);
+  StackRoot _r3(&s);
+
+  int64_t ints[] = {0, 1, -1, 63, -64, 300, INT64_MIN, INT64_MAX};
+
+  enc = Alloc<Encoder>();
+  for (int64_t i : ints) {
+    enc->Int(i);
+  }
+  enc->Float(-2.5);
+  enc->Str(StrFromC("foo\0bar", 7));
+  enc->Str(nullptr);
+  s = enc->Finish();
+
+  // Small integers take one byte
+  ASSERT(str_equals(StrFromC("\x00\x02\x01", 3), s->slice(0, 3)));
+
+  dec = Alloc<Decoder>(s);
+  for (int64_t i : ints) {
+    ASSERT_EQ(i, dec->Int());
+  }
+  ASSERT_EQ(-2.5, dec->Float());
+  ASSERT(str_equals(StrFromC("foo\0bar", 7), dec->Str()));
+  ASSERT_EQ(nullptr, dec->Str());
+  ASSERT(dec->Ok());
+  ASSERT(dec->AtEnd());
+
+  PASS();
+}
+
+TEST bigint_test() {
+  Encoder* enc = nullptr;
+  Decoder* dec = nullptr;
+  BigStr* s = nullptr;
+  StackRoot _r1(&enc);
+  StackRoot _r2(&dec);
+  StackRoot _r3(&s);
+
+  mops::BigInt ints[] = {mops::ZERO, mops::MINUS_ONE, mops::FromC(INT64_MAX),
+                         mops::FromC(INT64_MIN)};
+
+  enc = Alloc<Encoder>();
+  for (mops::BigInt i : ints) {
+    enc->BigInt(i);
+  }
+  s = enc->Finish();
+
+  // INT64_MIN is written as digits.  Same bytes as asdl/pyserial_test.py
+  const char expected[] =
+      "\x00\x01"
+      "\xfe\xff\xff\xff\xff\xff\xff\xff\xff\x01"
+      "\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01"
+      "*-9223372036854775808";
+  ASSERT(str_equals(StrFromC(expected, sizeof(expected) - 1), s));
+
+  dec = Alloc<Decoder>(s);
+  for (mops::BigInt i : ints) {
+    ASSERT(mops::Equal(i, dec->BigInt()));
+  }
+  ASSERT(dec->Ok());
+  ASSERT(dec->AtEnd());
+
+  // Digits that aren't a number
+  const char* bad[] = {"", "-", "1-2", " 3"};
+  for (const char* digits : bad) {
+    enc = Alloc<Encoder>();
+    enc->Int(INT64_MIN);
+    enc->Str(StrFromC(digits));
+    dec = Alloc<Decoder>(enc->Finish());
+    ASSERT(mops::Equal(mops::ZERO, dec->BigInt()));
+    ASSERT(!dec->Ok());
+  }
+
+  // Out of range, which only the +bigint build can represent
+  enc = Alloc<Encoder>();
+  enc->Int(INT64_MIN);
+  enc->Str(StrFromC("-1267650600228229401496703205376"));  // -(2 ** 100)
+  dec = Alloc<Decoder>(enc->Finish());
+  mops::BigInt big = dec->BigInt();
+#ifdef BIGINT
+  ASSERT(dec->Ok());
+  ASSERT(str_equals(StrFromC("-1267650600228229401496703205376"),
+                    mops::ToStr(big)));
+
+  // And it round trips
+  enc = Alloc<Encoder>();
+  enc->BigInt(big);
+  enc->BigInt(mops::Negate(big));
+  dec = Alloc<Decoder>(enc->Finish());
+  ASSERT(mops::Equal(big, dec->BigInt()));
+  ASSERT(mops::Equal(mops::Negate(big), dec->BigInt()));
+  ASSERT(dec->Ok());
+#else
+  (void)big;
+  ASSERT(!dec->Ok());
+#endif
+
+  PASS();
+}
+
+GREATEST_MAIN_DEFS();
+
+int main(int argc, char** argv) {
+  gHeap.Init();
+
+  GREATEST_MAIN_BEGIN();
+
+  RUN_TEST(primitive_test);
+  RUN_TEST(bigint_test);
+
+  gHeap.CleanProcessExit();
+
+  GREATEST_MAIN_END();
+  return 0;
+}
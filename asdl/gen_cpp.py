@@ -92,8 +92,9 @@ hnode_t* PrettyTree(bool do_abbrev, Dict<int, bool>* seen);
 """ % (cpp_namespace, type_name))
 
 
-def WriteHeaderFile(schema_ast, ARG_0, ns, pretty_print_methods, out_prefix):
-    # type: (ast.Module, str, str, bool, str) -> Dict[str, int]
+def WriteHeaderFile(schema_ast, ARG_0, ns, pretty_print_methods,
+                    serialize_methods, schema_hash, out_prefix):
+    # type: (ast.Module, str, str, bool, bool, int, str) -> Dict[str, int]
     guard = ns.upper()
     with open(out_prefix + '.h', 'w') as f:
         f.write("""\
@@ -109,6 +110,8 @@ def WriteHeaderFile(schema_ast, ARG_0, ns, pretty_print_methods, out_prefix):
 
         if pretty_print_methods:
             f.write('#include "asdl/cpp_runtime.h"\n')
+        if serialize_methods:
+            f.write('#include "asdl/cpp_serial.h"\n')
 
         # uses, externs
         _WriteUses(f, schema_ast)
@@ -121,6 +124,13 @@ namespace %s {
 
 """ % ns)
 
+        if serialize_methods:
+            f.write("""\
+// Changes with the schema, so that stale encodings aren't decoded
+const int SCHEMA_HASH = %d;
+
+""" % schema_hash)
+
         # Must be in the namespace
         v1 = ForwardDeclareVisitor(f)
         v1.VisitModule(schema_ast)
@@ -129,6 +139,7 @@ namespace %s {
         debug_info = {}  # type: Dict[str, int]
         v2 = ClassDefVisitor(f,
                              pretty_print_methods=pretty_print_methods,
+                             serialize_methods=serialize_methods,
                              debug_info=debug_info)
         v2.VisitModule(schema_ast)
 
@@ -141,8 +152,8 @@ namespace %s {
     return debug_info
 
 
-def WriteCppFile(schema_ast, ARG_0, ns, abbrev, out_prefix):
-    # type: (ast.Module, str, str, Abbrev, str) -> None
+def WriteCppFile(schema_ast, ARG_0, ns, abbrev, serialize_methods, out_prefix):
+    # type: (ast.Module, str, str, Abbrev, bool, str) -> None
 
     with open(out_prefix + '.cc', 'w') as f:
         f.write("""\
@@ -183,7 +194,8 @@ namespace %s {
 
         v3 = MethodDefVisitor(f,
                               abbrev_ns=abbrev.ns,
-                              abbrev_mod_entries=abbrev.mod_entries)
+                              abbrev_mod_entries=abbrev.mod_entries,
+                              serialize_methods=serialize_methods)
         v3.VisitModule(schema_ast)
 
         f.write("""
@@ -368,6 +380,120 @@ def _HNodeExpr(typ, var_name):
     return code_str, none_guard
 
 
+def _EncodeLines(typ, expr, counter):
+    # type: (ast.type_expr_t, str, List[int]) -> List[str]
+    """C++ statements that write a field to a pyserial::Encoder.
+
+    Like gen_python.py, but with ListIter and DictIter.
+    """
+    if ast.IsOptional(typ):
+        typ = cast(ast.ParameterizedType, typ).children[0]
+
+    if isinstance(typ, ast.ParameterizedType):
+        n = counter[0]
+        counter[0] += 1
+
+        lines = [
+            'if (%s == nullptr) {' % expr,
+            '  enc->Null();',
+            '} else {',
+            '  enc->Size(len(%s));' % expr,
+        ]
+        if typ.type_name == 'List':
+            it = 'it%d' % n
+            lines.append('  for (ListIter<%s> %s(%s); !%s.Done(); %s.Next()) {' %
+                         (_GetCppType(typ.children[0]), it, expr, it, it))
+            body = _EncodeLines(typ.children[0], '%s.Value()' % it, counter)
+
+        elif typ.type_name == 'Dict':
+            it = 'it%d' % n
+            lines.append(
+                '  for (DictIter<%s, %s> %s(%s); !%s.Done(); %s.Next()) {' %
+                (_GetCppType(typ.children[0]), _GetCppType(
+                    typ.children[1]), it, expr, it, it))
+            body = _EncodeLines(typ.children[0], '%s.Key()' % it, counter)
+            body.extend(
+                _EncodeLines(typ.children[1], '%s.Value()' % it, counter))
+
+        else:
+            raise AssertionError(typ.type_name)
+
+        lines.extend('    ' + line for line in body)
+        lines.append('  }')
+        lines.append('}')
+        return lines
+
+    assert isinstance(typ, ast.NamedType), typ
+    method = ast.SerialMethod(typ)
+    if not method:
+        return ['enc->Unsupported();']
+    if isinstance(typ.resolved, ast.SimpleSum):  # may be an enum class
+        expr = 'static_cast<int>(%s)' % expr
+    return ['enc->%s(%s);' % (method, expr)]
+
+
+def _DecodeLines(typ, lhs, counter):
+    # type: (ast.type_expr_t, str, List[int]) -> List[str]
+    """C++ statements that read a field from a pyserial::Decoder."""
+    if ast.IsOptional(typ):
+        typ = cast(ast.ParameterizedType, typ).children[0]
+
+    if isinstance(typ, ast.ParameterizedType):
+        n = counter[0]
+        counter[0] += 1
+
+        size = 'n%d' % n
+        c = 'c%d' % n
+        lines = [
+            'int %s = dec->Size();' % size,
+            'if (%s != -1) {' % size,
+            '  auto* %s = Alloc<%s>();' % (c, _GetCppType(typ)[:-1]),
+            '  for (int j%d = 0; j%d < %s; ++j%d) {' % (n, n, size, n),
+        ]
+        if typ.type_name == 'List':
+            item = 'i%d' % n
+            body = ['%s %s;' % (_GetCppType(typ.children[0]), item)]
+            body.extend(_DecodeLines(typ.children[0], item, counter))
+            body.append('%s->append(%s);' % (c, item))
+
+        elif typ.type_name == 'Dict':
+            k = 'k%d' % n
+            v = 'v%d' % n
+            body = [
+                '%s %s;' % (_GetCppType(typ.children[0]), k),
+                '%s %s;' % (_GetCppType(typ.children[1]), v),
+            ]
+            body.extend(_DecodeLines(typ.children[0], k, counter))
+            body.extend(_DecodeLines(typ.children[1], v, counter))
+            body.append('%s->set(%s, %s);' % (c, k, v))
+
+        else:
+            raise AssertionError(typ.type_name)
+
+        lines.extend('    ' + line for line in body)
+        lines.append('  }')
+        lines.append('  %s = %s;' % (lhs, c))
+        lines.append('}')
+        return lines
+
+    assert isinstance(typ, ast.NamedType), typ
+    method = ast.SerialMethod(typ)
+    if not method:
+        return ['dec->Unsupported();', '%s = nullptr;' % lhs]
+
+    if method != 'Obj':
+        if isinstance(typ.resolved, ast.SimpleSum):
+            return [
+                '%s = static_cast<%s>(dec->Int());' % (lhs, _GetCppType(typ))
+            ]
+        return ['%s = dec->%s();' % (lhs, method)]
+
+    # e.g. command_t::Decode(dec) or syntax_asdl::Token::Decode(dec)
+    cpp_type = _GetCppType(typ)
+    assert cpp_type.endswith('*'), cpp_type
+    return ['%s = %s::Decode(dec);' % (lhs, cpp_type[:-1])]
+
+
 # Variant tags are NOT unique:
 #   for each sum type, they go from 0, 1, 2 ... N
 #   There can be up to 64
@@ -383,6 +509,7 @@ class ClassDefVisitor(visitor.AsdlVisitor):
             self,
             f,  # type: IO[bytes]
             pretty_print_methods=True,  # type: bool
+            serialize_methods=False,  # type: bool
             debug_info=None,  # type: Optional[Dict[str, Any]]
     ):
         # type: (...) -> None
@@ -393,6 +520,7 @@ class ClassDefVisitor(visitor.AsdlVisitor):
         """
         visitor.AsdlVisitor.__init__(self, f)
         self.pretty_print_methods = pretty_print_methods
+        self.serialize_methods = serialize_methods
         self.debug_info = debug_info if debug_info is not None else {}
 
         self._shared_type_tags = {}  # type: Dict[str, int]
@@ -543,6 +671,10 @@ class ClassDefVisitor(visitor.AsdlVisitor):
                 '  hnode_t* PrettyTree(bool do_abbrev, Dict<int, bool>* seen = nullptr);'
             )
 
+        if self.serialize_methods:
+            Emit('  void Encode(pyserial::Encoder* enc);')
+            Emit('  static %(sum_name)s_t* Decode(pyserial::Decoder* dec);')
+
         Emit('')
         Emit('  DISALLOW_COPY_AND_ASSIGN(%(sum_name)s_t)')
         Emit('};')
@@ -602,15 +734,29 @@ class ClassDefVisitor(visitor.AsdlVisitor):
         self.Emit('};', depth)
         self.Emit('', depth)
 
-    def _EmitMethodsInHeader(self, obj_header_str):
-        # type: (str) -> None
-        """Generate PrettyTree(), type_id(), obj_header()"""
+    def _EmitMethodsInHeader(self, obj_header_str, class_name='',
+                             decode_new=False, decode=False):
+        # type: (str, str, bool, bool) -> None
+        """Generate PrettyTree(), type_id(), obj_header()
+
+        And Encode(), DecodeNew(), Decode() for --serialize-methods.
+        """
         if self.pretty_print_methods:
             self.Emit(
                 'hnode_t* PrettyTree(bool do_abbrev, Dict<int, bool>* seen = nullptr);'
             )
             self.Emit('')
 
+        if self.serialize_methods:
+            self.Emit('void Encode(pyserial::Encoder* enc);')
+            if decode_new:
+                self.Emit('static %s* DecodeNew(pyserial::Decoder* dec);' %
+                          class_name)
+            if decode:
+                self.Emit('static %s* Decode(pyserial::Decoder* dec);' %
+                          class_name)
+            self.Emit('')
+
         self.Emit('static constexpr ObjHeader obj_header() {')
         self.Emit('  return %s;' % obj_header_str)
         self.Emit('}')
@@ -652,7 +798,10 @@ class ClassDefVisitor(visitor.AsdlVisitor):
         # field_mask() should call List superclass, since say word_t won't have it
         obj_header_str = 'ObjHeader::TaggedSubtype(%d, field_mask())' % tag_num
         self.Indent()
-        self._EmitMethodsInHeader(obj_header_str)
+        self._EmitMethodsInHeader(obj_header_str,
+                                  class_name=class_name,
+                                  decode_new=True,
+                                  decode=True)
         self.Dedent()
 
         self._GenClassEnd(class_name, depth)
@@ -727,8 +876,14 @@ class ClassDefVisitor(visitor.AsdlVisitor):
 
         obj_header_str = 'ObjHeader::AsdlClass(%s, %d)' % (tag_num,
                                                            len(managed_fields))
+        # Variants are decoded by the sum type's Decode(), and zero arg
+        # singletons like command__NoOp don't need DecodeNew().
+        is_variant = '__' in class_name
         self.Indent()
-        self._EmitMethodsInHeader(obj_header_str)
+        self._EmitMethodsInHeader(obj_header_str,
+                                  class_name=class_name,
+                                  decode_new=bool(fields) or not is_variant,
+                                  decode=not is_variant)
         self.Dedent()
 
         #
@@ -794,11 +949,19 @@ class MethodDefVisitor(visitor.AsdlVisitor):
     circular dependencies.
     """
 
-    def __init__(self, f, abbrev_ns=None, abbrev_mod_entries=None):
-        # type: (IO[bytes], Optional[Any], List[Any]) -> None
+    def __init__(self,
+                 f,
+                 abbrev_ns=None,
+                 abbrev_mod_entries=None,
+                 serialize_methods=False):
+        # type: (IO[bytes], Optional[Any], List[Any], bool) -> None
         visitor.AsdlVisitor.__init__(self, f)
         self.abbrev_ns = abbrev_ns
         self.abbrev_mod_entries = abbrev_mod_entries or []
+        self.serialize_methods = serialize_methods
+
+        # Must match ClassDefVisitor
+        self._product_counter = MAX_VARIANTS_PER_SUM
 
     def _EmitList(self, list_str, item_type, out_val_name):
         # type: (str, ast.type_expr_t, str) -> None
@@ -1023,6 +1186,136 @@ class MethodDefVisitor(visitor.AsdlVisitor):
         self.Emit('  }', depth)
         self.Emit('}', depth)
 
+    def _EmitEncode(self, class_name, tag_str, body):
+        # type: (str, str, List[str]) -> None
+        self.Emit('')
+        self.Emit('void %s::Encode(pyserial::Encoder* enc) {' % class_name)
+        self.Emit('  if (!enc->Begin(this, %s)) {' % tag_str)
+        self.Emit('    return;')
+        self.Emit('  }')
+        for line in body:
+            self.Emit('  ' + line, reflow=False)
+        self.Emit('}')
+
+    def _EmitDecodeHead(self, class_name, tag_num):
+        # type: (str, int) -> None
+        """For a field whose type is a product type, like Token."""
+        self.Emit('')
+        self.Emit('%s* %s::Decode(pyserial::Decoder* dec) {' %
+                  (class_name, class_name))
+        self.Emit('  int h = dec->Head();')
+        self.Emit('  if (h == %d) {' % tag_num)
+        self.Emit('    return %s::DecodeNew(dec);' % class_name)
+        self.Emit('  }')
+        self.Emit('  return static_cast<%s*>(dec->Ref(h));' % class_name)
+        self.Emit('}')
+
+    def _EmitSerializeMethods(self, class_name, fields, tag_str,
+                              product_tag=-1):
+        # type: (str, List[ast.Field], str, int) -> None
+        body = []  # type: List[str]
+        counter = [0]
+        for field in fields:
+            body.extend(_EncodeLines(field.typ, 'this->%s' % field.name,
+                                     counter))
+        self._EmitEncode(class_name, tag_str, body)
+
+        if not fields and product_tag == -1:
+            return  # singleton
+
+        self.Emit('')
+        self.Emit('%s* %s::DecodeNew(pyserial::Decoder* dec) {' %
+                  (class_name, class_name))
+        if fields:
+            self.Emit('  %s* obj = %s::CreateNull();' %
+                      (class_name, class_name))
+        else:
+            self.Emit('  %s* obj = Alloc<%s>();' % (class_name, class_name))
+        # Register before the fields, like Encoder::Begin()
+        self.Emit('  dec->Add(obj);')
+        counter = [0]
+        for field in fields:
+            for line in _DecodeLines(field.typ, 'obj->%s' % field.name,
+                                     counter):
+                self.Emit('  ' + line, reflow=False)
+        self.Emit('  return obj;')
+        self.Emit('}')
+
+        if product_tag != -1:
+            self._EmitDecodeHead(class_name, product_tag)
+
+    def _EmitSerializeMethodsForList(self, class_name, item_type, tag_num):
+        # type: (str, ast.type_expr_t, int) -> None
+        c_item_type = _GetCppType(item_type)
+
+        body = [
+            'enc->Size(len(this));',
+            'for (ListIter<%s> it(this); !it.Done(); it.Next()) {' %
+            c_item_type,
+        ]
+        body.extend('  ' + line
+                    for line in _EncodeLines(item_type, 'it.Value()', [0]))
+        body.append('}')
+        self._EmitEncode(class_name, str(tag_num), body)
+
+        self.Emit('')
+        self.Emit('%s* %s::DecodeNew(pyserial::Decoder* dec) {' %
+                  (class_name, class_name))
+        self.Emit('  %s* obj = %s::New();' % (class_name, class_name))
+        self.Emit('  dec->Add(obj);')
+        self.Emit('  int n = dec->Size();')
+        self.Emit('  for (int j = 0; j < n; ++j) {')
+        self.Emit('    %s item;' % c_item_type)
+        for line in _DecodeLines(item_type, 'item', [0]):
+            self.Emit('    ' + line, reflow=False)
+        self.Emit('    obj->append(item);')
+        self.Emit('  }')
+        self.Emit('  return obj;')
+        self.Emit('}')
+
+        self._EmitDecodeHead(class_name, tag_num)
+
+    def _EmitSumSerializeMethods(self, sum, sum_name):
+        # type: (ast.Sum, str) -> None
+        """Emit dispatch WITHOUT using 'virtual', like PrettyTree()."""
+        self.Emit('')
+        self.Emit('void %s_t::Encode(pyserial::Encoder* enc) {' % sum_name)
+        self.Emit('  switch (this->tag()) {')
+        for variant in sum.types:
+            if variant.shared_type:
+                subtype_name = variant.shared_type
+            else:
+                subtype_name = '%s__%s' % (sum_name, variant.name)
+            self.Emit('  case %s_e::%s: {' % (sum_name, variant.name))
+            self.Emit('    static_cast<%s*>(this)->Encode(enc);' %
+                      subtype_name)
+            self.Emit('    return;')
+            self.Emit('  }')
+        self.Emit('  default:')
+        self.Emit('    assert(0);')
+        self.Emit('  }')
+        self.Emit('}')
+
+        self.Emit('')
+        self.Emit('%s_t* %s_t::Decode(pyserial::Decoder* dec) {' %
+                  (sum_name, sum_name))
+        self.Emit('  int h = dec->Head();')
+        self.Emit('  switch (h) {')
+        for variant in sum.types:
+            self.Emit('  case %s_e::%s:' % (sum_name, variant.name))
+            if variant.shared_type:
+                self.Emit('    return %s::DecodeNew(dec);' %
+                          variant.shared_type)
+            elif len(variant.fields) == 0:
+                self.Emit('    dec->Add(%s::%s);' % (sum_name, variant.name))
+                self.Emit('    return %s::%s;' % (sum_name, variant.name))
+            else:
+                self.Emit('    return %s__%s::DecodeNew(dec);' %
+                          (sum_name, variant.name))
+        self.Emit('  }')
+        self.Emit('  return static_cast<%s_t*>(dec->Ref(h));' % sum_name)
+        self.Emit('}')
+
     def VisitSimpleSum(self, sum, name, depth):
         # type: (ast.SimpleSum, str, int) -> None
         if 'integers' in sum.generate or 'uint16' in sum.generate:
@@ -1085,12 +1378,33 @@ class MethodDefVisitor(visitor.AsdlVisitor):
         self.Emit('  }')
         self.Emit('}')
 
+        if self.serialize_methods:
+            for variant in sum.types:
+                if variant.shared_type:
+                    continue
+                self._EmitSerializeMethods(
+                    '%s__%s' % (sum_name, variant.name), variant.fields,
+                    '%s_e::%s' % (sum_name, variant.name))
+            self._EmitSumSerializeMethods(sum, sum_name)
+
     def VisitProduct(self, product, name, depth):
         # type: (ast.Product, str, int) -> None
+        tag_num = self._product_counter
+        self._product_counter += 1
+
         self._EmitPrettyPrintMethods(name, product.fields)
 
+        if self.serialize_methods:
+            self._EmitSerializeMethods(name,
+                                       product.fields,
+                                       str(tag_num),
+                                       product_tag=tag_num)
+
     def VisitSubType(self, subtype):
         # type: (ast.SubTypeDecl) -> None
+        tag_num = self._product_counter
+        self._product_counter += 1
+
         list_item_type = None
         b = subtype.base_class
         if isinstance(b, ast.ParameterizedType):
@@ -1098,3 +1412,7 @@ class MethodDefVisitor(visitor.AsdlVisitor):
                 list_item_type = b.children[0]
         self._EmitPrettyPrintMethods(subtype.name, [],
                                      list_item_type=list_item_type)
+
+        if self.serialize_methods and list_item_type:
+            self._EmitSerializeMethodsForList(subtype.name, list_item_type,
+                                              tag_num)
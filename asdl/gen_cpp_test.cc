@@ -325,6 +325,52 @@ TEST walker_test() {
   PASS();
 }
 
+TEST serialize_test() {
+  auto* shared = Alloc<arith_expr::Var>(StrFromC("x"));
+  auto* slice = Alloc<arith_expr::Slice>(Alloc<arith_expr::Const>(42), nullptr,
+                                         nullptr, Alloc<arith_expr::Big>(-7));
+  auto* args = NewList<arith_expr_t*>({arith_expr::NoOp, shared, slice});
+  auto* node = Alloc<arith_expr::Binary>(StrFromC("+"), shared,
+                                         Alloc<arith_expr::FuncCall>(
+                                             StrFromC("f"), args));
+
+  auto* enc = Alloc<pyserial::Encoder>();
+  node->Encode(enc);
+  ASSERT(enc->Ok());
+  BigStr* s = enc->Finish();
+
+  auto* dec = Alloc<pyserial::Decoder>(s);
+  arith_expr_t* result = arith_expr_t::Decode(dec);
+  ASSERT(dec->Ok());
+  ASSERT(dec->AtEnd());
+
+  ASSERT_EQ(arith_expr_e::Binary, result->tag());
+  auto* b = static_cast<arith_expr::Binary*>(result);
+  auto* f = static_cast<arith_expr::FuncCall*>(b->right);
+  // Sharing and singletons are preserved
+  ASSERT_EQ(b->left, f->args->at(1));
+  ASSERT_EQ(arith_expr::NoOp, f->args->at(0));
+
+  auto* slice2 = static_cast<arith_expr::Slice*>(f->args->at(2));
+  ASSERT_EQ(42, static_cast<arith_expr::Const*>(slice2->a)->i);
+  ASSERT_EQ(nullptr, slice2->begin);
+  ASSERT_EQ(-7, static_cast<arith_expr::Big*>(slice2->stride)->b);
+
+  // Re-encoding gives the same bytes
+  auto* enc2 = Alloc<pyserial::Encoder>();
+  result->Encode(enc2);
+  ASSERT(str_equals(s, enc2->Finish()));
+
+  // Every prefix fails cleanly
+  for (int i = 0; i < len(s); ++i) {
+    auto* d = Alloc<pyserial::Decoder>(s->slice(0, i));
+    arith_expr_t::Decode(d);
+    ASSERT(!d->Ok());
+  }
+
+  PASS();
+}
+
 GREATEST_MAIN_DEFS();
 
 int main(int argc, char** argv) {
@@ -340,6 +386,7 @@ int main(int argc, char** argv) {
   RUN_TEST(string_defaults_test);
   RUN_TEST(list_defaults_test);
   RUN_TEST(walker_test);
+  RUN_TEST(serialize_test);
 
   gHeap.CleanProcessExit();
 
@@ -177,6 +177,111 @@ def _HNodeExpr(typ, var_name):
     return code_str, none_guard
 
 
+def _EncodeLines(typ, expr, counter):
+    # type: (ast.type_expr_t, str, List[int]) -> List[str]
+    """Python statements that write a field to a pyserial.Encoder."""
+    if ast.IsOptional(typ):  # None is encoded by each method
+        typ = cast(ast.ParameterizedType, typ).children[0]
+
+    if isinstance(typ, ast.ParameterizedType):
+        n = counter[0]
+        counter[0] += 1
+
+        lines = [
+            'if %s is None:' % expr,
+            '  enc.Null()',
+            'else:',
+            '  enc.Size(len(%s))' % expr,
+        ]
+        if typ.type_name == 'List':
+            item = 'i%d' % n
+            lines.append('  for %s in %s:' % (item, expr))
+            body = _EncodeLines(typ.children[0], item, counter)
+
+        elif typ.type_name == 'Dict':
+            k = 'k%d' % n
+            v = 'v%d' % n
+            lines.append('  for %s, %s in %s.iteritems():' % (k, v, expr))
+            body = _EncodeLines(typ.children[0], k, counter)
+            body.extend(_EncodeLines(typ.children[1], v, counter))
+
+        else:
+            raise AssertionError(typ.type_name)
+
+        lines.extend('    ' + line for line in body)
+        return lines
+
+    assert isinstance(typ, ast.NamedType), typ
+    method = ast.SerialMethod(typ)
+    if method:
+        return ['enc.%s(%s)' % (method, expr)]
+    return ['enc.Unsupported()']
+
+
+def _DecodeLines(typ, lhs, counter, imports):
+    # type: (ast.type_expr_t, str, List[int], List[str]) -> List[str]
+    """Python statements that read a field from a pyserial.Decoder.
+
+    Args:
+      imports: filled in with import lines that the statements need
+    """
+    if ast.IsOptional(typ):
+        typ = cast(ast.ParameterizedType, typ).children[0]
+
+    if isinstance(typ, ast.ParameterizedType):
+        n = counter[0]
+        counter[0] += 1
+
+        size = 'n%d' % n
+        c = 'c%d' % n
+        lines = [
+            '%s = dec.Size()' % size,
+            'if %s != -1:' % size,
+        ]
+        if typ.type_name == 'List':
+            item = 'i%d' % n
+            lines.append('  %s = []  # type: %s' % (c, _MyPyType(typ)))
+            lines.append('  for _ in xrange(%s):' % size)
+            body = _DecodeLines(typ.children[0], item, counter, imports)
+            body.append('%s.append(%s)' % (c, item))
+
+        elif typ.type_name == 'Dict':
+            k = 'k%d' % n
+            v = 'v%d' % n
+            lines.append('  %s = NewDict()  # type: %s' % (c, _MyPyType(typ)))
+            lines.append('  for _ in xrange(%s):' % size)
+            body = _DecodeLines(typ.children[0], k, counter, imports)
+            body.extend(_DecodeLines(typ.children[1], v, counter, imports))
+            body.append('%s[%s] = %s' % (c, k, v))
+
+        else:
+            raise AssertionError(typ.type_name)
+
+        lines.extend('    ' + line for line in body)
+        lines.append('  %s = %s' % (lhs, c))
+        return lines
+
+    assert isinstance(typ, ast.NamedType), typ
+    method = ast.SerialMethod(typ)
+    if not method:
+        return ['dec.Unsupported()', '%s = None' % lhs]
+
+    if method != 'Obj':
+        return ['%s = dec.%s()' % (lhs, method)]
+
+    r = typ.resolved
+    if isinstance(r, ast.Use):
+        py_name, _ = ast.TypeNameHeuristic(typ.name)
+        # Imported lazily, because schemas that 'use' each other form cycles
+        imp = 'from _devbuild.gen.%s_asdl import %s' % (r.module_parts[-1],
+                                                        py_name)
+        if imp not in imports:
+            imports.append(imp)
+    else:
+        py_name = _MyPyType(typ)
+    return ['%s = %s.Decode(dec)' % (lhs, py_name)]
+
+
 class GenMyPyVisitor(visitor.AsdlVisitor):
     """Generate Python code with MyPy type annotations."""
 
@@ -187,6 +292,8 @@ class GenMyPyVisitor(visitor.AsdlVisitor):
             abbrev_mod_entries=None,  # type: Optional[List[str]]
             pretty_print_methods=True,  # type: bool
             py_init_n=False,  # type: bool
+            serialize_methods=False,  # type: bool
+            schema_hash=0,  # type: int
     ):
         # type: (...) -> None
 
@@ -195,6 +302,8 @@ class GenMyPyVisitor(visitor.AsdlVisitor):
         self.abbrev_mod_entries = abbrev_mod_entries or []
         self.pretty_print_methods = pretty_print_methods
         self.py_init_n = py_init_n
+        self.serialize_methods = serialize_methods
+        self.schema_hash = schema_hash
 
         self._shared_type_tags = {}  # type: Dict[str, int]
         self._product_counter = 64  # matches asdl/gen_cpp.py
@@ -248,6 +357,15 @@ from asdl.runtime import NewRecord, NewLeaf, TraversalState
 from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, Field
 
 """)
+        if self.serialize_methods:
+            f.write("""\
+from asdl import pyserial
+from mycpp.mylib import NewDict
+
+# Changes with the schema, so that stale encodings aren't decoded
+SCHEMA_HASH = %d
+
+""" % self.schema_hash)
         if self.abbrev_module:
             f.write('from %s import *\n' % self.abbrev_module)
             f.write('\n')
@@ -400,8 +518,13 @@ from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, Field
         self.Emit('class %s(%s):' % (class_name, ', '.join(base_classes)))
         self.Emit('  _type_tag = %d' % tag_num)
 
-    def _GenListSubclass(self, class_name, base_classes, tag_num, class_ns=''):
-        # type: (str, List[str], int, str) -> None
+    def _GenListSubclass(self,
+                         class_name,
+                         base_classes,
+                         tag_num,
+                         item_type,
+                         class_ns=''):
+        # type: (str, List[str], int, ast.type_expr_t, str) -> None
         self._GenClassBegin(class_name, base_classes, tag_num)
 
         # TODO: Do something nicer
@@ -436,6 +559,9 @@ from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, Field
         if self.pretty_print_methods:
             self._EmitPrettyPrintMethodsForList(class_name)
 
+        if self.serialize_methods:
+            self._EmitSerializeMethodsForList(class_name, item_type, tag_num)
+
     def _GenClass(
             self,
             fields,  # type: List[ast.Field]
@@ -501,6 +627,101 @@ from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, Field
         if self.pretty_print_methods:
             self._EmitPrettyPrintMethods(class_name, class_ns, fields)
 
+        # Encode(), DecodeNew(), Decode()
+        if self.serialize_methods:
+            self._EmitSerializeMethods(class_name, class_ns, fields, tag_num)
+
+    def _EmitDecodeHead(self, class_name, tag_num):
+        # type: (str, int) -> None
+        """For a field whose type is a product type, like Token."""
+        self.Emit('  @staticmethod')
+        self.Emit('  def Decode(dec):')
+        self.Emit('    # type: (pyserial.Decoder) -> %s' % class_name)
+        self.Emit('    h = dec.Head()')
+        self.Emit('    if h == %d:' % tag_num)
+        self.Emit('      return %s.DecodeNew(dec)' % class_name)
+        self.Emit('    return cast(%s, dec.Ref(h))' % class_name)
+        self.Emit('')
+
+    def _EmitSerializeMethods(self, class_name, class_ns, fields, tag_num):
+        # type: (str, str, List[ast.Field], int) -> None
+        self.Emit('  def Encode(self, enc):')
+        self.Emit('    # type: (pyserial.Encoder) -> None')
+        self.Emit('    if not enc.Begin(self, %d):' % tag_num)
+        self.Emit('      return')
+        counter = [0]
+        for field in fields:
+            for line in _EncodeLines(field.typ, 'self.%s' % field.name,
+                                     counter):
+                self.Emit('    ' + line, reflow=False)
+        self.Emit('')
+
+        if not fields and '__' in class_name:
+            # Zero arg singletons like command__NoOp are decoded by the sum
+            # type's Decode(), so that they stay singletons.
+            return
+
+        qualified = class_ns + class_name
+
+        counter = [0]
+        imports = []  # type: List[str]
+        body = []  # type: List[str]
+        for field in fields:
+            body.extend(
+                _DecodeLines(field.typ, 'obj.%s' % field.name, counter,
+                             imports))
+
+        self.Emit('  @staticmethod')
+        self.Emit('  def DecodeNew(dec):')
+        self.Emit('    # type: (pyserial.Decoder) -> %s' % qualified)
+        for line in imports:
+            self.Emit('    ' + line, reflow=False)
+        if fields:
+            self.Emit('    obj = %s.CreateNull()' % qualified)
+        else:
+            self.Emit('    obj = %s()' % qualified)
+        # Register before the fields, like Encoder.Begin()
+        self.Emit('    dec.Add(obj)')
+        for line in body:
+            self.Emit('    ' + line, reflow=False)
+        self.Emit('    return obj')
+        self.Emit('')
+
+        if not class_ns:  # product type
+            self._EmitDecodeHead(class_name, tag_num)
+
+    def _EmitSerializeMethodsForList(self, class_name, item_type, tag_num):
+        # type: (str, ast.type_expr_t, int) -> None
+
+        self.Emit('  def Encode(self, enc):')
+        self.Emit('    # type: (pyserial.Encoder) -> None')
+        self.Emit('    if not enc.Begin(self, %d):' % tag_num)
+        self.Emit('      return')
+        self.Emit('    enc.Size(len(self))')
+        self.Emit('    for i in self:')
+        for line in _EncodeLines(item_type, 'i', [0]):
+            self.Emit('      ' + line, reflow=False)
+        self.Emit('')
+
+        imports = []  # type: List[str]
+        body = _DecodeLines(item_type, 'item', [0], imports)
+
+        self.Emit('  @staticmethod')
+        self.Emit('  def DecodeNew(dec):')
+        self.Emit('    # type: (pyserial.Decoder) -> %s' % class_name)
+        for line in imports:
+            self.Emit('    ' + line, reflow=False)
+        self.Emit('    obj = %s.New()' % class_name)
+        self.Emit('    dec.Add(obj)')
+        self.Emit('    for _ in xrange(dec.Size()):')
+        for line in body:
+            self.Emit('      ' + line, reflow=False)
+        self.Emit('      obj.append(item)')
+        self.Emit('    return obj')
+        self.Emit('')
+
+        self._EmitDecodeHead(class_name, tag_num)
+
     def _EmitPrettyBegin(self):
         # type: () -> None
         self.Emit('  def PrettyTree(self, do_abbrev, trav=None):')
@@ -635,6 +856,9 @@ from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, Field
         self.Emit('  # type: () -> int')
         self.Emit('  return self._type_tag')
 
+        if self.serialize_methods:
+            self._EmitSumDecode(sum, sum_name)
+
         self.Dedent()
         depth = self.current_depth
 
@@ -678,6 +902,26 @@ from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, Field
         self.Dedent()
         self.Emit('')
 
+    def _EmitSumDecode(self, sum, sum_name):
+        # type: (ast.Sum, str) -> None
+        """Dispatch on the tag, without a dict."""
+        self.Emit('', 0)
+        self.Emit('@staticmethod')
+        self.Emit('def Decode(dec):')
+        self.Emit('  # type: (pyserial.Decoder) -> %s_t' % sum_name)
+        self.Emit('  h = dec.Head()')
+        for variant in sum.types:
+            self.Emit('  if h == %s_e.%s:' % (sum_name, variant.name))
+            if variant.shared_type:
+                self.Emit('    return %s.DecodeNew(dec)' % variant.shared_type)
+            elif len(variant.fields) == 0:
+                self.Emit('    dec.Add(%s.%s)' % (sum_name, variant.name))
+                self.Emit('    return %s.%s' % (sum_name, variant.name))
+            else:
+                self.Emit('    return %s.%s.DecodeNew(dec)' %
+                          (sum_name, variant.name))
+        self.Emit('  return cast(%s_t, dec.Ref(h))' % sum_name)
+
     def VisitSubType(self, subtype):
         # type: (ast.SubTypeDecl) -> None
         self._shared_type_tags[subtype.name] = self._product_counter
@@ -716,6 +960,8 @@ from _devbuild.gen.hnode_asdl import color_e, hnode, hnode_e, hnode_t, Field
             bases.append(_MyPyType(subtype.base_class))
 
             if ast.IsList(subtype.base_class):
-                self._GenListSubclass(subtype.name, bases, tag_num)
+                item_type = cast(ast.ParameterizedType,
+                                 subtype.base_class).children[0]
+                self._GenListSubclass(subtype.name, bases, tag_num, item_type)
             else:
                 self._GenClass([], subtype.name, bases, tag_num)
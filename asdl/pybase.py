@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from _devbuild.gen.hnode_asdl import hnode_t
     from asdl.runtime import TraversalState
+    from asdl.pyserial import Encoder
 
 
 class SimpleObj(int):
@@ -26,6 +27,11 @@ class CompoundObj(object):
         # type: (bool, TraversalState) -> hnode_t
         raise NotImplementedError(self.__class__.__name__)
 
+    def Encode(self, enc):
+        # type: (Encoder) -> None
+        """Generated with asdl_main.py --serialize-methods"""
+        raise NotImplementedError(self.__class__.__name__)
+
     def __repr__(self):
         # type: () -> str
         """Print this ASDL object nicely."""
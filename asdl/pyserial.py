@@ -0,0 +1,265 @@
+#!/usr/bin/env python2
+"""pyserial.py - Binary encoding of ASDL object graphs.
+
+It's the runtime library for the Encode() and DecodeNew() methods that
+asdl/gen_{python,cpp}.py generate with --serialize-methods.  It's ported to
+C++ by hand, in asdl/cpp_serial.{h,cc}.
+
+The format is a stream of varints:
+
+  Int(i)    zig-zag LEB128 of a signed 64-bit integer
+  Float(f)  8 bytes of IEEE 754, little endian
+  Str(s)    Int(len(s) + 1), then the bytes.  Int(0) means None.
+  Size(n)   Int(n + 1), before the items of a List or Dict.  Int(0) is None.
+  BigInt(i) Int(i), or if i is outside (-2**63, 2**63), Int(-2**63) and then
+            Str() of the decimal digits.  The +bigint C++ build has such
+            values.
+
+An object is written as a "head" integer, then its fields in schema order:
+
+  0         None
+  tag > 0   a new object with this type tag, e.g. command_e.Simple
+  h < 0     a reference to object number -h - 1, counting objects in the order
+            they were first written
+
+So objects shared within the graph, like SourceLine, are written once, and
+the decoder preserves sharing.
+
+Seed() registers an object without writing it.  Both sides must seed the same
+number of objects, in the same order.  It's used to point decoded nodes at a
+source_t that describes the current invocation, e.g. a new 'source' location.
+
+Decoding never raises.  On malformed input, the decoder returns None and
+zeros, and Ok() is false.
+"""
+from __future__ import print_function
+
+import struct
+
+from mycpp import mops
+
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+if TYPE_CHECKING:
+    from asdl import pybase
+
+_MASK_64 = (1 << 64) - 1
+_BIG_INT_TAG = -(1 << 63)  # followed by decimal digits
+
+
+class Encoder(object):
+
+    def __init__(self):
+        # type: () -> None
+        self.buf = bytearray()
+
+        # id(obj) -> object number
+        self.memo = {}  # type: Dict[int, int]
+        # Keep objects alive, so that id() isn't reused
+        self.objs = []  # type: List[Any]
+
+        self.ok = True
+
+    def Ok(self):
+        # type: () -> bool
+        """False if the graph contained something we can't encode."""
+        return self.ok
+
+    def Seed(self, obj):
+        # type: (Any) -> None
+        self.memo[id(obj)] = len(self.objs)
+        self.objs.append(obj)
+
+    def Begin(self, obj, tag):
+        # type: (Any, int) -> bool
+        """Write the head of an object.
+
+        Returns True if the caller should write the fields, or False if we
+        wrote a reference to an object that was already written.
+        """
+        n = self.memo.get(id(obj), -1)
+        if n != -1:
+            self.Int(-n - 1)
+            return False
+
+        self.memo[id(obj)] = len(self.objs)
+        self.objs.append(obj)
+        self.Int(tag)
+        return True
+
+    def Obj(self, obj):
+        # type: (Optional[pybase.CompoundObj]) -> None
+        if obj is None:
+            self.Null()
+        else:
+            obj.Encode(self)
+
+    def Null(self):
+        # type: () -> None
+        self.buf.append(0)
+
+    def Int(self, i):
+        # type: (int) -> None
+        z = ((i << 1) ^ (i >> 63)) & _MASK_64  # zig-zag
+        while z >= 0x80:
+            self.buf.append((z & 0x7f) | 0x80)
+            z >>= 7
+        self.buf.append(z)
+
+    def Bool(self, b):
+        # type: (bool) -> None
+        self.Int(1 if b else 0)
+
+    def BigInt(self, i):
+        # type: (mops.BigInt) -> None
+        if _BIG_INT_TAG < i.i < -_BIG_INT_TAG:
+            self.Int(i.i)
+        else:
+            self.Int(_BIG_INT_TAG)
+            self.Str(mops.ToStr(i))
+
+    def Float(self, f):
+        # type: (float) -> None
+        self.buf.extend(struct.pack('<d', f))
+
+    def Str(self, s):
+        # type: (Optional[str]) -> None
+        if s is None:
+            self.Null()
+        else:
+            self.Int(len(s) + 1)
+            self.buf.extend(s)
+
+    def Size(self, n):
+        # type: (int) -> None
+        self.Int(n + 1)
+
+    def Unsupported(self):
+        # type: () -> None
+        """For 'any' and extern fields, which point outside the graph."""
+        self.ok = False
+        self.Null()
+
+    def Finish(self):
+        # type: () -> str
+        return str(self.buf)
+
+
+class Decoder(object):
+
+    def __init__(self, s):
+        # type: (str) -> None
+        self.buf = bytearray(s)
+        self.pos = 0
+        self.objs = []  # type: List[Any]
+        self.ok = True
+
+    def Ok(self):
+        # type: () -> bool
+        return self.ok
+
+    def AtEnd(self):
+        # type: () -> bool
+        return self.pos >= len(self.buf)
+
+    def Fail(self):
+        # type: () -> None
+        self.ok = False
+        self.pos = len(self.buf)  # all further reads return zero values
+
+    def Seed(self, obj):
+        # type: (Any) -> None
+        self.objs.append(obj)
+
+    def Add(self, obj):
+        # type: (Any) -> None
+        """Register a new object, BEFORE decoding its fields."""
+        self.objs.append(obj)
+
+    def Head(self):
+        # type: () -> int
+        return self.Int()
+
+    def Ref(self, h):
+        # type: (int) -> Any
+        """Resolve a head that isn't a new object: None or a reference."""
+        if h == 0:
+            return None
+        n = -h - 1
+        if h > 0 or n >= len(self.objs):  # unexpected tag, or bad reference
+            self.Fail()
+            return None
+        return self.objs[n]
+
+    def Int(self):
+        # type: () -> int
+        z = 0
+        shift = 0
+        while True:
+            if self.pos >= len(self.buf) or shift > 63:
+                self.Fail()
+                return 0
+            b = self.buf[self.pos]
+            self.pos += 1
+            z |= (b & 0x7f) << shift
+            if b < 0x80:
+                break
+            shift += 7
+        z &= _MASK_64
+        return (z >> 1) ^ -(z & 1)
+
+    def Bool(self):
+        # type: () -> bool
+        return self.Int() != 0
+
+    def BigInt(self):
+        # type: () -> mops.BigInt
+        i = self.Int()
+        if i != _BIG_INT_TAG:
+            return mops.BigInt(i)
+
+        s = self.Str()
+        digits = s[1:] if s is not None and s.startswith('-') else s
+        if digits is None or not digits.isdigit():
+            self.Fail()
+            return mops.ZERO
+        return mops.BigInt(int(s))
+
+    def Float(self):
+        # type: () -> float
+        end = self.pos + 8
+        if end > len(self.buf):
+            self.Fail()
+            return 0.0
+        f = struct.unpack('<d', str(self.buf[self.pos:end]))[0]
+        self.pos = end
+        return f
+
+    def Str(self):
+        # type: () -> Optional[str]
+        n = self.Int() - 1
+        if n < 0:
+            return None
+        end = self.pos + n
+        if end > len(self.buf):
+            self.Fail()
+            return None
+        s = str(self.buf[self.pos:end])
+        self.pos = end
+        return s
+
+    def Size(self):
+        # type: () -> int
+        """Returns -1 for None.
+
+        Every item takes at least one byte, so the decoder can't be made to
+        loop more than len(s) times.
+        """
+        n = self.Int() - 1
+        if n < -1 or n > len(self.buf) - self.pos:
+            self.Fail()
+            return -1
+        return n
+
+    def Unsupported(self):
+        # type: () -> None
+        self.Fail()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python2
+"""pyserial_test.py: Tests for pyserial.py."""
+from __future__ import print_function
+
+import unittest
+
+from asdl import pyserial  # module under test
+from mycpp import mops
+
+from _devbuild.gen.typed_arith_asdl import (arith_expr, arith_expr_e,
+                                            arith_expr_t, pipeline)
+
+
+def _Encode(node):
+    enc = pyserial.Encoder()
+    node.Encode(enc)
+    return enc.Finish()
+
+
+class PrimitiveTest(unittest.TestCase):
+
+    def testRoundTrip(self):
+        enc = pyserial.Encoder()
+        ints = [0, 1, -1, 63, -64, 64, 300, -(1 << 63), (1 << 63) - 1]
+        for i in ints:
+            enc.Int(i)
+        enc.Float(-2.5)
+        enc.Float(1e300)
+        enc.Str('')
+        enc.Str(None)
+        enc.Str('foo\0bar')
+        enc.Bool(True)
+        enc.BigInt(mops.BigInt(-(1 << 40)))
+        s = enc.Finish()
+
+        # Small integers take one byte
+        self.assertEqual('\x00\x02\x01', s[:3])
+
+        dec = pyserial.Decoder(s)
+        for i in ints:
+            self.assertEqual(i, dec.Int())
+        self.assertEqual(-2.5, dec.Float())
+        self.assertEqual(1e300, dec.Float())
+        self.assertEqual('', dec.Str())
+        self.assertEqual(None, dec.Str())
+        self.assertEqual('foo\0bar', dec.Str())
+        self.assertEqual(True, dec.Bool())
+        self.assertEqual(-(1 << 40), dec.BigInt().i)
+
+        self.assertTrue(dec.Ok())
+        self.assertTrue(dec.AtEnd())
+
+    def testBigInt(self):
+        # Values outside the int64_t range, like the +bigint C++ build has
+        big = [(1 << 63) - 1, -(1 << 63), 1 << 63, -(1 << 100), 0]
+        enc = pyserial.Encoder()
+        for i in big:
+            enc.BigInt(mops.BigInt(i))
+        s = enc.Finish()
+
+        # Same bytes as asdl/cpp_serial_test.cc
+        self.assertEqual(
+            '\xfe\xff\xff\xff\xff\xff\xff\xff\xff\x01'
+            '\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01'
+            '*-9223372036854775808', s[:41])
+
+        dec = pyserial.Decoder(s)
+        for i in big:
+            self.assertEqual(i, dec.BigInt().i)
+        self.assertTrue(dec.Ok())
+        self.assertTrue(dec.AtEnd())
+
+        # Not digits
+        for digits in ['', '-', '1-2', ' 3', None]:
+            enc = pyserial.Encoder()
+            enc.Int(-(1 << 63))
+            enc.Str(digits)
+            dec = pyserial.Decoder(enc.Finish())
+            self.assertEqual(0, dec.BigInt().i)
+            self.assertFalse(dec.Ok())
+
+    def testMalformed(self):
+        # Truncated varint
+        dec = pyserial.Decoder('\x80')
+        self.assertEqual(0, dec.Int())
+        self.assertFalse(dec.Ok())
+
+        # String longer than the input
+        dec = pyserial.Decoder('\x10ab')
+        self.assertEqual(None, dec.Str())
+        self.assertFalse(dec.Ok())
+
+        # Huge list size
+        dec = pyserial.Decoder('\xfe\xff\x01')
+        self.assertEqual(-1, dec.Size())
+        self.assertFalse(dec.Ok())
+
+        # Failure is sticky
+        self.assertEqual(0, dec.Int())
+        self.assertTrue(dec.AtEnd())
+
+
+class ObjectTest(unittest.TestCase):
+
+    def testRoundTrip(self):
+        shared = arith_expr.Var('x')
+        node = arith_expr.Binary(
+            '+', shared,
+            arith_expr.FuncCall('f', [
+                arith_expr.NoOp, shared,
+                arith_expr.Slice(arith_expr.Const(42), None, None,
+                                 arith_expr.Big(mops.BigInt(1 << 50)))
+            ]))
+        s = _Encode(node)
+
+        dec = pyserial.Decoder(s)
+        node2 = arith_expr_t.Decode(dec)
+        self.assertTrue(dec.Ok())
+        self.assertTrue(dec.AtEnd())
+
+        self.assertEqual(arith_expr_e.Binary, node2.tag())
+        # Sharing and singletons are preserved
+        self.assertIs(node2.left, node2.right.args[1])
+        self.assertIs(arith_expr.NoOp, node2.right.args[0])
+        self.assertEqual(42, node2.right.args[2].a.i)
+        self.assertEqual(None, node2.right.args[2].begin)
+
+        # Re-encoding gives the same bytes
+        self.assertEqual(s, _Encode(node2))
+
+    def testProduct(self):
+        s = _Encode(pipeline(True))
+        dec = pyserial.Decoder(s)
+        p = pipeline.Decode(dec)
+        self.assertEqual(True, p.negated)
+
+    def testSeed(self):
+        shared = arith_expr.Var('x')
+        node = arith_expr.Unary('-', shared)
+
+        enc = pyserial.Encoder()
+        enc.Seed(shared)
+        node.Encode(enc)
+        s = enc.Finish()
+
+        other = arith_expr.Var('y')
+        dec = pyserial.Decoder(s)
+        dec.Seed(other)
+        node2 = arith_expr_t.Decode(dec)
+        self.assertIs(other, node2.a)
+
+    def testMalformed(self):
+        s = _Encode(
+            arith_expr.Binary('+', arith_expr.Const(1), arith_expr.Const(2)))
+
+        # Every prefix of a valid encoding fails cleanly
+        for i in xrange(len(s)):
+            dec = pyserial.Decoder(s[:i])
+            arith_expr_t.Decode(dec)
+            self.assertFalse(dec.Ok(), i)
+
+        # Unknown tag, and a reference to an object that doesn't exist
+        for bad in ['\x7e', '\x05']:
+            dec = pyserial.Decoder(bad)
+            self.assertEqual(None, arith_expr_t.Decode(dec))
+            self.assertFalse(dec.Ok())
+
+
+if __name__ == '__main__':
+    unittest.main()
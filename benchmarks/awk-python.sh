@@ -82,6 +82,50 @@ print "total lines: ", num_lines
   done
 }
 
+# YSH reads stdin in big chunks, and slices lines out of the buffer.
+test-ysh() {
+  local ysh=${1:-_bin/cxx-opt/ysh}
+
+  time for i in {1..10}; do
+    cat "${FILES[@]}" | $ysh -c '
+    var num_lines = 0
+    var unique = {}
+
+    for line in (io.stdin) {
+      var key = line => lower()
+      setvar num_lines += 1
+      setvar unique[key] = get(unique, key, 0) + 1
+    }
+
+    echo "unique lines: $[len(unique)]"
+    echo "total lines: $num_lines"
+    '
+  done
+}
+
+# Same thing, but process a List of lines per iteration
+test-ysh-batches() {
+  local ysh=${1:-_bin/cxx-opt/ysh}
+
+  time for i in {1..10}; do
+    cat "${FILES[@]}" | $ysh -c '
+    var num_lines = 0
+    var unique = {}
+
+    for batch in (io.stdin => batches(1000)) {
+      setvar num_lines += len(batch)
+      for line in (batch) {
+        var key = line => lower()
+        setvar unique[key] = get(unique, key, 0) + 1
+      }
+    }
+
+    echo "unique lines: $[len(unique)]"
+    echo "total lines: $num_lines"
+    '
+  done
+}
+
 # Only 10-30 ms.  We are doing real work.
 test-wc() {
   time for i in {1..10}; do
@@ -0,0 +1,121 @@
+#!/usr/bin/env bash
+#
+# Compare integer-heavy loops in the default build, where mops::BigInt is
+# int64_t, and the +bigint build, where it's a tagged word that's promoted to
+# heap-allocated digits on overflow.
+#
+# The loops stay in the small range, so they measure the cost of the overflow
+# checks, except for 'factorial', which shows that big results are correct.
+#
+# Usage:
+#   benchmarks/bigint.sh <function name>
+#
+# Example:
+#   benchmarks/bigint.sh compare 1000000
+
+set -o nounset
+set -o pipefail
+set -o errexit
+
+readonly -a VARIANTS=(_bin/cxx-opt _bin/cxx-opt+bigint)
+
+TIMEFORMAT='%U'
+
+osh-arith() {
+  local dir=$1
+  local n=$2
+
+  time $dir/osh -c '
+  n=$1
+  sum=0
+  for (( i = 0; i < n; ++i )); do
+    (( sum += i * 3 % 7 - (i >> 1) ))
+  done
+  echo $sum
+  ' dummy $n
+}
+
+osh-bits() {
+  local dir=$1
+  local n=$2
+
+  time $dir/osh -c '
+  n=$1
+  h=0
+  for (( i = 0; i < n; ++i )); do
+    (( h = ((h << 5) ^ (h >> 3) ^ i) & 0xffffff ))
+  done
+  echo $h
+  ' dummy $n
+}
+
+ysh-arith() {
+  local dir=$1
+  local n=$2
+
+  time $dir/ysh -c '
+  func loop(n) {
+    var sum = 0
+    var i = 0
+    while (i < n) {
+      setvar sum += i * 3 % 7 - (i >> 1)
+      setvar i += 1
+    }
+    return (sum)
+  }
+  echo $[loop(int($1))]
+  ' dummy $n
+}
+
+ysh-fib() {
+  local dir=$1
+
+  time $dir/ysh -c '
+  func fib(n) {
+    if (n < 2) {
+      return (n)
+    }
+    return (fib(n - 1) + fib(n - 2))
+  }
+  echo $[fib(25)]
+  '
+}
+
+factorial() {
+  local dir=$1
+
+  # Overflows int64_t after 20!
+  time $dir/ysh -c '
+  var f = 1
+  for i in (1 ..= 30) {
+    setvar f *= i
+  }
+  echo $[f]
+  '
+}
+
+compare() {
+  local n=${1:-1000000}
+
+  for dir in "${VARIANTS[@]}"; do
+    ninja $dir/{osh,ysh}
+  done
+
+  for task in osh-arith osh-bits ysh-arith; do
+    for dir in "${VARIANTS[@]}"; do
+      echo "=== $task $dir ==="
+      $task $dir $n
+      echo
+    done
+  done
+
+  for task in ysh-fib factorial; do
+    for dir in "${VARIANTS[@]}"; do
+      echo "=== $task $dir ==="
+      $task $dir
+      echo
+    done
+  done
+}
+
+"$@"
@@ -10,6 +10,7 @@
 #
 # - fib: integer, loop, assignment (shells don't have real integers
 # - for_loop: 2025 update, taken from benchmarks/ysh-for.sh
+# - brace_range: for loop over {1..N}, mainly to measure max RSS
 # - word_freq: hash table / assoc array (OSH uses a vector<pair<>> now!)
 #              also integer counter
 # - bubble_sort: indexed array (bash uses a linked list?)
@@ -104,6 +105,17 @@ for_loop-tasks() {
   done
 }
 
+# task_name,iter,args
+brace_range-tasks() {
+  local provenance=$1
+
+  # dash and awk don't have brace expansion
+  cat $provenance | filter-provenance bash "$OSH_CPP_REGEX" |
+  while read fields; do
+    echo 'brace_range 1000000 _' | xargs -n 3 -- echo "$fields"
+  done
+}
+
 # task_name,iter,args
 control_flow-tasks() {
   local provenance=$1
@@ -297,6 +309,7 @@ parse_help-one() {
 hello-all() { task-all hello "$@"; }
 fib-all() { task-all fib "$@"; }
 for_loop-all() { task-all for_loop "$@"; }
+brace_range-all() { task-all brace_range "$@"; }
 control_flow-all() { task-all control_flow "$@"; }
 word_freq-all() { task-all word_freq "$@"; }
 assoc_array-all() { task-all assoc_array "$@"; }
@@ -356,7 +369,7 @@ task-all() {
 
     local -a cmd
     case $task_name in
-      hello|fib|for_loop|control_flow)
+      hello|fib|for_loop|brace_range|control_flow)
         # Run it DIRECTLY, do not run $0.  Because we do NOT want to fork bash
         # then dash, because bash uses more memory.
         args=( benchmarks/compute/$task_name.$(ext $runtime) "$arg1" "$arg2" )
@@ -0,0 +1,22 @@
+#!/usr/bin/env bash
+#
+# Loop over a large brace expansion, to measure memory usage.
+#
+# Usage:
+#   benchmarks/compute/brace_range.sh N
+#
+# Shells that expand {1..N} before the loop starts use memory proportional to
+# N.  OSH expands static brace words lazily in for loops.
+
+n=$1
+
+# Brace expansion happens at parse time, so use eval to vary N
+sum=0
+eval "for i in {1..$n}; do sum=\$(( sum + i )); done"
+echo "n = $n"
+echo "sum = $sum"
+
+# The cartesian product of several ranges
+count=0
+eval "for w in {a..c}{a..z}{0..$(( n / 100 ))}; do count=\$(( count + 1 )); done"
+echo "count = $count"
@@ -49,6 +49,13 @@ EOF
 
   tsv2html $in_dir/ex.compute-fib.tsv
 
+  cmark <<'EOF'
+#### ex.big-heap
+
+EOF
+
+  tsv2html $in_dir/ex.big-heap.tsv
+
 
   cat <<EOF
 
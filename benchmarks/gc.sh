@@ -93,6 +93,7 @@ print-tasks() {
     ex.bashcomp-parse-help  # only runs with bash
     ex.abuild-print-help  # bash / dash / zsh
     ex.compute-fib  # bash / dash / zsh
+    ex.big-heap  # bash / zsh
   )
 
   local -a shells=(
@@ -113,6 +114,9 @@ print-tasks() {
     # good GC stats
     "_bin/cxx-opt/osh${TAB}mut+alloc+free+gc"
     "_bin/cxx-opt/osh${TAB}mut+alloc+free+gc+exit"
+
+    # minor and major collections
+    "_bin/cxx-opt+generational/osh${TAB}mut+alloc+free+gc"
   )
 
   if test -n "$mycpp_nosouffle"; then
@@ -146,6 +150,10 @@ print-tasks() {
         "ex.bashcomp-parse-help${TAB}zsh"*)
           continue
           ;;
+        "ex.big-heap${TAB}dash"*)
+          # no associative arrays
+          continue
+          ;;
       esac
 
       local join_id="gc-$id"
@@ -175,6 +183,7 @@ print-cachegrind-tasks() {
     # Faster tasks, like benchmarks/uftrace, which is instrumented
     parse.abuild
     ex.compute-fib
+    ex.big-heap
   )
 
   local -a shells=(
@@ -190,6 +199,8 @@ print-cachegrind-tasks() {
     "_bin/cxx-opt/osh${TAB}mut+alloc+free"
     "_bin/cxx-opt/osh${TAB}mut+alloc+free+gc"
     "_bin/cxx-opt/osh${TAB}mut+alloc+free+gc+exit"
+
+    "_bin/cxx-opt+generational/osh${TAB}mut+alloc+free+gc"
   )
 
   if test -n "$mycpp_nosouffle"; then
@@ -269,6 +280,19 @@ run-tasks() {
         argv=( benchmarks/compute/fib.sh $iters 44 )
         ;;
 
+      ex.big-heap)
+        # A table that lives for the whole run, and many short-lived strings.
+        # Fewer iterations when instrumented.
+        local iters
+        if test $mode = time; then
+          iters=100000
+        else
+          iters=10000
+        fi
+
+        argv=( benchmarks/gc/big-heap.sh 100000 $iters )
+        ;;
+
       *)
         die "Invalid task $task"
         ;;
@@ -398,7 +422,7 @@ more-variants() {
 
 build-binaries() {
   soil/cpp-tarball.sh build-like-ninja \
-    opt{,+bumpleak,+bumproot,+bumpsmall,+nopool}
+    opt{,+bumpleak,+bumproot,+bumpsmall,+nopool,+generational}
 
   OILS_TRANSLATOR=mycpp-nosouffle soil/cpp-tarball.sh build-like-ninja opt
 }
@@ -527,6 +551,17 @@ EOF
 
   tsv2html $in_dir/ex.abuild-print-help.tsv
 
+  cmark <<'EOF'
+#### ex.big-heap
+
+A big associative array that stays alive, while a loop allocates short-lived
+strings.  `cxx-opt+generational` traces only the young objects in minor
+collections.
+
+EOF
+
+  tsv2html $in_dir/ex.big-heap.tsv
+
   cmark << 'EOF'
 - Underlying data: [stage2/times.tsv](stage2/times.tsv)
 EOF
@@ -0,0 +1,28 @@
+#!/usr/bin/env bash
+#
+# A workload for the generational GC: a big table that lives for the whole
+# run, and a loop that allocates short-lived objects.  A full collection marks
+# the table every time, while a minor collection only marks what's new.
+#
+# Usage:
+#   benchmarks/gc/big-heap.sh NUM_KEYS NUM_ITERS
+
+big-heap() {
+  local num_keys=${1:-100000}
+  local num_iters=${2:-100000}
+
+  declare -A table
+  local i
+  for (( i = 0; i < num_keys; ++i )); do
+    table["key$i"]="value $i"
+  done
+
+  local total=0
+  for (( i = 0; i < num_iters; ++i )); do
+    local s="${table["key$(( i % num_keys ))"]} $i"
+    total=$(( total + ${#s} ))
+  done
+  echo "$total"
+}
+
+big-heap "$@"
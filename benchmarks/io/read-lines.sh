@@ -131,6 +131,42 @@ compare-line-count() {
   done
 }
 
+count-read-syscalls() {
+  ### Print the number of read() and lseek() calls a shell makes
+  local sh=$1
+  local stdin=$2  # 'file' or 'pipe'
+
+  local out=_tmp/read-lines-strace.txt
+  local code='
+i=0
+while read -r line; do
+  i=$(( i + 1 ))
+done
+echo $i
+'
+  if test $stdin = file; then
+    strace -o $out -c -e trace=read,lseek $sh -c "$code" < $BIG_FILE
+  else
+    cat $BIG_FILE | strace -o $out -c -e trace=read,lseek $sh -c "$code"
+  fi
+  # The "calls" column
+  awk -v sh=$sh -v stdin=$stdin \
+    '$NF == "read" || $NF == "lseek" { print sh "\t" stdin "\t" $NF "\t" $4 }' $out
+}
+
+compare-syscalls() {
+  ### Regular files are read in chunks, then lseek() back.  Pipes aren't.
+
+  echo '=== lines'
+  wc -l < $BIG_FILE
+
+  for sh in dash bash $OSH_OPT bin/osh; do
+    for stdin in file pipe; do
+      count-read-syscalls $sh $stdin
+    done
+  done
+}
+
 sh-count-slow-trap() {
   local write_delay=${1:-0.20}
   local kill_delay=${2:-0.07}
@@ -249,6 +285,8 @@ soil-benchmark() {
   setup-benchmark
 
   compare-line-count
+
+  compare-syscalls
 }
 
 soil-test() {
@@ -0,0 +1,79 @@
+#!/usr/bin/env bash
+#
+# Compare reading variables at the top level, where they're looked up by name,
+# and inside a func, where locals have slots.
+#
+# Usage:
+#   benchmarks/ysh-locals.sh <function name>
+#
+# Example:
+#   benchmarks/ysh-locals.sh compare 1000000
+
+set -o nounset
+set -o pipefail
+set -o errexit
+
+YSH=_bin/cxx-opt/ysh
+
+top-level() {
+  local n=$1
+
+  time $YSH -c '
+  var n = int($1)
+  var sum = 0
+  var i = 0
+  while (i < n) {
+    setvar sum += i * 2 + i
+    setvar i += 1
+  }
+  echo $[sum]
+  ' dummy $n
+}
+
+in-func() {
+  local n=$1
+
+  time $YSH -c '
+  func loop(n) {
+    var sum = 0
+    var i = 0
+    while (i < n) {
+      setvar sum += i * 2 + i
+      setvar i += 1
+    }
+    return (sum)
+  }
+  echo $[loop(int($1))]
+  ' dummy $n
+}
+
+fib() {
+  local n=$1
+
+  time $YSH -c '
+  func fib(n) {
+    if (n < 2) {
+      return (n)
+    }
+    return (fib(n - 1) + fib(n - 2))
+  }
+  echo $[fib(int($1))]
+  ' dummy $n
+}
+
+compare() {
+  local n=${1:-1000000}
+
+  ninja $YSH
+
+  for variant in top-level in-func; do
+    echo "=== $variant ==="
+    $variant $n
+    echo
+  done
+
+  echo '=== fib ==='
+  fib 25
+}
+
+"$@"
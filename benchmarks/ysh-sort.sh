@@ -0,0 +1,101 @@
+#!/usr/bin/env bash
+#
+# Compare sorted() in YSH with piping to the external sort command.
+#
+# Usage:
+#   benchmarks/ysh-sort.sh <function name>
+#
+# Example:
+#   benchmarks/ysh-sort.sh compare 100000
+
+set -o nounset
+set -o pipefail
+set -o errexit
+
+YSH=_bin/cxx-opt/ysh
+
+readonly BASE_DIR=_tmp/ysh-sort
+
+make-input() {
+  local n=${1:-100000}
+
+  mkdir -p $BASE_DIR
+  local out=$BASE_DIR/words-$n.txt
+
+  # Deterministic "random" words
+  awk -v n=$n 'BEGIN { srand(42); for (i = 0; i < n; ++i) printf "w%d\n", int(rand() * n * 10) }' > $out
+  echo $out
+}
+
+with-sorted() {
+  local in=$1
+
+  time $YSH -c '
+  var lines = []
+  for line in (io.stdin) {
+    call lines->append(line)
+  }
+  var result = sorted(lines)
+  echo $[len(result)]
+  ' < $in
+}
+
+with-sort-method() {
+  local in=$1
+
+  time $YSH -c '
+  var lines = []
+  for line in (io.stdin) {
+    call lines->append(line)
+  }
+  call lines->sort()
+  echo $[len(lines)]
+  ' < $in
+}
+
+with-pipeline() {
+  local in=$1
+
+  # What users write without sorted(): serialize, fork sort, and split the
+  # output again
+  time $YSH -c '
+  var lines = []
+  for line in (io.stdin) {
+    call lines->append(line)
+  }
+  var result = $(write -- @lines | LC_ALL=C sort) => lines()
+  echo $[len(result)]
+  ' < $in
+}
+
+with-ints() {
+  local in=$1
+
+  # key= calls a func once per item
+  time $YSH -c '
+  var nums = []
+  for line in (io.stdin) {
+    call nums->append(int(line[1:]))
+  }
+  func neg(x) { return (-x) }
+  var result = sorted(nums, key=neg)
+  echo $[len(result)]
+  ' < $in
+}
+
+compare() {
+  local n=${1:-100000}
+
+  ninja $YSH
+
+  local in
+  in=$(make-input $n)
+
+  for variant in sorted sort-method pipeline ints; do
+    echo "=== $variant ==="
+    with-$variant $in
+    echo
+  done
+}
+
+"$@"
@@ -171,6 +171,11 @@ setglobal_compile_flags() {
     *+nopool)
       flags="$flags -D NO_POOL_ALLOC"
       ;;
+
+    *+generational)
+      # minor collections, with write barriers
+      flags="$flags -D GC_GENERATIONAL"
+      ;;
   esac
 
   # HAVE_READLINE is from ./configure
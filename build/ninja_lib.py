@@ -109,6 +109,7 @@ GC_PERF_VARIANTS = [
     ('cxx', 'opt+bumpsmall'),
     #('cxx', 'asan+bumpsmall'),
     ('cxx', 'opt+nopool'),
+    ('cxx', 'opt+generational'),
 
     # TODO: should be binary with different files
     #('cxx', 'opt+tcmalloc'),
@@ -125,6 +126,9 @@ OTHER_VARIANTS = [
     # Affects mycpp/gc_mops.cc - we can do overflow checking
     ('cxx', 'opt+bigint'),
     ('cxx', 'asan+bigint'),
+
+    # Affects mycpp/mark_sweep_heap.cc - minor collections and write barriers
+    ('cxx', 'asan+generational'),
 ]
 
 SMALL_TEST_MATRIX = [
@@ -338,6 +342,7 @@ class Rules(object):
                      asdl_path,
                      deps=None,
                      pretty_print_methods=True,
+                     serialize_methods=False,
                      abbrev_module=None):
 
         deps = deps or []
@@ -345,6 +350,9 @@ class Rules(object):
         # SYSTEM header, _gen/asdl/hnode.asdl.h
         deps.append('//asdl/hnode.asdl')
         deps.append('//display/pretty.asdl')
+        if serialize_methods:
+            # asdl/cpp_serial.h, which Encode() and Decode() methods call
+            deps.append('//asdl/cpp_serial')
 
         # to create _gen/mycpp/examples/expr.asdl.h
         prefix = '_gen/%s' % asdl_path
@@ -362,6 +370,8 @@ class Rules(object):
 
         if abbrev_module:
             asdl_flags.append('--abbrev-module=%s' % abbrev_module)
+        if serialize_methods:
+            asdl_flags.append('--serialize-methods')
 
         debug_mod = prefix + '_debug.py'
         outputs.append(debug_mod)
@@ -171,8 +171,8 @@ py-codegen() {
 
   gen-asdl-py 'frontend/types.asdl'
   # depends on syntax.asdl
-  gen-asdl-py 'core/runtime.asdl'
-  gen-asdl-py 'core/value.asdl'
+  gen-asdl-py 'core/runtime.asdl' --serialize-methods
+  gen-asdl-py 'core/value.asdl' --serialize-methods
   gen-asdl-py 'data_lang/htm8.asdl'
   gen-asdl-py 'data_lang/nil8.asdl'
   gen-asdl-py 'display/pretty.asdl'
@@ -185,7 +185,7 @@ py-codegen() {
   # This does __import__ of syntax_abbrev.py, which depends on Id.  We could
   # use the AST module later?
   gen-asdl-py 'frontend/syntax.asdl' \
-    --abbrev-module='frontend.syntax_abbrev'
+    --abbrev-module='frontend.syntax_abbrev' --serialize-methods
 
   option-mypy-gen
   flag-gen-mypy
@@ -204,7 +204,7 @@ py-asdl-examples() {
 
   gen-asdl-py 'asdl/examples/shared_variant.asdl'
   gen-asdl-py 'asdl/examples/typed_arith.asdl' \
-    --abbrev-module='asdl.examples.typed_arith_abbrev'
+    --abbrev-module='asdl.examples.typed_arith_abbrev' --serialize-methods
 }
 
 oil-cpp() {
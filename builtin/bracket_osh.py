@@ -27,6 +27,7 @@ if TYPE_CHECKING:
     from _devbuild.gen.types_asdl import lex_mode_t
     from core import optview
     from core import state
+    from core.stat_cache import StatCache
     from display import ui
 
 
@@ -176,12 +177,20 @@ def _ThreeArgs(w_parser):
 
 class Test(vm._Builtin):
 
-    def __init__(self, need_right_bracket, exec_opts, mem, errfmt):
-        # type: (bool, optview.Exec, state.Mem, ui.ErrorFormatter) -> None
+    def __init__(
+            self,
+            need_right_bracket,  # type: bool
+            exec_opts,  # type: optview.Exec
+            mem,  # type: state.Mem
+            errfmt,  # type: ui.ErrorFormatter
+            stat_cache,  # type: StatCache
+    ):
+        # type: (...) -> None
         self.need_right_bracket = need_right_bracket
         self.exec_opts = exec_opts
         self.mem = mem
         self.errfmt = errfmt
+        self.stat_cache = stat_cache
 
     def Run(self, cmd_val):
         # type: (cmd_value.Argv) -> int
@@ -270,6 +279,7 @@ class Test(vm._Builtin):
                                              None,
                                              None,
                                              self.errfmt,
+                                             self.stat_cache,
                                              bracket=True)
         bool_ev.word_ev = word_ev
         bool_ev.CheckCircularDeps()
@@ -2,7 +2,8 @@ from __future__ import print_function
 
 from _devbuild.gen import arg_types
 from _devbuild.gen.id_kind_asdl import Id
-from _devbuild.gen.value_asdl import (value, value_t)
+from _devbuild.gen.syntax_asdl import loc
+from _devbuild.gen.value_asdl import (value, value_t, sh_lvalue)
 from builtin import read_osh
 from core import optview
 from core import pyos
@@ -11,8 +12,9 @@ from core import vm
 from frontend import flag_util
 from frontend import match
 from frontend import typed_args
+from mycpp import mops
 from mycpp import mylib
-from mycpp.mylib import log
+from mycpp.mylib import log, STDIN_FILENO
 from osh import word_compile
 
 import posix_ as posix
@@ -32,10 +34,10 @@ class Echo(vm._Builtin):
     shopt -s simple_echo disables -e and -n.
     """
 
-    def __init__(self, exec_opts):
-        # type: (optview.Exec) -> None
+    def __init__(self, exec_opts, stdout_):
+        # type: (optview.Exec, vm.BuiltinStdout) -> None
         self.exec_opts = exec_opts
-        self.f = mylib.Stdout()
+        self.stdout_ = stdout_
 
         # Reuse this constant instance
         self.simple_flag = None  # type: arg_types.echo
@@ -102,7 +104,7 @@ class Echo(vm._Builtin):
         if not arg.n and not backslash_c:
             buf.write('\n')
 
-        self.f.write(buf.getvalue())
+        self.stdout_.f.write(buf.getvalue())
         return 0
 
 
@@ -124,19 +126,58 @@ class MapFile(vm._Builtin):
         if var_name is None:
             var_name = 'MAPFILE'
 
+        if arg.d is None:
+            delim = '\n'
+        elif len(arg.d):
+            delim = arg.d[0]
+        else:
+            delim = '\0'  # mapfile -d ''
+
+        # Like bash, never store a NUL delimiter, since strings in shell
+        # can't contain NUL
+        with_delim = not arg.t and delim != '\0'
+
+        # The flag parser rejects negative numbers with a usage error, so the
+        # default of -1 means the flag wasn't passed
+        has_fd = arg.u != mops.MINUS_ONE
+        has_count = arg.n != mops.MINUS_ONE
+        has_skip = arg.s != mops.MINUS_ONE
+        has_origin = arg.O != mops.MINUS_ONE
+
+        fd = mops.BigTruncate(arg.u) if has_fd else STDIN_FILENO
+        count = mops.BigTruncate(arg.n) if has_count else 0  # 0 for all
+        skip = mops.BigTruncate(arg.s) if has_skip else 0
+
         lines = []  # type: List[str]
-        while True:
-            # bash uses this slow algorithm; YSH could provide read --all-lines
-            try:
-                line, eof = read_osh.ReadLineSlowly(self.cmd_ev,
-                                                    with_eol=not arg.t)
-            except pyos.ReadError as e:
-                self.errfmt.PrintMessage("mapfile: read() error: %s" %
-                                         posix.strerror(e.err_num))
-                return 1
-            if eof:
-                break
-            lines.append(line)
-
-        state.BuiltinSetArray(self.mem, var_name, lines)
+        try:
+            if count == 0:
+                # We consume all the input, so read it in bulk
+                read_osh.ReadRecords(fd, delim, with_delim, skip,
+                                     self.cmd_ev, lines)
+            else:
+                # Don't read past the last line.  FdReader reads chunks and
+                # seeks back if the descriptor is seekable.
+                f = read_osh.FdReader(fd, self.cmd_ev)
+                with read_osh.ctx_Sync(f):
+                    while len(lines) < count:
+                        line, eof = f.ReadUntil(delim, with_delim)
+                        if eof:
+                            break
+                        if skip > 0:
+                            skip -= 1
+                        else:
+                            lines.append(line)
+        except pyos.ReadError as e:
+            self.errfmt.PrintMessage("mapfile: read() error: %s" %
+                                     posix.strerror(e.err_num))
+            return 1
+
+        if not has_origin:
+            state.BuiltinSetArray(self.mem, var_name, lines)
+        else:
+            # mapfile -O doesn't clear the array
+            origin = mops.BigTruncate(arg.O)
+            for i, line in enumerate(lines):
+                lval = sh_lvalue.Indexed(var_name, origin + i, loc.Missing)
+                state.BuiltinSetValue(self.mem, lval, value.Str(line))
         return 0
@@ -21,9 +21,13 @@ from frontend import typed_args
 from mycpp import mylib
 from mycpp.mylib import log, iteritems
 
+import libc
+
 from typing import TYPE_CHECKING, cast
 if TYPE_CHECKING:
     from core.alloc import Arena
+    from core.parse_cache import ParseCache
+    from core.stat_cache import StatCache
     from osh import cmd_eval
     from ysh import expr_eval
 
@@ -51,12 +55,16 @@ class Pp(_Builtin):
             errfmt,  # type: ui.ErrorFormatter
             procs,  # type: state.Procs
             arena,  # type: Arena
+            parse_cache,  # type: ParseCache
+            stat_cache,  # type: StatCache
     ):
         # type: (...) -> None
         _Builtin.__init__(self, mem, errfmt)
         self.expr_ev = expr_ev
         self.procs = procs
         self.arena = arena
+        self.parse_cache = parse_cache
+        self.stat_cache = stat_cache
         self.stdout_ = mylib.Stdout()
 
     def _PrettyPrint(self, cmd_val):
@@ -185,6 +193,24 @@ class Pp(_Builtin):
             print('TODO')
             return 0
 
+        if action == 'cache-stats_':  # Format may change
+            # TSV8 header
+            print('cache\thits\tmisses\tevictions\tnum_entries')
+            stats = libc.regex_cache_stats()
+            print('regcomp\t%d\t%d\t%d\t%d' %
+                  (stats[0], stats[1], stats[2], stats[3]))
+            # Files loaded by source and use.  num_entries is the number this
+            # shell wrote.
+            pc = self.parse_cache
+            print('parse\t%d\t%d\t0\t%d' %
+                  (pc.num_hits, pc.num_misses, pc.num_written))
+            # File tests like [ -f x ], with shopt -s stat_cache
+            sc = self.stat_cache
+            print('stat\t%d\t%d\t%d\t%d' %
+                  (sc.num_hits, sc.num_misses, sc.num_evictions,
+                   len(sc.results)))
+            return 0
+
         if action == 'proc':
             names, locs = arg_r.Rest2()
             if len(names):
@@ -232,10 +258,10 @@ class Write(_Builtin):
     write --j8 --sep $'\t' -- @strs   # this is like TSV8
     """
 
-    def __init__(self, mem, errfmt):
-        # type: (state.Mem, ui.ErrorFormatter) -> None
+    def __init__(self, mem, errfmt, stdout_):
+        # type: (state.Mem, ui.ErrorFormatter, vm.BuiltinStdout) -> None
         _Builtin.__init__(self, mem, errfmt)
-        self.stdout_ = mylib.Stdout()
+        self.stdout_ = stdout_
 
     def Run(self, cmd_val):
         # type: (cmd_value.Argv) -> int
@@ -246,7 +272,7 @@ class Write(_Builtin):
         i = 0
         while not arg_r.AtEnd():
             if i != 0:
-                self.stdout_.write(arg.sep)
+                self.stdout_.f.write(arg.sep)
             s = arg_r.Peek()
 
             if arg.json:
@@ -255,7 +281,7 @@ class Write(_Builtin):
             elif arg.j8:
                 s = j8.MaybeEncodeString(s)
 
-            self.stdout_.write(s)
+            self.stdout_.f.write(s)
 
             arg_r.Next()
             i += 1
@@ -263,7 +289,7 @@ class Write(_Builtin):
         if arg.n:
             pass
         elif len(arg.end):
-            self.stdout_.write(arg.end)
+            self.stdout_.f.write(arg.end)
 
         return 0
 
@@ -1,8 +1,10 @@
 from __future__ import print_function
 
+from errno import EINTR
+
 from _devbuild.gen import arg_types
-from _devbuild.gen.runtime_asdl import cmd_value
-from _devbuild.gen.syntax_asdl import loc, loc_t
+from _devbuild.gen.runtime_asdl import cmd_value, flow_e
+from _devbuild.gen.syntax_asdl import loc, loc_t, command_t
 from _devbuild.gen.value_asdl import value, LeftName
 from builtin import read_osh
 from core import error
@@ -17,10 +19,11 @@ from frontend import typed_args
 from mycpp import mops
 from mycpp import mylib
 from mycpp.mylib import log
+from osh import cmd_eval
 
 import posix_ as posix
 
-from typing import TYPE_CHECKING
+from typing import List, TYPE_CHECKING
 if TYPE_CHECKING:
     from display import ui
 
@@ -28,6 +31,30 @@ _ = log
 
 _JSON_ACTION_ERROR = "builtin expects 'read' or 'write'"
 
+# json read --stream reads at least this much at a time
+_STREAM_CHUNK_SIZE = 65536
+
+
+def _ReadChunk(want):
+    # type: (int) -> str
+    """Read at least 'want' bytes from stdin, or until EOF.
+
+    Returns at least one byte, or '' at EOF.
+    """
+    chunks = []  # type: List[str]
+    total = 0
+    while True:
+        n, err_num = pyos.Read(0, max(_STREAM_CHUNK_SIZE, want - total),
+                               chunks)
+        if n < 0:
+            if err_num == EINTR:
+                continue  # retry, like ReadAll()
+            raise pyos.ReadError(err_num)
+        total += n
+        if n == 0 or total >= want:
+            break
+    return ''.join(chunks)
+
 
 class Json(vm._Builtin):
     """JSON read and write.
@@ -36,9 +63,10 @@ class Json(vm._Builtin):
     --indent=2 controls multiline indentation
     """
 
-    def __init__(self, mem, errfmt, is_j8):
-        # type: (state.Mem, ui.ErrorFormatter, bool) -> None
+    def __init__(self, mem, cmd_ev, errfmt, is_j8):
+        # type: (state.Mem, cmd_eval.CommandEvaluator, ui.ErrorFormatter, bool) -> None
         self.mem = mem
+        self.cmd_ev = cmd_ev  # for json read --stream { ... }
         self.errfmt = errfmt
 
         self.is_j8 = is_j8
@@ -95,26 +123,33 @@ class Json(vm._Builtin):
 
         elif action == 'read':
             attrs = flag_util.Parse('json_read', arg_r)
-            #arg_jr = arg_types.json_read(attrs.attrs)
+            arg_jr = arg_types.json_read(attrs.attrs)
 
-            if cmd_val.proc_args:  # json read (&x)
+            place = None  # type: value.Place
+            block = None  # type: command_t
+            blame_loc = cmd_val.arg_locs[0]  # type: loc_t
+
+            if cmd_val.proc_args:
                 rd = typed_args.ReaderForProc(cmd_val)
-                place = rd.PosPlace()
+                if len(rd.pos_args):  # json read (&x)
+                    place = rd.PosPlace()
+                    blame_loc = cmd_val.proc_args.typed_args.left
+                if arg_jr.stream:  # json read --stream { echo $[_reply] }
+                    block = rd.OptionalBlockAsFrag()
                 rd.Done()
 
-                blame_loc = cmd_val.proc_args.typed_args.left  # type: loc_t
-
-            else:  # json read
-                var_name = '_reply'
-
-                #log('VAR %s', var_name)
-                blame_loc = cmd_val.arg_locs[0]
-                place = value.Place(LeftName(var_name, blame_loc),
+            if place is None:  # json read
+                place = value.Place(LeftName('_reply', blame_loc),
                                     self.mem.CurrentFrame())
 
             if not arg_r.AtEnd():
                 e_usage('read got too many args', arg_r.Location())
 
+            if arg_jr.stream:
+                if block is None:
+                    e_usage('read --stream expected a block', action_loc)
+                return self._ReadStream(place, block, blame_loc, action_loc)
+
             try:
                 contents = read_osh.ReadAll()
             except pyos.ReadError as e:  # different paths for read -d, etc.
@@ -138,3 +173,45 @@ class Json(vm._Builtin):
             raise error.Usage(_JSON_ACTION_ERROR, action_loc)
 
         return 0
+
+    def _ReadStream(self, place, block, blame_loc, action_loc):
+        # type: (value.Place, command_t, loc_t, loc_t) -> int
+        """json read --stream (&x) { echo $[x.name] }
+
+        Runs the block for each item of a List on stdin.  break and continue
+        work like they do in a loop.
+        """
+        p = j8.ListStreamParser(self.is_j8)
+        status = 0
+        with cmd_eval.ctx_LoopLevel(self.cmd_ev.cflow_builtin):
+            while True:
+                try:
+                    item = p.Next()
+                    if item is None:
+                        if p.Done():
+                            break
+                        # Read as much as we have, so a big item is re-parsed
+                        # a logarithmic number of times
+                        p.Feed(_ReadChunk(p.NumBuffered()))
+                        continue
+                except error.Decode as err:
+                    self.errfmt.Print_('%s read: %s' %
+                                       (self.name, err.Message()),
+                                       blame_loc=action_loc)
+                    return 1
+                except pyos.ReadError as e:
+                    self.errfmt.PrintMessage("read error: %s" %
+                                             posix.strerror(e.err_num))
+                    return 1
+
+                self.mem.SetPlace(place, item, blame_loc)
+                try:
+                    status = self.cmd_ev.EvalCommandFrag(block)
+                except vm.IntControlFlow as e:
+                    status = 0
+                    action = e.HandleLoop()
+                    if action == flow_e.Break:
+                        break
+                    elif action == flow_e.Raise:
+                        raise
+        return status
@@ -14,7 +14,8 @@ from __future__ import print_function
 
 from _devbuild.gen import arg_types
 from _devbuild.gen.runtime_asdl import cmd_value, CommandStatus
-from _devbuild.gen.syntax_asdl import source, loc, loc_t, CompoundWord
+from _devbuild.gen.syntax_asdl import (source, source_t, loc, loc_t,
+                                       CompoundWord)
 from _devbuild.gen.value_asdl import Obj, value, value_t
 from core import alloc
 from core import dev
@@ -44,6 +45,7 @@ if TYPE_CHECKING:
     from frontend import args
     from frontend.parse_lib import ParseContext
     from core import optview
+    from core.parse_cache import CachedFile, ParseCache
     from display import ui
     from mycpp import mylib
     from osh.cmd_eval import CommandEvaluator
@@ -142,6 +144,7 @@ class ShellFile(vm._Builtin):
             tracer,  # type: dev.Tracer
             errfmt,  # type: ui.ErrorFormatter
             loader,  # type: pyutil._ResourceLoader
+            parse_cache,  # type: ParseCache
             module_invoke=None,  # type: vm._Builtin
     ):
         # type: (...) -> None
@@ -157,6 +160,7 @@ class ShellFile(vm._Builtin):
         self.tracer = tracer
         self.errfmt = errfmt
         self.loader = loader
+        self.parse_cache = parse_cache
         self.module_invoke = module_invoke
 
         self.builtin_name = 'use' if module_invoke else 'source'
@@ -204,11 +208,19 @@ class ShellFile(vm._Builtin):
             return None, None
 
         line_reader = reader.FileLineReader(f, self.arena)
+        line_reader.ShareLines()
         c_parser = self.parse_ctx.MakeOshParser(line_reader)
         return f, c_parser
 
-    def _SourceExec(self, cmd_val, arg_r, path, c_parser):
-        # type: (cmd_value.Argv, args.Reader, str, cmd_parse.CommandParser) -> int
+    def _OpenCached(self, real_path, src, c_parser):
+        # type: (Optional[str], source_t, cmd_parse.CommandParser) -> Optional[CachedFile]
+        """Embedded files aren't cached, since they have no real path."""
+        if real_path is None:
+            return None
+        return self.parse_cache.Open(real_path, src, c_parser)
+
+    def _SourceExec(self, cmd_val, arg_r, path, real_path, c_parser):
+        # type: (cmd_value.Argv, args.Reader, str, Optional[str], cmd_parse.CommandParser) -> int
         call_loc = cmd_val.arg_locs[0]
 
         # A sourced module CAN have a new arguments array, but it always shares
@@ -223,12 +235,14 @@ class ShellFile(vm._Builtin):
                 with state.ctx_ThisDir(self.mem, path):
                     src = source.OtherFile(path, call_loc)
                     with alloc.ctx_SourceCode(self.arena, src):
+                        cached_file = self._OpenCached(real_path, src, c_parser)
                         try:
                             status = main_loop.Batch(
                                 self.cmd_ev,
                                 c_parser,
                                 self.errfmt,
-                                cmd_flags=cmd_eval.RaiseControlFlow)
+                                cmd_flags=cmd_eval.RaiseControlFlow,
+                                cached_file=cached_file)
                         except vm.IntControlFlow as e:
                             if e.IsReturn():
                                 status = e.StatusCode()
@@ -250,6 +264,7 @@ class ShellFile(vm._Builtin):
             self,
             cmd_val,  # type: cmd_value.Argv
             path,  # type: str
+            real_path,  # type: Optional[str]
             path_loc,  # type: loc_t
             c_parser,  # type: cmd_parse.CommandParser
             props,  # type: Dict[str, value_t]
@@ -267,12 +282,14 @@ class ShellFile(vm._Builtin):
                 with state.ctx_ThisDir(self.mem, path):
                     src = source.OtherFile(path, path_loc)
                     with alloc.ctx_SourceCode(self.arena, src):
+                        cached_file = self._OpenCached(real_path, src, c_parser)
                         try:
                             status = main_loop.Batch(
                                 self.cmd_ev,
                                 c_parser,
                                 self.errfmt,
-                                cmd_flags=cmd_eval.RaiseControlFlow)
+                                cmd_flags=cmd_eval.RaiseControlFlow,
+                                cached_file=cached_file)
                         except vm.IntControlFlow as e:
                             if e.IsReturn():
                                 status = e.StatusCode()
@@ -312,7 +329,8 @@ class ShellFile(vm._Builtin):
             if c_parser is None:
                 return 1  # error was already shown
 
-            return self._SourceExec(cmd_val, arg_r, load_path, c_parser)
+            return self._SourceExec(cmd_val, arg_r, load_path, None,
+                                    c_parser)
 
         else:
             # 'source' respects $PATH
@@ -326,7 +344,8 @@ class ShellFile(vm._Builtin):
                 return 1  # error was already shown
 
             with process.ctx_FileCloser(f):
-                return self._SourceExec(cmd_val, arg_r, path_arg, c_parser)
+                return self._SourceExec(cmd_val, arg_r, path_arg,
+                                        libc.realpath(resolved), c_parser)
 
         raise AssertionError()
 
@@ -445,8 +464,8 @@ class ShellFile(vm._Builtin):
             # Cache BEFORE executing, to prevent circular import
             self._embed_cache[embed_path] = module_obj
 
-            status = self._UseExec(cmd_val, load_path, path_loc, c_parser,
-                                   module_obj.d)
+            status = self._UseExec(cmd_val, load_path, None, path_loc,
+                                   c_parser, module_obj.d)
             if status != 0:
                 return status
 
@@ -475,8 +494,8 @@ class ShellFile(vm._Builtin):
             self._disk_cache[normalized] = module_obj
 
             with process.ctx_FileCloser(f):
-                status = self._UseExec(cmd_val, path_arg, path_loc, c_parser,
-                                       module_obj.d)
+                status = self._UseExec(cmd_val, path_arg, normalized,
+                                       path_loc, c_parser, module_obj.d)
             if status != 0:
                 return status
 
@@ -9,6 +9,7 @@ from core import num
 from core import state
 from core import vm
 from frontend import typed_args
+from mycpp import mops
 from mycpp.mylib import log, NewDict
 from osh import glob_
 from osh import prompt
@@ -310,6 +311,25 @@ class Strftime(vm._Callable):
         return value.Null
 
 
+class StdinBatches(vm._Callable):
+    """io.stdin => batches(n), for batch in (io.stdin => batches(1000))"""
+
+    def __init__(self):
+        # type: () -> None
+        pass
+
+    def Call(self, rd):
+        # type: (typed_args.Reader) -> value_t
+        unused_stdin = rd.PosValue()
+        size = mops.BigTruncate(rd.PosInt())
+        rd.Done()
+
+        if size <= 0:
+            raise error.Expr('batches() expected a positive size',
+                             rd.LeftParenToken())
+        return value.StdinBatches(size)
+
+
 class Glob(vm._Callable):
 
     def __init__(self, globber, is_method=False):
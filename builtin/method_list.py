@@ -2,6 +2,7 @@
 
 from __future__ import print_function
 
+from _devbuild.gen.syntax_asdl import loc_t
 from _devbuild.gen.value_asdl import (value, value_t)
 
 from core import num
@@ -11,6 +12,10 @@ from mycpp import mops
 from mycpp.mylib import log
 from ysh import val_ops
 
+from typing import List, TYPE_CHECKING
+if TYPE_CHECKING:
+    from ysh import expr_eval
+
 _ = log
 
 
@@ -203,3 +208,120 @@ class Insert(vm._Callable):
         li[i] = to_insert
 
         return value.Null
+
+
+# Runs this long are sorted with insertion sort, then merged
+_RUN_SIZE = 8
+
+
+def _Less(left, right, reverse, blame_loc):
+    # type: (value_t, value_t, bool, loc_t) -> bool
+    c = val_ops.Compare(left, right, blame_loc)
+    return c > 0 if reverse else c < 0
+
+
+def _SortOrder(keys, reverse, blame_loc):
+    # type: (List[value_t], bool, loc_t) -> List[int]
+    """Returns the indices of keys, in sorted order.
+
+    It's a bottom-up merge sort, which is stable even when reversed: equal keys
+    stay in their original order.
+    """
+    n = len(keys)
+    order = []  # type: List[int]
+    for i in xrange(n):
+        order.append(i)
+
+    start = 0
+    while start < n:
+        end = min(start + _RUN_SIZE, n)
+        i = start + 1
+        while i < end:
+            x = order[i]
+            j = i - 1
+            while j >= start and _Less(keys[x], keys[order[j]], reverse,
+                                       blame_loc):
+                order[j + 1] = order[j]
+                j -= 1
+            order[j + 1] = x
+            i += 1
+        start = end
+
+    tmp = [0] * n
+    width = _RUN_SIZE
+    while width < n:
+        lo = 0
+        while lo < n:
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+
+            a = lo
+            b = mid
+            k = lo
+            while a < mid and b < hi:
+                # Take from the right half only if it's strictly less
+                if _Less(keys[order[b]], keys[order[a]], reverse, blame_loc):
+                    tmp[k] = order[b]
+                    b += 1
+                else:
+                    tmp[k] = order[a]
+                    a += 1
+                k += 1
+            while a < mid:
+                tmp[k] = order[a]
+                a += 1
+                k += 1
+            while b < hi:
+                tmp[k] = order[b]
+                b += 1
+                k += 1
+
+            lo = hi
+
+        merged = tmp
+        tmp = order
+        order = merged
+        width *= 2
+
+    return order
+
+
+class Sort(vm._Callable):
+    """
+    sorted(mylist, key=f, reverse=true) returns a new List
+    call mylist->sort(key=f, reverse=true) sorts in place
+    """
+
+    def __init__(self, expr_ev, in_place):
+        # type: (expr_eval.ExprEvaluator, bool) -> None
+        self.expr_ev = expr_ev
+        self.in_place = in_place
+
+    def Call(self, rd):
+        # type: (typed_args.Reader) -> value_t
+
+        li = rd.PosList()
+        key_func = rd.NamedFunc('key', None)
+        reverse = rd.NamedBool('reverse', False)
+        rd.Done()
+
+        blame_loc = rd.LeftParenToken()
+
+        if key_func is None:
+            keys = li
+        else:
+            # Call the func once per item, not once per comparison
+            keys = []  # type: List[value_t]
+            for item in li:
+                keys.append(self.expr_ev.CallFunc(key_func, [item], blame_loc))
+
+        items = []  # type: List[value_t]
+        for i in _SortOrder(keys, reverse, blame_loc):
+            items.append(li[i])
+
+        if self.in_place:
+            del li[:]
+            li.extend(items)
+            return value.Null
+
+        return value.List(items)
@@ -31,7 +31,6 @@ from frontend import lexer
 from frontend import match
 from frontend import reader
 from mycpp import mops
-from mycpp import mylib
 from mycpp.mylib import log
 from osh import sh_expr_eval
 from osh import string_ops
@@ -224,12 +223,14 @@ class Printf(vm._Builtin):
             parse_ctx,  # type: parse_lib.ParseContext
             unsafe_arith,  # type: sh_expr_eval.UnsafeArith
             errfmt,  # type: ui.ErrorFormatter
+            stdout_,  # type: vm.BuiltinStdout
     ):
         # type: (...) -> None
         self.mem = mem
         self.parse_ctx = parse_ctx
         self.unsafe_arith = unsafe_arith
         self.errfmt = errfmt
+        self.stdout_ = stdout_
         self.parse_cache = {}  # type: Dict[str, List[printf_part_t]]
 
         # this object initialized in main()
@@ -596,5 +597,5 @@ class Printf(vm._Builtin):
             lval = self.unsafe_arith.ParseLValue(arg.v, v_loc)
             state.BuiltinSetValue(self.mem, lval, value.Str(result))
         else:
-            mylib.Stdout().write(result)
+            self.stdout_.f.write(result)
         return 0
@@ -24,6 +24,7 @@ _ = log
 from typing import List, TYPE_CHECKING
 if TYPE_CHECKING:
     from _devbuild.gen.runtime_asdl import cmd_value
+    from core.stat_cache import StatCache
     from osh import cmd_eval
 
 
@@ -110,10 +111,11 @@ class Cat(vm._Builtin):
 
 class Rm(vm._Builtin):
 
-    def __init__(self, errfmt):
-        # type: (ui.ErrorFormatter) -> None
+    def __init__(self, errfmt, stat_cache):
+        # type: (ui.ErrorFormatter, StatCache) -> None
         vm._Builtin.__init__(self)
         self.errfmt = errfmt
+        self.stat_cache = stat_cache
 
     def Run(self, cmd_val):
         # type: (cmd_value.Argv) -> int
@@ -127,6 +129,8 @@ class Rm(vm._Builtin):
             raise error.Usage('expected one or more files',
                               cmd_val.arg_locs[0])
 
+        self.stat_cache.Clear()
+
         status = 0
         for i, path in enumerate(argv):
             err_num = pyos.Unlink(path)
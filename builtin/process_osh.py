@@ -11,13 +11,17 @@ from resource import (RLIM_INFINITY, RLIMIT_CORE, RLIMIT_CPU, RLIMIT_DATA,
                       RLIMIT_FSIZE, RLIMIT_NOFILE, RLIMIT_STACK, RLIMIT_AS)
 from signal import SIGCONT
 
+from errno import EINTR
+
 from _devbuild.gen import arg_types
-from _devbuild.gen.syntax_asdl import loc, loc_t, CompoundWord
-from _devbuild.gen.runtime_asdl import (cmd_value, job_state_e, wait_status,
-                                        wait_status_e)
+from _devbuild.gen.syntax_asdl import loc, loc_t, CompoundWord, command_t
+from _devbuild.gen.runtime_asdl import (cmd_value, job_state_e, trace,
+                                        wait_status, wait_status_e)
+from _devbuild.gen.value_asdl import value, value_e, value_t, LeftName
 from core import dev
 from core import error
 from core.error import e_usage, e_die_status
+from core import num
 from core import process  # W1_EXITED, etc.
 from core import pyos
 from core import pyutil
@@ -30,6 +34,7 @@ from frontend import args
 from mycpp import mops
 from mycpp import mylib
 from mycpp.mylib import log, tagswitch, print_stderr
+from ysh import val_ops
 
 import posix_ as posix
 
@@ -123,7 +128,7 @@ class Fg(vm._Builtin):
         # We are not using waitpid(WCONTINUE) and WIFCONTINUED() in
         # WaitForOne() -- it's an extension to POSIX that isn't necessary for 'fg'
         job.SetForeground()
-        job.state = job_state_e.Running
+        self.job_list.SetJobState(job, job_state_e.Running)
 
         status = -1
 
@@ -207,6 +212,227 @@ class ForkWait(vm._Builtin):
         return self.shell_ex.RunSubshell(cmd_frag)
 
 
+def _CopyToStdout(r):
+    # type: (int) -> None
+    """Copy the output of a forkmany job to stdout, until EOF."""
+    write_ok = True
+    while True:
+        chunks = []  # type: List[str]
+        n, err_num = pyos.Read(r, 4096, chunks)
+        if n == 0:  # EOF
+            break
+        if n < 0:
+            if err_num == EINTR:
+                continue  # retry
+            break  # e.g. EIO; the job's status still counts
+
+        # Keep draining after a write error like EPIPE, so the job exits
+        if write_ok:
+            s = chunks[0]
+            try:
+                i = 0
+                while i < len(s):
+                    i += posix.write(1, s[i:])
+            except (IOError, OSError):
+                write_ok = False
+
+
+class ForkMany(vm._Builtin):
+    """forkmany -j 4 (items, &statuses) { echo $_reply }
+
+    Like xargs -P: run the block in a child process once for each item, with at
+    most N running at once.
+    """
+
+    def __init__(
+            self,
+            shell_ex,  # type: executor.ShellExecutor
+            waiter,  # type: Waiter
+            mem,  # type: state.Mem
+    ):
+        # type: (...) -> None
+        self.shell_ex = shell_ex
+        self.waiter = waiter
+        self.job_list = waiter.job_list
+        self.mem = mem
+
+    def _NextItem(self, items, stdin_it, i):
+        # type: (Optional[List[value_t]], Optional[val_ops.StdinIterator], int) -> Optional[value_t]
+        if items is not None:
+            if i == len(items):
+                return None
+            return items[i]
+
+        assert stdin_it is not None
+        while True:
+            item = stdin_it.FirstValue()
+            if item is None or item.tag() != value_e.Interrupted:
+                break
+            self.shell_ex.cmd_ev.RunPendingTraps()
+        return item
+
+    def _Start(self, block, item, place, blame_loc, from_stdin, keep_order,
+               read_fds):
+        # type: (command_t, value_t, value.Place, loc_t, bool, bool, List[int]) -> process.Process
+        """Start a job, with its item bound in the parent, before fork()."""
+        self.mem.SetPlace(place, item, blame_loc)
+
+        p = self.shell_ex.MakeProcess(block)
+        if from_stdin:
+            # Like xargs, so jobs don't read the items
+            p.AddStateChange(process.StdinFromDevNull())
+        if keep_order:
+            r, w = posix.pipe()
+            p.AddStateChange(process.StdoutToPipe(r, w))
+            p.StartProcess(trace.Fork)
+            posix.close(w)  # not going to write
+            read_fds.append(r)
+        else:
+            p.StartProcess(trace.Fork)
+        return p
+
+    def _RunJobs(self, block, items, stdin_it, place, blame_loc, max_jobs,
+                 keep_order, statuses):
+        # type: (command_t, Optional[List[value_t]], Optional[val_ops.StdinIterator], value.Place, loc_t, int, bool, List[int]) -> None
+        """Start a job for each item, and append its status to 'statuses'."""
+
+        # Jobs that haven't been reaped, in the order they were started
+        running = []  # type: List[process.Process]
+        running_index = []  # type: List[int]
+        read_fds = []  # type: List[int]  # for --keep-order
+
+        i = 0
+        items_done = False
+        while True:
+            # Start jobs until we reach the limit
+            while not items_done and len(running) < max_jobs:
+                item = self._NextItem(items, stdin_it, i)
+                if item is None:
+                    items_done = True
+                    break
+                if stdin_it is not None:
+                    stdin_it.Next()
+
+                p = self._Start(block, item, place, blame_loc,
+                                stdin_it is not None, keep_order, read_fds)
+                running.append(p)
+                running_index.append(i)
+                statuses.append(-1)
+                i += 1
+
+            if len(running) == 0:
+                break
+
+            if keep_order:
+                # Copy the output of the oldest job, and wait for it.  Newer
+                # jobs keep running, until their output fills a pipe.
+                _CopyToStdout(read_fds[0])
+                posix.close(read_fds[0])
+                statuses[running_index[0]] = running[0].Wait(self.waiter)
+
+                read_fds.pop(0)
+                running.pop(0)
+                running_index.pop(0)
+                continue
+
+            # Reap ANY job, with waitpid(-1), and then fill its slot
+            result, _ = self.waiter.WaitForOne()
+            if result == process.W1_NO_CHILDREN:
+                break  # shouldn't happen
+            if result == process.W1_CALL_INTR:  # signal
+                # Unlike 'wait', keep going after running traps
+                self.shell_ex.cmd_ev.RunPendingTraps()
+                continue
+
+            j = 0
+            n = len(running)
+            for k in xrange(n):
+                p = running[k]
+                if p.state == job_state_e.Exited:
+                    self.job_list.PopChildProcess(p.pid)
+                    statuses[running_index[k]] = p.status
+                else:
+                    running[j] = p
+                    running_index[j] = running_index[k]
+                    j += 1
+            # Compact
+            for _ in xrange(n - j):
+                running.pop()
+                running_index.pop()
+
+    def Run(self, cmd_val):
+        # type: (cmd_value.Argv) -> int
+        attrs, arg_r = flag_util.ParseCmdVal('forkmany',
+                                             cmd_val,
+                                             accept_typed_args=True)
+        arg = arg_types.forkmany(attrs.attrs)
+
+        arg_, location = arg_r.Peek2()
+        if arg_ is not None:
+            e_usage('got unexpected argument %r' % arg_, location)
+
+        max_jobs = mops.BigTruncate(arg.j)
+        if max_jobs == -1:  # not passed
+            max_jobs = 1  # like xargs -P
+        elif max_jobs < 1:
+            e_usage('expected -j to be at least 1, got %d' % max_jobs,
+                    cmd_val.arg_locs[0])
+
+        blame_loc = cmd_val.arg_locs[0]  # type: loc_t
+
+        items = None  # type: Optional[List[value_t]]
+        stdin_it = None  # type: Optional[val_ops.StdinIterator]
+        statuses_place = None  # type: Optional[value.Place]
+
+        rd = typed_args.ReaderForProc(cmd_val)
+        if len(rd.pos_args):
+            blame_loc = rd.LeftParenToken()
+            UP_val = rd.PosValue()
+            with tagswitch(UP_val) as case:
+                if case(value_e.List):
+                    val = cast(value.List, UP_val)
+                    items = val.items
+                elif case(value_e.Stdin):
+                    pass
+                else:
+                    raise error.TypeErr(UP_val,
+                                        'forkmany expected List or io.stdin',
+                                        rd.BlamePos())
+            if len(rd.pos_args):  # forkmany (items, &statuses)
+                statuses_place = rd.PosPlace()
+        block = rd.RequiredBlockAsFrag()
+        rd.Done()
+
+        if items is None:  # forkmany { echo $_reply } < lines.txt
+            stdin_it = val_ops.StdinIterator(blame_loc)
+
+        place = value.Place(LeftName('_reply', blame_loc),
+                            self.mem.CurrentFrame())
+
+        statuses = []  # type: List[int]
+        if stdin_it is not None:
+            # Give back what we read past the last item, even on errors
+            with val_ops.ctx_Iterator(stdin_it):
+                self._RunJobs(block, items, stdin_it, place, blame_loc,
+                              max_jobs, arg.k, statuses)
+        else:
+            self._RunJobs(block, items, stdin_it, place, blame_loc, max_jobs,
+                          arg.k, statuses)
+
+        if statuses_place:
+            status_list = []  # type: List[value_t]
+            for st in statuses:
+                status_list.append(num.ToBig(st))
+            self.mem.SetPlace(statuses_place, value.List(status_list),
+                              blame_loc)
+
+        # Like pipefail, but the first failure wins
+        for st in statuses:
+            if st != 0:
+                return st
+        return 0
+
+
 class Exec(vm._Builtin):
 
     def __init__(
@@ -348,6 +574,10 @@ class Wait(vm._Builtin):
 
                 elif case(wait_status_e.Pipeline):
                     wait_st = cast(wait_status.Pipeline, UP_wait_st)
+                    if wait_st.state == job_state_e.Exited:
+                        for pid in job.AllPids():
+                            self.job_list.PopChildProcess(pid)
+                        self.job_list.CleanupWhenJobExits(job)
                     # TODO: handle PIPESTATUS?  Is this right?
                     status = wait_st.codes[-1]
 
@@ -368,11 +598,26 @@ class Wait(vm._Builtin):
         # Return the last status
         return status
 
+    def _OnProcessExited(self, pid):
+        # type: (int) -> Optional[process.Job]
+        """Clean up after a process exits.
+
+        Returns the job it belonged to, if that whole job is now done.
+        """
+        self.job_list.PopChildProcess(pid)
+
+        job = self.job_list.JobFromPid(pid)
+        self.job_list.CleanupWhenProcessExits(pid)
+
+        if job and job.State() == job_state_e.Exited:
+            return job
+        return None
+
     def _WaitNext(self):
         # type: () -> int
 
-        # Loop until there is one fewer process running, there's nothing to wait
-        # for, or there's a signal
+        # Loop until there is one fewer job running, there's nothing to wait
+        # for, or there's a signal.  NumRunning() is O(1).
         n = self.job_list.NumRunning()
         if n == 0:
             status = 127
@@ -383,18 +628,18 @@ class Wait(vm._Builtin):
                 result, w1_arg = self.waiter.WaitForOne()
                 if result == process.W1_EXITED:
                     pid = w1_arg
-                    pr = self.job_list.PopChildProcess(pid)
-                    # TODO: background pipelines don't clean up properly,
-                    # because only the last PID is registered in
-                    # job_list.pid_to_job
-                    self.job_list.CleanupWhenProcessExits(pid)
+                    pr = self.job_list.child_procs.get(pid)
+                    job = self._OnProcessExited(pid)
 
                     if pr is None:
                         if self.exec_opts.verbose_warn():
                             print_stderr(
                                 "oils wait: PID %d exited, but oils didn't start it"
                                 % pid)
-                    else:
+                    elif job:
+                        # For a pipeline, this is the status of the last part
+                        status = job.status
+                    elif self.job_list.JobFromPid(pid) is None:
                         status = pr.status
 
                 elif result == process.W1_NO_CHILDREN:
@@ -409,11 +654,30 @@ class Wait(vm._Builtin):
 
     def _Run(self, cmd_val):
         # type: (cmd_value.Argv) -> int
-        attrs, arg_r = flag_util.ParseCmdVal('wait', cmd_val)
+        attrs, arg_r = flag_util.ParseCmdVal('wait',
+                                             cmd_val,
+                                             accept_typed_args=True)
         arg = arg_types.wait(attrs.attrs)
 
         job_ids, arg_locs = arg_r.Rest2()
 
+        place = None  # type: value.Place
+        if arg.status_list:
+            if cmd_val.proc_args:  # wait --all --status-list (&x)
+                rd = typed_args.ReaderForProc(cmd_val)
+                place = rd.PosPlace()
+                rd.Done()
+                blame_loc = cmd_val.proc_args.typed_args.left  # type: loc_t
+            else:  # wait --all --status-list sets _reply
+                blame_loc = cmd_val.arg_locs[0]
+                place = value.Place(LeftName('_reply', blame_loc),
+                                    self.mem.CurrentFrame())
+
+            if not arg.all:
+                raise error.Usage('--status-list requires --all', blame_loc)
+        else:
+            typed_args.DoesNotAccept(cmd_val.proc_args)
+
         if len(job_ids):
             # Note: -n and --all ignored in this case, like bash
             return self._WaitForJobs(job_ids, arg_locs)
@@ -424,6 +688,7 @@ class Wait(vm._Builtin):
         # 'wait' or wait --all
 
         status = 0
+        statuses = []  # type: List[value_t]  # in the order jobs finished
 
         # Note: NumRunning() makes sure we ignore stopped processes, which
         # cause WaitForOne() to return
@@ -431,10 +696,13 @@ class Wait(vm._Builtin):
             result, w1_arg = self.waiter.WaitForOne()
             if result == process.W1_EXITED:
                 pid = w1_arg
-                pr = self.job_list.PopChildProcess(pid)
-                # TODO: background pipelines don't clean up properly, because
-                # only the last PID is registered in job_list.pid_to_job
-                self.job_list.CleanupWhenProcessExits(pid)
+                pr = self.job_list.child_procs.get(pid)
+                job = self._OnProcessExited(pid)
+                if job and place is not None:
+                    statuses.append(num.ToBig(job.status))
+
+                if pr is None:
+                    continue
 
                 if arg.verbose:
                     self.errfmt.PrintMessage(
@@ -454,6 +722,8 @@ class Wait(vm._Builtin):
                 status = 128 + w1_arg
                 break
 
+        if place is not None:
+            self.mem.SetPlace(place, value.List(statuses), blame_loc)
         return status
 
 
@@ -117,7 +117,7 @@ def _AppendParts(
 
 
 #
-# Three read() wrappers for 'read' builtin that RunPendingTraps: _ReadN,
+# read() wrappers for 'read' builtin that RunPendingTraps: _ReadN, FdReader,
 # _ReadPortion, and ReadLineSlowly
 #
 
@@ -145,102 +145,215 @@ def _ReadN(fd, num_bytes, cmd_ev):
     return ''.join(chunks)
 
 
-def _ReadPortion(fd, delim_byte, max_chars, allow_escape, cmd_ev):
-    # type: (int, int, int, bool, CommandEvaluator) -> Tuple[str, bool]
-    """Read a portion of filedescriptor fd.
+# For seekable descriptors like regular files, read this many bytes at a time,
+# and then seek back to the first byte we didn't use.  bash does this too.
+#
+# Pipes are still read one byte at a time, because there's no way to "unread"
+# bytes from a pipe.
+_SEEKABLE_BUF_SIZE = 4096
 
-    Reads until delimiter or max_chars, which ever comes first. Will ignore
-    max_chars if it's set to -1.
 
-    The delimiter is not included in the result.
+class FdReader(object):
+    """Read bytes and lines from a file descriptor without consuming more than
+    the caller uses.
+
+    sys.stdin.readline() in Python has its own buffering which is incompatible
+    with shell semantics: the next command that reads the descriptor must start
+    right after the line we returned.  dash, mksh, and zsh all read a single
+    byte at a time with read(0, 1).
+
+    Callers must call Sync() when they're done, even on errors.  Use
+    ctx_Sync.
     """
-    ch_array = []  # type: List[int]
-    eof = False
 
-    chars_read = 0
-    backslash = False
-    while True:
-        if max_chars >= 0 and chars_read >= max_chars:
-            break
-        ch, err_num = pyos.ReadByte(fd)
-        if ch < 0:
+    def __init__(self, fd, cmd_ev):
+        # type: (int, CommandEvaluator) -> None
+        self.fd = fd
+        self.cmd_ev = cmd_ev
+
+        # lseek() fails with ESPIPE for pipes, sockets, and terminals
+        self.seekable = pyos.SeekRelative(fd, 0) == 0
+        self.buf = ''
+        self.pos = 0
+
+    def _Fill(self):
+        # type: () -> bool
+        """Read a chunk into the empty buffer.  Returns False on EOF."""
+        chunks = []  # type: List[str]
+        while True:
+            n, err_num = pyos.Read(self.fd, _SEEKABLE_BUF_SIZE, chunks)
+
+            if n < 0:
+                if err_num == EINTR:
+                    self.cmd_ev.RunPendingTraps()
+                    # retry after running traps
+                else:
+                    raise pyos.ReadError(err_num)
+
+            elif n == 0:  # EOF
+                return False
+
+            else:
+                break
+
+        self.buf = chunks[0]
+        self.pos = 0
+        return True
+
+    def ReadByte(self):
+        # type: () -> int
+        """Returns a byte, or EOF_SENTINEL."""
+        if self.seekable:
+            if self.pos == len(self.buf) and not self._Fill():
+                return pyos.EOF_SENTINEL
+            ch = mylib.ByteAt(self.buf, self.pos)
+            self.pos += 1
+            return ch
+
+        while True:
+            ch, err_num = pyos.ReadByte(self.fd)
+            if ch >= 0:
+                return ch
+
             if err_num == EINTR:
-                cmd_ev.RunPendingTraps()
+                self.cmd_ev.RunPendingTraps()
                 # retry after running traps
             else:
                 raise pyos.ReadError(err_num)
 
-        elif ch == pyos.EOF_SENTINEL:
-            eof = True
-            break
+    def ReadLine(self, with_eol):
+        # type: (bool) -> Tuple[str, bool]
+        """Returns (line, eof).  eof is true only if no bytes were read."""
+        return self.ReadUntil('\n', with_eol)
+
+    def ReadUntil(self, delim, with_delim):
+        # type: (str, bool) -> Tuple[str, bool]
+        """Like ReadLine(), but the delimiter is any single byte."""
+        if not self.seekable:
+            delim_byte = mylib.ByteAt(delim, 0)
+            ch_array = []  # type: List[int]
+            while True:
+                ch = self.ReadByte()
+                if ch == pyos.EOF_SENTINEL:
+                    return pyutil.ChArrayToString(ch_array), len(ch_array) == 0
+
+                if ch == delim_byte:
+                    if with_delim:
+                        ch_array.append(ch)
+                    return pyutil.ChArrayToString(ch_array), False
 
-        elif backslash:
-            backslash = False
-            if ch == pyos.NEWLINE_CH:
+                ch_array.append(ch)
+
+        # Split lines out of the buffer, rather than looping over bytes
+        parts = []  # type: List[str]
+        while True:
+            if self.pos == len(self.buf) and not self._Fill():
+                return ''.join(parts), len(parts) == 0
+
+            i = self.buf.find(delim, self.pos)
+            if i == -1:
+                parts.append(self.buf[self.pos:])
+                self.pos = len(self.buf)
                 continue
-            ch_array.append(pyos.BACKSLASH_CH)
-            ch_array.append(ch)
-        elif allow_escape and ch == pyos.BACKSLASH_CH:
-            backslash = True
-            continue
 
-        elif ch == delim_byte:
-            break
+            end = i + 1 if with_delim else i
+            parts.append(self.buf[self.pos:end])
+            self.pos = i + 1
+            return ''.join(parts), False
 
-        elif ch == 0:
-            # Quirk of most shells except zsh: they ignore NUL bytes!
-            pass
+    def Sync(self):
+        # type: () -> None
+        """Seek back to the first byte that wasn't returned."""
+        num_unused = len(self.buf) - self.pos
+        if num_unused:
+            # Ignore errors, since lseek() already succeeded on this descriptor
+            pyos.SeekRelative(self.fd, -num_unused)
+        self.buf = ''
+        self.pos = 0
 
-        else:
-            ch_array.append(ch)
 
-        chars_read += 1
+class ctx_Sync(object):
+    """Call FdReader.Sync() when the block exits.
 
-    return pyutil.ChArrayToString(ch_array), eof
+    A ReadError, or an error in a trap that runs during the read, would
+    otherwise lose the position of the descriptor.
+    """
 
+    def __init__(self, f):
+        # type: (FdReader) -> None
+        self.f = f
 
-def ReadLineSlowly(cmd_ev, with_eol=True):
-    # type: (CommandEvaluator, bool) -> Tuple[str, bool]
-    """Read a line from stdin, unbuffered 
+    def __enter__(self):
+        # type: () -> None
+        pass
+
+    def __exit__(self, type, value, traceback):
+        # type: (Any, Any, Any) -> None
+        self.f.Sync()
 
-    Used by mapfile and read --raw-line.
 
-    sys.stdin.readline() in Python has its own buffering which is incompatible
-    with shell semantics.  dash, mksh, and zsh all read a single byte at a time
-    with read(0, 1).
+def _ReadPortion(fd, delim_byte, max_chars, allow_escape, cmd_ev):
+    # type: (int, int, int, bool, CommandEvaluator) -> Tuple[str, bool]
+    """Read a portion of filedescriptor fd.
+
+    Reads until delimiter or max_chars, which ever comes first. Will ignore
+    max_chars if it's set to -1.
+
+    The delimiter is not included in the result.
     """
     ch_array = []  # type: List[int]
     eof = False
-    is_first_byte = True
-    while True:
-        ch, err_num = pyos.ReadByte(0)
-        #log('   ch %d', ch)
-
-        if ch < 0:
-            if err_num == EINTR:
-                cmd_ev.RunPendingTraps()
-                # retry after running traps
-            else:
-                raise pyos.ReadError(err_num)
 
-        elif ch == pyos.EOF_SENTINEL:
-            if is_first_byte:
+    f = FdReader(fd, cmd_ev)
+    with ctx_Sync(f):
+        chars_read = 0
+        backslash = False
+        while True:
+            if max_chars >= 0 and chars_read >= max_chars:
+                break
+            ch = f.ReadByte()
+            if ch == pyos.EOF_SENTINEL:
                 eof = True
-            break
+                break
 
-        elif ch == pyos.NEWLINE_CH:
-            if with_eol:
+            elif backslash:
+                backslash = False
+                if ch == pyos.NEWLINE_CH:
+                    continue
+                ch_array.append(pyos.BACKSLASH_CH)
                 ch_array.append(ch)
-            break
+            elif allow_escape and ch == pyos.BACKSLASH_CH:
+                backslash = True
+                continue
 
-        else:
-            ch_array.append(ch)
+            elif ch == delim_byte:
+                break
+
+            elif ch == 0:
+                # Quirk of most shells except zsh: they ignore NUL bytes!
+                pass
+
+            else:
+                ch_array.append(ch)
 
-        is_first_byte = False
+            chars_read += 1
 
     return pyutil.ChArrayToString(ch_array), eof
 
 
+def ReadLineSlowly(cmd_ev, with_eol=True):
+    # type: (CommandEvaluator, bool) -> Tuple[str, bool]
+    """Read a line from stdin, without reading past it.
+
+    Used by mapfile and read --raw-line.  It's only slow when stdin is a pipe;
+    see FdReader.
+    """
+    f = FdReader(STDIN_FILENO, cmd_ev)
+    with ctx_Sync(f):
+        line, eof = f.ReadLine(with_eol)
+    return line, eof
+
+
 def ReadAll():
     # type: () -> str
     """Read all of stdin.
@@ -266,6 +379,62 @@ def ReadAll():
     return ''.join(chunks)
 
 
+# mapfile without -n consumes all its input, so it can read big chunks, even
+# from a pipe
+_BULK_BUF_SIZE = 65536
+
+
+def ReadRecords(fd, delim, with_delim, skip, cmd_ev, out):
+    # type: (int, str, bool, int, CommandEvaluator, List[str]) -> None
+    """Read until EOF, and append records ending with delim to 'out'.
+
+    The first 'skip' records are discarded.  Each chunk is split in one pass,
+    and only a record that spans chunks is copied twice.
+    """
+    pieces = []  # type: List[str]  # the record that spans chunks
+    while True:
+        chunks = []  # type: List[str]
+        n, err_num = pyos.Read(fd, _BULK_BUF_SIZE, chunks)
+
+        if n < 0:
+            if err_num == EINTR:
+                cmd_ev.RunPendingTraps()
+                # retry after running traps
+                continue
+            else:
+                raise pyos.ReadError(err_num)
+
+        elif n == 0:  # EOF
+            break
+
+        buf = chunks[0]
+        pos = 0
+        while True:
+            i = buf.find(delim, pos)
+            if i == -1:
+                if pos < n:
+                    pieces.append(buf[pos:])
+                break
+
+            end = i + 1 if with_delim else i
+            if len(pieces):
+                pieces.append(buf[pos:end])
+                record = ''.join(pieces)
+                del pieces[:]
+            else:
+                record = buf[pos:end]
+            pos = i + 1
+
+            if skip > 0:
+                skip -= 1
+            else:
+                out.append(record)
+
+    # The last record may not have a delimiter
+    if len(pieces) and skip == 0:
+        out.append(''.join(pieces))
+
+
 class ctx_TermAttrs(object):
 
     def __init__(self, fd, local_modes):
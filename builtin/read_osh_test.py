@@ -1,9 +1,11 @@
 #!/usr/bin/env python2
 from __future__ import print_function
 
+import os
 import unittest
 
 from builtin import read_osh  # module under test
+from core import pyos
 from osh import split
 
 
@@ -30,6 +32,86 @@ class BuiltinTest(unittest.TestCase):
 
             print('---')
 
+    def testFdReader(self):
+        path = '_tmp/read_osh_test.txt'
+        with open(path, 'w') as f:
+            f.write('one\ntwo\n' + 'x' * 5000 + '\nlast')
+
+        fd = os.open(path, os.O_RDONLY)
+        r = read_osh.FdReader(fd, None)
+        self.assertEqual(True, r.seekable)
+        self.assertEqual(('one\n', False), r.ReadLine(True))
+        self.assertEqual(ord('t'), r.ReadByte())
+        r.Sync()
+
+        # The descriptor is positioned right after what we consumed
+        self.assertEqual('wo\n', os.read(fd, 3))
+
+        r = read_osh.FdReader(fd, None)
+        line, eof = r.ReadLine(False)
+        self.assertEqual('x' * 5000, line)
+        self.assertEqual(('last', False), r.ReadLine(False))
+        self.assertEqual(('', True), r.ReadLine(False))
+        self.assertEqual(pyos.EOF_SENTINEL, r.ReadByte())
+        r.Sync()
+        os.close(fd)
+
+    def testSyncOnError(self):
+        path = '_tmp/read_osh_test.txt'
+        with open(path, 'w') as f:
+            f.write('one\ntwo\n')
+
+        fd = os.open(path, os.O_RDONLY)
+        r = read_osh.FdReader(fd, None)
+        try:
+            with read_osh.ctx_Sync(r):
+                self.assertEqual(('one\n', False), r.ReadLine(True))
+                raise pyos.ReadError(0)
+        except pyos.ReadError:
+            pass
+
+        # The rest of the buffer was given back
+        self.assertEqual('two\n', os.read(fd, 100))
+        os.close(fd)
+
+    def testFdReaderPipe(self):
+        r_fd, w_fd = os.pipe()
+        os.write(w_fd, 'one\ntwo\n')
+        os.close(w_fd)
+
+        r = read_osh.FdReader(r_fd, None)
+        self.assertEqual(False, r.seekable)
+        self.assertEqual(('one', False), r.ReadLine(False))
+        r.Sync()
+
+        # Only one line was consumed
+        self.assertEqual('two\n', os.read(r_fd, 100))
+        os.close(r_fd)
+
+    def testReadRecords(self):
+        path = '_tmp/read_osh_test.txt'
+        long_line = 'y' * 100000  # spans chunks
+        with open(path, 'w') as f:
+            f.write('a:b:' + long_line + '::last')
+
+        CASES = [
+            (False, 0, ['a', 'b', long_line, '', 'last']),
+            (True, 0, ['a:', 'b:', long_line + ':', ':', 'last']),
+            (False, 2, [long_line, '', 'last']),
+            (False, 5, []),
+        ]
+        for with_delim, skip, expected in CASES:
+            fd = os.open(path, os.O_RDONLY)
+            out = []
+            read_osh.ReadRecords(fd, ':', with_delim, skip, None, out)
+            os.close(fd)
+            self.assertEqual(expected, out)
+
+        r = read_osh.FdReader(os.open(path, os.O_RDONLY), None)
+        self.assertEqual(('a:', False), r.ReadUntil(':', True))
+        self.assertEqual(('b', False), r.ReadUntil(':', False))
+        os.close(r.fd)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+headless_server_test.py: Tests for osh --headless --listen
+
+Usage:
+  client/headless_server_test.py [--sh-binary bin/osh]
+"""
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+import py_fanos
+
+SH_BINARY = 'bin/osh'
+
+# Loaded once by the server, before it forks sessions
+PRELUDE = b"""
+greet() {
+  echo "hello $1"
+}
+"""
+
+
+class Session(object):
+  """A connection to the server, which forks a shell for it."""
+
+  def __init__(self, sock_path):
+    self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    self.sock.connect(sock_path)
+
+  def Request(self, msg, fds=None):
+    py_fanos.send(self.sock, msg, fds)
+    return py_fanos.recv(self.sock)
+
+  def Eval(self, code):
+    """Returns the reply, and the captured stdout and stderr."""
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    stdin_fd = os.open('/dev/null', os.O_RDONLY)
+
+    reply = self.Request(b'EVAL ' + code, [stdin_fd, out_w, err_w])
+    for fd in (stdin_fd, out_w, err_w):
+      os.close(fd)
+
+    # The server closed its copies, so we get EOF
+    with os.fdopen(out_r, 'rb') as f:
+      stdout = f.read()
+    with os.fdopen(err_r, 'rb') as f:
+      stderr = f.read()
+    return reply, stdout, stderr
+
+  def Close(self):
+    self.sock.close()
+
+
+class HeadlessServerTest(unittest.TestCase):
+
+  def setUp(self):
+    self.tmp_dir = tempfile.mkdtemp()
+    self.sock_path = os.path.join(self.tmp_dir, 'osh.sock')
+
+    prelude_path = os.path.join(self.tmp_dir, 'prelude.sh')
+    with open(prelude_path, 'wb') as f:
+      f.write(PRELUDE)
+
+    self.server = self._StartServer(self.sock_path)
+
+    for _ in range(100):
+      if os.path.exists(self.sock_path):
+        break
+      time.sleep(0.05)
+    else:
+      self.fail("Server didn't create %s" % self.sock_path)
+
+  def _StartServer(self, sock_path, stderr=subprocess.DEVNULL):
+    prelude_path = os.path.join(self.tmp_dir, 'prelude.sh')
+    return subprocess.Popen(
+        [SH_BINARY, '--eval', prelude_path, '--headless', '--listen',
+         sock_path],
+        stdin=subprocess.DEVNULL, stderr=stderr)
+
+  def tearDown(self):
+    self.server.kill()
+    self.server.wait()
+    shutil.rmtree(self.tmp_dir)
+
+  def testEval(self):
+    s = Session(self.sock_path)
+
+    # Functions loaded before serving are available
+    reply, stdout, stderr = s.Eval(b'greet world')
+    self.assertEqual(b'OK 0', reply)
+    self.assertEqual(b'hello world\n', stdout)
+    self.assertEqual(b'', stderr)
+
+    reply, stdout, stderr = s.Eval(b'echo err >&2; return 42')
+    self.assertEqual(b'OK 42', reply)
+    self.assertEqual(b'err\n', stderr)
+
+    # Syntax error
+    reply, stdout, stderr = s.Eval(b'echo (')
+    self.assertEqual(b'OK 2', reply)
+    self.assertIn(b'echo (', stderr)
+
+    s.Close()
+
+  def testConcurrentSessions(self):
+    s1 = Session(self.sock_path)
+    s2 = Session(self.sock_path)
+
+    pid1 = s1.Request(b'GETPID')
+    pid2 = s2.Request(b'GETPID')
+    self.assertTrue(pid1.startswith(b'OK '), pid1)
+    self.assertNotEqual(pid1, pid2)
+
+    # Each session has its own state
+    s1.Eval(b'x=one')
+    s2.Eval(b'x=two')
+    _, stdout, _ = s1.Eval(b'echo $x')
+    self.assertEqual(b'one\n', stdout)
+    _, stdout, _ = s2.Eval(b'echo $x')
+    self.assertEqual(b'two\n', stdout)
+
+    s1.Close()
+
+    # Later sessions start from the state before serving
+    s3 = Session(self.sock_path)
+    _, stdout, _ = s3.Eval(b'echo "[$x]"; greet s3')
+    self.assertEqual(b'[]\nhello s3\n', stdout)
+
+    s2.Close()
+    s3.Close()
+
+  def testExit(self):
+    s = Session(self.sock_path)
+    reply, _, _ = s.Eval(b'exit 3')
+    # The session ends without a reply
+    self.assertEqual(None, reply)
+    s.Close()
+
+    # But the server is still there
+    s = Session(self.sock_path)
+    reply, stdout, _ = s.Eval(b'echo hi')
+    self.assertEqual(b'OK 0', reply)
+    self.assertEqual(b'hi\n', stdout)
+    s.Close()
+
+  def testSocketInUse(self):
+    # A second server doesn't take over the socket of a live one
+    server2 = self._StartServer(self.sock_path, stderr=subprocess.PIPE)
+    _, stderr = server2.communicate(timeout=5)
+    self.assertEqual(1, server2.returncode)
+    self.assertIn(b'Failed to listen', stderr)
+
+    s = Session(self.sock_path)
+    reply, stdout, _ = s.Eval(b'greet again')
+    self.assertEqual(b'OK 0', reply)
+    self.assertEqual(b'hello again\n', stdout)
+    s.Close()
+
+  def testStaleSocket(self):
+    # Left behind by a server that died
+    stale_path = os.path.join(self.tmp_dir, 'stale.sock')
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(stale_path)
+    stale.close()
+
+    server2 = self._StartServer(stale_path)
+    try:
+      for _ in range(100):
+        try:
+          s = Session(stale_path)
+          break
+        except ConnectionRefusedError:
+          time.sleep(0.05)
+      else:
+        self.fail("Server didn't replace %s" % stale_path)
+
+      reply, stdout, _ = s.Eval(b'greet stale')
+      self.assertEqual(b'OK 0', reply)
+      self.assertEqual(b'hello stale\n', stdout)
+      s.Close()
+    finally:
+      server2.kill()
+      server2.wait()
+
+
+if __name__ == '__main__':
+  if len(sys.argv) >= 3 and sys.argv[1] == '--sh-binary':
+    SH_BINARY = sys.argv[2]
+    del sys.argv[1:3]
+  unittest.main()
@@ -35,6 +35,11 @@ errors() {
   echo status=$?
 }
 
+server-test() {
+  # osh --headless --listen, with concurrent sessions
+  client/headless_server_test.py --sh-binary "${1:-bin/osh}"
+}
+
 # Hm what is this suppose to do?  It waits for input
 demo-pty() {
   echo mystdin | client/headless_demo.py --to-new-pty
@@ -46,6 +51,9 @@ soil-run-py() {
 
   errors
   echo
+
+  server-test
+  echo
 }
 
 soil-run-cpp() {
@@ -53,6 +61,9 @@ soil-run-cpp() {
   echo
 
   cpp-demo
+  echo
+
+  server-test _bin/cxx-dbg/osh
 }
 
 
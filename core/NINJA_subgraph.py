@@ -42,12 +42,14 @@ def NinjaGraph(ru):
             # #include in cc file from 'use' deps
             '//frontend/syntax.asdl',
             '//core/value.asdl'
-        ])
+        ],
+        serialize_methods=True)
 
     ru.asdl_library(
         'core/value.asdl',
         # #include in cc file from 'use' deps
-        deps=['//frontend/syntax.asdl', '//core/runtime.asdl'])
+        deps=['//frontend/syntax.asdl', '//core/runtime.asdl'],
+        serialize_methods=True)
 
     ru.cc_binary('core/runtime_asdl_test.cc',
                  deps=['//core/runtime.asdl'],
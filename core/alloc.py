@@ -47,7 +47,13 @@ class Arena(object):
     def SaveTokens(self):
         # type: () -> None
         """
-        Used by --tool X.  Do we need LosslessArena?
+        Used by --tool X, and by tests of lossless parsing.  Do we need
+        LosslessArena?
+
+        Running a script or the interactive shell never saves tokens, so each
+        Token lives only as long as the AST that refers to it.  (Storing saved
+        tokens in parallel arrays only saved ~1% of the max RSS of 'osh --tool
+        tokens', so they're plain objects.)
         """
         self.save_tokens = True
 
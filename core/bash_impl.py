@@ -419,42 +419,125 @@ def BashAssoc_ToStrForShellPrint(assoc_val):
 
 #------------------------------------------------------------------------------
 # All BashArray operations depending on its internal representation come here.
+#
+# A BashArray is dense while its indices are exactly 0..n-1.  Then the elements
+# are stored in the list 'strs', and 'd' is empty.  Creating a hole, e.g. with
+# a[5]=x or unset 'a[0]', converts it to the sparse representation, where 'd'
+# maps indices to strings, 'max_index' is the largest index, and 'strs' is
+# None.
 
 
 def BashArray_New():
     # type: () -> value.BashArray
+    strs = []  # type: List[str]
     d = {}  # type: Dict[mops.BigInt, str]
-    max_index = mops.MINUS_ONE  # max index for empty array
-    return value.BashArray(d, max_index)
+    return value.BashArray(strs, d, mops.MINUS_ONE)
 
 
 def BashArray_Copy(val):
     # type: (value.BashArray) -> value.BashArray
     d = {}  # type: Dict[mops.BigInt, str]
+    if val.strs is not None:
+        return value.BashArray(val.strs[:], d, mops.MINUS_ONE)
+
     for index in val.d:
         d[index] = val.d[index]
-    return value.BashArray(d, val.max_index)
+    return value.BashArray(None, d, val.max_index)
 
 
 def BashArray_FromList(strs):
     # type: (List[str]) -> value.BashArray
     d = {}  # type: Dict[mops.BigInt, str]
+
+    has_holes = False
+    for s in strs:
+        if s is None:
+            has_holes = True
+            break
+    if not has_holes:
+        # Copy it, because the caller may mutate the list
+        return value.BashArray(strs[:], d, mops.MINUS_ONE)
+
+    # None in the list is an unset element
     max_index = mops.MINUS_ONE  # max index for empty array
     for s in strs:
         max_index = mops.Add(max_index, mops.ONE)
         if s is not None:
             d[max_index] = s
 
-    return value.BashArray(d, max_index)
+    return value.BashArray(None, d, max_index)
+
+
+def _BashArray_ToSparse(sparse_val):
+    # type: (value.BashArray) -> None
+    """Switch to the Dict representation, e.g. before creating a hole."""
+    strs = sparse_val.strs
+    if strs is None:
+        return
+
+    d = sparse_val.d
+    max_index = mops.MINUS_ONE
+    for s in strs:
+        max_index = mops.Add(max_index, mops.ONE)
+        d[max_index] = s
+
+    sparse_val.strs = None
+    sparse_val.max_index = max_index
+
+
+def _BashArray_DenseIndex(strs, index):
+    # type: (List[str], mops.BigInt) -> int
+    """Return the position of a non-negative index in the dense list.
+
+    It may be equal to len(strs), which means append.  Returns -1 if the index
+    is past that, which would create a hole.
+    """
+    n = mops.IntWiden(len(strs))
+    if BigInt_Greater(index, n):
+        return -1
+    return mops.BigTruncate(index)
+
+
+def _BashArray_Get(sparse_val, index):
+    # type: (value.BashArray, mops.BigInt) -> Optional[str]
+    strs = sparse_val.strs
+    if strs is not None:
+        if BigInt_Less(index, mops.ZERO):
+            return None
+        i = _BashArray_DenseIndex(strs, index)
+        if i == -1 or i == len(strs):
+            return None
+        return strs[i]
+
+    return sparse_val.d.get(index)
+
+
+def _BashArray_Set(sparse_val, index, s):
+    # type: (value.BashArray, mops.BigInt, str) -> None
+    strs = sparse_val.strs
+    if strs is not None and not BigInt_Less(index, mops.ZERO):
+        i = _BashArray_DenseIndex(strs, index)
+        if i == len(strs):
+            strs.append(s)
+            return
+        if i != -1:
+            strs[i] = s
+            return
+
+    _BashArray_ToSparse(sparse_val)
+    sparse_val.d[index] = s
+    if BigInt_Greater(index, sparse_val.max_index):
+        sparse_val.max_index = index
 
 
 def BashArray_ListInitialize(val, initializer, has_plus, blame_loc, arith_ev):
     # type: (value.BashArray, value.InitializerList, bool, loc_t, ArrayIndexEvaluator) -> None
     if not has_plus:
+        val.strs = []
         val.d.clear()
         val.max_index = mops.MINUS_ONE
 
-    array_index = val.max_index
+    array_index = mops.Sub(BashArray_Length(val), mops.ONE)
     for triplet in initializer.assigns:
         if triplet.key is not None:
             array_index = arith_ev.StringToBigInt(triplet.key, blame_loc)
@@ -463,32 +546,42 @@ def BashArray_ListInitialize(val, initializer, has_plus, blame_loc, arith_ev):
 
         s = triplet.rval
         if triplet.plus_eq:
-            old_s = val.d.get(array_index)
+            old_s = _BashArray_Get(val, array_index)
             if old_s is not None:
                 s = old_s + s
 
-        val.d[array_index] = s
-        if BigInt_Greater(array_index, val.max_index):
-            val.max_index = array_index
+        _BashArray_Set(val, array_index, s)
 
 
 def BashArray_IsEmpty(sparse_val):
     # type: (value.BashArray) -> bool
+    if sparse_val.strs is not None:
+        return len(sparse_val.strs) == 0
     return len(sparse_val.d) == 0
 
 
 def BashArray_Count(sparse_val):
     # type: (value.BashArray) -> int
+    if sparse_val.strs is not None:
+        return len(sparse_val.strs)
     return len(sparse_val.d)
 
 
 def BashArray_Length(sparse_val):
     # type: (value.BashArray) -> mops.BigInt
+    if sparse_val.strs is not None:
+        return mops.IntWiden(len(sparse_val.strs))
     return mops.Add(sparse_val.max_index, mops.ONE)
 
 
 def BashArray_GetKeys(sparse_val):
     # type: (value.BashArray) -> List[mops.BigInt]
+    if sparse_val.strs is not None:
+        indices = []  # type: List[mops.BigInt]
+        for i in xrange(len(sparse_val.strs)):
+            indices.append(mops.IntWiden(i))
+        return indices
+
     keys = sparse_val.d.keys()
     mylib.BigIntSort(keys)
     return keys
@@ -501,6 +594,10 @@ def BashArray_GetValues(sparse_val):
     match the index in a sparse array.
 
     """
+    if sparse_val.strs is not None:
+        # Copy it, because the caller may hold on to it while the array is
+        # mutated, e.g. a+=("${a[@]}")
+        return sparse_val.strs[:]
 
     values = []  # type: List[str]
     for index in BashArray_GetKeys(sparse_val):
@@ -510,6 +607,10 @@ def BashArray_GetValues(sparse_val):
 
 def BashArray_AppendValues(sparse_val, strs):
     # type: (value.BashArray, List[str]) ->  None
+    if sparse_val.strs is not None:
+        sparse_val.strs.extend(strs)
+        return
+
     for s in strs:
         sparse_val.max_index = mops.Add(sparse_val.max_index, mops.ONE)
         sparse_val.d[sparse_val.max_index] = s
@@ -526,7 +627,7 @@ def _BashArray_CanonicalizeIndex(sparse_val, index):
     """
 
     if BigInt_Less(index, mops.ZERO):
-        index = mops.Add(index, mops.Add(sparse_val.max_index, mops.ONE))
+        index = mops.Add(index, BashArray_Length(sparse_val))
         if BigInt_Less(index, mops.ZERO):
             return mops.MINUS_ONE, error_code_e.IndexOutOfRange
     return index, error_code_e.OK
@@ -537,7 +638,7 @@ def BashArray_HasElement(sparse_val, index):
     index, error_code = _BashArray_CanonicalizeIndex(sparse_val, index)
     if error_code != error_code_e.OK:
         return False, error_code
-    return index in sparse_val.d, error_code_e.OK
+    return _BashArray_Get(sparse_val, index) is not None, error_code_e.OK
 
 
 def BashArray_GetElement(sparse_val, index):
@@ -545,7 +646,7 @@ def BashArray_GetElement(sparse_val, index):
     index, error_code = _BashArray_CanonicalizeIndex(sparse_val, index)
     if error_code != error_code_e.OK:
         return None, error_code
-    return sparse_val.d.get(index), error_code_e.OK
+    return _BashArray_Get(sparse_val, index), error_code_e.OK
 
 
 def BashArray_SetElement(sparse_val, index, s):
@@ -553,9 +654,7 @@ def BashArray_SetElement(sparse_val, index, s):
     index, error_code = _BashArray_CanonicalizeIndex(sparse_val, index)
     if error_code != error_code_e.OK:
         return error_code
-    if BigInt_Greater(index, sparse_val.max_index):
-        sparse_val.max_index = index
-    sparse_val.d[index] = s
+    _BashArray_Set(sparse_val, index, s)
     return error_code_e.OK
 
 
@@ -564,6 +663,17 @@ def BashArray_UnsetElement(sparse_val, index):
     index, error_code = _BashArray_CanonicalizeIndex(sparse_val, index)
     if error_code != error_code_e.OK:
         return error_code
+
+    strs = sparse_val.strs
+    if strs is not None:
+        i = _BashArray_DenseIndex(strs, index)
+        if i == -1 or i == len(strs):
+            return error_code_e.OK  # not found, which isn't an error
+        if i == len(strs) - 1:
+            strs.pop()  # the array stays dense
+            return error_code_e.OK
+
+    _BashArray_ToSparse(sparse_val)
     mylib.dict_erase(sparse_val.d, index)
 
     # update max_index
@@ -577,13 +687,12 @@ def BashArray_UnsetElement(sparse_val, index):
 
 def BashArray_Equals(lhs, rhs):
     # type: (value.BashArray, value.BashArray) -> bool
-    len_lhs = len(lhs.d)
-    len_rhs = len(rhs.d)
-    if len_lhs != len_rhs:
+    if BashArray_Count(lhs) != BashArray_Count(rhs):
         return False
 
-    for index in lhs.d:
-        if index not in rhs.d or rhs.d[index] != lhs.d[index]:
+    for index in BashArray_GetKeys(lhs):
+        s = _BashArray_Get(rhs, index)
+        if s is None or s != _BashArray_Get(lhs, index):
             return False
 
     return True
@@ -593,6 +702,13 @@ def BashArray_ToStrForShellPrint(sparse_val):
     # type: (value.BashArray) -> str
     body = []  # type: List[str]
 
+    if sparse_val.strs is not None:
+        for s in sparse_val.strs:
+            if len(body) > 0:
+                body.append(" ")
+            body.append(j8_lite.MaybeShellEncode(s))
+        return "(%s)" % ''.join(body)
+
     is_sparse = not mops.Equal(mops.IntWiden(BashArray_Count(sparse_val)),
                                BashArray_Length(sparse_val))
 
@@ -0,0 +1,85 @@
+#!/usr/bin/env python2
+"""bash_impl_test.py: Tests for bash_impl.py"""
+
+import unittest
+
+from _devbuild.gen.runtime_asdl import error_code_e
+from core import bash_impl  # module under test
+from mycpp import mops
+
+
+def _Big(i):
+    return mops.IntWiden(i)
+
+
+class BashArrayTest(unittest.TestCase):
+
+    def testDense(self):
+        a = bash_impl.BashArray_FromList(['a', 'b'])
+        self.assertEqual(['a', 'b'], a.strs)
+
+        # append and overwrite keep it dense
+        bash_impl.BashArray_AppendValues(a, ['c'])
+        bash_impl.BashArray_SetElement(a, _Big(3), 'd')
+        bash_impl.BashArray_SetElement(a, _Big(-1), 'D')
+        self.assertEqual(['a', 'b', 'c', 'D'], a.strs)
+
+        # unsetting the last element shortens it
+        bash_impl.BashArray_UnsetElement(a, _Big(3))
+        self.assertEqual(['a', 'b', 'c'], a.strs)
+        self.assertEqual(3, mops.BigTruncate(bash_impl.BashArray_Length(a)))
+
+        # the caller can't mutate the array through the values
+        values = bash_impl.BashArray_GetValues(a)
+        values.append('z')
+        self.assertEqual(3, bash_impl.BashArray_Count(a))
+
+    def testSparse(self):
+        a = bash_impl.BashArray_FromList(['a', 'b', 'c'])
+
+        # a hole converts it
+        bash_impl.BashArray_UnsetElement(a, _Big(1))
+        self.assertEqual(None, a.strs)
+        self.assertEqual(['a', 'c'], bash_impl.BashArray_GetValues(a))
+        self.assertEqual(2, bash_impl.BashArray_Count(a))
+        self.assertEqual(3, mops.BigTruncate(bash_impl.BashArray_Length(a)))
+
+        b = bash_impl.BashArray_FromList(['a', 'b', 'c'])
+        bash_impl.BashArray_SetElement(b, _Big(5), 'f')
+        self.assertEqual(None, b.strs)
+        s, error_code = bash_impl.BashArray_GetElement(b, _Big(-1))
+        self.assertEqual('f', s)
+        self.assertEqual(error_code_e.OK, error_code)
+        s, error_code = bash_impl.BashArray_GetElement(b, _Big(4))
+        self.assertEqual(None, s)
+
+        s, error_code = bash_impl.BashArray_GetElement(b, _Big(-7))
+        self.assertEqual(error_code_e.IndexOutOfRange, error_code)
+
+        # None in the list is a hole
+        c = bash_impl.BashArray_FromList(['a', None, 'c'])
+        self.assertEqual(None, c.strs)
+        self.assertEqual('([0]=a [2]=c)',
+                         bash_impl.BashArray_ToStrForShellPrint(c))
+
+    def testEquals(self):
+        dense = bash_impl.BashArray_FromList(['a', 'b'])
+        sparse = bash_impl.BashArray_FromList(['a', 'b', 'c'])
+        bash_impl.BashArray_SetElement(sparse, _Big(5), 'f')
+        bash_impl.BashArray_UnsetElement(sparse, _Big(5))
+        bash_impl.BashArray_UnsetElement(sparse, _Big(2))
+        self.assertEqual(None, sparse.strs)
+
+        self.assertTrue(bash_impl.BashArray_Equals(dense, sparse))
+        self.assertTrue(bash_impl.BashArray_Equals(sparse, dense))
+
+        bash_impl.BashArray_SetElement(sparse, _Big(1), 'B')
+        self.assertFalse(bash_impl.BashArray_Equals(dense, sparse))
+
+        copied = bash_impl.BashArray_Copy(dense)
+        bash_impl.BashArray_AppendValues(copied, ['c'])
+        self.assertEqual(2, bash_impl.BashArray_Count(dense))
+
+
+if __name__ == '__main__':
+    unittest.main()
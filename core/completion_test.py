@@ -16,6 +16,7 @@ from _devbuild.gen.runtime_asdl import comp_action_e
 from _devbuild.gen.syntax_asdl import proc_sig
 from _devbuild.gen.value_asdl import (value, value_e)
 from core import completion  # module under test
+from core import bash_impl
 from core import comp_ui
 from core import sh_init
 from core import state
@@ -209,7 +210,7 @@ class CompletionTest(unittest.TestCase):
         frame = cmd_ev.mem.var_stack[0]
         assert frame is not None
         proc = value.Proc(node.name, node.name_tok, proc_sig.Open, node.body,
-                          [], True, None, frame, None)
+                          [], True, None, frame, None, 0)
 
         comp_lookup = completion.Lookup()
         a = completion.ShellFuncAction(cmd_ev, proc, comp_lookup)
@@ -795,7 +796,7 @@ class InitCompletionTest(unittest.TestCase):
             val = mem.GetValue('PASSED')
             self.assertEqual(value_e.BashArray, val.tag(),
                              "[case %d] Expected array, got %s" % (i, val))
-            actually_passed = val.d.values()
+            actually_passed = bash_impl.BashArray_GetValues(val)
 
             should_pass = [
                 'COMP_WORDS',
@@ -2,10 +2,11 @@
 from __future__ import print_function
 
 from errno import EINTR
+import time as time_
 
 from _devbuild.gen.id_kind_asdl import Id
 from _devbuild.gen.option_asdl import builtin_i, builtin_t
-from _devbuild.gen.runtime_asdl import RedirValue, trace
+from _devbuild.gen.runtime_asdl import cmd_value, RedirValue, trace
 from _devbuild.gen.syntax_asdl import (
     command,
     command_e,
@@ -13,6 +14,7 @@ from _devbuild.gen.syntax_asdl import (
     CompoundWord,
     loc,
     loc_t,
+    word_e,
     word_t,
 )
 from builtin import hay_ysh
@@ -28,6 +30,7 @@ from frontend import consts
 from frontend import lexer
 from mycpp import mylib
 from mycpp.mylib import str_switch, log, print_stderr
+from osh import word_
 from pylib import os_path
 from pylib import path_stat
 
@@ -36,8 +39,7 @@ from posix_ import X_OK  # translated directly to C macro
 
 from typing import cast, Dict, List, Tuple, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
-    from _devbuild.gen.runtime_asdl import (cmd_value, CommandStatus,
-                                            StatusArray)
+    from _devbuild.gen.runtime_asdl import CommandStatus, StatusArray
     from _devbuild.gen.syntax_asdl import command_t
     from builtin import trap_osh
     from core import optview
@@ -191,14 +193,35 @@ def _RewriteExternToBuiltin(argv):
             return consts.NO_INDEX
 
 
+class _DirIndex(object):
+    """The names in a $PATH directory, for shopt -s path_index."""
+
+    def __init__(self, mtime, names):
+        # type: (int, Dict[str, bool]) -> None
+        self.mtime = mtime  # -1 if the dir doesn't exist
+        self.names = names
+
+        # mtime has a resolution of 1 second, so a dir listed during the
+        # second it was modified may change without the mtime changing.
+        self.racy = mtime >= int(time_.time())
+
+
 class SearchPath(object):
     """For looking up files in $PATH or ENV.PATH"""
 
     def __init__(self, mem, exec_opts):
         # type: (state.Mem, optview.Exec) -> None
         self.mem = mem
+        self.exec_opts = exec_opts
         self.cache = {}  # type: Dict[str, str]
 
+        # The last value of PATH, and its parts
+        self.path_str = None  # type: Optional[str]
+        self.path_dirs = []  # type: List[str]
+
+        # dir -> names in it, validated by mtime
+        self.dir_index = {}  # type: Dict[str, _DirIndex]
+
     def _GetPath(self):
         # type: () -> List[str]
 
@@ -207,14 +230,92 @@ class SearchPath(object):
         if s is None:
             return []  # treat as empty path
 
-        # TODO: Could cache this to avoid split() allocating all the time.
-        return s.split(':')
+        # Avoid split() allocating on every lookup.  Callers must not mutate
+        # the List.
+        if self.path_str is None or s != self.path_str:
+            self.path_str = s
+            self.path_dirs = s.split(':')
+        return self.path_dirs
+
+    def _GetDirIndex(self, path_dir, validate):
+        # type: (str, bool) -> _DirIndex
+        index = self.dir_index.get(path_dir)
+        if index is not None and not validate:
+            return index
+
+        try:
+            _, mtime = pyos.MakeDirCacheKey(path_dir)
+        except (IOError, OSError) as e:
+            # There could be a directory that doesn't exist in the $PATH.
+            mtime = -1
+
+        if index is not None and index.mtime == mtime and not index.racy:
+            return index
+
+        names = {}  # type: Dict[str, bool]
+        if mtime != -1:
+            try:
+                entries = posix.listdir(path_dir)
+            except (IOError, OSError) as e:
+                entries = []
+            for name in entries:
+                names[name] = True
+
+        index = _DirIndex(mtime, names)
+        self.dir_index[path_dir] = index
+        return index
+
+    def _ProbeIndex(self, name, path_dirs, validate, exec_required):
+        # type: (str, List[str], bool, bool) -> Optional[str]
+        for path_dir in path_dirs:
+            # A relative dir like . depends on the current dir, so don't index
+            # it.
+            if path_dir.startswith('/'):
+                index = self._GetDirIndex(path_dir, validate)
+                if name not in index.names:
+                    continue
+
+            full_path = os_path.join(path_dir, name)
+            if exec_required:
+                found = _IsPathExecutable(full_path)
+            else:
+                found = path_stat.isfile(full_path)
+
+            if found:
+                return full_path
+
+        return None
+
+    def _LookupIndexed(self, name, exec_required):
+        # type: (str, bool) -> Optional[str]
+        """Like LookupExecutable(), but trust the directory index.
+
+        So we don't have to touch every dir before the one that contains the
+        name.  Like bash's hash table, a NEW file that shadows one later in
+        $PATH isn't noticed until 'hash -r'.
+        """
+        if len(name) == 0:  # special case for "$(true)"
+            return None
+
+        if '/' in name:
+            return name if path_stat.exists(name) else None
+
+        path_dirs = self._GetPath()
+        full_path = self._ProbeIndex(name, path_dirs, False, exec_required)
+        if full_path is None:
+            # A dir may have changed since we indexed it, e.g. a program was
+            # installed.  So check mtimes before reporting that it's not found.
+            full_path = self._ProbeIndex(name, path_dirs, True, exec_required)
+        return full_path
 
     def LookupOne(self, name, exec_required=True):
         # type: (str, bool) -> Optional[str]
         """
         Returns the path itself (if relative path), the resolved path, or None.
         """
+        if self.exec_opts.path_index():
+            return self._LookupIndexed(name, exec_required)
+
         return LookupExecutable(name,
                                 self._GetPath(),
                                 exec_required=exec_required)
@@ -263,6 +364,7 @@ class SearchPath(object):
         # type: () -> None
         """For hash -r."""
         self.cache.clear()
+        self.dir_index.clear()
 
     def CachedCommands(self):
         # type: () -> List[str]
@@ -450,6 +552,7 @@ class ShellExecutor(vm._Executor):
             job_list,  # type: process.JobList
             fd_state,  # type: process.FdState
             trap_state,  # type: trap_osh.TrapState
+            builtin_stdout,  # type: vm.BuiltinStdout
     ):
         # type: (...) -> None
         vm._Executor.__init__(self, mem, exec_opts, mutable_opts, procs,
@@ -463,6 +566,7 @@ class ShellExecutor(vm._Executor):
         self.job_list = job_list
         self.fd_state = fd_state
         self.trap_state = trap_state
+        self.builtin_stdout = builtin_stdout
         self.process_sub_stack = []  # type: List[_ProcessSubFrame]
         self.clean_frame_pool = []  # type: List[_ProcessSubFrame]
 
@@ -745,6 +849,14 @@ class ShellExecutor(vm._Executor):
 
         return p.RunProcess(self.waiter, trace.ForkWait)
 
+    def MakeProcess(self, node):
+        # type: (command_t) -> process.Process
+        """For forkmany, which starts and waits for many processes itself.
+
+        Like the parts of a pipeline, they stay in the shell's process group.
+        """
+        return self._MakeProcess(node, True, self.exec_opts.errtrace())
+
     def CaptureStdout(self, node):
         # type: (command_t) -> Tuple[int, str]
 
@@ -787,6 +899,78 @@ class ShellExecutor(vm._Executor):
 
         return status, stdout_str
 
+    def _CaptureInProcess(self, node):
+        # type: (command_t) -> Tuple[int, str]
+        """Run $(echo $x) and similar without forking.
+
+        Returns status -1 if the command sub needs its own process.  We only
+        handle a single echo, printf, or write whose words can't change shell
+        state, so a subshell would behave the same.  Function bodies still
+        fork, since they can assign, exit, or fail with errexit.
+        """
+        if node.tag() != command_e.Simple:
+            return -1, ''
+        simple = cast(command.Simple, node)
+
+        # The child would trace with its PID, and could run the ERR trap
+        if self.exec_opts.xtrace() or self.exec_opts.errtrace():
+            return -1, ''
+        if self.exec_opts._running_hay():
+            return -1, ''
+
+        if (len(simple.more_env) or simple.redirects is not None or
+                simple.typed_args or simple.block):
+            return -1, ''
+
+        words = []  # type: List[CompoundWord]
+        for w in simple.words:
+            if w.tag() != word_e.Compound:  # e.g. brace expansion
+                return -1, ''
+            cw = cast(CompoundWord, w)
+            if not word_.IsPureWord(cw):
+                return -1, ''
+            words.append(cw)
+
+        buf = mylib.BufWriter()
+        try:
+            cmd_val = cast(cmd_value.Argv,
+                           self.cmd_ev.word_ev.EvalWordSequence2(words, False))
+            argv = cmd_val.argv
+            if len(argv) == 0:
+                return -1, ''
+
+            arg0 = argv[0]
+            builtin_id = consts.LookupNormalBuiltin(arg0)
+            if builtin_id not in (builtin_i.echo, builtin_i.printf,
+                                  builtin_i.write):
+                return -1, ''
+            if builtin_id == builtin_i.printf:
+                if len(argv) > 1 and argv[1].startswith('-v'):
+                    return -1, ''  # assigns a variable
+                for arg in argv:
+                    if '%(' in arg:
+                        return -1, ''  # %(fmt)T calls putenv('TZ')
+
+            # Procs and hay names shadow builtins
+            proc_val, self_obj = self.procs.GetInvokable(arg0)
+            if proc_val is not None or self.hay_state.Resolve(arg0):
+                return -1, ''
+
+            with vm.ctx_CaptureStdout(self.builtin_stdout, buf):
+                status = self.RunBuiltin(builtin_id, cmd_val)
+
+        except error.FatalRuntime as e:
+            # Word errors like ${x?} are reported the way the child would
+            # report them, and don't abort the parent
+            if not e.HasLocation():
+                e.location = self.mem.GetFallbackLocation()
+            self.errfmt.PrettyPrintError(e, prefix='fatal: ')
+            status = e.ExitStatus()
+
+        # common shell behavior: remove NUL from stdout
+        stdout_str = buf.getvalue().replace('\0', '').rstrip('\n')
+        return status, stdout_str
+
     def Capture3(self, node):
         # type: (command_t) -> Tuple[int, str, str]
 
@@ -879,7 +1063,9 @@ class ShellExecutor(vm._Executor):
                 node = command.Simple(blame_tok, [], self.builtin_cat_words,
                                         None, None, False, redir_node.redirects)
 
-        status, stdout_str = self.CaptureStdout(node)
+        status, stdout_str = self._CaptureInProcess(node)
+        if status == -1:
+            status, stdout_str = self.CaptureStdout(node)
 
         # OSH has the concept of aborting in the middle of a WORD.  We're not
         # waiting until the command is over!
@@ -6,6 +6,8 @@ Variants:
   main_loop.Headless()       calls Batch() like eval and source.
                                    We want 'echo 1\necho 2\n' to work, so we
                                    don't bother with "the PS2 problem".
+                                   Serve() forks a Headless session for each
+                                   connection to a Unix socket.
   main_loop.ParseWholeFile() calls ParseLogicalLine().  Used by osh -n.
 """
 from __future__ import print_function
@@ -16,21 +18,27 @@ from _devbuild.gen.syntax_asdl import (command, command_t, parse_result,
 from core import alloc
 from core import error
 from core import process
+from core import pyos
+from core import pyutil
 from core import state
 from core import util
 from display import ui
 from frontend import reader
 from osh import cmd_eval
+from mycpp import iolib
 from mycpp import mylib
 from mycpp.mylib import log, print_stderr, probe, tagswitch
 
 import fanos
+import libc
 import posix_ as posix
+from signal import SIGCHLD, SIG_DFL, SIG_IGN
 
-from typing import cast, Any, List, Tuple, TYPE_CHECKING
+from typing import cast, Any, List, Optional, Tuple, TYPE_CHECKING
 if TYPE_CHECKING:
     from core.comp_ui import _IDisplay
     from core import process
+    from core import parse_cache
     from frontend import parse_lib
     from osh import cmd_parse
     from osh import cmd_eval
@@ -108,14 +116,75 @@ class Headless(object):
         self.parse_ctx = parse_ctx
         self.errfmt = errfmt
 
+        # Where we receive requests and send replies.  A session forked by
+        # Serve() uses its connection for both.
+        self.in_fd = 0
+        self.out_fd = 1
+
     def Loop(self):
         # type: () -> int
         try:
             return self._Loop()
         except ValueError as e:
-            fanos.send(1, 'ERROR %s' % e)
+            fanos.send(self.out_fd, 'ERROR %s' % e)
             return 1
 
+    def Serve(self, sock_path):
+        # type: (str) -> int
+        """Accept connections on a Unix socket, and fork a session for each.
+
+        Each session is a copy of this shell, so it starts with the functions,
+        modules, and variables that were loaded before serving.  It handles
+        requests until the client closes the connection.
+
+        Returns:
+          In the parent, 1 if the socket couldn't be created.  In a session,
+          the status of Loop(), so the caller can exit like a headless shell.
+        """
+        try:
+            listen_fd = fanos.listen(sock_path)
+        except (IOError, OSError) as e:
+            print_stderr('oils: Failed to listen on %r: %s' %
+                         (sock_path, pyutil.strerror(e)))
+            return 1
+        except ValueError as e:
+            print_stderr('oils: Failed to listen on %r: %s' % (sock_path, e))
+            return 1
+
+        # Finished sessions are reaped by the kernel, so an idle server doesn't
+        # accumulate zombies
+        iolib.sigaction(SIGCHLD, SIG_IGN)
+
+        fanos_log('Listening on %s' % sock_path)
+        while True:
+            try:
+                conn_fd = fanos.accept(listen_fd)
+            except (IOError, OSError) as e:
+                # e.g. EMFILE or ECONNABORTED.  Keep serving other clients.
+                fanos_log('accept() failed: %s' % pyutil.strerror(e))
+                continue
+
+            try:
+                pid = posix.fork()
+            except OSError as e:
+                # The client sees EOF, and the server keeps going
+                fanos_log('fork() failed: %s' % pyutil.strerror(e))
+                posix.close(conn_fd)
+                continue
+
+            if pid == 0:  # child
+                # The session waits for its own processes
+                iolib.sigaction(SIGCHLD, SIG_DFL)
+                posix.close(listen_fd)
+                self.in_fd = conn_fd
+                self.out_fd = conn_fd
+                status = self.Loop()
+                posix.close(conn_fd)
+                return status
+
+            posix.close(conn_fd)
+            fanos_log('Session PID %d' % pid)
+
     def EVAL(self, arg):
         # type: (str) -> str
 
@@ -127,10 +196,10 @@ class Headless(object):
         line_reader = reader.StringLineReader(arg, self.parse_ctx.arena)
         c_parser = self.parse_ctx.MakeOshParser(line_reader)
 
-        # Status is unused; $_ can be queried by the headless client
-        unused_status = Batch(self.cmd_ev, c_parser, self.errfmt, 0)
+        status = Batch(self.cmd_ev, c_parser, self.errfmt, 0)
 
-        return ''  # result is always 'OK ' since there was no protocol error
+        # The reply is 'OK 0' and so forth, since there was no protocol error
+        return str(status)
 
     def _Loop(self):
         # type: () -> int
@@ -141,7 +210,7 @@ class Headless(object):
         fd_out = []  # type: List[int]
         while True:
             try:
-                blob = fanos.recv(0, fd_out)
+                blob = fanos.recv(self.in_fd, fd_out)
             except ValueError as e:
                 fanos_log('protocol error: %s' % e)
                 raise  # higher level handles it
@@ -186,7 +255,7 @@ class Headless(object):
                 fanos_log('Invalid command %r' % command)
                 raise ValueError('Invalid command %r' % command)
 
-            fanos.send(1, b'OK %s' % reply)
+            fanos.send(self.out_fd, b'OK %s' % reply)
             del fd_out[:]  # reset for next iteration
 
         return 0
@@ -328,12 +397,17 @@ def Batch(
         c_parser,  # type: cmd_parse.CommandParser
         errfmt,  # type: ui.ErrorFormatter
         cmd_flags=0,  # type: int
+        cached_file=None,  # type: Optional[parse_cache.CachedFile]
 ):
     # type: (...) -> int
     """
     source, eval, etc. treat parse errors as error code 2.  But the --eval flag does not.
     """
-    was_parsed, status = Batch2(cmd_ev, c_parser, errfmt, cmd_flags=cmd_flags)
+    was_parsed, status = Batch2(cmd_ev,
+                                c_parser,
+                                errfmt,
+                                cmd_flags=cmd_flags,
+                                cached_file=cached_file)
     if not was_parsed:
         return 2
     return status
@@ -344,10 +418,14 @@ def Batch2(
         c_parser,  # type: cmd_parse.CommandParser
         errfmt,  # type: ui.ErrorFormatter
         cmd_flags=0,  # type: int
+        cached_file=None,  # type: Optional[parse_cache.CachedFile]
 ):
     # type: (...) -> Tuple[bool, int]
     """Loop for batch execution.
 
+    If cached_file is passed, it's used instead of c_parser.  It may replay
+    nodes from the parse cache.
+
     Returns:
       int status, e.g. 2 on parse error
 
@@ -372,9 +450,14 @@ def Batch2(
     while True:
         probe('main_loop', 'Batch_parse_enter')
         try:
-            node = c_parser.ParseLogicalLine()  # can raise ParseError
+            if cached_file:
+                node = cached_file.ParseLogicalLine()  # can raise ParseError
+            else:
+                node = c_parser.ParseLogicalLine()  # can raise ParseError
             if node is None:  # EOF
                 c_parser.CheckForPendingHereDocs()  # can raise ParseError
+                if cached_file:
+                    cached_file.Finish()
                 break
         except error.Parse as e:
             errfmt.PrettyPrintError(e)
@@ -445,6 +528,7 @@ def EvalFile(
         parse_ctx,  # type: parse_lib.ParseContext
         cmd_ev,  # type: cmd_eval.CommandEvaluator
         lang,  # type: str
+        cache=None,  # type: Optional[parse_cache.ParseCache]
 ):
     # type: (...) -> Tuple[bool, int]
     """Evaluate a disk file, for --eval --eval-pure
@@ -466,6 +550,7 @@ def EvalFile(
         return False, -1
 
     line_reader = reader.FileLineReader(f, cmd_ev.arena)
+    line_reader.ShareLines()
     c_parser = parse_ctx.MakeOshParser(line_reader)
 
     # TODO:
@@ -478,9 +563,17 @@ def EvalFile(
             with state.ctx_ThisDir(cmd_ev.mem, fs_path):
                 src = source.MainFile(fs_path)
                 with alloc.ctx_SourceCode(cmd_ev.arena, src):
+                    cached_file = None  # type: Optional[parse_cache.CachedFile]
+                    if cache:
+                        real_path = libc.realpath(fs_path)
+                        if real_path is not None:
+                            cached_file = cache.Open(real_path, src, c_parser)
+
                     # May raise util.HardExit
-                    was_parsed, status = Batch2(cmd_ev, c_parser,
-                                                cmd_ev.errfmt)
+                    was_parsed, status = Batch2(cmd_ev,
+                                                c_parser,
+                                                cmd_ev.errfmt,
+                                                cached_file=cached_file)
                     if not was_parsed:
                         return False, -1
 
@@ -0,0 +1,269 @@
+"""
+parse_cache.py - Cache the syntax trees of 'source' and 'use' files on disk.
+
+An entry is a file in $XDG_CACHE_HOME/oils/parse, named after the real path of
+the source file.  It's written with pyserial.Encoder:
+
+    Str(version)   Oils version, schema hashes, and the number of Ids
+    Str(key)       pyos.FileCacheKey() of the source file, with size and mtime
+    Str(path)
+
+    Then for each logical line, as returned by ParseLogicalLine():
+
+    Int(line_num)     the line the parser started reading from
+    Int(fingerprint)  the parse options in effect
+    command_t
+
+    Int(0)         end of file
+
+Parsing depends on shell state, like 'shopt --set ysh:upgrade' at the top of
+the file, so each node is validated against the options at the time it's
+needed.  If they differ, we skip to its line and parse the rest of the file.
+
+Entries are only written when the whole file was parsed, and when no aliases
+could have been expanded.
+"""
+from __future__ import print_function
+
+from errno import EINTR
+
+from _devbuild.gen.id_kind_asdl import Id
+from _devbuild.gen import syntax_asdl
+from _devbuild.gen.syntax_asdl import command_t, source_t
+from _devbuild.gen import value_asdl
+from asdl import pyserial
+from core import pyos
+from frontend import consts
+from mycpp.mylib import log
+
+import posix_ as posix
+from posix_ import O_RDONLY
+
+from typing import List, Optional, TYPE_CHECKING
+if TYPE_CHECKING:
+    from core import state
+    from frontend.parse_lib import ParseContext
+    from osh import cmd_parse
+
+_ = log
+
+# Longer names may be rejected by the file system
+_MAX_NAME_LEN = 200
+
+
+def _ReadFile(path):
+    # type: (str) -> Optional[str]
+    try:
+        fd = posix.open(path, O_RDONLY, 0)
+    except (IOError, OSError):
+        return None
+
+    chunks = []  # type: List[str]
+    ok = True
+    while True:
+        n, err_num = pyos.Read(fd, 65536, chunks)
+        if n < 0:
+            if err_num == EINTR:
+                continue  # retry
+            ok = False
+            break
+        if n == 0:  # EOF
+            break
+    posix.close(fd)
+
+    if not ok:
+        return None
+    return ''.join(chunks)
+
+
+class ParseCache(object):
+    """Shared by the 'source' and 'use' builtins, and --eval."""
+
+    def __init__(
+            self,
+            cache_dir,  # type: str
+            version_str,  # type: str
+            parse_ctx,  # type: ParseContext
+            mutable_opts,  # type: state.MutableOpts
+    ):
+        # type: (...) -> None
+        self.cache_dir = cache_dir
+        # Changes when the encoding of the tree could change
+        self.version_str = '%s %d %d %d' % (
+            version_str, syntax_asdl.SCHEMA_HASH, value_asdl.SCHEMA_HASH,
+            Id.ARRAY_SIZE)
+        self.parse_ctx = parse_ctx
+        self.mutable_opts = mutable_opts
+
+        # For pp cache-stats_
+        self.num_hits = 0
+        self.num_misses = 0
+        self.num_written = 0
+
+    def Fingerprint(self):
+        # type: () -> int
+        """Returns the parse options as a bit mask, or -1 if the parse can't
+        be cached."""
+        fp = 0
+        for i, opt_num in enumerate(consts.PARSE_OPTION_NUMS):
+            if self.mutable_opts.Get(opt_num):
+                fp |= 1 << i
+
+        # Alias expansion depends on more than options
+        if (self.parse_ctx.parse_opts.expand_aliases() and
+                len(self.parse_ctx.aliases)):
+            return -1
+        return fp
+
+    def _CachePath(self, path):
+        # type: (str) -> Optional[str]
+        name = path.replace('%', '%25').replace('/', '%2F')
+        if len(name) > _MAX_NAME_LEN:
+            return None
+        return '%s/%s' % (self.cache_dir, name)
+
+    def Open(self, path, src, c_parser):
+        # type: (str, source_t, cmd_parse.CommandParser) -> Optional[CachedFile]
+        """Returns a CachedFile to parse with, or None if caching is disabled.
+
+        Args:
+          path: real path of a disk file, which c_parser reads from
+          src: pushed with ctx_SourceCode.  Decoded lines point to it.
+        """
+        if not self.parse_ctx.parse_opts.parse_cache():
+            return None
+        if self.parse_ctx.do_lossless or self.parse_ctx.arena.save_tokens:
+            return None  # tools want the lines and tokens in the arena
+
+        cache_path = self._CachePath(path)
+        if cache_path is None:
+            return None
+        key = pyos.FileCacheKey(path)
+        if len(key) == 0:
+            return None  # can't tell if it changed
+
+        contents = _ReadFile(cache_path)
+        if contents is not None:
+            dec = pyserial.Decoder(contents)
+            if (dec.Str() == self.version_str and dec.Str() == key and
+                    dec.Str() == path):
+                dec.Seed(src)
+                cached = CachedFile(self, c_parser, None, None)
+                if cached.Load(dec):
+                    self.num_hits += 1
+                    return cached
+
+        self.num_misses += 1
+
+        enc = pyserial.Encoder()
+        enc.Str(self.version_str)
+        enc.Str(key)
+        enc.Str(path)
+        enc.Seed(src)
+        return CachedFile(self, c_parser, enc, cache_path)
+
+    def Write(self, cache_path, contents):
+        # type: (str, str) -> None
+
+        # Errors are ignored, e.g. with a read-only home dir
+        if pyos.MakeDirs(self.cache_dir) != 0:
+            return
+        if pyos.WriteFileAtomic(cache_path, contents) == 0:
+            self.num_written += 1
+
+
+class CachedFile(object):
+    """Wraps a CommandParser for main_loop.Batch().
+
+    Either replays a cached entry, or records the nodes it parses into a new
+    one.
+    """
+
+    def __init__(
+            self,
+            cache,  # type: ParseCache
+            c_parser,  # type: cmd_parse.CommandParser
+            enc,  # type: Optional[pyserial.Encoder]
+            cache_path,  # type: Optional[str]
+    ):
+        # type: (...) -> None
+        self.cache = cache
+        self.c_parser = c_parser
+
+        # Recording
+        self.enc = enc
+        self.cache_path = cache_path
+
+        # Replaying
+        self.replaying = False
+        self.line_nums = []  # type: List[int]
+        self.fingerprints = []  # type: List[int]
+        self.nodes = []  # type: List[command_t]
+        self.pos = 0
+
+    def Load(self, dec):
+        # type: (pyserial.Decoder) -> bool
+        """Decode all nodes up front, so a corrupt entry is a miss."""
+        while True:
+            line_num = dec.Int()
+            if line_num == 0:
+                break
+            self.line_nums.append(line_num)
+            self.fingerprints.append(dec.Int())
+            self.nodes.append(command_t.Decode(dec))
+
+        if not dec.Ok() or not dec.AtEnd():
+            return False
+        self.replaying = True
+        return True
+
+    def ParseLogicalLine(self):
+        # type: () -> command_t
+        """Like CommandParser.ParseLogicalLine().
+
+        Raises:
+          ParseError
+        """
+        if self.replaying:
+            if self.pos == len(self.nodes):
+                return None  # EOF
+
+            if self.fingerprints[self.pos] == self.cache.Fingerprint():
+                node = self.nodes[self.pos]
+                self.pos += 1
+                return node
+
+            # Options changed, so parse the rest of the file
+            self.replaying = False
+            line_reader = self.c_parser.line_reader
+            line_reader.SkipLines(self.line_nums[self.pos] -
+                                  line_reader.line_num)
+
+        if self.enc is None:
+            return self.c_parser.ParseLogicalLine()
+
+        line_num = self.c_parser.line_reader.line_num
+        fp = self.cache.Fingerprint()
+
+        node = self.c_parser.ParseLogicalLine()
+        if node is None:  # EOF
+            return None
+
+        if fp == -1:
+            self.enc = None
+        else:
+            self.enc.Int(line_num)
+            self.enc.Int(fp)
+            node.Encode(self.enc)
+            if not self.enc.Ok():
+                self.enc = None
+        return node
+
+    def Finish(self):
+        # type: () -> None
+        """Called after the whole file was parsed."""
+        if self.enc is None:
+            return
+        self.enc.Int(0)
+        self.cache.Write(self.cache_path, self.enc.Finish())
+        self.enc = None
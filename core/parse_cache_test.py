@@ -0,0 +1,160 @@
+#!/usr/bin/env python2
+from __future__ import print_function
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from _devbuild.gen.option_asdl import option_i
+from _devbuild.gen.syntax_asdl import source
+from asdl import pyserial
+from core import alloc
+from core import parse_cache  # module under test
+from core import pyutil
+from core import state
+from core import test_lib
+from frontend import parse_lib
+from frontend import reader
+
+CODE = """\
+# comment
+f() {
+  echo "f $1"
+}
+
+cat <<EOT
+here $((1 + 2))
+EOT
+echo one; echo two
+x=(a b
+   c)
+"""
+
+
+class ParseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'lib.sh')
+        with open(self.path, 'w') as f:
+            f.write(CODE)
+        os.utime(self.path, (0, 1000000))  # not modified this second
+
+        self.arena = alloc.Arena()
+        mem = test_lib.MakeMem(self.arena)
+        parse_opts, _, self.mutable_opts = state.MakeOpts(mem, {}, None)
+        self.aliases = {}
+        ysh_grammar = pyutil.LoadYshGrammar(pyutil.GetResourceLoader())
+        self.parse_ctx = parse_lib.ParseContext(self.arena, parse_opts,
+                                                self.aliases, ysh_grammar)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _MakeCache(self):
+        return parse_cache.ParseCache(os.path.join(self.tmp_dir, 'cache'),
+                                      '1.0', self.parse_ctx,
+                                      self.mutable_opts)
+
+    def _Parse(self, cache, skew=-1):
+        """Returns the encoded nodes, and whether the entry was replayed."""
+        with open(self.path) as f:
+            line_reader = reader.FileLineReader(f, self.arena)
+            c_parser = self.parse_ctx.MakeOshParser(line_reader)
+            src = source.MainFile(self.path)
+            with alloc.ctx_SourceCode(self.arena, src):
+                cached = cache.Open(self.path, src, c_parser)
+                replayed = cached.replaying
+                if skew != -1:  # Pretend options changed before this node
+                    cached.fingerprints[skew] = -2
+
+                enc = pyserial.Encoder()
+                enc.Seed(src)
+                while True:
+                    node = cached.ParseLogicalLine()
+                    if node is None:
+                        c_parser.CheckForPendingHereDocs()
+                        cached.Finish()
+                        break
+                    node.Encode(enc)
+        return enc.Finish(), replayed
+
+    def testRecordAndReplay(self):
+        cache = self._MakeCache()
+
+        expected, replayed = self._Parse(cache)
+        self.assertFalse(replayed)
+        self.assertEqual(1, cache.num_written)
+
+        actual, replayed = self._Parse(cache)
+        self.assertTrue(replayed)
+        self.assertEqual(expected, actual)
+        self.assertEqual(1, cache.num_hits)
+        self.assertEqual(1, cache.num_misses)
+
+    def testFallBack(self):
+        cache = self._MakeCache()
+        expected, _ = self._Parse(cache)
+
+        # f, cat, echo, x
+        for i in xrange(4):
+            actual, replayed = self._Parse(cache, skew=i)
+            self.assertTrue(replayed)
+            self.assertEqual(expected, actual, i)
+
+    def testStale(self):
+        cache = self._MakeCache()
+        self._Parse(cache)
+
+        # Same size, different mtime
+        os.utime(self.path, (0, 2000000))
+        _, replayed = self._Parse(cache)
+        self.assertFalse(replayed)
+
+        # Different version
+        cache2 = parse_cache.ParseCache(cache.cache_dir, '2.0', self.parse_ctx,
+                                        self.mutable_opts)
+        _, replayed = self._Parse(cache2)
+        self.assertFalse(replayed)
+
+        # Modified this second
+        os.utime(self.path, None)
+        with open(self.path) as f:
+            c_parser = self.parse_ctx.MakeOshParser(
+                reader.FileLineReader(f, self.arena))
+            self.assertEqual(
+                None, cache.Open(self.path, source.MainFile(self.path),
+                                 c_parser))
+
+    def testCorrupt(self):
+        cache = self._MakeCache()
+        self._Parse(cache)
+
+        cache_path = cache._CachePath(self.path)
+        with open(cache_path) as f:
+            contents = f.read()
+        with open(cache_path, 'w') as f:
+            f.write(contents[:-10])
+
+        _, replayed = self._Parse(cache)
+        self.assertFalse(replayed)
+        # It's rewritten
+        _, replayed = self._Parse(cache)
+        self.assertTrue(replayed)
+
+    def testAliases(self):
+        cache = self._MakeCache()
+        self.mutable_opts.opt0_array[option_i.expand_aliases] = True
+        self.aliases['ll'] = 'ls -l'
+        self.assertEqual(-1, cache.Fingerprint())
+
+        self._Parse(cache)
+        self.assertEqual(0, cache.num_written)
+
+        self.mutable_opts.opt0_array[option_i.expand_aliases] = False
+        self.assertNotEqual(-1, cache.Fingerprint())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -74,6 +74,7 @@ if TYPE_CHECKING:
     from builtin import trap_osh
     from core import optview
     from core import vm
+    from core.stat_cache import StatCache
     from core.util import _DebugFile
     from osh.cmd_eval import CommandEvaluator
 
@@ -199,12 +200,14 @@ class FdState(object):
             tracer,  # type: Optional[dev.Tracer]
             waiter,  # type: Optional[Waiter]
             exec_opts,  # type: optview.Exec
+            stat_cache,  # type: StatCache
     ):
         # type: (...) -> None
         """
         Args:
           errfmt: for errors
           job_list: For keeping track of _HereDocWriterThunk
+          stat_cache: cleared when we open a file for writing
         """
         self.errfmt = errfmt
         self.job_control = job_control
@@ -215,6 +218,7 @@ class FdState(object):
         self.tracer = tracer
         self.waiter = waiter
         self.exec_opts = exec_opts
+        self.stat_cache = stat_cache
 
     def Open(self, path):
         # type: (str) -> mylib.LineReader
@@ -436,6 +440,9 @@ class FdState(object):
                     # /dev/null, we can open(2) it without O_EXCL. (Note,
                     # there is a race here. See demo/noclobber-race.sh)
 
+                if mode != O_RDONLY:  # may create or truncate the file
+                    self.stat_cache.Clear()
+
                 # NOTE: 0666 is affected by umask, all shells use it.
                 try:
                     open_fd = posix.open(arg.filename, mode, 0o666)
@@ -691,6 +698,20 @@ class StderrToPipe(ChildStateChange):
         #log('child CLOSE r %d pid=%d', self.r, posix.getpid())
 
 
+class StdinFromDevNull(ChildStateChange):
+    """For forkmany jobs, while the parent reads items from stdin."""
+
+    def __init__(self):
+        # type: () -> None
+        ChildStateChange.__init__(self)
+
+    def Apply(self):
+        # type: () -> None
+        fd = posix.open('/dev/null', O_RDONLY, 0o666)
+        posix.dup2(fd, 0)
+        posix.close(fd)
+
+
 INVALID_PGID = -1
 # argument to setpgid() that means the process is its own leader
 OWN_LEADER = 0
@@ -722,6 +743,11 @@ class SetPgid(ChildStateChange):
                 % (proc.pid, self.pgid, pyutil.strerror(e)))
 
 
+# Signals that a child shouldn't inherit SIG_IGN for.  See the comments in
+# Process.StartProcess().
+_SPAWN_SIGDEF = [SIGPIPE, SIGQUIT, SIGTTOU, SIGTTIN]
+
+
 class ExternalProgram(object):
     """The capability to execute an external program like 'ls'."""
 
@@ -754,6 +780,25 @@ class ExternalProgram(object):
                    True)
         assert False, "This line should never execute"  # NO RETURN
 
+    def Spawn(self, argv0_path, cmd_val, environ):
+        # type: (str, cmd_value.Argv, Dict[str, str]) -> int
+        """Start a program with posix_spawn(), which avoids copying the page
+        tables of the heap like fork() does.
+
+        Returns the PID, or -1 if the caller should fork() and Exec() instead.
+        """
+        if len(self.hijack_shebang):
+            return -1  # we have to read the file in the child
+
+        try:
+            pid = posix.posix_spawn(argv0_path, cmd_val.argv, environ,
+                                    _SPAWN_SIGDEF)
+        except (IOError, OSError) as e:
+            # e.g. ENOEXEC needs the /bin/sh retry, and EACCES needs an error
+            # message and status.  Exec() handles them.
+            return -1
+        return pid
+
     def _Exec(self, argv0_path, argv, argv0_loc, environ, should_retry):
         # type: (str, List[str], loc_t, Dict[str, str], bool) -> None
         if len(self.hijack_shebang):
@@ -831,6 +876,14 @@ class Thunk(object):
         """Returns a status code."""
         raise NotImplementedError()
 
+    def Spawn(self):
+        # type: () -> int
+        """Start the thunk without fork(), if possible.
+
+        Returns the PID, or -1 if the caller should fork() and Run() instead.
+        """
+        return -1
+
     def UserString(self):
         # type: () -> str
         """Display for the 'jobs' list."""
@@ -866,6 +919,11 @@ class ExternalThunk(Thunk):
         """An ExternalThunk is run in parent for the exec builtin."""
         self.ext_prog.Exec(self.argv0_path, self.cmd_val, self.environ)
 
+    def Spawn(self):
+        # type: () -> int
+        return self.ext_prog.Spawn(self.argv0_path, self.cmd_val,
+                                   self.environ)
+
 
 class BuiltinThunk(Thunk):
     """Builtin thunk - for running builtins in a forked subprocess"""
@@ -1020,6 +1078,7 @@ class Job(object):
         self.state = job_state_e.Running
         self.job_id = -1
         self.in_background = False
+        self.status = -1  # for 'wait' jobs
 
     def DisplayJob(self, job_id, f, style):
         # type: (int, mylib.Writer, int) -> None
@@ -1039,6 +1098,11 @@ class Job(object):
         """Return the pid we can wait on."""
         raise NotImplementedError()
 
+    def AllPids(self):
+        # type: () -> List[int]
+        """Return the PIDs of every process in this job."""
+        raise NotImplementedError()
+
     def JobWait(self, waiter):
         # type: (Waiter) -> wait_status_t
         """Wait for this process/pipeline to be stopped or finished."""
@@ -1086,7 +1150,6 @@ class Process(Job):
         self.close_w = -1
 
         self.pid = -1
-        self.status = -1
 
     def Init_ParentPipeline(self, pi):
         # type: (Pipeline) -> None
@@ -1120,6 +1183,11 @@ class Process(Job):
         assert self.pid != -1
         return self.pid
 
+    def AllPids(self):
+        # type: () -> List[int]
+        assert self.pid != -1
+        return [self.pid]
+
     def DisplayJob(self, job_id, f, style):
         # type: (int, mylib.Writer, int) -> None
         if job_id == -1:
@@ -1152,7 +1220,17 @@ class Process(Job):
     def StartProcess(self, why):
         # type: (trace_t) -> int
         """Start this process with fork(), handling redirects."""
-        pid = posix.fork()
+        pid = -1
+        if len(self.state_changes) == 0:
+            # Fast path for external commands.  Redirects were already applied
+            # in the parent, and the signal dispositions set below can be
+            # passed to posix_spawn().  SIGTSTP isn't one of them, because this
+            # child doesn't lead a process group.
+            pid = self.thunk.Spawn()
+
+        if pid == -1:
+            pid = posix.fork()
+
         if pid < 0:
             # When does this happen?
             e_die('Fatal error in posix.fork()')
@@ -1252,7 +1330,7 @@ class Process(Job):
 
     def WhenContinued(self):
         # type: () -> None
-        self.state = job_state_e.Running
+        self.job_list.SetJobState(self, job_state_e.Running)
 
         if self.parent_pipeline:
             # TODO: do we need anything here?
@@ -1276,7 +1354,7 @@ class Process(Job):
         # 128 is a shell thing
         # https://www.gnu.org/software/bash/manual/html_node/Exit-Status.html
         self.status = 128 + stop_sig
-        self.state = job_state_e.Stopped
+        self.job_list.SetJobState(self, job_state_e.Stopped)
 
         if self.parent_pipeline:
             # TODO: do we need anything here?
@@ -1309,7 +1387,7 @@ class Process(Job):
         #log('Process WhenExited %d %d', pid, status)
         assert pid == self.pid, 'Expected %d, got %d' % (self.pid, pid)
         self.status = status
-        self.state = job_state_e.Exited
+        self.job_list.SetJobState(self, job_state_e.Exited)
 
         if self.parent_pipeline:
             # populate pipeline status array; update Pipeline state, etc.
@@ -1377,7 +1455,6 @@ class Pipeline(Job):
         self.procs = []  # type: List[Process]
         self.pids = []  # type: List[int]  # pids in order
         self.pipe_status = []  # type: List[int]  # status in order
-        self.status = -1  # for 'wait' jobs
 
         self.pgid = INVALID_PGID
 
@@ -1413,6 +1490,10 @@ class Pipeline(Job):
         """
         return self.pids[-1]
 
+    def AllPids(self):
+        # type: () -> List[int]
+        return self.pids
+
     def DisplayJob(self, job_id, f, style):
         # type: (int, mylib.Writer, int) -> None
         if style == STYLE_PID_ONLY:
@@ -1590,7 +1671,7 @@ class Pipeline(Job):
 
         self.pipe_status[-1] = cmd_ev.LastStatus()
         if self.AllExited():
-            self.state = job_state_e.Exited
+            self.job_list.SetJobState(self, job_state_e.Exited)
 
         #log('pipestatus before all have finished = %s', self.pipe_status)
         return self.Wait(waiter)
@@ -1628,7 +1709,7 @@ class Pipeline(Job):
 
         # Status of pipeline is status of last process
         self.status = self.pipe_status[-1]
-        self.state = job_state_e.Exited
+        self.job_list.SetJobState(self, job_state_e.Exited)
 
         if not self.in_background:
             self.job_control.MaybeTakeTerminal()
@@ -1781,16 +1862,15 @@ class JobList(object):
         # job_id -> Job
         self.jobs = {}  # type: Dict[int, Job]
 
-        # self.pid_to_job is used by 'wait -n' and 'wait' - to call
-        # CleanupWhenProcessExits().  They Dict key is job.PidForWait()
+        # self.pid_to_job is used by 'wait -n', 'wait', and 'wait $pid' - to
+        # call CleanupWhenProcessExits().  EVERY PID of a job is a key, so a
+        # background pipeline can be found from any of its parts.
         self.pid_to_job = {}  # type: Dict[int, Job]
 
-        # TODO: consider linear search through JobList
-        # - by job ID
-        # - by PID
-        # - then you don't have to bother as much with the dicts
-        #   - you still need the child process dict to set the status and
-        #   state?
+        # The number of registered jobs in the Running state, maintained by
+        # SetJobState(), so 'wait' and 'wait -n' don't scan self.jobs after
+        # every process exits.
+        self.num_running = 0
 
         self.debug_pipelines = []  # type: List[Pipeline]
 
@@ -1817,16 +1897,39 @@ class JobList(object):
         # Look up the job by job ID, for wait %1, kill %1, etc.
         self.jobs[job_id] = job
 
-        # Pipelines
-        # TODO: register all PIDs?  And conversely, remove all PIDs
-        # what do other shells do?
-        self.pid_to_job[job.PidForWait()] = job
+        # Look up the job by any of its PIDs, for wait $!, wait -n, etc.
+        for pid in job.AllPids():
+            self.pid_to_job[pid] = job
 
         # Mutate the job itself
         job.job_id = job_id
 
+        if job.state == job_state_e.Running:
+            self.num_running += 1
+
         return job_id
 
+    def _IsRegistered(self, job):
+        # type: (Job) -> bool
+        if job.job_id == -1:
+            return False
+        # job IDs are reused, so check identity
+        return self.jobs.get(job.job_id) is job
+
+    def SetJobState(self, job, state):
+        # type: (Job, job_state_t) -> None
+        """Change the state of a job, keeping the running count up to date.
+
+        Called for unregistered jobs too, e.g. foreground processes and the
+        parts of a pipeline.
+        """
+        if self._IsRegistered(job):
+            if job.state == job_state_e.Running:
+                self.num_running -= 1
+            if state == job_state_e.Running:
+                self.num_running += 1
+        job.state = state
+
     def JobFromPid(self, pid):
         # type: (int) -> Optional[Job]
         return self.pid_to_job.get(pid)
@@ -1836,38 +1939,34 @@ class JobList(object):
         if len(self.jobs) == 0:
             self.next_job_id = 1
 
-    def CleanupWhenJobExits(self, job):
+    def _RemoveJob(self, job):
         # type: (Job) -> None
-        """Called when say 'fg %2' exits, and when 'wait %2' exits"""
-        mylib.dict_erase(self.jobs, job.job_id)
+        if not self._IsRegistered(job):
+            return
+
+        if job.state == job_state_e.Running:
+            self.num_running -= 1
 
-        mylib.dict_erase(self.pid_to_job, job.PidForWait())
+        mylib.dict_erase(self.jobs, job.job_id)
+        for pid in job.AllPids():
+            mylib.dict_erase(self.pid_to_job, pid)
 
+    def CleanupWhenJobExits(self, job):
+        # type: (Job) -> None
+        """Called when say 'fg %2' exits, and when 'wait %2' exits"""
+        self._RemoveJob(job)
         self._MaybeResetCounter()
 
     def CleanupWhenProcessExits(self, pid):
         # type: (int) -> None
-        """Given a PID, remove the job if it has Exited."""
+        """Given a PID, remove the job if it has Exited.
 
+        For a pipeline, the job is removed when its LAST part exits, whatever
+        order the parts exit in.
+        """
         job = self.pid_to_job.get(pid)
-        if 0:
-            # TODO: background pipelines don't clean up properly, because only
-            # the last PID is registered in job_list.pid_to_job
-
-            # Should we switch to a linear search of a background job array?
-            # Foreground jobs are stored in self.child_procs, and we migrate
-            # between them?
-
-            log('*** CleanupWhenProcessExits %d', pid)
-            log('job %s', job)
-            #log('STATE %s', _JobStateStr(job.state))
-
         if job and job.state == job_state_e.Exited:
-            # Note: only the LAST PID in a pipeline will ever be here, but it's
-            # OK to try to delete it.
-            mylib.dict_erase(self.pid_to_job, pid)
-
-            mylib.dict_erase(self.jobs, job.job_id)
+            self._RemoveJob(job)
 
         self._MaybeResetCounter()
 
@@ -1915,13 +2014,15 @@ class JobList(object):
         be helpful...
         """
         # Split all active jobs by state and sort each group by decreasing job
-        # ID to approximate newness.
+        # ID to approximate newness.  Only live jobs are visited, rather than
+        # every ID handed out since the counter was last reset.
+        job_ids = self.jobs.keys()
+        job_ids.sort()
+
         stopped_jobs = []  # type: List[Job]
         running_jobs = []  # type: List[Job]
-        for i in xrange(0, self.next_job_id):
-            job = self.jobs.get(i, None)
-            if not job:
-                continue
+        for job_id in job_ids:
+            job = self.jobs[job_id]
 
             if job.state == job_state_e.Stopped:
                 stopped_jobs.append(job)
@@ -2050,11 +2151,7 @@ class JobList(object):
 
         Used by 'wait' and 'wait -n'.
         """
-        count = 0
-        for _, job in iteritems(self.jobs):  # mycpp rewrite: from itervalues()
-            if job.State() == job_state_e.Running:
-                count += 1
-        return count
+        return self.num_running
 
 
 # Some WaitForOne() return values, which are negative.  The numbers are
@@ -2104,12 +2201,20 @@ class Waiter(object):
     process OR a background process!  So you have to distinguish between them.
     """
 
-    def __init__(self, job_list, exec_opts, signal_safe, tracer):
-        # type: (JobList, optview.Exec, iolib.SignalSafe, dev.Tracer) -> None
+    def __init__(
+            self,
+            job_list,  # type: JobList
+            exec_opts,  # type: optview.Exec
+            signal_safe,  # type: iolib.SignalSafe
+            tracer,  # type: dev.Tracer
+            stat_cache,  # type: StatCache
+    ):
+        # type: (...) -> None
         self.job_list = job_list
         self.exec_opts = exec_opts
         self.signal_safe = signal_safe
         self.tracer = tracer
+        self.stat_cache = stat_cache
         self.last_status = 127  # wait -n error code
 
     def LastStatusCode(self):
@@ -2185,6 +2290,9 @@ class Waiter(object):
             # such process", an invalid PID
             raise AssertionError()
 
+        # The child may have changed the file system
+        self.stat_cache.Clear()
+
         # All child processes are supposed to be in this dict.  Even if a
         # grandchild outlives the child (its parent), the shell does NOT become
         # the parent.  The init process does.
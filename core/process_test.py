@@ -16,6 +16,7 @@ from core import process  # module under test
 from core import pyos
 from core import sh_init
 from core import state
+from core import stat_cache
 from core import test_lib
 from core import util
 from display import ui
@@ -75,12 +76,13 @@ def _SetupTest(self):
     self.multi_trace = dev.MultiTracer(posix.getpid(), '', '', '', fd_state)
     self.tracer = dev.Tracer(None, exec_opts, mutable_opts, self.mem,
                              mylib.Stderr(), self.multi_trace)
+    s_cache = stat_cache.StatCache(self.mem, exec_opts)
     self.waiter = process.Waiter(self.job_list, exec_opts, self.trap_state,
-                                 self.tracer)
+                                 self.tracer, s_cache)
     self.errfmt = ui.ErrorFormatter()
     self.fd_state = process.FdState(self.errfmt, self.job_control,
                                     self.job_list, None, self.tracer, None,
-                                    exec_opts)
+                                    exec_opts, s_cache)
     self.ext_prog = process.ExternalProgram('', self.fd_state, self.errfmt,
                                             util.NullDebugFile())
     self.cmd_ev = test_lib.InitCommandEvaluator(arena=self.arena,
@@ -571,7 +573,8 @@ class PipelineJobListTest(_Common):
         # 3 processes per pipeline in this test
         self.assertEqual(length * 3, len(self.job_list.child_procs))
         self.assertEqual(length, len(self.job_list.jobs))
-        self.assertEqual(length, len(self.job_list.pid_to_job))
+        # every PID of a pipeline is indexed
+        self.assertEqual(length * 3, len(self.job_list.pid_to_job))
 
     def testWaitAll(self):
         """ wait """
@@ -590,7 +593,6 @@ class PipelineJobListTest(_Common):
         status = self.wait_builtin.Run(cmd_val)
         self.assertEqual(0, status)
 
-        return
         # Jobs list is now empty
         self.assertJobListLength(0)
 
@@ -606,18 +608,21 @@ class PipelineJobListTest(_Common):
         self.assertJobListLength(2)
 
         ### 'wait -n'
+        # The status is that of the whole pipeline, i.e. its last part.  The
+        # pipelines may finish in either order, since forking takes time.
         cmd_val = test_lib.MakeBuiltinArgv(['wait', '-n'])
-        status = self.wait_builtin.Run(cmd_val)
-        return
-        self.assertEqual(8, status)
+        status1 = self.wait_builtin.Run(cmd_val)
+        self.assertIn(status1, (8, 9))
 
-        # Jobs list now has 1 fewer job
-        self.assertJobListLength(1)
+        # Jobs list now has 1 fewer job.  (Parts of the other pipeline may
+        # have been reaped already.)
+        self.assertEqual(1, len(self.job_list.jobs))
+        self.assertEqual(3, len(self.job_list.pid_to_job))
 
         ### 'wait -n' again
         cmd_val = test_lib.MakeBuiltinArgv(['wait', '-n'])
-        status = self.wait_builtin.Run(cmd_val)
-        self.assertEqual(9, status)
+        status2 = self.wait_builtin.Run(cmd_val)
+        self.assertEqual(17, status1 + status2)
 
         # Now zero
         self.assertJobListLength(0)
@@ -642,8 +647,8 @@ class PipelineJobListTest(_Common):
         self.assertJobListLength(3)
 
         # wait $pid2
-        cmd_val = test_lib.MakeBuiltinArgv(['wait', str(pids[1])])
-        return
+        cmd_val = test_lib.MakeBuiltinArgv(
+            ['wait', str(pids[1].PidForWait())])
         status = self.wait_builtin.Run(cmd_val)
         self.assertEqual(8, status)
 
@@ -651,14 +656,16 @@ class PipelineJobListTest(_Common):
         self.assertJobListLength(2)
 
         # wait $pid3
-        cmd_val = test_lib.MakeBuiltinArgv(['wait', str(pids[2])])
+        cmd_val = test_lib.MakeBuiltinArgv(
+            ['wait', str(pids[2].PidForWait())])
         status = self.wait_builtin.Run(cmd_val)
         self.assertEqual(7, status)
 
         self.assertJobListLength(1)
 
         # wait $pid1
-        cmd_val = test_lib.MakeBuiltinArgv(['wait', str(pids[0])])
+        cmd_val = test_lib.MakeBuiltinArgv(
+            ['wait', str(pids[0].PidForWait())])
         status = self.wait_builtin.Run(cmd_val)
         self.assertEqual(9, status)
 
@@ -678,7 +685,6 @@ class PipelineJobListTest(_Common):
 
         # wait %j2
         cmd_val = test_lib.MakeBuiltinArgv(['wait', '%' + str(job_ids[1])])
-        return
         status = self.wait_builtin.Run(cmd_val)
         self.assertEqual(8, status)
 
@@ -4,7 +4,7 @@ Like py{error,util}.py, it won't be translated to C++.
 """
 from __future__ import print_function
 
-from errno import EINTR
+from errno import EEXIST, EINTR
 import pwd
 import resource
 import select
@@ -18,6 +18,7 @@ from mycpp.mylib import log
 
 import posix_ as posix
 from posix_ import WUNTRACED
+import stat
 
 from typing import Optional, Tuple, List, Dict, cast, Any, TYPE_CHECKING
 if TYPE_CHECKING:
@@ -29,6 +30,11 @@ EOF_SENTINEL = 256  # bigger than any byte
 NEWLINE_CH = 10  # ord('\n')
 BACKSLASH_CH = 92  # \
 
+# Kinds of directory entries, from ReadDir()
+ENTRY_OTHER = 0
+ENTRY_DIR = 1
+ENTRY_SYMLINK = 2
+
 
 def FlushStdout():
     # type: () -> Optional[error.IOError_OSError]
@@ -109,7 +115,7 @@ def ReadByte(fd):
     # type: (int) -> Tuple[int, int]
     """Low-level interface that returns values rather than raising exceptions.
 
-    Used by _ReadUntilDelim() and _ReadLineSlowly().
+    Used by read_osh.FdReader.
 
     Returns:
       failure: (-1, errno) on failure
@@ -128,6 +134,20 @@ def ReadByte(fd):
             return EOF_SENTINEL, 0
 
 
+def SeekRelative(fd, offset):
+    # type: (int, int) -> int
+    """lseek(fd, offset, SEEK_CUR)
+
+    Returns:
+      0 on success, or errno.  ESPIPE means fd is a pipe, socket, or terminal.
+    """
+    try:
+        posix.lseek(fd, offset, 1)  # SEEK_CUR
+    except OSError as e:
+        return e.errno
+    return 0
+
+
 def Environ():
     # type: () -> Dict[str, str]
     return posix.environ
@@ -296,6 +316,70 @@ def MakeDirCacheKey(path):
     return (path, int(st.st_mtime))
 
 
+def FileCacheKey(path):
+    # type: (str) -> str
+    """Returns a string that changes when the file changes, for caches of data
+    derived from it.
+
+    Returns '' if the file can't be stat'd, or if it was modified this second,
+    since another change in the same second wouldn't change the key.
+    """
+    try:
+        st = posix.stat(path)
+    except OSError:
+        return ''
+    mtime = int(st.st_mtime)
+    if int(time.time()) <= mtime:
+        return ''
+    return '%d %d %d %d' % (st.st_dev, st.st_ino, st.st_size, mtime)
+
+
+def MakeDirs(path):
+    # type: (str) -> int
+    """Like mkdir -p, but with mode 0700.  Returns 0 or an errno."""
+    parts = path.split('/')
+    for i in xrange(1, len(parts) + 1):
+        prefix = '/'.join(parts[:i])
+        if len(prefix) == 0:
+            continue
+        try:
+            posix.mkdir(prefix, 0o700)
+        except OSError as e:
+            if e.errno != EEXIST:
+                return e.errno
+    return 0
+
+
+def WriteFileAtomic(path, contents):
+    # type: (str, str) -> int
+    """Write a file that readers see whole, or not at all.
+
+    Returns 0 or an errno.
+    """
+    tmp_path = '%s.%d.tmp' % (path, posix.getpid())
+    try:
+        fd = posix.open(tmp_path,
+                        posix.O_WRONLY | posix.O_CREAT | posix.O_TRUNC, 0o600)
+    except OSError as e:
+        return e.errno
+
+    try:
+        try:
+            n = 0
+            while n < len(contents):
+                n += posix.write(fd, contents[n:])
+        finally:
+            posix.close(fd)
+        posix.rename(tmp_path, path)
+    except OSError as e:
+        try:
+            posix.unlink(tmp_path)
+        except OSError:
+            pass
+        return e.errno
+    return 0
+
+
 def IsSameFile(path1, path2):
     # type: (str, str) -> bool
 
@@ -317,6 +401,34 @@ def IsSameFile(path1, path2):
     return True
 
 
+def ReadDir(path, names, kinds):
+    # type: (str, List[str], List[int]) -> int
+    """Append the names in a directory, except . and .., and their kinds.
+
+    Returns 0 or an errno.  The C++ version gets the kinds from readdir()
+    d_type, so it doesn't usually lstat() each entry.
+    """
+    try:
+        entries = posix.listdir(path)
+    except OSError as e:
+        return e.errno
+
+    for name in entries:
+        try:
+            st = posix.lstat('%s/%s' % (path, name))
+        except OSError:  # removed since listdir()
+            continue
+        if stat.S_ISDIR(st.st_mode):
+            kind = ENTRY_DIR
+        elif stat.S_ISLNK(st.st_mode):
+            kind = ENTRY_SYMLINK
+        else:
+            kind = ENTRY_OTHER
+        names.append(name)
+        kinds.append(kind)
+    return 0
+
+
 def Unlink(path):
     # type: (str) -> int
     try:
@@ -17,6 +17,8 @@ from core import executor
 from core import completion
 from core import main_loop
 from core import optview
+from core import parse_cache
+from core import stat_cache
 from core import process
 from core import pyutil
 from core import sh_init
@@ -162,6 +164,7 @@ def SourceStartupFile(
 
     arena = parse_ctx.arena
     rc_line_reader = reader.FileLineReader(f, arena)
+    rc_line_reader.ShareLines()
     rc_c_parser = parse_ctx.MakeOshParser(rc_line_reader)
 
     with alloc.ctx_SourceCode(arena, source.MainFile(rc_path)):
@@ -397,8 +400,9 @@ def Main(
 
     job_control = process.JobControl()
     job_list = process.JobList()
+    s_cache = stat_cache.StatCache(mem, exec_opts)
     fd_state = process.FdState(errfmt, job_control, job_list, mem, None, None,
-                               exec_opts)
+                               exec_opts, s_cache)
 
     my_pid = posix.getpid()
 
@@ -440,7 +444,7 @@ def Main(
     signal_safe = iolib.InitSignalSafe()
     trap_state = trap_osh.TrapState(signal_safe)
 
-    waiter = process.Waiter(job_list, exec_opts, signal_safe, tracer)
+    waiter = process.Waiter(job_list, exec_opts, signal_safe, tracer, s_cache)
     fd_state.waiter = waiter
 
     cmd_deps.debug_f = debug_f
@@ -492,6 +496,13 @@ def Main(
 
     sh_files = sh_init.ShellFiles(lang, home_dir, mem, flag)
 
+    # Syntax trees of files loaded with 'source', 'use', and --eval
+    cache_home = environ.get('XDG_CACHE_HOME')
+    if cache_home is None or len(cache_home) == 0:
+        cache_home = os_path.join(home_dir, '.cache')
+    p_cache = parse_cache.ParseCache(os_path.join(cache_home, 'oils/parse'),
+                                     version_str, parse_ctx, mutable_opts)
+
     #
     # Executor and Evaluators (are circularly dependent)
     #
@@ -507,11 +518,14 @@ def Main(
 
     hay_state = hay_ysh.HayState()
 
+    # Shared by echo, printf, and write, so command subs can capture them
+    builtin_stdout = vm.BuiltinStdout()
+
     shell_ex = executor.ShellExecutor(mem, exec_opts, mutable_opts, procs,
                                       hay_state, builtins, tracer, errfmt,
                                       search_path, ext_prog, waiter,
                                       job_control, job_list, fd_state,
-                                      trap_state)
+                                      trap_state, builtin_stdout)
 
     pure_ex = executor.PureExecutor(mem, exec_opts, mutable_opts, procs,
                                     hay_state, builtins, tracer, errfmt)
@@ -519,7 +533,7 @@ def Main(
     arith_ev = sh_expr_eval.ArithEvaluator(mem, exec_opts, mutable_opts,
                                            parse_ctx, errfmt)
     bool_ev = sh_expr_eval.BoolEvaluator(mem, exec_opts, mutable_opts,
-                                         parse_ctx, errfmt)
+                                         parse_ctx, errfmt, s_cache)
     expr_ev = expr_eval.ExprEvaluator(mem, mutable_opts, methods, splitter,
                                       errfmt)
     word_ev = word_eval.NormalWordEvaluator(mem, exec_opts, mutable_opts,
@@ -686,9 +700,11 @@ def Main(
                                            tracer,
                                            errfmt,
                                            loader,
+                                           p_cache,
                                            module_invoke=module_invoke)
     source_builtin = meta_oils.ShellFile(parse_ctx, search_path, cmd_ev,
-                                         fd_state, tracer, errfmt, loader)
+                                         fd_state, tracer, errfmt, loader,
+                                         p_cache)
     b[builtin_i.source] = source_builtin
     b[builtin_i.dot] = source_builtin
     eval_builtin = meta_oils.Eval(parse_ctx, exec_opts, cmd_ev, tracer, errfmt,
@@ -726,20 +742,23 @@ def Main(
     b[builtin_i.append] = pure_ysh.Append(mem, errfmt)
 
     # test / [ differ by need_right_bracket
-    b[builtin_i.test] = bracket_osh.Test(False, exec_opts, mem, errfmt)
-    b[builtin_i.bracket] = bracket_osh.Test(True, exec_opts, mem, errfmt)
+    b[builtin_i.test] = bracket_osh.Test(False, exec_opts, mem, errfmt,
+                                         s_cache)
+    b[builtin_i.bracket] = bracket_osh.Test(True, exec_opts, mem, errfmt,
+                                            s_cache)
 
     # Output
-    b[builtin_i.echo] = io_osh.Echo(exec_opts)
+    b[builtin_i.echo] = io_osh.Echo(exec_opts, builtin_stdout)
     b[builtin_i.printf] = printf_osh.Printf(mem, parse_ctx, unsafe_arith,
-                                            errfmt)
-    b[builtin_i.write] = io_ysh.Write(mem, errfmt)
+                                            errfmt, builtin_stdout)
+    b[builtin_i.write] = io_ysh.Write(mem, errfmt, builtin_stdout)
     redir_builtin = io_ysh.RunBlock(mem, cmd_ev)  # used only for redirects
     b[builtin_i.redir] = redir_builtin
     b[builtin_i.fopen] = redir_builtin  # alias for backward compatibility
 
     # (pp output format isn't stable)
-    b[builtin_i.pp] = io_ysh.Pp(expr_ev, mem, errfmt, procs, arena)
+    b[builtin_i.pp] = io_ysh.Pp(expr_ev, mem, errfmt, procs, arena, p_cache,
+                                s_cache)
 
     cat = private_ysh.Cat(errfmt)
     b[builtin_i.cat] = cat
@@ -747,7 +766,7 @@ def Main(
 
     # PRIVATE builtins
     b[builtin_i.sleep] = private_ysh.Sleep(cmd_ev, signal_safe)
-    b[builtin_i.rm] = private_ysh.Rm(errfmt)
+    b[builtin_i.rm] = private_ysh.Rm(errfmt, s_cache)
 
     mapfile = io_osh.MapFile(mem, errfmt, cmd_ev)
     b[builtin_i.mapfile] = mapfile
@@ -765,8 +784,8 @@ def Main(
 
     b[builtin_i.times] = misc_osh.Times()
 
-    b[builtin_i.json] = json_ysh.Json(mem, errfmt, False)
-    b[builtin_i.json8] = json_ysh.Json(mem, errfmt, True)
+    b[builtin_i.json] = json_ysh.Json(mem, cmd_ev, errfmt, False)
+    b[builtin_i.json8] = json_ysh.Json(mem, cmd_ev, errfmt, True)
 
     ### Process builtins
     b[builtin_i.exec_] = process_osh.Exec(mem, ext_prog, fd_state, search_path,
@@ -783,6 +802,7 @@ def Main(
     # Could be in process_ysh
     b[builtin_i.fork] = process_osh.Fork(shell_ex)
     b[builtin_i.forkwait] = process_osh.ForkWait(shell_ex)
+    b[builtin_i.forkmany] = process_osh.ForkMany(shell_ex, waiter, mem)
 
     # Interactive builtins depend on readline
     bindx_cb = readline_osh.BindXCallback(eval_builtin, mem, errfmt)
@@ -867,6 +887,7 @@ def Main(
     }
     methods[value_e.List] = {
         'M/reverse': method_list.Reverse(),
+        'M/sort': method_list.Sort(expr_ev, True),
         'M/append': method_list.Append(),
         'M/clear': method_list.Clear(),
         'M/extend': method_list.Extend(),
@@ -906,6 +927,10 @@ def Main(
         'docComment': method_other.DocComment(),
     }
 
+    methods[value_e.Stdin] = {
+        'batches': method_io.StdinBatches(),
+    }
+
     methods[value_e.DebugFrame] = {
         'toString': func_reflect.DebugFrameToString(),
     }
@@ -994,6 +1019,7 @@ def Main(
 
     # List
     _AddBuiltinFunc(mem, 'join', func_misc.Join())
+    _AddBuiltinFunc(mem, 'sorted', method_list.Sort(expr_ev, False))
     _AddBuiltinFunc(mem, 'maybe', func_misc.Maybe())
     # TODO: deprecate in favor of io.glob()
     _AddBuiltinFunc(mem, 'glob', method_io.Glob(globber))
@@ -1019,8 +1045,12 @@ def Main(
         ex = pure_ex if is_pure else None
         with vm.ctx_MaybePure(ex, cmd_ev):
             try:
-                ok, status = main_loop.EvalFile(path, fd_state, parse_ctx,
-                                                cmd_ev, lang)
+                ok, status = main_loop.EvalFile(path,
+                                                fd_state,
+                                                parse_ctx,
+                                                cmd_ev,
+                                                lang,
+                                                cache=p_cache)
             except util.HardExit as e:
                 # Doesn't seem like we need this, and verbose_errexit isn't the right option
                 #if exec_opts.verbose_errexit():
@@ -1146,7 +1176,11 @@ def Main(
         loop = main_loop.Headless(cmd_ev, parse_ctx, errfmt)
         try:
             # TODO: What other exceptions happen here?
-            status = loop.Loop()
+            if flag.listen is not None:
+                # Returns in each forked session, when the client is done
+                status = loop.Serve(flag.listen)
+            else:
+                status = loop.Loop()
         except util.HardExit as e:
             status = e.status
 
@@ -0,0 +1,74 @@
+"""
+stat_cache.py - Remember the results of file tests like [ -f x ]
+
+Configure scripts test the same paths over and over, e.g. [ -d "$dir" ] in a
+loop.  With shopt -s stat_cache, each result is kept until the file system or
+the current dir may have changed:
+
+- a child process was reaped by the Waiter
+- a redirect opened a file for writing
+- the rm builtin ran
+- cd, pushd, or popd changed the current dir
+
+Files changed by a background job that is still running, or by an unrelated
+process, aren't noticed.  That's why the option is off by default.
+"""
+from __future__ import print_function
+
+from _devbuild.gen.id_kind_asdl import Id_t
+from mycpp.mylib import log
+from osh import bool_stat
+
+from typing import Dict, Optional, TYPE_CHECKING
+if TYPE_CHECKING:
+    from core import optview
+    from core import state
+
+_ = log
+
+
+class StatCache(object):
+    """Memoize bool_stat.DoUnaryOp(), with counters for 'pp cache-stats_'."""
+
+    def __init__(self, mem, exec_opts):
+        # type: (state.Mem, optview.Exec) -> None
+        self.mem = mem
+        self.exec_opts = exec_opts
+
+        # '%d %s' % (op_id, path) -> result
+        self.results = {}  # type: Dict[str, bool]
+        # Relative paths are only valid in the dir they were tested in
+        self.pwd = None  # type: Optional[str]
+
+        self.num_hits = 0
+        self.num_misses = 0
+        self.num_evictions = 0
+
+    def Clear(self):
+        # type: () -> None
+        """Called when the file system may have changed."""
+        n = len(self.results)
+        if n:
+            self.results.clear()
+            self.num_evictions += n
+
+    def UnaryOp(self, op_id, path):
+        # type: (Id_t, str) -> bool
+        if not self.exec_opts.stat_cache():
+            self.Clear()  # don't keep stale results if it's turned on again
+            return bool_stat.DoUnaryOp(op_id, path)
+
+        # cd always allocates a new string, so this check is cheap
+        if self.mem.pwd is not self.pwd:
+            self.Clear()
+            self.pwd = self.mem.pwd
+
+        key = '%d %s' % (op_id, path)
+        if key in self.results:
+            self.num_hits += 1
+            return self.results[key]
+
+        self.num_misses += 1
+        result = bool_stat.DoUnaryOp(op_id, path)
+        self.results[key] = result
+        return result
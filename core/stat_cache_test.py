@@ -0,0 +1,80 @@
+#!/usr/bin/env python2
+from __future__ import print_function
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from _devbuild.gen.id_kind_asdl import Id
+from _devbuild.gen.option_asdl import option_i
+from core import stat_cache  # module under test
+from core import state
+from core import test_lib
+
+
+class StatCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'f')
+        self.old_cwd = os.getcwd()
+
+        self.mem = test_lib.MakeMem(test_lib.MakeArena('<stat_cache_test>'))
+        parse_opts, exec_opts, mutable_opts = state.MakeOpts(
+            self.mem, {}, None)
+        mutable_opts.opt0_array[option_i.stat_cache] = True
+        self.mutable_opts = mutable_opts
+        self.cache = stat_cache.StatCache(self.mem, exec_opts)
+
+    def tearDown(self):
+        os.chdir(self.old_cwd)
+        shutil.rmtree(self.tmp_dir)
+
+    def testHitsAndClear(self):
+        c = self.cache
+        self.assertEqual(False, c.UnaryOp(Id.BoolUnary_f, self.path))
+
+        with open(self.path, 'w') as f:
+            f.write('x')
+
+        # Stale until cleared
+        self.assertEqual(False, c.UnaryOp(Id.BoolUnary_f, self.path))
+        self.assertEqual(1, c.num_hits)
+        self.assertEqual(1, c.num_misses)
+
+        # Different op, different entry
+        self.assertEqual(False, c.UnaryOp(Id.BoolUnary_d, self.path))
+        self.assertEqual(2, c.num_misses)
+
+        c.Clear()
+        self.assertEqual(2, c.num_evictions)
+        self.assertEqual(True, c.UnaryOp(Id.BoolUnary_f, self.path))
+
+    def testCd(self):
+        c = self.cache
+        self.mem.SetPwd(self.tmp_dir)
+        self.assertEqual(False, c.UnaryOp(Id.BoolUnary_e, 'f'))
+
+        with open(self.path, 'w') as f:
+            f.write('x')
+
+        # cd sets a new pwd, which drops relative results
+        self.mem.SetPwd('/')
+        os.chdir(self.tmp_dir)
+        self.assertEqual(True, c.UnaryOp(Id.BoolUnary_e, 'f'))
+        self.assertEqual(0, c.num_hits)
+
+    def testOff(self):
+        c = self.cache
+        self.assertEqual(False, c.UnaryOp(Id.BoolUnary_f, self.path))
+        self.assertEqual(1, len(c.results))
+
+        self.mutable_opts.opt0_array[option_i.stat_cache] = False
+        self.assertEqual(False, c.UnaryOp(Id.BoolUnary_f, self.path))
+        self.assertEqual(0, len(c.results))
+        self.assertEqual(1, c.num_misses)
+
+
+if __name__ == '__main__':
+    unittest.main()
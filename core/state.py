@@ -637,6 +637,19 @@ class MutableOpts(object):
         self._SetArrayByNum(opt_num, b)
 
 
+class _SlotFrame(object):
+    """Cells of proc and func locals, indexed by expr.Var slot.
+
+    The dict frame is still the source of truth.  This is a cache that avoids
+    hashing the name on every read of a local in an expression.
+    """
+
+    def __init__(self, frame, num_slots):
+        # type: (Dict[str, Cell], int) -> None
+        self.frame = frame
+        self.cells = [None] * num_slots  # type: List[Optional[Cell]]
+
+
 class _ArgFrame(object):
     """Stack frame for arguments array."""
 
@@ -764,6 +777,10 @@ class ctx_FuncCall(object):
 
         mem.var_stack.append(frame)
 
+        self.pushed_slots = func.parsed.num_slots > 0
+        if self.pushed_slots:
+            mem.slot_frames.append(_SlotFrame(frame, func.parsed.num_slots))
+
         # blame the location of (
         mem.debug_stack.append(blame_tok)
 
@@ -776,6 +793,8 @@ class ctx_FuncCall(object):
     def __exit__(self, type, value, traceback):
         # type: (Any, Any, Any) -> None
         self.mem.debug_stack.pop()
+        if self.pushed_slots:
+            self.mem.slot_frames.pop()
         self.mem.var_stack.pop()
 
         self.mem.var_stack[0] = self.saved_globals
@@ -816,6 +835,10 @@ class ctx_ProcCall(object):
 
         mem.var_stack.append(frame)
 
+        self.pushed_slots = proc.num_slots > 0
+        if self.pushed_slots:
+            mem.slot_frames.append(_SlotFrame(frame, proc.num_slots))
+
         mem.debug_stack.append(
             debug_frame.ProcLike(invoke_loc, proc.name_tok, proc.name))
 
@@ -836,6 +859,8 @@ class ctx_ProcCall(object):
         # type: (Any, Any, Any) -> None
         self.mutable_opts.PopDynamicScope()
         self.mem.debug_stack.pop()
+        if self.pushed_slots:
+            self.mem.slot_frames.pop()
         self.mem.var_stack.pop()
 
         if self.sh_compat:
@@ -960,6 +985,51 @@ class ctx_ThisDir(object):
             self.mem.this_dir.pop()
 
 
+def _IsRegisterName(name):
+    # type: (str) -> bool
+    """Names that Mem.GetValue() computes instead of looking up.
+
+    Keep in sync with the cases in GetValue().
+    """
+    with str_switch(name) as case:
+        if case('_error'):
+            return True
+        elif case('_this_dir'):
+            return True
+        elif case('PIPESTATUS'):
+            return True
+        elif case('_pipeline_status'):
+            return True
+        elif case('_process_sub_status'):
+            return True
+        elif case('BASH_REMATCH'):
+            return True
+        elif case('FUNCNAME'):
+            return True
+        elif case('BASH_SOURCE'):
+            return True
+        elif case('BASH_LINENO'):
+            return True
+        elif case('LINENO'):
+            return True
+        elif case('BASHPID'):
+            return True
+        elif case('_'):
+            return True
+        elif case('SECONDS'):
+            return True
+        else:
+            return False
+
+
+def _ClearSlots(slot_frame, cell):
+    # type: (_SlotFrame, Cell) -> None
+    """Called when a cell is unset."""
+    for i, c in enumerate(slot_frame.cells):
+        if c is cell:
+            slot_frame.cells[i] = None
+
+
 def _MakeArgvCell(argv):
     # type: (List[str]) -> Cell
     items = [value.Str(a) for a in argv]  # type: List[value_t]
@@ -1320,6 +1390,8 @@ class Mem(object):
 
         frame0 = NewDict()  # type: Dict[str, Cell]
         self.var_stack = [frame0]
+        # Parallel to the proc and func frames in var_stack that have slots
+        self.slot_frames = []  # type: List[_SlotFrame]
 
         # The debug_stack isn't strictly necessary for execution.  We use it
         # for crash dumps and for 3 parallel arrays: BASH_SOURCE, FUNCNAME, and
@@ -1329,6 +1401,13 @@ class Mem(object):
         self.env_dict = env_dict
         self.env_object = Obj(None, env_dict)  # initial state
 
+        # Cache of exported vars for GetEnv(), so that running external
+        # commands in a loop doesn't walk every frame each time.  It's
+        # invalidated when an exported cell changes, and checked against the
+        # frames it was computed from, since procs push and pop frames.
+        self.exported_cache = None  # type: Optional[Dict[str, str]]
+        self.exported_cache_frames = []  # type: List[Dict[str, Cell]]
+
         if defaults is None:  # for unit tests only
             self.defaults = NewDict()  # type: Dict[str, value_t]
         else:
@@ -1944,6 +2023,8 @@ class Mem(object):
                     frame[yval.name] = cell
                 else:
                     cell.val = val
+                    if cell.exported:
+                        self.exported_cache = None
 
             elif case(y_lvalue_e.Container):
                 e_die('Container place not implemented', blame_loc)
@@ -1967,6 +2048,8 @@ class Mem(object):
                 e_die("Can't assign to readonly value %r" % lval.name,
                       lval.blame_loc)
             cell.val = val  # Mutate value_t
+            if cell.exported:
+                self.exported_cache = None
         else:
             cell = Cell(False, False, False, val)
             var_frame[lval.name] = cell
@@ -2002,6 +2085,8 @@ class Mem(object):
                 e_die("Can't assign to readonly value %r" % lval.name,
                       lval.blame_loc)
             cell.val = val  # CHANGE VAL
+            if cell.exported:
+                self.exported_cache = None
 
             if flags & SetReadOnly:
                 cell.readonly = True
@@ -2042,8 +2127,9 @@ class Mem(object):
         if cell:
             # Clear before checking readonly bit.
             # NOTE: Could be cell.flags &= flag_clear_mask
-            if flags & ClearExport:
+            if flags & ClearExport and cell.exported:
                 cell.exported = False
+                self.exported_cache = None
             if flags & ClearReadOnly:
                 cell.readonly = False
             if flags & ClearNameref:
@@ -2057,10 +2143,13 @@ class Mem(object):
                     e_die("Can't assign to readonly value %r" % lval.name,
                           lval.blame_loc)
                 cell.val = val  # CHANGE VAL
+                if cell.exported:
+                    self.exported_cache = None
 
             # NOTE: Could be cell.flags |= flag_set_mask
-            if flags & SetExport:
+            if flags & SetExport and not cell.exported:
                 cell.exported = True
+                self.exported_cache = None
             if flags & SetReadOnly:
                 cell.readonly = True
             if flags & SetNameref:
@@ -2074,6 +2163,8 @@ class Mem(object):
             cell = Cell(bool(flags & SetExport), bool(flags & SetReadOnly),
                         bool(flags & SetNameref), val)
             var_frame[cell_name] = cell
+            if cell.exported:
+                self.exported_cache = None
 
         # Maintain invariant that only strings and undefined cells can be
         # exported.
@@ -2153,6 +2244,8 @@ class Mem(object):
                 # undef[0]=y is allowed
                 with tagswitch(UP_cell_val) as case2:
                     if case2(value_e.Undef):
+                        # The cell is replaced
+                        self._UncacheCell(var_frame, cell)
                         self._BindNewArrayWithEntry(var_frame, lval, rval,
                                                     flags, left_loc)
                         return
@@ -2246,6 +2339,8 @@ class Mem(object):
         """
         cell = self.var_stack[0][name]
         cell.val = new_val
+        if cell.exported:
+            self.exported_cache = None
 
     def GetValue(self, name, which_scopes=scope_e.Shopt):
         # type: (str, scope_t) -> value_t
@@ -2424,6 +2519,35 @@ class Mem(object):
                 # TODO: Can look in the builtins module, which is a value.Obj
                 return value.Undef
 
+    def GetSlotValue(self, slot, name):
+        # type: (int, str) -> value_t
+        """Like GetValue(name, scope_e.LocalOrGlobal), for an expr.Var with a
+        slot.
+
+        The Cell is looked up in the dict frame once per call, and then reused.
+        Cells are mutated in place by setvar, so only unset has to invalidate
+        it.
+        """
+        if len(self.slot_frames):
+            slot_frame = self.slot_frames[-1]
+            # Blocks and eval push other frames
+            if slot_frame.frame is self.var_stack[-1]:
+                cell = slot_frame.cells[slot]
+                if cell is None and not _IsRegisterName(name):
+                    cell = slot_frame.frame.get(name)
+                    slot_frame.cells[slot] = cell
+                if cell and not cell.nameref:
+                    return cell.val
+
+        return self.GetValue(name, scope_e.LocalOrGlobal)
+
+    def _UncacheCell(self, var_frame, cell):
+        # type: (Dict[str, Cell], Cell) -> None
+        """Called when a cell is removed from a frame, or replaced."""
+        for slot_frame in self.slot_frames:
+            if slot_frame.frame is var_frame:
+                _ClearSlots(slot_frame, cell)
+
     def GetCell(self, name, which_scopes=scope_e.Shopt):
         # type: (str, scope_t) -> Cell
         """Get both the value and flags.
@@ -2490,6 +2614,9 @@ class Mem(object):
                 # Make variables in higher scopes visible.
                 # example: test/spec.sh builtin-vars -r 24 (ble.sh)
                 mylib.dict_erase(var_frame, cell_name)
+                if cell.exported:
+                    self.exported_cache = None
+                self._UncacheCell(var_frame, cell)
 
                 # alternative that some shells use:
                 #   var_frame[cell_name].val = value.Undef
@@ -2565,8 +2692,9 @@ class Mem(object):
         """
         cell, var_frame = self._ResolveNameOnly(name, self.ScopesForReading())
         if cell:
-            if flag & ClearExport:
+            if flag & ClearExport and cell.exported:
                 cell.exported = False
+                self.exported_cache = None
             if flag & ClearNameref:
                 cell.nameref = False
             return True
@@ -2597,26 +2725,54 @@ class Mem(object):
                 continue
             new_env[name] = cast(value.Str, val).s
 
+    def _ExportedCacheIsValid(self):
+        # type: () -> bool
+        if self.exported_cache is None:
+            return False
+
+        # A proc call, temp binding, or module eval changes the frames
+        frames = self.exported_cache_frames
+        if len(frames) != len(self.var_stack):
+            return False
+        for i, frame in enumerate(self.var_stack):
+            if frame is not frames[i]:
+                return False
+        return True
+
+    def _GetExported(self):
+        # type: () -> Dict[str, str]
+        """Return the exported vars, which the caller must NOT mutate."""
+        if not self._ExportedCacheIsValid():
+            new_env = NewDict()  # type: Dict[str, str]
+            self._FillWithExported(new_env)
+            self.exported_cache = new_env
+            self.exported_cache_frames = self.var_stack[:]
+        return self.exported_cache
+
     def GetEnv(self):
         # type: () -> Dict[str, str]
         """
         Get the environment that should be used for launching processes.
 
-        Note: This is run on every SimpleCommand.  Should we have a dirty
-        flag?  We could notice these things:
-
-        - If an exported variable is changed
-        - If the set of exported variables changes.
+        This is run on every external SimpleCommand, so the exported vars are
+        cached.  The caller must NOT mutate the returned Dict.
         """
-        new_env = NewDict()  # type: Dict[str, str]
-
         # Note: ysh:upgrade has both of these behaviors
 
         # OSH: Consult exported vars
         if not self.exec_opts.no_exported():
-            self._FillWithExported(new_env)
+            exported = self._GetExported()
+            if not self.exec_opts.env_obj():
+                return exported  # common case: no copy
+
+            new_env = NewDict()  # type: Dict[str, str]
+            for name, s in iteritems(exported):
+                new_env[name] = s
+        else:
+            new_env = NewDict()
 
-        # YSH: Consult the ENV dict
+        # YSH: Consult the ENV dict.  Note: it can be mutated like any other
+        # Dict, so it's not cached.
         if self.exec_opts.env_obj():
             self._FillEnvObj(new_env, self.env_object)
 
@@ -191,7 +191,7 @@ class MemTest(unittest.TestCase):
                      bash_impl.BashArray_FromList(['1', '2', '3']),
                      scope_e.GlobalOnly)
         compreply_val = mem.var_stack[0]['COMPREPLY'].val
-        self.assertEqual(['1', '2', '3'], sorted(compreply_val.d.values()))
+        self.assertEqual(['1', '2', '3'], bash_impl.BashArray_GetValues(compreply_val))
 
         # export COMPREPLY - allowed when strict_array not set
         mem.SetValue(location.LName('COMPREPLY'),
@@ -235,11 +235,11 @@ class MemTest(unittest.TestCase):
         lhs = sh_lvalue.Indexed('a', 1, runtime.NO_SPID)
         # a[1]=2
         mem.SetValue(lhs, value.Str('2'), scope_e.Dynamic)
-        self.assertEqual(['2'], mem.var_stack[0]['a'].val.d.values())
+        self.assertEqual(['2'], bash_impl.BashArray_GetValues(mem.var_stack[0]['a'].val))
 
         # a[1]=3
         mem.SetValue(lhs, value.Str('3'), scope_e.Dynamic)
-        self.assertEqual(['3'], mem.var_stack[0]['a'].val.d.values())
+        self.assertEqual(['3'], bash_impl.BashArray_GetValues(mem.var_stack[0]['a'].val))
 
         # a[1]=(x y z)  # illegal but doesn't parse anyway
         if 0:
@@ -298,6 +298,53 @@ class MemTest(unittest.TestCase):
         e = mem.GetEnv()
         self.assertEqual('u', e['U'])
 
+    def testGetEnvCache(self):
+        mem = _InitMem()
+
+        # export E=1
+        mem.SetValue(location.LName('E'),
+                     value.Str('1'),
+                     scope_e.Dynamic,
+                     flags=state.SetExport)
+        e1 = mem.GetEnv()
+        self.assertEqual('1', e1['E'])
+
+        # Non-exported vars don't invalidate the cache
+        mem.SetValue(location.LName('x'), value.Str('x'), scope_e.Dynamic)
+        self.assertTrue(e1 is mem.GetEnv())
+
+        # E=2
+        mem.SetValue(location.LName('E'), value.Str('2'), scope_e.Dynamic)
+        e2 = mem.GetEnv()
+        self.assertEqual('2', e2['E'])
+        self.assertFalse(e1 is e2)
+
+        # export x
+        mem.SetValue(location.LName('x'),
+                     None,
+                     scope_e.Dynamic,
+                     flags=state.SetExport)
+        self.assertEqual('x', mem.GetEnv()['x'])
+
+        # f() { local E=3; export E; }
+        tok_a = lexer.DummyToken(Id.Lit_Chars, 'a')
+        self._PushShellCall(mem, 'f', tok_a, [])
+        mem.SetValue(location.LName('E'),
+                     value.Str('3'),
+                     scope_e.LocalOnly,
+                     flags=state.SetExport)
+        self.assertEqual('3', mem.GetEnv()['E'])
+        self._PopShellCall(mem)
+        self.assertEqual('2', mem.GetEnv()['E'])
+
+        # export -n x
+        mem.ClearFlag('x', state.ClearExport)
+        self.assertEqual(None, mem.GetEnv().get('x'))
+
+        # unset E
+        mem.Unset(location.LName('E'), scope_e.Shopt)
+        self.assertEqual(None, mem.GetEnv().get('E'))
+
     def testUnset(self):
         mem = _InitMem()
         # unset a
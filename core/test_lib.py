@@ -33,6 +33,7 @@ from core import process
 from core import pyutil
 from core import sh_init
 from core import state
+from core import stat_cache
 from display import ui
 from core import util
 from core import vm
@@ -217,8 +218,9 @@ def InitCommandEvaluator(parse_ctx=None,
     errfmt = ui.ErrorFormatter()
     job_control = process.JobControl()
     job_list = process.JobList()
+    s_cache = stat_cache.StatCache(mem, exec_opts)
     fd_state = process.FdState(errfmt, job_control, job_list, None, None, None,
-                               exec_opts)
+                               exec_opts, s_cache)
     aliases = {} if aliases is None else aliases
     procs = state.Procs(mem)
     methods = {}
@@ -238,9 +240,10 @@ def InitCommandEvaluator(parse_ctx=None,
         builtin_i.export_: assign_osh.Export(mem, arith_ev, errfmt),
         builtin_i.readonly: assign_osh.Readonly(mem, arith_ev, errfmt),
     }
+    builtin_stdout = vm.BuiltinStdout()
     builtins = {  # Lookup
         builtin_i.cat: private_ysh.Cat(errfmt),
-        builtin_i.echo: io_osh.Echo(exec_opts),
+        builtin_i.echo: io_osh.Echo(exec_opts, builtin_stdout),
         builtin_i.shift: assign_osh.Shift(mem),
 
         builtin_i.history: readline_osh.History(
@@ -274,7 +277,7 @@ def InitCommandEvaluator(parse_ctx=None,
     splitter = split.SplitContext(mem)
 
     bool_ev = sh_expr_eval.BoolEvaluator(mem, exec_opts, mutable_opts,
-                                         parse_ctx, errfmt)
+                                         parse_ctx, errfmt, s_cache)
     expr_ev = expr_eval.ExprEvaluator(mem, mutable_opts, methods, splitter,
                                       errfmt)
     tilde_ev = word_eval.TildeEvaluator(mem, exec_opts)
@@ -286,7 +289,7 @@ def InitCommandEvaluator(parse_ctx=None,
     multi_trace = dev.MultiTracer(posix.getpid(), '', '', '', fd_state)
     tracer = dev.Tracer(parse_ctx, exec_opts, mutable_opts, mem, debug_f,
                         multi_trace)
-    waiter = process.Waiter(job_list, exec_opts, trap_state, tracer)
+    waiter = process.Waiter(job_list, exec_opts, trap_state, tracer, s_cache)
 
     cmd_deps.cflow_builtin = cmd_eval.ControlFlowBuiltin(
         mem, exec_opts, tracer, errfmt)
@@ -300,7 +303,7 @@ def InitCommandEvaluator(parse_ctx=None,
                                       hay_state, builtins, tracer, errfmt,
                                       search_path, ext_prog, waiter,
                                       job_control, job_list, fd_state,
-                                      trap_state)
+                                      trap_state, builtin_stdout)
     pure_ex = executor.PureExecutor(mem, exec_opts, mutable_opts, procs,
                                     hay_state, builtins, tracer, errfmt)
 
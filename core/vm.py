@@ -13,6 +13,7 @@ from core.error import e_die
 from core import pyos
 from core import pyutil
 from display import ui
+from mycpp import mylib
 from mycpp.mylib import log, tagswitch
 
 from typing import List, Dict, Tuple, Optional, Any, cast, TYPE_CHECKING
@@ -540,3 +541,33 @@ class ctx_FlushStdout(object):
         err = pyos.FlushStdout()
         if err is not None:
             self.err_out.append(err)
+
+
+class BuiltinStdout(object):
+    """Where echo, printf, and write send their output.
+
+    Usually this is mylib.Stdout(), but ShellExecutor swaps in a BufWriter
+    to run a command sub like $(echo $x) without forking.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.f = mylib.Stdout()  # type: mylib.Writer
+
+
+class ctx_CaptureStdout(object):
+    """Send builtin output to a buffer, for command subs that don't fork."""
+
+    def __init__(self, stdout_, buf):
+        # type: (BuiltinStdout, mylib.BufWriter) -> None
+        self.stdout_ = stdout_
+        self.saved = stdout_.f
+        stdout_.f = buf
+
+    def __enter__(self):
+        # type: () -> None
+        pass
+
+    def __exit__(self, type, value, traceback):
+        # type: (Any, Any, Any) -> None
+        self.stdout_.f = self.saved
@@ -167,7 +167,12 @@ def NinjaGraph(ru):
                   srcs=['cpp/fanos.cc'],
                   deps=['//cpp/fanos_shared', '//mycpp/runtime'])
 
-    ru.cc_library('//cpp/libc', srcs=['cpp/libc.cc'], deps=['//mycpp/runtime'])
+    ru.cc_library('//cpp/regex_cache_shared',
+                  srcs=['cpp/regex_cache_shared.c'])
+
+    ru.cc_library('//cpp/libc',
+                  srcs=['cpp/libc.cc'],
+                  deps=['//cpp/regex_cache_shared', '//mycpp/runtime'])
 
     ru.cc_binary('cpp/libc_test.cc',
                  deps=['//cpp/libc'],
@@ -2,11 +2,14 @@
 
 #include "cpp/core.h"
 
-#include <ctype.h>  // ispunct()
+#include <ctype.h>   // ispunct()
+#include <dirent.h>  // opendir(), readdir()
 #include <errno.h>
+#include <fcntl.h>  // open()
 #include <float.h>
-#include <math.h>  // fmod()
-#include <pwd.h>   // passwd
+#include <limits.h>  // PATH_MAX
+#include <math.h>    // fmod()
+#include <pwd.h>     // passwd
 #include <signal.h>
 #include <sys/resource.h>  // getrusage
 #include <sys/select.h>    // select(), FD_ISSET, FD_SET, FD_ZERO
@@ -77,6 +80,13 @@ Tuple2<int, int> ReadByte(int fd) {
   }
 }
 
+int SeekRelative(int fd, int offset) {
+  if (::lseek(fd, offset, SEEK_CUR) < 0) {
+    return errno;
+  }
+  return 0;
+}
+
 Dict<BigStr*, BigStr*>* Environ() {
   auto d = Alloc<Dict<BigStr*, BigStr*>>();
 
@@ -195,8 +205,8 @@ Tuple2<mops::BigInt, mops::BigInt> GetRLimit(int resource) {
 
 void SetRLimit(int resource, mops::BigInt soft, mops::BigInt hard) {
   struct rlimit lim;
-  lim.rlim_cur = soft;
-  lim.rlim_max = hard;
+  lim.rlim_cur = mops::ToC(soft);
+  lim.rlim_max = mops::ToC(hard);
 
   if (::setrlimit(resource, &lim) < 0) {
     throw Alloc<IOError>(errno);
@@ -291,6 +301,73 @@ Tuple2<BigStr*, int>* MakeDirCacheKey(BigStr* path) {
   return Alloc<Tuple2<BigStr*, int>>(path, st.st_mtime);
 }
 
+BigStr* FileCacheKey(BigStr* path) {
+  struct stat st;
+  if (::stat(path->data(), &st) == -1) {
+    return kEmptyString;
+  }
+  // Another change in the same second wouldn't change the key
+  if (::time(nullptr) <= st.st_mtime) {
+    return kEmptyString;
+  }
+  char buf[100];
+  int n = snprintf(buf, sizeof(buf), "%llu %llu %lld %lld",
+                   static_cast<unsigned long long>(st.st_dev),
+                   static_cast<unsigned long long>(st.st_ino),
+                   static_cast<long long>(st.st_size),
+                   static_cast<long long>(st.st_mtime));
+  return StrFromC(buf, n);
+}
+
+int MakeDirs(BigStr* path) {
+  // Like mkdir -p, but with mode 0700
+  int n = len(path);
+  for (int i = 1; i <= n; ++i) {
+    if (i != n && path->data_[i] != '/') {
+      continue;
+    }
+    BigStr* prefix = path->slice(0, i);
+    if (::mkdir(prefix->data(), 0700) < 0 && errno != EEXIST) {
+      return errno;
+    }
+  }
+  return 0;
+}
+
+int WriteFileAtomic(BigStr* path, BigStr* contents) {
+  char tmp_path[PATH_MAX];
+  snprintf(tmp_path, sizeof(tmp_path), "%s.%d.tmp", path->data(), getpid());
+
+  int fd = ::open(tmp_path, O_WRONLY | O_CREAT | O_TRUNC, 0600);
+  if (fd < 0) {
+    return errno;
+  }
+
+  int err_num = 0;
+  int n = 0;
+  int length = len(contents);
+  while (n < length) {
+    ssize_t result = ::write(fd, contents->data_ + n, length - n);
+    if (result < 0) {
+      if (errno == EINTR) {
+        continue;
+      }
+      err_num = errno;
+      break;
+    }
+    n += result;
+  }
+  ::close(fd);
+
+  if (err_num == 0 && ::rename(tmp_path, path->data()) < 0) {
+    err_num = errno;
+  }
+  if (err_num != 0) {
+    ::unlink(tmp_path);
+  }
+  return err_num;
+}
+
 bool IsSameFile(BigStr* path1, BigStr* path2) {
   struct stat st1, st2;
   if (::stat(path1->data(), &st1)) {
@@ -315,6 +392,62 @@ int Unlink(BigStr* path) {
   return 0;
 }
 
+int ReadDir(BigStr* path, List<BigStr*>* names, List<int>* kinds) {
+  DIR* dirp = ::opendir(path->data());
+  if (dirp == nullptr) {
+    return errno;
+  }
+
+  int err_num = 0;
+  while (true) {
+    errno = 0;
+    struct dirent* ep = ::readdir(dirp);
+    if (ep == nullptr) {
+      err_num = errno;  // 0 at the end of the directory
+      break;
+    }
+
+    const char* name = ep->d_name;
+    if (name[0] == '.' &&
+        (name[1] == '\0' || (name[1] == '.' && name[2] == '\0'))) {
+      continue;
+    }
+
+    int kind = ENTRY_OTHER;
+    switch (ep->d_type) {
+    case DT_DIR:
+      kind = ENTRY_DIR;
+      break;
+    case DT_LNK:
+      kind = ENTRY_SYMLINK;
+      break;
+    case DT_UNKNOWN: {
+      // Some file systems don't fill in d_type
+      char buf[PATH_MAX];
+      snprintf(buf, sizeof(buf), "%s/%s", path->data(), name);
+      struct stat st;
+      if (::lstat(buf, &st) < 0) {
+        continue;  // removed since readdir()
+      }
+      if (S_ISDIR(st.st_mode)) {
+        kind = ENTRY_DIR;
+      } else if (S_ISLNK(st.st_mode)) {
+        kind = ENTRY_SYMLINK;
+      }
+      break;
+    }
+    default:
+      break;
+    }
+
+    names->append(StrFromC(name));
+    kinds->append(kind);
+  }
+
+  ::closedir(dirp);
+  return err_num;
+}
+
 Tuple2<int, void*> PushTermAttrs(int fd, int mask) {
   struct termios* term_attrs =
       static_cast<struct termios*>(malloc(sizeof(struct termios)));
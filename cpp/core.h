@@ -23,9 +23,14 @@ const int EOF_SENTINEL = 256;
 const int NEWLINE_CH = 10;
 const int BACKSLASH_CH = 92;
 
+const int ENTRY_OTHER = 0;
+const int ENTRY_DIR = 1;
+const int ENTRY_SYMLINK = 2;
+
 Tuple2<int, int> WaitPid(int waitpid_options);
 Tuple2<int, int> Read(int fd, int n, List<BigStr*>* chunks);
 Tuple2<int, int> ReadByte(int fd);
+int SeekRelative(int fd, int offset);
 BigStr* ReadLineBuffered();
 Dict<BigStr*, BigStr*>* Environ();
 int Chdir(BigStr* dest_dir);
@@ -90,10 +95,18 @@ void PopTermAttrs(int fd, int orig_local_modes, void* term_attrs);
 
 Tuple2<BigStr*, int>* MakeDirCacheKey(BigStr* path);
 
+BigStr* FileCacheKey(BigStr* path);
+
+int MakeDirs(BigStr* path);
+
+int WriteFileAtomic(BigStr* path, BigStr* contents);
+
 bool IsSameFile(BigStr* path1, BigStr* path2);
 
 int Unlink(BigStr* path);
 
+int ReadDir(BigStr* path, List<BigStr*>* names, List<int>* kinds);
+
 }  // namespace pyos
 
 namespace pyutil {
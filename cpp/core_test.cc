@@ -281,6 +281,68 @@ TEST dir_cache_key_test() {
   PASS();
 }
 
+TEST file_cache_test() {
+  // "/" wasn't modified in this second
+  BigStr* key = pyos::FileCacheKey(StrFromC("/"));
+  ASSERT(len(key) > 0);
+  ASSERT(str_equals(kEmptyString,
+                    pyos::FileCacheKey(StrFromC("nonexistent_ZZ"))));
+
+  char dir[] = "/tmp/core_test_XXXXXX";
+  ASSERT(mkdtemp(dir) != nullptr);
+  BigStr* tmp_dir = StrFromC(dir);
+  BigStr* sub = StrFormat("%s/a/b", tmp_dir);
+  ASSERT_EQ(0, pyos::MakeDirs(sub));
+  ASSERT_EQ(0, pyos::MakeDirs(sub));  // already exists
+
+  BigStr* path = StrFormat("%s/f", sub);
+  ASSERT_EQ(0, pyos::WriteFileAtomic(path, StrFromC("hello")));
+  struct stat st;
+  ASSERT(::stat(path->data(), &st) == 0);
+  ASSERT_EQ(5, st.st_size);
+
+  // Just written, so the key can't be trusted
+  ASSERT(str_equals(kEmptyString, pyos::FileCacheKey(path)));
+
+  ASSERT_EQ(ENOENT, pyos::WriteFileAtomic(StrFormat("%s/nope/f", tmp_dir),
+                                          StrFromC("x")));
+
+  PASS();
+}
+
+TEST read_dir_test() {
+  char dir[] = "/tmp/core_test_XXXXXX";
+  ASSERT(mkdtemp(dir) != nullptr);
+  BigStr* tmp_dir = StrFromC(dir);
+  ASSERT_EQ(0, pyos::MakeDirs(StrFormat("%s/sub", tmp_dir)));
+  ASSERT_EQ(0, pyos::WriteFileAtomic(StrFormat("%s/f", tmp_dir), kEmptyString));
+  ASSERT(::symlink("sub", StrFormat("%s/link", tmp_dir)->data()) == 0);
+
+  auto names = NewList<BigStr*>();
+  auto kinds = NewList<int>();
+  ASSERT_EQ(0, pyos::ReadDir(tmp_dir, names, kinds));
+  ASSERT_EQ(3, len(names));  // no . or ..
+  ASSERT_EQ(3, len(kinds));
+
+  for (int i = 0; i < len(names); ++i) {
+    BigStr* name = names->at(i);
+    int kind = kinds->at(i);
+    if (str_equals(name, StrFromC("sub"))) {
+      ASSERT_EQ(pyos::ENTRY_DIR, kind);
+    } else if (str_equals(name, StrFromC("link"))) {
+      ASSERT_EQ(pyos::ENTRY_SYMLINK, kind);
+    } else {
+      ASSERT(str_equals(name, StrFromC("f")));
+      ASSERT_EQ(pyos::ENTRY_OTHER, kind);
+    }
+  }
+
+  ASSERT_EQ(ENOENT, pyos::ReadDir(StrFromC("nonexistent_ZZ"), names, kinds));
+  ASSERT_EQ(3, len(names));
+
+  PASS();
+}
+
 // Test the theory that LeakSanitizer tests for reachability from global
 // variables.
 struct Node {
@@ -350,6 +412,8 @@ int main(int argc, char** argv) {
 
   RUN_TEST(passwd_test);
   RUN_TEST(dir_cache_key_test);
+  RUN_TEST(file_cache_test);
+  RUN_TEST(read_dir_test);
   RUN_TEST(asan_global_leak_test);
 
   // RUN_TEST(waitpid_demo);
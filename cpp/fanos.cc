@@ -54,4 +54,25 @@ BigStr* recv(int sock_fd, List<int>* fd_out) {
   return ret;
 }
 
+int listen(BigStr* path) {
+  FanosError err = {0};
+  int sock_fd = fanos_listen(path->data(), &err);
+  if (err.err_code != 0) {
+    throw Alloc<IOError>(err.err_code);
+  }
+  if (err.value_err != nullptr) {
+    throw Alloc<ValueError>(StrFromC(err.value_err));
+  }
+  return sock_fd;
+}
+
+int accept(int sock_fd) {
+  FanosError err = {0};
+  int conn_fd = fanos_accept(sock_fd, &err);
+  if (err.err_code != 0) {
+    throw Alloc<IOError>(err.err_code);
+  }
+  return conn_fd;
+}
+
 }  // namespace fanos
@@ -13,6 +13,12 @@ void send(int sock_fd, BigStr* blob);
 // nullptr (Python None) on EOF.
 BigStr* recv(int sock_fd, List<int>* fd_out);
 
+// Returns a Unix socket listening at the path.
+int listen(BigStr* path);
+
+// Returns a connection accepted on a socket from listen().
+int accept(int sock_fd);
+
 }  // namespace fanos
 
 #endif  // FANOS_H
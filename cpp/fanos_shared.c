@@ -2,11 +2,14 @@
 
 #include <assert.h>
 #include <errno.h>
+#include <fcntl.h>   // FD_CLOEXEC
 #include <stdarg.h>  // va_list, etc.
 #include <stdio.h>   // vfprintf
 #include <stdlib.h>
 #include <string.h>
 #include <sys/socket.h>
+#include <sys/stat.h>
+#include <sys/un.h>  // sockaddr_un
 #include <unistd.h>
 
 #define SIZEOF_FDS (sizeof(int) * FANOS_NUM_FDS)
@@ -18,6 +21,7 @@ const char* kErrUnexpectedEof = "Unexpected EOF";
 const char* kErrMissingLength = "Expected netstring length";
 const char* kErrMissingColon = "Expected : after netstring length";
 const char* kErrMissingComma = "Expected ,";
+const char* kErrPathTooLong = "Socket path too long";
 
 void fanos_send(int sock_fd, char* blob, int blob_len, const int* fds,
                 struct FanosError* err) {
@@ -213,3 +217,68 @@ void fanos_recv(int sock_fd, int* fd_out, struct FanosResult* result_out,
   result_out->data = data_buf;
   result_out->len = expected_bytes;
 }
+
+int fanos_listen(const char* path, struct FanosError* err) {
+  struct sockaddr_un addr = {0};
+  if (strlen(path) >= sizeof(addr.sun_path)) {
+    err->value_err = kErrPathTooLong;
+    return -1;
+  }
+  addr.sun_family = AF_UNIX;
+  strcpy(addr.sun_path, path);
+
+  int sock_fd = socket(AF_UNIX, SOCK_STREAM, 0);
+  if (sock_fd < 0) {
+    err->err_code = errno;
+    return -1;
+  }
+  // Child processes shouldn't inherit it
+  fcntl(sock_fd, F_SETFD, FD_CLOEXEC);
+
+  // Replace a stale socket, but not other kinds of files, or a socket that a
+  // server is still listening on
+  struct stat st;
+  if (lstat(path, &st) == 0 && S_ISSOCK(st.st_mode)) {
+    int probe_fd = socket(AF_UNIX, SOCK_STREAM, 0);
+    if (probe_fd < 0) {
+      err->err_code = errno;
+      close(sock_fd);
+      return -1;
+    }
+    int live = connect(probe_fd, (struct sockaddr*)&addr, sizeof(addr)) == 0;
+    int refused = !live && errno == ECONNREFUSED;
+    close(probe_fd);
+
+    if (live) {
+      err->err_code = EADDRINUSE;
+      close(sock_fd);
+      return -1;
+    }
+    if (refused) {
+      unlink(path);
+    }
+  }
+
+  if (bind(sock_fd, (struct sockaddr*)&addr, sizeof(addr)) < 0 ||
+      listen(sock_fd, 16) < 0) {
+    err->err_code = errno;
+    close(sock_fd);
+    return -1;
+  }
+  return sock_fd;
+}
+
+int fanos_accept(int sock_fd, struct FanosError* err) {
+  while (1) {
+    int conn_fd = accept(sock_fd, NULL, NULL);
+    if (conn_fd >= 0) {
+      // Processes started by the session shouldn't inherit it
+      fcntl(conn_fd, F_SETFD, FD_CLOEXEC);
+      return conn_fd;
+    }
+    if (errno != EINTR) {
+      err->err_code = errno;
+      return -1;
+    }
+  }
+}
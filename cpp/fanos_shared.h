@@ -46,4 +46,15 @@ void fanos_send(int sock_fd, char* blob, int blob_len, const int* fds,
 void fanos_recv(int sock_fd, int* fd_out, struct FanosResult* result_out,
                 struct FanosError* err);
 
+// Create a Unix socket that listens at the given path.  A socket left at the
+// path by a previous server is replaced.
+//
+// Returns the descriptor, or -1 and populates `err`.
+int fanos_listen(const char* path, struct FanosError* err);
+
+// Accept a connection on a socket from fanos_listen(), retrying on EINTR.
+//
+// Returns the descriptor, or -1 and populates `err`.
+int fanos_accept(int sock_fd, struct FanosError* err);
+
 #endif  // FANOS_SHARED_H
@@ -14,6 +14,8 @@
 #include <unistd.h>  // gethostname()
 #include <wchar.h>
 
+#include "cpp/regex_cache_shared.h"
+
 namespace libc {
 
 BigStr* gethostname() {
@@ -109,12 +111,9 @@ List<BigStr*>* glob(BigStr* pat, int flags) {
 List<int>* regex_search(BigStr* pattern, int cflags, BigStr* str, int eflags,
                         int pos) {
   cflags |= REG_EXTENDED;
-  regex_t pat;
-  int status = regcomp(&pat, pattern->data_, cflags);
-  if (status != 0) {
-    char error_desc[50];
-    regerror(status, &pat, error_desc, 50);
-
+  regex_t* pat;
+  char error_desc[50];
+  if (regex_cache_compile(pattern->data_, cflags, &pat, error_desc, 50) != 0) {
     char error_message[80];
     snprintf(error_message, 80, "Invalid regex %s (%s)", pattern->data_,
              error_desc);
@@ -123,7 +122,7 @@ List<int>* regex_search(BigStr* pattern, int cflags, BigStr* str, int eflags,
   }
   // log("pat = %d, str = %d", len(pattern), len(str));
 
-  int num_groups = pat.re_nsub + 1;  // number of captures
+  int num_groups = pat->re_nsub + 1;  // number of captures
 
   List<int>* indices = NewList<int>();
   indices->reserve(num_groups * 2);
@@ -131,7 +130,7 @@ List<int>* regex_search(BigStr* pattern, int cflags, BigStr* str, int eflags,
   const char* s = str->data_;
   regmatch_t* pmatch =
       static_cast<regmatch_t*>(malloc(sizeof(regmatch_t) * num_groups));
-  bool match = regexec(&pat, s + pos, num_groups, pmatch, eflags) == 0;
+  bool match = regexec(pat, s + pos, num_groups, pmatch, eflags) == 0;
   if (match) {
     int i;
     for (i = 0; i < num_groups; i++) {
@@ -150,7 +149,6 @@ List<int>* regex_search(BigStr* pattern, int cflags, BigStr* str, int eflags,
   }
 
   free(pmatch);
-  regfree(&pat);
 
   if (!match) {
     return nullptr;
@@ -169,20 +167,21 @@ const int NMATCH = 2;
 // Odd: This a Tuple2* not Tuple2 because it's Optional[Tuple2]!
 Tuple2<int, int>* regex_first_group_match(BigStr* pattern, BigStr* str,
                                           int pos) {
-  regex_t pat;
+  regex_t* pat;
   regmatch_t m[NMATCH];
 
   // Could have been checked by regex_parse for [[ =~ ]], but not for glob
   // patterns like ${foo/x*/y}.
 
-  if (regcomp(&pat, pattern->data_, REG_EXTENDED) != 0) {
+  char error_desc[50];
+  if (regex_cache_compile(pattern->data_, REG_EXTENDED, &pat, error_desc, 50) !=
+      0) {
     throw Alloc<RuntimeError>(
         StrFromC("Invalid regex syntax (func_regex_first_group_match)"));
   }
 
   // Match at offset 'pos'
-  int result = regexec(&pat, str->data_ + pos, NMATCH, m, 0 /*flags*/);
-  regfree(&pat);
+  int result = regexec(pat, str->data_ + pos, NMATCH, m, 0 /*flags*/);
 
   if (result != 0) {
     return nullptr;
@@ -196,6 +195,18 @@ Tuple2<int, int>* regex_first_group_match(BigStr* pattern, BigStr* str,
   return tup;
 }
 
+List<int>* regex_cache_stats() {
+  struct RegexCacheStats stats;
+  ::regex_cache_stats(&stats);
+
+  List<int>* result = NewList<int>();
+  result->append(stats.hits);
+  result->append(stats.misses);
+  result->append(stats.evictions);
+  result->append(stats.num_entries);
+  return result;
+}
+
 int wcswidth(BigStr* s) {
   // Behavior of mbstowcs() depends on LC_CTYPE
 
@@ -281,4 +292,10 @@ BigStr* setlocale(int category, BigStr* locale) {
 BigStr* nl_langinfo(int item) {
   return StrFromC(::nl_langinfo(item));
 }
+BigStr* strxfrm(BigStr* s) {
+  size_t n = ::strxfrm(nullptr, s->data_, 0);
+  BigStr* result = NewStr(n);
+  ::strxfrm(result->data_, s->data_, n + 1);
+  return result;
+}
 }  // namespace pylocale
@@ -32,6 +32,9 @@ Tuple2<int, int>* regex_first_group_match(BigStr* pattern, BigStr* str,
 List<int>* regex_search(BigStr* pattern, int cflags, BigStr* str, int eflags,
                         int pos = 0);
 
+// [hits, misses, evictions, num_entries] for the regcomp() cache
+List<int>* regex_cache_stats();
+
 int wcswidth(BigStr* str);
 int get_terminal_width();
 int sleep_until_error(double seconds);
@@ -64,6 +67,7 @@ class Error {
 };
 BigStr* setlocale(int category, BigStr* locale);
 BigStr* nl_langinfo(int item);
+BigStr* strxfrm(BigStr* s);
 
 }  // namespace pylocale
 
@@ -4,6 +4,7 @@
 #include <regex.h>   // regcomp()
 #include <unistd.h>  // gethostname()
 
+#include "cpp/regex_cache_shared.h"
 #include "mycpp/runtime.h"
 #include "vendor/greatest.h"
 
@@ -131,6 +132,52 @@ TEST regex_wrapper_test() {
   PASS();
 }
 
+TEST regex_cache_test() {
+  regex_cache_clear();
+
+  BigStr* pat = StrFromC("(a+)b");
+  List<int>* indices = nullptr;
+  for (int i = 0; i < 3; ++i) {
+    indices = libc::regex_search(pat, 0, StrFromC("xaab"), 0);
+    ASSERT(indices != nullptr);
+  }
+
+  // Same pattern with different flags is a different entry
+  indices = libc::regex_search(pat, REG_ICASE, StrFromC("xAAB"), 0);
+  ASSERT(indices != nullptr);
+
+  List<int>* stats = libc::regex_cache_stats();
+  ASSERT_EQ_FMT(2, stats->at(0), "%d");  // hits
+  ASSERT_EQ_FMT(2, stats->at(1), "%d");  // misses
+  ASSERT_EQ_FMT(0, stats->at(2), "%d");  // evictions
+  ASSERT_EQ_FMT(2, stats->at(3), "%d");  // num_entries
+
+  // Fill the cache past capacity
+  char buf[20];
+  for (int i = 0; i < REGEX_CACHE_CAPACITY; ++i) {
+    snprintf(buf, sizeof(buf), "x%d", i);
+    libc::regex_first_group_match(StrFromC(buf), StrFromC("x"), 0);
+  }
+  stats = libc::regex_cache_stats();
+  ASSERT_EQ_FMT(2, stats->at(2), "%d");
+  ASSERT_EQ_FMT(REGEX_CACHE_CAPACITY, stats->at(3), "%d");
+
+  // Errors are not cached
+  bool caught = false;
+  try {
+    libc::regex_search(StrFromC("*"), 0, StrFromC("x"), 0);
+  } catch (ValueError* e) {
+    caught = true;
+  }
+  ASSERT(caught);
+
+  regex_cache_clear();
+  stats = libc::regex_cache_stats();
+  ASSERT_EQ_FMT(0, stats->at(3), "%d");
+
+  PASS();
+}
+
 TEST glob_test() {
   // This depends on the file system
   auto files = libc::glob(StrFromC("*.testdata"));
@@ -185,6 +232,7 @@ int main(int argc, char** argv) {
   RUN_TEST(realpath_test);
   RUN_TEST(libc_test);
   RUN_TEST(regex_wrapper_test);
+  RUN_TEST(regex_cache_test);
   RUN_TEST(glob_test);
   RUN_TEST(fnmatch_test);
   RUN_TEST(for_test_coverage);
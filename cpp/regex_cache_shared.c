@@ -0,0 +1,102 @@
+#include "cpp/regex_cache_shared.h"
+
+#include <stdlib.h>
+#include <string.h>
+
+// An entry is in use iff pattern != NULL.
+struct RegexCacheEntry {
+  char* pattern;  // owned, from strdup()
+  unsigned int hash;
+  int cflags;
+  unsigned long last_used;  // for LRU eviction
+  regex_t re;
+};
+
+static struct RegexCacheEntry gEntries[REGEX_CACHE_CAPACITY];
+static unsigned long gTick = 0;
+static struct RegexCacheStats gStats = {0, 0, 0, 0};
+
+// FNV-1a, so a probe usually compares integers rather than strings
+static unsigned int hash_pattern(const char* s) {
+  unsigned int h = 2166136261u;
+  for (; *s; ++s) {
+    h ^= (unsigned char)*s;
+    h *= 16777619u;
+  }
+  return h;
+}
+
+static void free_entry(struct RegexCacheEntry* e) {
+  regfree(&e->re);
+  free(e->pattern);
+  e->pattern = NULL;
+}
+
+int regex_cache_compile(const char* pattern, int cflags, regex_t** out,
+                        char* err_buf, int err_buf_size) {
+  unsigned int h = hash_pattern(pattern);
+  gTick++;
+
+  // Look for a hit, while remembering a free or least recently used slot
+  struct RegexCacheEntry* victim = NULL;
+  int i;
+  for (i = 0; i < REGEX_CACHE_CAPACITY; ++i) {
+    struct RegexCacheEntry* e = &gEntries[i];
+    if (e->pattern == NULL) {
+      if (victim == NULL || victim->pattern != NULL) {
+        victim = e;
+      }
+      continue;
+    }
+    if (e->hash == h && e->cflags == cflags &&
+        strcmp(e->pattern, pattern) == 0) {
+      e->last_used = gTick;
+      gStats.hits++;
+      *out = &e->re;
+      return 0;
+    }
+    if (victim == NULL ||
+        (victim->pattern != NULL && e->last_used < victim->last_used)) {
+      victim = e;
+    }
+  }
+
+  gStats.misses++;
+
+  // Note: regex_t isn't copied, since it's opaque.  So a syntax error leaves
+  // the victim slot empty.
+  if (victim->pattern != NULL) {
+    free_entry(victim);
+    gStats.evictions++;
+    gStats.num_entries--;
+  }
+
+  int status = regcomp(&victim->re, pattern, cflags);
+  if (status != 0) {
+    regerror(status, &victim->re, err_buf, err_buf_size);
+    return status;
+  }
+
+  victim->pattern = strdup(pattern);
+  victim->hash = h;
+  victim->cflags = cflags;
+  victim->last_used = gTick;
+  gStats.num_entries++;
+
+  *out = &victim->re;
+  return 0;
+}
+
+void regex_cache_stats(struct RegexCacheStats* stats) {
+  *stats = gStats;
+}
+
+void regex_cache_clear(void) {
+  int i;
+  for (i = 0; i < REGEX_CACHE_CAPACITY; ++i) {
+    if (gEntries[i].pattern != NULL) {
+      free_entry(&gEntries[i]);
+    }
+  }
+  memset(&gStats, 0, sizeof(gStats));
+}
@@ -0,0 +1,42 @@
+#ifndef REGEX_CACHE_SHARED_H
+#define REGEX_CACHE_SHARED_H
+
+// A bounded LRU cache of compiled POSIX regexes, keyed by (pattern, cflags).
+//
+// This library is shared between cpp/libc.cc and pyext/libc.c.
+//
+// Shell loops like
+//
+//   while read -r line; do [[ $line =~ $pat ]] && ...; done
+//
+// would otherwise call regcomp() on the same pattern for every iteration.
+
+#include <regex.h>
+
+#define REGEX_CACHE_CAPACITY 100
+
+// Stats for the 'pp cache-stats_' debug action.
+struct RegexCacheStats {
+  int hits;
+  int misses;
+  int evictions;
+  int num_entries;
+};
+
+// Compile 'pattern' with 'cflags', or return a previously compiled regex_t.
+//
+// On success, returns 0 and sets *out.  The regex_t is owned by the cache:
+// the caller must NOT regfree() it, and must not hold onto it across another
+// call to regex_cache_compile(), which may evict it.
+//
+// On failure, returns the nonzero regcomp() error code, and writes a message
+// to err_buf.  Nothing is cached.
+int regex_cache_compile(const char* pattern, int cflags, regex_t** out,
+                        char* err_buf, int err_buf_size);
+
+void regex_cache_stats(struct RegexCacheStats* stats);
+
+// regfree() every entry and reset the counters.
+void regex_cache_clear(void);
+
+#endif  // REGEX_CACHE_SHARED_H
@@ -8,6 +8,7 @@
 #include <fcntl.h>      // open
 #include <math.h>       // isinf, isnan
 #include <signal.h>     // kill
+#include <spawn.h>      // posix_spawn
 #include <sys/stat.h>   // umask
 #include <sys/types.h>  // umask
 #include <sys/wait.h>   // WUNTRACED
@@ -86,8 +87,10 @@ mylib::File* fdopen(int fd, BigStr* c_mode) {
   return Alloc<mylib::CFile>(f);
 }
 
-void execve(BigStr* argv0, List<BigStr*>* argv,
-            Dict<BigStr*, BigStr*>* environ) {
+// Returns a malloc()'d buffer containing the NULL-terminated argv and envp
+// arrays for execve() and posix_spawn(), and the strings they point to.
+static char* MakeArgvEnvp(List<BigStr*>* argv, Dict<BigStr*, BigStr*>* environ,
+                          char*** argv_out, char*** envp_out) {
   int n_args = len(argv);
   int n_env = len(environ);
   int combined_size = 0;
@@ -103,8 +106,8 @@ void execve(BigStr* argv0, List<BigStr*>* argv,
   combined_size += argv_size;
   combined_size += env_size;
   char* combined_buf = static_cast<char*>(malloc(combined_size));
+  char* result = combined_buf;
 
-  // never deallocated
   char** _argv = reinterpret_cast<char**>(combined_buf);
   combined_buf += argv_size;
 
@@ -135,6 +138,18 @@ void execve(BigStr* argv0, List<BigStr*>* argv,
   }
   envp[n_env] = nullptr;
 
+  *argv_out = _argv;
+  *envp_out = envp;
+  return result;
+}
+
+void execve(BigStr* argv0, List<BigStr*>* argv,
+            Dict<BigStr*, BigStr*>* environ) {
+  char** _argv;
+  char** envp;
+  // never deallocated
+  MakeArgvEnvp(argv, environ, &_argv, &envp);
+
   int ret = ::execve(argv0->data_, _argv, envp);
   if (ret == -1) {
     throw Alloc<OSError>(errno);
@@ -144,6 +159,34 @@ void execve(BigStr* argv0, List<BigStr*>* argv,
   FAIL(kShouldNotGetHere);
 }
 
+int posix_spawn(BigStr* path, List<BigStr*>* argv,
+                Dict<BigStr*, BigStr*>* environ, List<int>* setsigdef) {
+  char** _argv;
+  char** envp;
+  char* buf = MakeArgvEnvp(argv, environ, &_argv, &envp);
+
+  sigset_t sigdef;
+  sigemptyset(&sigdef);
+  for (ListIter<int> it(setsigdef); !it.Done(); it.Next()) {
+    sigaddset(&sigdef, it.Value());
+  }
+
+  posix_spawnattr_t attr;
+  posix_spawnattr_init(&attr);
+  posix_spawnattr_setsigdefault(&attr, &sigdef);
+  posix_spawnattr_setflags(&attr, POSIX_SPAWN_SETSIGDEF);
+
+  pid_t pid;
+  int err = ::posix_spawn(&pid, path->data_, nullptr, &attr, _argv, envp);
+  posix_spawnattr_destroy(&attr);
+  free(buf);
+
+  if (err != 0) {
+    throw Alloc<OSError>(err);
+  }
+  return pid;
+}
+
 void kill(int pid, int sig) {
   if (::kill(pid, sig) != 0) {
     throw Alloc<OSError>(errno);
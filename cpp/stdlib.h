@@ -148,6 +148,11 @@ mylib::File* fdopen(int fd, BigStr* c_mode);
 void execve(BigStr* argv0, List<BigStr*>* argv,
             Dict<BigStr*, BigStr*>* environ);
 
+// Returns the PID.  Only the signal dispositions in setsigdef are changed,
+// to SIG_DFL.
+int posix_spawn(BigStr* path, List<BigStr*>* argv,
+                Dict<BigStr*, BigStr*>* environ, List<int>* setsigdef);
+
 void kill(int pid, int sig);
 void killpg(int pgid, int sig);
 
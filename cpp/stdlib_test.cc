@@ -1,7 +1,9 @@
 #include "cpp/stdlib.h"
 
 #include <errno.h>
+#include <signal.h>
 #include <sys/stat.h>
+#include <sys/wait.h>
 
 #include "mycpp/gc_builtins.h"
 #include "vendor/greatest.h"
@@ -126,6 +128,33 @@ TEST listdir_test() {
   PASS();
 }
 
+TEST posix_spawn_test() {
+  List<BigStr*>* argv = NewList<BigStr*>(
+      std::initializer_list<BigStr*>{StrFromC("sh"), StrFromC("-c"),
+                                     StrFromC("exit $CODE")});
+  auto environ = Alloc<Dict<BigStr*, BigStr*>>();
+  environ->set(StrFromC("CODE"), StrFromC("42"));
+  List<int>* setsigdef = NewList<int>(std::initializer_list<int>{SIGPIPE});
+
+  int pid = posix::posix_spawn(StrFromC("/bin/sh"), argv, environ, setsigdef);
+  ASSERT(pid > 0);
+
+  int status;
+  ASSERT_EQ(pid, ::waitpid(pid, &status, 0));
+  ASSERT(WIFEXITED(status));
+  ASSERT_EQ(42, WEXITSTATUS(status));
+
+  int ec = -1;
+  try {
+    posix::posix_spawn(StrFromC("nonexistent_ZZ"), argv, environ, setsigdef);
+  } catch (IOError_OSError* e) {
+    ec = e->errno_;
+  }
+  ASSERT_EQ(ENOENT, ec);
+
+  PASS();
+}
+
 TEST for_test_coverage() {
   time_::sleep(0);
 
@@ -148,6 +177,7 @@ int main(int argc, char** argv) {
   RUN_TEST(time_test);
   RUN_TEST(mtime_demo);
   RUN_TEST(listdir_test);
+  RUN_TEST(posix_spawn_test);
 
   RUN_TEST(for_test_coverage);
 
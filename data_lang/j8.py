@@ -1011,6 +1011,138 @@ class Parser(_Parser):
         return obj
 
 
+# States of ListStreamParser
+_BEFORE_LIST = 0  # expect [
+_FIRST_ITEM = 1  # expect value or ]
+_NEXT_ITEM = 2  # expect , value or ]
+_AFTER_LIST = 3  # expect EOF
+_DONE = 4
+
+# A token that starts this close to the end of the input may be incomplete,
+# e.g. tr|ue or "\u12|34"
+_MAX_PARTIAL_TOKEN = 16
+
+
+class ListStreamParser(Parser):
+    """Parse a top-level List incrementally, for json read --stream.
+
+    The caller feeds chunks of input, and gets the items one at a time.  Only
+    the input for the current item is kept, so memory is bounded by the
+    largest item, not the whole document.
+
+        p = ListStreamParser(is_j8)
+        while True:
+            item = p.Next()
+            if item is None:
+                if p.Done():
+                    break
+                p.Feed(chunk)  # or p.Feed('') at EOF
+                continue
+            ...
+    """
+
+    def __init__(self, is_j8):
+        # type: (bool) -> None
+        Parser.__init__(self, '', is_j8)
+        self.state = _BEFORE_LIST
+        self.at_eof = False
+
+        # Where the next token starts, and its line number.  Everything
+        # before it has been returned.
+        self.pos = 0
+        self.line_num = 1
+
+    def Feed(self, chunk):
+        # type: (str) -> None
+        """Add input.  An empty chunk means EOF."""
+        if len(chunk) == 0:
+            self.at_eof = True
+        self.s = self.s[self.pos:] + chunk
+        self.pos = 0
+        self.lexer = LexerDecoder(self.s, self.is_j8, self.lang_str)
+
+    def NumBuffered(self):
+        # type: () -> int
+        """Bytes of input that haven't been returned as items."""
+        return len(self.s) - self.pos
+
+    def Done(self):
+        # type: () -> bool
+        return self.state == _DONE
+
+    def _NearEnd(self, pos):
+        # type: (int) -> bool
+        return pos >= len(self.s) - _MAX_PARTIAL_TOKEN
+
+    def _Commit(self, new_state):
+        # type: (int) -> None
+        """Don't parse the input before the current token again."""
+        self.state = new_state
+        self.pos = self.start_pos
+        self.line_num = self.lexer.cur_line_num
+
+    def Next(self):
+        # type: () -> Optional[value_t]
+        """Return the next item of the List, or None.
+
+        None means that the List ended, or that we need more input to parse
+        the next item.  Call Done() to tell the difference.
+
+        Raises error.Decode.
+        """
+        # Start from the last item, even if we failed to parse it
+        self.lexer.pos = self.pos
+        self.lexer.cur_line_num = self.line_num
+        self.end_pos = self.pos
+        try:
+            self._Next()
+            while True:
+                if self.state == _BEFORE_LIST:
+                    if self.tok_id == Id.Eol_Tok and not self.at_eof:
+                        return None
+                    if self.tok_id != Id.J8_LBracket:
+                        raise self._ParseError(
+                            'Expected a List to stream, got %s' %
+                            Id_str(self.tok_id))
+                    self._Next()
+                    self._Commit(_FIRST_ITEM)
+
+                elif self.state in (_FIRST_ITEM, _NEXT_ITEM):
+                    if self.tok_id == Id.J8_RBracket:
+                        self._Next()
+                        self._Commit(_AFTER_LIST)
+                        continue
+                    if self.state == _NEXT_ITEM:
+                        self._Eat(Id.J8_Comma)
+
+                    item = self._ParseValue()
+
+                    # Unless it's followed by , or ] the item may be
+                    # incomplete, e.g. 12 could be the start of 123 or 12.5
+                    if (not self.at_eof and
+                            self.tok_id not in (Id.J8_Comma, Id.J8_RBracket)
+                            and self._NearEnd(self.end_pos)):
+                        return None
+                    self._Commit(_NEXT_ITEM)
+                    return item
+
+                elif self.state == _AFTER_LIST:
+                    if self.tok_id != Id.Eol_Tok:
+                        raise self._ParseError(
+                            'Unexpected trailing input after List')
+                    if self.at_eof:
+                        self.state = _DONE
+                    return None
+
+                else:  # _DONE
+                    return None
+
+        except error.Decode as e:
+            if not self.at_eof and self._NearEnd(e.end_pos):
+                return None  # the rest of the token may be in the next chunk
+            raise
+
+
 class Nil8Parser(_Parser):
     """
     Tokens not in JSON8:
@@ -212,6 +212,63 @@ class J8Test(unittest.TestCase):
             self.fail('Expected failure')
 
 
+def _StreamItems(s, chunk_size, is_j8=True):
+    p = j8.ListStreamParser(is_j8)
+    items = []
+    pos = 0
+    while True:
+        item = p.Next()
+        if item is None:
+            if p.Done():
+                break
+            p.Feed(s[pos:pos + chunk_size])
+            pos += chunk_size
+            continue
+        items.append(item)
+    return items
+
+
+class ListStreamParserTest(unittest.TestCase):
+
+    def testChunks(self):
+        s = r"""
+        [ 123, -1.5e3, true, null, "x \u03bc \ud83d\ude00 y",
+          u'\u{3bc}', {"k": [1, {}], "k2": []}, [] # comment
+        ]
+        """
+        expected = j8.Parser(s, True).ParseValue().items
+
+        # Tokens are split at every position
+        for chunk_size in [1, 2, 3, 7, 100]:
+            items = _StreamItems(s, chunk_size)
+            self.assertEqual(len(expected), len(items), chunk_size)
+            for e, a in zip(expected, items):
+                self.assertEqual(repr(e), repr(a), chunk_size)
+
+    def testEmpty(self):
+        self.assertEqual([], _StreamItems('[]', 1))
+        self.assertEqual([], _StreamItems(' [ ] \n', 100))
+
+    def testErrors(self):
+        cases = [
+            '',
+            '{}',
+            '42',
+            '[1, 2',
+            '[1,]',
+            '[1] 2',
+            "[u'x']",  # J8 only
+        ]
+        for s in cases:
+            for chunk_size in [1, 100]:
+                try:
+                    _StreamItems(s, chunk_size, is_j8=False)
+                except error.Decode as e:
+                    print(e.Message())
+                else:
+                    self.fail('Expected error for %r' % s)
+
+
 class YajlTest(unittest.TestCase):
     """
     Note on old tests for YAJL.  Differences
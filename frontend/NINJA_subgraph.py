@@ -170,6 +170,8 @@ def NinjaGraph(ru):
             '//core/value.asdl',
         ],
         abbrev_module='frontend.syntax_abbrev',
+        # For the parse cache, core/parse_cache.py
+        serialize_methods=True,
     )
 
     ru.cc_binary('frontend/syntax_asdl_test.cc',
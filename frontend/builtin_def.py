@@ -54,7 +54,7 @@ _NORMAL_BUILTINS = [
 
     # take a block
     # push-registers added below
-    'fork', 'forkwait',
+    'fork', 'forkwait', 'forkmany',
     'redir', 'fopen',  # fopen is for backward compat
     'shvar',
     'ctx',
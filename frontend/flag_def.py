@@ -135,7 +135,12 @@ READ_SPEC.LongFlag('--num-bytes', args.Int)
 READ_SPEC.LongFlag('--with-eol')
 
 MAPFILE_SPEC = FlagSpec('mapfile')
+MAPFILE_SPEC.ShortFlag('-d', args.String)  # delimiter, or '' for NUL
+MAPFILE_SPEC.ShortFlag('-n', args.Int)  # max number of lines, 0 for all
+MAPFILE_SPEC.ShortFlag('-O', args.Int)  # first index to assign
+MAPFILE_SPEC.ShortFlag('-s', args.Int)  # number of lines to skip
 MAPFILE_SPEC.ShortFlag('-t')
+MAPFILE_SPEC.ShortFlag('-u', args.Int)  # file descriptor
 
 CD_SPEC = FlagSpec('cd')
 CD_SPEC.ShortFlag('-L')
@@ -198,6 +203,7 @@ WAIT_SPEC = FlagSpec('wait')
 WAIT_SPEC.ShortFlag('-n')
 WAIT_SPEC.LongFlag('--all')
 WAIT_SPEC.LongFlag('--verbose')
+WAIT_SPEC.LongFlag('--status-list')
 
 TRAP_SPEC = FlagSpec('trap')
 TRAP_SPEC.ShortFlag('-p')
@@ -308,6 +314,8 @@ MAIN_SPEC.ShortFlag('-i')  # interactive
 MAIN_SPEC.ShortFlag('-l')  # login - currently no-op
 MAIN_SPEC.LongFlag('--login')  # login - currently no-op
 MAIN_SPEC.LongFlag('--headless')  # accepts ECMD, etc.
+# With --headless, fork a session for each connection to this Unix socket
+MAIN_SPEC.LongFlag('--listen', args.String)
 
 # TODO: -h too
 # the output format when passing -n
@@ -521,6 +529,11 @@ PP_SPEC = FlagSpec('pp')
 FORK_SPEC = FlagSpec('fork')
 FORKWAIT_SPEC = FlagSpec('forkwait')
 
+# Like xargs -P and GNU parallel --keep-order
+FORKMANY_SPEC = FlagSpec('forkmany')
+FORKMANY_SPEC.ShortFlag('-j', args.Int)  # max jobs at once
+FORKMANY_SPEC.ShortFlag('-k', long_name='--keep-order')
+
 # Might want --list at some point
 SOURCE_GUARD_SPEC = FlagSpec('source-guard')
 USE_SPEC = FlagSpec('use')
@@ -616,3 +629,7 @@ JSON_WRITE_SPEC.LongFlag('--indent',
                          help='Indent JSON by this amount')
 
 JSON_READ_SPEC = FlagSpec('json_read')
+JSON_READ_SPEC.LongFlag('--stream',
+                        args.Bool,
+                        default=False,
+                        help='Run a block for each item of a List')
@@ -99,6 +99,11 @@ def LazyStr(tok):
 
     Most tokens do NOT need strings.  We avoid allocating them in the lexer.
 
+    Variable names are interned, like the names the parsers put in the tree
+    (sh_lhs.Name, BracedVarSub.var_name, expr.Var, etc.).  So every lookup of
+    'x' in Mem uses the same string object, which has its hash cached, and
+    compares equal to the dict key by pointer.
+
     Note: SingleQuoted could have lazy sval, NOT at the token level.
     """
     if 0:
@@ -107,7 +112,9 @@ def LazyStr(tok):
     if tok.tval is None:
         if tok.id in (Id.VSub_DollarName, Id.VSub_Number):  # $x or $2
             # Special case for SimpleVarSub - completion also relies on this
-            tok.tval = TokenSliceLeft(tok, 1)
+            tok.tval = intern(TokenSliceLeft(tok, 1))
+        elif tok.id == Id.Lit_ArithVarLike:  # $(( x + 1 ))
+            tok.tval = intern(TokenVal(tok))
         else:
             tok.tval = TokenVal(tok)
 
@@ -213,6 +213,10 @@ def TokenForArith(node):
             w = cast(CompoundWord, UP_node)
             return LeftTokenForWord(w)
 
+        elif case(arith_expr_e.Const):
+            node = cast(arith_expr.Const, UP_node)
+            return node.c
+
         elif case(arith_expr_e.Unary):
             node = cast(arith_expr.Unary, UP_node)
             return TokenForArith(node.child)
@@ -239,7 +239,6 @@ _BASH_UNIMPLEMENTED = [
     'extquote',
     'force_fignore',
     'globasciiranges',
-    'globstar',  # TODO:  implement **
     'gnu_errfmt',
     'histreedit',
     'histverify',
@@ -303,6 +302,7 @@ def _Init(opt_def):
     opt_def.Add('failglob')
     opt_def.Add('nocasematch')
     opt_def.Add('dotglob')
+    opt_def.Add('globstar')
     opt_def.Add('globskipdots', default=True)
 
     opt_def.Add('extdebug')  # for task files
@@ -315,6 +315,9 @@ def _Init(opt_def):
 
     # Optimizations
     opt_def.Add('rewrite_extern', default=True)
+    opt_def.Add('path_index')
+    opt_def.Add('parse_cache', default=True)
+    opt_def.Add('stat_cache')
 
     # For implementing strict_errexit
     # TODO: could be _no_command_sub / _no_process_sub, if we had to discourage
@@ -15,7 +15,7 @@ from mycpp import iolib
 from mycpp import mylib
 from mycpp.mylib import log
 
-from typing import Optional, Tuple, List, TYPE_CHECKING
+from typing import Optional, Tuple, List, Dict, TYPE_CHECKING
 if TYPE_CHECKING:
     from _devbuild.gen.syntax_asdl import Token, SourceLine
     from core.alloc import Arena
@@ -56,6 +56,17 @@ class _Reader(object):
         self.line_num += 1
         return src_line, 0
 
+    def SkipLines(self, n):
+        # type: (int) -> None
+        """Read n lines without adding them to the arena.
+
+        For core/parse_cache.py, when it stops replaying cached nodes.
+        """
+        for _ in xrange(n):
+            if self._GetLine() is None:
+                break
+            self.line_num += 1
+
     def Reset(self):
         # type: () -> None
         """Called after command execution in main_loop.py."""
@@ -96,6 +107,23 @@ class FileLineReader(_Reader):
         self.f = f
         self.last_line_hint = False
 
+        # line -> the first copy of it we read
+        self.shared_lines = None  # type: Optional[Dict[str, str]]
+
+    def ShareLines(self):
+        # type: () -> None
+        """Keep one copy of lines that occur many times, like 'fi' and 'done'.
+
+        For files whose functions may live as long as the shell, like rc
+        files and 'source lib.sh'.  The tokens in the AST refer to the lines,
+        so many copies of the same line would otherwise stay alive.
+
+        The dict keeps every distinct line alive as long as the reader, even
+        the ones that DiscardLines() would free.  So it's not used for the
+        main script, whose reader lives until the shell exits.
+        """
+        self.shared_lines = {}
+
     def _GetLine(self):
         # type: () -> Optional[str]
         line = self.f.readline()
@@ -105,6 +133,13 @@ class FileLineReader(_Reader):
         if not line.endswith('\n'):
             self.last_line_hint = True
 
+        if self.shared_lines is not None:
+            first = self.shared_lines.get(line)
+            if first is None:
+                self.shared_lines[line] = line
+            else:
+                line = first
+
         return line
 
     def LastLineHint(self):
@@ -33,6 +33,28 @@ class ReaderTest(unittest.TestCase):
         self.assertEqual(None, src_line)
         self.assertEqual(0, offset)
 
+    def testShareLines(self):
+        arena = test_lib.MakeArena('<reader_test.py>')
+
+        f = cStringIO.StringIO('if x; then\n  fi\nif y; then\n  fi\n')
+        r = reader.FileLineReader(f, arena)
+        r.ShareLines()
+
+        lines = []
+        while True:
+            src_line, _ = r.GetLine()
+            if src_line is None:
+                break
+            lines.append(src_line)
+
+        self.assertEqual(4, len(lines))
+        self.assertEqual([1, 2, 3, 4], [li.line_num for li in lines])
+
+        # Same string, different SourceLine
+        self.assertIs(lines[1].content, lines[3].content)
+        self.assertIsNot(lines[1], lines[3])
+        self.assertEqual('if y; then\n', lines[2].content)
+
     def testLineReadersAreEquivalent(self):
         a1 = alloc.Arena()
         r1 = reader.StringLineReader('one\ntwo', a1)
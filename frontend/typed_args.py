@@ -634,6 +634,20 @@ class Reader(object):
         raise error.TypeErr(val, 'Named arg %r should be a Dict' % param_name,
                             self._BlameNamed(param_name))
 
+    def NamedFunc(self, param_name, default_):
+        # type: (str, value_t) -> value_t
+        """Returns a Func or BuiltinFunc."""
+        if param_name not in self.named_args:
+            return default_
+
+        val = self.named_args[param_name]
+        if val.tag() in (value_e.Func, value_e.BuiltinFunc):
+            mylib.dict_erase(self.named_args, param_name)
+            return val
+
+        raise error.TypeErr(val, 'Named arg %r should be a Func' % param_name,
+                            self._BlameNamed(param_name))
+
     def RestNamed(self):
         # type: () -> Dict[str, value_t]
         ret = self.named_args
@@ -36,7 +36,7 @@ inline bool keys_equal(int left, int right) {
 }
 
 inline bool items_equal(mops::BigInt left, mops::BigInt right) {
-  return left == right;
+  return mops::Equal(left, right);
 }
 
 inline bool keys_equal(mops::BigInt left, mops::BigInt right) {
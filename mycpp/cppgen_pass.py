@@ -1418,6 +1418,35 @@ class Impl(_Shared):
         self.write(' : ')
         self.accept(o.else_expr)
 
+    def _WriteBarrier(self,
+                      lval: Expression,
+                      current_method_name: Optional[str] = None) -> None:
+        """After self.x = y, tell a generational heap that an old object may
+        now point to a young one.  See WriteBarrier() in mycpp/gc_alloc.h.
+        """
+        if not isinstance(lval, MemberExpr):
+            return
+
+        lval_type = self._GetTypeOptional(lval)
+        if lval_type is not None and not CTypeIsManaged(GetCType(lval_type)):
+            return
+
+        obj = lval.expr
+        # The object is young while its constructor runs
+        if (isinstance(obj, NameExpr) and obj.name == 'self' and
+                current_method_name == '__init__'):
+            return
+
+        # Context managers are on the stack, and their members are roots
+        obj_type = self._GetTypeOptional(obj)
+        if (isinstance(obj_type, Instance) and
+                _IsContextManager(SplitPyName(obj_type.type.fullname))):
+            return
+
+        self.write_ind('WriteBarrier(')
+        self.accept(obj)
+        self.write(');\n')
+
     def _WriteTupleUnpacking(self,
                              temp_name: str,
                              lval_items: List[Expression],
@@ -1444,6 +1473,7 @@ class Impl(_Shared):
             # Tuples that are return values aren't pointers
             op = '.' if is_return else '->'
             self.write(' = %s%sat%d();\n', temp_name, op, i)  # RHS
+            self._WriteBarrier(lval_item)
 
     def _WriteTupleUnpackingInLoop(self, temp_name: str,
                                    lval_items: List[Expression],
@@ -1464,6 +1494,7 @@ class Impl(_Shared):
 
             op = '->'
             self.write(' = %s%sat%d();\n', temp_name, op, i)  # RHS
+            self._WriteBarrier(lval_item)
 
             # Note: it would be nice to eliminate these roots, just like
             # StackRoots _for() below
@@ -1754,6 +1785,7 @@ class Impl(_Shared):
                 self.write(' = ')
                 self._AssignNewDictImpl(lval)  # uses lval, not rval
                 self.write(';\n')
+                self._WriteBarrier(lval, current_method_name)
                 return
 
             if callee_name == 'cast':
@@ -1788,6 +1820,8 @@ class Impl(_Shared):
             self.write(' = ')
             self.accept(rval)
             self.write(';\n')
+            if not (isinstance(rval, NameExpr) and rval.name == 'None'):
+                self._WriteBarrier(lval, current_method_name)
             return
 
         if isinstance(lval, IndexExpr):  # a[x] = 1
@@ -2720,6 +2754,7 @@ class Impl(_Shared):
         self.write(' %s= ', o.op)  # + to +=
         self.accept(o.rvalue)
         self.write(';\n')
+        self._WriteBarrier(o.lvalue)  # self.s += 'x'
 
     def visit_while_stmt(self, o: 'mypy.nodes.WhileStmt') -> None:
         self.write_ind('while (')
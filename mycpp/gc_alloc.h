@@ -20,6 +20,17 @@ extern BumpLeakHeap gHeap;
 extern MarkSweepHeap gHeap;
 #endif
 
+// Called after storing a pointer in a field of obj, or in a Slab.  mycpp
+// generates these calls, except for stores to 'this' in constructors, because
+// an object is young until the next collection point.
+inline void WriteBarrier(void* obj) {
+#if GC_GENERATIONAL
+  gHeap.WriteBarrier(obj);
+#else
+  (void)obj;
+#endif
+}
+
 // mycpp generates code that keeps track of the root set
 class StackRoot {
  public:
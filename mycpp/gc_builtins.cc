@@ -3,7 +3,10 @@
 #include <math.h>   // INFINITY
 #include <stdio.h>  // required for readline/readline.h (man readline)
 
+#include <unordered_set>
+
 #include "_build/detected-cpp-config.h"
+#include "mycpp/gc_dict.h"
 #include "mycpp/gc_list.h"
 #include "mycpp/gc_str.h"
 
@@ -69,11 +72,50 @@ BigStr* str(double d) {
 //
 // Also for SmallStr, we don't care about interning.  Only for HeapStr.
 
+struct InternHash {
+  size_t operator()(BigStr* s) const {
+    return hash_key(s);
+  }
+};
+
+struct InternEqual {
+  bool operator()(BigStr* a, BigStr* b) const {
+    return str_equals(a, b);
+  }
+};
+
+// The parsers intern variable names.  The table is weak: the GC doesn't trace
+// it, and PruneInterned() removes the strings it's about to free.  So 'eval'
+// with many different names doesn't grow it without limit.
+static std::unordered_set<BigStr*, InternHash, InternEqual> gInterned;
+
 BigStr* intern(BigStr* s) {
-  // TODO: put in table gHeap.interned_
+  // This computes the hash of s, which is cached in the string, so later
+  // dict lookups with the interned string don't rehash it.
+  auto it = gInterned.find(s);
+  if (it != gInterned.end()) {
+    return *it;
+  }
+  gInterned.insert(s);
   return s;
 }
 
+int NumInterned() {
+  return gInterned.size();
+}
+
+#ifdef MARK_SWEEP
+void PruneInterned() {
+  for (auto it = gInterned.begin(); it != gInterned.end();) {
+    if (gHeap.IsMarked(*it)) {
+      ++it;
+    } else {
+      it = gInterned.erase(it);
+    }
+  }
+}
+#endif
+
 // Print quoted string.  Called by StrFormat('%r').
 // TODO: consider using J8 notation instead, since error messages show that
 // string.
@@ -125,6 +125,12 @@ BigStr* str(double d);
 
 BigStr* intern(BigStr* s);
 
+// Called by the GC after tracing, and before sweeping
+void PruneInterned();
+
+// For tests
+int NumInterned();
+
 // Used by mark_sweep_heap and StrFormat
 bool StringToInt(const char* s, int len, int base, int* result);
 
@@ -373,15 +373,15 @@ TEST container_test() {
   // Failed before we had keys_equal() for mops::BigInt
   auto* d = Alloc<Dict<mops::BigInt, BigStr*>>();
   for (int i = 0; i < 64; ++i) {
-    mops::BigInt p2 = mops::BigInt{1} << i;
+    mops::BigInt p2 = mops::LShift(mops::ONE, mops::IntWiden(i));
     d->set(p2, kEmptyString);
   }
   ASSERT_EQ_FMT(64, len(d), "%d");
 
   // Failed before we had items_equal() for mops::BigInt
   auto* lb = Alloc<List<mops::BigInt>>();
-  lb->append(mops::BigInt{1} << 32);
-  lb->append(mops::BigInt{1} << 33);
+  lb->append(mops::LShift(mops::ONE, mops::BigInt{32}));
+  lb->append(mops::LShift(mops::ONE, mops::BigInt{33}));
   ASSERT(!list_contains(lb, mops::BigInt{0}));
 
   PASS();
@@ -457,6 +457,37 @@ TEST intern_test() {
 
   ASSERT(str_equals(s, t));
 
+  // An equal string that was allocated separately maps to the first one
+  BigStr* u = intern(StrFromC("foo"));
+  ASSERT_EQ(t, u);
+
+  BigStr* v = intern(StrFromC("bar"));
+  ASSERT(t != v);
+
+  PASS();
+}
+
+TEST intern_collection_test() {
+  gHeap.Collect();  // strings from other tests
+
+  BigStr* kept = nullptr;
+  StackRoot _r(&kept);
+
+  kept = intern(StrFromC("kept"));
+  intern(StrFromC("garbage"));
+  int n = NumInterned();
+
+  gHeap.Collect();
+
+  // The table no longer refers to the freed string
+  ASSERT_EQ_FMT(n - 1, NumInterned(), "%d");
+
+  // The live string is still the interned one
+  ASSERT_EQ(kept, intern(StrFromC("kept")));
+
+  BigStr* s = StrFromC("garbage");
+  ASSERT_EQ(s, intern(s));
+
   PASS();
 }
 
@@ -498,6 +529,7 @@ int main(int argc, char** argv) {
 
   RUN_TEST(hash_str_test);
   RUN_TEST(intern_test);
+  RUN_TEST(intern_collection_test);
 
   RUN_TEST(max_test);
 
@@ -697,7 +697,9 @@ TEST hash_pileup_bug() {
     mops::BigInt index{1 << i};
     // log("index %ld", index);
 
-    for (mops::BigInt j = index; j < index + 2000; ++j) {
+    mops::BigInt end = mops::Add(index, mops::BigInt{2000});
+    for (mops::BigInt j = index; mops::Greater(end, j);
+         j = mops::Add(j, mops::ONE)) {
       d->set(j, kEmptyString);
       unsigned h = hash_key(j);
       hist[h] = true;
@@ -72,6 +72,7 @@ class SignalSafe {
     // Make sure we have a distinct list to reuse.
     DCHECK(empty_list_ != pending_signals_);
     pending_signals_ = empty_list_;
+    WriteBarrier(this);
 
     return ret;
   }
@@ -83,6 +84,7 @@ class SignalSafe {
     DCHECK(empty_list->capacity_ == kMaxPendingSignals);
 
     empty_list_ = empty_list;
+    WriteBarrier(this);
   }
 
   // Main thread wants to get the last signal received.
@@ -68,29 +68,62 @@ TEST signal_test() {
 }
 
 TEST signal_safe_test() {
-  iolib::SignalSafe signal_safe;
+  iolib::SignalSafe* signal_safe = nullptr;
+  StackRoot _r(&signal_safe);
+  signal_safe = Alloc<iolib::SignalSafe>();
 
-  List<int>* received = signal_safe.TakePendingSignals();
+  List<int>* received = signal_safe->TakePendingSignals();
 
   // We got now signals
   ASSERT_EQ_FMT(0, len(received), "%d");
 
   // The existing queue is of length 0
-  ASSERT_EQ_FMT(0, len(signal_safe.pending_signals_), "%d");
+  ASSERT_EQ_FMT(0, len(signal_safe->pending_signals_), "%d");
 
   // Capacity is a ROUND NUMBER from the allocator's POV
   // There's no convenient way to test the obj_len we pass to gHeap.Allocate,
   // but it should be (1022 + 2) * 4.
-  ASSERT_EQ_FMT(1022, signal_safe.pending_signals_->capacity_, "%d");
+  ASSERT_EQ_FMT(1022, signal_safe->pending_signals_->capacity_, "%d");
 
   // Register too many signals
   for (int i = 0; i < iolib::kMaxPendingSignals + 10; ++i) {
-    signal_safe.UpdateFromSignalHandler(SIGINT);
+    signal_safe->UpdateFromSignalHandler(SIGINT);
   }
 
   PASS();
 }
 
+#if GC_GENERATIONAL
+TEST signal_safe_write_barrier_test() {
+  iolib::SignalSafe* signal_safe = nullptr;
+  StackRoot _r(&signal_safe);
+  signal_safe = Alloc<iolib::SignalSafe>();
+
+  gHeap.gc_verify_ = true;
+  gHeap.Collect();  // promote signal_safe and its lists
+
+  List<int>* q = signal_safe->TakePendingSignals();
+  ASSERT_EQ(0, len(q));
+  gHeap.CollectYoung();
+
+  // The main thread returns a young list to the old SignalSafe
+  List<int>* empty = NewList<int>();
+  empty->reserve(iolib::kMaxPendingSignals);
+  signal_safe->ReuseEmptyList(empty);
+
+  gHeap.CollectYoung();  // verifies that the young list was marked
+
+  ASSERT_EQ(empty, signal_safe->empty_list_);
+  signal_safe->TakePendingSignals();
+  ASSERT_EQ(empty, signal_safe->pending_signals_);
+  ASSERT_EQ_FMT(iolib::kMaxPendingSignals, empty->capacity_, "%d");
+
+  gHeap.gc_verify_ = false;
+
+  PASS();
+}
+#endif
+
 GREATEST_MAIN_DEFS();
 
 int main(int argc, char** argv) {
@@ -100,6 +133,9 @@ int main(int argc, char** argv) {
 
   RUN_TEST(signal_test);
   RUN_TEST(signal_safe_test);
+#if GC_GENERATIONAL
+  RUN_TEST(signal_safe_write_barrier_test);
+#endif
 
   gHeap.CleanProcessExit();
 
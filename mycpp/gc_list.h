@@ -221,6 +221,9 @@ template <typename T>
 void List<T>::append(T item) {
   reserve(len_ + 1);
   slab_->items_[len_] = item;
+  if (std::is_pointer<T>()) {  // not List<int>, which signal handlers use
+    WriteBarrier(slab_);
+  }
   ++len_;
 }
 
@@ -301,6 +304,7 @@ void List<T>::reserve(int num_desired) {
     memcpy(new_slab->items_, slab_->items_, len_ * sizeof(T));
   }
   slab_ = new_slab;
+  WriteBarrier(this);
 }
 
 // Implements L[i] = item
@@ -315,6 +319,9 @@ void List<T>::set(int i, T item) {
   }
 
   slab_->items_[i] = item;
+  if (std::is_pointer<T>()) {
+    WriteBarrier(slab_);
+  }
 }
 
 // Implements L[i]
@@ -422,6 +429,9 @@ void List<T>::extend(List<T>* other) {
   for (int i = 0; i < n; ++i) {
     slab_->items_[len_ + i] = other->slab_->items_[i];
   }
+  if (std::is_pointer<T>() && n) {
+    WriteBarrier(slab_);
+  }
   len_ = new_len;
 }
 
@@ -437,7 +447,7 @@ inline void List<BigStr*>::sort() {
 }
 
 inline bool CompareBigInt(mops::BigInt a, mops::BigInt b) {
-  return a < b;
+  return mops::Greater(b, a);
 }
 
 template <>
@@ -5,9 +5,33 @@
 #include <math.h>      // isnan(), isinf()
 #include <stdio.h>
 
+#ifdef BIGINT
+  #include <stdlib.h>  // malloc()
+  #include <string.h>  // memcpy()
+
+  #include <algorithm>  // std::max(), std::sort(), std::lower_bound()
+  #include <string>
+  #include <vector>
+#endif
+
 #include "mycpp/gc_alloc.h"
 #include "mycpp/gc_builtins.h"  // StringToInt64
 #include "mycpp/gc_str.h"
+#include "mycpp/hash.h"  // fnv1()
+
+#ifdef BIGINT
+
+// Sign and magnitude.  The digits are never mutated after it's created.
+struct mops::BigNat {
+  BigNat* next;  // see gBigNats
+  bool negative;
+  bool marked;         // found by MarkBigNatWords()
+  bool pinned;         // never freed
+  int len;             // number of digits; the most significant isn't 0
+  uint32_t digits[1];  // least significant first
+};
+
+#endif
 
 namespace mops {
 
@@ -18,31 +42,630 @@ const BigInt MINUS_TWO = BigInt{-2};  // for printf
 
 static const int kInt64BufSize = 32;  // more than twice as big as kIntBufSize
 
+#ifdef BIGINT
+
+// BigInt values aren't traced by the GC, so their digits can't live in the GC
+// heap.  They're malloc()'d and kept on this list until SweepBigNats() finds
+// that nothing refers to them.  The common case never gets here, because
+// results that fit in int64_t aren't boxed.
+static BigNat* gBigNats = nullptr;
+static int gNumBigNats = 0;
+
+// Only scan the heap for BigInt values when this many digit buffers exist
+static const int kMinSweepThreshold = 1000;
+static int gSweepThreshold = kMinSweepThreshold;
+
+// Sorted addresses of gBigNats, from BeginBigNatMark() to SweepBigNats()
+static std::vector<uintptr_t> gBigNatIndex;
+
+bool BeginBigNatMark() {
+  if (gNumBigNats < gSweepThreshold) {
+    return false;
+  }
+  gBigNatIndex.clear();
+  for (BigNat* big = gBigNats; big; big = big->next) {
+    gBigNatIndex.push_back(reinterpret_cast<uintptr_t>(big));
+  }
+  std::sort(gBigNatIndex.begin(), gBigNatIndex.end());
+  return true;
+}
+
+// Conservative: this reads stack frames and unused parts of objects, and any
+// word with the right bits counts.
+__attribute__((no_sanitize_address)) void MarkBigNatWords(const void* begin,
+                                                          const void* end) {
+  DCHECK(!gBigNatIndex.empty());
+  uintptr_t lo = gBigNatIndex.front();
+  uintptr_t hi = gBigNatIndex.back();
+
+  // BigInt values are 8-byte aligned in objects and stack frames
+  uintptr_t p = (reinterpret_cast<uintptr_t>(begin) + 7) & ~uintptr_t{7};
+  uintptr_t stop = reinterpret_cast<uintptr_t>(end);
+  for (; p + sizeof(uint64_t) <= stop; p += sizeof(uint64_t)) {
+    uint64_t word = *reinterpret_cast<const uint64_t*>(p);
+    if ((word & 1) == 0) {
+      continue;  // small BigInt, or not a BigInt
+    }
+    uintptr_t addr = static_cast<uintptr_t>(word - 1);
+    if (addr < lo || addr > hi) {
+      continue;
+    }
+    auto it = std::lower_bound(gBigNatIndex.begin(), gBigNatIndex.end(), addr);
+    if (it != gBigNatIndex.end() && *it == addr) {
+      reinterpret_cast<BigNat*>(addr)->marked = true;
+    }
+  }
+}
+
+void SweepBigNats() {
+  BigNat** link = &gBigNats;
+  while (*link) {
+    BigNat* big = *link;
+    if (big->marked || big->pinned) {
+      big->marked = false;
+      link = &big->next;
+    } else {
+      *link = big->next;
+      free(big);
+      gNumBigNats--;
+    }
+  }
+  gBigNatIndex.clear();
+
+  gSweepThreshold = std::max(kMinSweepThreshold, gNumBigNats * 2);
+}
+
+void PinBigNats() {
+  for (BigNat* big = gBigNats; big; big = big->next) {
+    big->pinned = true;
+  }
+}
+
+int NumBigNats() {
+  return gNumBigNats;
+}
+
+typedef std::vector<uint32_t> Digits;
+
+// A value being computed on.  The magnitude has no leading zeros, so 0 is
+// empty.
+struct Num {
+  bool negative;
+  Digits mag;
+};
+
+static void Trim(Digits* d) {
+  while (!d->empty() && d->back() == 0) {
+    d->pop_back();
+  }
+}
+
+static Num Int64ToNum(int64_t i) {
+  Num n;
+  n.negative = i < 0;
+  uint64_t u = static_cast<uint64_t>(i);
+  if (n.negative) {
+    u = 0 - u;  // works for INT64_MIN too
+  }
+  n.mag.push_back(static_cast<uint32_t>(u));
+  n.mag.push_back(static_cast<uint32_t>(u >> 32));
+  Trim(&n.mag);
+  return n;
+}
+
+static Num ToNum(BigInt b) {
+  if (b.IsSmall()) {
+    return Int64ToNum(b.Small());
+  }
+  const BigNat* big = b.Big();
+  Num n;
+  n.negative = big->negative;
+  n.mag.assign(big->digits, big->digits + big->len);
+  return n;
+}
+
+static uint64_t AllocBigNat(const Num& n) {
+  int len = n.mag.size();
+  BigNat* big = static_cast<BigNat*>(
+      malloc(offsetof(BigNat, digits) + len * sizeof(uint32_t)));
+  big->next = gBigNats;
+  big->negative = n.negative;
+  big->marked = false;
+  big->pinned = false;
+  big->len = len;
+  memcpy(big->digits, n.mag.data(), len * sizeof(uint32_t));
+  gBigNats = big;
+  gNumBigNats++;
+
+  return reinterpret_cast<uintptr_t>(big) | 1;  // tagged
+}
+
+// Unboxes the result if it fits, maintaining the invariant in gc_mops.h
+static BigInt FromNum(Num* n) {
+  Trim(&n->mag);
+  int len = n->mag.size();
+
+  if (len <= 2) {
+    uint64_t u = 0;
+    for (int i = len - 1; i >= 0; --i) {
+      u = (u << 32) | n->mag[i];
+    }
+    if (!n->negative && u <= static_cast<uint64_t>(kMaxSmall)) {
+      return BigInt(static_cast<int64_t>(u));
+    }
+    if (n->negative && u <= static_cast<uint64_t>(kMaxSmall) + 1) {
+      return BigInt(-static_cast<int64_t>(u));
+    }
+  }
+  return BigInt::FromBits(AllocBigNat(*n));
+}
+
+uint64_t BigInt::Box(int64_t i) {
+  return AllocBigNat(Int64ToNum(i));
+}
+
+static int CompareMag(const Digits& a, const Digits& b) {
+  if (a.size() != b.size()) {
+    return a.size() < b.size() ? -1 : 1;
+  }
+  for (int i = a.size() - 1; i >= 0; --i) {
+    if (a[i] != b[i]) {
+      return a[i] < b[i] ? -1 : 1;
+    }
+  }
+  return 0;
+}
+
+static int CompareNum(const Num& a, const Num& b) {
+  if (a.negative != b.negative) {
+    return a.negative ? -1 : 1;  // 0 is never negative
+  }
+  int c = CompareMag(a.mag, b.mag);
+  return a.negative ? -c : c;
+}
+
+static Digits AddMag(const Digits& a, const Digits& b) {
+  const Digits& longer = a.size() >= b.size() ? a : b;
+  const Digits& shorter = a.size() >= b.size() ? b : a;
+
+  Digits result;
+  uint64_t carry = 0;
+  for (size_t i = 0; i < longer.size(); ++i) {
+    uint64_t sum = carry + longer[i];
+    if (i < shorter.size()) {
+      sum += shorter[i];
+    }
+    result.push_back(static_cast<uint32_t>(sum));
+    carry = sum >> 32;
+  }
+  if (carry) {
+    result.push_back(static_cast<uint32_t>(carry));
+  }
+  return result;
+}
+
+// Requires a >= b
+static Digits SubMag(const Digits& a, const Digits& b) {
+  Digits result;
+  int64_t borrow = 0;
+  for (size_t i = 0; i < a.size(); ++i) {
+    int64_t diff = static_cast<int64_t>(a[i]) - borrow;
+    if (i < b.size()) {
+      diff -= b[i];
+    }
+    borrow = diff < 0;
+    if (borrow) {
+      diff += INT64_C(1) << 32;
+    }
+    result.push_back(static_cast<uint32_t>(diff));
+  }
+  Trim(&result);
+  return result;
+}
+
+static Digits MulMag(const Digits& a, const Digits& b) {
+  Digits result(a.size() + b.size(), 0);
+  for (size_t i = 0; i < a.size(); ++i) {
+    uint64_t carry = 0;
+    for (size_t j = 0; j < b.size(); ++j) {
+      uint64_t t = static_cast<uint64_t>(a[i]) * b[j] + result[i + j] + carry;
+      result[i + j] = static_cast<uint32_t>(t);
+      carry = t >> 32;
+    }
+    result[i + b.size()] = static_cast<uint32_t>(carry);
+  }
+  Trim(&result);
+  return result;
+}
+
+// Sets *q = a / d, and returns a % d
+static uint32_t DivModDigit(const Digits& a, uint32_t d, Digits* q) {
+  q->assign(a.size(), 0);
+  uint64_t rem = 0;
+  for (int i = a.size() - 1; i >= 0; --i) {
+    uint64_t cur = (rem << 32) | a[i];
+    (*q)[i] = static_cast<uint32_t>(cur / d);
+    rem = cur % d;
+  }
+  Trim(q);
+  return static_cast<uint32_t>(rem);
+}
+
+// Binary long division.  It's quadratic, but numbers this big are rare.
+static void DivModMag(const Digits& a, const Digits& b, Digits* q, Digits* r) {
+  DCHECK(!b.empty());
+  if (b.size() == 1) {
+    uint32_t rem = DivModDigit(a, b[0], q);
+    r->assign(1, rem);
+    Trim(r);
+    return;
+  }
+
+  q->assign(a.size(), 0);
+  r->clear();
+  for (int i = a.size() * 32 - 1; i >= 0; --i) {
+    // r = (r << 1) | bit i of a
+    uint32_t carry = (a[i / 32] >> (i % 32)) & 1;
+    for (size_t j = 0; j < r->size(); ++j) {
+      uint32_t top = (*r)[j] >> 31;
+      (*r)[j] = ((*r)[j] << 1) | carry;
+      carry = top;
+    }
+    if (carry) {
+      r->push_back(carry);
+    }
+
+    if (CompareMag(*r, b) >= 0) {
+      *r = SubMag(*r, b);
+      (*q)[i / 32] |= uint32_t{1} << (i % 32);
+    }
+  }
+  Trim(q);
+}
+
+static Digits ShiftLeftMag(const Digits& a, int64_t n) {
+  if (a.empty()) {
+    return a;
+  }
+  int words = n / 32;
+  int bits = n % 32;
+
+  Digits result(words, 0);
+  uint32_t carry = 0;
+  for (size_t i = 0; i < a.size(); ++i) {
+    result.push_back((a[i] << bits) | carry);
+    carry = bits ? a[i] >> (32 - bits) : 0;
+  }
+  if (carry) {
+    result.push_back(carry);
+  }
+  return result;
+}
+
+static Digits ShiftRightMag(const Digits& a, int64_t n) {
+  if (n / 32 >= static_cast<int64_t>(a.size())) {
+    return Digits();
+  }
+  int words = n / 32;
+  int bits = n % 32;
+
+  Digits result;
+  for (size_t i = words; i < a.size(); ++i) {
+    uint32_t hi = i + 1 < a.size() ? a[i + 1] : 0;
+    result.push_back(bits ? (a[i] >> bits) | (hi << (32 - bits)) : a[i]);
+  }
+  Trim(&result);
+  return result;
+}
+
+static Num AddNum(const Num& a, const Num& b) {
+  Num result;
+  if (a.negative == b.negative) {
+    result.negative = a.negative;
+    result.mag = AddMag(a.mag, b.mag);
+  } else if (CompareMag(a.mag, b.mag) >= 0) {
+    result.negative = a.negative;
+    result.mag = SubMag(a.mag, b.mag);
+  } else {
+    result.negative = b.negative;
+    result.mag = SubMag(b.mag, a.mag);
+  }
+  return result;
+}
+
+// Two's complement digits, sign extended to len
+static Digits ToTwos(const Num& n, int len) {
+  Digits d(n.mag);
+  d.resize(len, 0);
+  if (n.negative) {
+    uint64_t carry = 1;
+    for (int i = 0; i < len; ++i) {
+      uint64_t t = static_cast<uint64_t>(~d[i]) + carry;
+      d[i] = static_cast<uint32_t>(t);
+      carry = t >> 32;
+    }
+  }
+  return d;
+}
+
+static Num FromTwos(const Digits& d) {
+  Num n;
+  n.negative = d.back() >> 31;
+  n.mag = ToTwos(Num{n.negative, d}, d.size());  // negating is symmetric
+  Trim(&n.mag);
+  return n;
+}
+
+enum class BitOp { And, Or, Xor };
+
+static BigInt DoBitOp(BigInt a, BigInt b, BitOp op) {
+  Num x = ToNum(a);
+  Num y = ToNum(b);
+  // One more digit for the sign bit
+  int len = std::max(x.mag.size(), y.mag.size()) + 1;
+
+  Digits dx = ToTwos(x, len);
+  Digits dy = ToTwos(y, len);
+  for (int i = 0; i < len; ++i) {
+    switch (op) {
+    case BitOp::And:
+      dx[i] &= dy[i];
+      break;
+    case BitOp::Or:
+      dx[i] |= dy[i];
+      break;
+    case BitOp::Xor:
+      dx[i] ^= dy[i];
+      break;
+    }
+  }
+  Num result = FromTwos(dx);
+  return FromNum(&result);
+}
+
+int SlowTruncate(BigInt b) {
+  return static_cast<int>(SlowToC(b));
+}
+
+int64_t SlowToC(BigInt b) {
+  // Low 64 bits of the two's complement representation
+  const BigNat* big = b.Big();
+  uint64_t u = big->digits[0];
+  if (big->len > 1) {
+    u |= static_cast<uint64_t>(big->digits[1]) << 32;
+  }
+  if (big->negative) {
+    u = 0 - u;
+  }
+  return static_cast<int64_t>(u);
+}
+
+double SlowToFloat(BigInt b) {
+  const BigNat* big = b.Big();
+  double f = 0.0;
+  for (int i = big->len - 1; i >= 0; --i) {
+    f = f * 4294967296.0 + big->digits[i];
+  }
+  return big->negative ? -f : f;
+}
+
+BigInt SlowNegate(BigInt b) {
+  Num n = ToNum(b);
+  n.negative = !n.negative && !n.mag.empty();
+  return FromNum(&n);
+}
+
+BigInt SlowAdd(BigInt a, BigInt b) {
+  Num result = AddNum(ToNum(a), ToNum(b));
+  return FromNum(&result);
+}
+
+BigInt SlowSub(BigInt a, BigInt b) {
+  Num y = ToNum(b);
+  y.negative = !y.negative && !y.mag.empty();
+  Num result = AddNum(ToNum(a), y);
+  return FromNum(&result);
+}
+
+BigInt SlowMul(BigInt a, BigInt b) {
+  Num x = ToNum(a);
+  Num y = ToNum(b);
+  Num result;
+  result.negative = x.negative != y.negative;
+  result.mag = MulMag(x.mag, y.mag);
+  return FromNum(&result);
+}
+
+// Like C and mops.py, the quotient is rounded toward zero ...
+BigInt SlowDiv(BigInt a, BigInt b) {
+  Num x = ToNum(a);
+  Num y = ToNum(b);
+  Num result;
+  Digits rem;
+  result.negative = x.negative != y.negative;
+  DivModMag(x.mag, y.mag, &result.mag, &rem);
+  return FromNum(&result);
+}
+
+// ... and the remainder has the sign of the dividend
+BigInt SlowRem(BigInt a, BigInt b) {
+  Num x = ToNum(a);
+  Num y = ToNum(b);
+  Num result;
+  Digits quotient;
+  result.negative = x.negative;
+  DivModMag(x.mag, y.mag, &quotient, &result.mag);
+  return FromNum(&result);
+}
+
+bool SlowEqual(BigInt a, BigInt b) {
+  return CompareNum(ToNum(a), ToNum(b)) == 0;
+}
+
+bool SlowGreater(BigInt a, BigInt b) {
+  return CompareNum(ToNum(a), ToNum(b)) > 0;
+}
+
+BigInt SlowLShift(BigInt a, BigInt b) {
+  Num result = ToNum(a);
+  result.mag = ShiftLeftMag(result.mag, ToC(b));
+  return FromNum(&result);
+}
+
+BigInt SlowRShift(BigInt a, BigInt b) {
+  Num n = ToNum(a);
+  if (!b.IsSmall()) {
+    return BigInt(n.negative ? -1 : 0);  // all bits shifted out
+  }
+  if (n.negative) {
+    // Round toward negative infinity, like int64_t: -((|a| - 1) >> b) - 1
+    Digits one(1, 1);
+    n.mag = AddMag(ShiftRightMag(SubMag(n.mag, one), b.Small()), one);
+  } else {
+    n.mag = ShiftRightMag(n.mag, b.Small());
+  }
+  return FromNum(&n);
+}
+
+BigInt SlowBitAnd(BigInt a, BigInt b) {
+  return DoBitOp(a, b, BitOp::And);
+}
+
+BigInt SlowBitOr(BigInt a, BigInt b) {
+  return DoBitOp(a, b, BitOp::Or);
+}
+
+BigInt SlowBitXor(BigInt a, BigInt b) {
+  return DoBitOp(a, b, BitOp::Xor);
+}
+
+unsigned Hash(BigInt b) {
+  if (b.IsSmall()) {
+    int64_t i = b.Small();
+    return fnv1(reinterpret_cast<const char*>(&i), sizeof(i));
+  }
+  const BigNat* big = b.Big();
+  return fnv1(reinterpret_cast<const char*>(big->digits),
+              big->len * sizeof(uint32_t)) ^
+         big->negative;
+}
+
+// Values in int64_t range are formatted the same way as the default build,
+// e.g. ToHexLower(-1) is ffffffffffffffff.
+static bool FitsInt64(BigInt b, int64_t* result) {
+  if (b.IsSmall()) {
+    *result = b.Small();
+    return true;
+  }
+  const BigNat* big = b.Big();
+  if (big->len > 2) {
+    return false;
+  }
+  uint64_t u = SlowToC(b);  // low 64 bits
+  if (big->negative) {
+    u = 0 - u;  // magnitude
+    if (u > static_cast<uint64_t>(INT64_MAX) + 1) {
+      return false;
+    }
+  } else if (u > static_cast<uint64_t>(INT64_MAX)) {
+    return false;
+  }
+  *result = SlowToC(b);
+  return true;
+}
+
+// Formats a value outside int64_t range, with a - sign rather than in two's
+// complement
+static BigStr* BigToBase(BigInt b, int base, bool upper) {
+  const char* chars = upper ? "0123456789ABCDEF" : "0123456789abcdef";
+
+  // Divide by the largest power of the base that fits in a digit
+  uint32_t chunk = base;
+  int chunk_width = 1;
+  while (static_cast<uint64_t>(chunk) * base <= UINT32_MAX) {
+    chunk *= base;
+    chunk_width++;
+  }
+
+  Num n = ToNum(b);
+  std::string rev;  // reversed
+  Digits q;
+  while (!n.mag.empty()) {
+    uint32_t rem = DivModDigit(n.mag, chunk, &q);
+    n.mag.swap(q);
+    for (int i = 0; i < chunk_width; ++i) {
+      rev.push_back(chars[rem % base]);
+      rem /= base;
+      if (n.mag.empty() && rem == 0) {
+        break;  // no leading zeros
+      }
+    }
+  }
+  if (n.negative) {
+    rev.push_back('-');
+  }
+  return ::StrFromC(std::string(rev.rbegin(), rev.rend()).c_str(), rev.size());
+}
+
+#endif  // BIGINT
+
 // Note: Could also use OverAllocatedStr, but most strings are small?
 
 // Similar to str(int i) in gc_builtins.cc
 
 BigStr* ToStr(BigInt b) {
+#ifdef BIGINT
+  int64_t i;
+  if (!FitsInt64(b, &i)) {
+    return BigToBase(b, 10, false);
+  }
+#else
+  int64_t i = b;
+#endif
   char buf[kInt64BufSize];
-  int len = snprintf(buf, kInt64BufSize, "%" PRId64, b);
+  int len = snprintf(buf, kInt64BufSize, "%" PRId64, i);
   return ::StrFromC(buf, len);
 }
 
 BigStr* ToOctal(BigInt b) {
+#ifdef BIGINT
+  int64_t i;
+  if (!FitsInt64(b, &i)) {
+    return BigToBase(b, 8, false);
+  }
+#else
+  int64_t i = b;
+#endif
   char buf[kInt64BufSize];
-  int len = snprintf(buf, kInt64BufSize, "%" PRIo64, b);
+  int len = snprintf(buf, kInt64BufSize, "%" PRIo64, i);
   return ::StrFromC(buf, len);
 }
 
 BigStr* ToHexUpper(BigInt b) {
+#ifdef BIGINT
+  int64_t i;
+  if (!FitsInt64(b, &i)) {
+    return BigToBase(b, 16, true);
+  }
+#else
+  int64_t i = b;
+#endif
   char buf[kInt64BufSize];
-  int len = snprintf(buf, kInt64BufSize, "%" PRIX64, b);
+  int len = snprintf(buf, kInt64BufSize, "%" PRIX64, i);
   return ::StrFromC(buf, len);
 }
 
 BigStr* ToHexLower(BigInt b) {
+#ifdef BIGINT
+  int64_t i;
+  if (!FitsInt64(b, &i)) {
+    return BigToBase(b, 16, false);
+  }
+#else
+  int64_t i = b;
+#endif
   char buf[kInt64BufSize];
-  int len = snprintf(buf, kInt64BufSize, "%" PRIx64, b);
+  int len = snprintf(buf, kInt64BufSize, "%" PRIx64, i);
   return ::StrFromC(buf, len);
 }
 
@@ -70,10 +693,23 @@ Tuple2<bool, BigInt> FromFloat(double f) {
     return Tuple2<bool, BigInt>(false, MINUS_ONE);
   }
 #ifdef BIGINT
-  // Testing that _bin/cxx-opt+bigint/ysh is actually different!
-  log("*** BIGINT active ***");
-#endif
+  // Doubles this big are integers, so no digits are lost
+  if (fabs(f) >= 9223372036854775808.0) {  // 2^63
+    int exp;
+    double mantissa = frexp(fabs(f), &exp);  // f = mantissa * 2^exp
+
+    Num n;
+    n.negative = f < 0;
+    uint64_t m = static_cast<uint64_t>(ldexp(mantissa, 53));
+    n.mag.push_back(static_cast<uint32_t>(m));
+    n.mag.push_back(static_cast<uint32_t>(m >> 32));
+    n.mag = ShiftLeftMag(n.mag, exp - 53);
+    return Tuple2<bool, BigInt>(true, FromNum(&n));
+  }
+  return Tuple2<bool, BigInt>(true, BigInt(static_cast<int64_t>(f)));
+#else
   return Tuple2<bool, BigInt>(true, static_cast<BigInt>(f));
+#endif
 }
 
 }  // namespace mops
@@ -13,11 +13,71 @@ class BigStr;
 namespace mops {
 
 // BigInt library
-// TODO: Make it arbitrary size.  Right now it's int64_t, which is distinct
-// from int.
+//
+// The default build uses int64_t, which is distinct from int.
+//
+// The +bigint variant (-D BIGINT) uses a tagged word instead, like a Smi in
+// JavaScript engines:
+//
+// - If the low bit is 0, the rest is a 63-bit integer, unboxed.
+// - If it's 1, the rest points to heap-allocated digits.
+//
+// Ops on small values check for overflow with GCC/Clang builtins, and only
+// call out of line when it happens, or when an operand is already big.  It's
+// still 8 bytes, so List<BigInt> and Dict<BigInt, V> work unchanged.
+
+#ifdef BIGINT
+
+struct BigNat;  // sign and magnitude, defined in gc_mops.cc
+
+// Range of unboxed values
+const int64_t kMaxSmall = (INT64_C(1) << 62) - 1;
+const int64_t kMinSmall = -(INT64_C(1) << 62);
+
+class BigInt {
+ public:
+  constexpr BigInt() : bits_(0) {
+  }
+  // Not explicit, so int64_t values convert like they do in the default build
+  constexpr BigInt(int64_t i)
+      : bits_(kMinSmall <= i && i <= kMaxSmall ? static_cast<uint64_t>(i) * 2
+                                               : Box(i)) {
+  }
+
+  static BigInt FromBits(uint64_t bits) {
+    BigInt b;
+    b.bits_ = bits;
+    return b;
+  }
+
+  bool IsSmall() const {
+    return (bits_ & 1) == 0;
+  }
+  int64_t Small() const {
+    return static_cast<int64_t>(bits_) >> 1;
+  }
+  const BigNat* Big() const {
+    return reinterpret_cast<const BigNat*>(static_cast<uintptr_t>(bits_ - 1));
+  }
+
+  // Invariant: a value is boxed iff it's outside [kMinSmall, kMaxSmall].  So
+  // two small values are equal iff their bits are equal.
+  //
+  // The digits are immutable, so BigInt can be copied freely.  mycpp doesn't
+  // trace BigInt values, so the digits are allocated outside the GC heap, and
+  // freed by a conservative scan.  See MarkBigNatWords().
+  uint64_t bits_;
+
+ private:
+  static uint64_t Box(int64_t i);
+};
+
+#else
 
 typedef int64_t BigInt;
 
+#endif
+
 // For convenience
 extern const BigInt ZERO;
 extern const BigInt ONE;
@@ -33,10 +93,6 @@ BigInt FromStr(BigStr* s, int base = 10);
 Tuple2<bool, BigInt> FromStr2(BigStr* s, int base = 10);
 Tuple2<bool, BigInt> FromFloat(double f);
 
-inline int BigTruncate(BigInt b) {
-  return static_cast<int>(b);
-}
-
 inline BigInt IntWiden(int b) {
   return static_cast<BigInt>(b);
 }
@@ -49,6 +105,204 @@ inline BigInt FromBool(bool b) {
   return b ? BigInt(1) : BigInt(0);
 }
 
+#ifdef BIGINT
+
+// Slow paths
+int SlowTruncate(BigInt b);
+int64_t SlowToC(BigInt b);
+double SlowToFloat(BigInt b);
+BigInt SlowNegate(BigInt b);
+BigInt SlowAdd(BigInt a, BigInt b);
+BigInt SlowSub(BigInt a, BigInt b);
+BigInt SlowMul(BigInt a, BigInt b);
+BigInt SlowDiv(BigInt a, BigInt b);
+BigInt SlowRem(BigInt a, BigInt b);
+bool SlowEqual(BigInt a, BigInt b);
+bool SlowGreater(BigInt a, BigInt b);
+BigInt SlowLShift(BigInt a, BigInt b);
+BigInt SlowRShift(BigInt a, BigInt b);
+BigInt SlowBitAnd(BigInt a, BigInt b);
+BigInt SlowBitOr(BigInt a, BigInt b);
+BigInt SlowBitXor(BigInt a, BigInt b);
+
+// For hash_key()
+unsigned Hash(BigInt b);
+
+// For MarkSweepHeap::Collect().  BigInt values aren't traced, so after marking,
+// the heap passes the memory of live objects and the stack to
+// MarkBigNatWords().  Any word that looks like a tagged pointer to digits
+// keeps them alive, and SweepBigNats() frees the rest.
+bool BeginBigNatMark();  // false if few were allocated since the last sweep
+void MarkBigNatWords(const void* begin, const void* end);
+void SweepBigNats();
+void PinBigNats();  // never free the ones that exist now, e.g. in globals
+int NumBigNats();   // for tests
+
+inline bool BothSmall(BigInt a, BigInt b) {
+  return ((a.bits_ | b.bits_) & 1) == 0;
+}
+
+// Truncates to the low bits, like static_cast<> does on int64_t
+inline int BigTruncate(BigInt b) {
+  return b.IsSmall() ? static_cast<int>(b.Small()) : SlowTruncate(b);
+}
+
+// For hand-written C++, e.g. SetRLimit()
+inline int64_t ToC(BigInt b) {
+  return b.IsSmall() ? b.Small() : SlowToC(b);
+}
+
+inline double ToFloat(BigInt b) {
+  return b.IsSmall() ? static_cast<double>(b.Small()) : SlowToFloat(b);
+}
+
+// Small values are stored doubled, so + - and bitwise ops work on the bits
+// directly, and the overflow check is for the 63-bit range.
+
+inline BigInt Negate(BigInt b) {
+  // -kMinSmall is boxed by the constructor
+  return b.IsSmall() ? BigInt(-b.Small()) : SlowNegate(b);
+}
+
+inline BigInt Add(BigInt a, BigInt b) {
+  int64_t result;
+  if (BothSmall(a, b) &&
+      !__builtin_add_overflow(static_cast<int64_t>(a.bits_),
+                              static_cast<int64_t>(b.bits_), &result)) {
+    return BigInt::FromBits(result);
+  }
+  return SlowAdd(a, b);
+}
+
+inline BigInt Sub(BigInt a, BigInt b) {
+  int64_t result;
+  if (BothSmall(a, b) &&
+      !__builtin_sub_overflow(static_cast<int64_t>(a.bits_),
+                              static_cast<int64_t>(b.bits_), &result)) {
+    return BigInt::FromBits(result);
+  }
+  return SlowSub(a, b);
+}
+
+inline BigInt Mul(BigInt a, BigInt b) {
+  int64_t result;
+  // a * 2b == 2ab
+  if (BothSmall(a, b) &&
+      !__builtin_mul_overflow(a.Small(), static_cast<int64_t>(b.bits_),
+                              &result)) {
+    return BigInt::FromBits(result);
+  }
+  return SlowMul(a, b);
+}
+
+inline BigInt Div(BigInt a, BigInt b) {
+  // Same check as in mops.py
+  DCHECK(b.bits_ != 0);  // divisor can't be zero
+
+  // Only kMinSmall / -1 leaves the small range, and the constructor boxes it
+  return BothSmall(a, b) ? BigInt(a.Small() / b.Small()) : SlowDiv(a, b);
+}
+
+inline BigInt Rem(BigInt a, BigInt b) {
+  // Same check as in mops.py
+  DCHECK(b.bits_ != 0);  // divisor can't be zero
+
+  // |a % b| <= |a|, so it's always small
+  return BothSmall(a, b) ? BigInt::FromBits((a.Small() % b.Small()) * 2)
+                         : SlowRem(a, b);
+}
+
+inline bool Equal(BigInt a, BigInt b) {
+  if (a.IsSmall() || b.IsSmall()) {
+    return a.bits_ == b.bits_;
+  }
+  return SlowEqual(a, b);
+}
+
+inline bool Greater(BigInt a, BigInt b) {
+  if (BothSmall(a, b)) {
+    return static_cast<int64_t>(a.bits_) > static_cast<int64_t>(b.bits_);
+  }
+  return SlowGreater(a, b);
+}
+
+inline BigInt LShift(BigInt a, BigInt b) {
+  DCHECK(!Greater(ZERO, b));
+  if (BothSmall(a, b) && b.bits_ < 2 * 63) {
+    int64_t n = b.Small();
+    // Shift as unsigned to avoid UB, then check that no bits were lost
+    int64_t result =
+        static_cast<int64_t>(static_cast<uint64_t>(a.Small()) << n);
+    if ((result >> n) == a.Small()) {
+      return BigInt(result);
+    }
+  }
+  return SlowLShift(a, b);
+}
+
+inline BigInt RShift(BigInt a, BigInt b) {
+  DCHECK(!Greater(ZERO, b));
+  if (a.IsSmall()) {
+    if (b.IsSmall() && b.bits_ < 2 * 63) {
+      return BigInt::FromBits((a.Small() >> b.Small()) * 2);
+    }
+    return BigInt(a.Small() < 0 ? -1 : 0);  // all bits shifted out
+  }
+  return SlowRShift(a, b);
+}
+
+inline BigInt BitAnd(BigInt a, BigInt b) {
+  return BothSmall(a, b) ? BigInt::FromBits(a.bits_ & b.bits_)
+                         : SlowBitAnd(a, b);
+}
+
+inline BigInt BitOr(BigInt a, BigInt b) {
+  return BothSmall(a, b) ? BigInt::FromBits(a.bits_ | b.bits_)
+                         : SlowBitOr(a, b);
+}
+
+inline BigInt BitXor(BigInt a, BigInt b) {
+  return BothSmall(a, b) ? BigInt::FromBits(a.bits_ ^ b.bits_)
+                         : SlowBitXor(a, b);
+}
+
+inline BigInt BitNot(BigInt a) {
+  // ~a == -a - 1
+  return a.IsSmall() ? BigInt::FromBits(~a.bits_ - 1)
+                     : SlowSub(SlowNegate(a), ONE);
+}
+
+// mycpp translates Python comparisons like x != mops.MINUS_ONE to these
+inline bool operator==(BigInt a, BigInt b) {
+  return Equal(a, b);
+}
+inline bool operator!=(BigInt a, BigInt b) {
+  return !Equal(a, b);
+}
+inline bool operator<(BigInt a, BigInt b) {
+  return Greater(b, a);
+}
+inline bool operator>(BigInt a, BigInt b) {
+  return Greater(a, b);
+}
+inline bool operator<=(BigInt a, BigInt b) {
+  return !Greater(a, b);
+}
+inline bool operator>=(BigInt a, BigInt b) {
+  return !Greater(b, a);
+}
+
+#else
+
+inline int BigTruncate(BigInt b) {
+  return static_cast<int>(b);
+}
+
+// For hand-written C++, e.g. SetRLimit()
+inline int64_t ToC(BigInt b) {
+  return b;
+}
+
 inline double ToFloat(BigInt b) {
   return static_cast<double>(b);
 }
@@ -115,6 +369,8 @@ inline BigInt BitNot(BigInt a) {
   return ~a;
 }
 
+#endif  // BIGINT
+
 }  // namespace mops
 
 #endif  // MYCPP_GC_MOPS_H
@@ -17,17 +17,17 @@ TEST bigint_test() {
   // You need to instantiate it as a BigInt, the constant (1) doesn't work
   // And also use %ld
 
-  mops::BigInt i = mops::BigInt{1} << 31;
-  log("bad  i = %d", i);  // bug
-  log("good i = %ld", i);
+  mops::BigInt i = mops::LShift(mops::BigInt{1}, mops::BigInt{31});
+  log("bad  i = %d", mops::ToC(i));  // bug
+  log("good i = %ld", mops::ToC(i));
   log("");
 
-  mops::BigInt i2 = mops::BigInt{1} << 32;
-  log("good i2 = %ld", i2);
+  mops::BigInt i2 = mops::LShift(mops::BigInt{1}, mops::BigInt{32});
+  log("good i2 = %ld", mops::ToC(i2));
   log("");
 
-  mops::BigInt i3 = i2 + i2;
-  log("good i3 = %ld", i3);
+  mops::BigInt i3 = mops::Add(i2, i2);
+  log("good i3 = %ld", mops::ToC(i3));
   log("");
 
   int64_t j = int64_t{1} << 31;
@@ -40,7 +40,7 @@ TEST bigint_test() {
 TEST static_cast_test() {
   // These conversion ops are currently implemented by static_cast<>
 
-  auto big = mops::BigInt{1} << 31;
+  auto big = mops::LShift(mops::BigInt{1}, mops::BigInt{31});
 
   // Turns into a negative number
   int i = mops::BigTruncate(big);
@@ -49,11 +49,11 @@ TEST static_cast_test() {
   // Truncates float to int.  TODO: Test out Oils behavior.
   float f = 3.14f;
   auto fbig = mops::FromFloat(f);
-  log("%f -> %ld", f, fbig);
+  log("%f -> %ld", f, mops::ToC(fbig.at1()));
 
   f = 3.99f;
   fbig = mops::FromFloat(f);
-  log("%f = %ld", f, fbig);
+  log("%f = %ld", f, mops::ToC(fbig.at1()));
 
   // OK this is an exact integer
   f = mops::ToFloat(big);
@@ -160,6 +160,190 @@ TEST gcc_clang_overflow_test() {
   PASS();
 }
 
+#ifdef BIGINT
+
+mops::BigInt Pow2(int n) {
+  return mops::LShift(mops::ONE, mops::IntWiden(n));
+}
+
+TEST promotion_test() {
+  mops::BigInt max{INT64_MAX};
+  mops::BigInt min{INT64_MIN};
+
+  mops::BigInt small_max{mops::kMaxSmall};
+  ASSERT(small_max.IsSmall());
+  mops::BigInt a = mops::Add(small_max, mops::ONE);
+  ASSERT(!a.IsSmall());
+  ASSERT(str_equals0("4611686018427387904", mops::ToStr(a)));
+
+  // Results that fit are unboxed again
+  mops::BigInt a2 = mops::Sub(a, mops::ONE);
+  ASSERT(a2.IsSmall());
+  ASSERT(mops::Equal(small_max, a2));
+  ASSERT(mops::Equal(a, mops::LShift(mops::ONE, mops::BigInt{62})));
+
+  // Values in int64_t range are boxed, but print the same way
+  ASSERT(!max.IsSmall());
+  ASSERT(str_equals0("ffffffffffffffff", mops::ToHexLower(mops::MINUS_ONE)));
+  ASSERT(str_equals0("8000000000000000", mops::ToHexLower(min)));
+  ASSERT(str_equals0("-9223372036854775808", mops::ToStr(min)));
+  ASSERT_EQ(INT64_MIN, mops::ToC(min));
+
+  mops::BigInt b = mops::Add(max, mops::ONE);
+  ASSERT(str_equals0("9223372036854775808", mops::ToStr(b)));
+  mops::BigInt c = mops::Sub(b, mops::ONE);
+  ASSERT(mops::Equal(max, c));
+
+  ASSERT(str_equals0("9223372036854775808", mops::ToStr(mops::Negate(min))));
+  ASSERT(str_equals0("-9223372036854775809",
+                     mops::ToStr(mops::Sub(min, mops::ONE))));
+  ASSERT(str_equals0("9223372036854775808",
+                     mops::ToStr(mops::Div(min, mops::MINUS_ONE))));
+  ASSERT(mops::Equal(mops::ZERO, mops::Rem(min, mops::MINUS_ONE)));
+
+  mops::BigInt sq = mops::Mul(Pow2(64), Pow2(64));
+  ASSERT(str_equals0("340282366920938463463374607431768211456",
+                     mops::ToStr(sq)));
+  ASSERT(mops::Equal(Pow2(128), sq));
+
+  PASS();
+}
+
+TEST big_arith_test() {
+  // 30! and back
+  mops::BigInt f = mops::ONE;
+  for (int i = 1; i <= 30; ++i) {
+    f = mops::Mul(f, mops::IntWiden(i));
+  }
+  ASSERT(str_equals0("265252859812191058636308480000000", mops::ToStr(f)));
+  for (int i = 30; i >= 1; --i) {
+    ASSERT(mops::Equal(mops::ZERO, mops::Rem(f, mops::IntWiden(i))));
+    f = mops::Div(f, mops::IntWiden(i));
+  }
+  ASSERT(mops::Equal(mops::ONE, f));
+
+  // Round toward zero, and the remainder has the sign of the dividend, like
+  // mops.py
+  mops::BigInt big = mops::Negate(mops::Mul(Pow2(40), Pow2(40)));
+  mops::BigInt seven{7};
+  ASSERT(str_equals0("-172703688516375596386596",
+                     mops::ToStr(mops::Div(big, seven))));
+  ASSERT(str_equals0("-4", mops::ToStr(mops::Rem(big, seven))));
+
+  // Multi-digit divisor
+  mops::BigInt q = mops::Div(mops::Add(Pow2(200), mops::ONE), Pow2(100));
+  ASSERT(mops::Equal(Pow2(100), q));
+  ASSERT(mops::Equal(mops::ONE,
+                     mops::Rem(mops::Add(Pow2(200), mops::ONE), Pow2(100))));
+
+  ASSERT(mops::Greater(Pow2(100), Pow2(99)));
+  ASSERT(mops::Greater(Pow2(64), mops::BigInt{INT64_MAX}));
+  ASSERT(mops::Greater(mops::BigInt{INT64_MIN}, mops::Negate(Pow2(64))));
+  ASSERT(!mops::Greater(mops::Negate(Pow2(100)), mops::Negate(Pow2(99))));
+
+  PASS();
+}
+
+TEST big_bits_test() {
+  mops::BigInt p100 = Pow2(100);
+  ASSERT(str_equals0("10000000000000000000000000", mops::ToHexLower(p100)));
+  ASSERT(str_equals0("2000000000000000000000", mops::ToOctal(Pow2(64))));
+  ASSERT(str_equals0("-FFFFFFFFFFFFFFFFF",
+                     mops::ToHexUpper(mops::Sub(mops::ONE, Pow2(68)))));
+
+  ASSERT(mops::Equal(mops::ONE, mops::RShift(p100, mops::BigInt{100})));
+  ASSERT(mops::Equal(mops::ZERO, mops::RShift(p100, mops::BigInt{101})));
+  // Negative numbers round toward negative infinity, like int64_t
+  mops::BigInt neg = mops::Sub(mops::Negate(p100), mops::ONE);
+  ASSERT(mops::Equal(mops::BigInt{-2}, mops::RShift(neg, mops::BigInt{100})));
+  ASSERT(mops::Equal(mops::MINUS_ONE, mops::RShift(neg, p100)));
+
+  mops::BigInt x = mops::Add(p100, mops::BigInt{5});
+  ASSERT(mops::Equal(mops::BigInt{5}, mops::BitAnd(x, mops::BigInt{7})));
+  ASSERT(mops::Equal(p100, mops::BitAnd(mops::MINUS_ONE, p100)));
+  ASSERT(mops::Equal(x, mops::BitOr(p100, mops::BigInt{5})));
+  ASSERT(mops::Equal(mops::ZERO, mops::BitXor(x, x)));
+  ASSERT(mops::Equal(neg, mops::BitNot(p100)));
+  ASSERT(mops::Equal(mops::Negate(p100),
+                     mops::BitAnd(mops::Negate(p100), mops::Negate(Pow2(64)))));
+
+  PASS();
+}
+
+TEST big_conversion_test() {
+  mops::BigInt b = mops::Add(Pow2(64), mops::BigInt{3});
+  ASSERT_EQ(3, mops::BigTruncate(b));
+  ASSERT_EQ(-3, mops::BigTruncate(mops::Negate(b)));
+  ASSERT_EQ_FMT(18446744073709551616.0, mops::ToFloat(Pow2(64)), "%f");
+
+  auto t = mops::FromFloat(1e20);
+  ASSERT(t.at0());
+  ASSERT(str_equals0("100000000000000000000", mops::ToStr(t.at1())));
+  t = mops::FromFloat(-9223372036854775808.0);
+  ASSERT(mops::Equal(mops::BigInt{INT64_MIN}, t.at1()));
+
+  // Equal values hash the same, however they were computed
+  mops::BigInt b2 = mops::Sub(mops::Mul(Pow2(32), Pow2(32)), mops::MINUS_TWO);
+  ASSERT(mops::Equal(mops::Add(b, mops::MINUS_ONE), b2));
+  ASSERT_EQ(hash_key(mops::Add(b, mops::MINUS_ONE)), hash_key(b2));
+
+  auto* d = Alloc<Dict<mops::BigInt, BigStr*>>();
+  d->set(b2, kEmptyString);
+  d->set(mops::Sub(b, mops::ONE), kEmptyString);
+  d->set(mops::BigInt{2}, kEmptyString);
+  ASSERT_EQ_FMT(2, len(d), "%d");
+
+  PASS();
+}
+
+TEST big_operators_test() {
+  // mycpp generates these for Python comparisons
+  ASSERT(Pow2(100) == Pow2(100));
+  ASSERT(Pow2(100) != Pow2(99));
+  ASSERT(mops::MINUS_ONE != Pow2(64));
+  ASSERT(mops::BigInt{INT64_MAX} < Pow2(64));
+  ASSERT(Pow2(64) > mops::BigInt{INT64_MAX});
+  ASSERT(mops::Negate(Pow2(64)) <= mops::Negate(Pow2(64)));
+  ASSERT(mops::ZERO >= mops::Negate(Pow2(64)));
+  ASSERT(!(mops::ZERO >= Pow2(64)));
+
+  PASS();
+}
+
+TEST bignat_sweep_test() {
+  List<mops::BigInt>* kept = nullptr;
+  StackRoot _r(&kept);
+
+  kept = Alloc<List<mops::BigInt>>();
+  kept->append(Pow2(100));
+  mops::BigInt local = mops::Add(Pow2(90), mops::ONE);
+
+  for (int i = 0; i < 5000; ++i) {
+    mops::Add(Pow2(80), mops::IntWiden(i));  // garbage
+  }
+  ASSERT(mops::NumBigNats() >= 10000);
+
+  gHeap.Collect();
+
+  // A few may be kept by stale words on the stack
+  log("%d BigNat after collection", mops::NumBigNats());
+  ASSERT(mops::NumBigNats() < 50);
+
+  ASSERT(mops::Equal(Pow2(100), kept->at(0)));
+  ASSERT(str_equals0("1237940039285380274899124225", mops::ToStr(local)));
+
+  kept = nullptr;
+  for (int i = 0; i < 2000; ++i) {
+    mops::Add(Pow2(80), mops::IntWiden(i));
+  }
+  gHeap.Collect();
+  ASSERT(str_equals0("1237940039285380274899124225", mops::ToStr(local)));
+
+  PASS();
+}
+
+#endif  // BIGINT
+
 GREATEST_MAIN_DEFS();
 
 int main(int argc, char** argv) {
@@ -173,6 +357,14 @@ int main(int argc, char** argv) {
   RUN_TEST(conversion_test);
   RUN_TEST(float_test);
   RUN_TEST(gcc_clang_overflow_test);
+#ifdef BIGINT
+  RUN_TEST(promotion_test);
+  RUN_TEST(big_arith_test);
+  RUN_TEST(big_bits_test);
+  RUN_TEST(big_conversion_test);
+  RUN_TEST(big_operators_test);
+  RUN_TEST(bignat_sweep_test);
+#endif
 
   gHeap.CleanProcessExit();
 
@@ -25,9 +25,13 @@ unsigned hash_key(int n) {
 }
 
 unsigned hash_key(mops::BigInt n) {
+#ifdef BIGINT
+  return mops::Hash(n);
+#else
   // Bug fix: our dict sizing is a power of 2, and we don't want integers in
   // the workload to interact badly with it.
   return fnv1(reinterpret_cast<const char*>(&n), sizeof(n));
+#endif
 }
 
 unsigned hash_key(void* p) {
@@ -8,13 +8,29 @@
 #include <time.h>      // clock_gettime(), CLOCK_PROCESS_CPUTIME_ID
 #include <unistd.h>    // STDERR_FILENO
 
+#include <unordered_set>  // VerifyYoung()
+
+#ifdef BIGINT
+  #ifdef __APPLE__
+    #include <malloc/malloc.h>  // malloc_size()
+  #else
+    #include <malloc.h>  // malloc_usable_size()
+  #endif
+#endif
+
 #include "_build/detected-cpp-config.h"  // for GC_TIMING
 #include "mycpp/gc_builtins.h"           // StringToInt()
+#include "mycpp/gc_mops.h"               // mops::MarkBigNatWords()
 #include "mycpp/gc_slab.h"
 
 // TODO: Remove this guard when we have separate binaries
 #if MARK_SWEEP
 
+  #if defined(BIGINT) && defined(__GLIBC__)
+// The stack pointer when the process started, above main()
+extern "C" void* __libc_stack_end;
+  #endif
+
 void MarkSweepHeap::Init() {
   Init(1000);  // collect at 1000 objects in tests
 }
@@ -38,19 +54,58 @@ void MarkSweepHeap::Init(int gc_threshold) {
     gc_verbose_ = true;
   }
 
+  #if GC_GENERATIONAL
+  nursery_size_ = 10000;
+  e = getenv("OILS_GC_NURSERY");
+  if (e) {
+    int result;
+    if (StringToInt(e, strlen(e), 10, &result)) {
+      nursery_size_ = result;
+    }
+  }
+
+  // only for developers: find missing write barriers
+  e = getenv("_OILS_GC_VERIFY");
+  if (e && strcmp(e, "1") == 0) {
+    gc_verify_ = true;
+  }
+  #endif
+
   live_objs_.reserve(KiB(10));
   roots_.reserve(KiB(1));  // prevent resizing in common case
+
+  #ifdef BIGINT
+    #ifdef __GLIBC__
+  stack_top_ = static_cast<char*>(__libc_stack_end);
+    #else
+  // Init() is called near the top of main(), e.g. by InitCppOnly().  Leave
+  // room for the frames between it and main().
+  stack_top_ = static_cast<char*>(__builtin_frame_address(0)) + 512;
+    #endif
+  // e.g. globals initialized before main()
+  mops::PinBigNats();
+  #endif
 }
 
 int MarkSweepHeap::MaybeCollect() {
   // Maybe collect BEFORE allocation, because the new object won't be rooted
   #if GC_ALWAYS
+    #if GC_GENERATIONAL
+  // Exercise the write barrier, with a major collection when the heap grows
+  int result = num_live() > gc_threshold_ ? Collect() : CollectYoung();
+    #else
   int result = Collect();
+    #endif
   #else
   int result = -1;
   if (num_live() > gc_threshold_) {
     result = Collect();
   }
+    #if GC_GENERATIONAL
+  else if (num_live() - num_old_ > nursery_size_) {
+    result = CollectYoung();
+  }
+    #endif
   #endif
 
   num_gc_points_++;  // this is a manual collection point
@@ -131,6 +186,22 @@ void* MarkSweepHeap::Reallocate(void* p, size_t num_bytes) {
 // - Tag::{Opaque,FixedSized,Scanned} have their mark bits set
 // - Tag::{FixedSize,Scanned} are also pushed on the gray stack
 
+bool MarkSweepHeap::IsMarked(void* obj) {
+  ObjHeader* header = ObjHeader::FromObject(obj);
+  if (header->heap_tag == HeapTag::Global) {  // never freed
+    return true;
+  }
+  #ifndef NO_POOL_ALLOC
+  if (header->pool_id == 1) {
+    return pool1_.IsMarked(header->obj_id);
+  }
+  if (header->pool_id == 2) {
+    return pool2_.IsMarked(header->obj_id);
+  }
+  #endif
+  return mark_set_.IsMarked(header->obj_id);
+}
+
 void MarkSweepHeap::MaybeMarkAndPush(RawObject* obj) {
   ObjHeader* header = ObjHeader::FromObject(obj);
   if (header->heap_tag == HeapTag::Global) {  // don't mark or push
@@ -242,12 +313,91 @@ void MarkSweepHeap::Sweep() {
   max_survived_ = std::max(max_survived_, num_live());
 }
 
-int MarkSweepHeap::Collect() {
   #ifdef GC_TIMING
-  struct timespec start, end;
-  if (clock_gettime(CLOCK_PROCESS_CPUTIME_ID, &start) < 0) {
+static double CpuMillis() {
+  struct timespec ts;
+  if (clock_gettime(CLOCK_PROCESS_CPUTIME_ID, &ts) < 0) {
     FAIL("clock_gettime failed");
   }
+  return ts.tv_sec * 1000.0 + ts.tv_nsec / 1e6;
+}
+  #endif
+
+void MarkSweepHeap::MarkRoots() {
+  // Note: It might be nice to get rid of double pointers
+  int num_roots = roots_.size();
+  for (int i = 0; i < num_roots; ++i) {
+    RawObject* root = *(roots_[i]);
+    if (root) {
+      MaybeMarkAndPush(root);
+    }
+  }
+
+  int num_globals = global_roots_.size();
+  for (int i = 0; i < num_globals; ++i) {
+    RawObject* root = global_roots_[i];
+    if (root) {
+      MaybeMarkAndPush(root);
+    }
+  }
+}
+
+  #ifdef BIGINT
+// A separate frame, so the callee-saved registers spilled by MarkBigNats() are
+// above 'here'
+__attribute__((noinline)) static void MarkBigNatsOnStack(char* stack_top) {
+  char here;
+  mops::MarkBigNatWords(&here, stack_top);
+}
+
+// BigInt values aren't traced, so find the ones that point to digits by
+// scanning the stack and every marked object.
+void MarkSweepHeap::MarkBigNats() {
+  __builtin_unwind_init();  // spill callee-saved registers to this frame
+  MarkBigNatsOnStack(stack_top_);
+
+  for (ObjHeader* obj : live_objs_) {
+    if (mark_set_.IsMarked(obj->obj_id)) {
+    #ifdef __APPLE__
+      size_t n = malloc_size(obj);
+    #else
+      size_t n = malloc_usable_size(obj);
+    #endif
+      mops::MarkBigNatWords(obj, reinterpret_cast<char*>(obj) + n);
+    }
+  }
+
+    #ifndef NO_POOL_ALLOC
+  auto mark = [](uint8_t* cell, size_t n) {
+    mops::MarkBigNatWords(cell, cell + n);
+  };
+  pool1_.ForEachMarked(mark);
+  pool2_.ForEachMarked(mark);
+    #endif
+}
+  #endif
+
+void MarkSweepHeap::RecordPause(double gc_millis, bool is_minor) {
+  if (gc_verbose_) {
+    log("    %.1f ms GC", gc_millis);
+  }
+
+  total_gc_millis_ += gc_millis;
+  if (gc_millis > max_gc_millis_) {
+    max_gc_millis_ = gc_millis;
+  }
+
+  if (is_minor) {
+    total_minor_millis_ += gc_millis;
+    if (gc_millis > max_minor_millis_) {
+      max_minor_millis_ = gc_millis;
+    }
+  }
+}
+
+int MarkSweepHeap::Collect() {
+  #ifdef GC_TIMING
+  double start_millis = CpuMillis();
   #endif
 
   int num_roots = roots_.size();
@@ -267,26 +417,31 @@ int MarkSweepHeap::Collect() {
   #endif
 
   // Mark roots.
-  // Note: It might be nice to get rid of double pointers
-  for (int i = 0; i < num_roots; ++i) {
-    RawObject* root = *(roots_[i]);
-    if (root) {
-      MaybeMarkAndPush(root);
-    }
-  }
-
-  for (int i = 0; i < num_globals; ++i) {
-    RawObject* root = global_roots_[i];
-    if (root) {
-      MaybeMarkAndPush(root);
-    }
-  }
+  MarkRoots();
 
   // Traverse object graph.
   TraceChildren();
 
+  #ifdef BIGINT
+  if (mops::BeginBigNatMark()) {
+    MarkBigNats();
+    mops::SweepBigNats();
+  }
+  #endif
+
+  PruneInterned();
+
   Sweep();
 
+  #if GC_GENERATIONAL
+  // Every live object was traced, and stays marked until the next major
+  // collection
+  num_remembered_ += remembered_.size();
+  remembered_.clear();
+  num_old_objs_ = live_objs_.size();
+  num_old_ = num_live();
+  #endif
+
   if (gc_verbose_) {
     log("    %d live after sweep", num_live());
   }
@@ -307,26 +462,153 @@ int MarkSweepHeap::Collect() {
   }
 
   #ifdef GC_TIMING
-  if (clock_gettime(CLOCK_PROCESS_CPUTIME_ID, &end) < 0) {
-    FAIL("clock_gettime failed");
+  RecordPause(CpuMillis() - start_millis, false);
+  #endif
+
+  return num_live();  // for unit tests only
+}
+
+  #if GC_GENERATIONAL
+void MarkSweepHeap::SweepYoung() {
+    #ifndef NO_POOL_ALLOC
+  pool1_.SweepYoung();
+  pool2_.SweepYoung();
+    #endif
+
+  // Like Sweep(), but old objects are at the front of live_objs_, and they
+  // aren't touched
+  int last_live_index = num_old_objs_;
+  int num_objs = live_objs_.size();
+  for (int i = num_old_objs_; i < num_objs; ++i) {
+    ObjHeader* obj = live_objs_[i];
+    if (mark_set_.IsMarked(obj->obj_id)) {
+      live_objs_[last_live_index++] = obj;
+    } else {
+      to_free_.push_back(obj);
+      num_live_--;
+    }
   }
+  live_objs_.resize(last_live_index);
+  num_old_objs_ = last_live_index;
+
+  num_collections_++;
+  num_minor_collections_++;
+  max_survived_ = std::max(max_survived_, num_live());
+  num_old_ = num_live();
+}
 
-  double start_secs = start.tv_sec + start.tv_nsec / 1e9;
-  double end_secs = end.tv_sec + end.tv_nsec / 1e9;
-  double gc_millis = (end_secs - start_secs) * 1000.0;
+// Do a full traversal from the roots, and check that every object it finds is
+// marked.  An unmarked one means a store to an old object wasn't followed by
+// WriteBarrier().
+void MarkSweepHeap::VerifyYoung() {
+  std::unordered_set<ObjHeader*> seen;
+  std::vector<ObjHeader*> stack;
+
+  auto visit = [&](RawObject* obj) {
+    if (obj == nullptr) {
+      return;
+    }
+    ObjHeader* header = ObjHeader::FromObject(obj);
+    if (header->heap_tag == HeapTag::Global || seen.count(header)) {
+      return;
+    }
+    seen.insert(header);
+
+    if (!IsMarked(obj)) {
+      log("Live object %p (type tag %d) wasn't marked by minor GC", obj,
+          header->type_tag);
+      FAIL("Missing write barrier");
+    }
+    stack.push_back(header);
+  };
+
+  for (RawObject** root : roots_) {
+    visit(*root);
+  }
+  for (RawObject* root : global_roots_) {
+    visit(root);
+  }
+
+  while (!stack.empty()) {
+    ObjHeader* header = stack.back();
+    stack.pop_back();
+
+    switch (header->heap_tag) {
+    case HeapTag::FixedSize: {
+      auto fixed = reinterpret_cast<LayoutFixed*>(header->ObjectAddress());
+      int mask = FIELD_MASK(*header);
+      for (int i = 0; i < kFieldMaskBits; ++i) {
+        if (mask & (1 << i)) {
+          visit(fixed->children_[i]);
+        }
+      }
+      break;
+    }
+    case HeapTag::Scanned: {
+      auto slab = reinterpret_cast<Slab<RawObject*>*>(header->ObjectAddress());
+      int n = NUM_POINTERS(*header);
+      for (int i = 0; i < n; ++i) {
+        visit(slab->items_[i]);
+      }
+      break;
+    }
+    default:  // Opaque
+      break;
+    }
+  }
+}
+
+int MarkSweepHeap::CollectYoung() {
+    #ifdef GC_TIMING
+  double start_millis = CpuMillis();
+    #endif
 
   if (gc_verbose_) {
-    log("    %.1f ms GC", gc_millis);
+    log("");
+    log("%2d. Minor GC with %d roots, %d remembered, and %d young objects",
+        num_collections_, static_cast<int>(roots_.size() + global_roots_.size()),
+        static_cast<int>(remembered_.size()), num_live() - num_old_);
   }
 
-  total_gc_millis_ += gc_millis;
-  if (gc_millis > max_gc_millis_) {
-    max_gc_millis_ = gc_millis;
+  // Old objects are still marked, so tracing stops at them
+  mark_set_.Grow(greatest_obj_id_);
+    #ifndef NO_POOL_ALLOC
+  pool1_.PrepareForMinorGc();
+  pool2_.PrepareForMinorGc();
+    #endif
+
+  MarkRoots();
+
+  // Old objects that may point to young ones
+  for (ObjHeader* header : remembered_) {
+    MaybeMarkAndPush(static_cast<RawObject*>(header->ObjectAddress()));
   }
-  #endif
+  num_remembered_ += remembered_.size();
+  remembered_.clear();
 
-  return num_live();  // for unit tests only
+  TraceChildren();
+
+    #ifndef OPTIMIZED
+  if (gc_verify_) {
+    VerifyYoung();
+  }
+    #endif
+
+  PruneInterned();
+
+  SweepYoung();
+
+  if (gc_verbose_) {
+    log("    %d live after sweep", num_live());
+  }
+
+    #ifdef GC_TIMING
+  RecordPause(CpuMillis() - start_millis, true);
+    #endif
+
+  return num_live();
 }
+  #endif  // GC_GENERATIONAL
 
 void MarkSweepHeap::PrintShortStats() {
   // TODO: should use feature detection of dprintf
@@ -371,12 +653,16 @@ void MarkSweepHeap::PrintStats(int fd) {
   dprintf(fd, "\n");
   dprintf(fd, "  num gc points    = %10d\n", num_gc_points_);
   dprintf(fd, "  num collections  = %10d\n", num_collections_);
+  dprintf(fd, "  num minor gcs    = %10d\n", num_minor_collections_);
+  dprintf(fd, "  num remembered   = %10" PRId64 "\n", num_remembered_);
   dprintf(fd, "\n");
   dprintf(fd, "   gc threshold    = %10d\n", gc_threshold_);
   dprintf(fd, "  num growths      = %10d\n", num_growths_);
   dprintf(fd, "\n");
   dprintf(fd, "  max gc millis    = %10.1f\n", max_gc_millis_);
   dprintf(fd, "total gc millis    = %10.1f\n", total_gc_millis_);
+  dprintf(fd, "  max minor millis = %10.1f\n", max_minor_millis_);
+  dprintf(fd, "total minor millis = %10.1f\n", total_minor_millis_);
   dprintf(fd, "\n");
   dprintf(fd, "roots capacity     = %10d\n",
           static_cast<int>(roots_.capacity()));
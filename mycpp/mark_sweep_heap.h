@@ -86,6 +86,33 @@ class MarkSet {
     return bits_[byte_index] & (1 << bit_index);
   }
 
+#if GC_GENERATIONAL
+  // A minor collection keeps the mark bits of old objects ("sticky mark
+  // bits"), and only makes room for objects allocated since the last one.
+  void Grow(int max_obj_id) {
+    int max_byte_index = (max_obj_id >> 3) + 1;
+    if (max_byte_index > static_cast<int>(bits_.size())) {
+      bits_.resize(max_byte_index);  // new objects are unmarked
+    }
+  }
+
+  // Called by the write barrier.  IDs past the end belong to objects allocated
+  // since the last collection, which are young.
+  bool IsOld(int obj_id) {
+    int byte_index = obj_id >> 3;
+    if (byte_index >= static_cast<int>(bits_.size())) {
+      return false;
+    }
+    return bits_[byte_index] & (1 << (obj_id & 0b111));
+  }
+
+  void Unmark(int obj_id) {
+    int byte_index = obj_id >> 3;
+    int bit_index = obj_id & 0b111;
+    bits_[byte_index] &= ~(1 << bit_index);
+  }
+#endif
+
   void Debug() {
     // TODO: should use feature detection of dprintf
 #ifndef OILS_WIN32
@@ -149,6 +176,9 @@ class Pool {
     free_list_ = free_list_->next;
     num_free_--;
     *obj_id = cell->id;
+#if GC_GENERATIONAL
+    young_cells_.push_back(cell->id);
+#endif
     return cell;
   }
 
@@ -158,6 +188,41 @@ class Pool {
     mark_set_.ReInit(blocks_.size() * CellsPerBlock);
   }
 
+#if GC_GENERATIONAL
+  void PrepareForMinorGc() {
+    DCHECK(!gc_underway_);
+    gc_underway_ = true;
+    mark_set_.Grow(blocks_.size() * CellsPerBlock);
+  }
+
+  bool IsOld(int cell_id) {
+    return mark_set_.IsOld(cell_id);
+  }
+
+  void Unmark(int cell_id) {
+    mark_set_.Unmark(cell_id);
+  }
+
+  // Free the young cells that weren't marked.  Other free cells are already
+  // on the free list, and old cells stay marked.
+  void SweepYoung() {
+    DCHECK(gc_underway_);
+    for (int cell_id : young_cells_) {
+      if (!mark_set_.IsMarked(cell_id)) {
+        num_free_++;
+        Block* block = blocks_[cell_id / CellsPerBlock];
+        FreeCell* free_cell =
+            reinterpret_cast<FreeCell*>(block->cells[cell_id % CellsPerBlock]);
+        free_cell->id = cell_id;
+        free_cell->next = free_list_;
+        free_list_ = free_cell;
+      }
+    }
+    young_cells_.clear();
+    gc_underway_ = false;
+  }
+#endif
+
   bool IsMarked(int cell_id) {
     DCHECK(gc_underway_);
     return mark_set_.IsMarked(cell_id);
@@ -168,6 +233,23 @@ class Pool {
     mark_set_.Mark(cell_id);
   }
 
+#ifdef BIGINT
+  // Call f(cell, CellSize) on each marked cell, before Sweep()
+  template <typename F>
+  void ForEachMarked(F f) {
+    DCHECK(gc_underway_);
+    int cell_id = 0;
+    for (Block* block : blocks_) {
+      for (Cell& cell : block->cells) {
+        if (mark_set_.IsMarked(cell_id)) {
+          f(cell, CellSize);
+        }
+        cell_id++;
+      }
+    }
+  }
+#endif
+
   void Sweep() {
     DCHECK(gc_underway_);
     // Iterate over every Cell linking the free ones into a new free list.
@@ -186,6 +268,9 @@ class Pool {
         cell_id++;
       }
     }
+#if GC_GENERATIONAL
+    young_cells_.clear();
+#endif
     gc_underway_ = false;
   }
 
@@ -239,6 +324,9 @@ class Pool {
   int64_t bytes_allocated_ = 0;
   std::vector<Block*> blocks_;
   MarkSet mark_set_;
+#if GC_GENERATIONAL
+  std::vector<int> young_cells_;  // allocated since the last collection
+#endif
 
   DISALLOW_COPY_AND_ASSIGN(Pool);
 };
@@ -269,12 +357,55 @@ class MarkSweepHeap {
 
   void* Allocate(size_t num_bytes, int* obj_id, int* pool_id);
 
+  // During a collection, whether obj was reached.  For weak tables, which
+  // remove unreached objects before they're swept.
+  bool IsMarked(void* obj);
+
 #if 0
   void* Reallocate(void* p, size_t num_bytes);
 #endif
   int MaybeCollect();
   int Collect();
 
+#if GC_GENERATIONAL
+  // A minor collection traces only young objects, i.e. the ones allocated
+  // since the last collection, starting from the roots and the remembered set.
+  // Survivors are promoted, i.e. they stay marked until the next major
+  // collection.
+  int CollectYoung();
+
+  // Called after a pointer is stored in obj.  If obj is old, it may now point
+  // to a young object, so it's unmarked and traced by the next minor
+  // collection.
+  void WriteBarrier(void* obj) {
+    ObjHeader* header = ObjHeader::FromObject(obj);
+    if (header->heap_tag == HeapTag::Global) {
+      return;
+    }
+    int obj_id = header->obj_id;
+  #ifndef NO_POOL_ALLOC
+    if (header->pool_id == 1) {
+      if (pool1_.IsOld(obj_id)) {
+        pool1_.Unmark(obj_id);
+        remembered_.push_back(header);
+      }
+      return;
+    }
+    if (header->pool_id == 2) {
+      if (pool2_.IsOld(obj_id)) {
+        pool2_.Unmark(obj_id);
+        remembered_.push_back(header);
+      }
+      return;
+    }
+  #endif
+    if (mark_set_.IsOld(obj_id)) {
+      mark_set_.Unmark(obj_id);
+      remembered_.push_back(header);
+    }
+  }
+#endif
+
   void MaybeMarkAndPush(RawObject* obj);
   void TraceChildren();
 
@@ -316,9 +447,13 @@ class MarkSweepHeap {
   int64_t bytes_allocated_ = 0;  // avoid overflow
   int num_gc_points_ = 0;        // manual collection points
   int num_collections_ = 0;
+  int num_minor_collections_ = 0;  // included in num_collections_
   int num_growths_;
   double max_gc_millis_ = 0.0;
   double total_gc_millis_ = 0.0;
+  double max_minor_millis_ = 0.0;
+  double total_minor_millis_ = 0.0;
+  int64_t num_remembered_ = 0;  // write barrier hits
 
 #ifndef NO_POOL_ALLOC
   // 16,384 / 24 bytes = 682 cells (rounded), 16,368 bytes
@@ -342,7 +477,37 @@ class MarkSweepHeap {
 
   int greatest_obj_id_ = 0;
 
+#ifdef BIGINT
+  // MarkBigNats() scans the stack up to here
+  char* stack_top_ = nullptr;
+#endif
+
+#if GC_GENERATIONAL
+  // live_objs_[0, num_old_objs_) survived the last collection
+  int num_old_objs_ = 0;
+  // num_live() after the last collection
+  int num_old_ = 0;
+  // Do a minor collection when this many objects were allocated since the
+  // last collection
+  int nursery_size_;
+
+  // Old objects unmarked by WriteBarrier()
+  std::vector<ObjHeader*> remembered_;
+
+  // Check that minor collections find every live object
+  bool gc_verify_ = false;
+#endif
+
  private:
+  void MarkRoots();
+#ifdef BIGINT
+  void MarkBigNats();
+#endif
+  void RecordPause(double gc_millis, bool is_minor);
+#if GC_GENERATIONAL
+  void SweepYoung();
+  void VerifyYoung();
+#endif
   void FreeEverything();
   void MaybePrintStats();
 
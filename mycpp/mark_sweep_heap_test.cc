@@ -53,7 +53,10 @@ TEST mark_set_test() {
 }
 
 TEST api_test() {
-#ifdef GC_ALWAYS
+#if defined(GC_ALWAYS) && GC_GENERATIONAL
+  // Minor collections promote survivors, so they aren't freed right away.  See
+  // generational_test.
+#elif defined(GC_ALWAYS)
   // no objects live
   ASSERT_EQ_FMT(0, gHeap.MaybeCollect(), "%d");
   {
@@ -171,6 +174,57 @@ TEST cycle_collection_test() {
   PASS();
 }
 
+#if GC_GENERATIONAL
+TEST generational_test() {
+  int num_old = gHeap.Collect();
+
+  Node *n1 = nullptr;
+  List<BigStr *> *L = nullptr;
+  StackRoots _roots({&n1, &L});
+
+  n1 = Alloc<Node>();
+  L = NewList<BigStr *>();
+  L->append(StrFromC("a"));
+  StrFromC("garbage");
+
+  // n1, L, its Slab, and "a" are promoted
+  ASSERT_EQ_FMT(num_old + 4, gHeap.CollectYoung(), "%d");
+  num_old += 4;
+
+  // Young objects that are only reachable from old ones
+  n1->next_ = Alloc<Node>();
+  WriteBarrier(n1);
+  L->append(StrFromC("b"));
+  StrFromC("garbage");
+
+  int64_t num_remembered = gHeap.num_remembered_;
+  ASSERT_EQ_FMT(num_old + 2, gHeap.CollectYoung(), "%d");
+  num_old += 2;
+  // n1 and the Slab
+  ASSERT_EQ_FMT(2, static_cast<int>(gHeap.num_remembered_ - num_remembered),
+                "%d");
+
+  ASSERT(str_equals(StrFromC("b"), L->at(1)));
+  ASSERT(n1->next_ != nullptr);
+
+  // A new Slab is stored in the old List
+  for (int i = 0; i < 10; ++i) {
+    L->append(StrFromC("c"));
+  }
+  ASSERT_EQ_FMT(num_old + 11, gHeap.CollectYoung(), "%d");
+  num_old += 11;
+  ASSERT_EQ(12, len(L));
+
+  // Old objects are only freed by major collections
+  L = nullptr;
+  ASSERT_EQ_FMT(num_old, gHeap.CollectYoung(), "%d");
+  // The List, its 2 Slabs, and 12 strings
+  ASSERT_EQ_FMT(num_old - 15, gHeap.Collect(), "%d");
+
+  PASS();
+}
+#endif
+
 TEST pool_sanity_check() {
   Pool<2, 32> p;
 
@@ -357,6 +411,9 @@ int main(int argc, char **argv) {
   RUN_TEST(string_collection_test);
   RUN_TEST(list_collection_test);
   RUN_TEST(cycle_collection_test);
+#if GC_GENERATIONAL
+  RUN_TEST(generational_test);
+#endif
 
   RUN_SUITE(pool_alloc);
 
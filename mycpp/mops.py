@@ -1,8 +1,9 @@
 """
 Math operations, e.g. for arbitrary precision integers 
 
-They are currently int64_t, rather than C int, but we want to upgrade to
-heap-allocated integers.
+They're int64_t in the default C++ build, rather than C int.  The +bigint
+build (-D BIGINT) promotes to heap-allocated digits on overflow, like the
+Python ints here.  FromStr2() still simulates the int64_t range in both.
 
 Regular int ops can use the normal operators + - * /, or maybe i_add() if we
 really want.  Does that make code gen harder or worse?
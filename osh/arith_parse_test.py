@@ -140,6 +140,10 @@ class ArithTest(unittest.TestCase):
         #testEvalExpr(['ab21xx', ':', '[^0-9]*([0-9]*)', '+', '3'], 24)
 
     def testEvalConstants(self):
+        # Decimal constants are folded at parse time
+        testEvalExpr('0', 0)
+        testEvalExpr('42', 42)
+
         # Octal constant
         testEvalExpr('011', 9)
 
@@ -19,6 +19,8 @@ from _devbuild.gen.id_kind_asdl import Id, Id_t
 from _devbuild.gen.syntax_asdl import (
     Token,
     CompoundWord,
+    DoubleQuoted,
+    SingleQuoted,
     word,
     word_e,
     word_t,
@@ -352,22 +354,43 @@ def _IntToString(i, width):
         return s
 
 
+def _RangeWidth(part):
+    # type: (word_part.BracedRange) -> int
+    """Return the zero-padded width of an integer range, or 0 for no padding.
+
+    e.g. {01..10} has width 2
+    """
+    z1 = _LeadingZeros(part.start)
+    z2 = _LeadingZeros(part.end)
+
+    if z1 == 0 and z2 == 0:
+        return 0
+    if z1 < z2:
+        return len(part.end)
+    return len(part.start)
+
+
+def _RangeCount(part):
+    # type: (word_part.BracedRange) -> int
+    """Return the number of strings in the range, without generating them."""
+    if part.kind == Id.Range_Int:
+        start = int(part.start)
+        end = int(part.end)
+    else:  # Id.Range_Char
+        start = ord(part.start)
+        end = ord(part.end)
+
+    # _RangeParser ensures that step has the same sign as (end - start)
+    return (end - start) // part.step + 1
+
+
 def _RangeStrings(part):
     # type: (word_part.BracedRange) -> List[str]
 
     if part.kind == Id.Range_Int:
         nums = []  # type: List[str]
 
-        z1 = _LeadingZeros(part.start)
-        z2 = _LeadingZeros(part.end)
-
-        if z1 == 0 and z2 == 0:
-            width = 0
-        else:
-            if z1 < z2:
-                width = len(part.end)
-            else:
-                width = len(part.start)
+        width = _RangeWidth(part)
 
         n = int(part.start)
         end = int(part.end)
@@ -537,3 +560,266 @@ def BraceExpandWords(words):
                 raise AssertionError(w.tag())
 
     return out
+
+
+#
+# Lazy expansion
+#
+
+
+def _IsStaticPart(part):
+    # type: (word_part_t) -> bool
+    """Can this part be evaluated without the interpreter?
+
+    Globs and tildes are excluded too, since they're expanded after brace
+    expansion.
+    """
+    UP_part = part
+    with tagswitch(part) as case:
+        if case(word_part_e.Literal):
+            tok = cast(Token, UP_part)
+            return tok.id not in (Id.Lit_Star, Id.Lit_QMark, Id.Lit_LBracket,
+                                  Id.Lit_RBracket, Id.Lit_Tilde)
+
+        elif case(word_part_e.EscapedLiteral, word_part_e.SingleQuoted,
+                  word_part_e.BracedRange, word_part_e.BracedRangeDigit):
+            return True
+
+        elif case(word_part_e.DoubleQuoted):
+            part = cast(DoubleQuoted, UP_part)
+            for p in part.parts:
+                if p.tag() not in (word_part_e.Literal,
+                                   word_part_e.EscapedLiteral):
+                    return False
+            return True
+
+        elif case(word_part_e.BracedTuple):
+            part = cast(word_part.BracedTuple, UP_part)
+            for w in part.words:
+                for p in w.parts:
+                    if not _IsStaticPart(p):
+                        return False
+            return True
+
+        else:
+            return False
+
+
+def IsStaticBraceWords(words):
+    # type: (List[word_t]) -> bool
+    """Should the words of 'for x in {1..1000000}' be expanded lazily?
+
+    True if there's at least one brace expansion, and every word evaluates
+    to exactly one string, independent of the interpreter state.
+    """
+    found = False
+    for w in words:
+        UP_w = w
+        with tagswitch(w) as case:
+            if case(word_e.BracedTree):
+                w = cast(word.BracedTree, UP_w)
+                found = True
+                parts = w.parts
+            elif case(word_e.Compound):
+                w = cast(CompoundWord, UP_w)
+                parts = w.parts
+            else:
+                raise AssertionError(w.tag())
+
+        for part in parts:
+            if not _IsStaticPart(part):
+                return False
+    return found
+
+
+def _EvalStaticParts(parts, pieces):
+    # type: (List[word_part_t], List[str]) -> bool
+    """Append the strings of static parts to pieces.
+
+    Returns whether any part was quoted.  Like the word evaluator, an
+    unquoted empty word is elided.
+    """
+    quoted = False
+    for part in parts:
+        UP_part = part
+        with tagswitch(part) as case:
+            if case(word_part_e.Literal):
+                tok = cast(Token, UP_part)
+                pieces.append(lexer.TokenVal(tok))
+
+            elif case(word_part_e.EscapedLiteral):
+                part = cast(word_part.EscapedLiteral, UP_part)
+                pieces.append(part.ch)
+                quoted = True
+
+            elif case(word_part_e.SingleQuoted):
+                part = cast(SingleQuoted, UP_part)
+                pieces.append(part.sval)
+                quoted = True
+
+            elif case(word_part_e.DoubleQuoted):
+                part = cast(DoubleQuoted, UP_part)
+                _EvalStaticParts(part.parts, pieces)
+                quoted = True
+
+            elif case(word_part_e.BracedRangeDigit):
+                part = cast(word_part.BracedRangeDigit, UP_part)
+                pieces.append(part.s)
+                quoted = True
+
+            else:
+                raise AssertionError(part.tag())
+    return quoted
+
+
+class _Slot(object):
+    """One digit of the odometer in BraceIterator.
+
+    A range computes its k-th string on demand.  Fixed parts and tuples store
+    their strings, which are bounded by the size of the source word.
+    """
+
+    def __init__(self, strs, quoted, range_part):
+        # type: (List[str], List[bool], Optional[word_part.BracedRange]) -> None
+        self.strs = strs
+        self.quoted = quoted
+        self.range_part = range_part
+
+        if range_part:
+            self.width = _RangeWidth(range_part)
+            self.count = _RangeCount(range_part)
+            if range_part.kind == Id.Range_Int:
+                self.start = int(range_part.start)
+            else:
+                self.start = ord(range_part.start)
+        else:
+            self.width = 0
+            self.count = len(strs)
+            self.start = 0
+
+    def Get(self, k):
+        # type: (int) -> str
+        if self.range_part is None:
+            return self.strs[k]
+
+        n = self.start + k * self.range_part.step
+        if self.range_part.kind == Id.Range_Int:
+            return _IntToString(n, self.width)
+        else:
+            return chr(n)
+
+    def IsQuoted(self, k):
+        # type: (int) -> bool
+        if self.range_part is None:
+            return self.quoted[k]
+        return True
+
+
+def _MakeSlot(part):
+    # type: (word_part_t) -> _Slot
+
+    UP_part = part
+    with tagswitch(part) as case:
+        if case(word_part_e.BracedRange):
+            part = cast(word_part.BracedRange, UP_part)
+            return _Slot([], [], part)
+
+        elif case(word_part_e.BracedTuple):
+            part = cast(word_part.BracedTuple, UP_part)
+            strs = []  # type: List[str]
+            quoted = []  # type: List[bool]
+            for w in part.words:
+                # Nested braces like {a,b{1..3}} are expanded eagerly.
+                for alt_parts in _BraceExpand(w.parts):
+                    pieces = []  # type: List[str]
+                    q = _EvalStaticParts(alt_parts, pieces)
+                    strs.append(''.join(pieces))
+                    quoted.append(q)
+            return _Slot(strs, quoted, None)
+
+        else:
+            pieces = []
+            q = _EvalStaticParts([part], pieces)
+            return _Slot([''.join(pieces)], [q], None)
+
+
+class BraceIterator(object):
+    """Lazily expand words that pass IsStaticBraceWords().
+
+    _BraceExpand() materializes the cartesian product, so {1..1000000} or
+    {a..z}{a..z}{0..999} would allocate every word up front.  Instead, each
+    BracedTree is an odometer, where the rightmost slot varies fastest.  That's
+    the same order as _BraceExpand().
+    """
+
+    def __init__(self, words):
+        # type: (List[word_t]) -> None
+        self.words = words
+        self.word_index = 0
+
+        self.slots = []  # type: List[_Slot]
+        self.counters = []  # type: List[int]
+        self.in_tree = False
+
+    def _StartTree(self, tree):
+        # type: (word.BracedTree) -> None
+        self.slots = []
+        self.counters = []
+        for part in tree.parts:
+            self.slots.append(_MakeSlot(part))
+            self.counters.append(0)
+        self.in_tree = True
+
+    def _Advance(self):
+        # type: () -> None
+        i = len(self.slots) - 1
+        while i >= 0:
+            self.counters[i] += 1
+            if self.counters[i] < self.slots[i].count:
+                return
+            self.counters[i] = 0
+            i -= 1
+        self.in_tree = False  # every slot wrapped around
+
+    def Next(self):
+        # type: () -> Optional[str]
+        """Return the next word, or None when done."""
+        while True:
+            if self.in_tree:
+                pieces = []  # type: List[str]
+                quoted = False
+                for i, slot in enumerate(self.slots):
+                    k = self.counters[i]
+                    pieces.append(slot.Get(k))
+                    if slot.IsQuoted(k):
+                        quoted = True
+                self._Advance()
+
+                s = ''.join(pieces)
+                if len(s) == 0 and not quoted:
+                    continue  # elided like an unquoted empty word
+                return s
+
+            if self.word_index == len(self.words):
+                return None
+
+            w = self.words[self.word_index]
+            self.word_index += 1
+
+            UP_w = w
+            with tagswitch(w) as case:
+                if case(word_e.BracedTree):
+                    w = cast(word.BracedTree, UP_w)
+                    self._StartTree(w)
+
+                elif case(word_e.Compound):
+                    w = cast(CompoundWord, UP_w)
+                    pieces = []
+                    quoted = _EvalStaticParts(w.parts, pieces)
+                    s = ''.join(pieces)
+                    if len(s) == 0 and not quoted:
+                        continue
+                    return s
+
+                else:
+                    raise AssertionError(w.tag())
@@ -180,6 +180,42 @@ class BracesTest(unittest.TestCase):
             _PrettyPrint(CompoundWord(parts))
             print('')
 
+    def testBraceIterator(self):
+        CASES = [
+            ('{1..3}', ['1', '2', '3']),
+            ('{01..10..4}', ['01', '05', '09']),
+            ('{c..a}', ['c', 'b', 'a']),
+            ('B-{a,b}-{1..2}-E', ['B-a-1-E', 'B-a-2-E', 'B-b-1-E', 'B-b-2-E']),
+            ('{a,b{1..2}}', ['a', 'b1', 'b2']),
+            ('{,}', []),  # unquoted empty words are elided
+            ("''{,}", ['', '']),
+        ]
+        for s, expected in CASES:
+            w = _assertReadWord(self, s)
+            tree = braces.BraceDetect(w)
+            self.assert_(braces.IsStaticBraceWords([tree]))
+
+            it = braces.BraceIterator([tree])
+            actual = []
+            while True:
+                s = it.Next()
+                if s is None:
+                    break
+                actual.append(s)
+            self.assertEqual(expected, actual)
+
+        for s in ['$x{a,b}', '*{a,b}', '{a,$(echo b)}']:
+            w = _assertReadWord(self, s)
+            tree = braces.BraceDetect(w)
+            self.assertFalse(braces.IsStaticBraceWords([tree]))
+
+    def testRangeCount(self):
+        for s in ['1..10', '10..1', '1..10..3', '-3..-10..-2', 'a..z', 'z..a..-5']:
+            tok = FakeTok(Id.Lit_Chars, s)
+            part = braces._RangePartDetect(tok)
+            self.assertEqual(len(braces._RangeStrings(part)),
+                             braces._RangeCount(part))
+
 
 if __name__ == '__main__':
     unittest.main()
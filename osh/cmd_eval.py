@@ -1399,6 +1399,8 @@ class CommandEvaluator(object):
 
         # for the 2 kinds of shell loop
         iter_list = None  # type: List[str]
+        # for i in {1..1000000}, expanded lazily
+        brace_it = None  # type: Optional[braces.BraceIterator]
 
         # for YSH loop
         iter_expr = None  # type: expr_t
@@ -1413,8 +1415,11 @@ class CommandEvaluator(object):
 
             elif case(for_iter_e.Words):
                 iterable = cast(for_iter.Words, UP_iterable)
-                words = braces.BraceExpandWords(iterable.words)
-                iter_list = self.word_ev.EvalWordSequence(words)
+                if braces.IsStaticBraceWords(iterable.words):
+                    brace_it = braces.BraceIterator(iterable.words)
+                else:
+                    words = braces.BraceExpandWords(iterable.words)
+                    iter_list = self.word_ev.EvalWordSequence(words)
 
             elif case(for_iter_e.YshExpr):
                 iterable = cast(for_iter.YshExpr, UP_iterable)
@@ -1485,9 +1490,14 @@ class CommandEvaluator(object):
                             'Range iteration expects at most 2 loop variables',
                             node.keyword)
 
-                elif case(value_e.Stdin):
+                elif case(value_e.Stdin, value_e.StdinBatches):
                     # TODO: This could changed to magic iterator?
-                    it2 = val_ops.StdinIterator(expr_blame)
+                    if val.tag() == value_e.StdinBatches:
+                        batches = cast(value.StdinBatches, UP_val)
+                        it2 = val_ops.StdinBatchIterator(
+                            batches.size, expr_blame)
+                    else:
+                        it2 = val_ops.StdinIterator(expr_blame)
                     if n == 1:
                         name1 = location.LName(node.iter_names[0])
                     elif n == 2:
@@ -1504,10 +1514,13 @@ class CommandEvaluator(object):
                         node.keyword)
 
         else:
-            assert iter_list is not None, iter_list
+            if brace_it:
+                it2 = val_ops.BraceIter(brace_it)
+            else:
+                assert iter_list is not None, iter_list
 
-            #log('iter list %s', iter_list)
-            it2 = val_ops.ArrayIter(iter_list)
+                #log('iter list %s', iter_list)
+                it2 = val_ops.ArrayIter(iter_list)
 
             if n == 1:
                 name1 = location.LName(node.iter_names[0])
@@ -1522,38 +1535,40 @@ class CommandEvaluator(object):
 
         status = 0  # in case we loop zero times
         with ctx_LoopLevel(self.cflow_builtin):
-            while True:
-                with state.ctx_LoopFrame(self.mem,
-                                         self.exec_opts.for_loop_frames()):
-                    first = it2.FirstValue()
-                    #log('first %s', first)
-                    if first is None:  # for StdinIterator
-                        #log('first is None')
-                        break
-
-                    if first.tag() == value_e.Interrupted:
-                        self.RunPendingTraps()
-                        #log('Done running traps')
-                        continue
-
-                    self.mem.SetLocalName(name1, first)
-                    if name2:
-                        self.mem.SetLocalName(name2, it2.SecondValue())
-                    if i_name:
-                        self.mem.SetLocalName(i_name, num.ToBig(it2.Index()))
-
-                    # increment index before handling continue, etc.
-                    it2.Next()
-
-                    try:
-                        status = self._Execute(node.body)  # last one wins
-                    except vm.IntControlFlow as e:
-                        status = 0
-                        action = e.HandleLoop()
-                        if action == flow_e.Break:
+            with val_ops.ctx_Iterator(it2):
+                while True:
+                    with state.ctx_LoopFrame(self.mem,
+                                             self.exec_opts.for_loop_frames()):
+                        first = it2.FirstValue()
+                        #log('first %s', first)
+                        if first is None:  # for StdinIterator
+                            #log('first is None')
                             break
-                        elif action == flow_e.Raise:
-                            raise
+
+                        if first.tag() == value_e.Interrupted:
+                            self.RunPendingTraps()
+                            #log('Done running traps')
+                            continue
+
+                        self.mem.SetLocalName(name1, first)
+                        if name2:
+                            self.mem.SetLocalName(name2, it2.SecondValue())
+                        if i_name:
+                            self.mem.SetLocalName(i_name,
+                                                  num.ToBig(it2.Index()))
+
+                        # increment index before handling continue, etc.
+                        it2.Next()
+
+                        try:
+                            status = self._Execute(node.body)  # last one wins
+                        except vm.IntControlFlow as e:
+                            status = 0
+                            action = e.HandleLoop()
+                            if action == flow_e.Break:
+                                break
+                            elif action == flow_e.Raise:
+                                raise
 
         return status
 
@@ -1598,7 +1613,7 @@ class CommandEvaluator(object):
 
         sh_func = value.Proc(node.name, node.name_tok,
                              proc_sig.Open, node.body, None, True, None,
-                             self.mem.GlobalFrame(), node.code_str)
+                             self.mem.GlobalFrame(), node.code_str, 0)
         self.procs.DefineShellFunc(node.name, sh_func)
 
     def _DoProc(self, node):
@@ -1614,7 +1629,7 @@ class CommandEvaluator(object):
         # no dynamic scope
         proc = value.Proc(proc_name, node.name, node.sig, node.body,
                           proc_defaults, False, self.mem.CurrentFrame(),
-                          self.mem.GlobalFrame(), None)
+                          self.mem.GlobalFrame(), None, node.num_slots)
         self.procs.DefineProc(proc_name, proc)
 
     def _DoFunc(self, node):
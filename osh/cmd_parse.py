@@ -23,6 +23,7 @@ from _devbuild.gen.syntax_asdl import (
     command_t,
     condition,
     condition_t,
+    expr,
     for_iter,
     ArgList,
     BraceGroup,
@@ -75,6 +76,8 @@ from mycpp.mylib import log, tagswitch
 from osh import braces
 from osh import bool_parse
 from osh import word_
+from ysh import expr_parse
+from ysh import expr_to_ast
 
 from typing import Optional, List, Dict, Any, Tuple, cast, TYPE_CHECKING
 if TYPE_CHECKING:
@@ -226,16 +229,16 @@ def _MakeAssignPair(parse_ctx, preparsed, arena):
 
     if left_token.id == Id.Lit_VarLike:  # s=1
         if lexer.IsPlusEquals(left_token):
-            var_name = lexer.TokenSliceRight(left_token, -2)
+            var_name = intern(lexer.TokenSliceRight(left_token, -2))
             op = assign_op_e.PlusEqual
         else:
-            var_name = lexer.TokenSliceRight(left_token, -1)
+            var_name = intern(lexer.TokenSliceRight(left_token, -1))
             op = assign_op_e.Equal
 
         lhs = sh_lhs.Name(left_token, var_name)
 
     elif left_token.id == Id.Lit_ArrayLhsOpen and parse_ctx.do_lossless:
-        var_name = lexer.TokenSliceRight(left_token, -1)
+        var_name = intern(lexer.TokenSliceRight(left_token, -1))
         if lexer.IsPlusEquals(close_token):
             op = assign_op_e.PlusEqual
         else:
@@ -249,7 +252,7 @@ def _MakeAssignPair(parse_ctx, preparsed, arena):
         lhs = sh_lhs.UnparsedIndex(left_token, var_name, index_str)
 
     elif left_token.id == Id.Lit_ArrayLhsOpen:  # a[x++]=1
-        var_name = lexer.TokenSliceRight(left_token, -1)
+        var_name = intern(lexer.TokenSliceRight(left_token, -1))
         if lexer.IsPlusEquals(close_token):
             op = assign_op_e.PlusEqual
         else:
@@ -309,7 +312,7 @@ def _AppendMoreEnv(preparsed_list, more_env):
         if lexer.IsPlusEquals(left_token):
             p_die('Expected = in environment binding, got +=', left_token)
 
-        var_name = lexer.TokenSliceRight(left_token, -1)
+        var_name = intern(lexer.TokenSliceRight(left_token, -1))
 
         parts = preparsed.w.parts
         n = len(parts)
@@ -409,6 +412,8 @@ class VarChecker(object):
         # self.tokens for location info: 'proc' or another token
         self.tokens = []  # type: List[Token]
         self.names = []  # type: List[Dict[str, Id_t]]
+        # Loop variables are locals too, but they can be reused
+        self.loop_names = []  # type: List[List[str]]
 
     def Push(self, blame_tok):
         # type: (Token) -> None
@@ -445,12 +450,27 @@ class VarChecker(object):
         self.tokens.append(blame_tok)
         entry = {}  # type: Dict[str, Id_t]
         self.names.append(entry)
+        self.loop_names.append([])
 
     def Pop(self):
         # type: () -> None
         self.names.pop()
+        self.loop_names.pop()
         self.tokens.pop()
 
+    def AddLoopName(self, var_name):
+        # type: (str) -> None
+        if len(self.loop_names) == 0:
+            return
+        self.loop_names[-1].append(var_name)
+
+    def LocalNames(self):
+        # type: () -> List[str]
+        """Names that are declared in the current proc or func."""
+        result = self.names[-1].keys()
+        result.extend(self.loop_names[-1])
+        return result
+
     def Check(self, keyword_id, var_name, blame_tok):
         # type: (Id_t, str, Token) -> None
         """Check for declaration / mutation errors in proc and func.
@@ -996,7 +1016,9 @@ class CommandParser(object):
 
             # allow x = 42
             self.hay_attrs_stack.append(first_word_caps)
-            brace_group = self.ParseBraceGroup()
+            # The block may be evaluated in another frame
+            with expr_parse.ctx_VarRefs(self.parse_ctx.tr, None):
+                brace_group = self.ParseBraceGroup()
 
             # Save the source code for reflection
             code_str = self.arena.SnipCodeString(brace_group.left,
@@ -1487,7 +1509,8 @@ class CommandParser(object):
                           loc.Word(w))
                 p_die('Invalid loop variable name %r' % iter_name, loc.Word(w))
 
-            node.iter_names.append(iter_name)
+            node.iter_names.append(intern(iter_name))
+            self.var_checker.AddLoopName(iter_name)
             num_iter_names += 1
             self._SetNext()
 
@@ -2279,7 +2302,11 @@ class CommandParser(object):
                         self.var_checker.Check(Id.KW_Var, b.name, b.blame_tok)
 
                 self._SetNext()
-                node.body = self.ParseBraceGroup()
+                var_refs = []  # type: List[expr.Var]
+                with expr_parse.ctx_VarRefs(self.parse_ctx.tr, var_refs):
+                    node.body = self.ParseBraceGroup()
+                node.num_slots = expr_to_ast.ResolveSlots(
+                    var_refs, self.var_checker.LocalNames())
                 # No redirects for YSH procs (only at call site)
 
         return node
@@ -2319,8 +2346,12 @@ class CommandParser(object):
                     self.var_checker.Check(Id.KW_Var, r.name, r.blame_tok)
 
             self._SetNext()
+            var_refs = []  # type: List[expr.Var]
             with ctx_CmdMode(self, cmd_mode_e.Func):
-                node.body = self.ParseBraceGroup()
+                with expr_parse.ctx_VarRefs(self.parse_ctx.tr, var_refs):
+                    node.body = self.ParseBraceGroup()
+            node.num_slots = expr_to_ast.ResolveSlots(
+                var_refs, self.var_checker.LocalNames())
 
         return node
 
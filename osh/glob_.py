@@ -10,8 +10,10 @@ from _devbuild.gen.value_asdl import value
 from core import pyos, pyutil, error
 from frontend import match
 from mycpp import mylib
-from mycpp.mylib import log
+from mycpp.mylib import iteritems, log
 from pylib import os_path
+from pylib import path_stat
+from pylib import pylocale
 
 from libc import GLOB_PERIOD, FNM_PATHNAME
 from _devbuild.gen.value_asdl import value_e
@@ -463,6 +465,215 @@ def _StringMatchesAnyPattern(s, patterns):
     return False
 
 
+def _SplitPath(pat, extended):
+    # type: (str, bool) -> List[str]
+    """Split a glob pattern into path components.
+
+    A leading / results in an empty first component, and a trailing / in an
+    empty last component.  With extended globs, a / inside @() etc. doesn't
+    split.
+    """
+    comps = []  # type: List[str]
+    depth = 0
+    start = 0
+    i = 0
+    n = len(pat)
+    while i < n:
+        c = mylib.ByteAt(pat, i)
+        if mylib.ByteEquals(c, '\\'):
+            i += 1
+        elif extended and mylib.ByteEquals(c, '('):
+            depth += 1
+        elif extended and mylib.ByteEquals(c, ')') and depth > 0:
+            depth -= 1
+        elif mylib.ByteEquals(c, '/') and depth == 0:
+            comps.append(pat[start:i])
+            start = i + 1
+        i += 1
+    comps.append(pat[start:])
+    return comps
+
+
+def _HasGlobStar(comps):
+    # type: (List[str]) -> bool
+    for comp in comps:
+        if comp == '**':
+            return True
+    return False
+
+
+def _SortPaths(paths):
+    # type: (List[str]) -> List[str]
+    """Sort in LC_COLLATE order like glob(), and remove duplicates."""
+    # strxfrm() output compares bytewise like strcoll(), and has no NUL
+    keyed = []  # type: List[str]
+    for path in paths:
+        keyed.append('%s\0%s' % (pylocale.strxfrm(path), path))
+    keyed.sort()
+
+    result = []  # type: List[str]
+    last = ''
+    for k in keyed:
+        path = k[k.find('\0') + 1:]
+        if len(result) and path == last:
+            continue  # e.g. **/**/*.md
+        result.append(path)
+        last = path
+    return result
+
+
+class _DirWalker(object):
+    """Expand a glob by reading directories, rather than with libc glob().
+
+    Used for ** with shopt -s globstar, and for extended globs, where each
+    path component is matched with fnmatch(), so nothing is filtered later.
+
+    Directory listings are cached for one expansion, so the entries of a
+    directory are read once, no matter how many components match there.  Only
+    literal components and trailing slashes stat() files; otherwise the kind
+    of entry comes from readdir().
+    """
+
+    def __init__(self, globstar, dotglob):
+        # type: (bool, bool) -> None
+        self.globstar = globstar
+        self.dotglob = dotglob
+
+        # dir path -> { name -> pyos.ENTRY_DIR etc. }
+        self.dir_cache = {}  # type: Dict[str, Dict[str, int]]
+        self.out = []  # type: List[str]
+
+    def _ReadDir(self, path):
+        # type: (str) -> Dict[str, int]
+        entries = self.dir_cache.get(path)
+        if entries is not None:
+            return entries
+
+        names = []  # type: List[str]
+        kinds = []  # type: List[int]
+        # Errors like EACCES and ENOTDIR mean there are no matches, like glob()
+        pyos.ReadDir(path if len(path) else '.', names, kinds)
+
+        entries = {}
+        for i, name in enumerate(names):
+            entries[name] = kinds[i]
+        self.dir_cache[path] = entries
+        return entries
+
+    def _Hidden(self, name, glob_comp):
+        # type: (str, str) -> bool
+        """Like glob() without GLOB_PERIOD, * doesn't match a leading dot."""
+        if self.dotglob:
+            return False
+        return name.startswith('.') and not glob_comp.startswith('.')
+
+    def Walk(self, base, glob_comps, pat_comps, i):
+        # type: (str, List[str], List[str], int) -> None
+        """Match components i and after, in the directory 'base'.
+
+        glob_comps decide which components are literal, hidden files, and **.
+        pat_comps are passed to fnmatch(), and differ for extended globs.
+        """
+        n = len(glob_comps)
+        if i == n:
+            self.out.append(base)
+            return
+
+        glob_comp = glob_comps[i]
+        last = i == n - 1
+
+        if len(glob_comp) == 0:  # trailing slash, or a//b
+            if not last:
+                self.Walk(_JoinPath(base, ''), glob_comps, pat_comps, i + 1)
+            elif len(base) and path_stat.isdir(base):
+                self.out.append(_JoinPath(base, ''))
+            return
+
+        if self.globstar and glob_comp == '**':
+            self._WalkStar(base, glob_comps, pat_comps, i + 1, True)
+            return
+
+        if not LooksLikeGlob(glob_comp):
+            name = GlobUnescape(glob_comp)
+            path = _JoinPath(base, name)
+            if last:
+                # Look it up in the cached listing, rather than calling stat()
+                if name in self._ReadDir(base):
+                    self.out.append(path)
+            else:
+                self.Walk(path, glob_comps, pat_comps, i + 1)
+            return
+
+        pat_comp = pat_comps[i]
+        for name, kind in iteritems(self._ReadDir(base)):
+            if self._Hidden(name, glob_comp):
+                continue
+            if not libc.fnmatch(pat_comp, name):
+                continue
+            path = _JoinPath(base, name)
+            if last:
+                self.out.append(path)
+            elif kind != pyos.ENTRY_OTHER:  # directory, or symlink to one
+                self.Walk(path, glob_comps, pat_comps, i + 1)
+
+    def _WalkStar(self, base, glob_comps, pat_comps, i, top):
+        # type: (str, List[str], List[str], int, bool) -> None
+        """** matches zero or more directories, but doesn't follow symlinks.
+
+        Like bash, **/ still matches a symlink to a directory, without
+        walking into it.
+        """
+        n = len(glob_comps)
+        # The rest of the pattern is a trailing slash
+        only_dirs = i == n - 1 and len(glob_comps[i]) == 0
+        if i == n:
+            # a/** matches a/ and everything under it, like bash
+            if top and len(base) and path_stat.isdir(base):
+                self.out.append(_JoinPath(base, ''))
+        else:
+            self.Walk(base, glob_comps, pat_comps, i)
+
+        for name, kind in iteritems(self._ReadDir(base)):
+            if self._Hidden(name, '*'):
+                continue
+            path = _JoinPath(base, name)
+            if i == n:
+                self.out.append(path)
+            if kind == pyos.ENTRY_DIR:
+                self._WalkStar(path, glob_comps, pat_comps, i, False)
+            elif kind == pyos.ENTRY_SYMLINK and only_dirs:
+                self.Walk(path, glob_comps, pat_comps, i)
+
+
+def _JoinPath(base, name):
+    # type: (str, str) -> str
+    if len(base) == 0:
+        return name
+    if base.endswith('/'):
+        return base + name
+    return '%s/%s' % (base, name)
+
+
+def _WalkGlob(glob_pat, pat, extended, globstar, dotglob):
+    # type: (str, str, bool, bool, bool) -> Optional[List[str]]
+    """Expand a glob with _DirWalker.
+
+    Returns None if the glob and fnmatch() patterns don't have the same
+    components, e.g. with @(a/b).
+    """
+    glob_comps = _SplitPath(glob_pat, False)
+    pat_comps = _SplitPath(pat, extended)
+    if len(glob_comps) != len(pat_comps):
+        return None
+
+    w = _DirWalker(globstar, dotglob)
+    if len(glob_comps[0]) == 0:  # absolute path
+        w.Walk('/', glob_comps, pat_comps, 1)
+    else:
+        w.Walk('', glob_comps, pat_comps, 0)
+    return _SortPaths(w.out)
+
+
 class Globber(object):
 
     def __init__(self, exec_opts, mem):
@@ -474,7 +685,6 @@ class Globber(object):
 
         # Other unimplemented bash options:
         #
-        # globstar          ** for directories
         # globasciiranges   ascii or unicode char classes (unicode by default)
         # nocaseglob
         # GLOBSORT global variable
@@ -560,25 +770,36 @@ class Globber(object):
         """
         globignore_patterns = self._GetGlobIgnorePatterns()
 
-        flags = 0
         # shopt -u dotglob (default): echo * does not return say .gitignore
         # If GLOBIGNORE is set, then dotglob is NOT respected - we return ..
-        if self.exec_opts.dotglob() or globignore_patterns is not None:
-            # If HAVE_GLOB_PERIOD is false, then ./configure stubs out
-            # GLOB_PERIOD as 0, a no-op
-            flags |= GLOB_PERIOD
-
-        try:
-            results = libc.glob(arg, flags)
-        except RuntimeError as e:
-            # Rare glob errors, like GLOB_NOSPACE
-            # Note: dash has a fatal sh_error() on GLOB_NOSPACE
-
-            # note: MyPy doesn't know RuntimeError has e.message (and e.args)
-            msg = e.message  # type: str
-            raise error.Structured(error.CODEC_STATUS, msg, blame_loc)
-        #log('glob %r -> %r', arg, g)
+        dotglob = self.exec_opts.dotglob() or globignore_patterns is not None
 
+        results = None  # type: Optional[List[str]]
+        if self.exec_opts.globstar() and _HasGlobStar(_SplitPath(arg, False)):
+            results = _WalkGlob(arg, arg, False, True, dotglob)
+        else:
+            flags = 0
+            if dotglob:
+                # If HAVE_GLOB_PERIOD is false, then ./configure stubs out
+                # GLOB_PERIOD as 0, a no-op
+                flags |= GLOB_PERIOD
+
+            try:
+                results = libc.glob(arg, flags)
+            except RuntimeError as e:
+                # Rare glob errors, like GLOB_NOSPACE
+                # Note: dash has a fatal sh_error() on GLOB_NOSPACE
+
+                # note: MyPy doesn't know RuntimeError has e.message (and e.args)
+                msg = e.message  # type: str
+                raise error.Structured(error.CODEC_STATUS, msg, blame_loc)
+            #log('glob %r -> %r', arg, g)
+
+        return self._Filter(results, globignore_patterns, out)
+
+    def _Filter(self, results, globignore_patterns, out):
+        # type: (List[str], Optional[List[str]], List[str]) -> int
+        """Append glob results to out, except those that filters remove."""
         if len(results) == 0:
             return 0  # nothing matched
 
@@ -655,13 +876,23 @@ class Globber(object):
             out.append(fnmatch_pat)
             return 1
 
-        tmp = []  # type: List[str]
-        self.DoShellGlob(glob_pat, tmp)
-        filtered = [s for s in tmp if libc.fnmatch(fnmatch_pat, s)]
-        n = len(filtered)
+        globignore_patterns = self._GetGlobIgnorePatterns()
+        dotglob = self.exec_opts.dotglob() or globignore_patterns is not None
+
+        # Match each component with fnmatch(), rather than globbing with *
+        # for the extended parts, and filtering every result
+        results = _WalkGlob(glob_pat, fnmatch_pat, True,
+                            self.exec_opts.globstar(), dotglob)
+        if results is not None:
+            n = self._Filter(results, globignore_patterns, out)
+        else:  # @(a/b) has a /
+            tmp = []  # type: List[str]
+            self.DoShellGlob(glob_pat, tmp)
+            filtered = [s for s in tmp if libc.fnmatch(fnmatch_pat, s)]
+            n = len(filtered)
+            out.extend(filtered)
 
         if n:
-            out.extend(filtered)
             return n
 
         if self.exec_opts.failglob():
@@ -4,7 +4,9 @@ glob_test.py: Tests for glob.py
 """
 from __future__ import print_function
 
+import os
 import re
+import tempfile
 import unittest
 
 from frontend import match
@@ -165,5 +167,41 @@ class GlobParserTest(unittest.TestCase):
             print('warnings: %s' % warnings)
 
 
+class DirWalkerTest(unittest.TestCase):
+
+    def testSplitPath(self):
+        self.assertEqual(['**', '*.py'], glob_._SplitPath('**/*.py', False))
+        self.assertEqual(['', 'tmp', '*'], glob_._SplitPath('/tmp/*', False))
+        self.assertEqual(['*', ''], glob_._SplitPath('*/', False))
+
+        # / inside extended glob
+        self.assertEqual(['@(a/b)'], glob_._SplitPath('@(a/b)', True))
+        self.assertEqual(['@(a', 'b)'], glob_._SplitPath('@(a/b)', False))
+        self.assertEqual(['\\(', '*'], glob_._SplitPath('\\(/*', True))
+
+    def testSortPaths(self):
+        self.assertEqual(['a', 'a/b', 'b'],
+                         glob_._SortPaths(['b', 'a/b', 'a', 'a/b']))
+
+    def testWalk(self):
+        tmp_dir = tempfile.mkdtemp()
+        for d in ['a/b', '.h']:
+            os.makedirs(os.path.join(tmp_dir, d))
+        for f in ['a/f1', 'a/b/f2', '.h/f3']:
+            open(os.path.join(tmp_dir, f), 'w').close()
+
+        w = glob_._DirWalker(True, False)
+        comps = glob_._SplitPath('%s/**/f*' % tmp_dir, False)
+        w.Walk('/', comps, comps, 1)
+        self.assertEqual(
+            ['%s/a/b/f2' % tmp_dir, '%s/a/f1' % tmp_dir],
+            glob_._SortPaths(w.out))
+
+        # Literal components aren't read, and neither are hidden directories
+        self.assertEqual(
+            [tmp_dir, '%s/a' % tmp_dir, '%s/a/b' % tmp_dir],
+            sorted(w.dir_cache))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -70,6 +70,7 @@ from libc import FNM_CASEFOLD, REG_ICASE
 from typing import Tuple, Optional, cast, TYPE_CHECKING
 if TYPE_CHECKING:
     from core import optview
+    from core.stat_cache import StatCache
     from frontend import parse_lib
 
 _ = log
@@ -463,8 +464,9 @@ class ArithEvaluator(bash_impl.ArrayIndexEvaluator):
             e_die('Parse error in recursive arithmetic', e.location)
 
         # Prevent infinite recursion of $(( 1x )) -- it's a word that evaluates
-        # to itself, and you don't want to reparse it as a word.
-        if node2.tag() == arith_expr_e.Word:
+        # to itself, and you don't want to reparse it as a word.  A constant
+        # means there was trailing garbage, like '12 34'.
+        if node2.tag() in (arith_expr_e.Word, arith_expr_e.Const):
             e_die("Invalid integer constant %r" % s, blame_loc)
 
         if self.exec_opts.eval_unsafe_arith():
@@ -608,6 +610,10 @@ class ArithEvaluator(bash_impl.ArrayIndexEvaluator):
                 w = cast(CompoundWord, UP_node)
                 return self.word_ev.EvalWordToString(w)
 
+            elif case(arith_expr_e.Const):  # $(( 42 ))
+                node = cast(arith_expr.Const, UP_node)
+                return node.val
+
             elif case(arith_expr_e.UnaryAssign):  # a++
                 node = cast(arith_expr.UnaryAssign, UP_node)
 
@@ -918,6 +924,9 @@ class ArithEvaluator(bash_impl.ArrayIndexEvaluator):
             w = cast(CompoundWord, UP_node)
             val = self.word_ev.EvalWordToString(w)
             return val.s
+        elif node.tag() == arith_expr_e.Const:  # A[42]
+            cnode = cast(arith_expr.Const, UP_node)
+            return lexer.LazyStr(cnode.c)
         else:
             # A[x] is the "Parsing Bash is Undecidable" problem
             # It is a string or var name?
@@ -980,6 +989,10 @@ class ArithEvaluator(bash_impl.ArrayIndexEvaluator):
                 var_name = self.EvalWordToString(w)
                 return (var_name, w)
 
+            elif case(arith_expr_e.Const):  # (( 1[2] = 3 )) is an error
+                cnode = cast(arith_expr.Const, UP_anode)
+                return (lexer.LazyStr(cnode.c), cnode.c)
+
         no_str = None  # type: Optional[str]
         return (no_str, loc.Missing)
 
@@ -1032,11 +1045,13 @@ class BoolEvaluator(ArithEvaluator):
             mutable_opts,  # type: Optional[state.MutableOpts]
             parse_ctx,  # type: Optional[parse_lib.ParseContext]
             errfmt,  # type: ui.ErrorFormatter
+            stat_cache,  # type: StatCache
             bracket=False  # type: bool
     ):
         # type: (...) -> None
         ArithEvaluator.__init__(self, mem, exec_opts, mutable_opts, parse_ctx,
                                 errfmt)
+        self.stat_cache = stat_cache
         self.bracket = bracket  # [ and [[ are slightly different
 
     def _IsDefined(self, s, blame_loc):
@@ -1181,7 +1196,7 @@ class BoolEvaluator(ArithEvaluator):
                 arg_type = consts.BoolArgType(op_id)
 
                 if arg_type == bool_arg_type_e.Path:
-                    return bool_stat.DoUnaryOp(op_id, s)
+                    return self.stat_cache.UnaryOp(op_id, s)
 
                 if arg_type == bool_arg_type_e.Str:
                     if op_id == Id.BoolUnary_z:
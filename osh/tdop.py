@@ -5,14 +5,18 @@ tdop.py - Library for expression parsing.
 from _devbuild.gen.id_kind_asdl import Id, Id_t
 from _devbuild.gen.syntax_asdl import (loc, arith_expr, arith_expr_e,
                                        arith_expr_t, word_e, word_t,
-                                       CompoundWord, Token)
+                                       word_part_e, CompoundWord, Token)
+from _devbuild.gen.value_asdl import value
 from core.error import p_die
 from display import ui
+from frontend import lexer
+from mycpp import mops
 from mycpp import mylib
 from mycpp.mylib import tagswitch
 from osh import word_
 
-from typing import (Callable, List, Dict, Tuple, Any, cast, TYPE_CHECKING)
+from typing import (Callable, List, Dict, Tuple, Any, Optional, cast,
+                    TYPE_CHECKING)
 
 if TYPE_CHECKING:  # break circular dep
     from osh.word_parse import WordParser
@@ -29,7 +33,7 @@ def IsIndexable(node):
     We also allow $a[i] and foo$x[i] (formerly parse_dynamic_arith)
     """
     with tagswitch(node) as case:
-        if case(arith_expr_e.VarSub, arith_expr_e.Word):
+        if case(arith_expr_e.VarSub, arith_expr_e.Word, arith_expr_e.Const):
             return True
     return False
 
@@ -69,6 +73,30 @@ def NullError(p, t, bp):
     return None  # never reached
 
 
+def _DecimalConst(w):
+    # type: (CompoundWord) -> Optional[arith_expr.Const]
+    """Fold 42 to value.Int, so it isn't evaluated as a word every time.
+
+    Octal 0755, hex 0xff, and 64#z are left for the runtime.
+    """
+    if len(w.parts) != 1:
+        return None
+    part0 = w.parts[0]
+    if part0.tag() != word_part_e.Literal:
+        return None
+    tok = cast(Token, part0)
+    if tok.id != Id.Lit_Digits:
+        return None
+
+    s = lexer.TokenVal(tok)
+    if len(s) > 1 and s[0] == '0':
+        return None
+    ok, i = mops.FromStr2(s)
+    if not ok:  # Integer too big is a runtime error
+        return None
+    return arith_expr.Const(tok, value.Int(i))
+
+
 def NullConstant(p, w, bp):
     # type: (TdopParser, word_t, int) -> arith_expr_t
     name_tok = word_.LooksLikeArithVar(w)
@@ -76,7 +104,11 @@ def NullConstant(p, w, bp):
         return name_tok
 
     # Id.Word_Compound in the spec ensures this cast is valid
-    return cast(CompoundWord, w)
+    cw = cast(CompoundWord, w)
+    cnode = _DecimalConst(cw)
+    if cnode:
+        return cnode
+    return cw
 
 
 def NullParen(p, t, bp):
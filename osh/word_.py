@@ -6,9 +6,17 @@ from _devbuild.gen.id_kind_asdl import Id, Kind, Id_t, Kind_t
 from _devbuild.gen.runtime_asdl import Piece
 from _devbuild.gen.syntax_asdl import (
     Token,
+    BracedVarSub,
     CompoundWord,
     DoubleQuoted,
+    SimpleVarSub,
     SingleQuoted,
+    bracket_op_e,
+    rhs_word_e,
+    rhs_word_t,
+    suffix_op,
+    suffix_op_e,
+    suffix_op_t,
     word,
     word_e,
     word_t,
@@ -173,52 +181,110 @@ def _EvalWordPart(part):
             raise AssertionError(part.tag())
 
 
+def _HasGlobChar(s):
+    # type: (str) -> bool
+    return '*' in s or '?' in s or '[' in s or ']' in s
+
+
+def _FastPartEval(part, strs):
+    # type: (word_part_t, List[str]) -> bool
+    """Append the value of a literal part to strs, or return False.
+
+    Unquoted literals with glob metacharacters are rejected, so the result
+    doesn't depend on the file system.  That's not just * ? [ ], but also
+    tokens like a[ and ]= in a[1]=x.
+    """
+    UP_part = part
+    with tagswitch(part) as case:
+        if case(word_part_e.Literal):
+            part = cast(Token, UP_part)
+            s = lexer.LazyStr(part)
+            if _HasGlobChar(s):
+                return False
+            strs.append(s)
+            return True
+
+        elif case(word_part_e.EscapedLiteral):
+            part = cast(word_part.EscapedLiteral, UP_part)
+            strs.append(part.ch)
+            return True
+
+        elif case(word_part_e.SingleQuoted):
+            part = cast(SingleQuoted, UP_part)
+            strs.append(part.sval)
+            return True
+
+        elif case(word_part_e.DoubleQuoted):
+            part = cast(DoubleQuoted, UP_part)
+            # "foo" and "a\$b", but not "$@"
+            for p in part.parts:
+                if p.tag() == word_part_e.Literal:
+                    strs.append(lexer.LazyStr(cast(Token, p)))
+                elif p.tag() == word_part_e.EscapedLiteral:
+                    strs.append(cast(word_part.EscapedLiteral, p).ch)
+                else:
+                    return False
+            return True
+
+        else:
+            # e.g. $x, ${x}, $(echo hi), ~, {a,b}
+            return False
+
+
 def FastStrEval(w):
     # type: (CompoundWord) -> Optional[str]
     """
-    Detects common case 
+    Detects words that are all literals, so we don't need part_vals, frames,
+    splitting, or globbing.  Common cases:
 
     (1) CompoundWord([LiteralPart(Id.LitChars)])
         For echo -e, test x -lt 0, etc.
     (2) single quoted word like 'foo'
+    (3) double quoted word without substitutions, like "foo"
+    (4) several literal parts, like --prefix="/usr" or a\ b or x=
+
+    Words with a single part return a string that's stored in the tree, so
+    they don't allocate.
 
     Other patterns we could detect are:
-    (1) "foo"
-    (2) "$var" and "${var}" - I think these are very common in OSH code (but not YSH)
+    (1) "$var" and "${var}" - I think these are very common in OSH code (but not YSH)
         - I think val_ops.Stringify() can handle all the errors
     """
-    if len(w.parts) != 1:
-        return None
-
-    part0 = w.parts[0]
-    UP_part0 = part0
-    with tagswitch(part0) as case:
-        if case(word_part_e.Literal):
-            part0 = cast(Token, UP_part0)
-
-            if part0.id in (Id.Lit_Chars, Id.Lit_LBracket, Id.Lit_RBracket):
-                # Could add more tokens in this case
-                #   e.g. + is Lit_Other, and it's a Token in 'expr'
-                #   Right now it's Lit_Chars (e.g. ls -l) and [ and ] because I
-                #   know those are common
-                #   { } are not as common
+    n = len(w.parts)
+    if n == 1:
+        part0 = w.parts[0]
+        UP_part0 = part0
+        with tagswitch(part0) as case:
+            if case(word_part_e.Literal):
+                part0 = cast(Token, UP_part0)
+
+                # [ and ] alone aren't globs
+                if part0.id in (Id.Lit_Star, Id.Lit_QMark):
+                    return None
                 return lexer.LazyStr(part0)
 
-            else:
-                # e.g. Id.Lit_Star needs to be glob expanded
-                # TODO: Consider moving Id.Lit_Star etc. to Kind.MaybeGlob?
-                return None
-
-        elif case(word_part_e.SingleQuoted):
-            part0 = cast(SingleQuoted, UP_part0)
-            # TODO: SingleQuoted should have lazy (str? sval) field
-            # This would only affect multi-line strings though?
-            return part0.sval
+            elif case(word_part_e.SingleQuoted):
+                part0 = cast(SingleQuoted, UP_part0)
+                # TODO: SingleQuoted should have lazy (str? sval) field
+                # This would only affect multi-line strings though?
+                return part0.sval
+
+            elif case(word_part_e.DoubleQuoted):
+                part0 = cast(DoubleQuoted, UP_part0)
+                if len(part0.parts) == 0:
+                    return ''
+                if (len(part0.parts) == 1 and
+                        part0.parts[0].tag() == word_part_e.Literal):
+                    return lexer.LazyStr(cast(Token, part0.parts[0]))
+
+    if n == 0:  # e.g. the empty word in case patterns
+        return None
 
-        else:
-            # e.g. DoubleQuoted can't be optimized to a string, because it
-            # might have "$@" and such
+    strs = []  # type: List[str]
+    for part in w.parts:
+        if not _FastPartEval(part, strs):
             return None
+    return ''.join(strs)
 
 
 def StaticEval(UP_w):
@@ -802,6 +868,100 @@ def CommandKind(w):
     return Kind.Word
 
 
+def _IsPureVarName(name):
+    # type: (str) -> bool
+    # $BASHPID differs in a subshell, and $RANDOM would advance the parent's
+    # generator
+    return name != 'BASHPID' and name != 'RANDOM'
+
+
+def _IsPureSuffixOp(op):
+    # type: (suffix_op_t) -> bool
+    UP_op = op
+    with tagswitch(op) as case:
+        if case(suffix_op_e.Nullary):
+            op = cast(Token, UP_op)
+            return op.id == Id.VOp0_Q  # not ${PS1@P}, which runs code
+
+        elif case(suffix_op_e.Unary):
+            op = cast(suffix_op.Unary, UP_op)
+            # ${x:=default} assigns
+            if op.op.id in (Id.VTest_ColonEquals, Id.VTest_Equals):
+                return False
+            return _IsPureRhsWord(op.arg_word)
+
+        elif case(suffix_op_e.PatSub):
+            op = cast(suffix_op.PatSub, UP_op)
+            return IsPureWord(op.pat) and _IsPureRhsWord(op.replace)
+
+        else:
+            # Slices contain arithmetic, which may assign
+            return False
+
+
+def _IsPureRhsWord(w):
+    # type: (rhs_word_t) -> bool
+    if w.tag() == rhs_word_e.Empty:
+        return True
+    return IsPureWord(cast(CompoundWord, w))
+
+
+def _IsPurePart(part):
+    # type: (word_part_t) -> bool
+    UP_part = part
+    with tagswitch(part) as case:
+        if case(word_part_e.Literal, word_part_e.EscapedLiteral,
+                word_part_e.SingleQuoted, word_part_e.TildeSub,
+                word_part_e.Splice):
+            return True
+
+        elif case(word_part_e.DoubleQuoted):
+            part = cast(DoubleQuoted, UP_part)
+            for p in part.parts:
+                if not _IsPurePart(p):
+                    return False
+            return True
+
+        elif case(word_part_e.SimpleVarSub):
+            part = cast(SimpleVarSub, UP_part)
+            if part.tok.id != Id.VSub_DollarName:
+                return True  # $1 $? $@ etc.
+            return _IsPureVarName(lexer.LazyStr(part.tok))
+
+        elif case(word_part_e.BracedVarSub):
+            part = cast(BracedVarSub, UP_part)
+            if not _IsPureVarName(part.var_name):
+                return False
+            # ${!ref} names a var dynamically
+            if part.prefix_op and part.prefix_op.id == Id.VSub_Bang:
+                return False
+            # ${a[i++]} may assign
+            if (part.bracket_op and
+                    part.bracket_op.tag() == bracket_op_e.ArrayIndex):
+                return False
+            if part.suffix_op:
+                return _IsPureSuffixOp(part.suffix_op)
+            return True
+
+        else:
+            # $(...) runs code, $(( x++ )) and $[f()] may mutate, etc.
+            return False
+
+
+def IsPureWord(w):
+    # type: (CompoundWord) -> bool
+    """Return whether evaluating the word can't change the shell's state.
+
+    Also rejects words whose value depends on the process, like $BASHPID.
+
+    Used to run command subs like $(echo "$x") without forking.
+    """
+    for part in w.parts:
+        if not _IsPurePart(part):
+            return False
+    return True
+
+
 # Stubs for converting RHS of assignment to expression mode.
 # For ysh_ify.py
 def IsVarSub(w):
@@ -2403,6 +2403,12 @@ class AbstractWordEvaluator(StringWordEvaluator):
                     locs.append(w)
                 continue
 
+            fast_str = word_.FastStrEval(w)
+            if fast_str is not None:
+                strs.append(fast_str)
+                locs.append(w)
+                continue
+
             if glob_.LooksLikeStaticGlob(w):
                 val = self.EvalWordToString(w)  # respects strict_array
                 num_appended = self.globber.Expand(val.s, strs, w)
@@ -171,6 +171,21 @@ class WordTest(unittest.TestCase):
         self.assertEqual('b', word_.FastStrEval(node.words[3]))
         self.assertEqual(']', word_.FastStrEval(node.words[4]))
 
+        # Words with several literal parts
+        node = assertParseSimpleCommand(
+            self, """echo --prefix="/usr" a\\ b "x y" "" 'q'"r"s""")
+        self.assertEqual('--prefix=/usr', word_.FastStrEval(node.words[1]))
+        self.assertEqual('a b', word_.FastStrEval(node.words[2]))
+        self.assertEqual('x y', word_.FastStrEval(node.words[3]))
+        self.assertEqual('', word_.FastStrEval(node.words[4]))
+        self.assertEqual('qrs', word_.FastStrEval(node.words[5]))
+
+        # Globs and substitutions aren't static
+        node = assertParseSimpleCommand(
+            self, 'echo *.py a[1] "$x" ~/src a[1]=x x=*.py')
+        for w in node.words[1:]:
+            self.assertEqual(None, word_.FastStrEval(w))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,7 @@
 // Python wrapper for FANOS library in cpp/fanos_shared.h
 
 #include <assert.h>
+#include <errno.h>
 #include <stdarg.h>  // va_list, etc.
 #include <stdio.h>  // vfprintf
 #include <stdlib.h>
@@ -98,6 +99,46 @@ func_send(PyObject *self, PyObject *args) {
   Py_RETURN_NONE;
 }
 
+static PyObject *
+func_listen(PyObject *self, PyObject *args) {
+  char *path;
+
+  if (!PyArg_ParseTuple(args, "s", &path)) {
+    return NULL;
+  }
+
+  struct FanosError err = {0};
+  int sock_fd = fanos_listen(path, &err);
+  if (err.err_code != 0) {
+    errno = err.err_code;
+    return PyErr_SetFromErrno(io_error);
+  }
+  if (err.value_err != NULL) {
+    PyErr_SetString(fanos_error, err.value_err);
+    return NULL;
+  }
+
+  return PyInt_FromLong(sock_fd);
+}
+
+static PyObject *
+func_accept(PyObject *self, PyObject *args) {
+  int sock_fd;
+
+  if (!PyArg_ParseTuple(args, "i", &sock_fd)) {
+    return NULL;
+  }
+
+  struct FanosError err = {0};
+  int conn_fd = fanos_accept(sock_fd, &err);
+  if (err.err_code != 0) {
+    errno = err.err_code;
+    return PyErr_SetFromErrno(io_error);
+  }
+
+  return PyInt_FromLong(conn_fd);
+}
+
 static PyMethodDef methods[] = {
   // Receive message and FDs from socket.
   {"recv", func_recv, METH_VARARGS, ""},
@@ -105,6 +146,10 @@ static PyMethodDef methods[] = {
   // Send a message across a socket.
   {"send", func_send, METH_VARARGS, ""},
 
+  // Create a listening Unix socket, and accept connections on it.
+  {"listen", func_listen, METH_VARARGS, ""},
+  {"accept", func_accept, METH_VARARGS, ""},
+
   {NULL, NULL},
 };
 
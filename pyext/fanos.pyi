@@ -4,3 +4,9 @@ from typing import List, Optional
 def recv(fd: int, fd_out: List[int]) -> Optional[str]: ...
 
 def send(fd: int, msg: str, fd0: int = -1, fd1: int = -1, fd2: int = -1) -> None: ...
+
+# returns a listening socket
+def listen(path: str) -> int: ...
+
+# returns a connected socket
+def accept(sock_fd: int) -> int: ...
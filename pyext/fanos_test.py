@@ -11,8 +11,11 @@ from __future__ import print_function
 fanos_test.py: Tests for fanos.c
 """
 import errno
+import os
+import shutil
 import socket
 import sys
+import tempfile
 import unittest
 
 from mycpp.mylib import log
@@ -197,6 +200,54 @@ class FanosTest(unittest.TestCase):
 
     right.close()
 
+  def testListenAccept(self):
+    tmp_dir = tempfile.mkdtemp()
+    path = os.path.join(tmp_dir, 'sock')
+
+    sock_fd = fanos.listen(path)
+    # A socket that's still listening isn't replaced
+    try:
+      fanos.listen(path)
+    except IOError as e:
+      self.assertEqual(errno.EADDRINUSE, e.errno)
+    else:
+      self.fail('Expected IOError')
+
+    # A stale socket is replaced
+    os.close(sock_fd)
+    sock_fd = fanos.listen(path)
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(path)
+    conn_fd = fanos.accept(sock_fd)
+
+    fanos.send(conn_fd, b'hi')
+    self.assertEqual('2:hi,', client.recv(10))
+
+    client.close()
+    os.close(conn_fd)
+    os.close(sock_fd)
+
+    # Other files aren't replaced
+    os.unlink(path)
+    with open(path, 'w') as f:
+      f.write('x')
+    try:
+      fanos.listen(path)
+    except IOError as e:
+      self.assertEqual(errno.EADDRINUSE, e.errno)
+    else:
+      self.fail('Expected IOError')
+
+    try:
+      fanos.listen('/' + 'x' * 200)
+    except ValueError as e:
+      print(e)
+    else:
+      self.fail('Expected ValueError')
+
+    shutil.rmtree(tmp_dir)
+
 
 class InvalidMessageTests(unittest.TestCase):
   """COPIED from py_fanos_test.py."""
@@ -25,6 +25,7 @@
 #include <Python.h>
 
 #include "_build/detected-config.h"
+#include "cpp/regex_cache_shared.h"
 
 // Log messages to stderr.
 static void debug(const char* fmt, ...) {
@@ -173,12 +174,10 @@ func_regex_search(PyObject *self, PyObject *args) {
   }
 
   cflags |= REG_EXTENDED;
-  regex_t pat;
-  int status = regcomp(&pat, pattern, cflags);
+  regex_t* pat;
+  char error_desc[50];
+  int status = regex_cache_compile(pattern, cflags, &pat, error_desc, 50);
   if (status != 0) {
-    char error_desc[50];
-    regerror(status, &pat, error_desc, 50);
-
     char error_message[80];
     snprintf(error_message, 80, "Invalid regex %s (%s)", pattern, error_desc);
 
@@ -186,16 +185,15 @@ func_regex_search(PyObject *self, PyObject *args) {
     return NULL;
   }
 
-  int num_groups = pat.re_nsub + 1;
+  int num_groups = pat->re_nsub + 1;
   PyObject *ret = PyList_New(num_groups * 2);
 
   if (ret == NULL) {
-    regfree(&pat);
     return NULL;
   }
 
   regmatch_t *pmatch = (regmatch_t*) malloc(sizeof(regmatch_t) * num_groups);
-  int match = regexec(&pat, str + pos, num_groups, pmatch, eflags);
+  int match = regexec(pat, str + pos, num_groups, pmatch, eflags);
   if (match == 0) {
     int i;
     for (i = 0; i < num_groups; i++) {
@@ -214,9 +212,9 @@ func_regex_search(PyObject *self, PyObject *args) {
   }
 
   free(pmatch);
-  regfree(&pat);
 
   if (match != 0) {
+    Py_DECREF(ret);
     Py_RETURN_NONE;
   }
 
@@ -239,16 +237,16 @@ func_regex_first_group_match(PyObject *self, PyObject *args) {
     return NULL;
   }
 
-  regex_t pat;
+  regex_t* pat;
   regmatch_t m[NMATCH];
 
   // Could have been checked by regex_parse for [[ =~ ]], but not for glob
   // patterns like ${foo/x*/y}.
 
-  int status = regcomp(&pat, pattern, REG_EXTENDED);
+  char error_string[80];
+  int status = regex_cache_compile(pattern, REG_EXTENDED, &pat, error_string,
+                                   80);
   if (status != 0) {
-    char error_string[80];
-    regerror(status, &pat, error_string, 80);
     PyErr_SetString(PyExc_RuntimeError, error_string);
     return NULL;
   }
@@ -256,8 +254,7 @@ func_regex_first_group_match(PyObject *self, PyObject *args) {
   debug("first_group_match pat %s str %s pos %d", pattern, str, pos);
 
   // Match at offset 'pos'
-  int result = regexec(&pat, str + pos, NMATCH, m, 0 /*flags*/);
-  regfree(&pat);
+  int result = regexec(pat, str + pos, NMATCH, m, 0 /*flags*/);
 
   if (result != 0) {
     Py_RETURN_NONE;  // no match
@@ -269,6 +266,14 @@ func_regex_first_group_match(PyObject *self, PyObject *args) {
   return Py_BuildValue("(i,i)", pos + start, pos + end);
 }
 
+static PyObject *
+func_regex_cache_stats(PyObject *self, PyObject *unused) {
+  struct RegexCacheStats stats;
+  regex_cache_stats(&stats);
+  return Py_BuildValue("[iiii]", stats.hits, stats.misses, stats.evictions,
+                       stats.num_entries);
+}
+
 // We do this in C so we can remove '%f' % 0.1 from the CPython build.  That
 // involves dtoa.c and pystrod.c, which are thousands of lines of code.
 static PyObject *
@@ -426,6 +431,10 @@ static PyMethodDef methods[] = {
   // the regex is invalid.
   {"regex_first_group_match", func_regex_first_group_match, METH_VARARGS, ""},
 
+  // Return [hits, misses, evictions, num_entries] for the cache of compiled
+  // regexes shared by the two functions above.
+  {"regex_cache_stats", func_regex_cache_stats, METH_NOARGS, ""},
+
   // "Print three floating point values for the 'time' builtin.
   {"print_time", func_print_time, METH_VARARGS, ""},
 
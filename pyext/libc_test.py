@@ -260,6 +260,22 @@ class LibcTest(unittest.TestCase):
     self.assertRaises(
         RuntimeError, libc.regex_first_group_match, r'*', 'abcd', 0)
 
+  def testRegexCache(self):
+    hits, misses, evictions, num_entries = libc.regex_cache_stats()
+
+    pat = '^cache-(test)$'
+    for i in range(3):
+      self.assertEqual([0, 10, 6, 10], libc.regex_search(pat, 0, 'cache-test', 0))
+    # Shared with regex_first_group_match(), because the flags are the same
+    self.assertEqual((6, 10), libc.regex_first_group_match(pat, 'cache-test', 0))
+    # A different flag is a different entry
+    self.assertEqual(None, libc.regex_search(pat, libc.REG_ICASE, 'CACHE', 0))
+
+    stats = libc.regex_cache_stats()
+    self.assertEqual(hits + 3, stats[0])
+    self.assertEqual(misses + 2, stats[1])
+    print(stats)
+
   def testRegexFirstGroupMatchError(self):
     # Helping to debug issue #291
     s = ''
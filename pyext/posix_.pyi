@@ -153,7 +153,7 @@ def lchown(path: unicode, uid: int, gid: int) -> None: ...
 def link(source: unicode, link_name: str) -> None: ...
 _T = TypeVar("_T")
 def listdir(path: _T) -> List[_T]: ...
-def lseek(fd: int, pos: int, how: int) -> None: ...
+def lseek(fd: int, pos: int, how: int) -> int: ...
 def lstat(path: unicode) -> stat_result: ...
 def major(device: int) -> int: ...
 def makedev(major: int, minor: int) -> int: ...
@@ -167,6 +167,7 @@ def openpty() -> Tuple[int, int]: ...
 def pathconf(path: unicode, name: str) -> str: ...
 def pipe() -> Tuple[int, int]: ...
 def popen(command: str, mode: str = ..., bufsize: int = ...) -> IO[str]: ...
+def posix_spawn(path: str, argv: List[str], env: Dict[str, str], setsigdef: List[int]) -> int: ...
 def putenv(varname: str, value: str) -> None: ...
 def read(fd: int, n: int) -> str: ...
 def readlink(path: _T) -> _T: ...
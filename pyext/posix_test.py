@@ -28,6 +28,7 @@ Other notes:
 """
 from __future__ import print_function
 
+import errno
 import signal
 import subprocess
 import unittest
@@ -52,6 +53,7 @@ FUNCS = [
     "execv",
     "execve",
     "fork",
+    "posix_spawn",
     "geteuid",
     "getpid",
     "getuid",
@@ -175,6 +177,20 @@ class PosixTest(unittest.TestCase):
       print('x'*65537, file=f)
       log('2: done')
 
+  def testPosixSpawn(self):
+    argv = ['sh', '-c', 'exit $CODE']
+    pid = posix_.posix_spawn('/bin/sh', argv, {'CODE': '42'},
+                             [signal.SIGPIPE])
+    _, status = posix_.waitpid(pid, 0)
+    self.assertEqual(42, posix_.WEXITSTATUS(status))
+
+    try:
+      posix_.posix_spawn('nonexistent_ZZ', argv, {}, [])
+    except OSError as e:
+      self.assertEqual(errno.ENOENT, e.errno)
+    else:
+      self.fail('Expected OSError')
+
   def testFcntl(self):
       from posix_ import F_DUPFD_CLOEXEC
       print(F_DUPFD_CLOEXEC)
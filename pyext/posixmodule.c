@@ -48,6 +48,8 @@ corresponding Unix manual entries for more information on calls.");
 #include <signal.h>
 #endif
 
+#include <spawn.h>              /* OSH patch: posix_spawn() */
+
 #ifdef HAVE_FCNTL_H
 #include <fcntl.h>
 #endif /* HAVE_FCNTL_H */
@@ -1264,6 +1266,107 @@ posix_execve(PyObject *self, PyObject *args)
 }
 #endif /* HAVE_EXECV */
 
+/* OSH patch: posix_spawn() avoids copying the page tables of a big heap,
+   which fork() does.  Unlike Python 3's os.posix_spawn(), there are no file
+   actions, and the only attribute is a list of signals to reset to SIG_DFL.
+
+   Returns the PID, or raises OSError.  Note that glibc reports execve()
+   errors like ENOENT this way, so no child is left to reap. */
+
+static PyObject *
+posix_posix_spawn(PyObject *self, PyObject *args)
+{
+    char *path;
+    PyObject *argv, *env, *setsigdef;
+    char **argvlist = NULL;
+    char **envlist = NULL;
+    PyObject *keys = NULL, *vals = NULL;
+    Py_ssize_t i, argc, envc = 0, nsig;
+    posix_spawnattr_t attr;
+    sigset_t sigdef;
+    pid_t pid;
+    int err;
+    PyObject *result = NULL;
+
+    if (!PyArg_ParseTuple(args, "sO!O!O!:posix_spawn", &path,
+                          &PyList_Type, &argv, &PyDict_Type, &env,
+                          &PyList_Type, &setsigdef))
+        return NULL;
+
+    argc = PyList_Size(argv);
+    argvlist = PyMem_NEW(char *, argc + 1);
+    if (argvlist == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+    for (i = 0; i < argc; i++) {
+        /* borrowed; the list keeps the strings alive */
+        argvlist[i] = PyString_AsString(PyList_GetItem(argv, i));
+        if (argvlist[i] == NULL)
+            goto done;
+    }
+    argvlist[argc] = NULL;
+
+    keys = PyDict_Keys(env);
+    vals = PyDict_Values(env);
+    if (keys == NULL || vals == NULL)
+        goto done;
+    envlist = PyMem_NEW(char *, PyList_Size(keys) + 1);
+    if (envlist == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+    for (envc = 0; envc < PyList_Size(keys); envc++) {
+        char *k = PyString_AsString(PyList_GetItem(keys, envc));
+        char *v = PyString_AsString(PyList_GetItem(vals, envc));
+        size_t len;
+        if (k == NULL || v == NULL)
+            goto done;
+        len = strlen(k) + strlen(v) + 2;
+        envlist[envc] = PyMem_NEW(char, len);
+        if (envlist[envc] == NULL) {
+            PyErr_NoMemory();
+            goto done;
+        }
+        PyOS_snprintf(envlist[envc], len, "%s=%s", k, v);
+    }
+    envlist[envc] = NULL;
+
+    sigemptyset(&sigdef);
+    nsig = PyList_Size(setsigdef);
+    for (i = 0; i < nsig; i++) {
+        long sig = PyInt_AsLong(PyList_GetItem(setsigdef, i));
+        if (sig == -1 && PyErr_Occurred())
+            goto done;
+        sigaddset(&sigdef, (int)sig);
+    }
+
+    posix_spawnattr_init(&attr);
+    posix_spawnattr_setsigdefault(&attr, &sigdef);
+    posix_spawnattr_setflags(&attr, POSIX_SPAWN_SETSIGDEF);
+
+    err = posix_spawn(&pid, path, NULL, &attr, argvlist, envlist);
+    posix_spawnattr_destroy(&attr);
+
+    if (err != 0) {
+        errno = err;
+        posix_error();
+        goto done;
+    }
+    result = PyInt_FromLong((long)pid);
+
+  done:
+    if (envlist != NULL) {
+        for (i = 0; i < envc; i++)
+            PyMem_DEL(envlist[i]);
+        PyMem_DEL(envlist);
+    }
+    PyMem_DEL(argvlist);  /* OK if NULL */
+    Py_XDECREF(keys);
+    Py_XDECREF(vals);
+    return result;
+}
+
 #ifdef HAVE_FORK
 PyDoc_STRVAR_remove(posix_fork__doc__,
 "fork() -> pid\n\n\
@@ -2071,6 +2174,37 @@ posix_read(PyObject *self, PyObject *args)
 }
 
 
+PyDoc_STRVAR_remove(posix_lseek__doc__,
+"lseek(fd, pos, how) -> newpos\n\n\
+Set the current position of a file descriptor.");
+
+// OILS patch: Restored for buffered 'read' on seekable file descriptors.
+// Simplified since we don't support Windows.
+static PyObject *
+posix_lseek(PyObject *self, PyObject *args)
+{
+    int fd, how;
+    PY_LONG_LONG pos;
+    off_t res;
+    if (!PyArg_ParseTuple(args, "iLi:lseek", &fd, &pos, &how))
+        return NULL;
+    /* Turn 0, 1, 2 into SEEK_{SET,CUR,END} */
+    switch (how) {
+    case 0: how = SEEK_SET; break;
+    case 1: how = SEEK_CUR; break;
+    case 2: how = SEEK_END; break;
+    }
+    if (!_PyVerify_fd(fd))
+        return posix_error();
+    Py_BEGIN_ALLOW_THREADS
+    res = lseek(fd, (off_t)pos, how);
+    Py_END_ALLOW_THREADS
+    if (res < 0)
+        return posix_error();
+    return PyLong_FromLongLong(res);
+}
+
+
 PyDoc_STRVAR_remove(posix_write__doc__,
 "write(fd, string) -> byteswritten\n\n\
 Write a string to a file descriptor.");
@@ -2557,7 +2691,9 @@ static PyMethodDef posix_methods[] = {
   {"getcwd", posix_getcwd, METH_NOARGS},
   {"listdir", posix_listdir, METH_VARARGS},
   {"lstat", posix_lstat, METH_VARARGS},
+  {"mkdir", posix_mkdir, METH_VARARGS},
   {"readlink", posix_readlink, METH_VARARGS},
+  {"rename", posix_rename, METH_VARARGS},
   {"stat", posix_stat, METH_VARARGS},
   {"unlink", posix_unlink, METH_VARARGS},
   {"umask", posix_umask, METH_VARARGS},
@@ -2566,6 +2702,7 @@ static PyMethodDef posix_methods[] = {
   {"_exit", posix__exit, METH_VARARGS},
   {"execv", posix_execv, METH_VARARGS},
   {"execve", posix_execve, METH_VARARGS},
+  {"posix_spawn", posix_posix_spawn, METH_VARARGS},
   {"fork", posix_fork, METH_NOARGS},
   {"getegid", posix_getegid, METH_NOARGS},
   {"geteuid", posix_geteuid, METH_NOARGS},
@@ -2578,6 +2715,7 @@ static PyMethodDef posix_methods[] = {
   {"close", posix_close_, METH_VARARGS},
   {"dup2", posix_dup2, METH_VARARGS},
   {"read", posix_read, METH_VARARGS},
+  {"lseek", posix_lseek, METH_VARARGS},
   {"write", posix_write, METH_VARARGS},
   {"fdopen", posix_fdopen, METH_VARARGS},
   {"isatty", posix_isatty, METH_VARARGS},
@@ -2,7 +2,7 @@
 from distutils.core import setup, Extension
 
 module = Extension('libc',
-                    sources = ['pyext/libc.c'],
+                    sources = ['cpp/regex_cache_shared.c', 'pyext/libc.c'],
                     # for #include "_build/detected-config.h"
                     extra_compile_args = ['-I', '.'],
                     undef_macros = ['NDEBUG'])
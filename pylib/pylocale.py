@@ -29,3 +29,8 @@ def setlocale(category, locale):
 def nl_langinfo(item):
     # type: (int) -> str
     return _locale.nl_langinfo(item)  # type: ignore
+
+
+def strxfrm(s):
+    # type: (str) -> str
+    return _locale.strxfrm(s)  # type: ignore
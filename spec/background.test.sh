@@ -273,6 +273,30 @@ status=9
 ## END
 ## N-I dash/mksh stdout-json: ""
 
+#### wait -n returns the status of a whole background pipeline
+case $SH in dash|mksh) return ;; esac
+
+# The last part exits first, so the job is only done when sleep exits
+{ sleep 0.05; exit 3; } | (exit 4) &
+wait -n
+echo "status=$?"
+
+{ sleep 0.05; exit 5; } | { cat; exit 6; } &
+(exit 7) &
+wait -n
+echo "status=$?"
+wait -n
+echo "status=$?"
+wait -n
+echo "status=$?"
+## STDOUT: 
+status=4
+status=7
+status=6
+status=127
+## END
+## N-I dash/mksh stdout-json: ""
+
 #### Async for loop
 for i in 1 2 3; do
   echo $i
@@ -402,6 +426,44 @@ wait --all 1
 ## N-I dash/bash/mksh STDOUT:
 ## END
 
+#### YSH wait --all --status-list
+case $SH in dash|bash|mksh) exit ;; esac
+shopt --set ysh:upgrade
+
+(exit 3) &
+{ sleep 0.05; exit 5; } | { cat; exit 0; } &
+{ sleep 0.1; exit 0; } &
+try {
+  wait --all --status-list
+}
+echo wait $[_error.code]
+pp test_ (_reply)
+
+(exit 0) &
+wait --all --status-list (&st)
+echo wait $?
+pp test_ (st)
+
+wait --all --status-list
+pp test_ (_reply)
+
+try {
+  wait --status-list
+}
+echo wait $[_error.code]
+
+## STDOUT:
+wait 1
+(List)   [3,0,0]
+wait 0
+(List)   [0]
+(List)   []
+wait 2
+## END
+
+## N-I dash/bash/mksh STDOUT:
+## END
+
 #### Signal message for killed background job
 case $SH in dash|mksh) exit ;; esac
 
@@ -499,3 +499,29 @@ echo {z..3}
 BUG
 ## END
 
+
+#### for loop over brace expansions
+for i in a{1..2}{x,y} {03..1..-2} "q"{c..a} {,} ''{,} end; do
+  echo -n "[$i]"
+done
+echo
+## STDOUT:
+[a1x][a1y][a2x][a2y][03][01][qc][qb][qa][][][end]
+## END
+## BUG mksh STDOUT:
+[a{1..2}x][a{1..2}y][{03..1..-2}][q{c..a}][][][end]
+## END
+
+#### for loop over large brace expansion with break
+for i in {a..z}{a..z}{0..999}; do
+  if test $i = ab5; then
+    break
+  fi
+done
+echo $i
+## STDOUT:
+ab5
+## END
+## N-I mksh STDOUT:
+{a..z}{a..z}{0..999}
+## END
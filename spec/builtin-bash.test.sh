@@ -1,4 +1,4 @@
-## oils_failures_allowed: 4
+## oils_failures_allowed: 0
 ## compare_shells: bash
 
 
@@ -202,7 +202,46 @@ n=3
 ## N-I dash/mksh/zsh/ash STDOUT:
 ## END
 
-#### mapfile / readarray stdin  TODO: Fix me.
+#### mapfile rejects negative numbers
+type mapfile >/dev/null 2>&1 || exit 0
+mapfile -n -1 arr < /dev/null
+echo n=$?
+mapfile -s -1 arr < /dev/null
+echo s=$?
+mapfile -O -1 arr < /dev/null
+echo O=$?
+mapfile -u -1 arr < /dev/null
+echo u=$?
+## STDOUT:
+n=2
+s=2
+O=2
+u=2
+## END
+## OK bash STDOUT:
+n=1
+s=1
+O=1
+u=1
+## END
+## N-I dash/mksh/zsh/ash STDOUT:
+## END
+
+#### mapfile -n leaves the rest of a file
+type mapfile >/dev/null 2>&1 || exit 0
+seq 5 > tmp.txt
+{ mapfile -n 2 -t arr; cat; } < tmp.txt
+echo "${arr[@]}"
+## STDOUT:
+3
+4
+5
+1 2
+## END
+## N-I dash/mksh/zsh/ash STDOUT:
+## END
+
+#### mapfile / readarray stdin
 shopt -s lastpipe  # for bash
 
 seq 2 | mapfile m
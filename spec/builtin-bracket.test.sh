@@ -768,3 +768,31 @@ status=2
 status=0
 status=0
 ## END
+
+#### shopt -s stat_cache notices changes made by the shell
+shopt -s stat_cache 2>/dev/null  # OSH only, but behavior is the same
+
+cd $TMP
+rm -f stat-cache
+test -f stat-cache || echo 'not yet'
+
+echo hi > stat-cache
+[ -f stat-cache ] && echo redirect
+
+rm stat-cache
+test -f stat-cache || echo rm
+
+touch stat-cache
+[ -f stat-cache ] && echo touch
+
+mkdir -p stat-cache-dir
+cd stat-cache-dir
+test -f stat-cache || echo cd
+
+## STDOUT:
+not yet
+redirect
+rm
+touch
+cd
+## END
@@ -297,3 +297,24 @@ echo -$()- ".$()."
 ## STDOUT:
 -- ..
 ## END
+
+#### Command sub with echo or printf doesn't change the parent's state
+x=$(echo ${y:=default})
+echo "x=$x y=${y-unset}"
+
+x=$(printf '%s\n' a b '' '')
+echo "[$x]"
+## STDOUT:
+x=default y=unset
+[a
+b]
+## END
+
+#### Command sub respects functions that shadow echo
+echo() { printf 'func %s\n' "$@"; }
+x=$(echo hi)
+unset -f echo
+echo "$x"
+## STDOUT:
+func hi
+## END
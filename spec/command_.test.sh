@@ -244,3 +244,36 @@ status=0
 hi
 status=0
 ## END
+
+#### shopt -s path_index notices new commands, and hash -r
+shopt -s path_index 2>/dev/null  # OSH only, but behavior is the same
+
+one=$TMP/path-index-one
+two=$TMP/path-index-two
+mkdir -p $one $two
+rm -f $one/* $two/*
+PATH="$one:$two:$PATH"
+
+echo 'echo two' > $two/mycmd
+chmod +x $two/mycmd
+mycmd
+
+# Not executable
+echo 'echo one' > $one/mycmd
+mycmd
+
+# Installed after the dir was indexed
+echo 'echo new' > $two/newcmd
+chmod +x $two/newcmd
+newcmd
+
+chmod +x $one/mycmd
+hash -r
+mycmd
+
+## STDOUT:
+two
+two
+new
+one
+## END
@@ -28,6 +28,18 @@ status=1
 status=0
 ## END
 
+#### shopt -s failglob with a word that looks like an array assignment
+shopt -s failglob
+echo b[1]=y
+echo status=$?
+## STDOUT:
+status=1
+## END
+## N-I dash/mksh/ash STDOUT:
+b[1]=y
+status=0
+## END
+
 #### shopt -s failglob in loop context
 for x in *.ZZ; do echo $x; done
 echo status=$?
@@ -191,6 +191,12 @@ echo [[z] []z]    # also accepted
 [ ]
 ## END
 
+#### Glob in a word that looks like an array assignment
+touch $TMP/a1=x
+cd $TMP
+echo a[1]=x a[2]=x
+## stdout: a1=x a[2]=x
+
 #### Glob of negated unescaped [[] and []]
 # osh does this "correctly" because it defers to libc!
 touch $TMP/_G
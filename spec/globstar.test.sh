@@ -1,4 +1,4 @@
-## oils_failures_allowed: 4
+## oils_failures_allowed: 1
 ## compare_shells: bash zsh
 
 #### globstar is off -> ** is treated like *
@@ -95,3 +95,85 @@ directory-1/symlink/leaf-2.md directory-2/leaf-2.md
 ## END
 ## N-I bash STDOUT:
 ## END
+
+#### **/ matches directories, and a/** matches a/ and everything under it
+shopt -s globstar
+
+mkdir -p a/b/c d
+touch a/f1 a/b/f2 a/b/c/f3 top
+
+echo **/
+echo a/**
+echo a/**/
+## STDOUT:
+a/ a/b/ a/b/c/ d/
+a/ a/b a/b/c a/b/c/f3 a/b/f2 a/f1
+a/ a/b/ a/b/c/
+## END
+
+#### ** skips hidden files unless dotglob, and doesn't follow symlinks
+shopt -s globstar
+
+mkdir -p a/.hidden d
+touch a/f1 a/.hidden/f2 a/.f3
+ln -s ../a d/link
+
+echo **
+echo **/f*
+shopt -s dotglob
+echo **
+## STDOUT:
+a a/f1 d d/link
+a/f1
+a a/.f3 a/.hidden a/.hidden/f2 a/f1 d d/link
+## END
+
+#### **/ matches symlinks to directories, but doesn't walk into them
+shopt -s globstar
+
+mkdir -p real/sub
+touch real/f
+ln -s real link
+ln -s sub real/sub-link
+ln -s nowhere dangling
+
+echo **/
+echo real/**/
+echo **/f
+## STDOUT:
+link/ real/ real/sub-link/ real/sub/
+real/ real/sub-link/ real/sub/
+real/f
+## END
+
+#### ** with extended globs
+case $SH in zsh) exit ;; esac
+shopt -s globstar extglob
+
+mkdir -p a/b
+touch a/x.c a/x.h a/b/y.c a/b/y.o
+
+echo **/*.@(c|h)
+echo a/**/!(*.c)
+## STDOUT:
+a/b/y.c a/x.c a/x.h
+a/b a/b/y.o a/x.h
+## END
+## N-I zsh STDOUT:
+## END
+
+#### ** respects GLOBIGNORE
+case $SH in zsh) exit ;; esac
+shopt -s globstar
+
+mkdir -p a/b
+touch a/x.c a/b/y.c a/b/y.o
+
+# Patterns are matched against the whole path
+GLOBIGNORE='*/*.o:*/*/*.o'
+echo **
+## STDOUT:
+a a/b a/b/y.c a/x.c
+## END
+## N-I zsh STDOUT:
+## END
@@ -215,6 +215,73 @@ pp gc-stats_
 ## END
 
 
+#### pp cache-stats_ shows regcomp() cache
+
+for i in 1 2 3; do
+  [[ foo =~ f(o+) ]] && echo ${BASH_REMATCH[1]}
+done
+
+[[ bar =~ f(o+) ]]
+echo status=$?
+
+pp cache-stats_ | head -n 1
+pp cache-stats_ | grep regcomp | cut -f 2-3
+
+## STDOUT:
+oo
+oo
+oo
+status=1
+cache	hits	misses	evictions	num_entries
+3	1
+## END
+
+#### pp cache-stats_ shows parse cache for source and use
+cd $TMP
+export XDG_CACHE_HOME=$TMP/parse-cache-home
+rm -r -f $XDG_CACHE_HOME
+
+echo 'proc p (s) { echo "p $s" }' > lib.ysh
+echo 'const __provide__ = :| x |; var x = 42' > mod.ysh
+# Files modified this second aren't cached
+touch -d 2020-01-01 lib.ysh mod.ysh
+
+for i in 1 2; do
+  $SH -O ysh:upgrade -c '
+  source lib.ysh
+  use mod.ysh
+  p $[mod.x]
+  pp cache-stats_ | grep parse | cut -f 2-3
+  '
+done
+
+# Changes are noticed
+echo 'proc p (s) { echo "p2 $s" }' > lib.ysh
+touch -d 2020-01-02 lib.ysh
+
+$SH -O ysh:upgrade -c '
+source lib.ysh
+p 1
+pp cache-stats_ | grep parse | cut -f 2-3
+'
+
+# shopt --unset parse_cache disables it
+$SH -O ysh:upgrade -c '
+shopt --unset parse_cache
+source lib.ysh
+pp cache-stats_ | grep parse | cut -f 2-3
+'
+
+## STDOUT:
+p 42
+0	2
+p 42
+2	0
+p2 1
+0	1
+0	0
+## END
+
 #### pp cell_
 x=42
 
@@ -83,3 +83,114 @@ hi
 status=42
 ok
 ## END
+
+#### forkmany usage errors
+shopt --set oil:upgrade
+shopt --unset errexit
+
+forkmany
+echo status=$?
+
+forkmany extra {
+  echo hi
+}
+echo status=$?
+
+forkmany -j -2 (:| a |) {
+  echo hi
+}
+echo status=$?
+
+forkmany -j 0 (:| a |) {
+  echo hi
+}
+echo status=$?
+
+forkmany (42) {
+  echo hi
+}
+echo status=$?
+
+## status: 3
+## STDOUT:
+status=2
+status=2
+status=2
+status=2
+## END
+
+#### forkmany runs a block for each item, and collects statuses
+shopt --set oil:upgrade
+shopt --unset errexit
+
+var items = :| 0 3 0 4 |
+forkmany -j 2 (items, &statuses) {
+  exit $_reply
+}
+echo status=$?
+write -- @statuses
+
+# At most 2 at once
+forkmany -j 2 (:| a b c |) {
+  echo $_reply
+} | sort
+
+## STDOUT:
+status=3
+0
+3
+0
+4
+a
+b
+c
+## END
+
+#### forkmany --keep-order prints output in item order
+shopt --set oil:upgrade
+
+var items = :| 3 1 2 |
+forkmany -j 3 --keep-order (items) {
+  sleep 0.0$_reply
+  echo "item $_reply"
+}
+
+## STDOUT:
+item 3
+item 1
+item 2
+## END
+
+#### forkmany runs traps while it waits
+shopt --set oil:upgrade
+
+var x = 0
+trap 'setvar x = 1' USR1
+
+# The second job starts after the trap ran
+forkmany (:| a b |) {
+  if test $_reply = a {
+    sleep 0.1
+    kill -USR1 $$
+    sleep 0.1
+  } else {
+    echo "x=$x"
+  }
+}
+echo status=$?
+
+## STDOUT:
+x=1
+status=0
+## END
+
+#### forkmany over lines of stdin
+shopt --set oil:upgrade
+
+# The spec test framework passes code on stdin, so this is the last line
+printf 'a\nb\nc\n' | forkmany -j 3 -k (io.stdin) { echo "line $_reply" }
+## STDOUT:
+line a
+line b
+line c
+## END
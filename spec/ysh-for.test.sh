@@ -194,6 +194,52 @@ fi
 pass
 ## END
 
+#### for batch in (io.stdin => batches(n))
+
+seq 7 > $[ENV.TMP]/seq.txt
+for batch in (io.stdin => batches(3)) {
+  echo $[len(batch)] @batch
+} < $[ENV.TMP]/seq.txt
+
+printf 'a\nb' | for i, batch in (io.stdin => batches(10)) {
+  echo $i @batch
+}
+
+try {
+  for batch in (io.stdin => batches(0)) {
+    echo $[len(batch)]
+  } < /dev/null
+}
+echo status=$[_error.code]
+
+## STDOUT:
+3 1 2 3
+3 4 5 6
+1 7
+0 a b
+status=3
+## END
+
+#### break out of for x in (io.stdin) leaves the rest of a file
+
+seq 5 > $[ENV.TMP]/seq.txt
+{
+  for x in (io.stdin) {
+    echo "for $x"
+    if (x === '2') {
+      break
+    }
+  }
+  read --raw-line
+  echo "read $_reply"
+} < $[ENV.TMP]/seq.txt
+
+## STDOUT:
+for 1
+for 2
+read 3
+## END
+
 #### Append to List in loop extends the loop (matches JS)
 
 # see demo/survey-loop
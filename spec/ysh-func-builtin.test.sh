@@ -14,6 +14,38 @@ argv.py $z
 ['a:b:c d']
 ## END
 
+#### sorted()
+var x = [5, 3.5, 10, -1]
+pp test_ (sorted(x))
+pp test_ (sorted(x, reverse=true))
+
+# The original isn't modified
+pp test_ (x)
+
+var names = :| bob alice Carol |
+pp test_ (sorted(names))
+func lower(s) { return (s => lower()) }
+pp test_ (sorted(names, key=lower))
+## STDOUT:
+(List)   [-1,3.5,5,10]
+(List)   [10,5,3.5,-1]
+(List)   [5,3.5,10,-1]
+(List)   ["Carol","alice","bob"]
+(List)   ["alice","bob","Carol"]
+## END
+
+#### sorted() with key=
+var items = [{name: 'b', n: 2}, {name: 'a', n: 2}, {name: 'c', n: 1}]
+func byN(d) { return (d.n) }
+for item in (sorted(items, key=byN)) {
+  echo $[item.name]
+}
+## STDOUT:
+c
+b
+a
+## END
+
 #### @[split(x)] respects IFS
 setvar IFS = ":"
 var x = "one:two:three"
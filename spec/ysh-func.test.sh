@@ -512,3 +512,51 @@ call f()
 ## STDOUT:
 x = 43
 ## END
+
+#### Locals, globals, and unset in a func body
+shopt --set ysh:upgrade
+
+var g = 'global'
+var y = 'global y'
+
+func f(n) {
+  var s = 0
+  for i in (0 ..< n) {
+    setvar s += i
+  }
+  var y = 'local y'
+  var before = y
+  unset y
+  return ([s, g, before, y])
+}
+
+pp test_ (f(4))
+pp test_ (f(5))
+
+## STDOUT:
+(List)   [6,"global","local y","global y"]
+(List)   [10,"global","local y","global y"]
+## END
+
+#### Recursive func and lambda see the right frame
+shopt --set ysh:upgrade
+
+func fib(n) {
+  if (n < 2) {
+    return (n)
+  }
+  return (fib(n - 1) + fib(n - 2))
+}
+echo $[fib(15)]
+
+func adder(x) {
+  var y = x + 1
+  return (^[x + y])
+}
+var e = adder(10)
+echo $[io->evalExpr(e, vars={x: 1, y: 2})]
+
+## STDOUT:
+610
+3
+## END
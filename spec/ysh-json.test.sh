@@ -172,6 +172,76 @@ pp test_ (y)
 pipeline status = 1
 ## END
 
+#### json read --stream runs a block for each item
+shopt -s ysh:upgrade
+
+echo '[1, "two", {"k": [3]}, null]' | json read --stream (&item) {
+  pp test_ (item)
+}
+echo status=$?
+
+# Default is $_reply
+echo '[4, 5]' | json8 read --stream {
+  echo $_reply
+}
+
+echo '[]' | json read --stream {
+  echo 'not run'
+}
+## STDOUT:
+(Int)   1
+(Str)   "two"
+(Dict)   {"k":[3]}
+(Null)   null
+status=0
+4
+5
+## END
+
+#### json read --stream with break and continue
+shopt -s ysh:upgrade
+
+json write (list(1 ..= 10), space=0) | json read --stream {
+  if (_reply === 3) {
+    continue
+  }
+  if (_reply === 5) {
+    break
+  }
+  echo $_reply
+}
+echo done
+## STDOUT:
+1
+2
+4
+done
+## END
+
+#### json read --stream errors
+shopt -s ysh:upgrade
+set +o errexit
+
+echo '{}' | json read --stream {
+  echo 'not run'
+}
+echo status=$?
+
+# Items before the error are processed
+echo '[1, 2' | json read --stream {
+  echo $_reply
+}
+echo status=$?
+
+json read --stream < /dev/null
+## status: 2
+## STDOUT:
+status=1
+1
+2
+status=1
+## END
+
 #### Extra data after valid JSON
 
 # Trailing space is OK
@@ -786,3 +786,74 @@ write @x
 0
 ## END
 
+
+#### List->sort()
+var a = [3, 1.5, -2, 10, 2]
+var b = :| banana cherry Apple apple |
+var empty = []
+
+call a->sort()
+call b->sort(reverse=true)
+call empty->sort()
+
+pp test_ (a)
+pp test_ (b)
+pp test_ (empty)
+## STDOUT:
+(List)   [-2,1.5,2,3,10]
+(List)   ["cherry","banana","apple","Apple"]
+(List)   []
+## END
+
+#### List->sort() with key is stable
+var words = :| bb a ccc dd e |
+func length(s) { return (len(s)) }
+
+call words->sort(key=length)
+write -- @words
+echo
+
+call words->sort(key=length, reverse=true)
+write -- @words
+## STDOUT:
+a
+e
+bb
+dd
+ccc
+
+ccc
+bb
+dd
+a
+e
+## END
+
+#### List->sort() puts NAN after every other number
+var a = [3.0, NAN, 1.0, 2.0]
+var b = [NAN, 3, 1.0, -INFINITY, NAN, 2]
+call a->sort()
+call b->sort(reverse=true)
+pp test_ (a)
+pp test_ (b)
+
+# Ints and Floats are compared exactly
+var c = [9007199254740993, 9007199254740992.0, 9007199254740991]
+call c->sort()
+for x in (c) {
+  if (type(x) === 'Float') { echo 'Float 2**53' } else { echo $x }
+}
+## STDOUT:
+(List)   [1.0,2.0,3.0,NAN]
+(List)   [NAN,NAN,3,2,1.0,-INFINITY]
+9007199254740991
+Float 2**53
+9007199254740993
+## END
+
+#### List->sort() on mixed types is an error
+var x = [1, 'a']
+call x->sort()
+## status: 3
+## STDOUT:
+## END
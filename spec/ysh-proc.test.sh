@@ -863,3 +863,28 @@ p
 ## STDOUT:
 x = 43
 ## END
+
+#### Proc locals are read in blocks and nested procs
+shopt --set ysh:upgrade
+
+proc p(x) {
+  var y = x + 1
+  cd / {
+    var z = y + 1
+    echo "block $x $y $z"
+  }
+  proc inner {
+    echo "inner $[x] $[y]"
+  }
+  inner
+  setvar y = 'changed'
+  echo "after $[y]"
+}
+
+p 5
+
+## STDOUT:
+block 5 6 7
+inner 5 6
+after changed
+## END
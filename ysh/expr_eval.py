@@ -497,8 +497,9 @@ class ExprEvaluator(object):
 
         return val
 
-    def _CallMetaMethod(self, func_val, pos_args, blame_loc):
+    def CallFunc(self, func_val, pos_args, blame_loc):
         # type: (value_t, List[value_t], loc_t) -> value_t
+        """For meta methods like __index__, and sorted(key=f)."""
 
         named_args = NewDict()  # type: Dict[str, value_t]
         arg_list = ArgList.CreateNull()  # There's no call site
@@ -1035,8 +1036,7 @@ class ExprEvaluator(object):
                 index_method = val_ops.IndexMetaMethod(obj)
                 if index_method is not None:
                     pos_args = [obj, index]
-                    return self._CallMetaMethod(index_method, pos_args,
-                                                blame_loc)
+                    return self.CallFunc(index_method, pos_args, blame_loc)
 
         raise error.TypeErr(
             obj, 'Subscript expected one of (Str List Dict, indexable Obj)',
@@ -1223,6 +1223,11 @@ class ExprEvaluator(object):
 
             elif case(expr_e.Var):
                 node = cast(expr.Var, UP_node)
+                if node.slot != -1:  # local of a proc or func
+                    val = self.mem.GetSlotValue(node.slot, node.name)
+                    if val.tag() == value_e.Undef:
+                        e_die('Undefined variable %r' % node.name, node.left)
+                    return val
                 return self._LookupVar(node.name, node.left)
 
             elif case(expr_e.Place):
@@ -26,6 +26,8 @@ from typing import TYPE_CHECKING, Any, Dict, Tuple, List, cast, Optional
 if TYPE_CHECKING:
     from frontend.lexer import Lexer
     from frontend.parse_lib import ParseContext
+    from _devbuild.gen.syntax_asdl import expr
+    from ysh.expr_to_ast import Transformer
     from pgen2.grammar import Grammar
     from pgen2.pnode import PNode
 
@@ -242,7 +244,11 @@ def _PushYshTokens(parse_ctx, gr, p, lex):
             line_reader = reader.DisallowedLineReader(parse_ctx.arena, tok)
             c_parser = parse_ctx.MakeParserForCommandSub(
                 line_reader, lex, Id.Eof_RParen)
-            node = c_parser.ParseCommandSub()
+            if tok.id == Id.Left_CaretParen:  # ^(echo hi) is a code literal
+                with ctx_VarRefs(parse_ctx.tr, None):
+                    node = c_parser.ParseCommandSub()
+            else:
+                node = c_parser.ParseCommandSub()
             # A little gross: Copied from osh/word_parse.py
             right_token = c_parser.w_parser.cur_token
 
@@ -387,3 +393,27 @@ class ctx_PNodeAllocator(object):
         # type: (Any, Any, Any) -> None
         self.expr_parser.pnode_alloc.Clear()
         self.expr_parser.pnode_alloc = None
+
+
+class ctx_VarRefs(object):
+    """Collect the expr.Var nodes in the body of a proc or func.
+
+    Code literals like blocks, ^(echo hi), ^[42 + x], and lambdas can be
+    evaluated in another frame, so they push None, and their nodes don't get
+    slots.
+    """
+
+    def __init__(self, tr, var_refs):
+        # type: (Optional[Transformer], Optional[List[expr.Var]]) -> None
+        if tr:
+            tr.var_refs_stack.append(var_refs)
+        self.tr = tr
+
+    def __enter__(self):
+        # type: () -> None
+        pass
+
+    def __exit__(self, type, value, traceback):
+        # type: (Any, Any, Any) -> None
+        if self.tr:
+            self.tr.var_refs_stack.pop()
@@ -125,6 +125,29 @@ if mylib.PYTHON:
         return names
 
 
+def ResolveSlots(var_refs, local_names):
+    # type: (List[expr.Var], List[str]) -> int
+    """Give a slot to each variable reference that names a local.
+
+    Slots are numbered in order of first reference, so only locals that are
+    read in expressions take space.  Returns the number of slots.
+    """
+    is_local = {}  # type: Dict[str, bool]
+    for name in local_names:
+        is_local[name] = True
+
+    slots = {}  # type: Dict[str, int]
+    for node in var_refs:
+        if node.name not in is_local:
+            continue
+        slot = slots.get(node.name, -1)
+        if slot == -1:
+            slot = len(slots)
+            slots[node.name] = slot
+        node.slot = slot
+    return len(slots)
+
+
 class Transformer(object):
     """Homogeneous parse tree -> heterogeneous AST ("lossless syntax tree")
 
@@ -157,6 +180,18 @@ class Transformer(object):
             # print raw nodes
             self.p_printer = expr_parse.ParseTreePrinter(names)
 
+        # See expr_parse.ctx_VarRefs
+        self.var_refs_stack = []  # type: List[Optional[List[expr.Var]]]
+
+    def _VarRef(self, tok):
+        # type: (Token) -> expr.Var
+        node = expr.Var(tok, intern(lexer.TokenVal(tok)), -1)
+        if len(self.var_refs_stack):
+            var_refs = self.var_refs_stack[-1]
+            if var_refs is not None:
+                var_refs.append(node)
+        return node
+
     def _LeftAssoc(self, p_node):
         # type: (PNode) -> expr_t
         """For an associative binary operation.
@@ -391,7 +426,8 @@ class Transformer(object):
             return self._TestlistComp(parent, parent.GetChild(1), id_)
 
         if id_ == Id.Left_CaretBracket:  # ^[42 + x]
-            child = self.Expr(parent.GetChild(1))
+            with expr_parse.ctx_VarRefs(self, None):
+                child = self.Expr(parent.GetChild(1))
             return expr.Literal(child)
 
         if id_ == Id.Op_LBrace:
@@ -442,7 +478,7 @@ class Transformer(object):
         if n == 3:
             typ = self._TypeExpr(p_node.GetChild(2))
 
-        return NameType(name_tok, lexer.TokenVal(name_tok), typ)
+        return NameType(name_tok, intern(lexer.TokenVal(name_tok)), typ)
 
     def _NameTypeList(self, p_node):
         # type: (PNode) -> List[NameType]
@@ -580,7 +616,8 @@ class Transformer(object):
             else:
                 params = []
 
-            body = self.Expr(pnode.GetChild(n - 1))
+            with expr_parse.ctx_VarRefs(self, None):
+                body = self.Expr(pnode.GetChild(n - 1))
             return expr.Lambda(params, body)
 
         #
@@ -736,7 +773,7 @@ class Transformer(object):
 
         tok = pnode.tok
         if typ == Id.Expr_Name:
-            return expr.Var(tok, lexer.TokenVal(tok))
+            return self._VarRef(tok)
 
         # Everything else is an expr.Const
         tok_str = lexer.TokenVal(tok)
@@ -1195,7 +1232,8 @@ class Transformer(object):
             type_ = self._TypeExpr(pnode.GetChild(1))
             default_val = self.Expr(pnode.GetChild(3))
 
-        return Param(name_tok, lexer.TokenVal(name_tok), type_, default_val)
+        return Param(name_tok, intern(lexer.TokenVal(name_tok)), type_,
+                     default_val)
 
     def _ParamGroup(self, p_node):
         # type: (PNode) -> ParamGroup
@@ -1218,7 +1256,7 @@ class Transformer(object):
 
             elif child.typ == Id.Expr_Ellipsis:
                 tok = p_node.GetChild(i + 1).tok
-                rest_of = RestParam(tok, lexer.TokenVal(tok))
+                rest_of = RestParam(tok, intern(lexer.TokenVal(tok)))
 
             i += 2
 
@@ -8,14 +8,15 @@ from _devbuild.gen.value_asdl import (value, value_e, value_t, eggex_ops,
                                       Obj)
 from core import bash_impl
 from core import error
+from core import pyos
 from core.error import e_die
 from display import ui
 from mycpp import mops
 from mycpp import mylib
-from mycpp.mylib import tagswitch, log
+from mycpp.mylib import tagswitch, log, isinf_, isnan_, STDIN_FILENO
 from ysh import regex_translate
 
-from typing import TYPE_CHECKING, cast, Dict, List, Optional
+from typing import TYPE_CHECKING, cast, Any, Dict, List, Optional
 
 import libc
 import posix_ as posix
@@ -24,6 +25,7 @@ _ = log
 
 if TYPE_CHECKING:
     from core import state
+    from osh.braces import BraceIterator
 
 
 def ToInt(val, msg, blame_loc):
@@ -217,6 +219,30 @@ class Iterator(object):
         """Return Dict value or FAIL"""
         raise AssertionError("Shouldn't have called this")
 
+    def Done(self):
+        # type: () -> None
+        """Called when the loop exits, including with break or return."""
+        pass
+
+
+class ctx_Iterator(object):
+
+    def __init__(self, it):
+        # type: (Iterator) -> None
+        self.it = it
+
+    def __enter__(self):
+        # type: () -> None
+        pass
+
+    def __exit__(self, type, value, traceback):
+        # type: (Any, Any, Any) -> None
+        self.it.Done()
+
+
+# for line in (io.stdin) reads this many bytes at a time
+_STDIN_BUF_SIZE = 65536
+
 
 class StdinIterator(Iterator):
     """ for x in <> { """
@@ -225,41 +251,110 @@ class StdinIterator(Iterator):
         # type: (loc_t) -> None
         Iterator.__init__(self)
         self.blame_loc = blame_loc
-        self.f = mylib.Stdin()
+
+        # Lines are sliced out of the buffer, so each line is one allocation
+        self.buf = ''
+        self.pos = 0
+        self.pieces = []  # type: List[str]  # a line that spans chunks
+        self.eof = False
 
     def FirstValue(self):
         # type: () -> Optional[value_t]
-
-        # line, eof = read_osh.ReadLineSlowly(None, with_eol=False)
-        try:
-            line = self.f.readline()
-        except (IOError, OSError) as e:  # signals
-            if e.errno == EINTR:
-                # Caller will can run traps with cmd_ev, like ReadLineSlowly
-                return value.Interrupted
+        while True:
+            i = self.buf.find('\n', self.pos)
+            if i != -1:
+                if len(self.pieces):
+                    self.pieces.append(self.buf[self.pos:i])
+                    line = ''.join(self.pieces)
+                    del self.pieces[:]
+                else:
+                    line = self.buf[self.pos:i]
+                self.pos = i + 1
+                return value.Str(line)
+
+            if self.pos < len(self.buf):
+                self.pieces.append(self.buf[self.pos:])
+            self.buf = ''
+            self.pos = 0
+
+            if self.eof:
+                if len(self.pieces):  # last line without a newline
+                    line = ''.join(self.pieces)
+                    del self.pieces[:]
+                    return value.Str(line)
+                return None  # Done
+
+            chunks = []  # type: List[str]
+            n, err_num = pyos.Read(STDIN_FILENO, _STDIN_BUF_SIZE, chunks)
+            if n < 0:
+                if err_num == EINTR:
+                    # Caller will can run traps with cmd_ev, like ReadLineSlowly
+                    return value.Interrupted
+                else:
+                    # For possible errors from read(), see
+                    #   man read
+                    # e.g. EISDIR when reading from a directory descriptor
+                    #
+                    # Note: the read builtin returns status 1 for EISDIR.
+                    #
+                    # We'll raise a top-level error like Python.  (Awk prints a
+                    # warning message)
+                    e_die(
+                        "I/O error in for <> loop: %s" %
+                        posix.strerror(err_num), self.blame_loc)
+            elif n == 0:
+                self.eof = True
             else:
-                # For possible errors from f.readline(), see
-                #   man read
-                #   man getline
-                # e.g.
-                # - ENOMEM getline() allocation failure
-                # - EISDIR getline() read from directory descriptor!
-                #
-                # Note: the read builtin returns status 1 for EISDIR.
-                #
-                # We'll raise a top-level error like Python.  (Awk prints a
-                # warning message)
-                e_die("I/O error in for <> loop: %s" % posix.strerror(e.errno),
-                      self.blame_loc)
-
-        #log('L %r', line)
-        if len(line) == 0:
-            return None  # Done
-        elif line.endswith('\n'):
-            # TODO: optimize this to prevent extra garbage
-            line = line[:-1]
-
-        return value.Str(line)
+                self.buf = chunks[0]
+
+    def Done(self):
+        # type: () -> None
+        """Give back the bytes we read past the last line.
+
+        That only works if stdin is seekable, e.g. a file.  With a pipe, 'break'
+        loses the rest of the buffer.
+        """
+        num_unused = len(self.buf) - self.pos
+        for piece in self.pieces:
+            num_unused += len(piece)
+        if num_unused:
+            # Ignore ESPIPE
+            pyos.SeekRelative(STDIN_FILENO, -num_unused)
+        self.buf = ''
+        self.pos = 0
+        del self.pieces[:]
+
+
+class StdinBatchIterator(Iterator):
+    """ for batch in (io.stdin => batches(1000)) { """
+
+    def __init__(self, size, blame_loc):
+        # type: (int, loc_t) -> None
+        Iterator.__init__(self)
+        self.lines = StdinIterator(blame_loc)
+        self.size = size
+        self.batch = []  # type: List[value_t]
+
+    def FirstValue(self):
+        # type: () -> Optional[value_t]
+        while len(self.batch) < self.size:
+            line = self.lines.FirstValue()
+            if line is None:
+                break
+            if line.tag() == value_e.Interrupted:
+                return line  # keep the partial batch, and resume later
+            self.batch.append(line)
+
+        if len(self.batch) == 0:
+            return None
+
+        result = value.List(self.batch)
+        self.batch = []
+        return result
+
+    def Done(self):
+        # type: () -> None
+        self.lines.Done()
 
 
 class ArrayIter(Iterator):
@@ -278,6 +373,31 @@ class ArrayIter(Iterator):
         return value.Str(self.strs[self.i])
 
 
+class BraceIter(Iterator):
+    """ for x in {1..1000000}; do """
+
+    def __init__(self, gen):
+        # type: (BraceIterator) -> None
+        Iterator.__init__(self)
+        self.gen = gen
+        self.cur = None  # type: Optional[str]
+        self.pending = True  # generate the value on demand
+
+    def Next(self):
+        # type: () -> None
+        Iterator.Next(self)
+        self.pending = True
+
+    def FirstValue(self):
+        # type: () -> Optional[value_t]
+        if self.pending:
+            self.cur = self.gen.Next()
+            self.pending = False
+        if self.cur is None:
+            return None
+        return value.Str(self.cur)
+
+
 class RangeIterator(Iterator):
     """ for x in (m:n) { """
 
@@ -471,6 +591,88 @@ def ExactlyEqual(left, right, blame_loc):
         "Can't compare two values of type %s" % ui.ValType(left), blame_loc)
 
 
+def _CompareInts(i1, i2):
+    # type: (mops.BigInt, mops.BigInt) -> int
+    if mops.Equal(i1, i2):
+        return 0
+    return 1 if mops.Greater(i1, i2) else -1
+
+
+def _CompareFloats(f1, f2):
+    # type: (float, float) -> int
+    """NaN is greater than every other number, and equal to itself."""
+    if isnan_(f1):
+        return 0 if isnan_(f2) else 1
+    if isnan_(f2):
+        return -1
+    if f1 < f2:
+        return -1
+    if f1 > f2:
+        return 1
+    return 0
+
+
+def _CompareIntFloat(i, f):
+    # type: (mops.BigInt, float) -> int
+    """Exact, even when i can't be represented as a float."""
+    c = _CompareFloats(mops.ToFloat(i), f)
+    if c != 0:
+        return c  # rounding i to a float doesn't change the order
+
+    # Now f is a whole number, or i was converted exactly
+    if isinf_(f):
+        return -1 if f > 0.0 else 1
+
+    if f >= 9223372036854775808.0:  # 2**63
+        # FromFloat(f) would overflow an int64_t, but f is even
+        _, half = mops.FromFloat(f / 2.0)
+        return _CompareInts(mops.Sub(mops.Sub(i, half), half), mops.ZERO)
+
+    _, whole = mops.FromFloat(f)
+    return _CompareInts(i, whole)
+
+
+def Compare(left, right, blame_loc):
+    # type: (value_t, value_t, loc_t) -> int
+    """Total order for sorted() and List->sort().  Returns -1, 0, or 1.
+
+    Int and Float are compared as numbers, exactly, and NaN is greater than
+    every other number.  Str is compared by bytes.  Other pairs of types are
+    errors.
+    """
+    UP_left = left
+    UP_right = right
+
+    if left.tag() == value_e.Str and right.tag() == value_e.Str:
+        left = cast(value.Str, UP_left)
+        right = cast(value.Str, UP_right)
+        return mylib.str_cmp(left.s, right.s)
+
+    if left.tag() == value_e.Int and right.tag() == value_e.Int:
+        left = cast(value.Int, UP_left)
+        right = cast(value.Int, UP_right)
+        return _CompareInts(left.i, right.i)
+
+    if left.tag() == value_e.Float and right.tag() == value_e.Float:
+        left = cast(value.Float, UP_left)
+        right = cast(value.Float, UP_right)
+        return _CompareFloats(left.f, right.f)
+
+    if left.tag() == value_e.Int and right.tag() == value_e.Float:
+        left = cast(value.Int, UP_left)
+        right = cast(value.Float, UP_right)
+        return _CompareIntFloat(left.i, right.f)
+
+    if left.tag() == value_e.Float and right.tag() == value_e.Int:
+        left = cast(value.Float, UP_left)
+        right = cast(value.Int, UP_right)
+        return -_CompareIntFloat(right.i, left.f)
+
+    raise error.TypeErrVerbose(
+        "Can't compare %s and %s" % (ui.ValType(left), ui.ValType(right)),
+        blame_loc)
+
+
 def Contains(needle, haystack):
     # type: (value_t, value_t) -> bool
     """Haystack must be a Dict.
@@ -6,7 +6,10 @@ from __future__ import print_function
 
 import unittest
 
+from _devbuild.gen.syntax_asdl import loc
 from _devbuild.gen.value_asdl import value
+from core import error
+from mycpp import mops
 from ysh import val_ops  # module under test
 
 
@@ -36,5 +39,65 @@ class IteratorTest(unittest.TestCase):
         self.assertEqual(None, it.FirstValue())
 
 
+class CompareTest(unittest.TestCase):
+
+    def testCompare(self):
+        one = value.Int(mops.IntWiden(1))
+        two = value.Int(mops.IntWiden(2))
+        half = value.Float(0.5)
+
+        self.assertEqual(-1, val_ops.Compare(one, two, loc.Missing))
+        self.assertEqual(1, val_ops.Compare(two, one, loc.Missing))
+        self.assertEqual(0, val_ops.Compare(one, one, loc.Missing))
+
+        # Mixed Int and Float
+        self.assertEqual(1, val_ops.Compare(one, half, loc.Missing))
+        self.assertEqual(0,
+                         val_ops.Compare(value.Float(2.0), two, loc.Missing))
+
+        # Bytes, not locale
+        self.assertEqual(
+            -1,
+            val_ops.Compare(value.Str('Z'), value.Str('a'), loc.Missing))
+
+        self.assertRaises(error.TypeErrVerbose, val_ops.Compare, one,
+                          value.Str('a'), loc.Missing)
+
+    def testNan(self):
+        nan = value.Float(float('nan'))
+        inf = value.Float(float('inf'))
+        one = value.Int(mops.IntWiden(1))
+
+        # After every other number
+        self.assertEqual(1, val_ops.Compare(nan, inf, loc.Missing))
+        self.assertEqual(-1, val_ops.Compare(inf, nan, loc.Missing))
+        self.assertEqual(1, val_ops.Compare(nan, one, loc.Missing))
+        self.assertEqual(-1, val_ops.Compare(one, nan, loc.Missing))
+        self.assertEqual(0, val_ops.Compare(nan, nan, loc.Missing))
+
+    def testExactIntFloat(self):
+        big = 1 << 53
+        f = value.Float(float(big))
+        for i, expected in [(big - 1, -1), (big, 0), (big + 1, 1)]:
+            v = value.Int(mops.BigInt(i))
+            self.assertEqual(expected, val_ops.Compare(v, f, loc.Missing))
+            self.assertEqual(-expected, val_ops.Compare(f, v, loc.Missing))
+
+        # float(2**63 - 1) is 2**63, which doesn't fit in an int64_t
+        f = value.Float(9223372036854775808.0)
+        v = value.Int(mops.BigInt((1 << 63) - 1))
+        self.assertEqual(-1, val_ops.Compare(v, f, loc.Missing))
+        v = value.Int(mops.BigInt(1 << 63))
+        self.assertEqual(0, val_ops.Compare(v, f, loc.Missing))
+
+        v = value.Int(mops.BigInt(-(1 << 63)))
+        self.assertEqual(0,
+                         val_ops.Compare(v, value.Float(-9223372036854775808.0),
+                                         loc.Missing))
+        self.assertEqual(1,
+                         val_ops.Compare(v, value.Float(float('-inf')),
+                                         loc.Missing))
+
+
 if __name__ == '__main__':
     unittest.main()